@@ -0,0 +1,60 @@
+"""
+Compares the time taken to compute the digests of pandas DataFrames of increasing sizes with the
+sampled digest and with the legacy digest, which inspects the types of all the values.
+
+Usage:
+
+    python dev/benchmarks/dataset_digest.py --rows 10000 --rows 1000000 --columns 10
+"""
+import os
+import time
+
+import click
+import numpy as np
+import pandas as pd
+
+from mlflow.data.digest_utils import compute_pandas_digest
+
+
+def _create_df(num_rows, num_columns):
+    rng = np.random.default_rng(0)
+    columns = {}
+    for i in range(num_columns):
+        if i % 2:
+            columns[f"str{i}"] = rng.integers(0, 1000, num_rows).astype(str).astype(object)
+        else:
+            columns[f"float{i}"] = rng.random(num_rows)
+    return pd.DataFrame(columns)
+
+
+def _time_digest(df, legacy):
+    os.environ["MLFLOW_USE_LEGACY_DATASET_DIGEST"] = str(legacy).lower()
+    try:
+        start = time.perf_counter()
+        compute_pandas_digest(df)
+        return time.perf_counter() - start
+    finally:
+        os.environ.pop("MLFLOW_USE_LEGACY_DATASET_DIGEST")
+
+
+@click.command()
+@click.option(
+    "--rows",
+    "row_counts",
+    multiple=True,
+    type=int,
+    default=[10_000, 100_000, 1_000_000],
+    show_default=True,
+)
+@click.option("--columns", "num_columns", default=10, show_default=True)
+def main(row_counts, num_columns):
+    click.echo(f"{'rows':>10} {'sampled':>10} {'legacy':>10}")
+    for num_rows in row_counts:
+        df = _create_df(num_rows, num_columns)
+        sampled_s = _time_digest(df, legacy=False)
+        legacy_s = _time_digest(df, legacy=True)
+        click.echo(f"{num_rows:>10} {sampled_s:>9.3f}s {legacy_s:>9.3f}s")
+
+
+if __name__ == "__main__":
+    main()
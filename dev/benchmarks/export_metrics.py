@@ -0,0 +1,70 @@
+"""
+Compares the time taken to read the full metric histories of several runs with one
+``get_metric_history`` call per metric and with a single ``export_metrics`` call, against a
+tracking store.
+
+Usage:
+
+    python dev/benchmarks/export_metrics.py --runs 10 --metrics 10 --steps 10000
+"""
+import tempfile
+import time
+
+import click
+
+from mlflow.entities import Metric
+from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+from mlflow.tracking import MlflowClient
+
+
+def _log_metrics(client, num_runs, num_metrics, num_steps):
+    experiment_id = client.create_experiment(f"bench-{time.time_ns()}")
+    run_ids = []
+    for _ in range(num_runs):
+        run_id = client.create_run(experiment_id).info.run_id
+        metrics = [
+            Metric(f"m{i}", step / num_steps, 0, step)
+            for i in range(num_metrics)
+            for step in range(num_steps)
+        ]
+        for start in range(0, len(metrics), 1000):
+            client.log_batch(run_id, metrics=metrics[start : start + 1000])
+        run_ids.append(run_id)
+    return run_ids
+
+
+def _get_metric_histories(client, run_ids, keys):
+    return sum(len(client.get_metric_history(r, k)) for r in run_ids for k in keys)
+
+
+@click.command()
+@click.option("--store", "store_type", type=click.Choice(["file", "sqlalchemy"]), default="file")
+@click.option("--runs", "num_runs", default=10, show_default=True)
+@click.option("--metrics", "num_metrics", default=10, show_default=True)
+@click.option("--steps", "num_steps", default=10000, show_default=True)
+def main(store_type, num_runs, num_metrics, num_steps):
+    with tempfile.TemporaryDirectory() as tmp:
+        if store_type == "file":
+            tracking_uri = tmp
+        else:
+            tracking_uri = f"sqlite:///{tmp}/mlflow.db"
+            SqlAlchemyStore(tracking_uri, tmp).engine.dispose()
+        client = MlflowClient(tracking_uri)
+        run_ids = _log_metrics(client, num_runs, num_metrics, num_steps)
+        keys = [f"m{i}" for i in range(num_metrics)]
+
+        start = time.perf_counter()
+        num_values = _get_metric_histories(client, run_ids, keys)
+        history_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        table = client.export_metrics(run_ids, keys)
+        export_s = time.perf_counter() - start
+
+        assert table.num_rows == num_values
+        click.echo(f"{'get_metric_history':>18}: {history_s:.2f} s ({num_values} values)")
+        click.echo(f"{'export_metrics':>18}: {export_s:.2f} s ({table.num_rows} values)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Compares the latency of gateway provider requests sent with a new ``aiohttp.ClientSession`` per
+request and with the pooled, keep-alive sessions of ``ClientSessionPool``, against a local stub
+upstream server. The stub is served over plain HTTP, so the difference measured here only
+reflects TCP connection setup; TLS handshakes with real providers widen it further.
+
+Usage:
+
+    python dev/benchmarks/gateway_session_pool.py --requests 2000 --concurrency 50
+"""
+import asyncio
+import contextlib
+import statistics
+import time
+
+import click
+from aiohttp import web
+
+from mlflow.gateway.providers.utils import ClientSessionPool, send_request
+
+
+async def _chat(request):
+    await request.read()
+    return web.json_response({"choices": [{"message": {"role": "assistant", "content": "hi"}}]})
+
+
+@contextlib.asynccontextmanager
+async def _stub_server():
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", _chat)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}/v1"
+    finally:
+        await runner.cleanup()
+
+
+async def _run(base_url, num_requests, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def request():
+        async with semaphore:
+            start = time.perf_counter()
+            await send_request({"Authorization": "Bearer key"}, base_url, "chat/completions", {})
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(request() for _ in range(num_requests)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "rps": num_requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95)] * 1000,
+    }
+
+
+async def _benchmark(num_requests, concurrency):
+    async with _stub_server() as base_url:
+        results = {"new session per request": await _run(base_url, num_requests, concurrency)}
+        async with ClientSessionPool():
+            results["pooled sessions"] = await _run(base_url, num_requests, concurrency)
+    return results
+
+
+@click.command()
+@click.option("--requests", "num_requests", default=2000, show_default=True)
+@click.option("--concurrency", default=50, show_default=True)
+def main(num_requests, concurrency):
+    results = asyncio.run(_benchmark(num_requests, concurrency))
+    for name, stats in results.items():
+        click.echo(
+            f"{name:>24}: {stats['rps']:8.1f} req/s, p50 {stats['p50_ms']:6.2f} ms, "
+            f"p95 {stats['p95_ms']:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Compares the metric ingestion throughput of ``SqlAlchemyStore.log_batch`` using the bulk
+``INSERT ... ON CONFLICT`` path against the legacy ORM path (which is still used for MSSQL).
+
+Usage:
+
+    python dev/benchmarks/log_metrics.py --db-uri sqlite:///bench.db --num-batches 50
+"""
+import tempfile
+import time
+from unittest import mock
+
+import click
+
+from mlflow.entities import Metric
+from mlflow.store.db.db_types import MSSQL
+from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+
+
+def _run_benchmark(store, num_batches, batch_size, num_keys, legacy):
+    experiment_id = store.create_experiment(f"bench-{time.time_ns()}")
+    run_id = store.create_run(experiment_id, "bench", 0, [], "bench").info.run_id
+    batches = [
+        [
+            Metric(
+                key=f"metric_{i % num_keys}", value=float(i), timestamp=i, step=b * batch_size + i
+            )
+            for i in range(batch_size)
+        ]
+        for b in range(num_batches)
+    ]
+    # The legacy ORM path is selected by the store for MSSQL only
+    patch = mock.patch.object(store, "db_type", MSSQL) if legacy else mock.MagicMock()
+    with patch:
+        start = time.perf_counter()
+        for metrics in batches:
+            store.log_batch(run_id, metrics=metrics, params=[], tags=[])
+        elapsed = time.perf_counter() - start
+    return num_batches * batch_size / elapsed
+
+
+@click.command()
+@click.option("--db-uri", default=None, help="Database URI. Defaults to a temporary SQLite DB.")
+@click.option("--num-batches", default=20, show_default=True)
+@click.option("--batch-size", default=1000, show_default=True)
+@click.option("--num-keys", default=50, show_default=True)
+def main(db_uri, num_batches, batch_size, num_keys):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_uri = db_uri or f"sqlite:///{tmp}/mlflow.db"
+        store = SqlAlchemyStore(db_uri, tmp)
+        for name, legacy in [("orm", True), ("bulk", False)]:
+            points_per_sec = _run_benchmark(store, num_batches, batch_size, num_keys, legacy)
+            click.echo(f"{name:>5}: {points_per_sec:,.0f} points/sec")
+        store.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
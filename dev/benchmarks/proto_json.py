@@ -0,0 +1,87 @@
+"""
+Compares the time taken by the tracking server to serialize large response messages to JSON with
+``message_to_json`` and with the single-pass ``message_to_compact_json`` and
+``iter_message_json_chunks``.
+
+Usage:
+
+    python dev/benchmarks/proto_json.py --runs 1000 --points 25000
+"""
+import json
+import time
+import uuid
+
+import click
+
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.protos.service_pb2 import GetMetricHistory, Run, SearchRuns
+from mlflow.utils.proto_json_utils import (
+    iter_message_json_chunks,
+    message_to_compact_json,
+    message_to_json,
+)
+
+
+def _search_runs_response(num_runs):
+    response = SearchRuns.Response()
+    for i in range(num_runs):
+        run = Run()
+        run.info.run_id = run.info.run_uuid = uuid.uuid4().hex
+        run.info.experiment_id = "0"
+        run.info.start_time = run.info.end_time = time.time_ns() // 1_000_000
+        run.info.status = 1
+        run.info.lifecycle_stage = "active"
+        run.data.metrics.extend(Metric(f"m{j}", i / (j + 1), 0, j).to_proto() for j in range(10))
+        run.data.params.extend(Param(f"p{j}", str(j)).to_proto() for j in range(10))
+        run.data.tags.extend(RunTag(f"t{j}", "value").to_proto() for j in range(10))
+        response.runs.append(run)
+    return response
+
+
+def _metric_history_response(num_points):
+    response = GetMetricHistory.Response()
+    response.metrics.extend(
+        Metric("loss", 1 / (step + 1), 1_700_000_000_000 + step, step).to_proto()
+        for step in range(num_points)
+    )
+    return response
+
+
+def _time(serialize, message, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        serialize(message)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@click.command()
+@click.option("--runs", "num_runs", default=1000, show_default=True)
+@click.option("--points", "num_points", default=25000, show_default=True)
+@click.option("--repeat", default=5, show_default=True)
+def main(num_runs, num_points, repeat):
+    messages = {
+        f"SearchRuns ({num_runs} runs)": _search_runs_response(num_runs),
+        f"GetMetricHistory ({num_points} points)": _metric_history_response(num_points),
+    }
+    serializers = {
+        "message_to_json": message_to_json,
+        "message_to_compact_json": message_to_compact_json,
+        "iter_message_json_chunks": lambda m: "".join(iter_message_json_chunks(m)),
+    }
+    for name, message in messages.items():
+        expected = json.loads(message_to_json(message))
+        assert json.loads(message_to_compact_json(message)) == expected
+        baseline = None
+        for serializer_name, serialize in serializers.items():
+            seconds = _time(serialize, message, repeat)
+            baseline = baseline or seconds
+            click.echo(
+                f"{name}: {serializer_name}: {seconds:.3f}s ({baseline / seconds:.1f}x), "
+                f"{len(serialize(message)):,} bytes"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Compares the latency of ``SqlAlchemyStore.search_runs`` for the first page and a deep page, using
+offset page tokens (issued by previous versions of MLflow) and keyset page tokens.
+
+Usage:
+
+    python dev/benchmarks/search_runs_pagination.py --db-uri sqlite:///bench.db --page 500
+"""
+import tempfile
+import time
+
+import click
+
+from mlflow.entities import Metric, ViewType
+from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+from mlflow.utils.search_utils import SearchUtils
+
+
+def _create_runs(store, num_runs):
+    experiment_id = store.create_experiment(f"bench-{time.time_ns()}")
+    for i in range(num_runs):
+        run_id = store.create_run(experiment_id, "bench", i // 3, [], f"run-{i}").info.run_id
+        store.log_batch(run_id, metrics=[Metric("loss", i % 100, 0, 0)], params=[], tags=[])
+    return experiment_id
+
+
+def _time_search(store, experiment_id, max_results, order_by, page_token, repeats):
+    elapsed = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        store.search_runs(
+            [experiment_id],
+            None,
+            ViewType.ALL,
+            max_results=max_results,
+            order_by=order_by,
+            page_token=page_token,
+        )
+        elapsed.append(time.perf_counter() - start)
+    return sorted(elapsed)[len(elapsed) // 2] * 1000
+
+
+def _get_keyset_page_token(store, experiment_id, max_results, order_by, page):
+    page_token = None
+    for _ in range(page - 1):
+        page_token = store.search_runs(
+            [experiment_id],
+            None,
+            ViewType.ALL,
+            max_results=max_results,
+            order_by=order_by,
+            page_token=page_token,
+        ).token
+    return page_token
+
+
+@click.command()
+@click.option("--db-uri", default=None, help="Database URI. Defaults to a temporary SQLite DB.")
+@click.option("--page", default=500, show_default=True, help="The deep page to benchmark.")
+@click.option("--max-results", default=10, show_default=True)
+@click.option("--order-by", multiple=True, help="Defaults to the natural ordering of runs.")
+@click.option("--repeats", default=10, show_default=True)
+def main(db_uri, page, max_results, order_by, repeats):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_uri = db_uri or f"sqlite:///{tmp}/mlflow.db"
+        store = SqlAlchemyStore(db_uri, tmp)
+        experiment_id = _create_runs(store, page * max_results)
+        order_by = list(order_by) or None
+        page_tokens = {
+            "offset": SearchUtils.create_page_token((page - 1) * max_results),
+            "keyset": _get_keyset_page_token(store, experiment_id, max_results, order_by, page),
+        }
+        first_page_ms = _time_search(store, experiment_id, max_results, order_by, None, repeats)
+        click.echo(f"{'page 1':>18}: {first_page_ms:.1f} ms")
+        for name, page_token in page_tokens.items():
+            deep_page_ms = _time_search(
+                store, experiment_id, max_results, order_by, page_token, repeats
+            )
+            click.echo(f"{f'page {page} ({name})':>18}: {deep_page_ms:.1f} ms")
+        store.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -26,21 +26,12 @@ implement mutual exclusion manually.
 
 For a lower level API, see the :py:mod:`mlflow.client` module.
 """
-import contextlib
+import importlib
+from typing import TYPE_CHECKING
 
 from mlflow.version import VERSION
 
 __version__ = VERSION
-from mlflow import (
-    artifacts,  # noqa: F401
-    client,  # noqa: F401
-    config,  # noqa: F401
-    data,  # noqa: F401
-    exceptions,  # noqa: F401
-    models,  # noqa: F401
-    projects,  # noqa: F401
-    tracking,  # noqa: F401
-)
 from mlflow.environment_variables import MLFLOW_CONFIGURE_LOGGING
 from mlflow.utils.lazy_load import LazyLoader
 from mlflow.utils.logging_utils import _configure_mlflow_loggers
@@ -87,81 +78,196 @@ xgboost = LazyLoader("mlflow.xgboost", globals(), "mlflow.xgboost")
 if MLFLOW_CONFIGURE_LOGGING.get() is True:
     _configure_mlflow_loggers(root_module_name=__name__)
 
-from mlflow.client import MlflowClient
-
-# For backward compatibility, we expose the following functions and classes at the top level in
-# addition to `mlflow.config`.
-from mlflow.config import (
-    disable_system_metrics_logging,
-    enable_system_metrics_logging,
-    get_registry_uri,
-    get_tracking_uri,
-    is_tracking_uri_set,
-    set_registry_uri,
-    set_system_metrics_node_id,
-    set_system_metrics_samples_before_logging,
-    set_system_metrics_sampling_interval,
-    set_tracking_uri,
-)
-from mlflow.exceptions import MlflowException
-from mlflow.models import evaluate
-from mlflow.projects import run
-from mlflow.tracing.fluent import (
-    get_current_active_span,
-    get_last_active_trace,
-    get_trace,
-    search_traces,
-    start_span,
-    trace,
-)
-from mlflow.tracking._model_registry.fluent import (
-    register_model,
-    search_model_versions,
-    search_registered_models,
-)
-from mlflow.tracking.fluent import (
-    ActiveRun,
-    active_run,
-    autolog,
-    create_experiment,
-    delete_experiment,
-    delete_run,
-    delete_tag,
-    end_run,
-    flush_artifact_async_logging,
-    flush_async_logging,
-    get_artifact_uri,
-    get_experiment,
-    get_experiment_by_name,
-    get_parent_run,
-    get_run,
-    last_active_run,
-    load_table,
-    log_artifact,
-    log_artifacts,
-    log_dict,
-    log_figure,
-    log_image,
-    log_input,
-    log_metric,
-    log_metrics,
-    log_param,
-    log_params,
-    log_table,
-    log_text,
-    search_experiments,
-    search_runs,
-    set_experiment,
-    set_experiment_tag,
-    set_experiment_tags,
-    set_tag,
-    set_tags,
-    start_run,
-)
-from mlflow.tracking.multimedia import Image
-from mlflow.utils.async_logging.run_operations import RunOperations  # noqa: F401
-from mlflow.utils.credentials import login
-from mlflow.utils.doctor import doctor
+# The fluent API is imported on first use by `__getattr__`, along with the subsystems it depends on,
+# e.g. tracing and model evaluation, so that `import mlflow` stays cheap in short-lived processes
+# such as scripts, Spark UDF workers and model servers.
+_LAZY_IMPORTS = {
+    "mlflow.client": ["MlflowClient"],
+    # For backward compatibility, we expose the following functions and classes at the top level
+    # in addition to `mlflow.config`.
+    "mlflow.config": [
+        "disable_system_metrics_logging",
+        "enable_system_metrics_logging",
+        "get_registry_uri",
+        "get_tracking_uri",
+        "is_tracking_uri_set",
+        "set_registry_uri",
+        "set_system_metrics_node_id",
+        "set_system_metrics_samples_before_logging",
+        "set_system_metrics_sampling_interval",
+        "set_tracking_uri",
+    ],
+    "mlflow.exceptions": ["MlflowException"],
+    "mlflow.models": ["evaluate"],
+    "mlflow.projects": ["run"],
+    "mlflow.tracing.fluent": [
+        "get_current_active_span",
+        "get_last_active_trace",
+        "get_trace",
+        "search_traces",
+        "start_span",
+        "trace",
+    ],
+    "mlflow.tracking._model_registry.fluent": [
+        "register_model",
+        "search_model_versions",
+        "search_registered_models",
+    ],
+    "mlflow.tracking.fluent": [
+        "ActiveRun",
+        "active_run",
+        "autolog",
+        "create_experiment",
+        "delete_experiment",
+        "delete_run",
+        "delete_tag",
+        "end_run",
+        "flush_artifact_async_logging",
+        "flush_async_logging",
+        "get_artifact_uri",
+        "get_experiment",
+        "get_experiment_by_name",
+        "get_parent_run",
+        "get_run",
+        "last_active_run",
+        "load_table",
+        "log_artifact",
+        "log_artifacts",
+        "log_dict",
+        "log_figure",
+        "log_image",
+        "log_input",
+        "log_metric",
+        "log_metrics",
+        "log_param",
+        "log_params",
+        "log_table",
+        "log_text",
+        "search_experiments",
+        "search_runs",
+        "set_experiment",
+        "set_experiment_tag",
+        "set_experiment_tags",
+        "set_tag",
+        "set_tags",
+        "start_run",
+    ],
+    "mlflow.tracking.multimedia": ["Image"],
+    "mlflow.utils.async_logging.run_operations": ["RunOperations"],
+    "mlflow.utils.credentials": ["login"],
+    "mlflow.utils.doctor": ["doctor"],
+}
+_LAZY_ATTRIBUTE_MODULES = {
+    name: module_name for module_name, names in _LAZY_IMPORTS.items() for name in names
+}
+
+if TYPE_CHECKING:
+    from mlflow import (
+        artifacts,  # noqa: F401
+        client,  # noqa: F401
+        config,  # noqa: F401
+        data,  # noqa: F401
+        exceptions,  # noqa: F401
+        gateway,  # noqa: F401
+        models,  # noqa: F401
+        projects,  # noqa: F401
+        tracking,  # noqa: F401
+    )
+    from mlflow.client import MlflowClient
+    from mlflow.config import (
+        disable_system_metrics_logging,
+        enable_system_metrics_logging,
+        get_registry_uri,
+        get_tracking_uri,
+        is_tracking_uri_set,
+        set_registry_uri,
+        set_system_metrics_node_id,
+        set_system_metrics_samples_before_logging,
+        set_system_metrics_sampling_interval,
+        set_tracking_uri,
+    )
+    from mlflow.exceptions import MlflowException
+    from mlflow.models import evaluate
+    from mlflow.projects import run
+    from mlflow.tracing.fluent import (
+        get_current_active_span,
+        get_last_active_trace,
+        get_trace,
+        search_traces,
+        start_span,
+        trace,
+    )
+    from mlflow.tracking._model_registry.fluent import (
+        register_model,
+        search_model_versions,
+        search_registered_models,
+    )
+    from mlflow.tracking.fluent import (
+        ActiveRun,
+        active_run,
+        autolog,
+        create_experiment,
+        delete_experiment,
+        delete_run,
+        delete_tag,
+        end_run,
+        flush_artifact_async_logging,
+        flush_async_logging,
+        get_artifact_uri,
+        get_experiment,
+        get_experiment_by_name,
+        get_parent_run,
+        get_run,
+        last_active_run,
+        load_table,
+        log_artifact,
+        log_artifacts,
+        log_dict,
+        log_figure,
+        log_image,
+        log_input,
+        log_metric,
+        log_metrics,
+        log_param,
+        log_params,
+        log_table,
+        log_text,
+        search_experiments,
+        search_runs,
+        set_experiment,
+        set_experiment_tag,
+        set_experiment_tags,
+        set_tag,
+        set_tags,
+        start_run,
+    )
+    from mlflow.tracking.multimedia import Image
+    from mlflow.utils.async_logging.run_operations import RunOperations  # noqa: F401
+    from mlflow.utils.credentials import login
+    from mlflow.utils.doctor import doctor
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTE_MODULES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTE_MODULES[name]), name)
+    elif not name.startswith("_"):
+        # Submodules, e.g. `mlflow.models`, used to be imported by `import mlflow`
+        try:
+            value = importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Later lookups don't go through `__getattr__`
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_ATTRIBUTE_MODULES})
+
 
 __all__ = [
     "ActiveRun",
@@ -230,12 +336,3 @@ __all__ = [
     "start_span",
     "trace",
 ]
-
-
-# `mlflow.gateway` depends on optional dependencies such as pydantic, psutil, and has version
-# restrictions for dependencies. Importing this module fails if they are not installed or
-# if invalid versions of these required packages are installed.
-with contextlib.suppress(Exception):
-    from mlflow import gateway  # noqa: F401
-
-    __all__.append("gateway")
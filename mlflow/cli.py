@@ -2,10 +2,8 @@ import contextlib
 import json
 import logging
 import os
-import re
 import sys
 import warnings
-from datetime import timedelta
 
 import click
 from click import UsageError
@@ -18,7 +16,11 @@ import mlflow.store.artifact.cli
 from mlflow import projects, version
 from mlflow.entities import ViewType
 from mlflow.entities.lifecycle_stage import LifecycleStage
-from mlflow.environment_variables import MLFLOW_EXPERIMENT_ID, MLFLOW_EXPERIMENT_NAME
+from mlflow.environment_variables import (
+    MLFLOW_EXPERIMENT_ID,
+    MLFLOW_EXPERIMENT_NAME,
+    MLFLOW_SERVER_ENABLE_METRIC_BUFFERING,
+)
 from mlflow.exceptions import InvalidUrlException, MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
@@ -259,6 +261,13 @@ def _validate_server_args(gunicorn_opts=None, workers=None, waitress_opts=None):
                 "gunicorn replaces waitress on non-Windows platforms, "
                 "cannot specify --waitress-opts"
             )
+        # Reads only write the metrics buffered by the worker handling them, so metrics buffered
+        # by other workers wouldn't be visible to clients reading their own writes
+        if MLFLOW_SERVER_ENABLE_METRIC_BUFFERING.get() and (workers is None or int(workers) != 1):
+            raise UsageError(
+                f"{MLFLOW_SERVER_ENABLE_METRIC_BUFFERING.name} requires a single gunicorn worker, "
+                "specify '--workers 1'."
+            )
 
 
 def _validate_static_prefix(ctx, param, value):
@@ -489,7 +498,7 @@ def gc(older_than, backend_store_uri, run_ids, experiment_ids):
     If the provided artifact URL is invalid, the artifact deletion will be bypassed,
     and the gc process will continue.
     """
-    from mlflow.utils.time import get_current_time_millis
+    from mlflow.utils.time import get_current_time_millis, parse_duration
 
     backend_store = _get_store(backend_store_uri, None)
     skip_experiments = False
@@ -510,19 +519,7 @@ def gc(older_than, backend_store_uri, run_ids, experiment_ids):
     time_delta = 0
 
     if older_than is not None:
-        regex = re.compile(
-            r"^((?P<days>[\.\d]+?)d)?((?P<hours>[\.\d]+?)h)?((?P<minutes>[\.\d]+?)m)"
-            r"?((?P<seconds>[\.\d]+?)s)?$"
-        )
-        parts = regex.match(older_than)
-        if parts is None:
-            raise MlflowException(
-                f"Could not parse any time information from '{older_than}'. "
-                "Examples of valid strings: '8h', '2d8h5m20s', '2m4s'",
-                error_code=INVALID_PARAMETER_VALUE,
-            )
-        time_params = {name: float(param) for name, param in parts.groupdict().items() if param}
-        time_delta = int(timedelta(**time_params).total_seconds() * 1000)
+        time_delta = int(parse_duration(older_than).total_seconds() * 1000)
 
     deleted_run_ids_older_than = backend_store._get_deleted_runs(older_than=time_delta)
     run_ids = run_ids.split(",") if run_ids else deleted_run_ids_older_than
@@ -630,6 +627,51 @@ def gc(older_than, backend_store_uri, run_ids, experiment_ids):
             click.echo(f"Experiment with ID {experiment_id} has been permanently deleted.")
 
 
+@cli.command(short_help="Convert the metric files of a file-based tracking store.")
+@click.option(
+    "--backend-store-uri",
+    metavar="PATH",
+    default=DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH,
+    help="URI of the file-based backend store whose metric files to convert "
+    "(e.g. 'file:///absolute/path/to/directory'). By default, the metric files of the "
+    "./mlruns directory are converted.",
+)
+@click.option(
+    "--format",
+    "metric_format",
+    type=click.Choice(["text", "binary"]),
+    default="binary",
+    show_default=True,
+    help="The format of the converted metric files.",
+)
+@click.option(
+    "--experiment-ids",
+    default=None,
+    help="Optional comma separated list of experiments whose runs to convert. If experiment ids "
+    "are not specified, the runs of all experiments, including deleted ones, are converted.",
+)
+def migrate_metrics(backend_store_uri, metric_format, experiment_ids):
+    """
+    Convert the metric files of the runs of a file-based backend store to the given format.
+    Metric files of both formats can be read by MLflow regardless of the value of
+    ``MLFLOW_FILE_STORE_METRIC_FORMAT``, which selects the format of new metric files.
+
+    **IMPORTANT**: Values logged to a metric while its file is converted may be lost - stop the
+    processes logging to the backend store before running this command.
+    """
+    from mlflow.store.tracking.file_store import FileStore
+
+    backend_store = _get_store(backend_store_uri, None)
+    if not isinstance(backend_store, FileStore):
+        raise MlflowException(
+            "This cli can only be used with a file-based backend store",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    experiment_ids = experiment_ids.split(",") if experiment_ids else None
+    num_converted = backend_store._convert_metric_files(metric_format, experiment_ids)
+    click.echo(f"Converted {num_converted} metric files to the {metric_format} format.")
+
+
 @cli.command(short_help="Prints out useful information for debugging issues with MLflow.")
 @click.option(
     "--mask-envs",
@@ -1,7 +1,8 @@
-from typing import Any, List
+from typing import Any, List, Optional
 
 from packaging.version import Version
 
+from mlflow.environment_variables import MLFLOW_USE_LEGACY_DATASET_DIGEST
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
 from mlflow.utils import insecure_hash
@@ -9,11 +10,54 @@ from mlflow.utils import insecure_hash
 MAX_ROWS = 10000
 
 
-def compute_pandas_digest(df) -> str:
+def get_sample_indices(num_rows: int, max_rows: int = MAX_ROWS):
+    """Selects the rows of a dataset that are hashed to compute its digest.
+
+    Args:
+        num_rows: The number of rows of the dataset.
+        max_rows: The maximum number of rows to select.
+
+    Returns:
+        A sorted numpy array of row indices: all the rows if there are at most ``max_rows`` of
+        them, otherwise the first and last ``max_rows // 4`` rows, and rows evenly spaced in
+        between them.
+    """
+    import numpy as np
+
+    if num_rows <= max_rows:
+        return np.arange(num_rows)
+    num_edge_rows = max_rows // 4
+    head = np.arange(num_edge_rows)
+    tail = np.arange(num_rows - num_edge_rows, num_rows)
+    strided = np.linspace(
+        num_edge_rows, num_rows - num_edge_rows - 1, max_rows - 2 * num_edge_rows, dtype=np.int64
+    )
+    return np.unique(np.concatenate([head, strided, tail]))
+
+
+def _is_string_column(column) -> bool:
+    import pandas as pd
+
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        values = column.cat.categories
+    elif pd.api.types.is_object_dtype(column.dtype) or pd.api.types.is_string_dtype(column.dtype):
+        values = column
+    else:
+        return False
+    return not column.isna().any() and pd.api.types.infer_dtype(values, skipna=False) == "string"
+
+
+def compute_pandas_digest(df, num_rows: Optional[int] = None) -> str:
     """Computes a digest for the given Pandas DataFrame.
 
+    The digest is computed from the string and numeric columns of a bounded sample of the rows
+    of the DataFrame, see :py:func:`get_sample_indices`, so that it takes a constant time
+    regardless of the size of the DataFrame.
+
     Args:
         df: A Pandas DataFrame.
+        num_rows: The number of rows of the dataset ``df`` was sampled from, if it was.
+            Defaults to the number of rows of ``df``.
 
     Returns:
         A string digest.
@@ -21,6 +65,41 @@ def compute_pandas_digest(df) -> str:
     import numpy as np
     import pandas as pd
 
+    if MLFLOW_USE_LEGACY_DATASET_DIGEST.get():
+        return _compute_legacy_pandas_digest(df)
+
+    num_rows = len(df) if num_rows is None else num_rows
+    sampled_df = df.iloc[get_sample_indices(len(df))] if len(df) > MAX_ROWS else df
+
+    # keep string and number columns, drop other column types. String columns are the columns
+    # whose sampled values are all strings, or all the columns if there are no rows
+    string_columns = pd.Index(
+        [
+            column
+            for i, column in enumerate(sampled_df.columns)
+            if len(sampled_df) == 0 or _is_string_column(sampled_df.iloc[:, i])
+        ],
+        dtype=sampled_df.columns.dtype,
+    )
+    numeric_columns = sampled_df.select_dtypes(include=[np.number]).columns
+
+    desired_columns = string_columns.union(numeric_columns)
+    sampled_df = sampled_df[desired_columns]
+
+    return get_normalized_md5_digest(
+        [
+            pd.util.hash_pandas_object(sampled_df).values,
+            np.int64(num_rows),
+        ]
+        + [str(x).encode() for x in df.columns]
+    )
+
+
+def _compute_legacy_pandas_digest(df) -> str:
+    """Computes the digest of a Pandas DataFrame from its first rows, as MLflow < 2.14 did."""
+    import numpy as np
+    import pandas as pd
+
     # trim to max rows
     trimmed_df = df.head(MAX_ROWS)
 
@@ -46,6 +125,9 @@ def compute_pandas_digest(df) -> str:
 def compute_numpy_digest(features, targets=None) -> str:
     """Computes a digest for the given numpy array.
 
+    The digest is computed from a bounded sample of the elements of the arrays, see
+    :py:func:`get_sample_indices`, which are gathered without copying the arrays.
+
     Args:
         features: A numpy array containing dataset features.
         targets: A numpy array containing dataset targets. Optional.
@@ -56,15 +138,20 @@ def compute_numpy_digest(features, targets=None) -> str:
     import numpy as np
     import pandas as pd
 
+    legacy = MLFLOW_USE_LEGACY_DATASET_DIGEST.get()
     hashable_elements = []
 
     def hash_array(array):
-        flattened_array = array.flatten()
-        trimmed_array = flattened_array[0:MAX_ROWS]
+        if legacy:
+            sampled_array = array.flatten()[0:MAX_ROWS]
+        elif array.size <= MAX_ROWS:
+            sampled_array = array.ravel()
+        else:
+            sampled_array = array[np.unravel_index(get_sample_indices(array.size), array.shape)]
         try:
-            hashable_elements.append(pd.util.hash_array(trimmed_array))
+            hashable_elements.append(pd.util.hash_array(sampled_array))
         except TypeError:
-            hashable_elements.append(np.int64(trimmed_array.size))
+            hashable_elements.append(np.int64(sampled_array.size))
 
         # hash full array dimensions
         for x in array.shape:
@@ -4,9 +4,10 @@ from functools import cached_property
 from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Sequence, Union
 
 from mlflow.data.dataset import Dataset
-from mlflow.data.digest_utils import compute_pandas_digest
+from mlflow.data.digest_utils import compute_pandas_digest, get_sample_indices
 from mlflow.data.huggingface_dataset_source import HuggingFaceDatasetSource
 from mlflow.data.pyfunc_dataset_mixin import PyFuncConvertibleDatasetMixin, PyFuncInputsOutputs
+from mlflow.environment_variables import MLFLOW_USE_LEGACY_DATASET_DIGEST
 from mlflow.exceptions import MlflowException
 from mlflow.models.evaluation.base import EvaluationDataset
 from mlflow.protos.databricks_pb2 import INTERNAL_ERROR, INVALID_PARAMETER_VALUE
@@ -60,12 +61,20 @@ class HuggingFaceDataset(Dataset, PyFuncConvertibleDatasetMixin):
         Computes a digest for the dataset. Called if the user doesn't supply
         a digest when constructing the dataset.
         """
-        df = next(
-            self._ds.to_pandas(
-                batch_size=_MAX_ROWS_FOR_DIGEST_COMPUTATION_AND_SCHEMA_INFERENCE, batched=True
+        num_rows = self._ds.num_rows
+        if (
+            MLFLOW_USE_LEGACY_DATASET_DIGEST.get()
+            or num_rows <= _MAX_ROWS_FOR_DIGEST_COMPUTATION_AND_SCHEMA_INFERENCE
+        ):
+            df = next(
+                self._ds.to_pandas(
+                    batch_size=_MAX_ROWS_FOR_DIGEST_COMPUTATION_AND_SCHEMA_INFERENCE, batched=True
+                )
             )
-        )
-        return compute_pandas_digest(df)
+            return compute_pandas_digest(df)
+        # Only convert the sampled rows to pandas
+        df = self._ds.select(get_sample_indices(num_rows)).to_pandas()
+        return compute_pandas_digest(df, num_rows=num_rows)
 
     def to_dict(self) -> Dict[str, str]:
         """Create config dictionary for the dataset.
@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
@@ -41,13 +42,22 @@ from mlflow.gateway.constants import (
     MLFLOW_QUERY_SUFFIX,
 )
 from mlflow.gateway.providers import get_provider
+from mlflow.gateway.providers.utils import ClientSessionPool
 from mlflow.gateway.schemas import chat, completions, embeddings
 from mlflow.gateway.utils import SearchRoutesToken, make_streaming_response
 from mlflow.version import VERSION
 
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # Requests to upstream providers reuse the connections of a pool that lives as long as the app
+    async with ClientSessionPool():
+        yield
+
+
 class GatewayAPI(FastAPI):
     def __init__(self, config: GatewayConfig, limiter: Limiter, *args: Any, **kwargs: Any):
+        kwargs.setdefault("lifespan", _lifespan)
         super().__init__(*args, **kwargs)
         self.state.limiter = limiter
         self.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
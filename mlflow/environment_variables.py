@@ -232,12 +232,42 @@ MLFLOW_REQUIREMENTS_INFERENCE_TIMEOUT = _EnvironmentVariable(
     "MLFLOW_REQUIREMENTS_INFERENCE_TIMEOUT", int, 120
 )
 
+#: Specifies a directory in which the inferred pip requirements of models are cached, so that
+#: logging models which only differ by their weights, e.g. the models of a hyperparameter sweep,
+#: in the same Python environment doesn't load them in a subprocess again. Caching is disabled if
+#: not set.
+#: (default: ``None``)
+MLFLOW_REQUIREMENTS_INFERENCE_CACHE_DIR = _EnvironmentVariable(
+    "MLFLOW_REQUIREMENTS_INFERENCE_CACHE_DIR", str, None
+)
+
 #: Specifies the MLflow Model Scoring server request timeout in seconds
 #: (default: ``60``)
 MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT = _EnvironmentVariable(
     "MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT", int, 60
 )
 
+#: Specifies whether the MLflow Model Scoring server groups concurrent requests into batches
+#: scored with a single ``predict`` call.
+#: (default: ``False``)
+MLFLOW_SCORING_SERVER_ENABLE_BATCHING = _BooleanEnvironmentVariable(
+    "MLFLOW_SCORING_SERVER_ENABLE_BATCHING", False
+)
+
+#: Specifies the maximum number of rows of the batches scored by the MLflow Model Scoring server
+#: when batching is enabled.
+#: (default: ``64``)
+MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE = _EnvironmentVariable(
+    "MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE", int, 64
+)
+
+#: Specifies the maximum time in milliseconds the MLflow Model Scoring server waits for
+#: concurrent requests to fill a batch when batching is enabled.
+#: (default: ``5``)
+MLFLOW_SCORING_SERVER_MAX_BATCH_DELAY_MS = _EnvironmentVariable(
+    "MLFLOW_SCORING_SERVER_MAX_BATCH_DELAY_MS", float, 5
+)
+
 #: (Experimental, may be changed or removed)
 #: Specifies the timeout to use when uploading or downloading a file
 #: (default: ``None``). If None, individual artifact stores will choose defaults.
@@ -245,6 +275,19 @@ MLFLOW_ARTIFACT_UPLOAD_DOWNLOAD_TIMEOUT = _EnvironmentVariable(
     "MLFLOW_ARTIFACT_UPLOAD_DOWNLOAD_TIMEOUT", int, None
 )
 
+#: Specifies the directory of the local cache of the artifacts of registered model versions
+#: downloaded from ``models:/`` URIs, which lets processes load the same model versions without
+#: downloading them again. The directory can be shared by the processes of a machine.
+#: (default: ``None``, which disables the cache)
+MLFLOW_ARTIFACT_CACHE_DIR = _EnvironmentVariable("MLFLOW_ARTIFACT_CACHE_DIR", str, None)
+
+#: Specifies the maximum total size of the files in ``MLFLOW_ARTIFACT_CACHE_DIR``, in bytes. The
+#: least recently used files are evicted once the cache exceeds this size.
+#: (default: ``10737418240``, i.e. 10 GiB)
+MLFLOW_ARTIFACT_CACHE_MAX_SIZE = _EnvironmentVariable(
+    "MLFLOW_ARTIFACT_CACHE_MAX_SIZE", int, 10 * 1024**3
+)
+
 #: Specifies the timeout for model inference with input example(s) when logging/saving a model.
 #: MLflow runs a few inference requests against the model to infer model signature and pip
 #: requirements. Sometimes the prediction hangs for a long time, especially for a large model.
@@ -386,6 +429,14 @@ MLFLOW_ENV_ROOT = _EnvironmentVariable(
     "MLFLOW_ENV_ROOT", str, str(Path.home().joinpath(".mlflow", "envs"))
 )
 
+#: Specifies the directory of the cache of packed virtualenv environments. Environments created
+#: to restore the environments of models are packed into this directory, and environments with
+#: the same Python version and requirements are unpacked from it instead of being created again,
+#: e.g. by ``mlflow models serve`` or on the executors of ``spark_udf``. The directory can be
+#: shared between machines with the same platform, e.g. on a network file system.
+#: (default: ``None``, which disables the cache)
+MLFLOW_ENV_CACHE_DIR = _EnvironmentVariable("MLFLOW_ENV_CACHE_DIR", str, None)
+
 #: Specifies whether or not to use DBFS FUSE mount to store artifacts on Databricks
 #: (default: ``False``)
 MLFLOW_ENABLE_DBFS_FUSE_ARTIFACT_REPO = _BooleanEnvironmentVariable(
@@ -631,3 +682,116 @@ MLFLOW_ENABLE_UC_FUNCTIONS = _BooleanEnvironmentVariable("MLFLOW_ENABLE_UC_FUNCT
 MLFLOW_ASYNC_LOGGING_BUFFERING_SECONDS = _EnvironmentVariable(
     "MLFLOW_ASYNC_LOGGING_BUFFERING_SECONDS", int, None
 )
+
+#: Specifies whether ``FileStore.search_runs`` should use an on-disk index of the runs of each
+#: experiment (stored under the experiment directory) instead of reading every run directory.
+#: The index is created on the first search and kept up to date by subsequent writes.
+#: (default: ``False``)
+MLFLOW_FILE_STORE_RUN_INDEX = _BooleanEnvironmentVariable("MLFLOW_FILE_STORE_RUN_INDEX", False)
+
+#: Specifies the maximum number of records (metrics, params and tags) that can be queued or being
+#: logged by the asynchronous logging queue at any time. Once the limit is reached, asynchronous
+#: logging calls are handled according to ``MLFLOW_ASYNC_LOGGING_OVERFLOW_POLICY``.
+#: (default: ``None``, i.e. unbounded)
+MLFLOW_ASYNC_LOGGING_MAX_IN_FLIGHT_RECORDS = _EnvironmentVariable(
+    "MLFLOW_ASYNC_LOGGING_MAX_IN_FLIGHT_RECORDS", int, None
+)
+
+#: Specifies how asynchronous logging calls are handled when the maximum number of in-flight
+#: records is reached: ``block`` waits until enough records are logged, and ``drop`` discards the
+#: logged data, in which case waiting for the returned operation raises an exception.
+#: (default: ``block``)
+MLFLOW_ASYNC_LOGGING_OVERFLOW_POLICY = _EnvironmentVariable(
+    "MLFLOW_ASYNC_LOGGING_OVERFLOW_POLICY", str, "block"
+)
+
+#: Specifies the maximum number of simultaneous connections that the MLflow Deployments server
+#: opens to each upstream provider origin. ``0`` means no limit.
+#: (default: ``100``)
+MLFLOW_GATEWAY_HTTP_POOL_LIMIT = _EnvironmentVariable("MLFLOW_GATEWAY_HTTP_POOL_LIMIT", int, 100)
+
+#: Specifies the number of seconds for which the MLflow Deployments server caches the DNS
+#: resolution of upstream provider hosts. ``0`` disables caching.
+#: (default: ``300``)
+MLFLOW_GATEWAY_HTTP_DNS_CACHE_TTL = _EnvironmentVariable(
+    "MLFLOW_GATEWAY_HTTP_DNS_CACHE_TTL", int, 300
+)
+
+#: Specifies the number of seconds for which the MLflow Deployments server keeps idle connections
+#: to upstream providers open for reuse.
+#: (default: ``30``)
+MLFLOW_GATEWAY_HTTP_KEEPALIVE_TIMEOUT = _EnvironmentVariable(
+    "MLFLOW_GATEWAY_HTTP_KEEPALIVE_TIMEOUT", float, 30.0
+)
+
+#: Specifies the format of the metric files created by ``FileStore``: ``text``, where each logged
+#: value is a ``"{timestamp} {value} {step}"`` line, or ``binary``, where each logged value is a
+#: fixed-width record that can be memory-mapped. Existing metric files keep their format, and both
+#: formats can be read regardless of this setting. Use ``mlflow migrate-metrics`` to convert the
+#: metric files of existing runs.
+#: (default: ``text``)
+MLFLOW_FILE_STORE_METRIC_FORMAT = _EnvironmentVariable(
+    "MLFLOW_FILE_STORE_METRIC_FORMAT", str, "text"
+)
+
+#: Specifies whether to compute the digests of pandas and numpy datasets from their first rows
+#: and elements, as MLflow < 2.14 did, instead of sampling rows across the whole dataset. Digests
+#: of datasets with at most 10000 rows, or numpy arrays with at most 10000 elements, are the same
+#: either way. Set this to ``true`` to keep the digests of larger datasets logged by earlier
+#: versions of MLflow, at the cost of a slower digest computation.
+#: (default: ``False``)
+MLFLOW_USE_LEGACY_DATASET_DIGEST = _BooleanEnvironmentVariable(
+    "MLFLOW_USE_LEGACY_DATASET_DIGEST", False
+)
+
+#: Specifies whether the tracking server buffers the metrics logged to runs and writes them to the
+#: tracking store in bulk, acknowledging logging requests once their metrics are appended to a
+#: write-ahead log in ``MLFLOW_SERVER_METRIC_BUFFER_DIR``. Reads of runs and metrics write the
+#: buffered metrics of the runs they read first. Buffering requires a database-backed tracking
+#: store and a single server worker, i.e. ``mlflow server --workers 1``.
+#: (default: ``False``)
+MLFLOW_SERVER_ENABLE_METRIC_BUFFERING = _BooleanEnvironmentVariable(
+    "MLFLOW_SERVER_ENABLE_METRIC_BUFFERING", False
+)
+
+#: Specifies the directory of the write-ahead log of the metrics buffered by the tracking server,
+#: which must persist across restarts of the server for buffered metrics to survive crashes.
+#: (default: ``mlflow-metric-buffer`` in the temporary directory of the system)
+MLFLOW_SERVER_METRIC_BUFFER_DIR = _EnvironmentVariable("MLFLOW_SERVER_METRIC_BUFFER_DIR", str, None)
+
+#: Specifies the maximum number of seconds the tracking server buffers metrics for before writing
+#: them to the tracking store.
+#: (default: ``1.0``)
+MLFLOW_SERVER_METRIC_BUFFER_FLUSH_INTERVAL = _EnvironmentVariable(
+    "MLFLOW_SERVER_METRIC_BUFFER_FLUSH_INTERVAL", float, 1.0
+)
+
+#: Specifies the number of metrics buffered by a tracking server worker above which they are
+#: written to the tracking store without waiting for the flush interval.
+#: (default: ``10000``)
+MLFLOW_SERVER_METRIC_BUFFER_MAX_SIZE = _EnvironmentVariable(
+    "MLFLOW_SERVER_METRIC_BUFFER_MAX_SIZE", int, 10000
+)
+
+#: Specifies whether the model checkpoints of the pytorch-lightning and keras checkpoint callbacks
+#: are uploaded in background threads. Checkpoints are saved to the local disk during training and
+#: uploaded while training continues, and the callbacks wait for pending uploads at the end of
+#: training. Set this to ``false`` to upload checkpoints before training continues.
+#: (default: ``True``)
+MLFLOW_CHECKPOINT_ASYNC_UPLOAD = _BooleanEnvironmentVariable("MLFLOW_CHECKPOINT_ASYNC_UPLOAD", True)
+
+#: Specifies the maximum number of model checkpoints uploaded concurrently when
+#: ``MLFLOW_CHECKPOINT_ASYNC_UPLOAD`` is enabled.
+#: (default: ``1``)
+MLFLOW_CHECKPOINT_UPLOAD_MAX_WORKERS = _EnvironmentVariable(
+    "MLFLOW_CHECKPOINT_UPLOAD_MAX_WORKERS", int, 1
+)
+
+#: Specifies the maximum number of model checkpoints saved to the local disk and waiting to be
+#: uploaded when ``MLFLOW_CHECKPOINT_ASYNC_UPLOAD`` is enabled. Training waits for an upload to
+#: start before saving more checkpoints. A pending checkpoint is replaced, without being uploaded,
+#: by a newer checkpoint logged to the same artifact directory, e.g. the latest best checkpoint.
+#: (default: ``2``)
+MLFLOW_CHECKPOINT_MAX_PENDING_UPLOADS = _EnvironmentVariable(
+    "MLFLOW_CHECKPOINT_MAX_PENDING_UPLOADS", int, 2
+)
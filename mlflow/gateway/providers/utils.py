@@ -1,21 +1,111 @@
+import asyncio
+import urllib.parse
+import weakref
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Dict
+from typing import Any, AsyncGenerator, Dict, Optional, Tuple
 
 import aiohttp
 
+from mlflow.environment_variables import (
+    MLFLOW_GATEWAY_HTTP_DNS_CACHE_TTL,
+    MLFLOW_GATEWAY_HTTP_KEEPALIVE_TIMEOUT,
+    MLFLOW_GATEWAY_HTTP_POOL_LIMIT,
+)
 from mlflow.gateway.constants import (
     MLFLOW_GATEWAY_ROUTE_TIMEOUT_SECONDS,
 )
 from mlflow.utils.uri import append_to_uri_path
 
+# The session pool of each event loop running a gateway app
+_SESSION_POOLS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ClientSessionPool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class ClientSessionPool:
+    """
+    A pool of long-lived ``aiohttp.ClientSession`` instances, one per upstream origin (scheme and
+    host), so that requests sent to the same provider reuse keep-alive connections instead of
+    opening a new connection each time.
+
+    While the pool is entered as an async context manager, ``send_request`` and
+    ``send_stream_request`` calls made from the same event loop use its sessions. The sessions
+    are closed when the context manager exits.
+
+    Args:
+        limit: The maximum number of simultaneous connections per origin, ``0`` for no limit.
+        dns_cache_ttl: The number of seconds for which DNS resolutions are cached.
+        keepalive_timeout: The number of seconds for which idle connections are kept open.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int] = None,
+        dns_cache_ttl: Optional[int] = None,
+        keepalive_timeout: Optional[float] = None,
+    ):
+        self.limit = MLFLOW_GATEWAY_HTTP_POOL_LIMIT.get() if limit is None else limit
+        self.dns_cache_ttl = (
+            MLFLOW_GATEWAY_HTTP_DNS_CACHE_TTL.get() if dns_cache_ttl is None else dns_cache_ttl
+        )
+        self.keepalive_timeout = (
+            MLFLOW_GATEWAY_HTTP_KEEPALIVE_TIMEOUT.get()
+            if keepalive_timeout is None
+            else keepalive_timeout
+        )
+        self._sessions: Dict[Tuple[str, str], aiohttp.ClientSession] = {}
+        self._loop = None
+
+    def get_session(self, base_url: str) -> aiohttp.ClientSession:
+        """
+        Returns the session used to send requests to the origin of ``base_url``.
+        """
+        parsed = urllib.parse.urlsplit(base_url)
+        origin = (parsed.scheme, parsed.netloc)
+        session = self._sessions.get(origin)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                ttl_dns_cache=self.dns_cache_ttl or None,
+                use_dns_cache=self.dns_cache_ttl > 0,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            session = aiohttp.ClientSession(connector=connector)
+            self._sessions[origin] = session
+        return session
+
+    async def close(self) -> None:
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        await asyncio.gather(*(session.close() for session in sessions))
+
+    async def __aenter__(self) -> "ClientSessionPool":
+        self._loop = asyncio.get_running_loop()
+        _SESSION_POOLS[self._loop] = self
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        if _SESSION_POOLS.get(self._loop) is self:
+            del _SESSION_POOLS[self._loop]
+        await self.close()
+
+
+def _get_session_pool() -> Optional[ClientSessionPool]:
+    return _SESSION_POOLS.get(asyncio.get_running_loop())
+
 
 @asynccontextmanager
 async def _aiohttp_post(headers: Dict[str, str], base_url: str, path: str, payload: Dict[str, Any]):
-    async with aiohttp.ClientSession(headers=headers) as session:
-        url = append_to_uri_path(base_url, path)
-        timeout = aiohttp.ClientTimeout(total=MLFLOW_GATEWAY_ROUTE_TIMEOUT_SECONDS)
-        async with session.post(url, json=payload, timeout=timeout) as response:
+    url = append_to_uri_path(base_url, path)
+    timeout = aiohttp.ClientTimeout(total=MLFLOW_GATEWAY_ROUTE_TIMEOUT_SECONDS)
+    if pool := _get_session_pool():
+        session = pool.get_session(base_url)
+        async with session.post(url, json=payload, headers=headers, timeout=timeout) as response:
             yield response
+    else:
+        async with aiohttp.ClientSession(headers=headers) as session:
+            async with session.post(url, json=payload, timeout=timeout) as response:
+                yield response
 
 
 async def send_request(headers: Dict[str, str], base_url: str, path: str, payload: Dict[str, Any]):
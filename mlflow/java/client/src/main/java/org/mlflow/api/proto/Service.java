@@ -43478,6 +43478,85 @@ public final class Service {
      */
     com.google.protobuf.ByteString
         getPageTokenBytes();
+
+    /**
+     * <pre>
+     * If set, only the latest metrics with these keys are returned with each run. By default, all
+     * the latest metrics of the runs are returned.
+     * </pre>
+     *
+     * <code>optional .mlflow.SearchRuns.KeyList include_metrics = 8;</code>
+     * @return Whether the includeMetrics field is set.
+     */
+    boolean hasIncludeMetrics();
+    /**
+     * <pre>
+     * If set, only the latest metrics with these keys are returned with each run. By default, all
+     * the latest metrics of the runs are returned.
+     * </pre>
+     *
+     * <code>optional .mlflow.SearchRuns.KeyList include_metrics = 8;</code>
+     * @return The includeMetrics.
+     */
+    org.mlflow.api.proto.Service.SearchRuns.KeyList getIncludeMetrics();
+    /**
+     * <pre>
+     * If set, only the latest metrics with these keys are returned with each run. By default, all
+     * the latest metrics of the runs are returned.
+     * </pre>
+     *
+     * <code>optional .mlflow.SearchRuns.KeyList include_metrics = 8;</code>
+     */
+    org.mlflow.api.proto.Service.SearchRuns.KeyListOrBuilder getIncludeMetricsOrBuilder();
+
+    /**
+     * <pre>
+     * If set, only the params with these keys are returned with each run. By default, all the
+     * params of the runs are returned.
+     * </pre>
+     *
+     * <code>optional .mlflow.SearchRuns.KeyList include_params = 9;</code>
+     * @return Whether the includeParams field is set.
+     */
+    boolean hasIncludeParams();
+    /**
+     * <pre>
+     * If set, only the params with these keys are returned with each run. By default, all the
+     * params of the runs are returned.
+     * </pre>
+     *
+     * <code>optional .mlflow.SearchRuns.KeyList include_params = 9;</code>
+     * @return The includeParams.
+     */
+    org.mlflow.api.proto.Service.SearchRuns.KeyList getIncludeParams();
+    /**
+     * <pre>
+     * If set, only the params with these keys are returned with each run. By default, all the
+     * params of the runs are returned.
+     * </pre>
+     *
+     * <code>optional .mlflow.SearchRuns.KeyList include_params = 9;</code>
+     */
+    org.mlflow.api.proto.Service.SearchRuns.KeyListOrBuilder getIncludeParamsOrBuilder();
+
+    /**
+     * <pre>
+     * Whether to return the dataset inputs of the runs. Defaults to true.
+     * </pre>
+     *
+     * <code>optional bool include_inputs = 10 [default = true];</code>
+     * @return Whether the includeInputs field is set.
+     */
+    boolean hasIncludeInputs();
+    /**
+     * <pre>
+     * Whether to return the dataset inputs of the runs. Defaults to true.
+     * </pre>
+     *
+     * <code>optional bool include_inputs = 10 [default = true];</code>
+     * @return The includeInputs.
+     */
+    boolean getIncludeInputs();
   }
   /**
    * Protobuf type {@code mlflow.SearchRuns}
@@ -43498,6 +43577,7 @@ public final class Service {
       maxResults_ = 1000;
       orderBy_ = com.google.protobuf.LazyStringArrayList.EMPTY;
       pageToken_ = "";
+      includeInputs_ = true;
     }
 
     @java.lang.Override
@@ -43578,6 +43658,37 @@ public final class Service {
               pageToken_ = bs;
               break;
             }
+            case 66: {
+              org.mlflow.api.proto.Service.SearchRuns.KeyList.Builder subBuilder = null;
+              if (((bitField0_ & 0x00000010) != 0)) {
+                subBuilder = includeMetrics_.toBuilder();
+              }
+              includeMetrics_ = input.readMessage(org.mlflow.api.proto.Service.SearchRuns.KeyList.PARSER, extensionRegistry);
+              if (subBuilder != null) {
+                subBuilder.mergeFrom(includeMetrics_);
+                includeMetrics_ = subBuilder.buildPartial();
+              }
+              bitField0_ |= 0x00000010;
+              break;
+            }
+            case 74: {
+              org.mlflow.api.proto.Service.SearchRuns.KeyList.Builder subBuilder = null;
+              if (((bitField0_ & 0x00000020) != 0)) {
+                subBuilder = includeParams_.toBuilder();
+              }
+              includeParams_ = input.readMessage(org.mlflow.api.proto.Service.SearchRuns.KeyList.PARSER, extensionRegistry);
+              if (subBuilder != null) {
+                subBuilder.mergeFrom(includeParams_);
+                includeParams_ = subBuilder.buildPartial();
+              }
+              bitField0_ |= 0x00000020;
+              break;
+            }
+            case 80: {
+              bitField0_ |= 0x00000040;
+              includeInputs_ = input.readBool();
+              break;
+            }
             default: {
               if (!parseUnknownField(
                   input, unknownFields, extensionRegistry, tag)) {
@@ -43616,93 +43727,60 @@ public final class Service {
               org.mlflow.api.proto.Service.SearchRuns.class, org.mlflow.api.proto.Service.SearchRuns.Builder.class);
     }
 
-    public interface ResponseOrBuilder extends
-        // @@protoc_insertion_point(interface_extends:mlflow.SearchRuns.Response)
+    public interface KeyListOrBuilder extends
+        // @@protoc_insertion_point(interface_extends:mlflow.SearchRuns.KeyList)
         com.google.protobuf.MessageOrBuilder {
 
       /**
-       * <pre>
-       * Runs that match the search criteria.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Run runs = 1;</code>
-       */
-      java.util.List<org.mlflow.api.proto.Service.Run> 
-          getRunsList();
-      /**
-       * <pre>
-       * Runs that match the search criteria.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Run runs = 1;</code>
-       */
-      org.mlflow.api.proto.Service.Run getRuns(int index);
-      /**
-       * <pre>
-       * Runs that match the search criteria.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Run runs = 1;</code>
-       */
-      int getRunsCount();
-      /**
-       * <pre>
-       * Runs that match the search criteria.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Run runs = 1;</code>
-       */
-      java.util.List<? extends org.mlflow.api.proto.Service.RunOrBuilder> 
-          getRunsOrBuilderList();
-      /**
-       * <pre>
-       * Runs that match the search criteria.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Run runs = 1;</code>
+       * <code>repeated string keys = 1;</code>
+       * @return A list containing the keys.
        */
-      org.mlflow.api.proto.Service.RunOrBuilder getRunsOrBuilder(
-          int index);
-
+      java.util.List<java.lang.String>
+          getKeysList();
       /**
-       * <code>optional string next_page_token = 2;</code>
-       * @return Whether the nextPageToken field is set.
+       * <code>repeated string keys = 1;</code>
+       * @return The count of keys.
        */
-      boolean hasNextPageToken();
+      int getKeysCount();
       /**
-       * <code>optional string next_page_token = 2;</code>
-       * @return The nextPageToken.
+       * <code>repeated string keys = 1;</code>
+       * @param index The index of the element to return.
+       * @return The keys at the given index.
        */
-      java.lang.String getNextPageToken();
+      java.lang.String getKeys(int index);
       /**
-       * <code>optional string next_page_token = 2;</code>
-       * @return The bytes for nextPageToken.
+       * <code>repeated string keys = 1;</code>
+       * @param index The index of the value to return.
+       * @return The bytes of the keys at the given index.
        */
       com.google.protobuf.ByteString
-          getNextPageTokenBytes();
+          getKeysBytes(int index);
     }
     /**
-     * Protobuf type {@code mlflow.SearchRuns.Response}
+     * <pre>
+     * List of keys, which allows to distinguish an empty list from an unset field.
+     * </pre>
+     *
+     * Protobuf type {@code mlflow.SearchRuns.KeyList}
      */
-    public static final class Response extends
+    public static final class KeyList extends
         com.google.protobuf.GeneratedMessageV3 implements
-        // @@protoc_insertion_point(message_implements:mlflow.SearchRuns.Response)
-        ResponseOrBuilder {
+        // @@protoc_insertion_point(message_implements:mlflow.SearchRuns.KeyList)
+        KeyListOrBuilder {
     private static final long serialVersionUID = 0L;
-      // Use Response.newBuilder() to construct.
-      private Response(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+      // Use KeyList.newBuilder() to construct.
+      private KeyList(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
         super(builder);
       }
-      private Response() {
-        runs_ = java.util.Collections.emptyList();
-        nextPageToken_ = "";
+      private KeyList() {
+        keys_ = com.google.protobuf.LazyStringArrayList.EMPTY;
       }
 
       @java.lang.Override
       @SuppressWarnings({"unused"})
       protected java.lang.Object newInstance(
           UnusedPrivateParameter unused) {
-        return new Response();
+        return new KeyList();
       }
 
       @java.lang.Override
@@ -43710,7 +43788,7 @@ public final class Service {
       getUnknownFields() {
         return this.unknownFields;
       }
-      private Response(
+      private KeyList(
           com.google.protobuf.CodedInputStream input,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws com.google.protobuf.InvalidProtocolBufferException {
@@ -43730,18 +43808,12 @@ public final class Service {
                 done = true;
                 break;
               case 10: {
+                com.google.protobuf.ByteString bs = input.readBytes();
                 if (!((mutable_bitField0_ & 0x00000001) != 0)) {
-                  runs_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Run>();
+                  keys_ = new com.google.protobuf.LazyStringArrayList();
                   mutable_bitField0_ |= 0x00000001;
                 }
-                runs_.add(
-                    input.readMessage(org.mlflow.api.proto.Service.Run.PARSER, extensionRegistry));
-                break;
-              }
-              case 18: {
-                com.google.protobuf.ByteString bs = input.readBytes();
-                bitField0_ |= 0x00000001;
-                nextPageToken_ = bs;
+                keys_.add(bs);
                 break;
               }
               default: {
@@ -43760,7 +43832,7 @@ public final class Service {
               e).setUnfinishedMessage(this);
         } finally {
           if (((mutable_bitField0_ & 0x00000001) != 0)) {
-            runs_ = java.util.Collections.unmodifiableList(runs_);
+            keys_ = keys_.getUnmodifiableView();
           }
           this.unknownFields = unknownFields.build();
           makeExtensionsImmutable();
@@ -43768,124 +43840,50 @@ public final class Service {
       }
       public static final com.google.protobuf.Descriptors.Descriptor
           getDescriptor() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_Response_descriptor;
+        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_KeyList_descriptor;
       }
 
       @java.lang.Override
       protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
           internalGetFieldAccessorTable() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_Response_fieldAccessorTable
+        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_KeyList_fieldAccessorTable
             .ensureFieldAccessorsInitialized(
-                org.mlflow.api.proto.Service.SearchRuns.Response.class, org.mlflow.api.proto.Service.SearchRuns.Response.Builder.class);
+                org.mlflow.api.proto.Service.SearchRuns.KeyList.class, org.mlflow.api.proto.Service.SearchRuns.KeyList.Builder.class);
       }
 
-      private int bitField0_;
-      public static final int RUNS_FIELD_NUMBER = 1;
-      private java.util.List<org.mlflow.api.proto.Service.Run> runs_;
-      /**
-       * <pre>
-       * Runs that match the search criteria.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Run runs = 1;</code>
-       */
-      @java.lang.Override
-      public java.util.List<org.mlflow.api.proto.Service.Run> getRunsList() {
-        return runs_;
-      }
-      /**
-       * <pre>
-       * Runs that match the search criteria.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Run runs = 1;</code>
-       */
-      @java.lang.Override
-      public java.util.List<? extends org.mlflow.api.proto.Service.RunOrBuilder> 
-          getRunsOrBuilderList() {
-        return runs_;
-      }
-      /**
-       * <pre>
-       * Runs that match the search criteria.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Run runs = 1;</code>
-       */
-      @java.lang.Override
-      public int getRunsCount() {
-        return runs_.size();
-      }
-      /**
-       * <pre>
-       * Runs that match the search criteria.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Run runs = 1;</code>
-       */
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.Run getRuns(int index) {
-        return runs_.get(index);
-      }
+      public static final int KEYS_FIELD_NUMBER = 1;
+      private com.google.protobuf.LazyStringList keys_;
       /**
-       * <pre>
-       * Runs that match the search criteria.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Run runs = 1;</code>
+       * <code>repeated string keys = 1;</code>
+       * @return A list containing the keys.
        */
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.RunOrBuilder getRunsOrBuilder(
-          int index) {
-        return runs_.get(index);
+      public com.google.protobuf.ProtocolStringList
+          getKeysList() {
+        return keys_;
       }
-
-      public static final int NEXT_PAGE_TOKEN_FIELD_NUMBER = 2;
-      private volatile java.lang.Object nextPageToken_;
       /**
-       * <code>optional string next_page_token = 2;</code>
-       * @return Whether the nextPageToken field is set.
+       * <code>repeated string keys = 1;</code>
+       * @return The count of keys.
        */
-      @java.lang.Override
-      public boolean hasNextPageToken() {
-        return ((bitField0_ & 0x00000001) != 0);
+      public int getKeysCount() {
+        return keys_.size();
       }
       /**
-       * <code>optional string next_page_token = 2;</code>
-       * @return The nextPageToken.
+       * <code>repeated string keys = 1;</code>
+       * @param index The index of the element to return.
+       * @return The keys at the given index.
        */
-      @java.lang.Override
-      public java.lang.String getNextPageToken() {
-        java.lang.Object ref = nextPageToken_;
-        if (ref instanceof java.lang.String) {
-          return (java.lang.String) ref;
-        } else {
-          com.google.protobuf.ByteString bs = 
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            nextPageToken_ = s;
-          }
-          return s;
-        }
+      public java.lang.String getKeys(int index) {
+        return keys_.get(index);
       }
       /**
-       * <code>optional string next_page_token = 2;</code>
-       * @return The bytes for nextPageToken.
+       * <code>repeated string keys = 1;</code>
+       * @param index The index of the value to return.
+       * @return The bytes of the keys at the given index.
        */
-      @java.lang.Override
       public com.google.protobuf.ByteString
-          getNextPageTokenBytes() {
-        java.lang.Object ref = nextPageToken_;
-        if (ref instanceof java.lang.String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          nextPageToken_ = b;
-          return b;
-        } else {
-          return (com.google.protobuf.ByteString) ref;
-        }
+          getKeysBytes(int index) {
+        return keys_.getByteString(index);
       }
 
       private byte memoizedIsInitialized = -1;
@@ -43902,11 +43900,8 @@ public final class Service {
       @java.lang.Override
       public void writeTo(com.google.protobuf.CodedOutputStream output)
                           throws java.io.IOException {
-        for (int i = 0; i < runs_.size(); i++) {
-          output.writeMessage(1, runs_.get(i));
-        }
-        if (((bitField0_ & 0x00000001) != 0)) {
-          com.google.protobuf.GeneratedMessageV3.writeString(output, 2, nextPageToken_);
+        for (int i = 0; i < keys_.size(); i++) {
+          com.google.protobuf.GeneratedMessageV3.writeString(output, 1, keys_.getRaw(i));
         }
         unknownFields.writeTo(output);
       }
@@ -43917,12 +43912,13 @@ public final class Service {
         if (size != -1) return size;
 
         size = 0;
-        for (int i = 0; i < runs_.size(); i++) {
-          size += com.google.protobuf.CodedOutputStream
-            .computeMessageSize(1, runs_.get(i));
-        }
-        if (((bitField0_ & 0x00000001) != 0)) {
-          size += com.google.protobuf.GeneratedMessageV3.computeStringSize(2, nextPageToken_);
+        {
+          int dataSize = 0;
+          for (int i = 0; i < keys_.size(); i++) {
+            dataSize += computeStringSizeNoTag(keys_.getRaw(i));
+          }
+          size += dataSize;
+          size += 1 * getKeysList().size();
         }
         size += unknownFields.getSerializedSize();
         memoizedSize = size;
@@ -43934,18 +43930,13 @@ public final class Service {
         if (obj == this) {
          return true;
         }
-        if (!(obj instanceof org.mlflow.api.proto.Service.SearchRuns.Response)) {
+        if (!(obj instanceof org.mlflow.api.proto.Service.SearchRuns.KeyList)) {
           return super.equals(obj);
         }
-        org.mlflow.api.proto.Service.SearchRuns.Response other = (org.mlflow.api.proto.Service.SearchRuns.Response) obj;
+        org.mlflow.api.proto.Service.SearchRuns.KeyList other = (org.mlflow.api.proto.Service.SearchRuns.KeyList) obj;
 
-        if (!getRunsList()
-            .equals(other.getRunsList())) return false;
-        if (hasNextPageToken() != other.hasNextPageToken()) return false;
-        if (hasNextPageToken()) {
-          if (!getNextPageToken()
-              .equals(other.getNextPageToken())) return false;
-        }
+        if (!getKeysList()
+            .equals(other.getKeysList())) return false;
         if (!unknownFields.equals(other.unknownFields)) return false;
         return true;
       }
@@ -43957,82 +43948,78 @@ public final class Service {
         }
         int hash = 41;
         hash = (19 * hash) + getDescriptor().hashCode();
-        if (getRunsCount() > 0) {
-          hash = (37 * hash) + RUNS_FIELD_NUMBER;
-          hash = (53 * hash) + getRunsList().hashCode();
-        }
-        if (hasNextPageToken()) {
-          hash = (37 * hash) + NEXT_PAGE_TOKEN_FIELD_NUMBER;
-          hash = (53 * hash) + getNextPageToken().hashCode();
+        if (getKeysCount() > 0) {
+          hash = (37 * hash) + KEYS_FIELD_NUMBER;
+          hash = (53 * hash) + getKeysList().hashCode();
         }
         hash = (29 * hash) + unknownFields.hashCode();
         memoizedHashCode = hash;
         return hash;
       }
 
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+      public static org.mlflow.api.proto.Service.SearchRuns.KeyList parseFrom(
           java.nio.ByteBuffer data)
           throws com.google.protobuf.InvalidProtocolBufferException {
         return PARSER.parseFrom(data);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+      public static org.mlflow.api.proto.Service.SearchRuns.KeyList parseFrom(
           java.nio.ByteBuffer data,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws com.google.protobuf.InvalidProtocolBufferException {
         return PARSER.parseFrom(data, extensionRegistry);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+      public static org.mlflow.api.proto.Service.SearchRuns.KeyList parseFrom(
           com.google.protobuf.ByteString data)
           throws com.google.protobuf.InvalidProtocolBufferException {
         return PARSER.parseFrom(data);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+      public static org.mlflow.api.proto.Service.SearchRuns.KeyList parseFrom(
           com.google.protobuf.ByteString data,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws com.google.protobuf.InvalidProtocolBufferException {
         return PARSER.parseFrom(data, extensionRegistry);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(byte[] data)
+      public static org.mlflow.api.proto.Service.SearchRuns.KeyList parseFrom(byte[] data)
           throws com.google.protobuf.InvalidProtocolBufferException {
         return PARSER.parseFrom(data);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+      public static org.mlflow.api.proto.Service.SearchRuns.KeyList parseFrom(
           byte[] data,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws com.google.protobuf.InvalidProtocolBufferException {
         return PARSER.parseFrom(data, extensionRegistry);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(java.io.InputStream input)
+      public static org.mlflow.api.proto.Service.SearchRuns.KeyList parseFrom(java.io.InputStream input)
           throws java.io.IOException {
         return com.google.protobuf.GeneratedMessageV3
             .parseWithIOException(PARSER, input);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+      public static org.mlflow.api.proto.Service.SearchRuns.KeyList parseFrom(
           java.io.InputStream input,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws java.io.IOException {
         return com.google.protobuf.GeneratedMessageV3
             .parseWithIOException(PARSER, input, extensionRegistry);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseDelimitedFrom(java.io.InputStream input)
+      public static org.mlflow.api.proto.Service.SearchRuns.KeyList parseDelimitedFrom(java.io.InputStream input)
           throws java.io.IOException {
         return com.google.protobuf.GeneratedMessageV3
             .parseDelimitedWithIOException(PARSER, input);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseDelimitedFrom(
+      public static org.mlflow.api.proto.Service.SearchRuns.KeyList parseDelimitedFrom(
           java.io.InputStream input,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws java.io.IOException {
         return com.google.protobuf.GeneratedMessageV3
             .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+      public static org.mlflow.api.proto.Service.SearchRuns.KeyList parseFrom(
           com.google.protobuf.CodedInputStream input)
           throws java.io.IOException {
         return com.google.protobuf.GeneratedMessageV3
             .parseWithIOException(PARSER, input);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+      public static org.mlflow.api.proto.Service.SearchRuns.KeyList parseFrom(
           com.google.protobuf.CodedInputStream input,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws java.io.IOException {
@@ -44045,7 +44032,7 @@ public final class Service {
       public static Builder newBuilder() {
         return DEFAULT_INSTANCE.toBuilder();
       }
-      public static Builder newBuilder(org.mlflow.api.proto.Service.SearchRuns.Response prototype) {
+      public static Builder newBuilder(org.mlflow.api.proto.Service.SearchRuns.KeyList prototype) {
         return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
       }
       @java.lang.Override
@@ -44061,26 +44048,30 @@ public final class Service {
         return builder;
       }
       /**
-       * Protobuf type {@code mlflow.SearchRuns.Response}
+       * <pre>
+       * List of keys, which allows to distinguish an empty list from an unset field.
+       * </pre>
+       *
+       * Protobuf type {@code mlflow.SearchRuns.KeyList}
        */
       public static final class Builder extends
           com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
-          // @@protoc_insertion_point(builder_implements:mlflow.SearchRuns.Response)
-          org.mlflow.api.proto.Service.SearchRuns.ResponseOrBuilder {
+          // @@protoc_insertion_point(builder_implements:mlflow.SearchRuns.KeyList)
+          org.mlflow.api.proto.Service.SearchRuns.KeyListOrBuilder {
         public static final com.google.protobuf.Descriptors.Descriptor
             getDescriptor() {
-          return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_Response_descriptor;
+          return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_KeyList_descriptor;
         }
 
         @java.lang.Override
         protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
             internalGetFieldAccessorTable() {
-          return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_Response_fieldAccessorTable
+          return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_KeyList_fieldAccessorTable
               .ensureFieldAccessorsInitialized(
-                  org.mlflow.api.proto.Service.SearchRuns.Response.class, org.mlflow.api.proto.Service.SearchRuns.Response.Builder.class);
+                  org.mlflow.api.proto.Service.SearchRuns.KeyList.class, org.mlflow.api.proto.Service.SearchRuns.KeyList.Builder.class);
         }
 
-        // Construct using org.mlflow.api.proto.Service.SearchRuns.Response.newBuilder()
+        // Construct using org.mlflow.api.proto.Service.SearchRuns.KeyList.newBuilder()
         private Builder() {
           maybeForceBuilderInitialization();
         }
@@ -44093,37 +44084,30 @@ public final class Service {
         private void maybeForceBuilderInitialization() {
           if (com.google.protobuf.GeneratedMessageV3
                   .alwaysUseFieldBuilders) {
-            getRunsFieldBuilder();
           }
         }
         @java.lang.Override
         public Builder clear() {
           super.clear();
-          if (runsBuilder_ == null) {
-            runs_ = java.util.Collections.emptyList();
-            bitField0_ = (bitField0_ & ~0x00000001);
-          } else {
-            runsBuilder_.clear();
-          }
-          nextPageToken_ = "";
-          bitField0_ = (bitField0_ & ~0x00000002);
+          keys_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+          bitField0_ = (bitField0_ & ~0x00000001);
           return this;
         }
 
         @java.lang.Override
         public com.google.protobuf.Descriptors.Descriptor
             getDescriptorForType() {
-          return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_Response_descriptor;
+          return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_KeyList_descriptor;
         }
 
         @java.lang.Override
-        public org.mlflow.api.proto.Service.SearchRuns.Response getDefaultInstanceForType() {
-          return org.mlflow.api.proto.Service.SearchRuns.Response.getDefaultInstance();
+        public org.mlflow.api.proto.Service.SearchRuns.KeyList getDefaultInstanceForType() {
+          return org.mlflow.api.proto.Service.SearchRuns.KeyList.getDefaultInstance();
         }
 
         @java.lang.Override
-        public org.mlflow.api.proto.Service.SearchRuns.Response build() {
-          org.mlflow.api.proto.Service.SearchRuns.Response result = buildPartial();
+        public org.mlflow.api.proto.Service.SearchRuns.KeyList build() {
+          org.mlflow.api.proto.Service.SearchRuns.KeyList result = buildPartial();
           if (!result.isInitialized()) {
             throw newUninitializedMessageException(result);
           }
@@ -44131,24 +44115,14 @@ public final class Service {
         }
 
         @java.lang.Override
-        public org.mlflow.api.proto.Service.SearchRuns.Response buildPartial() {
-          org.mlflow.api.proto.Service.SearchRuns.Response result = new org.mlflow.api.proto.Service.SearchRuns.Response(this);
+        public org.mlflow.api.proto.Service.SearchRuns.KeyList buildPartial() {
+          org.mlflow.api.proto.Service.SearchRuns.KeyList result = new org.mlflow.api.proto.Service.SearchRuns.KeyList(this);
           int from_bitField0_ = bitField0_;
-          int to_bitField0_ = 0;
-          if (runsBuilder_ == null) {
-            if (((bitField0_ & 0x00000001) != 0)) {
-              runs_ = java.util.Collections.unmodifiableList(runs_);
-              bitField0_ = (bitField0_ & ~0x00000001);
-            }
-            result.runs_ = runs_;
-          } else {
-            result.runs_ = runsBuilder_.build();
-          }
-          if (((from_bitField0_ & 0x00000002) != 0)) {
-            to_bitField0_ |= 0x00000001;
+          if (((bitField0_ & 0x00000001) != 0)) {
+            keys_ = keys_.getUnmodifiableView();
+            bitField0_ = (bitField0_ & ~0x00000001);
           }
-          result.nextPageToken_ = nextPageToken_;
-          result.bitField0_ = to_bitField0_;
+          result.keys_ = keys_;
           onBuilt();
           return result;
         }
@@ -44187,45 +44161,24 @@ public final class Service {
         }
         @java.lang.Override
         public Builder mergeFrom(com.google.protobuf.Message other) {
-          if (other instanceof org.mlflow.api.proto.Service.SearchRuns.Response) {
-            return mergeFrom((org.mlflow.api.proto.Service.SearchRuns.Response)other);
+          if (other instanceof org.mlflow.api.proto.Service.SearchRuns.KeyList) {
+            return mergeFrom((org.mlflow.api.proto.Service.SearchRuns.KeyList)other);
           } else {
             super.mergeFrom(other);
             return this;
           }
         }
 
-        public Builder mergeFrom(org.mlflow.api.proto.Service.SearchRuns.Response other) {
-          if (other == org.mlflow.api.proto.Service.SearchRuns.Response.getDefaultInstance()) return this;
-          if (runsBuilder_ == null) {
-            if (!other.runs_.isEmpty()) {
-              if (runs_.isEmpty()) {
-                runs_ = other.runs_;
-                bitField0_ = (bitField0_ & ~0x00000001);
-              } else {
-                ensureRunsIsMutable();
-                runs_.addAll(other.runs_);
-              }
-              onChanged();
-            }
-          } else {
-            if (!other.runs_.isEmpty()) {
-              if (runsBuilder_.isEmpty()) {
-                runsBuilder_.dispose();
-                runsBuilder_ = null;
-                runs_ = other.runs_;
-                bitField0_ = (bitField0_ & ~0x00000001);
-                runsBuilder_ = 
-                  com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
-                     getRunsFieldBuilder() : null;
-              } else {
-                runsBuilder_.addAllMessages(other.runs_);
-              }
+        public Builder mergeFrom(org.mlflow.api.proto.Service.SearchRuns.KeyList other) {
+          if (other == org.mlflow.api.proto.Service.SearchRuns.KeyList.getDefaultInstance()) return this;
+          if (!other.keys_.isEmpty()) {
+            if (keys_.isEmpty()) {
+              keys_ = other.keys_;
+              bitField0_ = (bitField0_ & ~0x00000001);
+            } else {
+              ensureKeysIsMutable();
+              keys_.addAll(other.keys_);
             }
-          }
-          if (other.hasNextPageToken()) {
-            bitField0_ |= 0x00000002;
-            nextPageToken_ = other.nextPageToken_;
             onChanged();
           }
           this.mergeUnknownFields(other.unknownFields);
@@ -44243,11 +44196,11 @@ public final class Service {
             com.google.protobuf.CodedInputStream input,
             com.google.protobuf.ExtensionRegistryLite extensionRegistry)
             throws java.io.IOException {
-          org.mlflow.api.proto.Service.SearchRuns.Response parsedMessage = null;
+          org.mlflow.api.proto.Service.SearchRuns.KeyList parsedMessage = null;
           try {
             parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
           } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-            parsedMessage = (org.mlflow.api.proto.Service.SearchRuns.Response) e.getUnfinishedMessage();
+            parsedMessage = (org.mlflow.api.proto.Service.SearchRuns.KeyList) e.getUnfinishedMessage();
             throw e.unwrapIOException();
           } finally {
             if (parsedMessage != null) {
@@ -44258,398 +44211,111 @@ public final class Service {
         }
         private int bitField0_;
 
-        private java.util.List<org.mlflow.api.proto.Service.Run> runs_ =
-          java.util.Collections.emptyList();
-        private void ensureRunsIsMutable() {
+        private com.google.protobuf.LazyStringList keys_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+        private void ensureKeysIsMutable() {
           if (!((bitField0_ & 0x00000001) != 0)) {
-            runs_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Run>(runs_);
+            keys_ = new com.google.protobuf.LazyStringArrayList(keys_);
             bitField0_ |= 0x00000001;
            }
         }
-
-        private com.google.protobuf.RepeatedFieldBuilderV3<
-            org.mlflow.api.proto.Service.Run, org.mlflow.api.proto.Service.Run.Builder, org.mlflow.api.proto.Service.RunOrBuilder> runsBuilder_;
-
         /**
-         * <pre>
-         * Runs that match the search criteria.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Run runs = 1;</code>
+         * <code>repeated string keys = 1;</code>
+         * @return A list containing the keys.
          */
-        public java.util.List<org.mlflow.api.proto.Service.Run> getRunsList() {
-          if (runsBuilder_ == null) {
-            return java.util.Collections.unmodifiableList(runs_);
-          } else {
-            return runsBuilder_.getMessageList();
-          }
+        public com.google.protobuf.ProtocolStringList
+            getKeysList() {
+          return keys_.getUnmodifiableView();
         }
         /**
-         * <pre>
-         * Runs that match the search criteria.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Run runs = 1;</code>
+         * <code>repeated string keys = 1;</code>
+         * @return The count of keys.
          */
-        public int getRunsCount() {
-          if (runsBuilder_ == null) {
-            return runs_.size();
-          } else {
-            return runsBuilder_.getCount();
-          }
+        public int getKeysCount() {
+          return keys_.size();
         }
         /**
-         * <pre>
-         * Runs that match the search criteria.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Run runs = 1;</code>
+         * <code>repeated string keys = 1;</code>
+         * @param index The index of the element to return.
+         * @return The keys at the given index.
          */
-        public org.mlflow.api.proto.Service.Run getRuns(int index) {
-          if (runsBuilder_ == null) {
-            return runs_.get(index);
-          } else {
-            return runsBuilder_.getMessage(index);
-          }
+        public java.lang.String getKeys(int index) {
+          return keys_.get(index);
         }
         /**
-         * <pre>
-         * Runs that match the search criteria.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Run runs = 1;</code>
+         * <code>repeated string keys = 1;</code>
+         * @param index The index of the value to return.
+         * @return The bytes of the keys at the given index.
          */
-        public Builder setRuns(
-            int index, org.mlflow.api.proto.Service.Run value) {
-          if (runsBuilder_ == null) {
-            if (value == null) {
-              throw new NullPointerException();
-            }
-            ensureRunsIsMutable();
-            runs_.set(index, value);
-            onChanged();
-          } else {
-            runsBuilder_.setMessage(index, value);
-          }
-          return this;
+        public com.google.protobuf.ByteString
+            getKeysBytes(int index) {
+          return keys_.getByteString(index);
         }
         /**
-         * <pre>
-         * Runs that match the search criteria.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Run runs = 1;</code>
+         * <code>repeated string keys = 1;</code>
+         * @param index The index to set the value at.
+         * @param value The keys to set.
+         * @return This builder for chaining.
          */
-        public Builder setRuns(
-            int index, org.mlflow.api.proto.Service.Run.Builder builderForValue) {
-          if (runsBuilder_ == null) {
-            ensureRunsIsMutable();
-            runs_.set(index, builderForValue.build());
-            onChanged();
-          } else {
-            runsBuilder_.setMessage(index, builderForValue.build());
-          }
+        public Builder setKeys(
+            int index, java.lang.String value) {
+          if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureKeysIsMutable();
+          keys_.set(index, value);
+          onChanged();
           return this;
         }
         /**
-         * <pre>
-         * Runs that match the search criteria.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Run runs = 1;</code>
+         * <code>repeated string keys = 1;</code>
+         * @param value The keys to add.
+         * @return This builder for chaining.
          */
-        public Builder addRuns(org.mlflow.api.proto.Service.Run value) {
-          if (runsBuilder_ == null) {
-            if (value == null) {
-              throw new NullPointerException();
-            }
-            ensureRunsIsMutable();
-            runs_.add(value);
-            onChanged();
-          } else {
-            runsBuilder_.addMessage(value);
-          }
+        public Builder addKeys(
+            java.lang.String value) {
+          if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureKeysIsMutable();
+          keys_.add(value);
+          onChanged();
           return this;
         }
         /**
-         * <pre>
-         * Runs that match the search criteria.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Run runs = 1;</code>
+         * <code>repeated string keys = 1;</code>
+         * @param values The keys to add.
+         * @return This builder for chaining.
          */
-        public Builder addRuns(
-            int index, org.mlflow.api.proto.Service.Run value) {
-          if (runsBuilder_ == null) {
-            if (value == null) {
-              throw new NullPointerException();
-            }
-            ensureRunsIsMutable();
-            runs_.add(index, value);
-            onChanged();
-          } else {
-            runsBuilder_.addMessage(index, value);
-          }
+        public Builder addAllKeys(
+            java.lang.Iterable<java.lang.String> values) {
+          ensureKeysIsMutable();
+          com.google.protobuf.AbstractMessageLite.Builder.addAll(
+              values, keys_);
+          onChanged();
           return this;
         }
         /**
-         * <pre>
-         * Runs that match the search criteria.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Run runs = 1;</code>
+         * <code>repeated string keys = 1;</code>
+         * @return This builder for chaining.
          */
-        public Builder addRuns(
-            org.mlflow.api.proto.Service.Run.Builder builderForValue) {
-          if (runsBuilder_ == null) {
-            ensureRunsIsMutable();
-            runs_.add(builderForValue.build());
-            onChanged();
-          } else {
-            runsBuilder_.addMessage(builderForValue.build());
-          }
+        public Builder clearKeys() {
+          keys_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+          bitField0_ = (bitField0_ & ~0x00000001);
+          onChanged();
           return this;
         }
         /**
-         * <pre>
-         * Runs that match the search criteria.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Run runs = 1;</code>
+         * <code>repeated string keys = 1;</code>
+         * @param value The bytes of the keys to add.
+         * @return This builder for chaining.
          */
-        public Builder addRuns(
-            int index, org.mlflow.api.proto.Service.Run.Builder builderForValue) {
-          if (runsBuilder_ == null) {
-            ensureRunsIsMutable();
-            runs_.add(index, builderForValue.build());
-            onChanged();
-          } else {
-            runsBuilder_.addMessage(index, builderForValue.build());
-          }
-          return this;
-        }
-        /**
-         * <pre>
-         * Runs that match the search criteria.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Run runs = 1;</code>
-         */
-        public Builder addAllRuns(
-            java.lang.Iterable<? extends org.mlflow.api.proto.Service.Run> values) {
-          if (runsBuilder_ == null) {
-            ensureRunsIsMutable();
-            com.google.protobuf.AbstractMessageLite.Builder.addAll(
-                values, runs_);
-            onChanged();
-          } else {
-            runsBuilder_.addAllMessages(values);
-          }
-          return this;
-        }
-        /**
-         * <pre>
-         * Runs that match the search criteria.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Run runs = 1;</code>
-         */
-        public Builder clearRuns() {
-          if (runsBuilder_ == null) {
-            runs_ = java.util.Collections.emptyList();
-            bitField0_ = (bitField0_ & ~0x00000001);
-            onChanged();
-          } else {
-            runsBuilder_.clear();
-          }
-          return this;
-        }
-        /**
-         * <pre>
-         * Runs that match the search criteria.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Run runs = 1;</code>
-         */
-        public Builder removeRuns(int index) {
-          if (runsBuilder_ == null) {
-            ensureRunsIsMutable();
-            runs_.remove(index);
-            onChanged();
-          } else {
-            runsBuilder_.remove(index);
-          }
-          return this;
-        }
-        /**
-         * <pre>
-         * Runs that match the search criteria.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Run runs = 1;</code>
-         */
-        public org.mlflow.api.proto.Service.Run.Builder getRunsBuilder(
-            int index) {
-          return getRunsFieldBuilder().getBuilder(index);
-        }
-        /**
-         * <pre>
-         * Runs that match the search criteria.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Run runs = 1;</code>
-         */
-        public org.mlflow.api.proto.Service.RunOrBuilder getRunsOrBuilder(
-            int index) {
-          if (runsBuilder_ == null) {
-            return runs_.get(index);  } else {
-            return runsBuilder_.getMessageOrBuilder(index);
-          }
-        }
-        /**
-         * <pre>
-         * Runs that match the search criteria.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Run runs = 1;</code>
-         */
-        public java.util.List<? extends org.mlflow.api.proto.Service.RunOrBuilder> 
-             getRunsOrBuilderList() {
-          if (runsBuilder_ != null) {
-            return runsBuilder_.getMessageOrBuilderList();
-          } else {
-            return java.util.Collections.unmodifiableList(runs_);
-          }
-        }
-        /**
-         * <pre>
-         * Runs that match the search criteria.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Run runs = 1;</code>
-         */
-        public org.mlflow.api.proto.Service.Run.Builder addRunsBuilder() {
-          return getRunsFieldBuilder().addBuilder(
-              org.mlflow.api.proto.Service.Run.getDefaultInstance());
-        }
-        /**
-         * <pre>
-         * Runs that match the search criteria.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Run runs = 1;</code>
-         */
-        public org.mlflow.api.proto.Service.Run.Builder addRunsBuilder(
-            int index) {
-          return getRunsFieldBuilder().addBuilder(
-              index, org.mlflow.api.proto.Service.Run.getDefaultInstance());
-        }
-        /**
-         * <pre>
-         * Runs that match the search criteria.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Run runs = 1;</code>
-         */
-        public java.util.List<org.mlflow.api.proto.Service.Run.Builder> 
-             getRunsBuilderList() {
-          return getRunsFieldBuilder().getBuilderList();
-        }
-        private com.google.protobuf.RepeatedFieldBuilderV3<
-            org.mlflow.api.proto.Service.Run, org.mlflow.api.proto.Service.Run.Builder, org.mlflow.api.proto.Service.RunOrBuilder> 
-            getRunsFieldBuilder() {
-          if (runsBuilder_ == null) {
-            runsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
-                org.mlflow.api.proto.Service.Run, org.mlflow.api.proto.Service.Run.Builder, org.mlflow.api.proto.Service.RunOrBuilder>(
-                    runs_,
-                    ((bitField0_ & 0x00000001) != 0),
-                    getParentForChildren(),
-                    isClean());
-            runs_ = null;
-          }
-          return runsBuilder_;
-        }
-
-        private java.lang.Object nextPageToken_ = "";
-        /**
-         * <code>optional string next_page_token = 2;</code>
-         * @return Whether the nextPageToken field is set.
-         */
-        public boolean hasNextPageToken() {
-          return ((bitField0_ & 0x00000002) != 0);
-        }
-        /**
-         * <code>optional string next_page_token = 2;</code>
-         * @return The nextPageToken.
-         */
-        public java.lang.String getNextPageToken() {
-          java.lang.Object ref = nextPageToken_;
-          if (!(ref instanceof java.lang.String)) {
-            com.google.protobuf.ByteString bs =
-                (com.google.protobuf.ByteString) ref;
-            java.lang.String s = bs.toStringUtf8();
-            if (bs.isValidUtf8()) {
-              nextPageToken_ = s;
-            }
-            return s;
-          } else {
-            return (java.lang.String) ref;
-          }
-        }
-        /**
-         * <code>optional string next_page_token = 2;</code>
-         * @return The bytes for nextPageToken.
-         */
-        public com.google.protobuf.ByteString
-            getNextPageTokenBytes() {
-          java.lang.Object ref = nextPageToken_;
-          if (ref instanceof String) {
-            com.google.protobuf.ByteString b = 
-                com.google.protobuf.ByteString.copyFromUtf8(
-                    (java.lang.String) ref);
-            nextPageToken_ = b;
-            return b;
-          } else {
-            return (com.google.protobuf.ByteString) ref;
-          }
-        }
-        /**
-         * <code>optional string next_page_token = 2;</code>
-         * @param value The nextPageToken to set.
-         * @return This builder for chaining.
-         */
-        public Builder setNextPageToken(
-            java.lang.String value) {
-          if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000002;
-          nextPageToken_ = value;
-          onChanged();
-          return this;
-        }
-        /**
-         * <code>optional string next_page_token = 2;</code>
-         * @return This builder for chaining.
-         */
-        public Builder clearNextPageToken() {
-          bitField0_ = (bitField0_ & ~0x00000002);
-          nextPageToken_ = getDefaultInstance().getNextPageToken();
-          onChanged();
-          return this;
-        }
-        /**
-         * <code>optional string next_page_token = 2;</code>
-         * @param value The bytes for nextPageToken to set.
-         * @return This builder for chaining.
-         */
-        public Builder setNextPageTokenBytes(
+        public Builder addKeysBytes(
             com.google.protobuf.ByteString value) {
           if (value == null) {
     throw new NullPointerException();
   }
-  bitField0_ |= 0x00000002;
-          nextPageToken_ = value;
+  ensureKeysIsMutable();
+          keys_.add(value);
           onChanged();
           return this;
         }
@@ -44666,4467 +44332,8433 @@ public final class Service {
         }
 
 
-        // @@protoc_insertion_point(builder_scope:mlflow.SearchRuns.Response)
+        // @@protoc_insertion_point(builder_scope:mlflow.SearchRuns.KeyList)
       }
 
-      // @@protoc_insertion_point(class_scope:mlflow.SearchRuns.Response)
-      private static final org.mlflow.api.proto.Service.SearchRuns.Response DEFAULT_INSTANCE;
+      // @@protoc_insertion_point(class_scope:mlflow.SearchRuns.KeyList)
+      private static final org.mlflow.api.proto.Service.SearchRuns.KeyList DEFAULT_INSTANCE;
       static {
-        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.SearchRuns.Response();
+        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.SearchRuns.KeyList();
       }
 
-      public static org.mlflow.api.proto.Service.SearchRuns.Response getDefaultInstance() {
+      public static org.mlflow.api.proto.Service.SearchRuns.KeyList getDefaultInstance() {
         return DEFAULT_INSTANCE;
       }
 
-      @java.lang.Deprecated public static final com.google.protobuf.Parser<Response>
-          PARSER = new com.google.protobuf.AbstractParser<Response>() {
+      @java.lang.Deprecated public static final com.google.protobuf.Parser<KeyList>
+          PARSER = new com.google.protobuf.AbstractParser<KeyList>() {
         @java.lang.Override
-        public Response parsePartialFrom(
+        public KeyList parsePartialFrom(
             com.google.protobuf.CodedInputStream input,
             com.google.protobuf.ExtensionRegistryLite extensionRegistry)
             throws com.google.protobuf.InvalidProtocolBufferException {
-          return new Response(input, extensionRegistry);
+          return new KeyList(input, extensionRegistry);
         }
       };
 
-      public static com.google.protobuf.Parser<Response> parser() {
+      public static com.google.protobuf.Parser<KeyList> parser() {
         return PARSER;
       }
 
       @java.lang.Override
-      public com.google.protobuf.Parser<Response> getParserForType() {
+      public com.google.protobuf.Parser<KeyList> getParserForType() {
         return PARSER;
       }
 
       @java.lang.Override
-      public org.mlflow.api.proto.Service.SearchRuns.Response getDefaultInstanceForType() {
+      public org.mlflow.api.proto.Service.SearchRuns.KeyList getDefaultInstanceForType() {
         return DEFAULT_INSTANCE;
       }
 
     }
 
-    private int bitField0_;
-    public static final int EXPERIMENT_IDS_FIELD_NUMBER = 1;
-    private com.google.protobuf.LazyStringList experimentIds_;
-    /**
-     * <pre>
-     * List of experiment IDs to search over.
-     * </pre>
-     *
-     * <code>repeated string experiment_ids = 1;</code>
-     * @return A list containing the experimentIds.
-     */
-    public com.google.protobuf.ProtocolStringList
-        getExperimentIdsList() {
-      return experimentIds_;
-    }
-    /**
-     * <pre>
-     * List of experiment IDs to search over.
-     * </pre>
-     *
-     * <code>repeated string experiment_ids = 1;</code>
-     * @return The count of experimentIds.
-     */
-    public int getExperimentIdsCount() {
-      return experimentIds_.size();
-    }
-    /**
-     * <pre>
-     * List of experiment IDs to search over.
-     * </pre>
-     *
-     * <code>repeated string experiment_ids = 1;</code>
-     * @param index The index of the element to return.
-     * @return The experimentIds at the given index.
-     */
-    public java.lang.String getExperimentIds(int index) {
-      return experimentIds_.get(index);
-    }
-    /**
-     * <pre>
-     * List of experiment IDs to search over.
-     * </pre>
-     *
-     * <code>repeated string experiment_ids = 1;</code>
-     * @param index The index of the value to return.
-     * @return The bytes of the experimentIds at the given index.
-     */
-    public com.google.protobuf.ByteString
-        getExperimentIdsBytes(int index) {
-      return experimentIds_.getByteString(index);
-    }
+    public interface ResponseOrBuilder extends
+        // @@protoc_insertion_point(interface_extends:mlflow.SearchRuns.Response)
+        com.google.protobuf.MessageOrBuilder {
 
-    public static final int FILTER_FIELD_NUMBER = 4;
-    private volatile java.lang.Object filter_;
-    /**
-     * <pre>
-     * A filter expression over params, metrics, and tags, that allows returning a subset of
-     * runs. The syntax is a subset of SQL that supports ANDing together binary operations
-     * between a param, metric, or tag and a constant.
-     * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
-     * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
-     * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
-     * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
-     * </pre>
-     *
-     * <code>optional string filter = 4;</code>
-     * @return Whether the filter field is set.
-     */
-    @java.lang.Override
-    public boolean hasFilter() {
-      return ((bitField0_ & 0x00000001) != 0);
+      /**
+       * <pre>
+       * Runs that match the search criteria.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      java.util.List<org.mlflow.api.proto.Service.Run> 
+          getRunsList();
+      /**
+       * <pre>
+       * Runs that match the search criteria.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      org.mlflow.api.proto.Service.Run getRuns(int index);
+      /**
+       * <pre>
+       * Runs that match the search criteria.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      int getRunsCount();
+      /**
+       * <pre>
+       * Runs that match the search criteria.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      java.util.List<? extends org.mlflow.api.proto.Service.RunOrBuilder> 
+          getRunsOrBuilderList();
+      /**
+       * <pre>
+       * Runs that match the search criteria.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      org.mlflow.api.proto.Service.RunOrBuilder getRunsOrBuilder(
+          int index);
+
+      /**
+       * <code>optional string next_page_token = 2;</code>
+       * @return Whether the nextPageToken field is set.
+       */
+      boolean hasNextPageToken();
+      /**
+       * <code>optional string next_page_token = 2;</code>
+       * @return The nextPageToken.
+       */
+      java.lang.String getNextPageToken();
+      /**
+       * <code>optional string next_page_token = 2;</code>
+       * @return The bytes for nextPageToken.
+       */
+      com.google.protobuf.ByteString
+          getNextPageTokenBytes();
     }
     /**
-     * <pre>
-     * A filter expression over params, metrics, and tags, that allows returning a subset of
-     * runs. The syntax is a subset of SQL that supports ANDing together binary operations
-     * between a param, metric, or tag and a constant.
-     * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
-     * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
-     * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
-     * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
-     * </pre>
-     *
-     * <code>optional string filter = 4;</code>
-     * @return The filter.
+     * Protobuf type {@code mlflow.SearchRuns.Response}
      */
-    @java.lang.Override
-    public java.lang.String getFilter() {
-      java.lang.Object ref = filter_;
-      if (ref instanceof java.lang.String) {
-        return (java.lang.String) ref;
-      } else {
-        com.google.protobuf.ByteString bs = 
-            (com.google.protobuf.ByteString) ref;
-        java.lang.String s = bs.toStringUtf8();
-        if (bs.isValidUtf8()) {
-          filter_ = s;
-        }
-        return s;
+    public static final class Response extends
+        com.google.protobuf.GeneratedMessageV3 implements
+        // @@protoc_insertion_point(message_implements:mlflow.SearchRuns.Response)
+        ResponseOrBuilder {
+    private static final long serialVersionUID = 0L;
+      // Use Response.newBuilder() to construct.
+      private Response(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+        super(builder);
       }
-    }
-    /**
-     * <pre>
-     * A filter expression over params, metrics, and tags, that allows returning a subset of
-     * runs. The syntax is a subset of SQL that supports ANDing together binary operations
-     * between a param, metric, or tag and a constant.
-     * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
-     * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
-     * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
-     * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
-     * </pre>
-     *
-     * <code>optional string filter = 4;</code>
-     * @return The bytes for filter.
-     */
-    @java.lang.Override
-    public com.google.protobuf.ByteString
-        getFilterBytes() {
-      java.lang.Object ref = filter_;
-      if (ref instanceof java.lang.String) {
-        com.google.protobuf.ByteString b = 
-            com.google.protobuf.ByteString.copyFromUtf8(
-                (java.lang.String) ref);
-        filter_ = b;
-        return b;
-      } else {
-        return (com.google.protobuf.ByteString) ref;
+      private Response() {
+        runs_ = java.util.Collections.emptyList();
+        nextPageToken_ = "";
       }
-    }
-
-    public static final int RUN_VIEW_TYPE_FIELD_NUMBER = 3;
-    private int runViewType_;
-    /**
-     * <pre>
-     * Whether to display only active, only deleted, or all runs.
-     * Defaults to only active runs.
-     * </pre>
-     *
-     * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
-     * @return Whether the runViewType field is set.
-     */
-    @java.lang.Override public boolean hasRunViewType() {
-      return ((bitField0_ & 0x00000002) != 0);
-    }
-    /**
-     * <pre>
-     * Whether to display only active, only deleted, or all runs.
-     * Defaults to only active runs.
-     * </pre>
-     *
-     * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
-     * @return The runViewType.
-     */
-    @java.lang.Override public org.mlflow.api.proto.Service.ViewType getRunViewType() {
-      @SuppressWarnings("deprecation")
-      org.mlflow.api.proto.Service.ViewType result = org.mlflow.api.proto.Service.ViewType.valueOf(runViewType_);
-      return result == null ? org.mlflow.api.proto.Service.ViewType.ACTIVE_ONLY : result;
-    }
 
-    public static final int MAX_RESULTS_FIELD_NUMBER = 5;
-    private int maxResults_;
-    /**
-     * <pre>
-     * Maximum number of runs desired. If unspecified, defaults to 1000.
-     * All servers are guaranteed to support a `max_results` threshold of at least 50,000
-     * but may support more. Callers of this endpoint are encouraged to pass max_results
-     * explicitly and leverage page_token to iterate through experiments.
-     * </pre>
-     *
-     * <code>optional int32 max_results = 5 [default = 1000];</code>
-     * @return Whether the maxResults field is set.
-     */
-    @java.lang.Override
-    public boolean hasMaxResults() {
-      return ((bitField0_ & 0x00000004) != 0);
-    }
-    /**
-     * <pre>
-     * Maximum number of runs desired. If unspecified, defaults to 1000.
-     * All servers are guaranteed to support a `max_results` threshold of at least 50,000
-     * but may support more. Callers of this endpoint are encouraged to pass max_results
-     * explicitly and leverage page_token to iterate through experiments.
-     * </pre>
-     *
-     * <code>optional int32 max_results = 5 [default = 1000];</code>
-     * @return The maxResults.
-     */
-    @java.lang.Override
-    public int getMaxResults() {
-      return maxResults_;
-    }
+      @java.lang.Override
+      @SuppressWarnings({"unused"})
+      protected java.lang.Object newInstance(
+          UnusedPrivateParameter unused) {
+        return new Response();
+      }
 
-    public static final int ORDER_BY_FIELD_NUMBER = 6;
-    private com.google.protobuf.LazyStringList orderBy_;
-    /**
-     * <pre>
-     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-     * (and this is the default ordering criterion if order_by is not provided).
-     * </pre>
-     *
-     * <code>repeated string order_by = 6;</code>
-     * @return A list containing the orderBy.
-     */
-    public com.google.protobuf.ProtocolStringList
-        getOrderByList() {
-      return orderBy_;
-    }
-    /**
-     * <pre>
-     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-     * (and this is the default ordering criterion if order_by is not provided).
-     * </pre>
-     *
-     * <code>repeated string order_by = 6;</code>
-     * @return The count of orderBy.
-     */
-    public int getOrderByCount() {
-      return orderBy_.size();
-    }
-    /**
-     * <pre>
-     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-     * (and this is the default ordering criterion if order_by is not provided).
-     * </pre>
-     *
-     * <code>repeated string order_by = 6;</code>
-     * @param index The index of the element to return.
-     * @return The orderBy at the given index.
-     */
-    public java.lang.String getOrderBy(int index) {
-      return orderBy_.get(index);
-    }
-    /**
-     * <pre>
-     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-     * (and this is the default ordering criterion if order_by is not provided).
-     * </pre>
-     *
-     * <code>repeated string order_by = 6;</code>
-     * @param index The index of the value to return.
-     * @return The bytes of the orderBy at the given index.
-     */
-    public com.google.protobuf.ByteString
-        getOrderByBytes(int index) {
-      return orderBy_.getByteString(index);
-    }
-
-    public static final int PAGE_TOKEN_FIELD_NUMBER = 7;
-    private volatile java.lang.Object pageToken_;
-    /**
-     * <code>optional string page_token = 7;</code>
-     * @return Whether the pageToken field is set.
-     */
-    @java.lang.Override
-    public boolean hasPageToken() {
-      return ((bitField0_ & 0x00000008) != 0);
-    }
-    /**
-     * <code>optional string page_token = 7;</code>
-     * @return The pageToken.
-     */
-    @java.lang.Override
-    public java.lang.String getPageToken() {
-      java.lang.Object ref = pageToken_;
-      if (ref instanceof java.lang.String) {
-        return (java.lang.String) ref;
-      } else {
-        com.google.protobuf.ByteString bs = 
-            (com.google.protobuf.ByteString) ref;
-        java.lang.String s = bs.toStringUtf8();
-        if (bs.isValidUtf8()) {
-          pageToken_ = s;
+      @java.lang.Override
+      public final com.google.protobuf.UnknownFieldSet
+      getUnknownFields() {
+        return this.unknownFields;
+      }
+      private Response(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        this();
+        if (extensionRegistry == null) {
+          throw new java.lang.NullPointerException();
+        }
+        int mutable_bitField0_ = 0;
+        com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+            com.google.protobuf.UnknownFieldSet.newBuilder();
+        try {
+          boolean done = false;
+          while (!done) {
+            int tag = input.readTag();
+            switch (tag) {
+              case 0:
+                done = true;
+                break;
+              case 10: {
+                if (!((mutable_bitField0_ & 0x00000001) != 0)) {
+                  runs_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Run>();
+                  mutable_bitField0_ |= 0x00000001;
+                }
+                runs_.add(
+                    input.readMessage(org.mlflow.api.proto.Service.Run.PARSER, extensionRegistry));
+                break;
+              }
+              case 18: {
+                com.google.protobuf.ByteString bs = input.readBytes();
+                bitField0_ |= 0x00000001;
+                nextPageToken_ = bs;
+                break;
+              }
+              default: {
+                if (!parseUnknownField(
+                    input, unknownFields, extensionRegistry, tag)) {
+                  done = true;
+                }
+                break;
+              }
+            }
+          }
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          throw e.setUnfinishedMessage(this);
+        } catch (java.io.IOException e) {
+          throw new com.google.protobuf.InvalidProtocolBufferException(
+              e).setUnfinishedMessage(this);
+        } finally {
+          if (((mutable_bitField0_ & 0x00000001) != 0)) {
+            runs_ = java.util.Collections.unmodifiableList(runs_);
+          }
+          this.unknownFields = unknownFields.build();
+          makeExtensionsImmutable();
         }
-        return s;
       }
-    }
-    /**
-     * <code>optional string page_token = 7;</code>
-     * @return The bytes for pageToken.
-     */
-    @java.lang.Override
-    public com.google.protobuf.ByteString
-        getPageTokenBytes() {
-      java.lang.Object ref = pageToken_;
-      if (ref instanceof java.lang.String) {
-        com.google.protobuf.ByteString b = 
-            com.google.protobuf.ByteString.copyFromUtf8(
-                (java.lang.String) ref);
-        pageToken_ = b;
-        return b;
-      } else {
-        return (com.google.protobuf.ByteString) ref;
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_Response_descriptor;
       }
-    }
-
-    private byte memoizedIsInitialized = -1;
-    @java.lang.Override
-    public final boolean isInitialized() {
-      byte isInitialized = memoizedIsInitialized;
-      if (isInitialized == 1) return true;
-      if (isInitialized == 0) return false;
-
-      memoizedIsInitialized = 1;
-      return true;
-    }
 
-    @java.lang.Override
-    public void writeTo(com.google.protobuf.CodedOutputStream output)
-                        throws java.io.IOException {
-      for (int i = 0; i < experimentIds_.size(); i++) {
-        com.google.protobuf.GeneratedMessageV3.writeString(output, 1, experimentIds_.getRaw(i));
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_Response_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.SearchRuns.Response.class, org.mlflow.api.proto.Service.SearchRuns.Response.Builder.class);
       }
-      if (((bitField0_ & 0x00000002) != 0)) {
-        output.writeEnum(3, runViewType_);
+
+      private int bitField0_;
+      public static final int RUNS_FIELD_NUMBER = 1;
+      private java.util.List<org.mlflow.api.proto.Service.Run> runs_;
+      /**
+       * <pre>
+       * Runs that match the search criteria.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      @java.lang.Override
+      public java.util.List<org.mlflow.api.proto.Service.Run> getRunsList() {
+        return runs_;
       }
-      if (((bitField0_ & 0x00000001) != 0)) {
-        com.google.protobuf.GeneratedMessageV3.writeString(output, 4, filter_);
+      /**
+       * <pre>
+       * Runs that match the search criteria.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      @java.lang.Override
+      public java.util.List<? extends org.mlflow.api.proto.Service.RunOrBuilder> 
+          getRunsOrBuilderList() {
+        return runs_;
       }
-      if (((bitField0_ & 0x00000004) != 0)) {
-        output.writeInt32(5, maxResults_);
+      /**
+       * <pre>
+       * Runs that match the search criteria.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      @java.lang.Override
+      public int getRunsCount() {
+        return runs_.size();
       }
-      for (int i = 0; i < orderBy_.size(); i++) {
-        com.google.protobuf.GeneratedMessageV3.writeString(output, 6, orderBy_.getRaw(i));
+      /**
+       * <pre>
+       * Runs that match the search criteria.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.Run getRuns(int index) {
+        return runs_.get(index);
       }
-      if (((bitField0_ & 0x00000008) != 0)) {
-        com.google.protobuf.GeneratedMessageV3.writeString(output, 7, pageToken_);
+      /**
+       * <pre>
+       * Runs that match the search criteria.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.RunOrBuilder getRunsOrBuilder(
+          int index) {
+        return runs_.get(index);
       }
-      unknownFields.writeTo(output);
-    }
-
-    @java.lang.Override
-    public int getSerializedSize() {
-      int size = memoizedSize;
-      if (size != -1) return size;
 
-      size = 0;
-      {
-        int dataSize = 0;
-        for (int i = 0; i < experimentIds_.size(); i++) {
-          dataSize += computeStringSizeNoTag(experimentIds_.getRaw(i));
-        }
-        size += dataSize;
-        size += 1 * getExperimentIdsList().size();
+      public static final int NEXT_PAGE_TOKEN_FIELD_NUMBER = 2;
+      private volatile java.lang.Object nextPageToken_;
+      /**
+       * <code>optional string next_page_token = 2;</code>
+       * @return Whether the nextPageToken field is set.
+       */
+      @java.lang.Override
+      public boolean hasNextPageToken() {
+        return ((bitField0_ & 0x00000001) != 0);
       }
-      if (((bitField0_ & 0x00000002) != 0)) {
-        size += com.google.protobuf.CodedOutputStream
-          .computeEnumSize(3, runViewType_);
+      /**
+       * <code>optional string next_page_token = 2;</code>
+       * @return The nextPageToken.
+       */
+      @java.lang.Override
+      public java.lang.String getNextPageToken() {
+        java.lang.Object ref = nextPageToken_;
+        if (ref instanceof java.lang.String) {
+          return (java.lang.String) ref;
+        } else {
+          com.google.protobuf.ByteString bs = 
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            nextPageToken_ = s;
+          }
+          return s;
+        }
       }
-      if (((bitField0_ & 0x00000001) != 0)) {
-        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(4, filter_);
+      /**
+       * <code>optional string next_page_token = 2;</code>
+       * @return The bytes for nextPageToken.
+       */
+      @java.lang.Override
+      public com.google.protobuf.ByteString
+          getNextPageTokenBytes() {
+        java.lang.Object ref = nextPageToken_;
+        if (ref instanceof java.lang.String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          nextPageToken_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
       }
-      if (((bitField0_ & 0x00000004) != 0)) {
-        size += com.google.protobuf.CodedOutputStream
-          .computeInt32Size(5, maxResults_);
+
+      private byte memoizedIsInitialized = -1;
+      @java.lang.Override
+      public final boolean isInitialized() {
+        byte isInitialized = memoizedIsInitialized;
+        if (isInitialized == 1) return true;
+        if (isInitialized == 0) return false;
+
+        memoizedIsInitialized = 1;
+        return true;
       }
-      {
-        int dataSize = 0;
-        for (int i = 0; i < orderBy_.size(); i++) {
-          dataSize += computeStringSizeNoTag(orderBy_.getRaw(i));
+
+      @java.lang.Override
+      public void writeTo(com.google.protobuf.CodedOutputStream output)
+                          throws java.io.IOException {
+        for (int i = 0; i < runs_.size(); i++) {
+          output.writeMessage(1, runs_.get(i));
         }
-        size += dataSize;
-        size += 1 * getOrderByList().size();
+        if (((bitField0_ & 0x00000001) != 0)) {
+          com.google.protobuf.GeneratedMessageV3.writeString(output, 2, nextPageToken_);
+        }
+        unknownFields.writeTo(output);
       }
-      if (((bitField0_ & 0x00000008) != 0)) {
-        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(7, pageToken_);
+
+      @java.lang.Override
+      public int getSerializedSize() {
+        int size = memoizedSize;
+        if (size != -1) return size;
+
+        size = 0;
+        for (int i = 0; i < runs_.size(); i++) {
+          size += com.google.protobuf.CodedOutputStream
+            .computeMessageSize(1, runs_.get(i));
+        }
+        if (((bitField0_ & 0x00000001) != 0)) {
+          size += com.google.protobuf.GeneratedMessageV3.computeStringSize(2, nextPageToken_);
+        }
+        size += unknownFields.getSerializedSize();
+        memoizedSize = size;
+        return size;
       }
-      size += unknownFields.getSerializedSize();
-      memoizedSize = size;
-      return size;
-    }
 
-    @java.lang.Override
-    public boolean equals(final java.lang.Object obj) {
-      if (obj == this) {
-       return true;
+      @java.lang.Override
+      public boolean equals(final java.lang.Object obj) {
+        if (obj == this) {
+         return true;
+        }
+        if (!(obj instanceof org.mlflow.api.proto.Service.SearchRuns.Response)) {
+          return super.equals(obj);
+        }
+        org.mlflow.api.proto.Service.SearchRuns.Response other = (org.mlflow.api.proto.Service.SearchRuns.Response) obj;
+
+        if (!getRunsList()
+            .equals(other.getRunsList())) return false;
+        if (hasNextPageToken() != other.hasNextPageToken()) return false;
+        if (hasNextPageToken()) {
+          if (!getNextPageToken()
+              .equals(other.getNextPageToken())) return false;
+        }
+        if (!unknownFields.equals(other.unknownFields)) return false;
+        return true;
       }
-      if (!(obj instanceof org.mlflow.api.proto.Service.SearchRuns)) {
-        return super.equals(obj);
+
+      @java.lang.Override
+      public int hashCode() {
+        if (memoizedHashCode != 0) {
+          return memoizedHashCode;
+        }
+        int hash = 41;
+        hash = (19 * hash) + getDescriptor().hashCode();
+        if (getRunsCount() > 0) {
+          hash = (37 * hash) + RUNS_FIELD_NUMBER;
+          hash = (53 * hash) + getRunsList().hashCode();
+        }
+        if (hasNextPageToken()) {
+          hash = (37 * hash) + NEXT_PAGE_TOKEN_FIELD_NUMBER;
+          hash = (53 * hash) + getNextPageToken().hashCode();
+        }
+        hash = (29 * hash) + unknownFields.hashCode();
+        memoizedHashCode = hash;
+        return hash;
       }
-      org.mlflow.api.proto.Service.SearchRuns other = (org.mlflow.api.proto.Service.SearchRuns) obj;
 
-      if (!getExperimentIdsList()
-          .equals(other.getExperimentIdsList())) return false;
-      if (hasFilter() != other.hasFilter()) return false;
-      if (hasFilter()) {
-        if (!getFilter()
-            .equals(other.getFilter())) return false;
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+          java.nio.ByteBuffer data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
       }
-      if (hasRunViewType() != other.hasRunViewType()) return false;
-      if (hasRunViewType()) {
-        if (runViewType_ != other.runViewType_) return false;
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+          java.nio.ByteBuffer data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
       }
-      if (hasMaxResults() != other.hasMaxResults()) return false;
-      if (hasMaxResults()) {
-        if (getMaxResults()
-            != other.getMaxResults()) return false;
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+          com.google.protobuf.ByteString data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
       }
-      if (!getOrderByList()
-          .equals(other.getOrderByList())) return false;
-      if (hasPageToken() != other.hasPageToken()) return false;
-      if (hasPageToken()) {
-        if (!getPageToken()
-            .equals(other.getPageToken())) return false;
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+          com.google.protobuf.ByteString data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
       }
-      if (!unknownFields.equals(other.unknownFields)) return false;
-      return true;
-    }
-
-    @java.lang.Override
-    public int hashCode() {
-      if (memoizedHashCode != 0) {
-        return memoizedHashCode;
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(byte[] data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
       }
-      int hash = 41;
-      hash = (19 * hash) + getDescriptor().hashCode();
-      if (getExperimentIdsCount() > 0) {
-        hash = (37 * hash) + EXPERIMENT_IDS_FIELD_NUMBER;
-        hash = (53 * hash) + getExperimentIdsList().hashCode();
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+          byte[] data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
       }
-      if (hasFilter()) {
-        hash = (37 * hash) + FILTER_FIELD_NUMBER;
-        hash = (53 * hash) + getFilter().hashCode();
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
       }
-      if (hasRunViewType()) {
-        hash = (37 * hash) + RUN_VIEW_TYPE_FIELD_NUMBER;
-        hash = (53 * hash) + runViewType_;
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
       }
-      if (hasMaxResults()) {
-        hash = (37 * hash) + MAX_RESULTS_FIELD_NUMBER;
-        hash = (53 * hash) + getMaxResults();
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseDelimitedFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input);
       }
-      if (getOrderByCount() > 0) {
-        hash = (37 * hash) + ORDER_BY_FIELD_NUMBER;
-        hash = (53 * hash) + getOrderByList().hashCode();
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseDelimitedFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
       }
-      if (hasPageToken()) {
-        hash = (37 * hash) + PAGE_TOKEN_FIELD_NUMBER;
-        hash = (53 * hash) + getPageToken().hashCode();
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+          com.google.protobuf.CodedInputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
       }
-      hash = (29 * hash) + unknownFields.hashCode();
-      memoizedHashCode = hash;
-      return hash;
-    }
-
-    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
-        java.nio.ByteBuffer data)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data);
-    }
-    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
-        java.nio.ByteBuffer data,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
-        com.google.protobuf.ByteString data)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data);
-    }
-    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
-        com.google.protobuf.ByteString data,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(byte[] data)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data);
-    }
-    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
-        byte[] data,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(java.io.InputStream input)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseWithIOException(PARSER, input);
-    }
-    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
-        java.io.InputStream input,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseWithIOException(PARSER, input, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.SearchRuns parseDelimitedFrom(java.io.InputStream input)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseDelimitedWithIOException(PARSER, input);
-    }
-    public static org.mlflow.api.proto.Service.SearchRuns parseDelimitedFrom(
-        java.io.InputStream input,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
-        com.google.protobuf.CodedInputStream input)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseWithIOException(PARSER, input);
-    }
-    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
-        com.google.protobuf.CodedInputStream input,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseWithIOException(PARSER, input, extensionRegistry);
-    }
-
-    @java.lang.Override
-    public Builder newBuilderForType() { return newBuilder(); }
-    public static Builder newBuilder() {
-      return DEFAULT_INSTANCE.toBuilder();
-    }
-    public static Builder newBuilder(org.mlflow.api.proto.Service.SearchRuns prototype) {
-      return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
-    }
-    @java.lang.Override
-    public Builder toBuilder() {
-      return this == DEFAULT_INSTANCE
-          ? new Builder() : new Builder().mergeFrom(this);
-    }
-
-    @java.lang.Override
-    protected Builder newBuilderForType(
-        com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
-      Builder builder = new Builder(parent);
-      return builder;
-    }
-    /**
-     * Protobuf type {@code mlflow.SearchRuns}
-     */
-    public static final class Builder extends
-        com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
-        // @@protoc_insertion_point(builder_implements:mlflow.SearchRuns)
-        org.mlflow.api.proto.Service.SearchRunsOrBuilder {
-      public static final com.google.protobuf.Descriptors.Descriptor
-          getDescriptor() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_descriptor;
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
       }
 
       @java.lang.Override
-      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
-          internalGetFieldAccessorTable() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_fieldAccessorTable
-            .ensureFieldAccessorsInitialized(
-                org.mlflow.api.proto.Service.SearchRuns.class, org.mlflow.api.proto.Service.SearchRuns.Builder.class);
-      }
-
-      // Construct using org.mlflow.api.proto.Service.SearchRuns.newBuilder()
-      private Builder() {
-        maybeForceBuilderInitialization();
-      }
-
-      private Builder(
-          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
-        super(parent);
-        maybeForceBuilderInitialization();
-      }
-      private void maybeForceBuilderInitialization() {
-        if (com.google.protobuf.GeneratedMessageV3
-                .alwaysUseFieldBuilders) {
-        }
+      public Builder newBuilderForType() { return newBuilder(); }
+      public static Builder newBuilder() {
+        return DEFAULT_INSTANCE.toBuilder();
       }
-      @java.lang.Override
-      public Builder clear() {
-        super.clear();
-        experimentIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
-        bitField0_ = (bitField0_ & ~0x00000001);
-        filter_ = "";
-        bitField0_ = (bitField0_ & ~0x00000002);
-        runViewType_ = 1;
-        bitField0_ = (bitField0_ & ~0x00000004);
-        maxResults_ = 1000;
-        bitField0_ = (bitField0_ & ~0x00000008);
-        orderBy_ = com.google.protobuf.LazyStringArrayList.EMPTY;
-        bitField0_ = (bitField0_ & ~0x00000010);
-        pageToken_ = "";
-        bitField0_ = (bitField0_ & ~0x00000020);
-        return this;
+      public static Builder newBuilder(org.mlflow.api.proto.Service.SearchRuns.Response prototype) {
+        return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
       }
-
       @java.lang.Override
-      public com.google.protobuf.Descriptors.Descriptor
-          getDescriptorForType() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_descriptor;
+      public Builder toBuilder() {
+        return this == DEFAULT_INSTANCE
+            ? new Builder() : new Builder().mergeFrom(this);
       }
 
       @java.lang.Override
-      public org.mlflow.api.proto.Service.SearchRuns getDefaultInstanceForType() {
-        return org.mlflow.api.proto.Service.SearchRuns.getDefaultInstance();
+      protected Builder newBuilderForType(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        Builder builder = new Builder(parent);
+        return builder;
       }
+      /**
+       * Protobuf type {@code mlflow.SearchRuns.Response}
+       */
+      public static final class Builder extends
+          com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+          // @@protoc_insertion_point(builder_implements:mlflow.SearchRuns.Response)
+          org.mlflow.api.proto.Service.SearchRuns.ResponseOrBuilder {
+        public static final com.google.protobuf.Descriptors.Descriptor
+            getDescriptor() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_Response_descriptor;
+        }
 
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.SearchRuns build() {
-        org.mlflow.api.proto.Service.SearchRuns result = buildPartial();
-        if (!result.isInitialized()) {
-          throw newUninitializedMessageException(result);
+        @java.lang.Override
+        protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+            internalGetFieldAccessorTable() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_Response_fieldAccessorTable
+              .ensureFieldAccessorsInitialized(
+                  org.mlflow.api.proto.Service.SearchRuns.Response.class, org.mlflow.api.proto.Service.SearchRuns.Response.Builder.class);
         }
-        return result;
-      }
 
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.SearchRuns buildPartial() {
-        org.mlflow.api.proto.Service.SearchRuns result = new org.mlflow.api.proto.Service.SearchRuns(this);
-        int from_bitField0_ = bitField0_;
-        int to_bitField0_ = 0;
-        if (((bitField0_ & 0x00000001) != 0)) {
-          experimentIds_ = experimentIds_.getUnmodifiableView();
-          bitField0_ = (bitField0_ & ~0x00000001);
+        // Construct using org.mlflow.api.proto.Service.SearchRuns.Response.newBuilder()
+        private Builder() {
+          maybeForceBuilderInitialization();
         }
-        result.experimentIds_ = experimentIds_;
-        if (((from_bitField0_ & 0x00000002) != 0)) {
-          to_bitField0_ |= 0x00000001;
+
+        private Builder(
+            com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+          super(parent);
+          maybeForceBuilderInitialization();
         }
-        result.filter_ = filter_;
-        if (((from_bitField0_ & 0x00000004) != 0)) {
-          to_bitField0_ |= 0x00000002;
+        private void maybeForceBuilderInitialization() {
+          if (com.google.protobuf.GeneratedMessageV3
+                  .alwaysUseFieldBuilders) {
+            getRunsFieldBuilder();
+          }
         }
-        result.runViewType_ = runViewType_;
-        if (((from_bitField0_ & 0x00000008) != 0)) {
-          to_bitField0_ |= 0x00000004;
+        @java.lang.Override
+        public Builder clear() {
+          super.clear();
+          if (runsBuilder_ == null) {
+            runs_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000001);
+          } else {
+            runsBuilder_.clear();
+          }
+          nextPageToken_ = "";
+          bitField0_ = (bitField0_ & ~0x00000002);
+          return this;
         }
-        result.maxResults_ = maxResults_;
-        if (((bitField0_ & 0x00000010) != 0)) {
-          orderBy_ = orderBy_.getUnmodifiableView();
-          bitField0_ = (bitField0_ & ~0x00000010);
+
+        @java.lang.Override
+        public com.google.protobuf.Descriptors.Descriptor
+            getDescriptorForType() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_Response_descriptor;
         }
-        result.orderBy_ = orderBy_;
-        if (((from_bitField0_ & 0x00000020) != 0)) {
-          to_bitField0_ |= 0x00000008;
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.SearchRuns.Response getDefaultInstanceForType() {
+          return org.mlflow.api.proto.Service.SearchRuns.Response.getDefaultInstance();
         }
-        result.pageToken_ = pageToken_;
-        result.bitField0_ = to_bitField0_;
-        onBuilt();
-        return result;
-      }
 
-      @java.lang.Override
-      public Builder clone() {
-        return super.clone();
-      }
-      @java.lang.Override
-      public Builder setField(
-          com.google.protobuf.Descriptors.FieldDescriptor field,
-          java.lang.Object value) {
-        return super.setField(field, value);
-      }
-      @java.lang.Override
-      public Builder clearField(
-          com.google.protobuf.Descriptors.FieldDescriptor field) {
-        return super.clearField(field);
-      }
-      @java.lang.Override
-      public Builder clearOneof(
-          com.google.protobuf.Descriptors.OneofDescriptor oneof) {
-        return super.clearOneof(oneof);
-      }
-      @java.lang.Override
-      public Builder setRepeatedField(
-          com.google.protobuf.Descriptors.FieldDescriptor field,
-          int index, java.lang.Object value) {
-        return super.setRepeatedField(field, index, value);
-      }
-      @java.lang.Override
-      public Builder addRepeatedField(
-          com.google.protobuf.Descriptors.FieldDescriptor field,
-          java.lang.Object value) {
-        return super.addRepeatedField(field, value);
-      }
-      @java.lang.Override
-      public Builder mergeFrom(com.google.protobuf.Message other) {
-        if (other instanceof org.mlflow.api.proto.Service.SearchRuns) {
-          return mergeFrom((org.mlflow.api.proto.Service.SearchRuns)other);
-        } else {
-          super.mergeFrom(other);
-          return this;
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.SearchRuns.Response build() {
+          org.mlflow.api.proto.Service.SearchRuns.Response result = buildPartial();
+          if (!result.isInitialized()) {
+            throw newUninitializedMessageException(result);
+          }
+          return result;
         }
-      }
 
-      public Builder mergeFrom(org.mlflow.api.proto.Service.SearchRuns other) {
-        if (other == org.mlflow.api.proto.Service.SearchRuns.getDefaultInstance()) return this;
-        if (!other.experimentIds_.isEmpty()) {
-          if (experimentIds_.isEmpty()) {
-            experimentIds_ = other.experimentIds_;
-            bitField0_ = (bitField0_ & ~0x00000001);
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.SearchRuns.Response buildPartial() {
+          org.mlflow.api.proto.Service.SearchRuns.Response result = new org.mlflow.api.proto.Service.SearchRuns.Response(this);
+          int from_bitField0_ = bitField0_;
+          int to_bitField0_ = 0;
+          if (runsBuilder_ == null) {
+            if (((bitField0_ & 0x00000001) != 0)) {
+              runs_ = java.util.Collections.unmodifiableList(runs_);
+              bitField0_ = (bitField0_ & ~0x00000001);
+            }
+            result.runs_ = runs_;
           } else {
-            ensureExperimentIdsIsMutable();
-            experimentIds_.addAll(other.experimentIds_);
+            result.runs_ = runsBuilder_.build();
           }
-          onChanged();
+          if (((from_bitField0_ & 0x00000002) != 0)) {
+            to_bitField0_ |= 0x00000001;
+          }
+          result.nextPageToken_ = nextPageToken_;
+          result.bitField0_ = to_bitField0_;
+          onBuilt();
+          return result;
         }
-        if (other.hasFilter()) {
-          bitField0_ |= 0x00000002;
-          filter_ = other.filter_;
-          onChanged();
+
+        @java.lang.Override
+        public Builder clone() {
+          return super.clone();
         }
-        if (other.hasRunViewType()) {
-          setRunViewType(other.getRunViewType());
+        @java.lang.Override
+        public Builder setField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return super.setField(field, value);
         }
-        if (other.hasMaxResults()) {
-          setMaxResults(other.getMaxResults());
+        @java.lang.Override
+        public Builder clearField(
+            com.google.protobuf.Descriptors.FieldDescriptor field) {
+          return super.clearField(field);
         }
-        if (!other.orderBy_.isEmpty()) {
-          if (orderBy_.isEmpty()) {
-            orderBy_ = other.orderBy_;
-            bitField0_ = (bitField0_ & ~0x00000010);
+        @java.lang.Override
+        public Builder clearOneof(
+            com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+          return super.clearOneof(oneof);
+        }
+        @java.lang.Override
+        public Builder setRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            int index, java.lang.Object value) {
+          return super.setRepeatedField(field, index, value);
+        }
+        @java.lang.Override
+        public Builder addRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return super.addRepeatedField(field, value);
+        }
+        @java.lang.Override
+        public Builder mergeFrom(com.google.protobuf.Message other) {
+          if (other instanceof org.mlflow.api.proto.Service.SearchRuns.Response) {
+            return mergeFrom((org.mlflow.api.proto.Service.SearchRuns.Response)other);
           } else {
-            ensureOrderByIsMutable();
-            orderBy_.addAll(other.orderBy_);
+            super.mergeFrom(other);
+            return this;
           }
-          onChanged();
         }
-        if (other.hasPageToken()) {
-          bitField0_ |= 0x00000020;
-          pageToken_ = other.pageToken_;
+
+        public Builder mergeFrom(org.mlflow.api.proto.Service.SearchRuns.Response other) {
+          if (other == org.mlflow.api.proto.Service.SearchRuns.Response.getDefaultInstance()) return this;
+          if (runsBuilder_ == null) {
+            if (!other.runs_.isEmpty()) {
+              if (runs_.isEmpty()) {
+                runs_ = other.runs_;
+                bitField0_ = (bitField0_ & ~0x00000001);
+              } else {
+                ensureRunsIsMutable();
+                runs_.addAll(other.runs_);
+              }
+              onChanged();
+            }
+          } else {
+            if (!other.runs_.isEmpty()) {
+              if (runsBuilder_.isEmpty()) {
+                runsBuilder_.dispose();
+                runsBuilder_ = null;
+                runs_ = other.runs_;
+                bitField0_ = (bitField0_ & ~0x00000001);
+                runsBuilder_ = 
+                  com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
+                     getRunsFieldBuilder() : null;
+              } else {
+                runsBuilder_.addAllMessages(other.runs_);
+              }
+            }
+          }
+          if (other.hasNextPageToken()) {
+            bitField0_ |= 0x00000002;
+            nextPageToken_ = other.nextPageToken_;
+            onChanged();
+          }
+          this.mergeUnknownFields(other.unknownFields);
           onChanged();
+          return this;
         }
-        this.mergeUnknownFields(other.unknownFields);
-        onChanged();
-        return this;
-      }
 
-      @java.lang.Override
-      public final boolean isInitialized() {
-        return true;
-      }
+        @java.lang.Override
+        public final boolean isInitialized() {
+          return true;
+        }
 
-      @java.lang.Override
-      public Builder mergeFrom(
-          com.google.protobuf.CodedInputStream input,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws java.io.IOException {
-        org.mlflow.api.proto.Service.SearchRuns parsedMessage = null;
-        try {
-          parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
-        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-          parsedMessage = (org.mlflow.api.proto.Service.SearchRuns) e.getUnfinishedMessage();
-          throw e.unwrapIOException();
-        } finally {
-          if (parsedMessage != null) {
-            mergeFrom(parsedMessage);
+        @java.lang.Override
+        public Builder mergeFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws java.io.IOException {
+          org.mlflow.api.proto.Service.SearchRuns.Response parsedMessage = null;
+          try {
+            parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+          } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+            parsedMessage = (org.mlflow.api.proto.Service.SearchRuns.Response) e.getUnfinishedMessage();
+            throw e.unwrapIOException();
+          } finally {
+            if (parsedMessage != null) {
+              mergeFrom(parsedMessage);
+            }
           }
+          return this;
         }
-        return this;
-      }
-      private int bitField0_;
+        private int bitField0_;
 
-      private com.google.protobuf.LazyStringList experimentIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
-      private void ensureExperimentIdsIsMutable() {
-        if (!((bitField0_ & 0x00000001) != 0)) {
-          experimentIds_ = new com.google.protobuf.LazyStringArrayList(experimentIds_);
-          bitField0_ |= 0x00000001;
-         }
-      }
-      /**
-       * <pre>
-       * List of experiment IDs to search over.
-       * </pre>
-       *
-       * <code>repeated string experiment_ids = 1;</code>
-       * @return A list containing the experimentIds.
-       */
-      public com.google.protobuf.ProtocolStringList
-          getExperimentIdsList() {
-        return experimentIds_.getUnmodifiableView();
-      }
-      /**
-       * <pre>
-       * List of experiment IDs to search over.
-       * </pre>
-       *
-       * <code>repeated string experiment_ids = 1;</code>
-       * @return The count of experimentIds.
-       */
-      public int getExperimentIdsCount() {
-        return experimentIds_.size();
-      }
-      /**
-       * <pre>
-       * List of experiment IDs to search over.
-       * </pre>
-       *
-       * <code>repeated string experiment_ids = 1;</code>
-       * @param index The index of the element to return.
-       * @return The experimentIds at the given index.
-       */
-      public java.lang.String getExperimentIds(int index) {
-        return experimentIds_.get(index);
-      }
-      /**
-       * <pre>
-       * List of experiment IDs to search over.
-       * </pre>
-       *
-       * <code>repeated string experiment_ids = 1;</code>
-       * @param index The index of the value to return.
-       * @return The bytes of the experimentIds at the given index.
-       */
-      public com.google.protobuf.ByteString
-          getExperimentIdsBytes(int index) {
-        return experimentIds_.getByteString(index);
-      }
-      /**
-       * <pre>
-       * List of experiment IDs to search over.
-       * </pre>
-       *
-       * <code>repeated string experiment_ids = 1;</code>
-       * @param index The index to set the value at.
-       * @param value The experimentIds to set.
-       * @return This builder for chaining.
-       */
-      public Builder setExperimentIds(
-          int index, java.lang.String value) {
-        if (value == null) {
+        private java.util.List<org.mlflow.api.proto.Service.Run> runs_ =
+          java.util.Collections.emptyList();
+        private void ensureRunsIsMutable() {
+          if (!((bitField0_ & 0x00000001) != 0)) {
+            runs_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Run>(runs_);
+            bitField0_ |= 0x00000001;
+           }
+        }
+
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.Run, org.mlflow.api.proto.Service.Run.Builder, org.mlflow.api.proto.Service.RunOrBuilder> runsBuilder_;
+
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.Run> getRunsList() {
+          if (runsBuilder_ == null) {
+            return java.util.Collections.unmodifiableList(runs_);
+          } else {
+            return runsBuilder_.getMessageList();
+          }
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public int getRunsCount() {
+          if (runsBuilder_ == null) {
+            return runs_.size();
+          } else {
+            return runsBuilder_.getCount();
+          }
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Run getRuns(int index) {
+          if (runsBuilder_ == null) {
+            return runs_.get(index);
+          } else {
+            return runsBuilder_.getMessage(index);
+          }
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder setRuns(
+            int index, org.mlflow.api.proto.Service.Run value) {
+          if (runsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureRunsIsMutable();
+            runs_.set(index, value);
+            onChanged();
+          } else {
+            runsBuilder_.setMessage(index, value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder setRuns(
+            int index, org.mlflow.api.proto.Service.Run.Builder builderForValue) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            runs_.set(index, builderForValue.build());
+            onChanged();
+          } else {
+            runsBuilder_.setMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addRuns(org.mlflow.api.proto.Service.Run value) {
+          if (runsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureRunsIsMutable();
+            runs_.add(value);
+            onChanged();
+          } else {
+            runsBuilder_.addMessage(value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addRuns(
+            int index, org.mlflow.api.proto.Service.Run value) {
+          if (runsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureRunsIsMutable();
+            runs_.add(index, value);
+            onChanged();
+          } else {
+            runsBuilder_.addMessage(index, value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addRuns(
+            org.mlflow.api.proto.Service.Run.Builder builderForValue) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            runs_.add(builderForValue.build());
+            onChanged();
+          } else {
+            runsBuilder_.addMessage(builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addRuns(
+            int index, org.mlflow.api.proto.Service.Run.Builder builderForValue) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            runs_.add(index, builderForValue.build());
+            onChanged();
+          } else {
+            runsBuilder_.addMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addAllRuns(
+            java.lang.Iterable<? extends org.mlflow.api.proto.Service.Run> values) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            com.google.protobuf.AbstractMessageLite.Builder.addAll(
+                values, runs_);
+            onChanged();
+          } else {
+            runsBuilder_.addAllMessages(values);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder clearRuns() {
+          if (runsBuilder_ == null) {
+            runs_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000001);
+            onChanged();
+          } else {
+            runsBuilder_.clear();
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder removeRuns(int index) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            runs_.remove(index);
+            onChanged();
+          } else {
+            runsBuilder_.remove(index);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Run.Builder getRunsBuilder(
+            int index) {
+          return getRunsFieldBuilder().getBuilder(index);
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.RunOrBuilder getRunsOrBuilder(
+            int index) {
+          if (runsBuilder_ == null) {
+            return runs_.get(index);  } else {
+            return runsBuilder_.getMessageOrBuilder(index);
+          }
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public java.util.List<? extends org.mlflow.api.proto.Service.RunOrBuilder> 
+             getRunsOrBuilderList() {
+          if (runsBuilder_ != null) {
+            return runsBuilder_.getMessageOrBuilderList();
+          } else {
+            return java.util.Collections.unmodifiableList(runs_);
+          }
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Run.Builder addRunsBuilder() {
+          return getRunsFieldBuilder().addBuilder(
+              org.mlflow.api.proto.Service.Run.getDefaultInstance());
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Run.Builder addRunsBuilder(
+            int index) {
+          return getRunsFieldBuilder().addBuilder(
+              index, org.mlflow.api.proto.Service.Run.getDefaultInstance());
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.Run.Builder> 
+             getRunsBuilderList() {
+          return getRunsFieldBuilder().getBuilderList();
+        }
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.Run, org.mlflow.api.proto.Service.Run.Builder, org.mlflow.api.proto.Service.RunOrBuilder> 
+            getRunsFieldBuilder() {
+          if (runsBuilder_ == null) {
+            runsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
+                org.mlflow.api.proto.Service.Run, org.mlflow.api.proto.Service.Run.Builder, org.mlflow.api.proto.Service.RunOrBuilder>(
+                    runs_,
+                    ((bitField0_ & 0x00000001) != 0),
+                    getParentForChildren(),
+                    isClean());
+            runs_ = null;
+          }
+          return runsBuilder_;
+        }
+
+        private java.lang.Object nextPageToken_ = "";
+        /**
+         * <code>optional string next_page_token = 2;</code>
+         * @return Whether the nextPageToken field is set.
+         */
+        public boolean hasNextPageToken() {
+          return ((bitField0_ & 0x00000002) != 0);
+        }
+        /**
+         * <code>optional string next_page_token = 2;</code>
+         * @return The nextPageToken.
+         */
+        public java.lang.String getNextPageToken() {
+          java.lang.Object ref = nextPageToken_;
+          if (!(ref instanceof java.lang.String)) {
+            com.google.protobuf.ByteString bs =
+                (com.google.protobuf.ByteString) ref;
+            java.lang.String s = bs.toStringUtf8();
+            if (bs.isValidUtf8()) {
+              nextPageToken_ = s;
+            }
+            return s;
+          } else {
+            return (java.lang.String) ref;
+          }
+        }
+        /**
+         * <code>optional string next_page_token = 2;</code>
+         * @return The bytes for nextPageToken.
+         */
+        public com.google.protobuf.ByteString
+            getNextPageTokenBytes() {
+          java.lang.Object ref = nextPageToken_;
+          if (ref instanceof String) {
+            com.google.protobuf.ByteString b = 
+                com.google.protobuf.ByteString.copyFromUtf8(
+                    (java.lang.String) ref);
+            nextPageToken_ = b;
+            return b;
+          } else {
+            return (com.google.protobuf.ByteString) ref;
+          }
+        }
+        /**
+         * <code>optional string next_page_token = 2;</code>
+         * @param value The nextPageToken to set.
+         * @return This builder for chaining.
+         */
+        public Builder setNextPageToken(
+            java.lang.String value) {
+          if (value == null) {
     throw new NullPointerException();
   }
-  ensureExperimentIdsIsMutable();
-        experimentIds_.set(index, value);
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * List of experiment IDs to search over.
-       * </pre>
-       *
-       * <code>repeated string experiment_ids = 1;</code>
-       * @param value The experimentIds to add.
-       * @return This builder for chaining.
-       */
-      public Builder addExperimentIds(
-          java.lang.String value) {
-        if (value == null) {
+  bitField0_ |= 0x00000002;
+          nextPageToken_ = value;
+          onChanged();
+          return this;
+        }
+        /**
+         * <code>optional string next_page_token = 2;</code>
+         * @return This builder for chaining.
+         */
+        public Builder clearNextPageToken() {
+          bitField0_ = (bitField0_ & ~0x00000002);
+          nextPageToken_ = getDefaultInstance().getNextPageToken();
+          onChanged();
+          return this;
+        }
+        /**
+         * <code>optional string next_page_token = 2;</code>
+         * @param value The bytes for nextPageToken to set.
+         * @return This builder for chaining.
+         */
+        public Builder setNextPageTokenBytes(
+            com.google.protobuf.ByteString value) {
+          if (value == null) {
     throw new NullPointerException();
   }
-  ensureExperimentIdsIsMutable();
-        experimentIds_.add(value);
-        onChanged();
-        return this;
+  bitField0_ |= 0x00000002;
+          nextPageToken_ = value;
+          onChanged();
+          return this;
+        }
+        @java.lang.Override
+        public final Builder setUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.setUnknownFields(unknownFields);
+        }
+
+        @java.lang.Override
+        public final Builder mergeUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.mergeUnknownFields(unknownFields);
+        }
+
+
+        // @@protoc_insertion_point(builder_scope:mlflow.SearchRuns.Response)
       }
-      /**
-       * <pre>
-       * List of experiment IDs to search over.
-       * </pre>
-       *
-       * <code>repeated string experiment_ids = 1;</code>
-       * @param values The experimentIds to add.
-       * @return This builder for chaining.
-       */
-      public Builder addAllExperimentIds(
-          java.lang.Iterable<java.lang.String> values) {
-        ensureExperimentIdsIsMutable();
-        com.google.protobuf.AbstractMessageLite.Builder.addAll(
-            values, experimentIds_);
-        onChanged();
-        return this;
+
+      // @@protoc_insertion_point(class_scope:mlflow.SearchRuns.Response)
+      private static final org.mlflow.api.proto.Service.SearchRuns.Response DEFAULT_INSTANCE;
+      static {
+        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.SearchRuns.Response();
       }
-      /**
-       * <pre>
-       * List of experiment IDs to search over.
-       * </pre>
-       *
-       * <code>repeated string experiment_ids = 1;</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearExperimentIds() {
-        experimentIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
-        bitField0_ = (bitField0_ & ~0x00000001);
-        onChanged();
-        return this;
+
+      public static org.mlflow.api.proto.Service.SearchRuns.Response getDefaultInstance() {
+        return DEFAULT_INSTANCE;
       }
-      /**
-       * <pre>
-       * List of experiment IDs to search over.
-       * </pre>
-       *
-       * <code>repeated string experiment_ids = 1;</code>
-       * @param value The bytes of the experimentIds to add.
-       * @return This builder for chaining.
-       */
-      public Builder addExperimentIdsBytes(
-          com.google.protobuf.ByteString value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  ensureExperimentIdsIsMutable();
-        experimentIds_.add(value);
-        onChanged();
-        return this;
+
+      @java.lang.Deprecated public static final com.google.protobuf.Parser<Response>
+          PARSER = new com.google.protobuf.AbstractParser<Response>() {
+        @java.lang.Override
+        public Response parsePartialFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws com.google.protobuf.InvalidProtocolBufferException {
+          return new Response(input, extensionRegistry);
+        }
+      };
+
+      public static com.google.protobuf.Parser<Response> parser() {
+        return PARSER;
       }
 
-      private java.lang.Object filter_ = "";
-      /**
-       * <pre>
-       * A filter expression over params, metrics, and tags, that allows returning a subset of
-       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
-       * between a param, metric, or tag and a constant.
-       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
-       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
-       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
-       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
-       * </pre>
-       *
-       * <code>optional string filter = 4;</code>
-       * @return Whether the filter field is set.
-       */
-      public boolean hasFilter() {
-        return ((bitField0_ & 0x00000002) != 0);
+      @java.lang.Override
+      public com.google.protobuf.Parser<Response> getParserForType() {
+        return PARSER;
       }
-      /**
-       * <pre>
-       * A filter expression over params, metrics, and tags, that allows returning a subset of
-       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
-       * between a param, metric, or tag and a constant.
-       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
-       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
-       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
-       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
-       * </pre>
-       *
-       * <code>optional string filter = 4;</code>
-       * @return The filter.
-       */
-      public java.lang.String getFilter() {
-        java.lang.Object ref = filter_;
-        if (!(ref instanceof java.lang.String)) {
-          com.google.protobuf.ByteString bs =
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            filter_ = s;
-          }
-          return s;
-        } else {
-          return (java.lang.String) ref;
-        }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.SearchRuns.Response getDefaultInstanceForType() {
+        return DEFAULT_INSTANCE;
       }
-      /**
-       * <pre>
-       * A filter expression over params, metrics, and tags, that allows returning a subset of
-       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
-       * between a param, metric, or tag and a constant.
-       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
-       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
-       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
-       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
-       * </pre>
-       *
-       * <code>optional string filter = 4;</code>
-       * @return The bytes for filter.
-       */
-      public com.google.protobuf.ByteString
-          getFilterBytes() {
-        java.lang.Object ref = filter_;
-        if (ref instanceof String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          filter_ = b;
-          return b;
-        } else {
-          return (com.google.protobuf.ByteString) ref;
+
+    }
+
+    private int bitField0_;
+    public static final int EXPERIMENT_IDS_FIELD_NUMBER = 1;
+    private com.google.protobuf.LazyStringList experimentIds_;
+    /**
+     * <pre>
+     * List of experiment IDs to search over.
+     * </pre>
+     *
+     * <code>repeated string experiment_ids = 1;</code>
+     * @return A list containing the experimentIds.
+     */
+    public com.google.protobuf.ProtocolStringList
+        getExperimentIdsList() {
+      return experimentIds_;
+    }
+    /**
+     * <pre>
+     * List of experiment IDs to search over.
+     * </pre>
+     *
+     * <code>repeated string experiment_ids = 1;</code>
+     * @return The count of experimentIds.
+     */
+    public int getExperimentIdsCount() {
+      return experimentIds_.size();
+    }
+    /**
+     * <pre>
+     * List of experiment IDs to search over.
+     * </pre>
+     *
+     * <code>repeated string experiment_ids = 1;</code>
+     * @param index The index of the element to return.
+     * @return The experimentIds at the given index.
+     */
+    public java.lang.String getExperimentIds(int index) {
+      return experimentIds_.get(index);
+    }
+    /**
+     * <pre>
+     * List of experiment IDs to search over.
+     * </pre>
+     *
+     * <code>repeated string experiment_ids = 1;</code>
+     * @param index The index of the value to return.
+     * @return The bytes of the experimentIds at the given index.
+     */
+    public com.google.protobuf.ByteString
+        getExperimentIdsBytes(int index) {
+      return experimentIds_.getByteString(index);
+    }
+
+    public static final int FILTER_FIELD_NUMBER = 4;
+    private volatile java.lang.Object filter_;
+    /**
+     * <pre>
+     * A filter expression over params, metrics, and tags, that allows returning a subset of
+     * runs. The syntax is a subset of SQL that supports ANDing together binary operations
+     * between a param, metric, or tag and a constant.
+     * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
+     * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
+     * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
+     * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
+     * </pre>
+     *
+     * <code>optional string filter = 4;</code>
+     * @return Whether the filter field is set.
+     */
+    @java.lang.Override
+    public boolean hasFilter() {
+      return ((bitField0_ & 0x00000001) != 0);
+    }
+    /**
+     * <pre>
+     * A filter expression over params, metrics, and tags, that allows returning a subset of
+     * runs. The syntax is a subset of SQL that supports ANDing together binary operations
+     * between a param, metric, or tag and a constant.
+     * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
+     * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
+     * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
+     * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
+     * </pre>
+     *
+     * <code>optional string filter = 4;</code>
+     * @return The filter.
+     */
+    @java.lang.Override
+    public java.lang.String getFilter() {
+      java.lang.Object ref = filter_;
+      if (ref instanceof java.lang.String) {
+        return (java.lang.String) ref;
+      } else {
+        com.google.protobuf.ByteString bs = 
+            (com.google.protobuf.ByteString) ref;
+        java.lang.String s = bs.toStringUtf8();
+        if (bs.isValidUtf8()) {
+          filter_ = s;
         }
+        return s;
       }
-      /**
-       * <pre>
-       * A filter expression over params, metrics, and tags, that allows returning a subset of
-       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
-       * between a param, metric, or tag and a constant.
-       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
-       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
-       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
-       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
-       * </pre>
-       *
-       * <code>optional string filter = 4;</code>
-       * @param value The filter to set.
-       * @return This builder for chaining.
-       */
-      public Builder setFilter(
-          java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000002;
-        filter_ = value;
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * A filter expression over params, metrics, and tags, that allows returning a subset of
-       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
-       * between a param, metric, or tag and a constant.
-       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
-       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
-       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
-       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
-       * </pre>
-       *
-       * <code>optional string filter = 4;</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearFilter() {
-        bitField0_ = (bitField0_ & ~0x00000002);
-        filter_ = getDefaultInstance().getFilter();
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * A filter expression over params, metrics, and tags, that allows returning a subset of
-       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
-       * between a param, metric, or tag and a constant.
-       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
-       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
-       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
-       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
-       * </pre>
-       *
-       * <code>optional string filter = 4;</code>
-       * @param value The bytes for filter to set.
-       * @return This builder for chaining.
-       */
-      public Builder setFilterBytes(
-          com.google.protobuf.ByteString value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000002;
-        filter_ = value;
-        onChanged();
-        return this;
+    }
+    /**
+     * <pre>
+     * A filter expression over params, metrics, and tags, that allows returning a subset of
+     * runs. The syntax is a subset of SQL that supports ANDing together binary operations
+     * between a param, metric, or tag and a constant.
+     * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
+     * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
+     * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
+     * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
+     * </pre>
+     *
+     * <code>optional string filter = 4;</code>
+     * @return The bytes for filter.
+     */
+    @java.lang.Override
+    public com.google.protobuf.ByteString
+        getFilterBytes() {
+      java.lang.Object ref = filter_;
+      if (ref instanceof java.lang.String) {
+        com.google.protobuf.ByteString b = 
+            com.google.protobuf.ByteString.copyFromUtf8(
+                (java.lang.String) ref);
+        filter_ = b;
+        return b;
+      } else {
+        return (com.google.protobuf.ByteString) ref;
       }
+    }
 
-      private int runViewType_ = 1;
-      /**
-       * <pre>
-       * Whether to display only active, only deleted, or all runs.
-       * Defaults to only active runs.
-       * </pre>
-       *
-       * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
-       * @return Whether the runViewType field is set.
-       */
-      @java.lang.Override public boolean hasRunViewType() {
-        return ((bitField0_ & 0x00000004) != 0);
-      }
-      /**
-       * <pre>
-       * Whether to display only active, only deleted, or all runs.
-       * Defaults to only active runs.
-       * </pre>
-       *
-       * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
-       * @return The runViewType.
-       */
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.ViewType getRunViewType() {
-        @SuppressWarnings("deprecation")
-        org.mlflow.api.proto.Service.ViewType result = org.mlflow.api.proto.Service.ViewType.valueOf(runViewType_);
-        return result == null ? org.mlflow.api.proto.Service.ViewType.ACTIVE_ONLY : result;
-      }
-      /**
-       * <pre>
-       * Whether to display only active, only deleted, or all runs.
-       * Defaults to only active runs.
-       * </pre>
-       *
-       * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
-       * @param value The runViewType to set.
-       * @return This builder for chaining.
-       */
-      public Builder setRunViewType(org.mlflow.api.proto.Service.ViewType value) {
-        if (value == null) {
-          throw new NullPointerException();
+    public static final int RUN_VIEW_TYPE_FIELD_NUMBER = 3;
+    private int runViewType_;
+    /**
+     * <pre>
+     * Whether to display only active, only deleted, or all runs.
+     * Defaults to only active runs.
+     * </pre>
+     *
+     * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
+     * @return Whether the runViewType field is set.
+     */
+    @java.lang.Override public boolean hasRunViewType() {
+      return ((bitField0_ & 0x00000002) != 0);
+    }
+    /**
+     * <pre>
+     * Whether to display only active, only deleted, or all runs.
+     * Defaults to only active runs.
+     * </pre>
+     *
+     * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
+     * @return The runViewType.
+     */
+    @java.lang.Override public org.mlflow.api.proto.Service.ViewType getRunViewType() {
+      @SuppressWarnings("deprecation")
+      org.mlflow.api.proto.Service.ViewType result = org.mlflow.api.proto.Service.ViewType.valueOf(runViewType_);
+      return result == null ? org.mlflow.api.proto.Service.ViewType.ACTIVE_ONLY : result;
+    }
+
+    public static final int MAX_RESULTS_FIELD_NUMBER = 5;
+    private int maxResults_;
+    /**
+     * <pre>
+     * Maximum number of runs desired. If unspecified, defaults to 1000.
+     * All servers are guaranteed to support a `max_results` threshold of at least 50,000
+     * but may support more. Callers of this endpoint are encouraged to pass max_results
+     * explicitly and leverage page_token to iterate through experiments.
+     * </pre>
+     *
+     * <code>optional int32 max_results = 5 [default = 1000];</code>
+     * @return Whether the maxResults field is set.
+     */
+    @java.lang.Override
+    public boolean hasMaxResults() {
+      return ((bitField0_ & 0x00000004) != 0);
+    }
+    /**
+     * <pre>
+     * Maximum number of runs desired. If unspecified, defaults to 1000.
+     * All servers are guaranteed to support a `max_results` threshold of at least 50,000
+     * but may support more. Callers of this endpoint are encouraged to pass max_results
+     * explicitly and leverage page_token to iterate through experiments.
+     * </pre>
+     *
+     * <code>optional int32 max_results = 5 [default = 1000];</code>
+     * @return The maxResults.
+     */
+    @java.lang.Override
+    public int getMaxResults() {
+      return maxResults_;
+    }
+
+    public static final int ORDER_BY_FIELD_NUMBER = 6;
+    private com.google.protobuf.LazyStringList orderBy_;
+    /**
+     * <pre>
+     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+     * (and this is the default ordering criterion if order_by is not provided).
+     * </pre>
+     *
+     * <code>repeated string order_by = 6;</code>
+     * @return A list containing the orderBy.
+     */
+    public com.google.protobuf.ProtocolStringList
+        getOrderByList() {
+      return orderBy_;
+    }
+    /**
+     * <pre>
+     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+     * (and this is the default ordering criterion if order_by is not provided).
+     * </pre>
+     *
+     * <code>repeated string order_by = 6;</code>
+     * @return The count of orderBy.
+     */
+    public int getOrderByCount() {
+      return orderBy_.size();
+    }
+    /**
+     * <pre>
+     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+     * (and this is the default ordering criterion if order_by is not provided).
+     * </pre>
+     *
+     * <code>repeated string order_by = 6;</code>
+     * @param index The index of the element to return.
+     * @return The orderBy at the given index.
+     */
+    public java.lang.String getOrderBy(int index) {
+      return orderBy_.get(index);
+    }
+    /**
+     * <pre>
+     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+     * (and this is the default ordering criterion if order_by is not provided).
+     * </pre>
+     *
+     * <code>repeated string order_by = 6;</code>
+     * @param index The index of the value to return.
+     * @return The bytes of the orderBy at the given index.
+     */
+    public com.google.protobuf.ByteString
+        getOrderByBytes(int index) {
+      return orderBy_.getByteString(index);
+    }
+
+    public static final int PAGE_TOKEN_FIELD_NUMBER = 7;
+    private volatile java.lang.Object pageToken_;
+    /**
+     * <code>optional string page_token = 7;</code>
+     * @return Whether the pageToken field is set.
+     */
+    @java.lang.Override
+    public boolean hasPageToken() {
+      return ((bitField0_ & 0x00000008) != 0);
+    }
+    /**
+     * <code>optional string page_token = 7;</code>
+     * @return The pageToken.
+     */
+    @java.lang.Override
+    public java.lang.String getPageToken() {
+      java.lang.Object ref = pageToken_;
+      if (ref instanceof java.lang.String) {
+        return (java.lang.String) ref;
+      } else {
+        com.google.protobuf.ByteString bs = 
+            (com.google.protobuf.ByteString) ref;
+        java.lang.String s = bs.toStringUtf8();
+        if (bs.isValidUtf8()) {
+          pageToken_ = s;
         }
-        bitField0_ |= 0x00000004;
-        runViewType_ = value.getNumber();
-        onChanged();
-        return this;
+        return s;
       }
-      /**
-       * <pre>
-       * Whether to display only active, only deleted, or all runs.
-       * Defaults to only active runs.
-       * </pre>
-       *
-       * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearRunViewType() {
-        bitField0_ = (bitField0_ & ~0x00000004);
-        runViewType_ = 1;
-        onChanged();
-        return this;
+    }
+    /**
+     * <code>optional string page_token = 7;</code>
+     * @return The bytes for pageToken.
+     */
+    @java.lang.Override
+    public com.google.protobuf.ByteString
+        getPageTokenBytes() {
+      java.lang.Object ref = pageToken_;
+      if (ref instanceof java.lang.String) {
+        com.google.protobuf.ByteString b = 
+            com.google.protobuf.ByteString.copyFromUtf8(
+                (java.lang.String) ref);
+        pageToken_ = b;
+        return b;
+      } else {
+        return (com.google.protobuf.ByteString) ref;
       }
+    }
 
-      private int maxResults_ = 1000;
-      /**
-       * <pre>
-       * Maximum number of runs desired. If unspecified, defaults to 1000.
-       * All servers are guaranteed to support a `max_results` threshold of at least 50,000
-       * but may support more. Callers of this endpoint are encouraged to pass max_results
-       * explicitly and leverage page_token to iterate through experiments.
-       * </pre>
-       *
-       * <code>optional int32 max_results = 5 [default = 1000];</code>
-       * @return Whether the maxResults field is set.
-       */
-      @java.lang.Override
-      public boolean hasMaxResults() {
-        return ((bitField0_ & 0x00000008) != 0);
-      }
-      /**
-       * <pre>
-       * Maximum number of runs desired. If unspecified, defaults to 1000.
-       * All servers are guaranteed to support a `max_results` threshold of at least 50,000
-       * but may support more. Callers of this endpoint are encouraged to pass max_results
-       * explicitly and leverage page_token to iterate through experiments.
-       * </pre>
-       *
-       * <code>optional int32 max_results = 5 [default = 1000];</code>
-       * @return The maxResults.
-       */
-      @java.lang.Override
-      public int getMaxResults() {
-        return maxResults_;
-      }
-      /**
-       * <pre>
-       * Maximum number of runs desired. If unspecified, defaults to 1000.
-       * All servers are guaranteed to support a `max_results` threshold of at least 50,000
-       * but may support more. Callers of this endpoint are encouraged to pass max_results
-       * explicitly and leverage page_token to iterate through experiments.
-       * </pre>
-       *
-       * <code>optional int32 max_results = 5 [default = 1000];</code>
-       * @param value The maxResults to set.
-       * @return This builder for chaining.
-       */
-      public Builder setMaxResults(int value) {
-        bitField0_ |= 0x00000008;
-        maxResults_ = value;
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * Maximum number of runs desired. If unspecified, defaults to 1000.
-       * All servers are guaranteed to support a `max_results` threshold of at least 50,000
-       * but may support more. Callers of this endpoint are encouraged to pass max_results
-       * explicitly and leverage page_token to iterate through experiments.
-       * </pre>
-       *
-       * <code>optional int32 max_results = 5 [default = 1000];</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearMaxResults() {
-        bitField0_ = (bitField0_ & ~0x00000008);
-        maxResults_ = 1000;
-        onChanged();
-        return this;
-      }
-
-      private com.google.protobuf.LazyStringList orderBy_ = com.google.protobuf.LazyStringArrayList.EMPTY;
-      private void ensureOrderByIsMutable() {
-        if (!((bitField0_ & 0x00000010) != 0)) {
-          orderBy_ = new com.google.protobuf.LazyStringArrayList(orderBy_);
-          bitField0_ |= 0x00000010;
-         }
-      }
-      /**
-       * <pre>
-       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-       * (and this is the default ordering criterion if order_by is not provided).
-       * </pre>
-       *
-       * <code>repeated string order_by = 6;</code>
-       * @return A list containing the orderBy.
-       */
-      public com.google.protobuf.ProtocolStringList
-          getOrderByList() {
-        return orderBy_.getUnmodifiableView();
-      }
-      /**
-       * <pre>
-       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-       * (and this is the default ordering criterion if order_by is not provided).
-       * </pre>
-       *
-       * <code>repeated string order_by = 6;</code>
-       * @return The count of orderBy.
-       */
-      public int getOrderByCount() {
-        return orderBy_.size();
-      }
-      /**
-       * <pre>
-       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-       * (and this is the default ordering criterion if order_by is not provided).
-       * </pre>
-       *
-       * <code>repeated string order_by = 6;</code>
-       * @param index The index of the element to return.
-       * @return The orderBy at the given index.
-       */
-      public java.lang.String getOrderBy(int index) {
-        return orderBy_.get(index);
-      }
-      /**
-       * <pre>
-       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-       * (and this is the default ordering criterion if order_by is not provided).
-       * </pre>
-       *
-       * <code>repeated string order_by = 6;</code>
-       * @param index The index of the value to return.
-       * @return The bytes of the orderBy at the given index.
-       */
-      public com.google.protobuf.ByteString
-          getOrderByBytes(int index) {
-        return orderBy_.getByteString(index);
-      }
-      /**
-       * <pre>
-       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-       * (and this is the default ordering criterion if order_by is not provided).
-       * </pre>
-       *
-       * <code>repeated string order_by = 6;</code>
-       * @param index The index to set the value at.
-       * @param value The orderBy to set.
-       * @return This builder for chaining.
-       */
-      public Builder setOrderBy(
-          int index, java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  ensureOrderByIsMutable();
-        orderBy_.set(index, value);
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-       * (and this is the default ordering criterion if order_by is not provided).
-       * </pre>
-       *
-       * <code>repeated string order_by = 6;</code>
-       * @param value The orderBy to add.
-       * @return This builder for chaining.
-       */
-      public Builder addOrderBy(
-          java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  ensureOrderByIsMutable();
-        orderBy_.add(value);
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-       * (and this is the default ordering criterion if order_by is not provided).
-       * </pre>
-       *
-       * <code>repeated string order_by = 6;</code>
-       * @param values The orderBy to add.
-       * @return This builder for chaining.
-       */
-      public Builder addAllOrderBy(
-          java.lang.Iterable<java.lang.String> values) {
-        ensureOrderByIsMutable();
-        com.google.protobuf.AbstractMessageLite.Builder.addAll(
-            values, orderBy_);
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-       * (and this is the default ordering criterion if order_by is not provided).
-       * </pre>
-       *
-       * <code>repeated string order_by = 6;</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearOrderBy() {
-        orderBy_ = com.google.protobuf.LazyStringArrayList.EMPTY;
-        bitField0_ = (bitField0_ & ~0x00000010);
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-       * (and this is the default ordering criterion if order_by is not provided).
-       * </pre>
-       *
-       * <code>repeated string order_by = 6;</code>
-       * @param value The bytes of the orderBy to add.
-       * @return This builder for chaining.
-       */
-      public Builder addOrderByBytes(
-          com.google.protobuf.ByteString value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  ensureOrderByIsMutable();
-        orderBy_.add(value);
-        onChanged();
-        return this;
-      }
-
-      private java.lang.Object pageToken_ = "";
-      /**
-       * <code>optional string page_token = 7;</code>
-       * @return Whether the pageToken field is set.
-       */
-      public boolean hasPageToken() {
-        return ((bitField0_ & 0x00000020) != 0);
-      }
-      /**
-       * <code>optional string page_token = 7;</code>
-       * @return The pageToken.
-       */
-      public java.lang.String getPageToken() {
-        java.lang.Object ref = pageToken_;
-        if (!(ref instanceof java.lang.String)) {
-          com.google.protobuf.ByteString bs =
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            pageToken_ = s;
-          }
-          return s;
-        } else {
-          return (java.lang.String) ref;
-        }
-      }
-      /**
-       * <code>optional string page_token = 7;</code>
-       * @return The bytes for pageToken.
-       */
-      public com.google.protobuf.ByteString
-          getPageTokenBytes() {
-        java.lang.Object ref = pageToken_;
-        if (ref instanceof String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          pageToken_ = b;
-          return b;
-        } else {
-          return (com.google.protobuf.ByteString) ref;
-        }
-      }
-      /**
-       * <code>optional string page_token = 7;</code>
-       * @param value The pageToken to set.
-       * @return This builder for chaining.
-       */
-      public Builder setPageToken(
-          java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000020;
-        pageToken_ = value;
-        onChanged();
-        return this;
-      }
-      /**
-       * <code>optional string page_token = 7;</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearPageToken() {
-        bitField0_ = (bitField0_ & ~0x00000020);
-        pageToken_ = getDefaultInstance().getPageToken();
-        onChanged();
-        return this;
-      }
-      /**
-       * <code>optional string page_token = 7;</code>
-       * @param value The bytes for pageToken to set.
-       * @return This builder for chaining.
-       */
-      public Builder setPageTokenBytes(
-          com.google.protobuf.ByteString value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000020;
-        pageToken_ = value;
-        onChanged();
-        return this;
-      }
-      @java.lang.Override
-      public final Builder setUnknownFields(
-          final com.google.protobuf.UnknownFieldSet unknownFields) {
-        return super.setUnknownFields(unknownFields);
-      }
-
-      @java.lang.Override
-      public final Builder mergeUnknownFields(
-          final com.google.protobuf.UnknownFieldSet unknownFields) {
-        return super.mergeUnknownFields(unknownFields);
-      }
-
-
-      // @@protoc_insertion_point(builder_scope:mlflow.SearchRuns)
-    }
-
-    // @@protoc_insertion_point(class_scope:mlflow.SearchRuns)
-    private static final org.mlflow.api.proto.Service.SearchRuns DEFAULT_INSTANCE;
-    static {
-      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.SearchRuns();
-    }
-
-    public static org.mlflow.api.proto.Service.SearchRuns getDefaultInstance() {
-      return DEFAULT_INSTANCE;
-    }
-
-    @java.lang.Deprecated public static final com.google.protobuf.Parser<SearchRuns>
-        PARSER = new com.google.protobuf.AbstractParser<SearchRuns>() {
-      @java.lang.Override
-      public SearchRuns parsePartialFrom(
-          com.google.protobuf.CodedInputStream input,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return new SearchRuns(input, extensionRegistry);
-      }
-    };
-
-    public static com.google.protobuf.Parser<SearchRuns> parser() {
-      return PARSER;
-    }
-
-    @java.lang.Override
-    public com.google.protobuf.Parser<SearchRuns> getParserForType() {
-      return PARSER;
-    }
-
-    @java.lang.Override
-    public org.mlflow.api.proto.Service.SearchRuns getDefaultInstanceForType() {
-      return DEFAULT_INSTANCE;
-    }
-
-  }
-
-  public interface ListArtifactsOrBuilder extends
-      // @@protoc_insertion_point(interface_extends:mlflow.ListArtifacts)
-      com.google.protobuf.MessageOrBuilder {
-
-    /**
-     * <pre>
-     * ID of the run whose artifacts to list. Must be provided.
-     * </pre>
-     *
-     * <code>optional string run_id = 3;</code>
-     * @return Whether the runId field is set.
-     */
-    boolean hasRunId();
-    /**
-     * <pre>
-     * ID of the run whose artifacts to list. Must be provided.
-     * </pre>
-     *
-     * <code>optional string run_id = 3;</code>
-     * @return The runId.
-     */
-    java.lang.String getRunId();
-    /**
-     * <pre>
-     * ID of the run whose artifacts to list. Must be provided.
-     * </pre>
-     *
-     * <code>optional string run_id = 3;</code>
-     * @return The bytes for runId.
-     */
-    com.google.protobuf.ByteString
-        getRunIdBytes();
-
+    public static final int INCLUDE_METRICS_FIELD_NUMBER = 8;
+    private org.mlflow.api.proto.Service.SearchRuns.KeyList includeMetrics_;
     /**
      * <pre>
-     * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
-     * be removed in a future MLflow version.
+     * If set, only the latest metrics with these keys are returned with each run. By default, all
+     * the latest metrics of the runs are returned.
      * </pre>
      *
-     * <code>optional string run_uuid = 1;</code>
-     * @return Whether the runUuid field is set.
+     * <code>optional .mlflow.SearchRuns.KeyList include_metrics = 8;</code>
+     * @return Whether the includeMetrics field is set.
      */
-    boolean hasRunUuid();
+    @java.lang.Override
+    public boolean hasIncludeMetrics() {
+      return ((bitField0_ & 0x00000010) != 0);
+    }
     /**
      * <pre>
-     * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
-     * be removed in a future MLflow version.
+     * If set, only the latest metrics with these keys are returned with each run. By default, all
+     * the latest metrics of the runs are returned.
      * </pre>
      *
-     * <code>optional string run_uuid = 1;</code>
-     * @return The runUuid.
+     * <code>optional .mlflow.SearchRuns.KeyList include_metrics = 8;</code>
+     * @return The includeMetrics.
      */
-    java.lang.String getRunUuid();
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.SearchRuns.KeyList getIncludeMetrics() {
+      return includeMetrics_ == null ? org.mlflow.api.proto.Service.SearchRuns.KeyList.getDefaultInstance() : includeMetrics_;
+    }
     /**
      * <pre>
-     * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
-     * be removed in a future MLflow version.
+     * If set, only the latest metrics with these keys are returned with each run. By default, all
+     * the latest metrics of the runs are returned.
      * </pre>
      *
-     * <code>optional string run_uuid = 1;</code>
-     * @return The bytes for runUuid.
+     * <code>optional .mlflow.SearchRuns.KeyList include_metrics = 8;</code>
      */
-    com.google.protobuf.ByteString
-        getRunUuidBytes();
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.SearchRuns.KeyListOrBuilder getIncludeMetricsOrBuilder() {
+      return includeMetrics_ == null ? org.mlflow.api.proto.Service.SearchRuns.KeyList.getDefaultInstance() : includeMetrics_;
+    }
 
+    public static final int INCLUDE_PARAMS_FIELD_NUMBER = 9;
+    private org.mlflow.api.proto.Service.SearchRuns.KeyList includeParams_;
     /**
      * <pre>
-     * Filter artifacts matching this path (a relative path from the root artifact directory).
+     * If set, only the params with these keys are returned with each run. By default, all the
+     * params of the runs are returned.
      * </pre>
      *
-     * <code>optional string path = 2;</code>
-     * @return Whether the path field is set.
+     * <code>optional .mlflow.SearchRuns.KeyList include_params = 9;</code>
+     * @return Whether the includeParams field is set.
      */
-    boolean hasPath();
+    @java.lang.Override
+    public boolean hasIncludeParams() {
+      return ((bitField0_ & 0x00000020) != 0);
+    }
     /**
      * <pre>
-     * Filter artifacts matching this path (a relative path from the root artifact directory).
+     * If set, only the params with these keys are returned with each run. By default, all the
+     * params of the runs are returned.
      * </pre>
      *
-     * <code>optional string path = 2;</code>
-     * @return The path.
+     * <code>optional .mlflow.SearchRuns.KeyList include_params = 9;</code>
+     * @return The includeParams.
      */
-    java.lang.String getPath();
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.SearchRuns.KeyList getIncludeParams() {
+      return includeParams_ == null ? org.mlflow.api.proto.Service.SearchRuns.KeyList.getDefaultInstance() : includeParams_;
+    }
     /**
      * <pre>
-     * Filter artifacts matching this path (a relative path from the root artifact directory).
+     * If set, only the params with these keys are returned with each run. By default, all the
+     * params of the runs are returned.
      * </pre>
      *
-     * <code>optional string path = 2;</code>
-     * @return The bytes for path.
+     * <code>optional .mlflow.SearchRuns.KeyList include_params = 9;</code>
      */
-    com.google.protobuf.ByteString
-        getPathBytes();
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.SearchRuns.KeyListOrBuilder getIncludeParamsOrBuilder() {
+      return includeParams_ == null ? org.mlflow.api.proto.Service.SearchRuns.KeyList.getDefaultInstance() : includeParams_;
+    }
 
+    public static final int INCLUDE_INPUTS_FIELD_NUMBER = 10;
+    private boolean includeInputs_;
     /**
      * <pre>
-     * Token indicating the page of artifact results to fetch
-     * </pre>
-     *
-     * <code>optional string page_token = 4;</code>
-     * @return Whether the pageToken field is set.
-     */
-    boolean hasPageToken();
-    /**
-     * <pre>
-     * Token indicating the page of artifact results to fetch
+     * Whether to return the dataset inputs of the runs. Defaults to true.
      * </pre>
      *
-     * <code>optional string page_token = 4;</code>
-     * @return The pageToken.
+     * <code>optional bool include_inputs = 10 [default = true];</code>
+     * @return Whether the includeInputs field is set.
      */
-    java.lang.String getPageToken();
+    @java.lang.Override
+    public boolean hasIncludeInputs() {
+      return ((bitField0_ & 0x00000040) != 0);
+    }
     /**
      * <pre>
-     * Token indicating the page of artifact results to fetch
+     * Whether to return the dataset inputs of the runs. Defaults to true.
      * </pre>
      *
-     * <code>optional string page_token = 4;</code>
-     * @return The bytes for pageToken.
+     * <code>optional bool include_inputs = 10 [default = true];</code>
+     * @return The includeInputs.
      */
-    com.google.protobuf.ByteString
-        getPageTokenBytes();
-  }
-  /**
-   * Protobuf type {@code mlflow.ListArtifacts}
-   */
-  public static final class ListArtifacts extends
-      com.google.protobuf.GeneratedMessageV3 implements
-      // @@protoc_insertion_point(message_implements:mlflow.ListArtifacts)
-      ListArtifactsOrBuilder {
-  private static final long serialVersionUID = 0L;
-    // Use ListArtifacts.newBuilder() to construct.
-    private ListArtifacts(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
-      super(builder);
-    }
-    private ListArtifacts() {
-      runId_ = "";
-      runUuid_ = "";
-      path_ = "";
-      pageToken_ = "";
+    @java.lang.Override
+    public boolean getIncludeInputs() {
+      return includeInputs_;
     }
 
+    private byte memoizedIsInitialized = -1;
     @java.lang.Override
-    @SuppressWarnings({"unused"})
-    protected java.lang.Object newInstance(
-        UnusedPrivateParameter unused) {
-      return new ListArtifacts();
+    public final boolean isInitialized() {
+      byte isInitialized = memoizedIsInitialized;
+      if (isInitialized == 1) return true;
+      if (isInitialized == 0) return false;
+
+      memoizedIsInitialized = 1;
+      return true;
     }
 
     @java.lang.Override
-    public final com.google.protobuf.UnknownFieldSet
-    getUnknownFields() {
-      return this.unknownFields;
-    }
-    private ListArtifacts(
-        com.google.protobuf.CodedInputStream input,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      this();
-      if (extensionRegistry == null) {
-        throw new java.lang.NullPointerException();
+    public void writeTo(com.google.protobuf.CodedOutputStream output)
+                        throws java.io.IOException {
+      for (int i = 0; i < experimentIds_.size(); i++) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 1, experimentIds_.getRaw(i));
       }
-      int mutable_bitField0_ = 0;
-      com.google.protobuf.UnknownFieldSet.Builder unknownFields =
-          com.google.protobuf.UnknownFieldSet.newBuilder();
-      try {
-        boolean done = false;
-        while (!done) {
-          int tag = input.readTag();
-          switch (tag) {
-            case 0:
-              done = true;
-              break;
-            case 10: {
-              com.google.protobuf.ByteString bs = input.readBytes();
-              bitField0_ |= 0x00000002;
-              runUuid_ = bs;
-              break;
-            }
-            case 18: {
-              com.google.protobuf.ByteString bs = input.readBytes();
-              bitField0_ |= 0x00000004;
-              path_ = bs;
-              break;
-            }
-            case 26: {
-              com.google.protobuf.ByteString bs = input.readBytes();
-              bitField0_ |= 0x00000001;
-              runId_ = bs;
-              break;
-            }
-            case 34: {
-              com.google.protobuf.ByteString bs = input.readBytes();
-              bitField0_ |= 0x00000008;
-              pageToken_ = bs;
-              break;
-            }
-            default: {
-              if (!parseUnknownField(
-                  input, unknownFields, extensionRegistry, tag)) {
-                done = true;
-              }
-              break;
-            }
-          }
-        }
-      } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-        throw e.setUnfinishedMessage(this);
-      } catch (java.io.IOException e) {
-        throw new com.google.protobuf.InvalidProtocolBufferException(
-            e).setUnfinishedMessage(this);
-      } finally {
-        this.unknownFields = unknownFields.build();
-        makeExtensionsImmutable();
+      if (((bitField0_ & 0x00000002) != 0)) {
+        output.writeEnum(3, runViewType_);
       }
-    }
-    public static final com.google.protobuf.Descriptors.Descriptor
-        getDescriptor() {
-      return org.mlflow.api.proto.Service.internal_static_mlflow_ListArtifacts_descriptor;
+      if (((bitField0_ & 0x00000001) != 0)) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 4, filter_);
+      }
+      if (((bitField0_ & 0x00000004) != 0)) {
+        output.writeInt32(5, maxResults_);
+      }
+      for (int i = 0; i < orderBy_.size(); i++) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 6, orderBy_.getRaw(i));
+      }
+      if (((bitField0_ & 0x00000008) != 0)) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 7, pageToken_);
+      }
+      if (((bitField0_ & 0x00000010) != 0)) {
+        output.writeMessage(8, getIncludeMetrics());
+      }
+      if (((bitField0_ & 0x00000020) != 0)) {
+        output.writeMessage(9, getIncludeParams());
+      }
+      if (((bitField0_ & 0x00000040) != 0)) {
+        output.writeBool(10, includeInputs_);
+      }
+      unknownFields.writeTo(output);
     }
 
     @java.lang.Override
-    protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
-        internalGetFieldAccessorTable() {
-      return org.mlflow.api.proto.Service.internal_static_mlflow_ListArtifacts_fieldAccessorTable
-          .ensureFieldAccessorsInitialized(
-              org.mlflow.api.proto.Service.ListArtifacts.class, org.mlflow.api.proto.Service.ListArtifacts.Builder.class);
-    }
-
-    public interface ResponseOrBuilder extends
-        // @@protoc_insertion_point(interface_extends:mlflow.ListArtifacts.Response)
-        com.google.protobuf.MessageOrBuilder {
-
-      /**
-       * <pre>
-       * Root artifact directory for the run.
-       * </pre>
-       *
-       * <code>optional string root_uri = 1;</code>
-       * @return Whether the rootUri field is set.
-       */
-      boolean hasRootUri();
-      /**
-       * <pre>
-       * Root artifact directory for the run.
-       * </pre>
-       *
-       * <code>optional string root_uri = 1;</code>
-       * @return The rootUri.
-       */
-      java.lang.String getRootUri();
-      /**
-       * <pre>
-       * Root artifact directory for the run.
-       * </pre>
-       *
-       * <code>optional string root_uri = 1;</code>
-       * @return The bytes for rootUri.
-       */
-      com.google.protobuf.ByteString
-          getRootUriBytes();
-
-      /**
-       * <pre>
-       * File location and metadata for artifacts.
-       * </pre>
-       *
-       * <code>repeated .mlflow.FileInfo files = 2;</code>
-       */
-      java.util.List<org.mlflow.api.proto.Service.FileInfo> 
-          getFilesList();
-      /**
-       * <pre>
-       * File location and metadata for artifacts.
-       * </pre>
-       *
-       * <code>repeated .mlflow.FileInfo files = 2;</code>
-       */
-      org.mlflow.api.proto.Service.FileInfo getFiles(int index);
-      /**
-       * <pre>
-       * File location and metadata for artifacts.
-       * </pre>
-       *
-       * <code>repeated .mlflow.FileInfo files = 2;</code>
-       */
-      int getFilesCount();
-      /**
-       * <pre>
-       * File location and metadata for artifacts.
-       * </pre>
-       *
-       * <code>repeated .mlflow.FileInfo files = 2;</code>
-       */
-      java.util.List<? extends org.mlflow.api.proto.Service.FileInfoOrBuilder> 
-          getFilesOrBuilderList();
-      /**
-       * <pre>
-       * File location and metadata for artifacts.
-       * </pre>
-       *
-       * <code>repeated .mlflow.FileInfo files = 2;</code>
-       */
-      org.mlflow.api.proto.Service.FileInfoOrBuilder getFilesOrBuilder(
-          int index);
+    public int getSerializedSize() {
+      int size = memoizedSize;
+      if (size != -1) return size;
 
-      /**
-       * <pre>
-       * Token that can be used to retrieve the next page of artifact results
-       * </pre>
-       *
-       * <code>optional string next_page_token = 3;</code>
-       * @return Whether the nextPageToken field is set.
-       */
-      boolean hasNextPageToken();
-      /**
-       * <pre>
-       * Token that can be used to retrieve the next page of artifact results
-       * </pre>
-       *
-       * <code>optional string next_page_token = 3;</code>
-       * @return The nextPageToken.
-       */
-      java.lang.String getNextPageToken();
-      /**
-       * <pre>
-       * Token that can be used to retrieve the next page of artifact results
-       * </pre>
-       *
-       * <code>optional string next_page_token = 3;</code>
-       * @return The bytes for nextPageToken.
-       */
-      com.google.protobuf.ByteString
-          getNextPageTokenBytes();
-    }
-    /**
-     * Protobuf type {@code mlflow.ListArtifacts.Response}
-     */
-    public static final class Response extends
-        com.google.protobuf.GeneratedMessageV3 implements
-        // @@protoc_insertion_point(message_implements:mlflow.ListArtifacts.Response)
-        ResponseOrBuilder {
-    private static final long serialVersionUID = 0L;
-      // Use Response.newBuilder() to construct.
-      private Response(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
-        super(builder);
+      size = 0;
+      {
+        int dataSize = 0;
+        for (int i = 0; i < experimentIds_.size(); i++) {
+          dataSize += computeStringSizeNoTag(experimentIds_.getRaw(i));
+        }
+        size += dataSize;
+        size += 1 * getExperimentIdsList().size();
       }
-      private Response() {
-        rootUri_ = "";
-        files_ = java.util.Collections.emptyList();
-        nextPageToken_ = "";
+      if (((bitField0_ & 0x00000002) != 0)) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeEnumSize(3, runViewType_);
       }
-
-      @java.lang.Override
-      @SuppressWarnings({"unused"})
-      protected java.lang.Object newInstance(
-          UnusedPrivateParameter unused) {
-        return new Response();
+      if (((bitField0_ & 0x00000001) != 0)) {
+        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(4, filter_);
       }
-
-      @java.lang.Override
-      public final com.google.protobuf.UnknownFieldSet
-      getUnknownFields() {
-        return this.unknownFields;
+      if (((bitField0_ & 0x00000004) != 0)) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeInt32Size(5, maxResults_);
       }
-      private Response(
-          com.google.protobuf.CodedInputStream input,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        this();
-        if (extensionRegistry == null) {
-          throw new java.lang.NullPointerException();
-        }
-        int mutable_bitField0_ = 0;
-        com.google.protobuf.UnknownFieldSet.Builder unknownFields =
-            com.google.protobuf.UnknownFieldSet.newBuilder();
-        try {
-          boolean done = false;
-          while (!done) {
-            int tag = input.readTag();
-            switch (tag) {
-              case 0:
-                done = true;
-                break;
-              case 10: {
-                com.google.protobuf.ByteString bs = input.readBytes();
-                bitField0_ |= 0x00000001;
-                rootUri_ = bs;
-                break;
-              }
-              case 18: {
-                if (!((mutable_bitField0_ & 0x00000002) != 0)) {
-                  files_ = new java.util.ArrayList<org.mlflow.api.proto.Service.FileInfo>();
-                  mutable_bitField0_ |= 0x00000002;
-                }
-                files_.add(
-                    input.readMessage(org.mlflow.api.proto.Service.FileInfo.PARSER, extensionRegistry));
-                break;
-              }
-              case 26: {
-                com.google.protobuf.ByteString bs = input.readBytes();
-                bitField0_ |= 0x00000002;
-                nextPageToken_ = bs;
-                break;
-              }
-              default: {
-                if (!parseUnknownField(
-                    input, unknownFields, extensionRegistry, tag)) {
-                  done = true;
-                }
-                break;
-              }
-            }
-          }
-        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-          throw e.setUnfinishedMessage(this);
-        } catch (java.io.IOException e) {
-          throw new com.google.protobuf.InvalidProtocolBufferException(
-              e).setUnfinishedMessage(this);
-        } finally {
-          if (((mutable_bitField0_ & 0x00000002) != 0)) {
-            files_ = java.util.Collections.unmodifiableList(files_);
-          }
-          this.unknownFields = unknownFields.build();
-          makeExtensionsImmutable();
+      {
+        int dataSize = 0;
+        for (int i = 0; i < orderBy_.size(); i++) {
+          dataSize += computeStringSizeNoTag(orderBy_.getRaw(i));
         }
+        size += dataSize;
+        size += 1 * getOrderByList().size();
       }
-      public static final com.google.protobuf.Descriptors.Descriptor
-          getDescriptor() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_ListArtifacts_Response_descriptor;
+      if (((bitField0_ & 0x00000008) != 0)) {
+        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(7, pageToken_);
+      }
+      if (((bitField0_ & 0x00000010) != 0)) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeMessageSize(8, getIncludeMetrics());
+      }
+      if (((bitField0_ & 0x00000020) != 0)) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeMessageSize(9, getIncludeParams());
+      }
+      if (((bitField0_ & 0x00000040) != 0)) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeBoolSize(10, includeInputs_);
       }
+      size += unknownFields.getSerializedSize();
+      memoizedSize = size;
+      return size;
+    }
 
-      @java.lang.Override
-      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
-          internalGetFieldAccessorTable() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_ListArtifacts_Response_fieldAccessorTable
-            .ensureFieldAccessorsInitialized(
-                org.mlflow.api.proto.Service.ListArtifacts.Response.class, org.mlflow.api.proto.Service.ListArtifacts.Response.Builder.class);
+    @java.lang.Override
+    public boolean equals(final java.lang.Object obj) {
+      if (obj == this) {
+       return true;
+      }
+      if (!(obj instanceof org.mlflow.api.proto.Service.SearchRuns)) {
+        return super.equals(obj);
       }
+      org.mlflow.api.proto.Service.SearchRuns other = (org.mlflow.api.proto.Service.SearchRuns) obj;
 
-      private int bitField0_;
-      public static final int ROOT_URI_FIELD_NUMBER = 1;
-      private volatile java.lang.Object rootUri_;
-      /**
-       * <pre>
-       * Root artifact directory for the run.
-       * </pre>
-       *
-       * <code>optional string root_uri = 1;</code>
-       * @return Whether the rootUri field is set.
-       */
-      @java.lang.Override
-      public boolean hasRootUri() {
-        return ((bitField0_ & 0x00000001) != 0);
+      if (!getExperimentIdsList()
+          .equals(other.getExperimentIdsList())) return false;
+      if (hasFilter() != other.hasFilter()) return false;
+      if (hasFilter()) {
+        if (!getFilter()
+            .equals(other.getFilter())) return false;
       }
-      /**
-       * <pre>
-       * Root artifact directory for the run.
-       * </pre>
-       *
-       * <code>optional string root_uri = 1;</code>
-       * @return The rootUri.
-       */
-      @java.lang.Override
-      public java.lang.String getRootUri() {
-        java.lang.Object ref = rootUri_;
-        if (ref instanceof java.lang.String) {
-          return (java.lang.String) ref;
-        } else {
-          com.google.protobuf.ByteString bs = 
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            rootUri_ = s;
-          }
-          return s;
-        }
+      if (hasRunViewType() != other.hasRunViewType()) return false;
+      if (hasRunViewType()) {
+        if (runViewType_ != other.runViewType_) return false;
       }
-      /**
-       * <pre>
-       * Root artifact directory for the run.
-       * </pre>
-       *
-       * <code>optional string root_uri = 1;</code>
-       * @return The bytes for rootUri.
-       */
-      @java.lang.Override
-      public com.google.protobuf.ByteString
-          getRootUriBytes() {
-        java.lang.Object ref = rootUri_;
-        if (ref instanceof java.lang.String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          rootUri_ = b;
-          return b;
-        } else {
-          return (com.google.protobuf.ByteString) ref;
-        }
+      if (hasMaxResults() != other.hasMaxResults()) return false;
+      if (hasMaxResults()) {
+        if (getMaxResults()
+            != other.getMaxResults()) return false;
+      }
+      if (!getOrderByList()
+          .equals(other.getOrderByList())) return false;
+      if (hasPageToken() != other.hasPageToken()) return false;
+      if (hasPageToken()) {
+        if (!getPageToken()
+            .equals(other.getPageToken())) return false;
+      }
+      if (hasIncludeMetrics() != other.hasIncludeMetrics()) return false;
+      if (hasIncludeMetrics()) {
+        if (!getIncludeMetrics()
+            .equals(other.getIncludeMetrics())) return false;
       }
+      if (hasIncludeParams() != other.hasIncludeParams()) return false;
+      if (hasIncludeParams()) {
+        if (!getIncludeParams()
+            .equals(other.getIncludeParams())) return false;
+      }
+      if (hasIncludeInputs() != other.hasIncludeInputs()) return false;
+      if (hasIncludeInputs()) {
+        if (getIncludeInputs()
+            != other.getIncludeInputs()) return false;
+      }
+      if (!unknownFields.equals(other.unknownFields)) return false;
+      return true;
+    }
 
-      public static final int FILES_FIELD_NUMBER = 2;
-      private java.util.List<org.mlflow.api.proto.Service.FileInfo> files_;
-      /**
-       * <pre>
-       * File location and metadata for artifacts.
-       * </pre>
-       *
-       * <code>repeated .mlflow.FileInfo files = 2;</code>
-       */
-      @java.lang.Override
-      public java.util.List<org.mlflow.api.proto.Service.FileInfo> getFilesList() {
-        return files_;
+    @java.lang.Override
+    public int hashCode() {
+      if (memoizedHashCode != 0) {
+        return memoizedHashCode;
       }
-      /**
-       * <pre>
-       * File location and metadata for artifacts.
-       * </pre>
-       *
-       * <code>repeated .mlflow.FileInfo files = 2;</code>
-       */
-      @java.lang.Override
-      public java.util.List<? extends org.mlflow.api.proto.Service.FileInfoOrBuilder> 
-          getFilesOrBuilderList() {
-        return files_;
+      int hash = 41;
+      hash = (19 * hash) + getDescriptor().hashCode();
+      if (getExperimentIdsCount() > 0) {
+        hash = (37 * hash) + EXPERIMENT_IDS_FIELD_NUMBER;
+        hash = (53 * hash) + getExperimentIdsList().hashCode();
       }
-      /**
-       * <pre>
-       * File location and metadata for artifacts.
-       * </pre>
-       *
-       * <code>repeated .mlflow.FileInfo files = 2;</code>
-       */
-      @java.lang.Override
-      public int getFilesCount() {
-        return files_.size();
+      if (hasFilter()) {
+        hash = (37 * hash) + FILTER_FIELD_NUMBER;
+        hash = (53 * hash) + getFilter().hashCode();
       }
-      /**
-       * <pre>
-       * File location and metadata for artifacts.
-       * </pre>
-       *
-       * <code>repeated .mlflow.FileInfo files = 2;</code>
-       */
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.FileInfo getFiles(int index) {
-        return files_.get(index);
+      if (hasRunViewType()) {
+        hash = (37 * hash) + RUN_VIEW_TYPE_FIELD_NUMBER;
+        hash = (53 * hash) + runViewType_;
       }
-      /**
-       * <pre>
-       * File location and metadata for artifacts.
-       * </pre>
-       *
-       * <code>repeated .mlflow.FileInfo files = 2;</code>
-       */
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.FileInfoOrBuilder getFilesOrBuilder(
-          int index) {
-        return files_.get(index);
+      if (hasMaxResults()) {
+        hash = (37 * hash) + MAX_RESULTS_FIELD_NUMBER;
+        hash = (53 * hash) + getMaxResults();
       }
-
-      public static final int NEXT_PAGE_TOKEN_FIELD_NUMBER = 3;
-      private volatile java.lang.Object nextPageToken_;
-      /**
-       * <pre>
-       * Token that can be used to retrieve the next page of artifact results
-       * </pre>
-       *
-       * <code>optional string next_page_token = 3;</code>
-       * @return Whether the nextPageToken field is set.
-       */
-      @java.lang.Override
-      public boolean hasNextPageToken() {
-        return ((bitField0_ & 0x00000002) != 0);
+      if (getOrderByCount() > 0) {
+        hash = (37 * hash) + ORDER_BY_FIELD_NUMBER;
+        hash = (53 * hash) + getOrderByList().hashCode();
       }
-      /**
-       * <pre>
-       * Token that can be used to retrieve the next page of artifact results
-       * </pre>
-       *
-       * <code>optional string next_page_token = 3;</code>
-       * @return The nextPageToken.
-       */
+      if (hasPageToken()) {
+        hash = (37 * hash) + PAGE_TOKEN_FIELD_NUMBER;
+        hash = (53 * hash) + getPageToken().hashCode();
+      }
+      if (hasIncludeMetrics()) {
+        hash = (37 * hash) + INCLUDE_METRICS_FIELD_NUMBER;
+        hash = (53 * hash) + getIncludeMetrics().hashCode();
+      }
+      if (hasIncludeParams()) {
+        hash = (37 * hash) + INCLUDE_PARAMS_FIELD_NUMBER;
+        hash = (53 * hash) + getIncludeParams().hashCode();
+      }
+      if (hasIncludeInputs()) {
+        hash = (37 * hash) + INCLUDE_INPUTS_FIELD_NUMBER;
+        hash = (53 * hash) + com.google.protobuf.Internal.hashBoolean(
+            getIncludeInputs());
+      }
+      hash = (29 * hash) + unknownFields.hashCode();
+      memoizedHashCode = hash;
+      return hash;
+    }
+
+    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
+        java.nio.ByteBuffer data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
+        java.nio.ByteBuffer data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
+        com.google.protobuf.ByteString data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
+        com.google.protobuf.ByteString data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(byte[] data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
+        byte[] data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseDelimitedFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseDelimitedFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
+        com.google.protobuf.CodedInputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+
+    @java.lang.Override
+    public Builder newBuilderForType() { return newBuilder(); }
+    public static Builder newBuilder() {
+      return DEFAULT_INSTANCE.toBuilder();
+    }
+    public static Builder newBuilder(org.mlflow.api.proto.Service.SearchRuns prototype) {
+      return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+    }
+    @java.lang.Override
+    public Builder toBuilder() {
+      return this == DEFAULT_INSTANCE
+          ? new Builder() : new Builder().mergeFrom(this);
+    }
+
+    @java.lang.Override
+    protected Builder newBuilderForType(
+        com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+      Builder builder = new Builder(parent);
+      return builder;
+    }
+    /**
+     * Protobuf type {@code mlflow.SearchRuns}
+     */
+    public static final class Builder extends
+        com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+        // @@protoc_insertion_point(builder_implements:mlflow.SearchRuns)
+        org.mlflow.api.proto.Service.SearchRunsOrBuilder {
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_descriptor;
+      }
+
       @java.lang.Override
-      public java.lang.String getNextPageToken() {
-        java.lang.Object ref = nextPageToken_;
-        if (ref instanceof java.lang.String) {
-          return (java.lang.String) ref;
-        } else {
-          com.google.protobuf.ByteString bs = 
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            nextPageToken_ = s;
-          }
-          return s;
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.SearchRuns.class, org.mlflow.api.proto.Service.SearchRuns.Builder.class);
+      }
+
+      // Construct using org.mlflow.api.proto.Service.SearchRuns.newBuilder()
+      private Builder() {
+        maybeForceBuilderInitialization();
+      }
+
+      private Builder(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        super(parent);
+        maybeForceBuilderInitialization();
+      }
+      private void maybeForceBuilderInitialization() {
+        if (com.google.protobuf.GeneratedMessageV3
+                .alwaysUseFieldBuilders) {
+          getIncludeMetricsFieldBuilder();
+          getIncludeParamsFieldBuilder();
         }
       }
-      /**
-       * <pre>
-       * Token that can be used to retrieve the next page of artifact results
-       * </pre>
-       *
-       * <code>optional string next_page_token = 3;</code>
-       * @return The bytes for nextPageToken.
-       */
       @java.lang.Override
-      public com.google.protobuf.ByteString
-          getNextPageTokenBytes() {
-        java.lang.Object ref = nextPageToken_;
-        if (ref instanceof java.lang.String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          nextPageToken_ = b;
-          return b;
+      public Builder clear() {
+        super.clear();
+        experimentIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+        bitField0_ = (bitField0_ & ~0x00000001);
+        filter_ = "";
+        bitField0_ = (bitField0_ & ~0x00000002);
+        runViewType_ = 1;
+        bitField0_ = (bitField0_ & ~0x00000004);
+        maxResults_ = 1000;
+        bitField0_ = (bitField0_ & ~0x00000008);
+        orderBy_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+        bitField0_ = (bitField0_ & ~0x00000010);
+        pageToken_ = "";
+        bitField0_ = (bitField0_ & ~0x00000020);
+        if (includeMetricsBuilder_ == null) {
+          includeMetrics_ = null;
         } else {
-          return (com.google.protobuf.ByteString) ref;
+          includeMetricsBuilder_.clear();
+        }
+        bitField0_ = (bitField0_ & ~0x00000040);
+        if (includeParamsBuilder_ == null) {
+          includeParams_ = null;
+        } else {
+          includeParamsBuilder_.clear();
         }
+        bitField0_ = (bitField0_ & ~0x00000080);
+        includeInputs_ = true;
+        bitField0_ = (bitField0_ & ~0x00000100);
+        return this;
       }
 
-      private byte memoizedIsInitialized = -1;
       @java.lang.Override
-      public final boolean isInitialized() {
-        byte isInitialized = memoizedIsInitialized;
-        if (isInitialized == 1) return true;
-        if (isInitialized == 0) return false;
-
-        memoizedIsInitialized = 1;
-        return true;
+      public com.google.protobuf.Descriptors.Descriptor
+          getDescriptorForType() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_descriptor;
       }
 
       @java.lang.Override
-      public void writeTo(com.google.protobuf.CodedOutputStream output)
-                          throws java.io.IOException {
-        if (((bitField0_ & 0x00000001) != 0)) {
-          com.google.protobuf.GeneratedMessageV3.writeString(output, 1, rootUri_);
-        }
-        for (int i = 0; i < files_.size(); i++) {
-          output.writeMessage(2, files_.get(i));
-        }
-        if (((bitField0_ & 0x00000002) != 0)) {
-          com.google.protobuf.GeneratedMessageV3.writeString(output, 3, nextPageToken_);
-        }
-        unknownFields.writeTo(output);
+      public org.mlflow.api.proto.Service.SearchRuns getDefaultInstanceForType() {
+        return org.mlflow.api.proto.Service.SearchRuns.getDefaultInstance();
       }
 
       @java.lang.Override
-      public int getSerializedSize() {
-        int size = memoizedSize;
-        if (size != -1) return size;
-
-        size = 0;
-        if (((bitField0_ & 0x00000001) != 0)) {
-          size += com.google.protobuf.GeneratedMessageV3.computeStringSize(1, rootUri_);
-        }
-        for (int i = 0; i < files_.size(); i++) {
-          size += com.google.protobuf.CodedOutputStream
-            .computeMessageSize(2, files_.get(i));
-        }
-        if (((bitField0_ & 0x00000002) != 0)) {
-          size += com.google.protobuf.GeneratedMessageV3.computeStringSize(3, nextPageToken_);
+      public org.mlflow.api.proto.Service.SearchRuns build() {
+        org.mlflow.api.proto.Service.SearchRuns result = buildPartial();
+        if (!result.isInitialized()) {
+          throw newUninitializedMessageException(result);
         }
-        size += unknownFields.getSerializedSize();
-        memoizedSize = size;
-        return size;
+        return result;
       }
 
       @java.lang.Override
-      public boolean equals(final java.lang.Object obj) {
-        if (obj == this) {
-         return true;
+      public org.mlflow.api.proto.Service.SearchRuns buildPartial() {
+        org.mlflow.api.proto.Service.SearchRuns result = new org.mlflow.api.proto.Service.SearchRuns(this);
+        int from_bitField0_ = bitField0_;
+        int to_bitField0_ = 0;
+        if (((bitField0_ & 0x00000001) != 0)) {
+          experimentIds_ = experimentIds_.getUnmodifiableView();
+          bitField0_ = (bitField0_ & ~0x00000001);
         }
-        if (!(obj instanceof org.mlflow.api.proto.Service.ListArtifacts.Response)) {
-          return super.equals(obj);
+        result.experimentIds_ = experimentIds_;
+        if (((from_bitField0_ & 0x00000002) != 0)) {
+          to_bitField0_ |= 0x00000001;
         }
-        org.mlflow.api.proto.Service.ListArtifacts.Response other = (org.mlflow.api.proto.Service.ListArtifacts.Response) obj;
-
-        if (hasRootUri() != other.hasRootUri()) return false;
-        if (hasRootUri()) {
-          if (!getRootUri()
-              .equals(other.getRootUri())) return false;
+        result.filter_ = filter_;
+        if (((from_bitField0_ & 0x00000004) != 0)) {
+          to_bitField0_ |= 0x00000002;
         }
-        if (!getFilesList()
-            .equals(other.getFilesList())) return false;
-        if (hasNextPageToken() != other.hasNextPageToken()) return false;
-        if (hasNextPageToken()) {
-          if (!getNextPageToken()
-              .equals(other.getNextPageToken())) return false;
+        result.runViewType_ = runViewType_;
+        if (((from_bitField0_ & 0x00000008) != 0)) {
+          to_bitField0_ |= 0x00000004;
         }
-        if (!unknownFields.equals(other.unknownFields)) return false;
-        return true;
-      }
-
-      @java.lang.Override
-      public int hashCode() {
-        if (memoizedHashCode != 0) {
-          return memoizedHashCode;
+        result.maxResults_ = maxResults_;
+        if (((bitField0_ & 0x00000010) != 0)) {
+          orderBy_ = orderBy_.getUnmodifiableView();
+          bitField0_ = (bitField0_ & ~0x00000010);
         }
-        int hash = 41;
-        hash = (19 * hash) + getDescriptor().hashCode();
-        if (hasRootUri()) {
-          hash = (37 * hash) + ROOT_URI_FIELD_NUMBER;
-          hash = (53 * hash) + getRootUri().hashCode();
+        result.orderBy_ = orderBy_;
+        if (((from_bitField0_ & 0x00000020) != 0)) {
+          to_bitField0_ |= 0x00000008;
         }
-        if (getFilesCount() > 0) {
-          hash = (37 * hash) + FILES_FIELD_NUMBER;
-          hash = (53 * hash) + getFilesList().hashCode();
+        result.pageToken_ = pageToken_;
+        if (((from_bitField0_ & 0x00000040) != 0)) {
+          if (includeMetricsBuilder_ == null) {
+            result.includeMetrics_ = includeMetrics_;
+          } else {
+            result.includeMetrics_ = includeMetricsBuilder_.build();
+          }
+          to_bitField0_ |= 0x00000010;
         }
-        if (hasNextPageToken()) {
-          hash = (37 * hash) + NEXT_PAGE_TOKEN_FIELD_NUMBER;
-          hash = (53 * hash) + getNextPageToken().hashCode();
+        if (((from_bitField0_ & 0x00000080) != 0)) {
+          if (includeParamsBuilder_ == null) {
+            result.includeParams_ = includeParams_;
+          } else {
+            result.includeParams_ = includeParamsBuilder_.build();
+          }
+          to_bitField0_ |= 0x00000020;
         }
-        hash = (29 * hash) + unknownFields.hashCode();
-        memoizedHashCode = hash;
-        return hash;
+        if (((from_bitField0_ & 0x00000100) != 0)) {
+          to_bitField0_ |= 0x00000040;
+        }
+        result.includeInputs_ = includeInputs_;
+        result.bitField0_ = to_bitField0_;
+        onBuilt();
+        return result;
       }
 
-      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseFrom(
-          java.nio.ByteBuffer data)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return PARSER.parseFrom(data);
-      }
-      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseFrom(
-          java.nio.ByteBuffer data,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return PARSER.parseFrom(data, extensionRegistry);
-      }
-      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseFrom(
-          com.google.protobuf.ByteString data)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return PARSER.parseFrom(data);
-      }
-      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseFrom(
-          com.google.protobuf.ByteString data,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return PARSER.parseFrom(data, extensionRegistry);
-      }
-      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseFrom(byte[] data)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return PARSER.parseFrom(data);
-      }
-      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseFrom(
-          byte[] data,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return PARSER.parseFrom(data, extensionRegistry);
-      }
-      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseFrom(java.io.InputStream input)
-          throws java.io.IOException {
-        return com.google.protobuf.GeneratedMessageV3
-            .parseWithIOException(PARSER, input);
-      }
-      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseFrom(
-          java.io.InputStream input,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws java.io.IOException {
-        return com.google.protobuf.GeneratedMessageV3
-            .parseWithIOException(PARSER, input, extensionRegistry);
-      }
-      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseDelimitedFrom(java.io.InputStream input)
-          throws java.io.IOException {
-        return com.google.protobuf.GeneratedMessageV3
-            .parseDelimitedWithIOException(PARSER, input);
-      }
-      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseDelimitedFrom(
-          java.io.InputStream input,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws java.io.IOException {
-        return com.google.protobuf.GeneratedMessageV3
-            .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
-      }
-      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseFrom(
-          com.google.protobuf.CodedInputStream input)
-          throws java.io.IOException {
-        return com.google.protobuf.GeneratedMessageV3
-            .parseWithIOException(PARSER, input);
+      @java.lang.Override
+      public Builder clone() {
+        return super.clone();
       }
-      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseFrom(
-          com.google.protobuf.CodedInputStream input,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws java.io.IOException {
-        return com.google.protobuf.GeneratedMessageV3
-            .parseWithIOException(PARSER, input, extensionRegistry);
+      @java.lang.Override
+      public Builder setField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return super.setField(field, value);
       }
-
       @java.lang.Override
-      public Builder newBuilderForType() { return newBuilder(); }
-      public static Builder newBuilder() {
-        return DEFAULT_INSTANCE.toBuilder();
+      public Builder clearField(
+          com.google.protobuf.Descriptors.FieldDescriptor field) {
+        return super.clearField(field);
       }
-      public static Builder newBuilder(org.mlflow.api.proto.Service.ListArtifacts.Response prototype) {
-        return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+      @java.lang.Override
+      public Builder clearOneof(
+          com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+        return super.clearOneof(oneof);
       }
       @java.lang.Override
-      public Builder toBuilder() {
-        return this == DEFAULT_INSTANCE
-            ? new Builder() : new Builder().mergeFrom(this);
+      public Builder setRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          int index, java.lang.Object value) {
+        return super.setRepeatedField(field, index, value);
       }
-
       @java.lang.Override
-      protected Builder newBuilderForType(
-          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
-        Builder builder = new Builder(parent);
-        return builder;
+      public Builder addRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return super.addRepeatedField(field, value);
       }
-      /**
-       * Protobuf type {@code mlflow.ListArtifacts.Response}
-       */
-      public static final class Builder extends
-          com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
-          // @@protoc_insertion_point(builder_implements:mlflow.ListArtifacts.Response)
-          org.mlflow.api.proto.Service.ListArtifacts.ResponseOrBuilder {
-        public static final com.google.protobuf.Descriptors.Descriptor
-            getDescriptor() {
-          return org.mlflow.api.proto.Service.internal_static_mlflow_ListArtifacts_Response_descriptor;
+      @java.lang.Override
+      public Builder mergeFrom(com.google.protobuf.Message other) {
+        if (other instanceof org.mlflow.api.proto.Service.SearchRuns) {
+          return mergeFrom((org.mlflow.api.proto.Service.SearchRuns)other);
+        } else {
+          super.mergeFrom(other);
+          return this;
         }
+      }
 
-        @java.lang.Override
-        protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
-            internalGetFieldAccessorTable() {
-          return org.mlflow.api.proto.Service.internal_static_mlflow_ListArtifacts_Response_fieldAccessorTable
-              .ensureFieldAccessorsInitialized(
-                  org.mlflow.api.proto.Service.ListArtifacts.Response.class, org.mlflow.api.proto.Service.ListArtifacts.Response.Builder.class);
+      public Builder mergeFrom(org.mlflow.api.proto.Service.SearchRuns other) {
+        if (other == org.mlflow.api.proto.Service.SearchRuns.getDefaultInstance()) return this;
+        if (!other.experimentIds_.isEmpty()) {
+          if (experimentIds_.isEmpty()) {
+            experimentIds_ = other.experimentIds_;
+            bitField0_ = (bitField0_ & ~0x00000001);
+          } else {
+            ensureExperimentIdsIsMutable();
+            experimentIds_.addAll(other.experimentIds_);
+          }
+          onChanged();
         }
-
-        // Construct using org.mlflow.api.proto.Service.ListArtifacts.Response.newBuilder()
-        private Builder() {
-          maybeForceBuilderInitialization();
+        if (other.hasFilter()) {
+          bitField0_ |= 0x00000002;
+          filter_ = other.filter_;
+          onChanged();
         }
-
-        private Builder(
-            com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
-          super(parent);
-          maybeForceBuilderInitialization();
+        if (other.hasRunViewType()) {
+          setRunViewType(other.getRunViewType());
         }
-        private void maybeForceBuilderInitialization() {
-          if (com.google.protobuf.GeneratedMessageV3
-                  .alwaysUseFieldBuilders) {
-            getFilesFieldBuilder();
-          }
+        if (other.hasMaxResults()) {
+          setMaxResults(other.getMaxResults());
         }
-        @java.lang.Override
-        public Builder clear() {
-          super.clear();
-          rootUri_ = "";
-          bitField0_ = (bitField0_ & ~0x00000001);
-          if (filesBuilder_ == null) {
-            files_ = java.util.Collections.emptyList();
-            bitField0_ = (bitField0_ & ~0x00000002);
+        if (!other.orderBy_.isEmpty()) {
+          if (orderBy_.isEmpty()) {
+            orderBy_ = other.orderBy_;
+            bitField0_ = (bitField0_ & ~0x00000010);
           } else {
-            filesBuilder_.clear();
+            ensureOrderByIsMutable();
+            orderBy_.addAll(other.orderBy_);
           }
-          nextPageToken_ = "";
-          bitField0_ = (bitField0_ & ~0x00000004);
-          return this;
+          onChanged();
         }
-
-        @java.lang.Override
-        public com.google.protobuf.Descriptors.Descriptor
-            getDescriptorForType() {
-          return org.mlflow.api.proto.Service.internal_static_mlflow_ListArtifacts_Response_descriptor;
+        if (other.hasPageToken()) {
+          bitField0_ |= 0x00000020;
+          pageToken_ = other.pageToken_;
+          onChanged();
         }
-
-        @java.lang.Override
-        public org.mlflow.api.proto.Service.ListArtifacts.Response getDefaultInstanceForType() {
-          return org.mlflow.api.proto.Service.ListArtifacts.Response.getDefaultInstance();
+        if (other.hasIncludeMetrics()) {
+          mergeIncludeMetrics(other.getIncludeMetrics());
         }
-
-        @java.lang.Override
-        public org.mlflow.api.proto.Service.ListArtifacts.Response build() {
-          org.mlflow.api.proto.Service.ListArtifacts.Response result = buildPartial();
-          if (!result.isInitialized()) {
-            throw newUninitializedMessageException(result);
-          }
-          return result;
-        }
-
-        @java.lang.Override
-        public org.mlflow.api.proto.Service.ListArtifacts.Response buildPartial() {
-          org.mlflow.api.proto.Service.ListArtifacts.Response result = new org.mlflow.api.proto.Service.ListArtifacts.Response(this);
-          int from_bitField0_ = bitField0_;
-          int to_bitField0_ = 0;
-          if (((from_bitField0_ & 0x00000001) != 0)) {
-            to_bitField0_ |= 0x00000001;
-          }
-          result.rootUri_ = rootUri_;
-          if (filesBuilder_ == null) {
-            if (((bitField0_ & 0x00000002) != 0)) {
-              files_ = java.util.Collections.unmodifiableList(files_);
-              bitField0_ = (bitField0_ & ~0x00000002);
-            }
-            result.files_ = files_;
-          } else {
-            result.files_ = filesBuilder_.build();
-          }
-          if (((from_bitField0_ & 0x00000004) != 0)) {
-            to_bitField0_ |= 0x00000002;
-          }
-          result.nextPageToken_ = nextPageToken_;
-          result.bitField0_ = to_bitField0_;
-          onBuilt();
-          return result;
-        }
-
-        @java.lang.Override
-        public Builder clone() {
-          return super.clone();
-        }
-        @java.lang.Override
-        public Builder setField(
-            com.google.protobuf.Descriptors.FieldDescriptor field,
-            java.lang.Object value) {
-          return super.setField(field, value);
-        }
-        @java.lang.Override
-        public Builder clearField(
-            com.google.protobuf.Descriptors.FieldDescriptor field) {
-          return super.clearField(field);
-        }
-        @java.lang.Override
-        public Builder clearOneof(
-            com.google.protobuf.Descriptors.OneofDescriptor oneof) {
-          return super.clearOneof(oneof);
-        }
-        @java.lang.Override
-        public Builder setRepeatedField(
-            com.google.protobuf.Descriptors.FieldDescriptor field,
-            int index, java.lang.Object value) {
-          return super.setRepeatedField(field, index, value);
-        }
-        @java.lang.Override
-        public Builder addRepeatedField(
-            com.google.protobuf.Descriptors.FieldDescriptor field,
-            java.lang.Object value) {
-          return super.addRepeatedField(field, value);
+        if (other.hasIncludeParams()) {
+          mergeIncludeParams(other.getIncludeParams());
         }
-        @java.lang.Override
-        public Builder mergeFrom(com.google.protobuf.Message other) {
-          if (other instanceof org.mlflow.api.proto.Service.ListArtifacts.Response) {
-            return mergeFrom((org.mlflow.api.proto.Service.ListArtifacts.Response)other);
-          } else {
-            super.mergeFrom(other);
-            return this;
-          }
-        }
-
-        public Builder mergeFrom(org.mlflow.api.proto.Service.ListArtifacts.Response other) {
-          if (other == org.mlflow.api.proto.Service.ListArtifacts.Response.getDefaultInstance()) return this;
-          if (other.hasRootUri()) {
-            bitField0_ |= 0x00000001;
-            rootUri_ = other.rootUri_;
-            onChanged();
-          }
-          if (filesBuilder_ == null) {
-            if (!other.files_.isEmpty()) {
-              if (files_.isEmpty()) {
-                files_ = other.files_;
-                bitField0_ = (bitField0_ & ~0x00000002);
-              } else {
-                ensureFilesIsMutable();
-                files_.addAll(other.files_);
-              }
-              onChanged();
-            }
-          } else {
-            if (!other.files_.isEmpty()) {
-              if (filesBuilder_.isEmpty()) {
-                filesBuilder_.dispose();
-                filesBuilder_ = null;
-                files_ = other.files_;
-                bitField0_ = (bitField0_ & ~0x00000002);
-                filesBuilder_ = 
-                  com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
-                     getFilesFieldBuilder() : null;
-              } else {
-                filesBuilder_.addAllMessages(other.files_);
-              }
-            }
-          }
-          if (other.hasNextPageToken()) {
-            bitField0_ |= 0x00000004;
-            nextPageToken_ = other.nextPageToken_;
-            onChanged();
-          }
-          this.mergeUnknownFields(other.unknownFields);
-          onChanged();
-          return this;
+        if (other.hasIncludeInputs()) {
+          setIncludeInputs(other.getIncludeInputs());
         }
+        this.mergeUnknownFields(other.unknownFields);
+        onChanged();
+        return this;
+      }
 
-        @java.lang.Override
-        public final boolean isInitialized() {
-          return true;
-        }
+      @java.lang.Override
+      public final boolean isInitialized() {
+        return true;
+      }
 
-        @java.lang.Override
-        public Builder mergeFrom(
-            com.google.protobuf.CodedInputStream input,
-            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-            throws java.io.IOException {
-          org.mlflow.api.proto.Service.ListArtifacts.Response parsedMessage = null;
-          try {
-            parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
-          } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-            parsedMessage = (org.mlflow.api.proto.Service.ListArtifacts.Response) e.getUnfinishedMessage();
-            throw e.unwrapIOException();
-          } finally {
-            if (parsedMessage != null) {
-              mergeFrom(parsedMessage);
-            }
+      @java.lang.Override
+      public Builder mergeFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        org.mlflow.api.proto.Service.SearchRuns parsedMessage = null;
+        try {
+          parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          parsedMessage = (org.mlflow.api.proto.Service.SearchRuns) e.getUnfinishedMessage();
+          throw e.unwrapIOException();
+        } finally {
+          if (parsedMessage != null) {
+            mergeFrom(parsedMessage);
           }
-          return this;
         }
-        private int bitField0_;
+        return this;
+      }
+      private int bitField0_;
 
-        private java.lang.Object rootUri_ = "";
-        /**
-         * <pre>
-         * Root artifact directory for the run.
-         * </pre>
-         *
-         * <code>optional string root_uri = 1;</code>
-         * @return Whether the rootUri field is set.
-         */
-        public boolean hasRootUri() {
-          return ((bitField0_ & 0x00000001) != 0);
-        }
-        /**
-         * <pre>
-         * Root artifact directory for the run.
-         * </pre>
-         *
-         * <code>optional string root_uri = 1;</code>
-         * @return The rootUri.
-         */
-        public java.lang.String getRootUri() {
-          java.lang.Object ref = rootUri_;
-          if (!(ref instanceof java.lang.String)) {
-            com.google.protobuf.ByteString bs =
-                (com.google.protobuf.ByteString) ref;
-            java.lang.String s = bs.toStringUtf8();
-            if (bs.isValidUtf8()) {
-              rootUri_ = s;
-            }
-            return s;
-          } else {
-            return (java.lang.String) ref;
-          }
-        }
-        /**
-         * <pre>
-         * Root artifact directory for the run.
-         * </pre>
-         *
-         * <code>optional string root_uri = 1;</code>
-         * @return The bytes for rootUri.
-         */
-        public com.google.protobuf.ByteString
-            getRootUriBytes() {
-          java.lang.Object ref = rootUri_;
-          if (ref instanceof String) {
-            com.google.protobuf.ByteString b = 
-                com.google.protobuf.ByteString.copyFromUtf8(
-                    (java.lang.String) ref);
-            rootUri_ = b;
-            return b;
-          } else {
-            return (com.google.protobuf.ByteString) ref;
-          }
-        }
-        /**
-         * <pre>
-         * Root artifact directory for the run.
-         * </pre>
-         *
-         * <code>optional string root_uri = 1;</code>
-         * @param value The rootUri to set.
-         * @return This builder for chaining.
-         */
-        public Builder setRootUri(
-            java.lang.String value) {
-          if (value == null) {
+      private com.google.protobuf.LazyStringList experimentIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+      private void ensureExperimentIdsIsMutable() {
+        if (!((bitField0_ & 0x00000001) != 0)) {
+          experimentIds_ = new com.google.protobuf.LazyStringArrayList(experimentIds_);
+          bitField0_ |= 0x00000001;
+         }
+      }
+      /**
+       * <pre>
+       * List of experiment IDs to search over.
+       * </pre>
+       *
+       * <code>repeated string experiment_ids = 1;</code>
+       * @return A list containing the experimentIds.
+       */
+      public com.google.protobuf.ProtocolStringList
+          getExperimentIdsList() {
+        return experimentIds_.getUnmodifiableView();
+      }
+      /**
+       * <pre>
+       * List of experiment IDs to search over.
+       * </pre>
+       *
+       * <code>repeated string experiment_ids = 1;</code>
+       * @return The count of experimentIds.
+       */
+      public int getExperimentIdsCount() {
+        return experimentIds_.size();
+      }
+      /**
+       * <pre>
+       * List of experiment IDs to search over.
+       * </pre>
+       *
+       * <code>repeated string experiment_ids = 1;</code>
+       * @param index The index of the element to return.
+       * @return The experimentIds at the given index.
+       */
+      public java.lang.String getExperimentIds(int index) {
+        return experimentIds_.get(index);
+      }
+      /**
+       * <pre>
+       * List of experiment IDs to search over.
+       * </pre>
+       *
+       * <code>repeated string experiment_ids = 1;</code>
+       * @param index The index of the value to return.
+       * @return The bytes of the experimentIds at the given index.
+       */
+      public com.google.protobuf.ByteString
+          getExperimentIdsBytes(int index) {
+        return experimentIds_.getByteString(index);
+      }
+      /**
+       * <pre>
+       * List of experiment IDs to search over.
+       * </pre>
+       *
+       * <code>repeated string experiment_ids = 1;</code>
+       * @param index The index to set the value at.
+       * @param value The experimentIds to set.
+       * @return This builder for chaining.
+       */
+      public Builder setExperimentIds(
+          int index, java.lang.String value) {
+        if (value == null) {
     throw new NullPointerException();
   }
-  bitField0_ |= 0x00000001;
-          rootUri_ = value;
-          onChanged();
-          return this;
-        }
-        /**
-         * <pre>
-         * Root artifact directory for the run.
-         * </pre>
-         *
-         * <code>optional string root_uri = 1;</code>
-         * @return This builder for chaining.
-         */
-        public Builder clearRootUri() {
-          bitField0_ = (bitField0_ & ~0x00000001);
-          rootUri_ = getDefaultInstance().getRootUri();
-          onChanged();
-          return this;
-        }
-        /**
-         * <pre>
-         * Root artifact directory for the run.
-         * </pre>
-         *
-         * <code>optional string root_uri = 1;</code>
-         * @param value The bytes for rootUri to set.
-         * @return This builder for chaining.
-         */
-        public Builder setRootUriBytes(
-            com.google.protobuf.ByteString value) {
-          if (value == null) {
+  ensureExperimentIdsIsMutable();
+        experimentIds_.set(index, value);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * List of experiment IDs to search over.
+       * </pre>
+       *
+       * <code>repeated string experiment_ids = 1;</code>
+       * @param value The experimentIds to add.
+       * @return This builder for chaining.
+       */
+      public Builder addExperimentIds(
+          java.lang.String value) {
+        if (value == null) {
     throw new NullPointerException();
   }
-  bitField0_ |= 0x00000001;
-          rootUri_ = value;
-          onChanged();
-          return this;
-        }
-
-        private java.util.List<org.mlflow.api.proto.Service.FileInfo> files_ =
-          java.util.Collections.emptyList();
-        private void ensureFilesIsMutable() {
-          if (!((bitField0_ & 0x00000002) != 0)) {
-            files_ = new java.util.ArrayList<org.mlflow.api.proto.Service.FileInfo>(files_);
-            bitField0_ |= 0x00000002;
-           }
-        }
-
-        private com.google.protobuf.RepeatedFieldBuilderV3<
-            org.mlflow.api.proto.Service.FileInfo, org.mlflow.api.proto.Service.FileInfo.Builder, org.mlflow.api.proto.Service.FileInfoOrBuilder> filesBuilder_;
+  ensureExperimentIdsIsMutable();
+        experimentIds_.add(value);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * List of experiment IDs to search over.
+       * </pre>
+       *
+       * <code>repeated string experiment_ids = 1;</code>
+       * @param values The experimentIds to add.
+       * @return This builder for chaining.
+       */
+      public Builder addAllExperimentIds(
+          java.lang.Iterable<java.lang.String> values) {
+        ensureExperimentIdsIsMutable();
+        com.google.protobuf.AbstractMessageLite.Builder.addAll(
+            values, experimentIds_);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * List of experiment IDs to search over.
+       * </pre>
+       *
+       * <code>repeated string experiment_ids = 1;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearExperimentIds() {
+        experimentIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+        bitField0_ = (bitField0_ & ~0x00000001);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * List of experiment IDs to search over.
+       * </pre>
+       *
+       * <code>repeated string experiment_ids = 1;</code>
+       * @param value The bytes of the experimentIds to add.
+       * @return This builder for chaining.
+       */
+      public Builder addExperimentIdsBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureExperimentIdsIsMutable();
+        experimentIds_.add(value);
+        onChanged();
+        return this;
+      }
 
-        /**
-         * <pre>
-         * File location and metadata for artifacts.
-         * </pre>
-         *
-         * <code>repeated .mlflow.FileInfo files = 2;</code>
-         */
-        public java.util.List<org.mlflow.api.proto.Service.FileInfo> getFilesList() {
-          if (filesBuilder_ == null) {
-            return java.util.Collections.unmodifiableList(files_);
-          } else {
-            return filesBuilder_.getMessageList();
+      private java.lang.Object filter_ = "";
+      /**
+       * <pre>
+       * A filter expression over params, metrics, and tags, that allows returning a subset of
+       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
+       * between a param, metric, or tag and a constant.
+       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
+       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
+       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
+       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
+       * </pre>
+       *
+       * <code>optional string filter = 4;</code>
+       * @return Whether the filter field is set.
+       */
+      public boolean hasFilter() {
+        return ((bitField0_ & 0x00000002) != 0);
+      }
+      /**
+       * <pre>
+       * A filter expression over params, metrics, and tags, that allows returning a subset of
+       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
+       * between a param, metric, or tag and a constant.
+       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
+       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
+       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
+       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
+       * </pre>
+       *
+       * <code>optional string filter = 4;</code>
+       * @return The filter.
+       */
+      public java.lang.String getFilter() {
+        java.lang.Object ref = filter_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            filter_ = s;
           }
+          return s;
+        } else {
+          return (java.lang.String) ref;
         }
-        /**
-         * <pre>
-         * File location and metadata for artifacts.
-         * </pre>
-         *
-         * <code>repeated .mlflow.FileInfo files = 2;</code>
-         */
-        public int getFilesCount() {
-          if (filesBuilder_ == null) {
-            return files_.size();
-          } else {
-            return filesBuilder_.getCount();
-          }
+      }
+      /**
+       * <pre>
+       * A filter expression over params, metrics, and tags, that allows returning a subset of
+       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
+       * between a param, metric, or tag and a constant.
+       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
+       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
+       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
+       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
+       * </pre>
+       *
+       * <code>optional string filter = 4;</code>
+       * @return The bytes for filter.
+       */
+      public com.google.protobuf.ByteString
+          getFilterBytes() {
+        java.lang.Object ref = filter_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          filter_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
         }
-        /**
-         * <pre>
+      }
+      /**
+       * <pre>
+       * A filter expression over params, metrics, and tags, that allows returning a subset of
+       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
+       * between a param, metric, or tag and a constant.
+       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
+       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
+       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
+       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
+       * </pre>
+       *
+       * <code>optional string filter = 4;</code>
+       * @param value The filter to set.
+       * @return This builder for chaining.
+       */
+      public Builder setFilter(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000002;
+        filter_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * A filter expression over params, metrics, and tags, that allows returning a subset of
+       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
+       * between a param, metric, or tag and a constant.
+       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
+       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
+       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
+       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
+       * </pre>
+       *
+       * <code>optional string filter = 4;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearFilter() {
+        bitField0_ = (bitField0_ & ~0x00000002);
+        filter_ = getDefaultInstance().getFilter();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * A filter expression over params, metrics, and tags, that allows returning a subset of
+       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
+       * between a param, metric, or tag and a constant.
+       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
+       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
+       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
+       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
+       * </pre>
+       *
+       * <code>optional string filter = 4;</code>
+       * @param value The bytes for filter to set.
+       * @return This builder for chaining.
+       */
+      public Builder setFilterBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000002;
+        filter_ = value;
+        onChanged();
+        return this;
+      }
+
+      private int runViewType_ = 1;
+      /**
+       * <pre>
+       * Whether to display only active, only deleted, or all runs.
+       * Defaults to only active runs.
+       * </pre>
+       *
+       * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
+       * @return Whether the runViewType field is set.
+       */
+      @java.lang.Override public boolean hasRunViewType() {
+        return ((bitField0_ & 0x00000004) != 0);
+      }
+      /**
+       * <pre>
+       * Whether to display only active, only deleted, or all runs.
+       * Defaults to only active runs.
+       * </pre>
+       *
+       * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
+       * @return The runViewType.
+       */
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.ViewType getRunViewType() {
+        @SuppressWarnings("deprecation")
+        org.mlflow.api.proto.Service.ViewType result = org.mlflow.api.proto.Service.ViewType.valueOf(runViewType_);
+        return result == null ? org.mlflow.api.proto.Service.ViewType.ACTIVE_ONLY : result;
+      }
+      /**
+       * <pre>
+       * Whether to display only active, only deleted, or all runs.
+       * Defaults to only active runs.
+       * </pre>
+       *
+       * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
+       * @param value The runViewType to set.
+       * @return This builder for chaining.
+       */
+      public Builder setRunViewType(org.mlflow.api.proto.Service.ViewType value) {
+        if (value == null) {
+          throw new NullPointerException();
+        }
+        bitField0_ |= 0x00000004;
+        runViewType_ = value.getNumber();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Whether to display only active, only deleted, or all runs.
+       * Defaults to only active runs.
+       * </pre>
+       *
+       * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearRunViewType() {
+        bitField0_ = (bitField0_ & ~0x00000004);
+        runViewType_ = 1;
+        onChanged();
+        return this;
+      }
+
+      private int maxResults_ = 1000;
+      /**
+       * <pre>
+       * Maximum number of runs desired. If unspecified, defaults to 1000.
+       * All servers are guaranteed to support a `max_results` threshold of at least 50,000
+       * but may support more. Callers of this endpoint are encouraged to pass max_results
+       * explicitly and leverage page_token to iterate through experiments.
+       * </pre>
+       *
+       * <code>optional int32 max_results = 5 [default = 1000];</code>
+       * @return Whether the maxResults field is set.
+       */
+      @java.lang.Override
+      public boolean hasMaxResults() {
+        return ((bitField0_ & 0x00000008) != 0);
+      }
+      /**
+       * <pre>
+       * Maximum number of runs desired. If unspecified, defaults to 1000.
+       * All servers are guaranteed to support a `max_results` threshold of at least 50,000
+       * but may support more. Callers of this endpoint are encouraged to pass max_results
+       * explicitly and leverage page_token to iterate through experiments.
+       * </pre>
+       *
+       * <code>optional int32 max_results = 5 [default = 1000];</code>
+       * @return The maxResults.
+       */
+      @java.lang.Override
+      public int getMaxResults() {
+        return maxResults_;
+      }
+      /**
+       * <pre>
+       * Maximum number of runs desired. If unspecified, defaults to 1000.
+       * All servers are guaranteed to support a `max_results` threshold of at least 50,000
+       * but may support more. Callers of this endpoint are encouraged to pass max_results
+       * explicitly and leverage page_token to iterate through experiments.
+       * </pre>
+       *
+       * <code>optional int32 max_results = 5 [default = 1000];</code>
+       * @param value The maxResults to set.
+       * @return This builder for chaining.
+       */
+      public Builder setMaxResults(int value) {
+        bitField0_ |= 0x00000008;
+        maxResults_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Maximum number of runs desired. If unspecified, defaults to 1000.
+       * All servers are guaranteed to support a `max_results` threshold of at least 50,000
+       * but may support more. Callers of this endpoint are encouraged to pass max_results
+       * explicitly and leverage page_token to iterate through experiments.
+       * </pre>
+       *
+       * <code>optional int32 max_results = 5 [default = 1000];</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearMaxResults() {
+        bitField0_ = (bitField0_ & ~0x00000008);
+        maxResults_ = 1000;
+        onChanged();
+        return this;
+      }
+
+      private com.google.protobuf.LazyStringList orderBy_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+      private void ensureOrderByIsMutable() {
+        if (!((bitField0_ & 0x00000010) != 0)) {
+          orderBy_ = new com.google.protobuf.LazyStringArrayList(orderBy_);
+          bitField0_ |= 0x00000010;
+         }
+      }
+      /**
+       * <pre>
+       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+       * (and this is the default ordering criterion if order_by is not provided).
+       * </pre>
+       *
+       * <code>repeated string order_by = 6;</code>
+       * @return A list containing the orderBy.
+       */
+      public com.google.protobuf.ProtocolStringList
+          getOrderByList() {
+        return orderBy_.getUnmodifiableView();
+      }
+      /**
+       * <pre>
+       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+       * (and this is the default ordering criterion if order_by is not provided).
+       * </pre>
+       *
+       * <code>repeated string order_by = 6;</code>
+       * @return The count of orderBy.
+       */
+      public int getOrderByCount() {
+        return orderBy_.size();
+      }
+      /**
+       * <pre>
+       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+       * (and this is the default ordering criterion if order_by is not provided).
+       * </pre>
+       *
+       * <code>repeated string order_by = 6;</code>
+       * @param index The index of the element to return.
+       * @return The orderBy at the given index.
+       */
+      public java.lang.String getOrderBy(int index) {
+        return orderBy_.get(index);
+      }
+      /**
+       * <pre>
+       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+       * (and this is the default ordering criterion if order_by is not provided).
+       * </pre>
+       *
+       * <code>repeated string order_by = 6;</code>
+       * @param index The index of the value to return.
+       * @return The bytes of the orderBy at the given index.
+       */
+      public com.google.protobuf.ByteString
+          getOrderByBytes(int index) {
+        return orderBy_.getByteString(index);
+      }
+      /**
+       * <pre>
+       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+       * (and this is the default ordering criterion if order_by is not provided).
+       * </pre>
+       *
+       * <code>repeated string order_by = 6;</code>
+       * @param index The index to set the value at.
+       * @param value The orderBy to set.
+       * @return This builder for chaining.
+       */
+      public Builder setOrderBy(
+          int index, java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureOrderByIsMutable();
+        orderBy_.set(index, value);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+       * (and this is the default ordering criterion if order_by is not provided).
+       * </pre>
+       *
+       * <code>repeated string order_by = 6;</code>
+       * @param value The orderBy to add.
+       * @return This builder for chaining.
+       */
+      public Builder addOrderBy(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureOrderByIsMutable();
+        orderBy_.add(value);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+       * (and this is the default ordering criterion if order_by is not provided).
+       * </pre>
+       *
+       * <code>repeated string order_by = 6;</code>
+       * @param values The orderBy to add.
+       * @return This builder for chaining.
+       */
+      public Builder addAllOrderBy(
+          java.lang.Iterable<java.lang.String> values) {
+        ensureOrderByIsMutable();
+        com.google.protobuf.AbstractMessageLite.Builder.addAll(
+            values, orderBy_);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+       * (and this is the default ordering criterion if order_by is not provided).
+       * </pre>
+       *
+       * <code>repeated string order_by = 6;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearOrderBy() {
+        orderBy_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+        bitField0_ = (bitField0_ & ~0x00000010);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+       * (and this is the default ordering criterion if order_by is not provided).
+       * </pre>
+       *
+       * <code>repeated string order_by = 6;</code>
+       * @param value The bytes of the orderBy to add.
+       * @return This builder for chaining.
+       */
+      public Builder addOrderByBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureOrderByIsMutable();
+        orderBy_.add(value);
+        onChanged();
+        return this;
+      }
+
+      private java.lang.Object pageToken_ = "";
+      /**
+       * <code>optional string page_token = 7;</code>
+       * @return Whether the pageToken field is set.
+       */
+      public boolean hasPageToken() {
+        return ((bitField0_ & 0x00000020) != 0);
+      }
+      /**
+       * <code>optional string page_token = 7;</code>
+       * @return The pageToken.
+       */
+      public java.lang.String getPageToken() {
+        java.lang.Object ref = pageToken_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            pageToken_ = s;
+          }
+          return s;
+        } else {
+          return (java.lang.String) ref;
+        }
+      }
+      /**
+       * <code>optional string page_token = 7;</code>
+       * @return The bytes for pageToken.
+       */
+      public com.google.protobuf.ByteString
+          getPageTokenBytes() {
+        java.lang.Object ref = pageToken_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          pageToken_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
+      }
+      /**
+       * <code>optional string page_token = 7;</code>
+       * @param value The pageToken to set.
+       * @return This builder for chaining.
+       */
+      public Builder setPageToken(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000020;
+        pageToken_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <code>optional string page_token = 7;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearPageToken() {
+        bitField0_ = (bitField0_ & ~0x00000020);
+        pageToken_ = getDefaultInstance().getPageToken();
+        onChanged();
+        return this;
+      }
+      /**
+       * <code>optional string page_token = 7;</code>
+       * @param value The bytes for pageToken to set.
+       * @return This builder for chaining.
+       */
+      public Builder setPageTokenBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000020;
+        pageToken_ = value;
+        onChanged();
+        return this;
+      }
+
+      private org.mlflow.api.proto.Service.SearchRuns.KeyList includeMetrics_;
+      private com.google.protobuf.SingleFieldBuilderV3<
+          org.mlflow.api.proto.Service.SearchRuns.KeyList, org.mlflow.api.proto.Service.SearchRuns.KeyList.Builder, org.mlflow.api.proto.Service.SearchRuns.KeyListOrBuilder> includeMetricsBuilder_;
+      /**
+       * <pre>
+       * If set, only the latest metrics with these keys are returned with each run. By default, all
+       * the latest metrics of the runs are returned.
+       * </pre>
+       *
+       * <code>optional .mlflow.SearchRuns.KeyList include_metrics = 8;</code>
+       * @return Whether the includeMetrics field is set.
+       */
+      public boolean hasIncludeMetrics() {
+        return ((bitField0_ & 0x00000040) != 0);
+      }
+      /**
+       * <pre>
+       * If set, only the latest metrics with these keys are returned with each run. By default, all
+       * the latest metrics of the runs are returned.
+       * </pre>
+       *
+       * <code>optional .mlflow.SearchRuns.KeyList include_metrics = 8;</code>
+       * @return The includeMetrics.
+       */
+      public org.mlflow.api.proto.Service.SearchRuns.KeyList getIncludeMetrics() {
+        if (includeMetricsBuilder_ == null) {
+          return includeMetrics_ == null ? org.mlflow.api.proto.Service.SearchRuns.KeyList.getDefaultInstance() : includeMetrics_;
+        } else {
+          return includeMetricsBuilder_.getMessage();
+        }
+      }
+      /**
+       * <pre>
+       * If set, only the latest metrics with these keys are returned with each run. By default, all
+       * the latest metrics of the runs are returned.
+       * </pre>
+       *
+       * <code>optional .mlflow.SearchRuns.KeyList include_metrics = 8;</code>
+       */
+      public Builder setIncludeMetrics(org.mlflow.api.proto.Service.SearchRuns.KeyList value) {
+        if (includeMetricsBuilder_ == null) {
+          if (value == null) {
+            throw new NullPointerException();
+          }
+          includeMetrics_ = value;
+          onChanged();
+        } else {
+          includeMetricsBuilder_.setMessage(value);
+        }
+        bitField0_ |= 0x00000040;
+        return this;
+      }
+      /**
+       * <pre>
+       * If set, only the latest metrics with these keys are returned with each run. By default, all
+       * the latest metrics of the runs are returned.
+       * </pre>
+       *
+       * <code>optional .mlflow.SearchRuns.KeyList include_metrics = 8;</code>
+       */
+      public Builder setIncludeMetrics(
+          org.mlflow.api.proto.Service.SearchRuns.KeyList.Builder builderForValue) {
+        if (includeMetricsBuilder_ == null) {
+          includeMetrics_ = builderForValue.build();
+          onChanged();
+        } else {
+          includeMetricsBuilder_.setMessage(builderForValue.build());
+        }
+        bitField0_ |= 0x00000040;
+        return this;
+      }
+      /**
+       * <pre>
+       * If set, only the latest metrics with these keys are returned with each run. By default, all
+       * the latest metrics of the runs are returned.
+       * </pre>
+       *
+       * <code>optional .mlflow.SearchRuns.KeyList include_metrics = 8;</code>
+       */
+      public Builder mergeIncludeMetrics(org.mlflow.api.proto.Service.SearchRuns.KeyList value) {
+        if (includeMetricsBuilder_ == null) {
+          if (((bitField0_ & 0x00000040) != 0) &&
+              includeMetrics_ != null &&
+              includeMetrics_ != org.mlflow.api.proto.Service.SearchRuns.KeyList.getDefaultInstance()) {
+            includeMetrics_ =
+              org.mlflow.api.proto.Service.SearchRuns.KeyList.newBuilder(includeMetrics_).mergeFrom(value).buildPartial();
+          } else {
+            includeMetrics_ = value;
+          }
+          onChanged();
+        } else {
+          includeMetricsBuilder_.mergeFrom(value);
+        }
+        bitField0_ |= 0x00000040;
+        return this;
+      }
+      /**
+       * <pre>
+       * If set, only the latest metrics with these keys are returned with each run. By default, all
+       * the latest metrics of the runs are returned.
+       * </pre>
+       *
+       * <code>optional .mlflow.SearchRuns.KeyList include_metrics = 8;</code>
+       */
+      public Builder clearIncludeMetrics() {
+        if (includeMetricsBuilder_ == null) {
+          includeMetrics_ = null;
+          onChanged();
+        } else {
+          includeMetricsBuilder_.clear();
+        }
+        bitField0_ = (bitField0_ & ~0x00000040);
+        return this;
+      }
+      /**
+       * <pre>
+       * If set, only the latest metrics with these keys are returned with each run. By default, all
+       * the latest metrics of the runs are returned.
+       * </pre>
+       *
+       * <code>optional .mlflow.SearchRuns.KeyList include_metrics = 8;</code>
+       */
+      public org.mlflow.api.proto.Service.SearchRuns.KeyList.Builder getIncludeMetricsBuilder() {
+        bitField0_ |= 0x00000040;
+        onChanged();
+        return getIncludeMetricsFieldBuilder().getBuilder();
+      }
+      /**
+       * <pre>
+       * If set, only the latest metrics with these keys are returned with each run. By default, all
+       * the latest metrics of the runs are returned.
+       * </pre>
+       *
+       * <code>optional .mlflow.SearchRuns.KeyList include_metrics = 8;</code>
+       */
+      public org.mlflow.api.proto.Service.SearchRuns.KeyListOrBuilder getIncludeMetricsOrBuilder() {
+        if (includeMetricsBuilder_ != null) {
+          return includeMetricsBuilder_.getMessageOrBuilder();
+        } else {
+          return includeMetrics_ == null ?
+              org.mlflow.api.proto.Service.SearchRuns.KeyList.getDefaultInstance() : includeMetrics_;
+        }
+      }
+      /**
+       * <pre>
+       * If set, only the latest metrics with these keys are returned with each run. By default, all
+       * the latest metrics of the runs are returned.
+       * </pre>
+       *
+       * <code>optional .mlflow.SearchRuns.KeyList include_metrics = 8;</code>
+       */
+      private com.google.protobuf.SingleFieldBuilderV3<
+          org.mlflow.api.proto.Service.SearchRuns.KeyList, org.mlflow.api.proto.Service.SearchRuns.KeyList.Builder, org.mlflow.api.proto.Service.SearchRuns.KeyListOrBuilder> 
+          getIncludeMetricsFieldBuilder() {
+        if (includeMetricsBuilder_ == null) {
+          includeMetricsBuilder_ = new com.google.protobuf.SingleFieldBuilderV3<
+              org.mlflow.api.proto.Service.SearchRuns.KeyList, org.mlflow.api.proto.Service.SearchRuns.KeyList.Builder, org.mlflow.api.proto.Service.SearchRuns.KeyListOrBuilder>(
+                  getIncludeMetrics(),
+                  getParentForChildren(),
+                  isClean());
+          includeMetrics_ = null;
+        }
+        return includeMetricsBuilder_;
+      }
+
+      private org.mlflow.api.proto.Service.SearchRuns.KeyList includeParams_;
+      private com.google.protobuf.SingleFieldBuilderV3<
+          org.mlflow.api.proto.Service.SearchRuns.KeyList, org.mlflow.api.proto.Service.SearchRuns.KeyList.Builder, org.mlflow.api.proto.Service.SearchRuns.KeyListOrBuilder> includeParamsBuilder_;
+      /**
+       * <pre>
+       * If set, only the params with these keys are returned with each run. By default, all the
+       * params of the runs are returned.
+       * </pre>
+       *
+       * <code>optional .mlflow.SearchRuns.KeyList include_params = 9;</code>
+       * @return Whether the includeParams field is set.
+       */
+      public boolean hasIncludeParams() {
+        return ((bitField0_ & 0x00000080) != 0);
+      }
+      /**
+       * <pre>
+       * If set, only the params with these keys are returned with each run. By default, all the
+       * params of the runs are returned.
+       * </pre>
+       *
+       * <code>optional .mlflow.SearchRuns.KeyList include_params = 9;</code>
+       * @return The includeParams.
+       */
+      public org.mlflow.api.proto.Service.SearchRuns.KeyList getIncludeParams() {
+        if (includeParamsBuilder_ == null) {
+          return includeParams_ == null ? org.mlflow.api.proto.Service.SearchRuns.KeyList.getDefaultInstance() : includeParams_;
+        } else {
+          return includeParamsBuilder_.getMessage();
+        }
+      }
+      /**
+       * <pre>
+       * If set, only the params with these keys are returned with each run. By default, all the
+       * params of the runs are returned.
+       * </pre>
+       *
+       * <code>optional .mlflow.SearchRuns.KeyList include_params = 9;</code>
+       */
+      public Builder setIncludeParams(org.mlflow.api.proto.Service.SearchRuns.KeyList value) {
+        if (includeParamsBuilder_ == null) {
+          if (value == null) {
+            throw new NullPointerException();
+          }
+          includeParams_ = value;
+          onChanged();
+        } else {
+          includeParamsBuilder_.setMessage(value);
+        }
+        bitField0_ |= 0x00000080;
+        return this;
+      }
+      /**
+       * <pre>
+       * If set, only the params with these keys are returned with each run. By default, all the
+       * params of the runs are returned.
+       * </pre>
+       *
+       * <code>optional .mlflow.SearchRuns.KeyList include_params = 9;</code>
+       */
+      public Builder setIncludeParams(
+          org.mlflow.api.proto.Service.SearchRuns.KeyList.Builder builderForValue) {
+        if (includeParamsBuilder_ == null) {
+          includeParams_ = builderForValue.build();
+          onChanged();
+        } else {
+          includeParamsBuilder_.setMessage(builderForValue.build());
+        }
+        bitField0_ |= 0x00000080;
+        return this;
+      }
+      /**
+       * <pre>
+       * If set, only the params with these keys are returned with each run. By default, all the
+       * params of the runs are returned.
+       * </pre>
+       *
+       * <code>optional .mlflow.SearchRuns.KeyList include_params = 9;</code>
+       */
+      public Builder mergeIncludeParams(org.mlflow.api.proto.Service.SearchRuns.KeyList value) {
+        if (includeParamsBuilder_ == null) {
+          if (((bitField0_ & 0x00000080) != 0) &&
+              includeParams_ != null &&
+              includeParams_ != org.mlflow.api.proto.Service.SearchRuns.KeyList.getDefaultInstance()) {
+            includeParams_ =
+              org.mlflow.api.proto.Service.SearchRuns.KeyList.newBuilder(includeParams_).mergeFrom(value).buildPartial();
+          } else {
+            includeParams_ = value;
+          }
+          onChanged();
+        } else {
+          includeParamsBuilder_.mergeFrom(value);
+        }
+        bitField0_ |= 0x00000080;
+        return this;
+      }
+      /**
+       * <pre>
+       * If set, only the params with these keys are returned with each run. By default, all the
+       * params of the runs are returned.
+       * </pre>
+       *
+       * <code>optional .mlflow.SearchRuns.KeyList include_params = 9;</code>
+       */
+      public Builder clearIncludeParams() {
+        if (includeParamsBuilder_ == null) {
+          includeParams_ = null;
+          onChanged();
+        } else {
+          includeParamsBuilder_.clear();
+        }
+        bitField0_ = (bitField0_ & ~0x00000080);
+        return this;
+      }
+      /**
+       * <pre>
+       * If set, only the params with these keys are returned with each run. By default, all the
+       * params of the runs are returned.
+       * </pre>
+       *
+       * <code>optional .mlflow.SearchRuns.KeyList include_params = 9;</code>
+       */
+      public org.mlflow.api.proto.Service.SearchRuns.KeyList.Builder getIncludeParamsBuilder() {
+        bitField0_ |= 0x00000080;
+        onChanged();
+        return getIncludeParamsFieldBuilder().getBuilder();
+      }
+      /**
+       * <pre>
+       * If set, only the params with these keys are returned with each run. By default, all the
+       * params of the runs are returned.
+       * </pre>
+       *
+       * <code>optional .mlflow.SearchRuns.KeyList include_params = 9;</code>
+       */
+      public org.mlflow.api.proto.Service.SearchRuns.KeyListOrBuilder getIncludeParamsOrBuilder() {
+        if (includeParamsBuilder_ != null) {
+          return includeParamsBuilder_.getMessageOrBuilder();
+        } else {
+          return includeParams_ == null ?
+              org.mlflow.api.proto.Service.SearchRuns.KeyList.getDefaultInstance() : includeParams_;
+        }
+      }
+      /**
+       * <pre>
+       * If set, only the params with these keys are returned with each run. By default, all the
+       * params of the runs are returned.
+       * </pre>
+       *
+       * <code>optional .mlflow.SearchRuns.KeyList include_params = 9;</code>
+       */
+      private com.google.protobuf.SingleFieldBuilderV3<
+          org.mlflow.api.proto.Service.SearchRuns.KeyList, org.mlflow.api.proto.Service.SearchRuns.KeyList.Builder, org.mlflow.api.proto.Service.SearchRuns.KeyListOrBuilder> 
+          getIncludeParamsFieldBuilder() {
+        if (includeParamsBuilder_ == null) {
+          includeParamsBuilder_ = new com.google.protobuf.SingleFieldBuilderV3<
+              org.mlflow.api.proto.Service.SearchRuns.KeyList, org.mlflow.api.proto.Service.SearchRuns.KeyList.Builder, org.mlflow.api.proto.Service.SearchRuns.KeyListOrBuilder>(
+                  getIncludeParams(),
+                  getParentForChildren(),
+                  isClean());
+          includeParams_ = null;
+        }
+        return includeParamsBuilder_;
+      }
+
+      private boolean includeInputs_ = true;
+      /**
+       * <pre>
+       * Whether to return the dataset inputs of the runs. Defaults to true.
+       * </pre>
+       *
+       * <code>optional bool include_inputs = 10 [default = true];</code>
+       * @return Whether the includeInputs field is set.
+       */
+      @java.lang.Override
+      public boolean hasIncludeInputs() {
+        return ((bitField0_ & 0x00000100) != 0);
+      }
+      /**
+       * <pre>
+       * Whether to return the dataset inputs of the runs. Defaults to true.
+       * </pre>
+       *
+       * <code>optional bool include_inputs = 10 [default = true];</code>
+       * @return The includeInputs.
+       */
+      @java.lang.Override
+      public boolean getIncludeInputs() {
+        return includeInputs_;
+      }
+      /**
+       * <pre>
+       * Whether to return the dataset inputs of the runs. Defaults to true.
+       * </pre>
+       *
+       * <code>optional bool include_inputs = 10 [default = true];</code>
+       * @param value The includeInputs to set.
+       * @return This builder for chaining.
+       */
+      public Builder setIncludeInputs(boolean value) {
+        bitField0_ |= 0x00000100;
+        includeInputs_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Whether to return the dataset inputs of the runs. Defaults to true.
+       * </pre>
+       *
+       * <code>optional bool include_inputs = 10 [default = true];</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearIncludeInputs() {
+        bitField0_ = (bitField0_ & ~0x00000100);
+        includeInputs_ = true;
+        onChanged();
+        return this;
+      }
+      @java.lang.Override
+      public final Builder setUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.setUnknownFields(unknownFields);
+      }
+
+      @java.lang.Override
+      public final Builder mergeUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.mergeUnknownFields(unknownFields);
+      }
+
+
+      // @@protoc_insertion_point(builder_scope:mlflow.SearchRuns)
+    }
+
+    // @@protoc_insertion_point(class_scope:mlflow.SearchRuns)
+    private static final org.mlflow.api.proto.Service.SearchRuns DEFAULT_INSTANCE;
+    static {
+      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.SearchRuns();
+    }
+
+    public static org.mlflow.api.proto.Service.SearchRuns getDefaultInstance() {
+      return DEFAULT_INSTANCE;
+    }
+
+    @java.lang.Deprecated public static final com.google.protobuf.Parser<SearchRuns>
+        PARSER = new com.google.protobuf.AbstractParser<SearchRuns>() {
+      @java.lang.Override
+      public SearchRuns parsePartialFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return new SearchRuns(input, extensionRegistry);
+      }
+    };
+
+    public static com.google.protobuf.Parser<SearchRuns> parser() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public com.google.protobuf.Parser<SearchRuns> getParserForType() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.SearchRuns getDefaultInstanceForType() {
+      return DEFAULT_INSTANCE;
+    }
+
+  }
+
+  public interface ListArtifactsOrBuilder extends
+      // @@protoc_insertion_point(interface_extends:mlflow.ListArtifacts)
+      com.google.protobuf.MessageOrBuilder {
+
+    /**
+     * <pre>
+     * ID of the run whose artifacts to list. Must be provided.
+     * </pre>
+     *
+     * <code>optional string run_id = 3;</code>
+     * @return Whether the runId field is set.
+     */
+    boolean hasRunId();
+    /**
+     * <pre>
+     * ID of the run whose artifacts to list. Must be provided.
+     * </pre>
+     *
+     * <code>optional string run_id = 3;</code>
+     * @return The runId.
+     */
+    java.lang.String getRunId();
+    /**
+     * <pre>
+     * ID of the run whose artifacts to list. Must be provided.
+     * </pre>
+     *
+     * <code>optional string run_id = 3;</code>
+     * @return The bytes for runId.
+     */
+    com.google.protobuf.ByteString
+        getRunIdBytes();
+
+    /**
+     * <pre>
+     * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
+     * be removed in a future MLflow version.
+     * </pre>
+     *
+     * <code>optional string run_uuid = 1;</code>
+     * @return Whether the runUuid field is set.
+     */
+    boolean hasRunUuid();
+    /**
+     * <pre>
+     * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
+     * be removed in a future MLflow version.
+     * </pre>
+     *
+     * <code>optional string run_uuid = 1;</code>
+     * @return The runUuid.
+     */
+    java.lang.String getRunUuid();
+    /**
+     * <pre>
+     * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
+     * be removed in a future MLflow version.
+     * </pre>
+     *
+     * <code>optional string run_uuid = 1;</code>
+     * @return The bytes for runUuid.
+     */
+    com.google.protobuf.ByteString
+        getRunUuidBytes();
+
+    /**
+     * <pre>
+     * Filter artifacts matching this path (a relative path from the root artifact directory).
+     * </pre>
+     *
+     * <code>optional string path = 2;</code>
+     * @return Whether the path field is set.
+     */
+    boolean hasPath();
+    /**
+     * <pre>
+     * Filter artifacts matching this path (a relative path from the root artifact directory).
+     * </pre>
+     *
+     * <code>optional string path = 2;</code>
+     * @return The path.
+     */
+    java.lang.String getPath();
+    /**
+     * <pre>
+     * Filter artifacts matching this path (a relative path from the root artifact directory).
+     * </pre>
+     *
+     * <code>optional string path = 2;</code>
+     * @return The bytes for path.
+     */
+    com.google.protobuf.ByteString
+        getPathBytes();
+
+    /**
+     * <pre>
+     * Token indicating the page of artifact results to fetch
+     * </pre>
+     *
+     * <code>optional string page_token = 4;</code>
+     * @return Whether the pageToken field is set.
+     */
+    boolean hasPageToken();
+    /**
+     * <pre>
+     * Token indicating the page of artifact results to fetch
+     * </pre>
+     *
+     * <code>optional string page_token = 4;</code>
+     * @return The pageToken.
+     */
+    java.lang.String getPageToken();
+    /**
+     * <pre>
+     * Token indicating the page of artifact results to fetch
+     * </pre>
+     *
+     * <code>optional string page_token = 4;</code>
+     * @return The bytes for pageToken.
+     */
+    com.google.protobuf.ByteString
+        getPageTokenBytes();
+  }
+  /**
+   * Protobuf type {@code mlflow.ListArtifacts}
+   */
+  public static final class ListArtifacts extends
+      com.google.protobuf.GeneratedMessageV3 implements
+      // @@protoc_insertion_point(message_implements:mlflow.ListArtifacts)
+      ListArtifactsOrBuilder {
+  private static final long serialVersionUID = 0L;
+    // Use ListArtifacts.newBuilder() to construct.
+    private ListArtifacts(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+      super(builder);
+    }
+    private ListArtifacts() {
+      runId_ = "";
+      runUuid_ = "";
+      path_ = "";
+      pageToken_ = "";
+    }
+
+    @java.lang.Override
+    @SuppressWarnings({"unused"})
+    protected java.lang.Object newInstance(
+        UnusedPrivateParameter unused) {
+      return new ListArtifacts();
+    }
+
+    @java.lang.Override
+    public final com.google.protobuf.UnknownFieldSet
+    getUnknownFields() {
+      return this.unknownFields;
+    }
+    private ListArtifacts(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      this();
+      if (extensionRegistry == null) {
+        throw new java.lang.NullPointerException();
+      }
+      int mutable_bitField0_ = 0;
+      com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+          com.google.protobuf.UnknownFieldSet.newBuilder();
+      try {
+        boolean done = false;
+        while (!done) {
+          int tag = input.readTag();
+          switch (tag) {
+            case 0:
+              done = true;
+              break;
+            case 10: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000002;
+              runUuid_ = bs;
+              break;
+            }
+            case 18: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000004;
+              path_ = bs;
+              break;
+            }
+            case 26: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000001;
+              runId_ = bs;
+              break;
+            }
+            case 34: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000008;
+              pageToken_ = bs;
+              break;
+            }
+            default: {
+              if (!parseUnknownField(
+                  input, unknownFields, extensionRegistry, tag)) {
+                done = true;
+              }
+              break;
+            }
+          }
+        }
+      } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+        throw e.setUnfinishedMessage(this);
+      } catch (java.io.IOException e) {
+        throw new com.google.protobuf.InvalidProtocolBufferException(
+            e).setUnfinishedMessage(this);
+      } finally {
+        this.unknownFields = unknownFields.build();
+        makeExtensionsImmutable();
+      }
+    }
+    public static final com.google.protobuf.Descriptors.Descriptor
+        getDescriptor() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_ListArtifacts_descriptor;
+    }
+
+    @java.lang.Override
+    protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+        internalGetFieldAccessorTable() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_ListArtifacts_fieldAccessorTable
+          .ensureFieldAccessorsInitialized(
+              org.mlflow.api.proto.Service.ListArtifacts.class, org.mlflow.api.proto.Service.ListArtifacts.Builder.class);
+    }
+
+    public interface ResponseOrBuilder extends
+        // @@protoc_insertion_point(interface_extends:mlflow.ListArtifacts.Response)
+        com.google.protobuf.MessageOrBuilder {
+
+      /**
+       * <pre>
+       * Root artifact directory for the run.
+       * </pre>
+       *
+       * <code>optional string root_uri = 1;</code>
+       * @return Whether the rootUri field is set.
+       */
+      boolean hasRootUri();
+      /**
+       * <pre>
+       * Root artifact directory for the run.
+       * </pre>
+       *
+       * <code>optional string root_uri = 1;</code>
+       * @return The rootUri.
+       */
+      java.lang.String getRootUri();
+      /**
+       * <pre>
+       * Root artifact directory for the run.
+       * </pre>
+       *
+       * <code>optional string root_uri = 1;</code>
+       * @return The bytes for rootUri.
+       */
+      com.google.protobuf.ByteString
+          getRootUriBytes();
+
+      /**
+       * <pre>
+       * File location and metadata for artifacts.
+       * </pre>
+       *
+       * <code>repeated .mlflow.FileInfo files = 2;</code>
+       */
+      java.util.List<org.mlflow.api.proto.Service.FileInfo> 
+          getFilesList();
+      /**
+       * <pre>
+       * File location and metadata for artifacts.
+       * </pre>
+       *
+       * <code>repeated .mlflow.FileInfo files = 2;</code>
+       */
+      org.mlflow.api.proto.Service.FileInfo getFiles(int index);
+      /**
+       * <pre>
+       * File location and metadata for artifacts.
+       * </pre>
+       *
+       * <code>repeated .mlflow.FileInfo files = 2;</code>
+       */
+      int getFilesCount();
+      /**
+       * <pre>
+       * File location and metadata for artifacts.
+       * </pre>
+       *
+       * <code>repeated .mlflow.FileInfo files = 2;</code>
+       */
+      java.util.List<? extends org.mlflow.api.proto.Service.FileInfoOrBuilder> 
+          getFilesOrBuilderList();
+      /**
+       * <pre>
+       * File location and metadata for artifacts.
+       * </pre>
+       *
+       * <code>repeated .mlflow.FileInfo files = 2;</code>
+       */
+      org.mlflow.api.proto.Service.FileInfoOrBuilder getFilesOrBuilder(
+          int index);
+
+      /**
+       * <pre>
+       * Token that can be used to retrieve the next page of artifact results
+       * </pre>
+       *
+       * <code>optional string next_page_token = 3;</code>
+       * @return Whether the nextPageToken field is set.
+       */
+      boolean hasNextPageToken();
+      /**
+       * <pre>
+       * Token that can be used to retrieve the next page of artifact results
+       * </pre>
+       *
+       * <code>optional string next_page_token = 3;</code>
+       * @return The nextPageToken.
+       */
+      java.lang.String getNextPageToken();
+      /**
+       * <pre>
+       * Token that can be used to retrieve the next page of artifact results
+       * </pre>
+       *
+       * <code>optional string next_page_token = 3;</code>
+       * @return The bytes for nextPageToken.
+       */
+      com.google.protobuf.ByteString
+          getNextPageTokenBytes();
+    }
+    /**
+     * Protobuf type {@code mlflow.ListArtifacts.Response}
+     */
+    public static final class Response extends
+        com.google.protobuf.GeneratedMessageV3 implements
+        // @@protoc_insertion_point(message_implements:mlflow.ListArtifacts.Response)
+        ResponseOrBuilder {
+    private static final long serialVersionUID = 0L;
+      // Use Response.newBuilder() to construct.
+      private Response(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+        super(builder);
+      }
+      private Response() {
+        rootUri_ = "";
+        files_ = java.util.Collections.emptyList();
+        nextPageToken_ = "";
+      }
+
+      @java.lang.Override
+      @SuppressWarnings({"unused"})
+      protected java.lang.Object newInstance(
+          UnusedPrivateParameter unused) {
+        return new Response();
+      }
+
+      @java.lang.Override
+      public final com.google.protobuf.UnknownFieldSet
+      getUnknownFields() {
+        return this.unknownFields;
+      }
+      private Response(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        this();
+        if (extensionRegistry == null) {
+          throw new java.lang.NullPointerException();
+        }
+        int mutable_bitField0_ = 0;
+        com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+            com.google.protobuf.UnknownFieldSet.newBuilder();
+        try {
+          boolean done = false;
+          while (!done) {
+            int tag = input.readTag();
+            switch (tag) {
+              case 0:
+                done = true;
+                break;
+              case 10: {
+                com.google.protobuf.ByteString bs = input.readBytes();
+                bitField0_ |= 0x00000001;
+                rootUri_ = bs;
+                break;
+              }
+              case 18: {
+                if (!((mutable_bitField0_ & 0x00000002) != 0)) {
+                  files_ = new java.util.ArrayList<org.mlflow.api.proto.Service.FileInfo>();
+                  mutable_bitField0_ |= 0x00000002;
+                }
+                files_.add(
+                    input.readMessage(org.mlflow.api.proto.Service.FileInfo.PARSER, extensionRegistry));
+                break;
+              }
+              case 26: {
+                com.google.protobuf.ByteString bs = input.readBytes();
+                bitField0_ |= 0x00000002;
+                nextPageToken_ = bs;
+                break;
+              }
+              default: {
+                if (!parseUnknownField(
+                    input, unknownFields, extensionRegistry, tag)) {
+                  done = true;
+                }
+                break;
+              }
+            }
+          }
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          throw e.setUnfinishedMessage(this);
+        } catch (java.io.IOException e) {
+          throw new com.google.protobuf.InvalidProtocolBufferException(
+              e).setUnfinishedMessage(this);
+        } finally {
+          if (((mutable_bitField0_ & 0x00000002) != 0)) {
+            files_ = java.util.Collections.unmodifiableList(files_);
+          }
+          this.unknownFields = unknownFields.build();
+          makeExtensionsImmutable();
+        }
+      }
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_ListArtifacts_Response_descriptor;
+      }
+
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_ListArtifacts_Response_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.ListArtifacts.Response.class, org.mlflow.api.proto.Service.ListArtifacts.Response.Builder.class);
+      }
+
+      private int bitField0_;
+      public static final int ROOT_URI_FIELD_NUMBER = 1;
+      private volatile java.lang.Object rootUri_;
+      /**
+       * <pre>
+       * Root artifact directory for the run.
+       * </pre>
+       *
+       * <code>optional string root_uri = 1;</code>
+       * @return Whether the rootUri field is set.
+       */
+      @java.lang.Override
+      public boolean hasRootUri() {
+        return ((bitField0_ & 0x00000001) != 0);
+      }
+      /**
+       * <pre>
+       * Root artifact directory for the run.
+       * </pre>
+       *
+       * <code>optional string root_uri = 1;</code>
+       * @return The rootUri.
+       */
+      @java.lang.Override
+      public java.lang.String getRootUri() {
+        java.lang.Object ref = rootUri_;
+        if (ref instanceof java.lang.String) {
+          return (java.lang.String) ref;
+        } else {
+          com.google.protobuf.ByteString bs = 
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            rootUri_ = s;
+          }
+          return s;
+        }
+      }
+      /**
+       * <pre>
+       * Root artifact directory for the run.
+       * </pre>
+       *
+       * <code>optional string root_uri = 1;</code>
+       * @return The bytes for rootUri.
+       */
+      @java.lang.Override
+      public com.google.protobuf.ByteString
+          getRootUriBytes() {
+        java.lang.Object ref = rootUri_;
+        if (ref instanceof java.lang.String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          rootUri_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
+      }
+
+      public static final int FILES_FIELD_NUMBER = 2;
+      private java.util.List<org.mlflow.api.proto.Service.FileInfo> files_;
+      /**
+       * <pre>
+       * File location and metadata for artifacts.
+       * </pre>
+       *
+       * <code>repeated .mlflow.FileInfo files = 2;</code>
+       */
+      @java.lang.Override
+      public java.util.List<org.mlflow.api.proto.Service.FileInfo> getFilesList() {
+        return files_;
+      }
+      /**
+       * <pre>
+       * File location and metadata for artifacts.
+       * </pre>
+       *
+       * <code>repeated .mlflow.FileInfo files = 2;</code>
+       */
+      @java.lang.Override
+      public java.util.List<? extends org.mlflow.api.proto.Service.FileInfoOrBuilder> 
+          getFilesOrBuilderList() {
+        return files_;
+      }
+      /**
+       * <pre>
+       * File location and metadata for artifacts.
+       * </pre>
+       *
+       * <code>repeated .mlflow.FileInfo files = 2;</code>
+       */
+      @java.lang.Override
+      public int getFilesCount() {
+        return files_.size();
+      }
+      /**
+       * <pre>
+       * File location and metadata for artifacts.
+       * </pre>
+       *
+       * <code>repeated .mlflow.FileInfo files = 2;</code>
+       */
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.FileInfo getFiles(int index) {
+        return files_.get(index);
+      }
+      /**
+       * <pre>
+       * File location and metadata for artifacts.
+       * </pre>
+       *
+       * <code>repeated .mlflow.FileInfo files = 2;</code>
+       */
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.FileInfoOrBuilder getFilesOrBuilder(
+          int index) {
+        return files_.get(index);
+      }
+
+      public static final int NEXT_PAGE_TOKEN_FIELD_NUMBER = 3;
+      private volatile java.lang.Object nextPageToken_;
+      /**
+       * <pre>
+       * Token that can be used to retrieve the next page of artifact results
+       * </pre>
+       *
+       * <code>optional string next_page_token = 3;</code>
+       * @return Whether the nextPageToken field is set.
+       */
+      @java.lang.Override
+      public boolean hasNextPageToken() {
+        return ((bitField0_ & 0x00000002) != 0);
+      }
+      /**
+       * <pre>
+       * Token that can be used to retrieve the next page of artifact results
+       * </pre>
+       *
+       * <code>optional string next_page_token = 3;</code>
+       * @return The nextPageToken.
+       */
+      @java.lang.Override
+      public java.lang.String getNextPageToken() {
+        java.lang.Object ref = nextPageToken_;
+        if (ref instanceof java.lang.String) {
+          return (java.lang.String) ref;
+        } else {
+          com.google.protobuf.ByteString bs = 
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            nextPageToken_ = s;
+          }
+          return s;
+        }
+      }
+      /**
+       * <pre>
+       * Token that can be used to retrieve the next page of artifact results
+       * </pre>
+       *
+       * <code>optional string next_page_token = 3;</code>
+       * @return The bytes for nextPageToken.
+       */
+      @java.lang.Override
+      public com.google.protobuf.ByteString
+          getNextPageTokenBytes() {
+        java.lang.Object ref = nextPageToken_;
+        if (ref instanceof java.lang.String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          nextPageToken_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
+      }
+
+      private byte memoizedIsInitialized = -1;
+      @java.lang.Override
+      public final boolean isInitialized() {
+        byte isInitialized = memoizedIsInitialized;
+        if (isInitialized == 1) return true;
+        if (isInitialized == 0) return false;
+
+        memoizedIsInitialized = 1;
+        return true;
+      }
+
+      @java.lang.Override
+      public void writeTo(com.google.protobuf.CodedOutputStream output)
+                          throws java.io.IOException {
+        if (((bitField0_ & 0x00000001) != 0)) {
+          com.google.protobuf.GeneratedMessageV3.writeString(output, 1, rootUri_);
+        }
+        for (int i = 0; i < files_.size(); i++) {
+          output.writeMessage(2, files_.get(i));
+        }
+        if (((bitField0_ & 0x00000002) != 0)) {
+          com.google.protobuf.GeneratedMessageV3.writeString(output, 3, nextPageToken_);
+        }
+        unknownFields.writeTo(output);
+      }
+
+      @java.lang.Override
+      public int getSerializedSize() {
+        int size = memoizedSize;
+        if (size != -1) return size;
+
+        size = 0;
+        if (((bitField0_ & 0x00000001) != 0)) {
+          size += com.google.protobuf.GeneratedMessageV3.computeStringSize(1, rootUri_);
+        }
+        for (int i = 0; i < files_.size(); i++) {
+          size += com.google.protobuf.CodedOutputStream
+            .computeMessageSize(2, files_.get(i));
+        }
+        if (((bitField0_ & 0x00000002) != 0)) {
+          size += com.google.protobuf.GeneratedMessageV3.computeStringSize(3, nextPageToken_);
+        }
+        size += unknownFields.getSerializedSize();
+        memoizedSize = size;
+        return size;
+      }
+
+      @java.lang.Override
+      public boolean equals(final java.lang.Object obj) {
+        if (obj == this) {
+         return true;
+        }
+        if (!(obj instanceof org.mlflow.api.proto.Service.ListArtifacts.Response)) {
+          return super.equals(obj);
+        }
+        org.mlflow.api.proto.Service.ListArtifacts.Response other = (org.mlflow.api.proto.Service.ListArtifacts.Response) obj;
+
+        if (hasRootUri() != other.hasRootUri()) return false;
+        if (hasRootUri()) {
+          if (!getRootUri()
+              .equals(other.getRootUri())) return false;
+        }
+        if (!getFilesList()
+            .equals(other.getFilesList())) return false;
+        if (hasNextPageToken() != other.hasNextPageToken()) return false;
+        if (hasNextPageToken()) {
+          if (!getNextPageToken()
+              .equals(other.getNextPageToken())) return false;
+        }
+        if (!unknownFields.equals(other.unknownFields)) return false;
+        return true;
+      }
+
+      @java.lang.Override
+      public int hashCode() {
+        if (memoizedHashCode != 0) {
+          return memoizedHashCode;
+        }
+        int hash = 41;
+        hash = (19 * hash) + getDescriptor().hashCode();
+        if (hasRootUri()) {
+          hash = (37 * hash) + ROOT_URI_FIELD_NUMBER;
+          hash = (53 * hash) + getRootUri().hashCode();
+        }
+        if (getFilesCount() > 0) {
+          hash = (37 * hash) + FILES_FIELD_NUMBER;
+          hash = (53 * hash) + getFilesList().hashCode();
+        }
+        if (hasNextPageToken()) {
+          hash = (37 * hash) + NEXT_PAGE_TOKEN_FIELD_NUMBER;
+          hash = (53 * hash) + getNextPageToken().hashCode();
+        }
+        hash = (29 * hash) + unknownFields.hashCode();
+        memoizedHashCode = hash;
+        return hash;
+      }
+
+      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseFrom(
+          java.nio.ByteBuffer data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseFrom(
+          java.nio.ByteBuffer data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseFrom(
+          com.google.protobuf.ByteString data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseFrom(
+          com.google.protobuf.ByteString data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseFrom(byte[] data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseFrom(
+          byte[] data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseDelimitedFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseDelimitedFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseFrom(
+          com.google.protobuf.CodedInputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.ListArtifacts.Response parseFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
+      }
+
+      @java.lang.Override
+      public Builder newBuilderForType() { return newBuilder(); }
+      public static Builder newBuilder() {
+        return DEFAULT_INSTANCE.toBuilder();
+      }
+      public static Builder newBuilder(org.mlflow.api.proto.Service.ListArtifacts.Response prototype) {
+        return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+      }
+      @java.lang.Override
+      public Builder toBuilder() {
+        return this == DEFAULT_INSTANCE
+            ? new Builder() : new Builder().mergeFrom(this);
+      }
+
+      @java.lang.Override
+      protected Builder newBuilderForType(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        Builder builder = new Builder(parent);
+        return builder;
+      }
+      /**
+       * Protobuf type {@code mlflow.ListArtifacts.Response}
+       */
+      public static final class Builder extends
+          com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+          // @@protoc_insertion_point(builder_implements:mlflow.ListArtifacts.Response)
+          org.mlflow.api.proto.Service.ListArtifacts.ResponseOrBuilder {
+        public static final com.google.protobuf.Descriptors.Descriptor
+            getDescriptor() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_ListArtifacts_Response_descriptor;
+        }
+
+        @java.lang.Override
+        protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+            internalGetFieldAccessorTable() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_ListArtifacts_Response_fieldAccessorTable
+              .ensureFieldAccessorsInitialized(
+                  org.mlflow.api.proto.Service.ListArtifacts.Response.class, org.mlflow.api.proto.Service.ListArtifacts.Response.Builder.class);
+        }
+
+        // Construct using org.mlflow.api.proto.Service.ListArtifacts.Response.newBuilder()
+        private Builder() {
+          maybeForceBuilderInitialization();
+        }
+
+        private Builder(
+            com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+          super(parent);
+          maybeForceBuilderInitialization();
+        }
+        private void maybeForceBuilderInitialization() {
+          if (com.google.protobuf.GeneratedMessageV3
+                  .alwaysUseFieldBuilders) {
+            getFilesFieldBuilder();
+          }
+        }
+        @java.lang.Override
+        public Builder clear() {
+          super.clear();
+          rootUri_ = "";
+          bitField0_ = (bitField0_ & ~0x00000001);
+          if (filesBuilder_ == null) {
+            files_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000002);
+          } else {
+            filesBuilder_.clear();
+          }
+          nextPageToken_ = "";
+          bitField0_ = (bitField0_ & ~0x00000004);
+          return this;
+        }
+
+        @java.lang.Override
+        public com.google.protobuf.Descriptors.Descriptor
+            getDescriptorForType() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_ListArtifacts_Response_descriptor;
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.ListArtifacts.Response getDefaultInstanceForType() {
+          return org.mlflow.api.proto.Service.ListArtifacts.Response.getDefaultInstance();
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.ListArtifacts.Response build() {
+          org.mlflow.api.proto.Service.ListArtifacts.Response result = buildPartial();
+          if (!result.isInitialized()) {
+            throw newUninitializedMessageException(result);
+          }
+          return result;
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.ListArtifacts.Response buildPartial() {
+          org.mlflow.api.proto.Service.ListArtifacts.Response result = new org.mlflow.api.proto.Service.ListArtifacts.Response(this);
+          int from_bitField0_ = bitField0_;
+          int to_bitField0_ = 0;
+          if (((from_bitField0_ & 0x00000001) != 0)) {
+            to_bitField0_ |= 0x00000001;
+          }
+          result.rootUri_ = rootUri_;
+          if (filesBuilder_ == null) {
+            if (((bitField0_ & 0x00000002) != 0)) {
+              files_ = java.util.Collections.unmodifiableList(files_);
+              bitField0_ = (bitField0_ & ~0x00000002);
+            }
+            result.files_ = files_;
+          } else {
+            result.files_ = filesBuilder_.build();
+          }
+          if (((from_bitField0_ & 0x00000004) != 0)) {
+            to_bitField0_ |= 0x00000002;
+          }
+          result.nextPageToken_ = nextPageToken_;
+          result.bitField0_ = to_bitField0_;
+          onBuilt();
+          return result;
+        }
+
+        @java.lang.Override
+        public Builder clone() {
+          return super.clone();
+        }
+        @java.lang.Override
+        public Builder setField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return super.setField(field, value);
+        }
+        @java.lang.Override
+        public Builder clearField(
+            com.google.protobuf.Descriptors.FieldDescriptor field) {
+          return super.clearField(field);
+        }
+        @java.lang.Override
+        public Builder clearOneof(
+            com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+          return super.clearOneof(oneof);
+        }
+        @java.lang.Override
+        public Builder setRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            int index, java.lang.Object value) {
+          return super.setRepeatedField(field, index, value);
+        }
+        @java.lang.Override
+        public Builder addRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return super.addRepeatedField(field, value);
+        }
+        @java.lang.Override
+        public Builder mergeFrom(com.google.protobuf.Message other) {
+          if (other instanceof org.mlflow.api.proto.Service.ListArtifacts.Response) {
+            return mergeFrom((org.mlflow.api.proto.Service.ListArtifacts.Response)other);
+          } else {
+            super.mergeFrom(other);
+            return this;
+          }
+        }
+
+        public Builder mergeFrom(org.mlflow.api.proto.Service.ListArtifacts.Response other) {
+          if (other == org.mlflow.api.proto.Service.ListArtifacts.Response.getDefaultInstance()) return this;
+          if (other.hasRootUri()) {
+            bitField0_ |= 0x00000001;
+            rootUri_ = other.rootUri_;
+            onChanged();
+          }
+          if (filesBuilder_ == null) {
+            if (!other.files_.isEmpty()) {
+              if (files_.isEmpty()) {
+                files_ = other.files_;
+                bitField0_ = (bitField0_ & ~0x00000002);
+              } else {
+                ensureFilesIsMutable();
+                files_.addAll(other.files_);
+              }
+              onChanged();
+            }
+          } else {
+            if (!other.files_.isEmpty()) {
+              if (filesBuilder_.isEmpty()) {
+                filesBuilder_.dispose();
+                filesBuilder_ = null;
+                files_ = other.files_;
+                bitField0_ = (bitField0_ & ~0x00000002);
+                filesBuilder_ = 
+                  com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
+                     getFilesFieldBuilder() : null;
+              } else {
+                filesBuilder_.addAllMessages(other.files_);
+              }
+            }
+          }
+          if (other.hasNextPageToken()) {
+            bitField0_ |= 0x00000004;
+            nextPageToken_ = other.nextPageToken_;
+            onChanged();
+          }
+          this.mergeUnknownFields(other.unknownFields);
+          onChanged();
+          return this;
+        }
+
+        @java.lang.Override
+        public final boolean isInitialized() {
+          return true;
+        }
+
+        @java.lang.Override
+        public Builder mergeFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws java.io.IOException {
+          org.mlflow.api.proto.Service.ListArtifacts.Response parsedMessage = null;
+          try {
+            parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+          } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+            parsedMessage = (org.mlflow.api.proto.Service.ListArtifacts.Response) e.getUnfinishedMessage();
+            throw e.unwrapIOException();
+          } finally {
+            if (parsedMessage != null) {
+              mergeFrom(parsedMessage);
+            }
+          }
+          return this;
+        }
+        private int bitField0_;
+
+        private java.lang.Object rootUri_ = "";
+        /**
+         * <pre>
+         * Root artifact directory for the run.
+         * </pre>
+         *
+         * <code>optional string root_uri = 1;</code>
+         * @return Whether the rootUri field is set.
+         */
+        public boolean hasRootUri() {
+          return ((bitField0_ & 0x00000001) != 0);
+        }
+        /**
+         * <pre>
+         * Root artifact directory for the run.
+         * </pre>
+         *
+         * <code>optional string root_uri = 1;</code>
+         * @return The rootUri.
+         */
+        public java.lang.String getRootUri() {
+          java.lang.Object ref = rootUri_;
+          if (!(ref instanceof java.lang.String)) {
+            com.google.protobuf.ByteString bs =
+                (com.google.protobuf.ByteString) ref;
+            java.lang.String s = bs.toStringUtf8();
+            if (bs.isValidUtf8()) {
+              rootUri_ = s;
+            }
+            return s;
+          } else {
+            return (java.lang.String) ref;
+          }
+        }
+        /**
+         * <pre>
+         * Root artifact directory for the run.
+         * </pre>
+         *
+         * <code>optional string root_uri = 1;</code>
+         * @return The bytes for rootUri.
+         */
+        public com.google.protobuf.ByteString
+            getRootUriBytes() {
+          java.lang.Object ref = rootUri_;
+          if (ref instanceof String) {
+            com.google.protobuf.ByteString b = 
+                com.google.protobuf.ByteString.copyFromUtf8(
+                    (java.lang.String) ref);
+            rootUri_ = b;
+            return b;
+          } else {
+            return (com.google.protobuf.ByteString) ref;
+          }
+        }
+        /**
+         * <pre>
+         * Root artifact directory for the run.
+         * </pre>
+         *
+         * <code>optional string root_uri = 1;</code>
+         * @param value The rootUri to set.
+         * @return This builder for chaining.
+         */
+        public Builder setRootUri(
+            java.lang.String value) {
+          if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000001;
+          rootUri_ = value;
+          onChanged();
+          return this;
+        }
+        /**
+         * <pre>
+         * Root artifact directory for the run.
+         * </pre>
+         *
+         * <code>optional string root_uri = 1;</code>
+         * @return This builder for chaining.
+         */
+        public Builder clearRootUri() {
+          bitField0_ = (bitField0_ & ~0x00000001);
+          rootUri_ = getDefaultInstance().getRootUri();
+          onChanged();
+          return this;
+        }
+        /**
+         * <pre>
+         * Root artifact directory for the run.
+         * </pre>
+         *
+         * <code>optional string root_uri = 1;</code>
+         * @param value The bytes for rootUri to set.
+         * @return This builder for chaining.
+         */
+        public Builder setRootUriBytes(
+            com.google.protobuf.ByteString value) {
+          if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000001;
+          rootUri_ = value;
+          onChanged();
+          return this;
+        }
+
+        private java.util.List<org.mlflow.api.proto.Service.FileInfo> files_ =
+          java.util.Collections.emptyList();
+        private void ensureFilesIsMutable() {
+          if (!((bitField0_ & 0x00000002) != 0)) {
+            files_ = new java.util.ArrayList<org.mlflow.api.proto.Service.FileInfo>(files_);
+            bitField0_ |= 0x00000002;
+           }
+        }
+
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.FileInfo, org.mlflow.api.proto.Service.FileInfo.Builder, org.mlflow.api.proto.Service.FileInfoOrBuilder> filesBuilder_;
+
+        /**
+         * <pre>
+         * File location and metadata for artifacts.
+         * </pre>
+         *
+         * <code>repeated .mlflow.FileInfo files = 2;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.FileInfo> getFilesList() {
+          if (filesBuilder_ == null) {
+            return java.util.Collections.unmodifiableList(files_);
+          } else {
+            return filesBuilder_.getMessageList();
+          }
+        }
+        /**
+         * <pre>
+         * File location and metadata for artifacts.
+         * </pre>
+         *
+         * <code>repeated .mlflow.FileInfo files = 2;</code>
+         */
+        public int getFilesCount() {
+          if (filesBuilder_ == null) {
+            return files_.size();
+          } else {
+            return filesBuilder_.getCount();
+          }
+        }
+        /**
+         * <pre>
+         * File location and metadata for artifacts.
+         * </pre>
+         *
+         * <code>repeated .mlflow.FileInfo files = 2;</code>
+         */
+        public org.mlflow.api.proto.Service.FileInfo getFiles(int index) {
+          if (filesBuilder_ == null) {
+            return files_.get(index);
+          } else {
+            return filesBuilder_.getMessage(index);
+          }
+        }
+        /**
+         * <pre>
+         * File location and metadata for artifacts.
+         * </pre>
+         *
+         * <code>repeated .mlflow.FileInfo files = 2;</code>
+         */
+        public Builder setFiles(
+            int index, org.mlflow.api.proto.Service.FileInfo value) {
+          if (filesBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureFilesIsMutable();
+            files_.set(index, value);
+            onChanged();
+          } else {
+            filesBuilder_.setMessage(index, value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * File location and metadata for artifacts.
+         * </pre>
+         *
+         * <code>repeated .mlflow.FileInfo files = 2;</code>
+         */
+        public Builder setFiles(
+            int index, org.mlflow.api.proto.Service.FileInfo.Builder builderForValue) {
+          if (filesBuilder_ == null) {
+            ensureFilesIsMutable();
+            files_.set(index, builderForValue.build());
+            onChanged();
+          } else {
+            filesBuilder_.setMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * File location and metadata for artifacts.
+         * </pre>
+         *
+         * <code>repeated .mlflow.FileInfo files = 2;</code>
+         */
+        public Builder addFiles(org.mlflow.api.proto.Service.FileInfo value) {
+          if (filesBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureFilesIsMutable();
+            files_.add(value);
+            onChanged();
+          } else {
+            filesBuilder_.addMessage(value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * File location and metadata for artifacts.
+         * </pre>
+         *
+         * <code>repeated .mlflow.FileInfo files = 2;</code>
+         */
+        public Builder addFiles(
+            int index, org.mlflow.api.proto.Service.FileInfo value) {
+          if (filesBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureFilesIsMutable();
+            files_.add(index, value);
+            onChanged();
+          } else {
+            filesBuilder_.addMessage(index, value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * File location and metadata for artifacts.
+         * </pre>
+         *
+         * <code>repeated .mlflow.FileInfo files = 2;</code>
+         */
+        public Builder addFiles(
+            org.mlflow.api.proto.Service.FileInfo.Builder builderForValue) {
+          if (filesBuilder_ == null) {
+            ensureFilesIsMutable();
+            files_.add(builderForValue.build());
+            onChanged();
+          } else {
+            filesBuilder_.addMessage(builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * File location and metadata for artifacts.
+         * </pre>
+         *
+         * <code>repeated .mlflow.FileInfo files = 2;</code>
+         */
+        public Builder addFiles(
+            int index, org.mlflow.api.proto.Service.FileInfo.Builder builderForValue) {
+          if (filesBuilder_ == null) {
+            ensureFilesIsMutable();
+            files_.add(index, builderForValue.build());
+            onChanged();
+          } else {
+            filesBuilder_.addMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * File location and metadata for artifacts.
+         * </pre>
+         *
+         * <code>repeated .mlflow.FileInfo files = 2;</code>
+         */
+        public Builder addAllFiles(
+            java.lang.Iterable<? extends org.mlflow.api.proto.Service.FileInfo> values) {
+          if (filesBuilder_ == null) {
+            ensureFilesIsMutable();
+            com.google.protobuf.AbstractMessageLite.Builder.addAll(
+                values, files_);
+            onChanged();
+          } else {
+            filesBuilder_.addAllMessages(values);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * File location and metadata for artifacts.
+         * </pre>
+         *
+         * <code>repeated .mlflow.FileInfo files = 2;</code>
+         */
+        public Builder clearFiles() {
+          if (filesBuilder_ == null) {
+            files_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000002);
+            onChanged();
+          } else {
+            filesBuilder_.clear();
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * File location and metadata for artifacts.
+         * </pre>
+         *
+         * <code>repeated .mlflow.FileInfo files = 2;</code>
+         */
+        public Builder removeFiles(int index) {
+          if (filesBuilder_ == null) {
+            ensureFilesIsMutable();
+            files_.remove(index);
+            onChanged();
+          } else {
+            filesBuilder_.remove(index);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * File location and metadata for artifacts.
+         * </pre>
+         *
+         * <code>repeated .mlflow.FileInfo files = 2;</code>
+         */
+        public org.mlflow.api.proto.Service.FileInfo.Builder getFilesBuilder(
+            int index) {
+          return getFilesFieldBuilder().getBuilder(index);
+        }
+        /**
+         * <pre>
+         * File location and metadata for artifacts.
+         * </pre>
+         *
+         * <code>repeated .mlflow.FileInfo files = 2;</code>
+         */
+        public org.mlflow.api.proto.Service.FileInfoOrBuilder getFilesOrBuilder(
+            int index) {
+          if (filesBuilder_ == null) {
+            return files_.get(index);  } else {
+            return filesBuilder_.getMessageOrBuilder(index);
+          }
+        }
+        /**
+         * <pre>
+         * File location and metadata for artifacts.
+         * </pre>
+         *
+         * <code>repeated .mlflow.FileInfo files = 2;</code>
+         */
+        public java.util.List<? extends org.mlflow.api.proto.Service.FileInfoOrBuilder> 
+             getFilesOrBuilderList() {
+          if (filesBuilder_ != null) {
+            return filesBuilder_.getMessageOrBuilderList();
+          } else {
+            return java.util.Collections.unmodifiableList(files_);
+          }
+        }
+        /**
+         * <pre>
+         * File location and metadata for artifacts.
+         * </pre>
+         *
+         * <code>repeated .mlflow.FileInfo files = 2;</code>
+         */
+        public org.mlflow.api.proto.Service.FileInfo.Builder addFilesBuilder() {
+          return getFilesFieldBuilder().addBuilder(
+              org.mlflow.api.proto.Service.FileInfo.getDefaultInstance());
+        }
+        /**
+         * <pre>
+         * File location and metadata for artifacts.
+         * </pre>
+         *
+         * <code>repeated .mlflow.FileInfo files = 2;</code>
+         */
+        public org.mlflow.api.proto.Service.FileInfo.Builder addFilesBuilder(
+            int index) {
+          return getFilesFieldBuilder().addBuilder(
+              index, org.mlflow.api.proto.Service.FileInfo.getDefaultInstance());
+        }
+        /**
+         * <pre>
          * File location and metadata for artifacts.
          * </pre>
          *
-         * <code>repeated .mlflow.FileInfo files = 2;</code>
+         * <code>repeated .mlflow.FileInfo files = 2;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.FileInfo.Builder> 
+             getFilesBuilderList() {
+          return getFilesFieldBuilder().getBuilderList();
+        }
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.FileInfo, org.mlflow.api.proto.Service.FileInfo.Builder, org.mlflow.api.proto.Service.FileInfoOrBuilder> 
+            getFilesFieldBuilder() {
+          if (filesBuilder_ == null) {
+            filesBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
+                org.mlflow.api.proto.Service.FileInfo, org.mlflow.api.proto.Service.FileInfo.Builder, org.mlflow.api.proto.Service.FileInfoOrBuilder>(
+                    files_,
+                    ((bitField0_ & 0x00000002) != 0),
+                    getParentForChildren(),
+                    isClean());
+            files_ = null;
+          }
+          return filesBuilder_;
+        }
+
+        private java.lang.Object nextPageToken_ = "";
+        /**
+         * <pre>
+         * Token that can be used to retrieve the next page of artifact results
+         * </pre>
+         *
+         * <code>optional string next_page_token = 3;</code>
+         * @return Whether the nextPageToken field is set.
+         */
+        public boolean hasNextPageToken() {
+          return ((bitField0_ & 0x00000004) != 0);
+        }
+        /**
+         * <pre>
+         * Token that can be used to retrieve the next page of artifact results
+         * </pre>
+         *
+         * <code>optional string next_page_token = 3;</code>
+         * @return The nextPageToken.
+         */
+        public java.lang.String getNextPageToken() {
+          java.lang.Object ref = nextPageToken_;
+          if (!(ref instanceof java.lang.String)) {
+            com.google.protobuf.ByteString bs =
+                (com.google.protobuf.ByteString) ref;
+            java.lang.String s = bs.toStringUtf8();
+            if (bs.isValidUtf8()) {
+              nextPageToken_ = s;
+            }
+            return s;
+          } else {
+            return (java.lang.String) ref;
+          }
+        }
+        /**
+         * <pre>
+         * Token that can be used to retrieve the next page of artifact results
+         * </pre>
+         *
+         * <code>optional string next_page_token = 3;</code>
+         * @return The bytes for nextPageToken.
+         */
+        public com.google.protobuf.ByteString
+            getNextPageTokenBytes() {
+          java.lang.Object ref = nextPageToken_;
+          if (ref instanceof String) {
+            com.google.protobuf.ByteString b = 
+                com.google.protobuf.ByteString.copyFromUtf8(
+                    (java.lang.String) ref);
+            nextPageToken_ = b;
+            return b;
+          } else {
+            return (com.google.protobuf.ByteString) ref;
+          }
+        }
+        /**
+         * <pre>
+         * Token that can be used to retrieve the next page of artifact results
+         * </pre>
+         *
+         * <code>optional string next_page_token = 3;</code>
+         * @param value The nextPageToken to set.
+         * @return This builder for chaining.
+         */
+        public Builder setNextPageToken(
+            java.lang.String value) {
+          if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000004;
+          nextPageToken_ = value;
+          onChanged();
+          return this;
+        }
+        /**
+         * <pre>
+         * Token that can be used to retrieve the next page of artifact results
+         * </pre>
+         *
+         * <code>optional string next_page_token = 3;</code>
+         * @return This builder for chaining.
          */
-        public org.mlflow.api.proto.Service.FileInfo getFiles(int index) {
-          if (filesBuilder_ == null) {
-            return files_.get(index);
-          } else {
-            return filesBuilder_.getMessage(index);
-          }
+        public Builder clearNextPageToken() {
+          bitField0_ = (bitField0_ & ~0x00000004);
+          nextPageToken_ = getDefaultInstance().getNextPageToken();
+          onChanged();
+          return this;
+        }
+        /**
+         * <pre>
+         * Token that can be used to retrieve the next page of artifact results
+         * </pre>
+         *
+         * <code>optional string next_page_token = 3;</code>
+         * @param value The bytes for nextPageToken to set.
+         * @return This builder for chaining.
+         */
+        public Builder setNextPageTokenBytes(
+            com.google.protobuf.ByteString value) {
+          if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000004;
+          nextPageToken_ = value;
+          onChanged();
+          return this;
+        }
+        @java.lang.Override
+        public final Builder setUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.setUnknownFields(unknownFields);
+        }
+
+        @java.lang.Override
+        public final Builder mergeUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.mergeUnknownFields(unknownFields);
+        }
+
+
+        // @@protoc_insertion_point(builder_scope:mlflow.ListArtifacts.Response)
+      }
+
+      // @@protoc_insertion_point(class_scope:mlflow.ListArtifacts.Response)
+      private static final org.mlflow.api.proto.Service.ListArtifacts.Response DEFAULT_INSTANCE;
+      static {
+        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.ListArtifacts.Response();
+      }
+
+      public static org.mlflow.api.proto.Service.ListArtifacts.Response getDefaultInstance() {
+        return DEFAULT_INSTANCE;
+      }
+
+      @java.lang.Deprecated public static final com.google.protobuf.Parser<Response>
+          PARSER = new com.google.protobuf.AbstractParser<Response>() {
+        @java.lang.Override
+        public Response parsePartialFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws com.google.protobuf.InvalidProtocolBufferException {
+          return new Response(input, extensionRegistry);
+        }
+      };
+
+      public static com.google.protobuf.Parser<Response> parser() {
+        return PARSER;
+      }
+
+      @java.lang.Override
+      public com.google.protobuf.Parser<Response> getParserForType() {
+        return PARSER;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.ListArtifacts.Response getDefaultInstanceForType() {
+        return DEFAULT_INSTANCE;
+      }
+
+    }
+
+    private int bitField0_;
+    public static final int RUN_ID_FIELD_NUMBER = 3;
+    private volatile java.lang.Object runId_;
+    /**
+     * <pre>
+     * ID of the run whose artifacts to list. Must be provided.
+     * </pre>
+     *
+     * <code>optional string run_id = 3;</code>
+     * @return Whether the runId field is set.
+     */
+    @java.lang.Override
+    public boolean hasRunId() {
+      return ((bitField0_ & 0x00000001) != 0);
+    }
+    /**
+     * <pre>
+     * ID of the run whose artifacts to list. Must be provided.
+     * </pre>
+     *
+     * <code>optional string run_id = 3;</code>
+     * @return The runId.
+     */
+    @java.lang.Override
+    public java.lang.String getRunId() {
+      java.lang.Object ref = runId_;
+      if (ref instanceof java.lang.String) {
+        return (java.lang.String) ref;
+      } else {
+        com.google.protobuf.ByteString bs = 
+            (com.google.protobuf.ByteString) ref;
+        java.lang.String s = bs.toStringUtf8();
+        if (bs.isValidUtf8()) {
+          runId_ = s;
+        }
+        return s;
+      }
+    }
+    /**
+     * <pre>
+     * ID of the run whose artifacts to list. Must be provided.
+     * </pre>
+     *
+     * <code>optional string run_id = 3;</code>
+     * @return The bytes for runId.
+     */
+    @java.lang.Override
+    public com.google.protobuf.ByteString
+        getRunIdBytes() {
+      java.lang.Object ref = runId_;
+      if (ref instanceof java.lang.String) {
+        com.google.protobuf.ByteString b = 
+            com.google.protobuf.ByteString.copyFromUtf8(
+                (java.lang.String) ref);
+        runId_ = b;
+        return b;
+      } else {
+        return (com.google.protobuf.ByteString) ref;
+      }
+    }
+
+    public static final int RUN_UUID_FIELD_NUMBER = 1;
+    private volatile java.lang.Object runUuid_;
+    /**
+     * <pre>
+     * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
+     * be removed in a future MLflow version.
+     * </pre>
+     *
+     * <code>optional string run_uuid = 1;</code>
+     * @return Whether the runUuid field is set.
+     */
+    @java.lang.Override
+    public boolean hasRunUuid() {
+      return ((bitField0_ & 0x00000002) != 0);
+    }
+    /**
+     * <pre>
+     * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
+     * be removed in a future MLflow version.
+     * </pre>
+     *
+     * <code>optional string run_uuid = 1;</code>
+     * @return The runUuid.
+     */
+    @java.lang.Override
+    public java.lang.String getRunUuid() {
+      java.lang.Object ref = runUuid_;
+      if (ref instanceof java.lang.String) {
+        return (java.lang.String) ref;
+      } else {
+        com.google.protobuf.ByteString bs = 
+            (com.google.protobuf.ByteString) ref;
+        java.lang.String s = bs.toStringUtf8();
+        if (bs.isValidUtf8()) {
+          runUuid_ = s;
+        }
+        return s;
+      }
+    }
+    /**
+     * <pre>
+     * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
+     * be removed in a future MLflow version.
+     * </pre>
+     *
+     * <code>optional string run_uuid = 1;</code>
+     * @return The bytes for runUuid.
+     */
+    @java.lang.Override
+    public com.google.protobuf.ByteString
+        getRunUuidBytes() {
+      java.lang.Object ref = runUuid_;
+      if (ref instanceof java.lang.String) {
+        com.google.protobuf.ByteString b = 
+            com.google.protobuf.ByteString.copyFromUtf8(
+                (java.lang.String) ref);
+        runUuid_ = b;
+        return b;
+      } else {
+        return (com.google.protobuf.ByteString) ref;
+      }
+    }
+
+    public static final int PATH_FIELD_NUMBER = 2;
+    private volatile java.lang.Object path_;
+    /**
+     * <pre>
+     * Filter artifacts matching this path (a relative path from the root artifact directory).
+     * </pre>
+     *
+     * <code>optional string path = 2;</code>
+     * @return Whether the path field is set.
+     */
+    @java.lang.Override
+    public boolean hasPath() {
+      return ((bitField0_ & 0x00000004) != 0);
+    }
+    /**
+     * <pre>
+     * Filter artifacts matching this path (a relative path from the root artifact directory).
+     * </pre>
+     *
+     * <code>optional string path = 2;</code>
+     * @return The path.
+     */
+    @java.lang.Override
+    public java.lang.String getPath() {
+      java.lang.Object ref = path_;
+      if (ref instanceof java.lang.String) {
+        return (java.lang.String) ref;
+      } else {
+        com.google.protobuf.ByteString bs = 
+            (com.google.protobuf.ByteString) ref;
+        java.lang.String s = bs.toStringUtf8();
+        if (bs.isValidUtf8()) {
+          path_ = s;
+        }
+        return s;
+      }
+    }
+    /**
+     * <pre>
+     * Filter artifacts matching this path (a relative path from the root artifact directory).
+     * </pre>
+     *
+     * <code>optional string path = 2;</code>
+     * @return The bytes for path.
+     */
+    @java.lang.Override
+    public com.google.protobuf.ByteString
+        getPathBytes() {
+      java.lang.Object ref = path_;
+      if (ref instanceof java.lang.String) {
+        com.google.protobuf.ByteString b = 
+            com.google.protobuf.ByteString.copyFromUtf8(
+                (java.lang.String) ref);
+        path_ = b;
+        return b;
+      } else {
+        return (com.google.protobuf.ByteString) ref;
+      }
+    }
+
+    public static final int PAGE_TOKEN_FIELD_NUMBER = 4;
+    private volatile java.lang.Object pageToken_;
+    /**
+     * <pre>
+     * Token indicating the page of artifact results to fetch
+     * </pre>
+     *
+     * <code>optional string page_token = 4;</code>
+     * @return Whether the pageToken field is set.
+     */
+    @java.lang.Override
+    public boolean hasPageToken() {
+      return ((bitField0_ & 0x00000008) != 0);
+    }
+    /**
+     * <pre>
+     * Token indicating the page of artifact results to fetch
+     * </pre>
+     *
+     * <code>optional string page_token = 4;</code>
+     * @return The pageToken.
+     */
+    @java.lang.Override
+    public java.lang.String getPageToken() {
+      java.lang.Object ref = pageToken_;
+      if (ref instanceof java.lang.String) {
+        return (java.lang.String) ref;
+      } else {
+        com.google.protobuf.ByteString bs = 
+            (com.google.protobuf.ByteString) ref;
+        java.lang.String s = bs.toStringUtf8();
+        if (bs.isValidUtf8()) {
+          pageToken_ = s;
+        }
+        return s;
+      }
+    }
+    /**
+     * <pre>
+     * Token indicating the page of artifact results to fetch
+     * </pre>
+     *
+     * <code>optional string page_token = 4;</code>
+     * @return The bytes for pageToken.
+     */
+    @java.lang.Override
+    public com.google.protobuf.ByteString
+        getPageTokenBytes() {
+      java.lang.Object ref = pageToken_;
+      if (ref instanceof java.lang.String) {
+        com.google.protobuf.ByteString b = 
+            com.google.protobuf.ByteString.copyFromUtf8(
+                (java.lang.String) ref);
+        pageToken_ = b;
+        return b;
+      } else {
+        return (com.google.protobuf.ByteString) ref;
+      }
+    }
+
+    private byte memoizedIsInitialized = -1;
+    @java.lang.Override
+    public final boolean isInitialized() {
+      byte isInitialized = memoizedIsInitialized;
+      if (isInitialized == 1) return true;
+      if (isInitialized == 0) return false;
+
+      memoizedIsInitialized = 1;
+      return true;
+    }
+
+    @java.lang.Override
+    public void writeTo(com.google.protobuf.CodedOutputStream output)
+                        throws java.io.IOException {
+      if (((bitField0_ & 0x00000002) != 0)) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 1, runUuid_);
+      }
+      if (((bitField0_ & 0x00000004) != 0)) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 2, path_);
+      }
+      if (((bitField0_ & 0x00000001) != 0)) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 3, runId_);
+      }
+      if (((bitField0_ & 0x00000008) != 0)) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 4, pageToken_);
+      }
+      unknownFields.writeTo(output);
+    }
+
+    @java.lang.Override
+    public int getSerializedSize() {
+      int size = memoizedSize;
+      if (size != -1) return size;
+
+      size = 0;
+      if (((bitField0_ & 0x00000002) != 0)) {
+        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(1, runUuid_);
+      }
+      if (((bitField0_ & 0x00000004) != 0)) {
+        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(2, path_);
+      }
+      if (((bitField0_ & 0x00000001) != 0)) {
+        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(3, runId_);
+      }
+      if (((bitField0_ & 0x00000008) != 0)) {
+        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(4, pageToken_);
+      }
+      size += unknownFields.getSerializedSize();
+      memoizedSize = size;
+      return size;
+    }
+
+    @java.lang.Override
+    public boolean equals(final java.lang.Object obj) {
+      if (obj == this) {
+       return true;
+      }
+      if (!(obj instanceof org.mlflow.api.proto.Service.ListArtifacts)) {
+        return super.equals(obj);
+      }
+      org.mlflow.api.proto.Service.ListArtifacts other = (org.mlflow.api.proto.Service.ListArtifacts) obj;
+
+      if (hasRunId() != other.hasRunId()) return false;
+      if (hasRunId()) {
+        if (!getRunId()
+            .equals(other.getRunId())) return false;
+      }
+      if (hasRunUuid() != other.hasRunUuid()) return false;
+      if (hasRunUuid()) {
+        if (!getRunUuid()
+            .equals(other.getRunUuid())) return false;
+      }
+      if (hasPath() != other.hasPath()) return false;
+      if (hasPath()) {
+        if (!getPath()
+            .equals(other.getPath())) return false;
+      }
+      if (hasPageToken() != other.hasPageToken()) return false;
+      if (hasPageToken()) {
+        if (!getPageToken()
+            .equals(other.getPageToken())) return false;
+      }
+      if (!unknownFields.equals(other.unknownFields)) return false;
+      return true;
+    }
+
+    @java.lang.Override
+    public int hashCode() {
+      if (memoizedHashCode != 0) {
+        return memoizedHashCode;
+      }
+      int hash = 41;
+      hash = (19 * hash) + getDescriptor().hashCode();
+      if (hasRunId()) {
+        hash = (37 * hash) + RUN_ID_FIELD_NUMBER;
+        hash = (53 * hash) + getRunId().hashCode();
+      }
+      if (hasRunUuid()) {
+        hash = (37 * hash) + RUN_UUID_FIELD_NUMBER;
+        hash = (53 * hash) + getRunUuid().hashCode();
+      }
+      if (hasPath()) {
+        hash = (37 * hash) + PATH_FIELD_NUMBER;
+        hash = (53 * hash) + getPath().hashCode();
+      }
+      if (hasPageToken()) {
+        hash = (37 * hash) + PAGE_TOKEN_FIELD_NUMBER;
+        hash = (53 * hash) + getPageToken().hashCode();
+      }
+      hash = (29 * hash) + unknownFields.hashCode();
+      memoizedHashCode = hash;
+      return hash;
+    }
+
+    public static org.mlflow.api.proto.Service.ListArtifacts parseFrom(
+        java.nio.ByteBuffer data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.ListArtifacts parseFrom(
+        java.nio.ByteBuffer data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.ListArtifacts parseFrom(
+        com.google.protobuf.ByteString data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.ListArtifacts parseFrom(
+        com.google.protobuf.ByteString data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.ListArtifacts parseFrom(byte[] data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.ListArtifacts parseFrom(
+        byte[] data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.ListArtifacts parseFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.ListArtifacts parseFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.ListArtifacts parseDelimitedFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.ListArtifacts parseDelimitedFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.ListArtifacts parseFrom(
+        com.google.protobuf.CodedInputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.ListArtifacts parseFrom(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+
+    @java.lang.Override
+    public Builder newBuilderForType() { return newBuilder(); }
+    public static Builder newBuilder() {
+      return DEFAULT_INSTANCE.toBuilder();
+    }
+    public static Builder newBuilder(org.mlflow.api.proto.Service.ListArtifacts prototype) {
+      return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+    }
+    @java.lang.Override
+    public Builder toBuilder() {
+      return this == DEFAULT_INSTANCE
+          ? new Builder() : new Builder().mergeFrom(this);
+    }
+
+    @java.lang.Override
+    protected Builder newBuilderForType(
+        com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+      Builder builder = new Builder(parent);
+      return builder;
+    }
+    /**
+     * Protobuf type {@code mlflow.ListArtifacts}
+     */
+    public static final class Builder extends
+        com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+        // @@protoc_insertion_point(builder_implements:mlflow.ListArtifacts)
+        org.mlflow.api.proto.Service.ListArtifactsOrBuilder {
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_ListArtifacts_descriptor;
+      }
+
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_ListArtifacts_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.ListArtifacts.class, org.mlflow.api.proto.Service.ListArtifacts.Builder.class);
+      }
+
+      // Construct using org.mlflow.api.proto.Service.ListArtifacts.newBuilder()
+      private Builder() {
+        maybeForceBuilderInitialization();
+      }
+
+      private Builder(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        super(parent);
+        maybeForceBuilderInitialization();
+      }
+      private void maybeForceBuilderInitialization() {
+        if (com.google.protobuf.GeneratedMessageV3
+                .alwaysUseFieldBuilders) {
         }
-        /**
-         * <pre>
-         * File location and metadata for artifacts.
-         * </pre>
-         *
-         * <code>repeated .mlflow.FileInfo files = 2;</code>
-         */
-        public Builder setFiles(
-            int index, org.mlflow.api.proto.Service.FileInfo value) {
-          if (filesBuilder_ == null) {
-            if (value == null) {
-              throw new NullPointerException();
-            }
-            ensureFilesIsMutable();
-            files_.set(index, value);
-            onChanged();
-          } else {
-            filesBuilder_.setMessage(index, value);
-          }
-          return this;
+      }
+      @java.lang.Override
+      public Builder clear() {
+        super.clear();
+        runId_ = "";
+        bitField0_ = (bitField0_ & ~0x00000001);
+        runUuid_ = "";
+        bitField0_ = (bitField0_ & ~0x00000002);
+        path_ = "";
+        bitField0_ = (bitField0_ & ~0x00000004);
+        pageToken_ = "";
+        bitField0_ = (bitField0_ & ~0x00000008);
+        return this;
+      }
+
+      @java.lang.Override
+      public com.google.protobuf.Descriptors.Descriptor
+          getDescriptorForType() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_ListArtifacts_descriptor;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.ListArtifacts getDefaultInstanceForType() {
+        return org.mlflow.api.proto.Service.ListArtifacts.getDefaultInstance();
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.ListArtifacts build() {
+        org.mlflow.api.proto.Service.ListArtifacts result = buildPartial();
+        if (!result.isInitialized()) {
+          throw newUninitializedMessageException(result);
         }
-        /**
-         * <pre>
-         * File location and metadata for artifacts.
-         * </pre>
-         *
-         * <code>repeated .mlflow.FileInfo files = 2;</code>
-         */
-        public Builder setFiles(
-            int index, org.mlflow.api.proto.Service.FileInfo.Builder builderForValue) {
-          if (filesBuilder_ == null) {
-            ensureFilesIsMutable();
-            files_.set(index, builderForValue.build());
-            onChanged();
-          } else {
-            filesBuilder_.setMessage(index, builderForValue.build());
-          }
-          return this;
+        return result;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.ListArtifacts buildPartial() {
+        org.mlflow.api.proto.Service.ListArtifacts result = new org.mlflow.api.proto.Service.ListArtifacts(this);
+        int from_bitField0_ = bitField0_;
+        int to_bitField0_ = 0;
+        if (((from_bitField0_ & 0x00000001) != 0)) {
+          to_bitField0_ |= 0x00000001;
         }
-        /**
-         * <pre>
-         * File location and metadata for artifacts.
-         * </pre>
-         *
-         * <code>repeated .mlflow.FileInfo files = 2;</code>
-         */
-        public Builder addFiles(org.mlflow.api.proto.Service.FileInfo value) {
-          if (filesBuilder_ == null) {
-            if (value == null) {
-              throw new NullPointerException();
-            }
-            ensureFilesIsMutable();
-            files_.add(value);
-            onChanged();
-          } else {
-            filesBuilder_.addMessage(value);
-          }
-          return this;
+        result.runId_ = runId_;
+        if (((from_bitField0_ & 0x00000002) != 0)) {
+          to_bitField0_ |= 0x00000002;
         }
-        /**
-         * <pre>
-         * File location and metadata for artifacts.
-         * </pre>
-         *
-         * <code>repeated .mlflow.FileInfo files = 2;</code>
-         */
-        public Builder addFiles(
-            int index, org.mlflow.api.proto.Service.FileInfo value) {
-          if (filesBuilder_ == null) {
-            if (value == null) {
-              throw new NullPointerException();
-            }
-            ensureFilesIsMutable();
-            files_.add(index, value);
-            onChanged();
-          } else {
-            filesBuilder_.addMessage(index, value);
-          }
-          return this;
+        result.runUuid_ = runUuid_;
+        if (((from_bitField0_ & 0x00000004) != 0)) {
+          to_bitField0_ |= 0x00000004;
         }
-        /**
-         * <pre>
-         * File location and metadata for artifacts.
-         * </pre>
-         *
-         * <code>repeated .mlflow.FileInfo files = 2;</code>
-         */
-        public Builder addFiles(
-            org.mlflow.api.proto.Service.FileInfo.Builder builderForValue) {
-          if (filesBuilder_ == null) {
-            ensureFilesIsMutable();
-            files_.add(builderForValue.build());
-            onChanged();
-          } else {
-            filesBuilder_.addMessage(builderForValue.build());
-          }
+        result.path_ = path_;
+        if (((from_bitField0_ & 0x00000008) != 0)) {
+          to_bitField0_ |= 0x00000008;
+        }
+        result.pageToken_ = pageToken_;
+        result.bitField0_ = to_bitField0_;
+        onBuilt();
+        return result;
+      }
+
+      @java.lang.Override
+      public Builder clone() {
+        return super.clone();
+      }
+      @java.lang.Override
+      public Builder setField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return super.setField(field, value);
+      }
+      @java.lang.Override
+      public Builder clearField(
+          com.google.protobuf.Descriptors.FieldDescriptor field) {
+        return super.clearField(field);
+      }
+      @java.lang.Override
+      public Builder clearOneof(
+          com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+        return super.clearOneof(oneof);
+      }
+      @java.lang.Override
+      public Builder setRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          int index, java.lang.Object value) {
+        return super.setRepeatedField(field, index, value);
+      }
+      @java.lang.Override
+      public Builder addRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return super.addRepeatedField(field, value);
+      }
+      @java.lang.Override
+      public Builder mergeFrom(com.google.protobuf.Message other) {
+        if (other instanceof org.mlflow.api.proto.Service.ListArtifacts) {
+          return mergeFrom((org.mlflow.api.proto.Service.ListArtifacts)other);
+        } else {
+          super.mergeFrom(other);
           return this;
         }
-        /**
-         * <pre>
-         * File location and metadata for artifacts.
-         * </pre>
-         *
-         * <code>repeated .mlflow.FileInfo files = 2;</code>
-         */
-        public Builder addFiles(
-            int index, org.mlflow.api.proto.Service.FileInfo.Builder builderForValue) {
-          if (filesBuilder_ == null) {
-            ensureFilesIsMutable();
-            files_.add(index, builderForValue.build());
-            onChanged();
-          } else {
-            filesBuilder_.addMessage(index, builderForValue.build());
+      }
+
+      public Builder mergeFrom(org.mlflow.api.proto.Service.ListArtifacts other) {
+        if (other == org.mlflow.api.proto.Service.ListArtifacts.getDefaultInstance()) return this;
+        if (other.hasRunId()) {
+          bitField0_ |= 0x00000001;
+          runId_ = other.runId_;
+          onChanged();
+        }
+        if (other.hasRunUuid()) {
+          bitField0_ |= 0x00000002;
+          runUuid_ = other.runUuid_;
+          onChanged();
+        }
+        if (other.hasPath()) {
+          bitField0_ |= 0x00000004;
+          path_ = other.path_;
+          onChanged();
+        }
+        if (other.hasPageToken()) {
+          bitField0_ |= 0x00000008;
+          pageToken_ = other.pageToken_;
+          onChanged();
+        }
+        this.mergeUnknownFields(other.unknownFields);
+        onChanged();
+        return this;
+      }
+
+      @java.lang.Override
+      public final boolean isInitialized() {
+        return true;
+      }
+
+      @java.lang.Override
+      public Builder mergeFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        org.mlflow.api.proto.Service.ListArtifacts parsedMessage = null;
+        try {
+          parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          parsedMessage = (org.mlflow.api.proto.Service.ListArtifacts) e.getUnfinishedMessage();
+          throw e.unwrapIOException();
+        } finally {
+          if (parsedMessage != null) {
+            mergeFrom(parsedMessage);
           }
-          return this;
         }
-        /**
-         * <pre>
-         * File location and metadata for artifacts.
-         * </pre>
-         *
-         * <code>repeated .mlflow.FileInfo files = 2;</code>
-         */
-        public Builder addAllFiles(
-            java.lang.Iterable<? extends org.mlflow.api.proto.Service.FileInfo> values) {
-          if (filesBuilder_ == null) {
-            ensureFilesIsMutable();
-            com.google.protobuf.AbstractMessageLite.Builder.addAll(
-                values, files_);
-            onChanged();
-          } else {
-            filesBuilder_.addAllMessages(values);
+        return this;
+      }
+      private int bitField0_;
+
+      private java.lang.Object runId_ = "";
+      /**
+       * <pre>
+       * ID of the run whose artifacts to list. Must be provided.
+       * </pre>
+       *
+       * <code>optional string run_id = 3;</code>
+       * @return Whether the runId field is set.
+       */
+      public boolean hasRunId() {
+        return ((bitField0_ & 0x00000001) != 0);
+      }
+      /**
+       * <pre>
+       * ID of the run whose artifacts to list. Must be provided.
+       * </pre>
+       *
+       * <code>optional string run_id = 3;</code>
+       * @return The runId.
+       */
+      public java.lang.String getRunId() {
+        java.lang.Object ref = runId_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            runId_ = s;
           }
-          return this;
+          return s;
+        } else {
+          return (java.lang.String) ref;
         }
-        /**
-         * <pre>
-         * File location and metadata for artifacts.
-         * </pre>
-         *
-         * <code>repeated .mlflow.FileInfo files = 2;</code>
-         */
-        public Builder clearFiles() {
-          if (filesBuilder_ == null) {
-            files_ = java.util.Collections.emptyList();
-            bitField0_ = (bitField0_ & ~0x00000002);
-            onChanged();
-          } else {
-            filesBuilder_.clear();
+      }
+      /**
+       * <pre>
+       * ID of the run whose artifacts to list. Must be provided.
+       * </pre>
+       *
+       * <code>optional string run_id = 3;</code>
+       * @return The bytes for runId.
+       */
+      public com.google.protobuf.ByteString
+          getRunIdBytes() {
+        java.lang.Object ref = runId_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          runId_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
+      }
+      /**
+       * <pre>
+       * ID of the run whose artifacts to list. Must be provided.
+       * </pre>
+       *
+       * <code>optional string run_id = 3;</code>
+       * @param value The runId to set.
+       * @return This builder for chaining.
+       */
+      public Builder setRunId(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000001;
+        runId_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * ID of the run whose artifacts to list. Must be provided.
+       * </pre>
+       *
+       * <code>optional string run_id = 3;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearRunId() {
+        bitField0_ = (bitField0_ & ~0x00000001);
+        runId_ = getDefaultInstance().getRunId();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * ID of the run whose artifacts to list. Must be provided.
+       * </pre>
+       *
+       * <code>optional string run_id = 3;</code>
+       * @param value The bytes for runId to set.
+       * @return This builder for chaining.
+       */
+      public Builder setRunIdBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000001;
+        runId_ = value;
+        onChanged();
+        return this;
+      }
+
+      private java.lang.Object runUuid_ = "";
+      /**
+       * <pre>
+       * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
+       * be removed in a future MLflow version.
+       * </pre>
+       *
+       * <code>optional string run_uuid = 1;</code>
+       * @return Whether the runUuid field is set.
+       */
+      public boolean hasRunUuid() {
+        return ((bitField0_ & 0x00000002) != 0);
+      }
+      /**
+       * <pre>
+       * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
+       * be removed in a future MLflow version.
+       * </pre>
+       *
+       * <code>optional string run_uuid = 1;</code>
+       * @return The runUuid.
+       */
+      public java.lang.String getRunUuid() {
+        java.lang.Object ref = runUuid_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            runUuid_ = s;
           }
-          return this;
+          return s;
+        } else {
+          return (java.lang.String) ref;
+        }
+      }
+      /**
+       * <pre>
+       * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
+       * be removed in a future MLflow version.
+       * </pre>
+       *
+       * <code>optional string run_uuid = 1;</code>
+       * @return The bytes for runUuid.
+       */
+      public com.google.protobuf.ByteString
+          getRunUuidBytes() {
+        java.lang.Object ref = runUuid_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          runUuid_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
         }
-        /**
-         * <pre>
-         * File location and metadata for artifacts.
-         * </pre>
-         *
-         * <code>repeated .mlflow.FileInfo files = 2;</code>
-         */
-        public Builder removeFiles(int index) {
-          if (filesBuilder_ == null) {
-            ensureFilesIsMutable();
-            files_.remove(index);
-            onChanged();
-          } else {
-            filesBuilder_.remove(index);
+      }
+      /**
+       * <pre>
+       * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
+       * be removed in a future MLflow version.
+       * </pre>
+       *
+       * <code>optional string run_uuid = 1;</code>
+       * @param value The runUuid to set.
+       * @return This builder for chaining.
+       */
+      public Builder setRunUuid(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000002;
+        runUuid_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
+       * be removed in a future MLflow version.
+       * </pre>
+       *
+       * <code>optional string run_uuid = 1;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearRunUuid() {
+        bitField0_ = (bitField0_ & ~0x00000002);
+        runUuid_ = getDefaultInstance().getRunUuid();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
+       * be removed in a future MLflow version.
+       * </pre>
+       *
+       * <code>optional string run_uuid = 1;</code>
+       * @param value The bytes for runUuid to set.
+       * @return This builder for chaining.
+       */
+      public Builder setRunUuidBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000002;
+        runUuid_ = value;
+        onChanged();
+        return this;
+      }
+
+      private java.lang.Object path_ = "";
+      /**
+       * <pre>
+       * Filter artifacts matching this path (a relative path from the root artifact directory).
+       * </pre>
+       *
+       * <code>optional string path = 2;</code>
+       * @return Whether the path field is set.
+       */
+      public boolean hasPath() {
+        return ((bitField0_ & 0x00000004) != 0);
+      }
+      /**
+       * <pre>
+       * Filter artifacts matching this path (a relative path from the root artifact directory).
+       * </pre>
+       *
+       * <code>optional string path = 2;</code>
+       * @return The path.
+       */
+      public java.lang.String getPath() {
+        java.lang.Object ref = path_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            path_ = s;
           }
-          return this;
+          return s;
+        } else {
+          return (java.lang.String) ref;
         }
-        /**
-         * <pre>
-         * File location and metadata for artifacts.
-         * </pre>
-         *
-         * <code>repeated .mlflow.FileInfo files = 2;</code>
-         */
-        public org.mlflow.api.proto.Service.FileInfo.Builder getFilesBuilder(
-            int index) {
-          return getFilesFieldBuilder().getBuilder(index);
+      }
+      /**
+       * <pre>
+       * Filter artifacts matching this path (a relative path from the root artifact directory).
+       * </pre>
+       *
+       * <code>optional string path = 2;</code>
+       * @return The bytes for path.
+       */
+      public com.google.protobuf.ByteString
+          getPathBytes() {
+        java.lang.Object ref = path_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          path_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
         }
-        /**
-         * <pre>
-         * File location and metadata for artifacts.
-         * </pre>
-         *
-         * <code>repeated .mlflow.FileInfo files = 2;</code>
-         */
-        public org.mlflow.api.proto.Service.FileInfoOrBuilder getFilesOrBuilder(
-            int index) {
-          if (filesBuilder_ == null) {
-            return files_.get(index);  } else {
-            return filesBuilder_.getMessageOrBuilder(index);
+      }
+      /**
+       * <pre>
+       * Filter artifacts matching this path (a relative path from the root artifact directory).
+       * </pre>
+       *
+       * <code>optional string path = 2;</code>
+       * @param value The path to set.
+       * @return This builder for chaining.
+       */
+      public Builder setPath(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000004;
+        path_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Filter artifacts matching this path (a relative path from the root artifact directory).
+       * </pre>
+       *
+       * <code>optional string path = 2;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearPath() {
+        bitField0_ = (bitField0_ & ~0x00000004);
+        path_ = getDefaultInstance().getPath();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Filter artifacts matching this path (a relative path from the root artifact directory).
+       * </pre>
+       *
+       * <code>optional string path = 2;</code>
+       * @param value The bytes for path to set.
+       * @return This builder for chaining.
+       */
+      public Builder setPathBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000004;
+        path_ = value;
+        onChanged();
+        return this;
+      }
+
+      private java.lang.Object pageToken_ = "";
+      /**
+       * <pre>
+       * Token indicating the page of artifact results to fetch
+       * </pre>
+       *
+       * <code>optional string page_token = 4;</code>
+       * @return Whether the pageToken field is set.
+       */
+      public boolean hasPageToken() {
+        return ((bitField0_ & 0x00000008) != 0);
+      }
+      /**
+       * <pre>
+       * Token indicating the page of artifact results to fetch
+       * </pre>
+       *
+       * <code>optional string page_token = 4;</code>
+       * @return The pageToken.
+       */
+      public java.lang.String getPageToken() {
+        java.lang.Object ref = pageToken_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            pageToken_ = s;
           }
+          return s;
+        } else {
+          return (java.lang.String) ref;
         }
-        /**
-         * <pre>
-         * File location and metadata for artifacts.
-         * </pre>
-         *
-         * <code>repeated .mlflow.FileInfo files = 2;</code>
-         */
-        public java.util.List<? extends org.mlflow.api.proto.Service.FileInfoOrBuilder> 
-             getFilesOrBuilderList() {
-          if (filesBuilder_ != null) {
-            return filesBuilder_.getMessageOrBuilderList();
-          } else {
-            return java.util.Collections.unmodifiableList(files_);
+      }
+      /**
+       * <pre>
+       * Token indicating the page of artifact results to fetch
+       * </pre>
+       *
+       * <code>optional string page_token = 4;</code>
+       * @return The bytes for pageToken.
+       */
+      public com.google.protobuf.ByteString
+          getPageTokenBytes() {
+        java.lang.Object ref = pageToken_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          pageToken_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
+      }
+      /**
+       * <pre>
+       * Token indicating the page of artifact results to fetch
+       * </pre>
+       *
+       * <code>optional string page_token = 4;</code>
+       * @param value The pageToken to set.
+       * @return This builder for chaining.
+       */
+      public Builder setPageToken(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000008;
+        pageToken_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Token indicating the page of artifact results to fetch
+       * </pre>
+       *
+       * <code>optional string page_token = 4;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearPageToken() {
+        bitField0_ = (bitField0_ & ~0x00000008);
+        pageToken_ = getDefaultInstance().getPageToken();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Token indicating the page of artifact results to fetch
+       * </pre>
+       *
+       * <code>optional string page_token = 4;</code>
+       * @param value The bytes for pageToken to set.
+       * @return This builder for chaining.
+       */
+      public Builder setPageTokenBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000008;
+        pageToken_ = value;
+        onChanged();
+        return this;
+      }
+      @java.lang.Override
+      public final Builder setUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.setUnknownFields(unknownFields);
+      }
+
+      @java.lang.Override
+      public final Builder mergeUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.mergeUnknownFields(unknownFields);
+      }
+
+
+      // @@protoc_insertion_point(builder_scope:mlflow.ListArtifacts)
+    }
+
+    // @@protoc_insertion_point(class_scope:mlflow.ListArtifacts)
+    private static final org.mlflow.api.proto.Service.ListArtifacts DEFAULT_INSTANCE;
+    static {
+      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.ListArtifacts();
+    }
+
+    public static org.mlflow.api.proto.Service.ListArtifacts getDefaultInstance() {
+      return DEFAULT_INSTANCE;
+    }
+
+    @java.lang.Deprecated public static final com.google.protobuf.Parser<ListArtifacts>
+        PARSER = new com.google.protobuf.AbstractParser<ListArtifacts>() {
+      @java.lang.Override
+      public ListArtifacts parsePartialFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return new ListArtifacts(input, extensionRegistry);
+      }
+    };
+
+    public static com.google.protobuf.Parser<ListArtifacts> parser() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public com.google.protobuf.Parser<ListArtifacts> getParserForType() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.ListArtifacts getDefaultInstanceForType() {
+      return DEFAULT_INSTANCE;
+    }
+
+  }
+
+  public interface FileInfoOrBuilder extends
+      // @@protoc_insertion_point(interface_extends:mlflow.FileInfo)
+      com.google.protobuf.MessageOrBuilder {
+
+    /**
+     * <pre>
+     * Path relative to the root artifact directory run.
+     * </pre>
+     *
+     * <code>optional string path = 1;</code>
+     * @return Whether the path field is set.
+     */
+    boolean hasPath();
+    /**
+     * <pre>
+     * Path relative to the root artifact directory run.
+     * </pre>
+     *
+     * <code>optional string path = 1;</code>
+     * @return The path.
+     */
+    java.lang.String getPath();
+    /**
+     * <pre>
+     * Path relative to the root artifact directory run.
+     * </pre>
+     *
+     * <code>optional string path = 1;</code>
+     * @return The bytes for path.
+     */
+    com.google.protobuf.ByteString
+        getPathBytes();
+
+    /**
+     * <pre>
+     * Whether the path is a directory.
+     * </pre>
+     *
+     * <code>optional bool is_dir = 2;</code>
+     * @return Whether the isDir field is set.
+     */
+    boolean hasIsDir();
+    /**
+     * <pre>
+     * Whether the path is a directory.
+     * </pre>
+     *
+     * <code>optional bool is_dir = 2;</code>
+     * @return The isDir.
+     */
+    boolean getIsDir();
+
+    /**
+     * <pre>
+     * Size in bytes. Unset for directories.
+     * </pre>
+     *
+     * <code>optional int64 file_size = 3;</code>
+     * @return Whether the fileSize field is set.
+     */
+    boolean hasFileSize();
+    /**
+     * <pre>
+     * Size in bytes. Unset for directories.
+     * </pre>
+     *
+     * <code>optional int64 file_size = 3;</code>
+     * @return The fileSize.
+     */
+    long getFileSize();
+  }
+  /**
+   * <pre>
+   * Metadata of a single artifact file or directory.
+   * </pre>
+   *
+   * Protobuf type {@code mlflow.FileInfo}
+   */
+  public static final class FileInfo extends
+      com.google.protobuf.GeneratedMessageV3 implements
+      // @@protoc_insertion_point(message_implements:mlflow.FileInfo)
+      FileInfoOrBuilder {
+  private static final long serialVersionUID = 0L;
+    // Use FileInfo.newBuilder() to construct.
+    private FileInfo(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+      super(builder);
+    }
+    private FileInfo() {
+      path_ = "";
+    }
+
+    @java.lang.Override
+    @SuppressWarnings({"unused"})
+    protected java.lang.Object newInstance(
+        UnusedPrivateParameter unused) {
+      return new FileInfo();
+    }
+
+    @java.lang.Override
+    public final com.google.protobuf.UnknownFieldSet
+    getUnknownFields() {
+      return this.unknownFields;
+    }
+    private FileInfo(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      this();
+      if (extensionRegistry == null) {
+        throw new java.lang.NullPointerException();
+      }
+      int mutable_bitField0_ = 0;
+      com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+          com.google.protobuf.UnknownFieldSet.newBuilder();
+      try {
+        boolean done = false;
+        while (!done) {
+          int tag = input.readTag();
+          switch (tag) {
+            case 0:
+              done = true;
+              break;
+            case 10: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000001;
+              path_ = bs;
+              break;
+            }
+            case 16: {
+              bitField0_ |= 0x00000002;
+              isDir_ = input.readBool();
+              break;
+            }
+            case 24: {
+              bitField0_ |= 0x00000004;
+              fileSize_ = input.readInt64();
+              break;
+            }
+            default: {
+              if (!parseUnknownField(
+                  input, unknownFields, extensionRegistry, tag)) {
+                done = true;
+              }
+              break;
+            }
           }
         }
-        /**
-         * <pre>
-         * File location and metadata for artifacts.
-         * </pre>
-         *
-         * <code>repeated .mlflow.FileInfo files = 2;</code>
-         */
-        public org.mlflow.api.proto.Service.FileInfo.Builder addFilesBuilder() {
-          return getFilesFieldBuilder().addBuilder(
-              org.mlflow.api.proto.Service.FileInfo.getDefaultInstance());
-        }
-        /**
-         * <pre>
-         * File location and metadata for artifacts.
-         * </pre>
-         *
-         * <code>repeated .mlflow.FileInfo files = 2;</code>
-         */
-        public org.mlflow.api.proto.Service.FileInfo.Builder addFilesBuilder(
-            int index) {
-          return getFilesFieldBuilder().addBuilder(
-              index, org.mlflow.api.proto.Service.FileInfo.getDefaultInstance());
-        }
-        /**
-         * <pre>
-         * File location and metadata for artifacts.
-         * </pre>
-         *
-         * <code>repeated .mlflow.FileInfo files = 2;</code>
-         */
-        public java.util.List<org.mlflow.api.proto.Service.FileInfo.Builder> 
-             getFilesBuilderList() {
-          return getFilesFieldBuilder().getBuilderList();
+      } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+        throw e.setUnfinishedMessage(this);
+      } catch (java.io.IOException e) {
+        throw new com.google.protobuf.InvalidProtocolBufferException(
+            e).setUnfinishedMessage(this);
+      } finally {
+        this.unknownFields = unknownFields.build();
+        makeExtensionsImmutable();
+      }
+    }
+    public static final com.google.protobuf.Descriptors.Descriptor
+        getDescriptor() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_FileInfo_descriptor;
+    }
+
+    @java.lang.Override
+    protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+        internalGetFieldAccessorTable() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_FileInfo_fieldAccessorTable
+          .ensureFieldAccessorsInitialized(
+              org.mlflow.api.proto.Service.FileInfo.class, org.mlflow.api.proto.Service.FileInfo.Builder.class);
+    }
+
+    private int bitField0_;
+    public static final int PATH_FIELD_NUMBER = 1;
+    private volatile java.lang.Object path_;
+    /**
+     * <pre>
+     * Path relative to the root artifact directory run.
+     * </pre>
+     *
+     * <code>optional string path = 1;</code>
+     * @return Whether the path field is set.
+     */
+    @java.lang.Override
+    public boolean hasPath() {
+      return ((bitField0_ & 0x00000001) != 0);
+    }
+    /**
+     * <pre>
+     * Path relative to the root artifact directory run.
+     * </pre>
+     *
+     * <code>optional string path = 1;</code>
+     * @return The path.
+     */
+    @java.lang.Override
+    public java.lang.String getPath() {
+      java.lang.Object ref = path_;
+      if (ref instanceof java.lang.String) {
+        return (java.lang.String) ref;
+      } else {
+        com.google.protobuf.ByteString bs = 
+            (com.google.protobuf.ByteString) ref;
+        java.lang.String s = bs.toStringUtf8();
+        if (bs.isValidUtf8()) {
+          path_ = s;
         }
-        private com.google.protobuf.RepeatedFieldBuilderV3<
-            org.mlflow.api.proto.Service.FileInfo, org.mlflow.api.proto.Service.FileInfo.Builder, org.mlflow.api.proto.Service.FileInfoOrBuilder> 
-            getFilesFieldBuilder() {
-          if (filesBuilder_ == null) {
-            filesBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
-                org.mlflow.api.proto.Service.FileInfo, org.mlflow.api.proto.Service.FileInfo.Builder, org.mlflow.api.proto.Service.FileInfoOrBuilder>(
-                    files_,
-                    ((bitField0_ & 0x00000002) != 0),
-                    getParentForChildren(),
-                    isClean());
-            files_ = null;
-          }
-          return filesBuilder_;
+        return s;
+      }
+    }
+    /**
+     * <pre>
+     * Path relative to the root artifact directory run.
+     * </pre>
+     *
+     * <code>optional string path = 1;</code>
+     * @return The bytes for path.
+     */
+    @java.lang.Override
+    public com.google.protobuf.ByteString
+        getPathBytes() {
+      java.lang.Object ref = path_;
+      if (ref instanceof java.lang.String) {
+        com.google.protobuf.ByteString b = 
+            com.google.protobuf.ByteString.copyFromUtf8(
+                (java.lang.String) ref);
+        path_ = b;
+        return b;
+      } else {
+        return (com.google.protobuf.ByteString) ref;
+      }
+    }
+
+    public static final int IS_DIR_FIELD_NUMBER = 2;
+    private boolean isDir_;
+    /**
+     * <pre>
+     * Whether the path is a directory.
+     * </pre>
+     *
+     * <code>optional bool is_dir = 2;</code>
+     * @return Whether the isDir field is set.
+     */
+    @java.lang.Override
+    public boolean hasIsDir() {
+      return ((bitField0_ & 0x00000002) != 0);
+    }
+    /**
+     * <pre>
+     * Whether the path is a directory.
+     * </pre>
+     *
+     * <code>optional bool is_dir = 2;</code>
+     * @return The isDir.
+     */
+    @java.lang.Override
+    public boolean getIsDir() {
+      return isDir_;
+    }
+
+    public static final int FILE_SIZE_FIELD_NUMBER = 3;
+    private long fileSize_;
+    /**
+     * <pre>
+     * Size in bytes. Unset for directories.
+     * </pre>
+     *
+     * <code>optional int64 file_size = 3;</code>
+     * @return Whether the fileSize field is set.
+     */
+    @java.lang.Override
+    public boolean hasFileSize() {
+      return ((bitField0_ & 0x00000004) != 0);
+    }
+    /**
+     * <pre>
+     * Size in bytes. Unset for directories.
+     * </pre>
+     *
+     * <code>optional int64 file_size = 3;</code>
+     * @return The fileSize.
+     */
+    @java.lang.Override
+    public long getFileSize() {
+      return fileSize_;
+    }
+
+    private byte memoizedIsInitialized = -1;
+    @java.lang.Override
+    public final boolean isInitialized() {
+      byte isInitialized = memoizedIsInitialized;
+      if (isInitialized == 1) return true;
+      if (isInitialized == 0) return false;
+
+      memoizedIsInitialized = 1;
+      return true;
+    }
+
+    @java.lang.Override
+    public void writeTo(com.google.protobuf.CodedOutputStream output)
+                        throws java.io.IOException {
+      if (((bitField0_ & 0x00000001) != 0)) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 1, path_);
+      }
+      if (((bitField0_ & 0x00000002) != 0)) {
+        output.writeBool(2, isDir_);
+      }
+      if (((bitField0_ & 0x00000004) != 0)) {
+        output.writeInt64(3, fileSize_);
+      }
+      unknownFields.writeTo(output);
+    }
+
+    @java.lang.Override
+    public int getSerializedSize() {
+      int size = memoizedSize;
+      if (size != -1) return size;
+
+      size = 0;
+      if (((bitField0_ & 0x00000001) != 0)) {
+        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(1, path_);
+      }
+      if (((bitField0_ & 0x00000002) != 0)) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeBoolSize(2, isDir_);
+      }
+      if (((bitField0_ & 0x00000004) != 0)) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeInt64Size(3, fileSize_);
+      }
+      size += unknownFields.getSerializedSize();
+      memoizedSize = size;
+      return size;
+    }
+
+    @java.lang.Override
+    public boolean equals(final java.lang.Object obj) {
+      if (obj == this) {
+       return true;
+      }
+      if (!(obj instanceof org.mlflow.api.proto.Service.FileInfo)) {
+        return super.equals(obj);
+      }
+      org.mlflow.api.proto.Service.FileInfo other = (org.mlflow.api.proto.Service.FileInfo) obj;
+
+      if (hasPath() != other.hasPath()) return false;
+      if (hasPath()) {
+        if (!getPath()
+            .equals(other.getPath())) return false;
+      }
+      if (hasIsDir() != other.hasIsDir()) return false;
+      if (hasIsDir()) {
+        if (getIsDir()
+            != other.getIsDir()) return false;
+      }
+      if (hasFileSize() != other.hasFileSize()) return false;
+      if (hasFileSize()) {
+        if (getFileSize()
+            != other.getFileSize()) return false;
+      }
+      if (!unknownFields.equals(other.unknownFields)) return false;
+      return true;
+    }
+
+    @java.lang.Override
+    public int hashCode() {
+      if (memoizedHashCode != 0) {
+        return memoizedHashCode;
+      }
+      int hash = 41;
+      hash = (19 * hash) + getDescriptor().hashCode();
+      if (hasPath()) {
+        hash = (37 * hash) + PATH_FIELD_NUMBER;
+        hash = (53 * hash) + getPath().hashCode();
+      }
+      if (hasIsDir()) {
+        hash = (37 * hash) + IS_DIR_FIELD_NUMBER;
+        hash = (53 * hash) + com.google.protobuf.Internal.hashBoolean(
+            getIsDir());
+      }
+      if (hasFileSize()) {
+        hash = (37 * hash) + FILE_SIZE_FIELD_NUMBER;
+        hash = (53 * hash) + com.google.protobuf.Internal.hashLong(
+            getFileSize());
+      }
+      hash = (29 * hash) + unknownFields.hashCode();
+      memoizedHashCode = hash;
+      return hash;
+    }
+
+    public static org.mlflow.api.proto.Service.FileInfo parseFrom(
+        java.nio.ByteBuffer data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.FileInfo parseFrom(
+        java.nio.ByteBuffer data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.FileInfo parseFrom(
+        com.google.protobuf.ByteString data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.FileInfo parseFrom(
+        com.google.protobuf.ByteString data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.FileInfo parseFrom(byte[] data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.FileInfo parseFrom(
+        byte[] data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.FileInfo parseFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.FileInfo parseFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.FileInfo parseDelimitedFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.FileInfo parseDelimitedFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.FileInfo parseFrom(
+        com.google.protobuf.CodedInputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.FileInfo parseFrom(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+
+    @java.lang.Override
+    public Builder newBuilderForType() { return newBuilder(); }
+    public static Builder newBuilder() {
+      return DEFAULT_INSTANCE.toBuilder();
+    }
+    public static Builder newBuilder(org.mlflow.api.proto.Service.FileInfo prototype) {
+      return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+    }
+    @java.lang.Override
+    public Builder toBuilder() {
+      return this == DEFAULT_INSTANCE
+          ? new Builder() : new Builder().mergeFrom(this);
+    }
+
+    @java.lang.Override
+    protected Builder newBuilderForType(
+        com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+      Builder builder = new Builder(parent);
+      return builder;
+    }
+    /**
+     * <pre>
+     * Metadata of a single artifact file or directory.
+     * </pre>
+     *
+     * Protobuf type {@code mlflow.FileInfo}
+     */
+    public static final class Builder extends
+        com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+        // @@protoc_insertion_point(builder_implements:mlflow.FileInfo)
+        org.mlflow.api.proto.Service.FileInfoOrBuilder {
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_FileInfo_descriptor;
+      }
+
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_FileInfo_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.FileInfo.class, org.mlflow.api.proto.Service.FileInfo.Builder.class);
+      }
+
+      // Construct using org.mlflow.api.proto.Service.FileInfo.newBuilder()
+      private Builder() {
+        maybeForceBuilderInitialization();
+      }
+
+      private Builder(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        super(parent);
+        maybeForceBuilderInitialization();
+      }
+      private void maybeForceBuilderInitialization() {
+        if (com.google.protobuf.GeneratedMessageV3
+                .alwaysUseFieldBuilders) {
         }
+      }
+      @java.lang.Override
+      public Builder clear() {
+        super.clear();
+        path_ = "";
+        bitField0_ = (bitField0_ & ~0x00000001);
+        isDir_ = false;
+        bitField0_ = (bitField0_ & ~0x00000002);
+        fileSize_ = 0L;
+        bitField0_ = (bitField0_ & ~0x00000004);
+        return this;
+      }
 
-        private java.lang.Object nextPageToken_ = "";
-        /**
-         * <pre>
-         * Token that can be used to retrieve the next page of artifact results
-         * </pre>
-         *
-         * <code>optional string next_page_token = 3;</code>
-         * @return Whether the nextPageToken field is set.
-         */
-        public boolean hasNextPageToken() {
-          return ((bitField0_ & 0x00000004) != 0);
+      @java.lang.Override
+      public com.google.protobuf.Descriptors.Descriptor
+          getDescriptorForType() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_FileInfo_descriptor;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.FileInfo getDefaultInstanceForType() {
+        return org.mlflow.api.proto.Service.FileInfo.getDefaultInstance();
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.FileInfo build() {
+        org.mlflow.api.proto.Service.FileInfo result = buildPartial();
+        if (!result.isInitialized()) {
+          throw newUninitializedMessageException(result);
         }
-        /**
-         * <pre>
-         * Token that can be used to retrieve the next page of artifact results
-         * </pre>
-         *
-         * <code>optional string next_page_token = 3;</code>
-         * @return The nextPageToken.
-         */
-        public java.lang.String getNextPageToken() {
-          java.lang.Object ref = nextPageToken_;
-          if (!(ref instanceof java.lang.String)) {
-            com.google.protobuf.ByteString bs =
-                (com.google.protobuf.ByteString) ref;
-            java.lang.String s = bs.toStringUtf8();
-            if (bs.isValidUtf8()) {
-              nextPageToken_ = s;
-            }
-            return s;
-          } else {
-            return (java.lang.String) ref;
-          }
+        return result;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.FileInfo buildPartial() {
+        org.mlflow.api.proto.Service.FileInfo result = new org.mlflow.api.proto.Service.FileInfo(this);
+        int from_bitField0_ = bitField0_;
+        int to_bitField0_ = 0;
+        if (((from_bitField0_ & 0x00000001) != 0)) {
+          to_bitField0_ |= 0x00000001;
         }
-        /**
-         * <pre>
-         * Token that can be used to retrieve the next page of artifact results
-         * </pre>
-         *
-         * <code>optional string next_page_token = 3;</code>
-         * @return The bytes for nextPageToken.
-         */
-        public com.google.protobuf.ByteString
-            getNextPageTokenBytes() {
-          java.lang.Object ref = nextPageToken_;
-          if (ref instanceof String) {
-            com.google.protobuf.ByteString b = 
-                com.google.protobuf.ByteString.copyFromUtf8(
-                    (java.lang.String) ref);
-            nextPageToken_ = b;
-            return b;
-          } else {
-            return (com.google.protobuf.ByteString) ref;
-          }
+        result.path_ = path_;
+        if (((from_bitField0_ & 0x00000002) != 0)) {
+          result.isDir_ = isDir_;
+          to_bitField0_ |= 0x00000002;
         }
-        /**
-         * <pre>
-         * Token that can be used to retrieve the next page of artifact results
-         * </pre>
-         *
-         * <code>optional string next_page_token = 3;</code>
-         * @param value The nextPageToken to set.
-         * @return This builder for chaining.
-         */
-        public Builder setNextPageToken(
-            java.lang.String value) {
-          if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000004;
-          nextPageToken_ = value;
-          onChanged();
-          return this;
+        if (((from_bitField0_ & 0x00000004) != 0)) {
+          result.fileSize_ = fileSize_;
+          to_bitField0_ |= 0x00000004;
         }
-        /**
-         * <pre>
-         * Token that can be used to retrieve the next page of artifact results
-         * </pre>
-         *
-         * <code>optional string next_page_token = 3;</code>
-         * @return This builder for chaining.
-         */
-        public Builder clearNextPageToken() {
-          bitField0_ = (bitField0_ & ~0x00000004);
-          nextPageToken_ = getDefaultInstance().getNextPageToken();
-          onChanged();
+        result.bitField0_ = to_bitField0_;
+        onBuilt();
+        return result;
+      }
+
+      @java.lang.Override
+      public Builder clone() {
+        return super.clone();
+      }
+      @java.lang.Override
+      public Builder setField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return super.setField(field, value);
+      }
+      @java.lang.Override
+      public Builder clearField(
+          com.google.protobuf.Descriptors.FieldDescriptor field) {
+        return super.clearField(field);
+      }
+      @java.lang.Override
+      public Builder clearOneof(
+          com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+        return super.clearOneof(oneof);
+      }
+      @java.lang.Override
+      public Builder setRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          int index, java.lang.Object value) {
+        return super.setRepeatedField(field, index, value);
+      }
+      @java.lang.Override
+      public Builder addRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return super.addRepeatedField(field, value);
+      }
+      @java.lang.Override
+      public Builder mergeFrom(com.google.protobuf.Message other) {
+        if (other instanceof org.mlflow.api.proto.Service.FileInfo) {
+          return mergeFrom((org.mlflow.api.proto.Service.FileInfo)other);
+        } else {
+          super.mergeFrom(other);
           return this;
         }
-        /**
-         * <pre>
-         * Token that can be used to retrieve the next page of artifact results
-         * </pre>
-         *
-         * <code>optional string next_page_token = 3;</code>
-         * @param value The bytes for nextPageToken to set.
-         * @return This builder for chaining.
-         */
-        public Builder setNextPageTokenBytes(
-            com.google.protobuf.ByteString value) {
-          if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000004;
-          nextPageToken_ = value;
+      }
+
+      public Builder mergeFrom(org.mlflow.api.proto.Service.FileInfo other) {
+        if (other == org.mlflow.api.proto.Service.FileInfo.getDefaultInstance()) return this;
+        if (other.hasPath()) {
+          bitField0_ |= 0x00000001;
+          path_ = other.path_;
           onChanged();
-          return this;
         }
-        @java.lang.Override
-        public final Builder setUnknownFields(
-            final com.google.protobuf.UnknownFieldSet unknownFields) {
-          return super.setUnknownFields(unknownFields);
+        if (other.hasIsDir()) {
+          setIsDir(other.getIsDir());
         }
-
-        @java.lang.Override
-        public final Builder mergeUnknownFields(
-            final com.google.protobuf.UnknownFieldSet unknownFields) {
-          return super.mergeUnknownFields(unknownFields);
+        if (other.hasFileSize()) {
+          setFileSize(other.getFileSize());
         }
-
-
-        // @@protoc_insertion_point(builder_scope:mlflow.ListArtifacts.Response)
+        this.mergeUnknownFields(other.unknownFields);
+        onChanged();
+        return this;
       }
 
-      // @@protoc_insertion_point(class_scope:mlflow.ListArtifacts.Response)
-      private static final org.mlflow.api.proto.Service.ListArtifacts.Response DEFAULT_INSTANCE;
-      static {
-        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.ListArtifacts.Response();
+      @java.lang.Override
+      public final boolean isInitialized() {
+        return true;
       }
 
-      public static org.mlflow.api.proto.Service.ListArtifacts.Response getDefaultInstance() {
-        return DEFAULT_INSTANCE;
+      @java.lang.Override
+      public Builder mergeFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        org.mlflow.api.proto.Service.FileInfo parsedMessage = null;
+        try {
+          parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          parsedMessage = (org.mlflow.api.proto.Service.FileInfo) e.getUnfinishedMessage();
+          throw e.unwrapIOException();
+        } finally {
+          if (parsedMessage != null) {
+            mergeFrom(parsedMessage);
+          }
+        }
+        return this;
       }
+      private int bitField0_;
 
-      @java.lang.Deprecated public static final com.google.protobuf.Parser<Response>
-          PARSER = new com.google.protobuf.AbstractParser<Response>() {
-        @java.lang.Override
-        public Response parsePartialFrom(
-            com.google.protobuf.CodedInputStream input,
-            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-            throws com.google.protobuf.InvalidProtocolBufferException {
-          return new Response(input, extensionRegistry);
+      private java.lang.Object path_ = "";
+      /**
+       * <pre>
+       * Path relative to the root artifact directory run.
+       * </pre>
+       *
+       * <code>optional string path = 1;</code>
+       * @return Whether the path field is set.
+       */
+      public boolean hasPath() {
+        return ((bitField0_ & 0x00000001) != 0);
+      }
+      /**
+       * <pre>
+       * Path relative to the root artifact directory run.
+       * </pre>
+       *
+       * <code>optional string path = 1;</code>
+       * @return The path.
+       */
+      public java.lang.String getPath() {
+        java.lang.Object ref = path_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            path_ = s;
+          }
+          return s;
+        } else {
+          return (java.lang.String) ref;
         }
-      };
+      }
+      /**
+       * <pre>
+       * Path relative to the root artifact directory run.
+       * </pre>
+       *
+       * <code>optional string path = 1;</code>
+       * @return The bytes for path.
+       */
+      public com.google.protobuf.ByteString
+          getPathBytes() {
+        java.lang.Object ref = path_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          path_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
+      }
+      /**
+       * <pre>
+       * Path relative to the root artifact directory run.
+       * </pre>
+       *
+       * <code>optional string path = 1;</code>
+       * @param value The path to set.
+       * @return This builder for chaining.
+       */
+      public Builder setPath(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000001;
+        path_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Path relative to the root artifact directory run.
+       * </pre>
+       *
+       * <code>optional string path = 1;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearPath() {
+        bitField0_ = (bitField0_ & ~0x00000001);
+        path_ = getDefaultInstance().getPath();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Path relative to the root artifact directory run.
+       * </pre>
+       *
+       * <code>optional string path = 1;</code>
+       * @param value The bytes for path to set.
+       * @return This builder for chaining.
+       */
+      public Builder setPathBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000001;
+        path_ = value;
+        onChanged();
+        return this;
+      }
 
-      public static com.google.protobuf.Parser<Response> parser() {
-        return PARSER;
+      private boolean isDir_ ;
+      /**
+       * <pre>
+       * Whether the path is a directory.
+       * </pre>
+       *
+       * <code>optional bool is_dir = 2;</code>
+       * @return Whether the isDir field is set.
+       */
+      @java.lang.Override
+      public boolean hasIsDir() {
+        return ((bitField0_ & 0x00000002) != 0);
+      }
+      /**
+       * <pre>
+       * Whether the path is a directory.
+       * </pre>
+       *
+       * <code>optional bool is_dir = 2;</code>
+       * @return The isDir.
+       */
+      @java.lang.Override
+      public boolean getIsDir() {
+        return isDir_;
+      }
+      /**
+       * <pre>
+       * Whether the path is a directory.
+       * </pre>
+       *
+       * <code>optional bool is_dir = 2;</code>
+       * @param value The isDir to set.
+       * @return This builder for chaining.
+       */
+      public Builder setIsDir(boolean value) {
+        bitField0_ |= 0x00000002;
+        isDir_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Whether the path is a directory.
+       * </pre>
+       *
+       * <code>optional bool is_dir = 2;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearIsDir() {
+        bitField0_ = (bitField0_ & ~0x00000002);
+        isDir_ = false;
+        onChanged();
+        return this;
       }
 
+      private long fileSize_ ;
+      /**
+       * <pre>
+       * Size in bytes. Unset for directories.
+       * </pre>
+       *
+       * <code>optional int64 file_size = 3;</code>
+       * @return Whether the fileSize field is set.
+       */
       @java.lang.Override
-      public com.google.protobuf.Parser<Response> getParserForType() {
-        return PARSER;
+      public boolean hasFileSize() {
+        return ((bitField0_ & 0x00000004) != 0);
+      }
+      /**
+       * <pre>
+       * Size in bytes. Unset for directories.
+       * </pre>
+       *
+       * <code>optional int64 file_size = 3;</code>
+       * @return The fileSize.
+       */
+      @java.lang.Override
+      public long getFileSize() {
+        return fileSize_;
+      }
+      /**
+       * <pre>
+       * Size in bytes. Unset for directories.
+       * </pre>
+       *
+       * <code>optional int64 file_size = 3;</code>
+       * @param value The fileSize to set.
+       * @return This builder for chaining.
+       */
+      public Builder setFileSize(long value) {
+        bitField0_ |= 0x00000004;
+        fileSize_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Size in bytes. Unset for directories.
+       * </pre>
+       *
+       * <code>optional int64 file_size = 3;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearFileSize() {
+        bitField0_ = (bitField0_ & ~0x00000004);
+        fileSize_ = 0L;
+        onChanged();
+        return this;
+      }
+      @java.lang.Override
+      public final Builder setUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.setUnknownFields(unknownFields);
       }
 
       @java.lang.Override
-      public org.mlflow.api.proto.Service.ListArtifacts.Response getDefaultInstanceForType() {
-        return DEFAULT_INSTANCE;
+      public final Builder mergeUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.mergeUnknownFields(unknownFields);
       }
 
+
+      // @@protoc_insertion_point(builder_scope:mlflow.FileInfo)
     }
 
-    private int bitField0_;
-    public static final int RUN_ID_FIELD_NUMBER = 3;
-    private volatile java.lang.Object runId_;
+    // @@protoc_insertion_point(class_scope:mlflow.FileInfo)
+    private static final org.mlflow.api.proto.Service.FileInfo DEFAULT_INSTANCE;
+    static {
+      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.FileInfo();
+    }
+
+    public static org.mlflow.api.proto.Service.FileInfo getDefaultInstance() {
+      return DEFAULT_INSTANCE;
+    }
+
+    @java.lang.Deprecated public static final com.google.protobuf.Parser<FileInfo>
+        PARSER = new com.google.protobuf.AbstractParser<FileInfo>() {
+      @java.lang.Override
+      public FileInfo parsePartialFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return new FileInfo(input, extensionRegistry);
+      }
+    };
+
+    public static com.google.protobuf.Parser<FileInfo> parser() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public com.google.protobuf.Parser<FileInfo> getParserForType() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.FileInfo getDefaultInstanceForType() {
+      return DEFAULT_INSTANCE;
+    }
+
+  }
+
+  public interface GetMetricHistoryOrBuilder extends
+      // @@protoc_insertion_point(interface_extends:mlflow.GetMetricHistory)
+      com.google.protobuf.MessageOrBuilder {
+
     /**
      * <pre>
-     * ID of the run whose artifacts to list. Must be provided.
+     * ID of the run from which to fetch metric values. Must be provided.
      * </pre>
      *
      * <code>optional string run_id = 3;</code>
      * @return Whether the runId field is set.
      */
-    @java.lang.Override
-    public boolean hasRunId() {
-      return ((bitField0_ & 0x00000001) != 0);
-    }
+    boolean hasRunId();
     /**
      * <pre>
-     * ID of the run whose artifacts to list. Must be provided.
+     * ID of the run from which to fetch metric values. Must be provided.
      * </pre>
      *
      * <code>optional string run_id = 3;</code>
      * @return The runId.
      */
-    @java.lang.Override
-    public java.lang.String getRunId() {
-      java.lang.Object ref = runId_;
-      if (ref instanceof java.lang.String) {
-        return (java.lang.String) ref;
-      } else {
-        com.google.protobuf.ByteString bs = 
-            (com.google.protobuf.ByteString) ref;
-        java.lang.String s = bs.toStringUtf8();
-        if (bs.isValidUtf8()) {
-          runId_ = s;
-        }
-        return s;
-      }
-    }
+    java.lang.String getRunId();
     /**
      * <pre>
-     * ID of the run whose artifacts to list. Must be provided.
+     * ID of the run from which to fetch metric values. Must be provided.
      * </pre>
      *
      * <code>optional string run_id = 3;</code>
      * @return The bytes for runId.
      */
-    @java.lang.Override
-    public com.google.protobuf.ByteString
-        getRunIdBytes() {
-      java.lang.Object ref = runId_;
-      if (ref instanceof java.lang.String) {
-        com.google.protobuf.ByteString b = 
-            com.google.protobuf.ByteString.copyFromUtf8(
-                (java.lang.String) ref);
-        runId_ = b;
-        return b;
-      } else {
-        return (com.google.protobuf.ByteString) ref;
-      }
-    }
+    com.google.protobuf.ByteString
+        getRunIdBytes();
+
+    /**
+     * <pre>
+     * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
+     * will be removed in a future MLflow version.
+     * </pre>
+     *
+     * <code>optional string run_uuid = 1;</code>
+     * @return Whether the runUuid field is set.
+     */
+    boolean hasRunUuid();
+    /**
+     * <pre>
+     * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
+     * will be removed in a future MLflow version.
+     * </pre>
+     *
+     * <code>optional string run_uuid = 1;</code>
+     * @return The runUuid.
+     */
+    java.lang.String getRunUuid();
+    /**
+     * <pre>
+     * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
+     * will be removed in a future MLflow version.
+     * </pre>
+     *
+     * <code>optional string run_uuid = 1;</code>
+     * @return The bytes for runUuid.
+     */
+    com.google.protobuf.ByteString
+        getRunUuidBytes();
+
+    /**
+     * <pre>
+     * Name of the metric.
+     * </pre>
+     *
+     * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+     * @return Whether the metricKey field is set.
+     */
+    boolean hasMetricKey();
+    /**
+     * <pre>
+     * Name of the metric.
+     * </pre>
+     *
+     * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+     * @return The metricKey.
+     */
+    java.lang.String getMetricKey();
+    /**
+     * <pre>
+     * Name of the metric.
+     * </pre>
+     *
+     * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+     * @return The bytes for metricKey.
+     */
+    com.google.protobuf.ByteString
+        getMetricKeyBytes();
 
-    public static final int RUN_UUID_FIELD_NUMBER = 1;
-    private volatile java.lang.Object runUuid_;
     /**
      * <pre>
-     * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
-     * be removed in a future MLflow version.
+     * Token indicating the page of metric history to fetch
      * </pre>
      *
-     * <code>optional string run_uuid = 1;</code>
-     * @return Whether the runUuid field is set.
+     * <code>optional string page_token = 4;</code>
+     * @return Whether the pageToken field is set.
      */
-    @java.lang.Override
-    public boolean hasRunUuid() {
-      return ((bitField0_ & 0x00000002) != 0);
-    }
+    boolean hasPageToken();
     /**
      * <pre>
-     * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
-     * be removed in a future MLflow version.
+     * Token indicating the page of metric history to fetch
      * </pre>
      *
-     * <code>optional string run_uuid = 1;</code>
-     * @return The runUuid.
+     * <code>optional string page_token = 4;</code>
+     * @return The pageToken.
      */
-    @java.lang.Override
-    public java.lang.String getRunUuid() {
-      java.lang.Object ref = runUuid_;
-      if (ref instanceof java.lang.String) {
-        return (java.lang.String) ref;
-      } else {
-        com.google.protobuf.ByteString bs = 
-            (com.google.protobuf.ByteString) ref;
-        java.lang.String s = bs.toStringUtf8();
-        if (bs.isValidUtf8()) {
-          runUuid_ = s;
-        }
-        return s;
-      }
-    }
+    java.lang.String getPageToken();
     /**
      * <pre>
-     * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
-     * be removed in a future MLflow version.
+     * Token indicating the page of metric history to fetch
      * </pre>
      *
-     * <code>optional string run_uuid = 1;</code>
-     * @return The bytes for runUuid.
+     * <code>optional string page_token = 4;</code>
+     * @return The bytes for pageToken.
      */
-    @java.lang.Override
-    public com.google.protobuf.ByteString
-        getRunUuidBytes() {
-      java.lang.Object ref = runUuid_;
-      if (ref instanceof java.lang.String) {
-        com.google.protobuf.ByteString b = 
-            com.google.protobuf.ByteString.copyFromUtf8(
-                (java.lang.String) ref);
-        runUuid_ = b;
-        return b;
-      } else {
-        return (com.google.protobuf.ByteString) ref;
-      }
-    }
+    com.google.protobuf.ByteString
+        getPageTokenBytes();
 
-    public static final int PATH_FIELD_NUMBER = 2;
-    private volatile java.lang.Object path_;
     /**
      * <pre>
-     * Filter artifacts matching this path (a relative path from the root artifact directory).
+     * Maximum number of logged instances of a metric for a run to return per call.
+     * Backend servers may restrict the value of `max_results` depending on performance requirements.
+     * Requests that do not specify this value will behave as non-paginated queries where all
+     * metric history values for a given metric within a run are returned in a single response.
      * </pre>
      *
-     * <code>optional string path = 2;</code>
-     * @return Whether the path field is set.
+     * <code>optional int32 max_results = 5;</code>
+     * @return Whether the maxResults field is set.
      */
-    @java.lang.Override
-    public boolean hasPath() {
-      return ((bitField0_ & 0x00000004) != 0);
-    }
+    boolean hasMaxResults();
     /**
      * <pre>
-     * Filter artifacts matching this path (a relative path from the root artifact directory).
+     * Maximum number of logged instances of a metric for a run to return per call.
+     * Backend servers may restrict the value of `max_results` depending on performance requirements.
+     * Requests that do not specify this value will behave as non-paginated queries where all
+     * metric history values for a given metric within a run are returned in a single response.
      * </pre>
      *
-     * <code>optional string path = 2;</code>
-     * @return The path.
+     * <code>optional int32 max_results = 5;</code>
+     * @return The maxResults.
      */
+    int getMaxResults();
+  }
+  /**
+   * Protobuf type {@code mlflow.GetMetricHistory}
+   */
+  public static final class GetMetricHistory extends
+      com.google.protobuf.GeneratedMessageV3 implements
+      // @@protoc_insertion_point(message_implements:mlflow.GetMetricHistory)
+      GetMetricHistoryOrBuilder {
+  private static final long serialVersionUID = 0L;
+    // Use GetMetricHistory.newBuilder() to construct.
+    private GetMetricHistory(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+      super(builder);
+    }
+    private GetMetricHistory() {
+      runId_ = "";
+      runUuid_ = "";
+      metricKey_ = "";
+      pageToken_ = "";
+    }
+
     @java.lang.Override
-    public java.lang.String getPath() {
-      java.lang.Object ref = path_;
-      if (ref instanceof java.lang.String) {
-        return (java.lang.String) ref;
-      } else {
-        com.google.protobuf.ByteString bs = 
-            (com.google.protobuf.ByteString) ref;
-        java.lang.String s = bs.toStringUtf8();
-        if (bs.isValidUtf8()) {
-          path_ = s;
+    @SuppressWarnings({"unused"})
+    protected java.lang.Object newInstance(
+        UnusedPrivateParameter unused) {
+      return new GetMetricHistory();
+    }
+
+    @java.lang.Override
+    public final com.google.protobuf.UnknownFieldSet
+    getUnknownFields() {
+      return this.unknownFields;
+    }
+    private GetMetricHistory(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      this();
+      if (extensionRegistry == null) {
+        throw new java.lang.NullPointerException();
+      }
+      int mutable_bitField0_ = 0;
+      com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+          com.google.protobuf.UnknownFieldSet.newBuilder();
+      try {
+        boolean done = false;
+        while (!done) {
+          int tag = input.readTag();
+          switch (tag) {
+            case 0:
+              done = true;
+              break;
+            case 10: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000002;
+              runUuid_ = bs;
+              break;
+            }
+            case 18: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000004;
+              metricKey_ = bs;
+              break;
+            }
+            case 26: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000001;
+              runId_ = bs;
+              break;
+            }
+            case 34: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000008;
+              pageToken_ = bs;
+              break;
+            }
+            case 40: {
+              bitField0_ |= 0x00000010;
+              maxResults_ = input.readInt32();
+              break;
+            }
+            default: {
+              if (!parseUnknownField(
+                  input, unknownFields, extensionRegistry, tag)) {
+                done = true;
+              }
+              break;
+            }
+          }
+        }
+      } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+        throw e.setUnfinishedMessage(this);
+      } catch (java.io.IOException e) {
+        throw new com.google.protobuf.InvalidProtocolBufferException(
+            e).setUnfinishedMessage(this);
+      } finally {
+        this.unknownFields = unknownFields.build();
+        makeExtensionsImmutable();
+      }
+    }
+    public static final com.google.protobuf.Descriptors.Descriptor
+        getDescriptor() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistory_descriptor;
+    }
+
+    @java.lang.Override
+    protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+        internalGetFieldAccessorTable() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistory_fieldAccessorTable
+          .ensureFieldAccessorsInitialized(
+              org.mlflow.api.proto.Service.GetMetricHistory.class, org.mlflow.api.proto.Service.GetMetricHistory.Builder.class);
+    }
+
+    public interface ResponseOrBuilder extends
+        // @@protoc_insertion_point(interface_extends:mlflow.GetMetricHistory.Response)
+        com.google.protobuf.MessageOrBuilder {
+
+      /**
+       * <pre>
+       * All logged values for this metric.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 1;</code>
+       */
+      java.util.List<org.mlflow.api.proto.Service.Metric> 
+          getMetricsList();
+      /**
+       * <pre>
+       * All logged values for this metric.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 1;</code>
+       */
+      org.mlflow.api.proto.Service.Metric getMetrics(int index);
+      /**
+       * <pre>
+       * All logged values for this metric.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 1;</code>
+       */
+      int getMetricsCount();
+      /**
+       * <pre>
+       * All logged values for this metric.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 1;</code>
+       */
+      java.util.List<? extends org.mlflow.api.proto.Service.MetricOrBuilder> 
+          getMetricsOrBuilderList();
+      /**
+       * <pre>
+       * All logged values for this metric.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 1;</code>
+       */
+      org.mlflow.api.proto.Service.MetricOrBuilder getMetricsOrBuilder(
+          int index);
+
+      /**
+       * <pre>
+       * Token that can be used to issue a query for the next page of metric history values.
+       * A missing token indicates that no additional metrics are available to fetch.
+       * </pre>
+       *
+       * <code>optional string next_page_token = 2;</code>
+       * @return Whether the nextPageToken field is set.
+       */
+      boolean hasNextPageToken();
+      /**
+       * <pre>
+       * Token that can be used to issue a query for the next page of metric history values.
+       * A missing token indicates that no additional metrics are available to fetch.
+       * </pre>
+       *
+       * <code>optional string next_page_token = 2;</code>
+       * @return The nextPageToken.
+       */
+      java.lang.String getNextPageToken();
+      /**
+       * <pre>
+       * Token that can be used to issue a query for the next page of metric history values.
+       * A missing token indicates that no additional metrics are available to fetch.
+       * </pre>
+       *
+       * <code>optional string next_page_token = 2;</code>
+       * @return The bytes for nextPageToken.
+       */
+      com.google.protobuf.ByteString
+          getNextPageTokenBytes();
+    }
+    /**
+     * Protobuf type {@code mlflow.GetMetricHistory.Response}
+     */
+    public static final class Response extends
+        com.google.protobuf.GeneratedMessageV3 implements
+        // @@protoc_insertion_point(message_implements:mlflow.GetMetricHistory.Response)
+        ResponseOrBuilder {
+    private static final long serialVersionUID = 0L;
+      // Use Response.newBuilder() to construct.
+      private Response(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+        super(builder);
+      }
+      private Response() {
+        metrics_ = java.util.Collections.emptyList();
+        nextPageToken_ = "";
+      }
+
+      @java.lang.Override
+      @SuppressWarnings({"unused"})
+      protected java.lang.Object newInstance(
+          UnusedPrivateParameter unused) {
+        return new Response();
+      }
+
+      @java.lang.Override
+      public final com.google.protobuf.UnknownFieldSet
+      getUnknownFields() {
+        return this.unknownFields;
+      }
+      private Response(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        this();
+        if (extensionRegistry == null) {
+          throw new java.lang.NullPointerException();
+        }
+        int mutable_bitField0_ = 0;
+        com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+            com.google.protobuf.UnknownFieldSet.newBuilder();
+        try {
+          boolean done = false;
+          while (!done) {
+            int tag = input.readTag();
+            switch (tag) {
+              case 0:
+                done = true;
+                break;
+              case 10: {
+                if (!((mutable_bitField0_ & 0x00000001) != 0)) {
+                  metrics_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Metric>();
+                  mutable_bitField0_ |= 0x00000001;
+                }
+                metrics_.add(
+                    input.readMessage(org.mlflow.api.proto.Service.Metric.PARSER, extensionRegistry));
+                break;
+              }
+              case 18: {
+                com.google.protobuf.ByteString bs = input.readBytes();
+                bitField0_ |= 0x00000001;
+                nextPageToken_ = bs;
+                break;
+              }
+              default: {
+                if (!parseUnknownField(
+                    input, unknownFields, extensionRegistry, tag)) {
+                  done = true;
+                }
+                break;
+              }
+            }
+          }
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          throw e.setUnfinishedMessage(this);
+        } catch (java.io.IOException e) {
+          throw new com.google.protobuf.InvalidProtocolBufferException(
+              e).setUnfinishedMessage(this);
+        } finally {
+          if (((mutable_bitField0_ & 0x00000001) != 0)) {
+            metrics_ = java.util.Collections.unmodifiableList(metrics_);
+          }
+          this.unknownFields = unknownFields.build();
+          makeExtensionsImmutable();
+        }
+      }
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistory_Response_descriptor;
+      }
+
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistory_Response_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.GetMetricHistory.Response.class, org.mlflow.api.proto.Service.GetMetricHistory.Response.Builder.class);
+      }
+
+      private int bitField0_;
+      public static final int METRICS_FIELD_NUMBER = 1;
+      private java.util.List<org.mlflow.api.proto.Service.Metric> metrics_;
+      /**
+       * <pre>
+       * All logged values for this metric.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 1;</code>
+       */
+      @java.lang.Override
+      public java.util.List<org.mlflow.api.proto.Service.Metric> getMetricsList() {
+        return metrics_;
+      }
+      /**
+       * <pre>
+       * All logged values for this metric.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 1;</code>
+       */
+      @java.lang.Override
+      public java.util.List<? extends org.mlflow.api.proto.Service.MetricOrBuilder> 
+          getMetricsOrBuilderList() {
+        return metrics_;
+      }
+      /**
+       * <pre>
+       * All logged values for this metric.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 1;</code>
+       */
+      @java.lang.Override
+      public int getMetricsCount() {
+        return metrics_.size();
+      }
+      /**
+       * <pre>
+       * All logged values for this metric.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 1;</code>
+       */
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.Metric getMetrics(int index) {
+        return metrics_.get(index);
+      }
+      /**
+       * <pre>
+       * All logged values for this metric.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 1;</code>
+       */
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.MetricOrBuilder getMetricsOrBuilder(
+          int index) {
+        return metrics_.get(index);
+      }
+
+      public static final int NEXT_PAGE_TOKEN_FIELD_NUMBER = 2;
+      private volatile java.lang.Object nextPageToken_;
+      /**
+       * <pre>
+       * Token that can be used to issue a query for the next page of metric history values.
+       * A missing token indicates that no additional metrics are available to fetch.
+       * </pre>
+       *
+       * <code>optional string next_page_token = 2;</code>
+       * @return Whether the nextPageToken field is set.
+       */
+      @java.lang.Override
+      public boolean hasNextPageToken() {
+        return ((bitField0_ & 0x00000001) != 0);
+      }
+      /**
+       * <pre>
+       * Token that can be used to issue a query for the next page of metric history values.
+       * A missing token indicates that no additional metrics are available to fetch.
+       * </pre>
+       *
+       * <code>optional string next_page_token = 2;</code>
+       * @return The nextPageToken.
+       */
+      @java.lang.Override
+      public java.lang.String getNextPageToken() {
+        java.lang.Object ref = nextPageToken_;
+        if (ref instanceof java.lang.String) {
+          return (java.lang.String) ref;
+        } else {
+          com.google.protobuf.ByteString bs = 
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            nextPageToken_ = s;
+          }
+          return s;
+        }
+      }
+      /**
+       * <pre>
+       * Token that can be used to issue a query for the next page of metric history values.
+       * A missing token indicates that no additional metrics are available to fetch.
+       * </pre>
+       *
+       * <code>optional string next_page_token = 2;</code>
+       * @return The bytes for nextPageToken.
+       */
+      @java.lang.Override
+      public com.google.protobuf.ByteString
+          getNextPageTokenBytes() {
+        java.lang.Object ref = nextPageToken_;
+        if (ref instanceof java.lang.String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          nextPageToken_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
         }
-        return s;
       }
-    }
-    /**
-     * <pre>
-     * Filter artifacts matching this path (a relative path from the root artifact directory).
-     * </pre>
-     *
-     * <code>optional string path = 2;</code>
-     * @return The bytes for path.
-     */
-    @java.lang.Override
-    public com.google.protobuf.ByteString
-        getPathBytes() {
-      java.lang.Object ref = path_;
-      if (ref instanceof java.lang.String) {
-        com.google.protobuf.ByteString b = 
-            com.google.protobuf.ByteString.copyFromUtf8(
-                (java.lang.String) ref);
-        path_ = b;
-        return b;
-      } else {
-        return (com.google.protobuf.ByteString) ref;
+
+      private byte memoizedIsInitialized = -1;
+      @java.lang.Override
+      public final boolean isInitialized() {
+        byte isInitialized = memoizedIsInitialized;
+        if (isInitialized == 1) return true;
+        if (isInitialized == 0) return false;
+
+        memoizedIsInitialized = 1;
+        return true;
       }
-    }
 
-    public static final int PAGE_TOKEN_FIELD_NUMBER = 4;
-    private volatile java.lang.Object pageToken_;
-    /**
-     * <pre>
-     * Token indicating the page of artifact results to fetch
-     * </pre>
-     *
-     * <code>optional string page_token = 4;</code>
-     * @return Whether the pageToken field is set.
-     */
-    @java.lang.Override
-    public boolean hasPageToken() {
-      return ((bitField0_ & 0x00000008) != 0);
-    }
-    /**
-     * <pre>
-     * Token indicating the page of artifact results to fetch
-     * </pre>
-     *
-     * <code>optional string page_token = 4;</code>
-     * @return The pageToken.
-     */
-    @java.lang.Override
-    public java.lang.String getPageToken() {
-      java.lang.Object ref = pageToken_;
-      if (ref instanceof java.lang.String) {
-        return (java.lang.String) ref;
-      } else {
-        com.google.protobuf.ByteString bs = 
-            (com.google.protobuf.ByteString) ref;
-        java.lang.String s = bs.toStringUtf8();
-        if (bs.isValidUtf8()) {
-          pageToken_ = s;
+      @java.lang.Override
+      public void writeTo(com.google.protobuf.CodedOutputStream output)
+                          throws java.io.IOException {
+        for (int i = 0; i < metrics_.size(); i++) {
+          output.writeMessage(1, metrics_.get(i));
         }
-        return s;
-      }
-    }
-    /**
-     * <pre>
-     * Token indicating the page of artifact results to fetch
-     * </pre>
-     *
-     * <code>optional string page_token = 4;</code>
-     * @return The bytes for pageToken.
-     */
-    @java.lang.Override
-    public com.google.protobuf.ByteString
-        getPageTokenBytes() {
-      java.lang.Object ref = pageToken_;
-      if (ref instanceof java.lang.String) {
-        com.google.protobuf.ByteString b = 
-            com.google.protobuf.ByteString.copyFromUtf8(
-                (java.lang.String) ref);
-        pageToken_ = b;
-        return b;
-      } else {
-        return (com.google.protobuf.ByteString) ref;
+        if (((bitField0_ & 0x00000001) != 0)) {
+          com.google.protobuf.GeneratedMessageV3.writeString(output, 2, nextPageToken_);
+        }
+        unknownFields.writeTo(output);
       }
-    }
 
-    private byte memoizedIsInitialized = -1;
-    @java.lang.Override
-    public final boolean isInitialized() {
-      byte isInitialized = memoizedIsInitialized;
-      if (isInitialized == 1) return true;
-      if (isInitialized == 0) return false;
-
-      memoizedIsInitialized = 1;
-      return true;
-    }
+      @java.lang.Override
+      public int getSerializedSize() {
+        int size = memoizedSize;
+        if (size != -1) return size;
 
-    @java.lang.Override
-    public void writeTo(com.google.protobuf.CodedOutputStream output)
-                        throws java.io.IOException {
-      if (((bitField0_ & 0x00000002) != 0)) {
-        com.google.protobuf.GeneratedMessageV3.writeString(output, 1, runUuid_);
-      }
-      if (((bitField0_ & 0x00000004) != 0)) {
-        com.google.protobuf.GeneratedMessageV3.writeString(output, 2, path_);
-      }
-      if (((bitField0_ & 0x00000001) != 0)) {
-        com.google.protobuf.GeneratedMessageV3.writeString(output, 3, runId_);
-      }
-      if (((bitField0_ & 0x00000008) != 0)) {
-        com.google.protobuf.GeneratedMessageV3.writeString(output, 4, pageToken_);
+        size = 0;
+        for (int i = 0; i < metrics_.size(); i++) {
+          size += com.google.protobuf.CodedOutputStream
+            .computeMessageSize(1, metrics_.get(i));
+        }
+        if (((bitField0_ & 0x00000001) != 0)) {
+          size += com.google.protobuf.GeneratedMessageV3.computeStringSize(2, nextPageToken_);
+        }
+        size += unknownFields.getSerializedSize();
+        memoizedSize = size;
+        return size;
       }
-      unknownFields.writeTo(output);
-    }
 
-    @java.lang.Override
-    public int getSerializedSize() {
-      int size = memoizedSize;
-      if (size != -1) return size;
+      @java.lang.Override
+      public boolean equals(final java.lang.Object obj) {
+        if (obj == this) {
+         return true;
+        }
+        if (!(obj instanceof org.mlflow.api.proto.Service.GetMetricHistory.Response)) {
+          return super.equals(obj);
+        }
+        org.mlflow.api.proto.Service.GetMetricHistory.Response other = (org.mlflow.api.proto.Service.GetMetricHistory.Response) obj;
 
-      size = 0;
-      if (((bitField0_ & 0x00000002) != 0)) {
-        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(1, runUuid_);
-      }
-      if (((bitField0_ & 0x00000004) != 0)) {
-        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(2, path_);
-      }
-      if (((bitField0_ & 0x00000001) != 0)) {
-        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(3, runId_);
+        if (!getMetricsList()
+            .equals(other.getMetricsList())) return false;
+        if (hasNextPageToken() != other.hasNextPageToken()) return false;
+        if (hasNextPageToken()) {
+          if (!getNextPageToken()
+              .equals(other.getNextPageToken())) return false;
+        }
+        if (!unknownFields.equals(other.unknownFields)) return false;
+        return true;
       }
-      if (((bitField0_ & 0x00000008) != 0)) {
-        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(4, pageToken_);
+
+      @java.lang.Override
+      public int hashCode() {
+        if (memoizedHashCode != 0) {
+          return memoizedHashCode;
+        }
+        int hash = 41;
+        hash = (19 * hash) + getDescriptor().hashCode();
+        if (getMetricsCount() > 0) {
+          hash = (37 * hash) + METRICS_FIELD_NUMBER;
+          hash = (53 * hash) + getMetricsList().hashCode();
+        }
+        if (hasNextPageToken()) {
+          hash = (37 * hash) + NEXT_PAGE_TOKEN_FIELD_NUMBER;
+          hash = (53 * hash) + getNextPageToken().hashCode();
+        }
+        hash = (29 * hash) + unknownFields.hashCode();
+        memoizedHashCode = hash;
+        return hash;
       }
-      size += unknownFields.getSerializedSize();
-      memoizedSize = size;
-      return size;
-    }
 
-    @java.lang.Override
-    public boolean equals(final java.lang.Object obj) {
-      if (obj == this) {
-       return true;
+      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseFrom(
+          java.nio.ByteBuffer data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
       }
-      if (!(obj instanceof org.mlflow.api.proto.Service.ListArtifacts)) {
-        return super.equals(obj);
+      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseFrom(
+          java.nio.ByteBuffer data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
       }
-      org.mlflow.api.proto.Service.ListArtifacts other = (org.mlflow.api.proto.Service.ListArtifacts) obj;
-
-      if (hasRunId() != other.hasRunId()) return false;
-      if (hasRunId()) {
-        if (!getRunId()
-            .equals(other.getRunId())) return false;
+      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseFrom(
+          com.google.protobuf.ByteString data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
       }
-      if (hasRunUuid() != other.hasRunUuid()) return false;
-      if (hasRunUuid()) {
-        if (!getRunUuid()
-            .equals(other.getRunUuid())) return false;
+      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseFrom(
+          com.google.protobuf.ByteString data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
       }
-      if (hasPath() != other.hasPath()) return false;
-      if (hasPath()) {
-        if (!getPath()
-            .equals(other.getPath())) return false;
+      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseFrom(byte[] data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
       }
-      if (hasPageToken() != other.hasPageToken()) return false;
-      if (hasPageToken()) {
-        if (!getPageToken()
-            .equals(other.getPageToken())) return false;
+      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseFrom(
+          byte[] data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
       }
-      if (!unknownFields.equals(other.unknownFields)) return false;
-      return true;
-    }
-
-    @java.lang.Override
-    public int hashCode() {
-      if (memoizedHashCode != 0) {
-        return memoizedHashCode;
+      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
       }
-      int hash = 41;
-      hash = (19 * hash) + getDescriptor().hashCode();
-      if (hasRunId()) {
-        hash = (37 * hash) + RUN_ID_FIELD_NUMBER;
-        hash = (53 * hash) + getRunId().hashCode();
+      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
       }
-      if (hasRunUuid()) {
-        hash = (37 * hash) + RUN_UUID_FIELD_NUMBER;
-        hash = (53 * hash) + getRunUuid().hashCode();
+      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseDelimitedFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input);
       }
-      if (hasPath()) {
-        hash = (37 * hash) + PATH_FIELD_NUMBER;
-        hash = (53 * hash) + getPath().hashCode();
+      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseDelimitedFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
       }
-      if (hasPageToken()) {
-        hash = (37 * hash) + PAGE_TOKEN_FIELD_NUMBER;
-        hash = (53 * hash) + getPageToken().hashCode();
+      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseFrom(
+          com.google.protobuf.CodedInputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
       }
-      hash = (29 * hash) + unknownFields.hashCode();
-      memoizedHashCode = hash;
-      return hash;
-    }
-
-    public static org.mlflow.api.proto.Service.ListArtifacts parseFrom(
-        java.nio.ByteBuffer data)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data);
-    }
-    public static org.mlflow.api.proto.Service.ListArtifacts parseFrom(
-        java.nio.ByteBuffer data,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.ListArtifacts parseFrom(
-        com.google.protobuf.ByteString data)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data);
-    }
-    public static org.mlflow.api.proto.Service.ListArtifacts parseFrom(
-        com.google.protobuf.ByteString data,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.ListArtifacts parseFrom(byte[] data)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data);
-    }
-    public static org.mlflow.api.proto.Service.ListArtifacts parseFrom(
-        byte[] data,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.ListArtifacts parseFrom(java.io.InputStream input)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseWithIOException(PARSER, input);
-    }
-    public static org.mlflow.api.proto.Service.ListArtifacts parseFrom(
-        java.io.InputStream input,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseWithIOException(PARSER, input, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.ListArtifacts parseDelimitedFrom(java.io.InputStream input)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseDelimitedWithIOException(PARSER, input);
-    }
-    public static org.mlflow.api.proto.Service.ListArtifacts parseDelimitedFrom(
-        java.io.InputStream input,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.ListArtifacts parseFrom(
-        com.google.protobuf.CodedInputStream input)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseWithIOException(PARSER, input);
-    }
-    public static org.mlflow.api.proto.Service.ListArtifacts parseFrom(
-        com.google.protobuf.CodedInputStream input,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseWithIOException(PARSER, input, extensionRegistry);
-    }
-
-    @java.lang.Override
-    public Builder newBuilderForType() { return newBuilder(); }
-    public static Builder newBuilder() {
-      return DEFAULT_INSTANCE.toBuilder();
-    }
-    public static Builder newBuilder(org.mlflow.api.proto.Service.ListArtifacts prototype) {
-      return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
-    }
-    @java.lang.Override
-    public Builder toBuilder() {
-      return this == DEFAULT_INSTANCE
-          ? new Builder() : new Builder().mergeFrom(this);
-    }
-
-    @java.lang.Override
-    protected Builder newBuilderForType(
-        com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
-      Builder builder = new Builder(parent);
-      return builder;
-    }
-    /**
-     * Protobuf type {@code mlflow.ListArtifacts}
-     */
-    public static final class Builder extends
-        com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
-        // @@protoc_insertion_point(builder_implements:mlflow.ListArtifacts)
-        org.mlflow.api.proto.Service.ListArtifactsOrBuilder {
-      public static final com.google.protobuf.Descriptors.Descriptor
-          getDescriptor() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_ListArtifacts_descriptor;
+      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
       }
 
       @java.lang.Override
-      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
-          internalGetFieldAccessorTable() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_ListArtifacts_fieldAccessorTable
-            .ensureFieldAccessorsInitialized(
-                org.mlflow.api.proto.Service.ListArtifacts.class, org.mlflow.api.proto.Service.ListArtifacts.Builder.class);
+      public Builder newBuilderForType() { return newBuilder(); }
+      public static Builder newBuilder() {
+        return DEFAULT_INSTANCE.toBuilder();
       }
-
-      // Construct using org.mlflow.api.proto.Service.ListArtifacts.newBuilder()
-      private Builder() {
-        maybeForceBuilderInitialization();
+      public static Builder newBuilder(org.mlflow.api.proto.Service.GetMetricHistory.Response prototype) {
+        return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+      }
+      @java.lang.Override
+      public Builder toBuilder() {
+        return this == DEFAULT_INSTANCE
+            ? new Builder() : new Builder().mergeFrom(this);
       }
 
-      private Builder(
+      @java.lang.Override
+      protected Builder newBuilderForType(
           com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
-        super(parent);
-        maybeForceBuilderInitialization();
+        Builder builder = new Builder(parent);
+        return builder;
       }
-      private void maybeForceBuilderInitialization() {
-        if (com.google.protobuf.GeneratedMessageV3
-                .alwaysUseFieldBuilders) {
+      /**
+       * Protobuf type {@code mlflow.GetMetricHistory.Response}
+       */
+      public static final class Builder extends
+          com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+          // @@protoc_insertion_point(builder_implements:mlflow.GetMetricHistory.Response)
+          org.mlflow.api.proto.Service.GetMetricHistory.ResponseOrBuilder {
+        public static final com.google.protobuf.Descriptors.Descriptor
+            getDescriptor() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistory_Response_descriptor;
+        }
+
+        @java.lang.Override
+        protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+            internalGetFieldAccessorTable() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistory_Response_fieldAccessorTable
+              .ensureFieldAccessorsInitialized(
+                  org.mlflow.api.proto.Service.GetMetricHistory.Response.class, org.mlflow.api.proto.Service.GetMetricHistory.Response.Builder.class);
+        }
+
+        // Construct using org.mlflow.api.proto.Service.GetMetricHistory.Response.newBuilder()
+        private Builder() {
+          maybeForceBuilderInitialization();
+        }
+
+        private Builder(
+            com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+          super(parent);
+          maybeForceBuilderInitialization();
+        }
+        private void maybeForceBuilderInitialization() {
+          if (com.google.protobuf.GeneratedMessageV3
+                  .alwaysUseFieldBuilders) {
+            getMetricsFieldBuilder();
+          }
+        }
+        @java.lang.Override
+        public Builder clear() {
+          super.clear();
+          if (metricsBuilder_ == null) {
+            metrics_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000001);
+          } else {
+            metricsBuilder_.clear();
+          }
+          nextPageToken_ = "";
+          bitField0_ = (bitField0_ & ~0x00000002);
+          return this;
+        }
+
+        @java.lang.Override
+        public com.google.protobuf.Descriptors.Descriptor
+            getDescriptorForType() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistory_Response_descriptor;
         }
-      }
-      @java.lang.Override
-      public Builder clear() {
-        super.clear();
-        runId_ = "";
-        bitField0_ = (bitField0_ & ~0x00000001);
-        runUuid_ = "";
-        bitField0_ = (bitField0_ & ~0x00000002);
-        path_ = "";
-        bitField0_ = (bitField0_ & ~0x00000004);
-        pageToken_ = "";
-        bitField0_ = (bitField0_ & ~0x00000008);
-        return this;
-      }
 
-      @java.lang.Override
-      public com.google.protobuf.Descriptors.Descriptor
-          getDescriptorForType() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_ListArtifacts_descriptor;
-      }
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.GetMetricHistory.Response getDefaultInstanceForType() {
+          return org.mlflow.api.proto.Service.GetMetricHistory.Response.getDefaultInstance();
+        }
 
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.ListArtifacts getDefaultInstanceForType() {
-        return org.mlflow.api.proto.Service.ListArtifacts.getDefaultInstance();
-      }
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.GetMetricHistory.Response build() {
+          org.mlflow.api.proto.Service.GetMetricHistory.Response result = buildPartial();
+          if (!result.isInitialized()) {
+            throw newUninitializedMessageException(result);
+          }
+          return result;
+        }
 
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.ListArtifacts build() {
-        org.mlflow.api.proto.Service.ListArtifacts result = buildPartial();
-        if (!result.isInitialized()) {
-          throw newUninitializedMessageException(result);
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.GetMetricHistory.Response buildPartial() {
+          org.mlflow.api.proto.Service.GetMetricHistory.Response result = new org.mlflow.api.proto.Service.GetMetricHistory.Response(this);
+          int from_bitField0_ = bitField0_;
+          int to_bitField0_ = 0;
+          if (metricsBuilder_ == null) {
+            if (((bitField0_ & 0x00000001) != 0)) {
+              metrics_ = java.util.Collections.unmodifiableList(metrics_);
+              bitField0_ = (bitField0_ & ~0x00000001);
+            }
+            result.metrics_ = metrics_;
+          } else {
+            result.metrics_ = metricsBuilder_.build();
+          }
+          if (((from_bitField0_ & 0x00000002) != 0)) {
+            to_bitField0_ |= 0x00000001;
+          }
+          result.nextPageToken_ = nextPageToken_;
+          result.bitField0_ = to_bitField0_;
+          onBuilt();
+          return result;
         }
-        return result;
-      }
 
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.ListArtifacts buildPartial() {
-        org.mlflow.api.proto.Service.ListArtifacts result = new org.mlflow.api.proto.Service.ListArtifacts(this);
-        int from_bitField0_ = bitField0_;
-        int to_bitField0_ = 0;
-        if (((from_bitField0_ & 0x00000001) != 0)) {
-          to_bitField0_ |= 0x00000001;
+        @java.lang.Override
+        public Builder clone() {
+          return super.clone();
         }
-        result.runId_ = runId_;
-        if (((from_bitField0_ & 0x00000002) != 0)) {
-          to_bitField0_ |= 0x00000002;
+        @java.lang.Override
+        public Builder setField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return super.setField(field, value);
         }
-        result.runUuid_ = runUuid_;
-        if (((from_bitField0_ & 0x00000004) != 0)) {
-          to_bitField0_ |= 0x00000004;
+        @java.lang.Override
+        public Builder clearField(
+            com.google.protobuf.Descriptors.FieldDescriptor field) {
+          return super.clearField(field);
         }
-        result.path_ = path_;
-        if (((from_bitField0_ & 0x00000008) != 0)) {
-          to_bitField0_ |= 0x00000008;
+        @java.lang.Override
+        public Builder clearOneof(
+            com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+          return super.clearOneof(oneof);
         }
-        result.pageToken_ = pageToken_;
-        result.bitField0_ = to_bitField0_;
-        onBuilt();
-        return result;
-      }
-
-      @java.lang.Override
-      public Builder clone() {
-        return super.clone();
-      }
-      @java.lang.Override
-      public Builder setField(
-          com.google.protobuf.Descriptors.FieldDescriptor field,
-          java.lang.Object value) {
-        return super.setField(field, value);
-      }
-      @java.lang.Override
-      public Builder clearField(
-          com.google.protobuf.Descriptors.FieldDescriptor field) {
-        return super.clearField(field);
-      }
-      @java.lang.Override
-      public Builder clearOneof(
-          com.google.protobuf.Descriptors.OneofDescriptor oneof) {
-        return super.clearOneof(oneof);
-      }
-      @java.lang.Override
-      public Builder setRepeatedField(
-          com.google.protobuf.Descriptors.FieldDescriptor field,
-          int index, java.lang.Object value) {
-        return super.setRepeatedField(field, index, value);
-      }
-      @java.lang.Override
-      public Builder addRepeatedField(
-          com.google.protobuf.Descriptors.FieldDescriptor field,
-          java.lang.Object value) {
-        return super.addRepeatedField(field, value);
-      }
-      @java.lang.Override
-      public Builder mergeFrom(com.google.protobuf.Message other) {
-        if (other instanceof org.mlflow.api.proto.Service.ListArtifacts) {
-          return mergeFrom((org.mlflow.api.proto.Service.ListArtifacts)other);
-        } else {
-          super.mergeFrom(other);
-          return this;
+        @java.lang.Override
+        public Builder setRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            int index, java.lang.Object value) {
+          return super.setRepeatedField(field, index, value);
+        }
+        @java.lang.Override
+        public Builder addRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return super.addRepeatedField(field, value);
+        }
+        @java.lang.Override
+        public Builder mergeFrom(com.google.protobuf.Message other) {
+          if (other instanceof org.mlflow.api.proto.Service.GetMetricHistory.Response) {
+            return mergeFrom((org.mlflow.api.proto.Service.GetMetricHistory.Response)other);
+          } else {
+            super.mergeFrom(other);
+            return this;
+          }
         }
-      }
 
-      public Builder mergeFrom(org.mlflow.api.proto.Service.ListArtifacts other) {
-        if (other == org.mlflow.api.proto.Service.ListArtifacts.getDefaultInstance()) return this;
-        if (other.hasRunId()) {
-          bitField0_ |= 0x00000001;
-          runId_ = other.runId_;
+        public Builder mergeFrom(org.mlflow.api.proto.Service.GetMetricHistory.Response other) {
+          if (other == org.mlflow.api.proto.Service.GetMetricHistory.Response.getDefaultInstance()) return this;
+          if (metricsBuilder_ == null) {
+            if (!other.metrics_.isEmpty()) {
+              if (metrics_.isEmpty()) {
+                metrics_ = other.metrics_;
+                bitField0_ = (bitField0_ & ~0x00000001);
+              } else {
+                ensureMetricsIsMutable();
+                metrics_.addAll(other.metrics_);
+              }
+              onChanged();
+            }
+          } else {
+            if (!other.metrics_.isEmpty()) {
+              if (metricsBuilder_.isEmpty()) {
+                metricsBuilder_.dispose();
+                metricsBuilder_ = null;
+                metrics_ = other.metrics_;
+                bitField0_ = (bitField0_ & ~0x00000001);
+                metricsBuilder_ = 
+                  com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
+                     getMetricsFieldBuilder() : null;
+              } else {
+                metricsBuilder_.addAllMessages(other.metrics_);
+              }
+            }
+          }
+          if (other.hasNextPageToken()) {
+            bitField0_ |= 0x00000002;
+            nextPageToken_ = other.nextPageToken_;
+            onChanged();
+          }
+          this.mergeUnknownFields(other.unknownFields);
           onChanged();
+          return this;
         }
-        if (other.hasRunUuid()) {
-          bitField0_ |= 0x00000002;
-          runUuid_ = other.runUuid_;
-          onChanged();
+
+        @java.lang.Override
+        public final boolean isInitialized() {
+          return true;
         }
-        if (other.hasPath()) {
-          bitField0_ |= 0x00000004;
-          path_ = other.path_;
-          onChanged();
+
+        @java.lang.Override
+        public Builder mergeFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws java.io.IOException {
+          org.mlflow.api.proto.Service.GetMetricHistory.Response parsedMessage = null;
+          try {
+            parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+          } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+            parsedMessage = (org.mlflow.api.proto.Service.GetMetricHistory.Response) e.getUnfinishedMessage();
+            throw e.unwrapIOException();
+          } finally {
+            if (parsedMessage != null) {
+              mergeFrom(parsedMessage);
+            }
+          }
+          return this;
         }
-        if (other.hasPageToken()) {
-          bitField0_ |= 0x00000008;
-          pageToken_ = other.pageToken_;
-          onChanged();
+        private int bitField0_;
+
+        private java.util.List<org.mlflow.api.proto.Service.Metric> metrics_ =
+          java.util.Collections.emptyList();
+        private void ensureMetricsIsMutable() {
+          if (!((bitField0_ & 0x00000001) != 0)) {
+            metrics_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Metric>(metrics_);
+            bitField0_ |= 0x00000001;
+           }
         }
-        this.mergeUnknownFields(other.unknownFields);
-        onChanged();
-        return this;
-      }
 
-      @java.lang.Override
-      public final boolean isInitialized() {
-        return true;
-      }
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.Metric, org.mlflow.api.proto.Service.Metric.Builder, org.mlflow.api.proto.Service.MetricOrBuilder> metricsBuilder_;
 
-      @java.lang.Override
-      public Builder mergeFrom(
-          com.google.protobuf.CodedInputStream input,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws java.io.IOException {
-        org.mlflow.api.proto.Service.ListArtifacts parsedMessage = null;
-        try {
-          parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
-        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-          parsedMessage = (org.mlflow.api.proto.Service.ListArtifacts) e.getUnfinishedMessage();
-          throw e.unwrapIOException();
-        } finally {
-          if (parsedMessage != null) {
-            mergeFrom(parsedMessage);
+        /**
+         * <pre>
+         * All logged values for this metric.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 1;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.Metric> getMetricsList() {
+          if (metricsBuilder_ == null) {
+            return java.util.Collections.unmodifiableList(metrics_);
+          } else {
+            return metricsBuilder_.getMessageList();
           }
         }
-        return this;
-      }
-      private int bitField0_;
-
-      private java.lang.Object runId_ = "";
-      /**
-       * <pre>
-       * ID of the run whose artifacts to list. Must be provided.
-       * </pre>
-       *
-       * <code>optional string run_id = 3;</code>
-       * @return Whether the runId field is set.
-       */
-      public boolean hasRunId() {
-        return ((bitField0_ & 0x00000001) != 0);
-      }
-      /**
-       * <pre>
-       * ID of the run whose artifacts to list. Must be provided.
-       * </pre>
-       *
-       * <code>optional string run_id = 3;</code>
-       * @return The runId.
-       */
-      public java.lang.String getRunId() {
-        java.lang.Object ref = runId_;
-        if (!(ref instanceof java.lang.String)) {
-          com.google.protobuf.ByteString bs =
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            runId_ = s;
+        /**
+         * <pre>
+         * All logged values for this metric.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 1;</code>
+         */
+        public int getMetricsCount() {
+          if (metricsBuilder_ == null) {
+            return metrics_.size();
+          } else {
+            return metricsBuilder_.getCount();
+          }
+        }
+        /**
+         * <pre>
+         * All logged values for this metric.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Metric getMetrics(int index) {
+          if (metricsBuilder_ == null) {
+            return metrics_.get(index);
+          } else {
+            return metricsBuilder_.getMessage(index);
+          }
+        }
+        /**
+         * <pre>
+         * All logged values for this metric.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 1;</code>
+         */
+        public Builder setMetrics(
+            int index, org.mlflow.api.proto.Service.Metric value) {
+          if (metricsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureMetricsIsMutable();
+            metrics_.set(index, value);
+            onChanged();
+          } else {
+            metricsBuilder_.setMessage(index, value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * All logged values for this metric.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 1;</code>
+         */
+        public Builder setMetrics(
+            int index, org.mlflow.api.proto.Service.Metric.Builder builderForValue) {
+          if (metricsBuilder_ == null) {
+            ensureMetricsIsMutable();
+            metrics_.set(index, builderForValue.build());
+            onChanged();
+          } else {
+            metricsBuilder_.setMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * All logged values for this metric.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 1;</code>
+         */
+        public Builder addMetrics(org.mlflow.api.proto.Service.Metric value) {
+          if (metricsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureMetricsIsMutable();
+            metrics_.add(value);
+            onChanged();
+          } else {
+            metricsBuilder_.addMessage(value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * All logged values for this metric.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 1;</code>
+         */
+        public Builder addMetrics(
+            int index, org.mlflow.api.proto.Service.Metric value) {
+          if (metricsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureMetricsIsMutable();
+            metrics_.add(index, value);
+            onChanged();
+          } else {
+            metricsBuilder_.addMessage(index, value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * All logged values for this metric.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 1;</code>
+         */
+        public Builder addMetrics(
+            org.mlflow.api.proto.Service.Metric.Builder builderForValue) {
+          if (metricsBuilder_ == null) {
+            ensureMetricsIsMutable();
+            metrics_.add(builderForValue.build());
+            onChanged();
+          } else {
+            metricsBuilder_.addMessage(builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * All logged values for this metric.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 1;</code>
+         */
+        public Builder addMetrics(
+            int index, org.mlflow.api.proto.Service.Metric.Builder builderForValue) {
+          if (metricsBuilder_ == null) {
+            ensureMetricsIsMutable();
+            metrics_.add(index, builderForValue.build());
+            onChanged();
+          } else {
+            metricsBuilder_.addMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * All logged values for this metric.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 1;</code>
+         */
+        public Builder addAllMetrics(
+            java.lang.Iterable<? extends org.mlflow.api.proto.Service.Metric> values) {
+          if (metricsBuilder_ == null) {
+            ensureMetricsIsMutable();
+            com.google.protobuf.AbstractMessageLite.Builder.addAll(
+                values, metrics_);
+            onChanged();
+          } else {
+            metricsBuilder_.addAllMessages(values);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * All logged values for this metric.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 1;</code>
+         */
+        public Builder clearMetrics() {
+          if (metricsBuilder_ == null) {
+            metrics_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000001);
+            onChanged();
+          } else {
+            metricsBuilder_.clear();
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * All logged values for this metric.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 1;</code>
+         */
+        public Builder removeMetrics(int index) {
+          if (metricsBuilder_ == null) {
+            ensureMetricsIsMutable();
+            metrics_.remove(index);
+            onChanged();
+          } else {
+            metricsBuilder_.remove(index);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * All logged values for this metric.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Metric.Builder getMetricsBuilder(
+            int index) {
+          return getMetricsFieldBuilder().getBuilder(index);
+        }
+        /**
+         * <pre>
+         * All logged values for this metric.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.MetricOrBuilder getMetricsOrBuilder(
+            int index) {
+          if (metricsBuilder_ == null) {
+            return metrics_.get(index);  } else {
+            return metricsBuilder_.getMessageOrBuilder(index);
           }
-          return s;
-        } else {
-          return (java.lang.String) ref;
-        }
-      }
-      /**
-       * <pre>
-       * ID of the run whose artifacts to list. Must be provided.
-       * </pre>
-       *
-       * <code>optional string run_id = 3;</code>
-       * @return The bytes for runId.
-       */
-      public com.google.protobuf.ByteString
-          getRunIdBytes() {
-        java.lang.Object ref = runId_;
-        if (ref instanceof String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          runId_ = b;
-          return b;
-        } else {
-          return (com.google.protobuf.ByteString) ref;
         }
-      }
-      /**
-       * <pre>
-       * ID of the run whose artifacts to list. Must be provided.
-       * </pre>
-       *
-       * <code>optional string run_id = 3;</code>
-       * @param value The runId to set.
-       * @return This builder for chaining.
-       */
-      public Builder setRunId(
-          java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000001;
-        runId_ = value;
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * ID of the run whose artifacts to list. Must be provided.
-       * </pre>
-       *
-       * <code>optional string run_id = 3;</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearRunId() {
-        bitField0_ = (bitField0_ & ~0x00000001);
-        runId_ = getDefaultInstance().getRunId();
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * ID of the run whose artifacts to list. Must be provided.
-       * </pre>
-       *
-       * <code>optional string run_id = 3;</code>
-       * @param value The bytes for runId to set.
-       * @return This builder for chaining.
-       */
-      public Builder setRunIdBytes(
-          com.google.protobuf.ByteString value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000001;
-        runId_ = value;
-        onChanged();
-        return this;
-      }
-
-      private java.lang.Object runUuid_ = "";
-      /**
-       * <pre>
-       * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
-       * be removed in a future MLflow version.
-       * </pre>
-       *
-       * <code>optional string run_uuid = 1;</code>
-       * @return Whether the runUuid field is set.
-       */
-      public boolean hasRunUuid() {
-        return ((bitField0_ & 0x00000002) != 0);
-      }
-      /**
-       * <pre>
-       * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
-       * be removed in a future MLflow version.
-       * </pre>
-       *
-       * <code>optional string run_uuid = 1;</code>
-       * @return The runUuid.
-       */
-      public java.lang.String getRunUuid() {
-        java.lang.Object ref = runUuid_;
-        if (!(ref instanceof java.lang.String)) {
-          com.google.protobuf.ByteString bs =
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            runUuid_ = s;
+        /**
+         * <pre>
+         * All logged values for this metric.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 1;</code>
+         */
+        public java.util.List<? extends org.mlflow.api.proto.Service.MetricOrBuilder> 
+             getMetricsOrBuilderList() {
+          if (metricsBuilder_ != null) {
+            return metricsBuilder_.getMessageOrBuilderList();
+          } else {
+            return java.util.Collections.unmodifiableList(metrics_);
           }
-          return s;
-        } else {
-          return (java.lang.String) ref;
         }
-      }
-      /**
-       * <pre>
-       * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
-       * be removed in a future MLflow version.
-       * </pre>
-       *
-       * <code>optional string run_uuid = 1;</code>
-       * @return The bytes for runUuid.
-       */
-      public com.google.protobuf.ByteString
-          getRunUuidBytes() {
-        java.lang.Object ref = runUuid_;
-        if (ref instanceof String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          runUuid_ = b;
-          return b;
-        } else {
-          return (com.google.protobuf.ByteString) ref;
+        /**
+         * <pre>
+         * All logged values for this metric.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Metric.Builder addMetricsBuilder() {
+          return getMetricsFieldBuilder().addBuilder(
+              org.mlflow.api.proto.Service.Metric.getDefaultInstance());
         }
-      }
-      /**
-       * <pre>
-       * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
-       * be removed in a future MLflow version.
-       * </pre>
-       *
-       * <code>optional string run_uuid = 1;</code>
-       * @param value The runUuid to set.
-       * @return This builder for chaining.
-       */
-      public Builder setRunUuid(
-          java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000002;
-        runUuid_ = value;
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
-       * be removed in a future MLflow version.
-       * </pre>
-       *
-       * <code>optional string run_uuid = 1;</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearRunUuid() {
-        bitField0_ = (bitField0_ & ~0x00000002);
-        runUuid_ = getDefaultInstance().getRunUuid();
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
-       * be removed in a future MLflow version.
-       * </pre>
-       *
-       * <code>optional string run_uuid = 1;</code>
-       * @param value The bytes for runUuid to set.
-       * @return This builder for chaining.
-       */
-      public Builder setRunUuidBytes(
-          com.google.protobuf.ByteString value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000002;
-        runUuid_ = value;
-        onChanged();
-        return this;
-      }
-
-      private java.lang.Object path_ = "";
-      /**
-       * <pre>
-       * Filter artifacts matching this path (a relative path from the root artifact directory).
-       * </pre>
-       *
-       * <code>optional string path = 2;</code>
-       * @return Whether the path field is set.
-       */
-      public boolean hasPath() {
-        return ((bitField0_ & 0x00000004) != 0);
-      }
-      /**
-       * <pre>
-       * Filter artifacts matching this path (a relative path from the root artifact directory).
-       * </pre>
-       *
-       * <code>optional string path = 2;</code>
-       * @return The path.
-       */
-      public java.lang.String getPath() {
-        java.lang.Object ref = path_;
-        if (!(ref instanceof java.lang.String)) {
-          com.google.protobuf.ByteString bs =
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            path_ = s;
-          }
-          return s;
-        } else {
-          return (java.lang.String) ref;
+        /**
+         * <pre>
+         * All logged values for this metric.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Metric.Builder addMetricsBuilder(
+            int index) {
+          return getMetricsFieldBuilder().addBuilder(
+              index, org.mlflow.api.proto.Service.Metric.getDefaultInstance());
         }
-      }
-      /**
-       * <pre>
-       * Filter artifacts matching this path (a relative path from the root artifact directory).
-       * </pre>
-       *
-       * <code>optional string path = 2;</code>
-       * @return The bytes for path.
-       */
-      public com.google.protobuf.ByteString
-          getPathBytes() {
-        java.lang.Object ref = path_;
-        if (ref instanceof String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          path_ = b;
-          return b;
-        } else {
-          return (com.google.protobuf.ByteString) ref;
+        /**
+         * <pre>
+         * All logged values for this metric.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 1;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.Metric.Builder> 
+             getMetricsBuilderList() {
+          return getMetricsFieldBuilder().getBuilderList();
         }
-      }
-      /**
-       * <pre>
-       * Filter artifacts matching this path (a relative path from the root artifact directory).
-       * </pre>
-       *
-       * <code>optional string path = 2;</code>
-       * @param value The path to set.
-       * @return This builder for chaining.
-       */
-      public Builder setPath(
-          java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000004;
-        path_ = value;
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * Filter artifacts matching this path (a relative path from the root artifact directory).
-       * </pre>
-       *
-       * <code>optional string path = 2;</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearPath() {
-        bitField0_ = (bitField0_ & ~0x00000004);
-        path_ = getDefaultInstance().getPath();
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * Filter artifacts matching this path (a relative path from the root artifact directory).
-       * </pre>
-       *
-       * <code>optional string path = 2;</code>
-       * @param value The bytes for path to set.
-       * @return This builder for chaining.
-       */
-      public Builder setPathBytes(
-          com.google.protobuf.ByteString value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000004;
-        path_ = value;
-        onChanged();
-        return this;
-      }
-
-      private java.lang.Object pageToken_ = "";
-      /**
-       * <pre>
-       * Token indicating the page of artifact results to fetch
-       * </pre>
-       *
-       * <code>optional string page_token = 4;</code>
-       * @return Whether the pageToken field is set.
-       */
-      public boolean hasPageToken() {
-        return ((bitField0_ & 0x00000008) != 0);
-      }
-      /**
-       * <pre>
-       * Token indicating the page of artifact results to fetch
-       * </pre>
-       *
-       * <code>optional string page_token = 4;</code>
-       * @return The pageToken.
-       */
-      public java.lang.String getPageToken() {
-        java.lang.Object ref = pageToken_;
-        if (!(ref instanceof java.lang.String)) {
-          com.google.protobuf.ByteString bs =
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            pageToken_ = s;
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.Metric, org.mlflow.api.proto.Service.Metric.Builder, org.mlflow.api.proto.Service.MetricOrBuilder> 
+            getMetricsFieldBuilder() {
+          if (metricsBuilder_ == null) {
+            metricsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
+                org.mlflow.api.proto.Service.Metric, org.mlflow.api.proto.Service.Metric.Builder, org.mlflow.api.proto.Service.MetricOrBuilder>(
+                    metrics_,
+                    ((bitField0_ & 0x00000001) != 0),
+                    getParentForChildren(),
+                    isClean());
+            metrics_ = null;
           }
-          return s;
-        } else {
-          return (java.lang.String) ref;
+          return metricsBuilder_;
         }
-      }
-      /**
-       * <pre>
-       * Token indicating the page of artifact results to fetch
-       * </pre>
-       *
-       * <code>optional string page_token = 4;</code>
-       * @return The bytes for pageToken.
-       */
-      public com.google.protobuf.ByteString
-          getPageTokenBytes() {
-        java.lang.Object ref = pageToken_;
-        if (ref instanceof String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          pageToken_ = b;
-          return b;
-        } else {
-          return (com.google.protobuf.ByteString) ref;
+
+        private java.lang.Object nextPageToken_ = "";
+        /**
+         * <pre>
+         * Token that can be used to issue a query for the next page of metric history values.
+         * A missing token indicates that no additional metrics are available to fetch.
+         * </pre>
+         *
+         * <code>optional string next_page_token = 2;</code>
+         * @return Whether the nextPageToken field is set.
+         */
+        public boolean hasNextPageToken() {
+          return ((bitField0_ & 0x00000002) != 0);
         }
-      }
-      /**
-       * <pre>
-       * Token indicating the page of artifact results to fetch
-       * </pre>
-       *
-       * <code>optional string page_token = 4;</code>
-       * @param value The pageToken to set.
-       * @return This builder for chaining.
-       */
-      public Builder setPageToken(
-          java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000008;
-        pageToken_ = value;
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * Token indicating the page of artifact results to fetch
-       * </pre>
-       *
-       * <code>optional string page_token = 4;</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearPageToken() {
-        bitField0_ = (bitField0_ & ~0x00000008);
-        pageToken_ = getDefaultInstance().getPageToken();
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * Token indicating the page of artifact results to fetch
-       * </pre>
-       *
-       * <code>optional string page_token = 4;</code>
-       * @param value The bytes for pageToken to set.
-       * @return This builder for chaining.
-       */
-      public Builder setPageTokenBytes(
-          com.google.protobuf.ByteString value) {
-        if (value == null) {
+        /**
+         * <pre>
+         * Token that can be used to issue a query for the next page of metric history values.
+         * A missing token indicates that no additional metrics are available to fetch.
+         * </pre>
+         *
+         * <code>optional string next_page_token = 2;</code>
+         * @return The nextPageToken.
+         */
+        public java.lang.String getNextPageToken() {
+          java.lang.Object ref = nextPageToken_;
+          if (!(ref instanceof java.lang.String)) {
+            com.google.protobuf.ByteString bs =
+                (com.google.protobuf.ByteString) ref;
+            java.lang.String s = bs.toStringUtf8();
+            if (bs.isValidUtf8()) {
+              nextPageToken_ = s;
+            }
+            return s;
+          } else {
+            return (java.lang.String) ref;
+          }
+        }
+        /**
+         * <pre>
+         * Token that can be used to issue a query for the next page of metric history values.
+         * A missing token indicates that no additional metrics are available to fetch.
+         * </pre>
+         *
+         * <code>optional string next_page_token = 2;</code>
+         * @return The bytes for nextPageToken.
+         */
+        public com.google.protobuf.ByteString
+            getNextPageTokenBytes() {
+          java.lang.Object ref = nextPageToken_;
+          if (ref instanceof String) {
+            com.google.protobuf.ByteString b = 
+                com.google.protobuf.ByteString.copyFromUtf8(
+                    (java.lang.String) ref);
+            nextPageToken_ = b;
+            return b;
+          } else {
+            return (com.google.protobuf.ByteString) ref;
+          }
+        }
+        /**
+         * <pre>
+         * Token that can be used to issue a query for the next page of metric history values.
+         * A missing token indicates that no additional metrics are available to fetch.
+         * </pre>
+         *
+         * <code>optional string next_page_token = 2;</code>
+         * @param value The nextPageToken to set.
+         * @return This builder for chaining.
+         */
+        public Builder setNextPageToken(
+            java.lang.String value) {
+          if (value == null) {
     throw new NullPointerException();
   }
-  bitField0_ |= 0x00000008;
-        pageToken_ = value;
-        onChanged();
-        return this;
-      }
-      @java.lang.Override
-      public final Builder setUnknownFields(
-          final com.google.protobuf.UnknownFieldSet unknownFields) {
-        return super.setUnknownFields(unknownFields);
-      }
+  bitField0_ |= 0x00000002;
+          nextPageToken_ = value;
+          onChanged();
+          return this;
+        }
+        /**
+         * <pre>
+         * Token that can be used to issue a query for the next page of metric history values.
+         * A missing token indicates that no additional metrics are available to fetch.
+         * </pre>
+         *
+         * <code>optional string next_page_token = 2;</code>
+         * @return This builder for chaining.
+         */
+        public Builder clearNextPageToken() {
+          bitField0_ = (bitField0_ & ~0x00000002);
+          nextPageToken_ = getDefaultInstance().getNextPageToken();
+          onChanged();
+          return this;
+        }
+        /**
+         * <pre>
+         * Token that can be used to issue a query for the next page of metric history values.
+         * A missing token indicates that no additional metrics are available to fetch.
+         * </pre>
+         *
+         * <code>optional string next_page_token = 2;</code>
+         * @param value The bytes for nextPageToken to set.
+         * @return This builder for chaining.
+         */
+        public Builder setNextPageTokenBytes(
+            com.google.protobuf.ByteString value) {
+          if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000002;
+          nextPageToken_ = value;
+          onChanged();
+          return this;
+        }
+        @java.lang.Override
+        public final Builder setUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.setUnknownFields(unknownFields);
+        }
 
-      @java.lang.Override
-      public final Builder mergeUnknownFields(
-          final com.google.protobuf.UnknownFieldSet unknownFields) {
-        return super.mergeUnknownFields(unknownFields);
+        @java.lang.Override
+        public final Builder mergeUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.mergeUnknownFields(unknownFields);
+        }
+
+
+        // @@protoc_insertion_point(builder_scope:mlflow.GetMetricHistory.Response)
       }
 
+      // @@protoc_insertion_point(class_scope:mlflow.GetMetricHistory.Response)
+      private static final org.mlflow.api.proto.Service.GetMetricHistory.Response DEFAULT_INSTANCE;
+      static {
+        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.GetMetricHistory.Response();
+      }
 
-      // @@protoc_insertion_point(builder_scope:mlflow.ListArtifacts)
-    }
+      public static org.mlflow.api.proto.Service.GetMetricHistory.Response getDefaultInstance() {
+        return DEFAULT_INSTANCE;
+      }
 
-    // @@protoc_insertion_point(class_scope:mlflow.ListArtifacts)
-    private static final org.mlflow.api.proto.Service.ListArtifacts DEFAULT_INSTANCE;
-    static {
-      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.ListArtifacts();
-    }
+      @java.lang.Deprecated public static final com.google.protobuf.Parser<Response>
+          PARSER = new com.google.protobuf.AbstractParser<Response>() {
+        @java.lang.Override
+        public Response parsePartialFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws com.google.protobuf.InvalidProtocolBufferException {
+          return new Response(input, extensionRegistry);
+        }
+      };
 
-    public static org.mlflow.api.proto.Service.ListArtifacts getDefaultInstance() {
-      return DEFAULT_INSTANCE;
-    }
+      public static com.google.protobuf.Parser<Response> parser() {
+        return PARSER;
+      }
 
-    @java.lang.Deprecated public static final com.google.protobuf.Parser<ListArtifacts>
-        PARSER = new com.google.protobuf.AbstractParser<ListArtifacts>() {
       @java.lang.Override
-      public ListArtifacts parsePartialFrom(
-          com.google.protobuf.CodedInputStream input,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return new ListArtifacts(input, extensionRegistry);
+      public com.google.protobuf.Parser<Response> getParserForType() {
+        return PARSER;
       }
-    };
-
-    public static com.google.protobuf.Parser<ListArtifacts> parser() {
-      return PARSER;
-    }
 
-    @java.lang.Override
-    public com.google.protobuf.Parser<ListArtifacts> getParserForType() {
-      return PARSER;
-    }
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.GetMetricHistory.Response getDefaultInstanceForType() {
+        return DEFAULT_INSTANCE;
+      }
 
-    @java.lang.Override
-    public org.mlflow.api.proto.Service.ListArtifacts getDefaultInstanceForType() {
-      return DEFAULT_INSTANCE;
     }
 
-  }
-
-  public interface FileInfoOrBuilder extends
-      // @@protoc_insertion_point(interface_extends:mlflow.FileInfo)
-      com.google.protobuf.MessageOrBuilder {
-
+    private int bitField0_;
+    public static final int RUN_ID_FIELD_NUMBER = 3;
+    private volatile java.lang.Object runId_;
     /**
      * <pre>
-     * Path relative to the root artifact directory run.
+     * ID of the run from which to fetch metric values. Must be provided.
      * </pre>
      *
-     * <code>optional string path = 1;</code>
-     * @return Whether the path field is set.
+     * <code>optional string run_id = 3;</code>
+     * @return Whether the runId field is set.
      */
-    boolean hasPath();
+    @java.lang.Override
+    public boolean hasRunId() {
+      return ((bitField0_ & 0x00000001) != 0);
+    }
     /**
      * <pre>
-     * Path relative to the root artifact directory run.
+     * ID of the run from which to fetch metric values. Must be provided.
      * </pre>
      *
-     * <code>optional string path = 1;</code>
-     * @return The path.
+     * <code>optional string run_id = 3;</code>
+     * @return The runId.
      */
-    java.lang.String getPath();
+    @java.lang.Override
+    public java.lang.String getRunId() {
+      java.lang.Object ref = runId_;
+      if (ref instanceof java.lang.String) {
+        return (java.lang.String) ref;
+      } else {
+        com.google.protobuf.ByteString bs = 
+            (com.google.protobuf.ByteString) ref;
+        java.lang.String s = bs.toStringUtf8();
+        if (bs.isValidUtf8()) {
+          runId_ = s;
+        }
+        return s;
+      }
+    }
     /**
      * <pre>
-     * Path relative to the root artifact directory run.
+     * ID of the run from which to fetch metric values. Must be provided.
      * </pre>
      *
-     * <code>optional string path = 1;</code>
-     * @return The bytes for path.
+     * <code>optional string run_id = 3;</code>
+     * @return The bytes for runId.
      */
-    com.google.protobuf.ByteString
-        getPathBytes();
+    @java.lang.Override
+    public com.google.protobuf.ByteString
+        getRunIdBytes() {
+      java.lang.Object ref = runId_;
+      if (ref instanceof java.lang.String) {
+        com.google.protobuf.ByteString b = 
+            com.google.protobuf.ByteString.copyFromUtf8(
+                (java.lang.String) ref);
+        runId_ = b;
+        return b;
+      } else {
+        return (com.google.protobuf.ByteString) ref;
+      }
+    }
 
+    public static final int RUN_UUID_FIELD_NUMBER = 1;
+    private volatile java.lang.Object runUuid_;
     /**
      * <pre>
-     * Whether the path is a directory.
-     * </pre>
-     *
-     * <code>optional bool is_dir = 2;</code>
-     * @return Whether the isDir field is set.
-     */
-    boolean hasIsDir();
-    /**
-     * <pre>
-     * Whether the path is a directory.
+     * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
+     * will be removed in a future MLflow version.
      * </pre>
      *
-     * <code>optional bool is_dir = 2;</code>
-     * @return The isDir.
+     * <code>optional string run_uuid = 1;</code>
+     * @return Whether the runUuid field is set.
      */
-    boolean getIsDir();
-
+    @java.lang.Override
+    public boolean hasRunUuid() {
+      return ((bitField0_ & 0x00000002) != 0);
+    }
     /**
      * <pre>
-     * Size in bytes. Unset for directories.
+     * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
+     * will be removed in a future MLflow version.
      * </pre>
      *
-     * <code>optional int64 file_size = 3;</code>
-     * @return Whether the fileSize field is set.
+     * <code>optional string run_uuid = 1;</code>
+     * @return The runUuid.
      */
-    boolean hasFileSize();
+    @java.lang.Override
+    public java.lang.String getRunUuid() {
+      java.lang.Object ref = runUuid_;
+      if (ref instanceof java.lang.String) {
+        return (java.lang.String) ref;
+      } else {
+        com.google.protobuf.ByteString bs = 
+            (com.google.protobuf.ByteString) ref;
+        java.lang.String s = bs.toStringUtf8();
+        if (bs.isValidUtf8()) {
+          runUuid_ = s;
+        }
+        return s;
+      }
+    }
     /**
      * <pre>
-     * Size in bytes. Unset for directories.
+     * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
+     * will be removed in a future MLflow version.
      * </pre>
      *
-     * <code>optional int64 file_size = 3;</code>
-     * @return The fileSize.
+     * <code>optional string run_uuid = 1;</code>
+     * @return The bytes for runUuid.
      */
-    long getFileSize();
-  }
-  /**
-   * <pre>
-   * Metadata of a single artifact file or directory.
-   * </pre>
-   *
-   * Protobuf type {@code mlflow.FileInfo}
-   */
-  public static final class FileInfo extends
-      com.google.protobuf.GeneratedMessageV3 implements
-      // @@protoc_insertion_point(message_implements:mlflow.FileInfo)
-      FileInfoOrBuilder {
-  private static final long serialVersionUID = 0L;
-    // Use FileInfo.newBuilder() to construct.
-    private FileInfo(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
-      super(builder);
-    }
-    private FileInfo() {
-      path_ = "";
-    }
-
-    @java.lang.Override
-    @SuppressWarnings({"unused"})
-    protected java.lang.Object newInstance(
-        UnusedPrivateParameter unused) {
-      return new FileInfo();
-    }
-
     @java.lang.Override
-    public final com.google.protobuf.UnknownFieldSet
-    getUnknownFields() {
-      return this.unknownFields;
-    }
-    private FileInfo(
-        com.google.protobuf.CodedInputStream input,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      this();
-      if (extensionRegistry == null) {
-        throw new java.lang.NullPointerException();
-      }
-      int mutable_bitField0_ = 0;
-      com.google.protobuf.UnknownFieldSet.Builder unknownFields =
-          com.google.protobuf.UnknownFieldSet.newBuilder();
-      try {
-        boolean done = false;
-        while (!done) {
-          int tag = input.readTag();
-          switch (tag) {
-            case 0:
-              done = true;
-              break;
-            case 10: {
-              com.google.protobuf.ByteString bs = input.readBytes();
-              bitField0_ |= 0x00000001;
-              path_ = bs;
-              break;
-            }
-            case 16: {
-              bitField0_ |= 0x00000002;
-              isDir_ = input.readBool();
-              break;
-            }
-            case 24: {
-              bitField0_ |= 0x00000004;
-              fileSize_ = input.readInt64();
-              break;
-            }
-            default: {
-              if (!parseUnknownField(
-                  input, unknownFields, extensionRegistry, tag)) {
-                done = true;
-              }
-              break;
-            }
-          }
-        }
-      } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-        throw e.setUnfinishedMessage(this);
-      } catch (java.io.IOException e) {
-        throw new com.google.protobuf.InvalidProtocolBufferException(
-            e).setUnfinishedMessage(this);
-      } finally {
-        this.unknownFields = unknownFields.build();
-        makeExtensionsImmutable();
+    public com.google.protobuf.ByteString
+        getRunUuidBytes() {
+      java.lang.Object ref = runUuid_;
+      if (ref instanceof java.lang.String) {
+        com.google.protobuf.ByteString b = 
+            com.google.protobuf.ByteString.copyFromUtf8(
+                (java.lang.String) ref);
+        runUuid_ = b;
+        return b;
+      } else {
+        return (com.google.protobuf.ByteString) ref;
       }
     }
-    public static final com.google.protobuf.Descriptors.Descriptor
-        getDescriptor() {
-      return org.mlflow.api.proto.Service.internal_static_mlflow_FileInfo_descriptor;
-    }
-
-    @java.lang.Override
-    protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
-        internalGetFieldAccessorTable() {
-      return org.mlflow.api.proto.Service.internal_static_mlflow_FileInfo_fieldAccessorTable
-          .ensureFieldAccessorsInitialized(
-              org.mlflow.api.proto.Service.FileInfo.class, org.mlflow.api.proto.Service.FileInfo.Builder.class);
-    }
 
-    private int bitField0_;
-    public static final int PATH_FIELD_NUMBER = 1;
-    private volatile java.lang.Object path_;
+    public static final int METRIC_KEY_FIELD_NUMBER = 2;
+    private volatile java.lang.Object metricKey_;
     /**
      * <pre>
-     * Path relative to the root artifact directory run.
+     * Name of the metric.
      * </pre>
      *
-     * <code>optional string path = 1;</code>
-     * @return Whether the path field is set.
+     * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+     * @return Whether the metricKey field is set.
      */
     @java.lang.Override
-    public boolean hasPath() {
-      return ((bitField0_ & 0x00000001) != 0);
+    public boolean hasMetricKey() {
+      return ((bitField0_ & 0x00000004) != 0);
     }
     /**
      * <pre>
-     * Path relative to the root artifact directory run.
+     * Name of the metric.
      * </pre>
      *
-     * <code>optional string path = 1;</code>
-     * @return The path.
+     * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+     * @return The metricKey.
      */
     @java.lang.Override
-    public java.lang.String getPath() {
-      java.lang.Object ref = path_;
+    public java.lang.String getMetricKey() {
+      java.lang.Object ref = metricKey_;
       if (ref instanceof java.lang.String) {
         return (java.lang.String) ref;
       } else {
@@ -49134,86 +52766,125 @@ public final class Service {
             (com.google.protobuf.ByteString) ref;
         java.lang.String s = bs.toStringUtf8();
         if (bs.isValidUtf8()) {
-          path_ = s;
+          metricKey_ = s;
         }
         return s;
       }
     }
     /**
      * <pre>
-     * Path relative to the root artifact directory run.
+     * Name of the metric.
      * </pre>
      *
-     * <code>optional string path = 1;</code>
-     * @return The bytes for path.
+     * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+     * @return The bytes for metricKey.
      */
     @java.lang.Override
     public com.google.protobuf.ByteString
-        getPathBytes() {
-      java.lang.Object ref = path_;
+        getMetricKeyBytes() {
+      java.lang.Object ref = metricKey_;
       if (ref instanceof java.lang.String) {
         com.google.protobuf.ByteString b = 
             com.google.protobuf.ByteString.copyFromUtf8(
                 (java.lang.String) ref);
-        path_ = b;
+        metricKey_ = b;
         return b;
       } else {
         return (com.google.protobuf.ByteString) ref;
       }
     }
 
-    public static final int IS_DIR_FIELD_NUMBER = 2;
-    private boolean isDir_;
+    public static final int PAGE_TOKEN_FIELD_NUMBER = 4;
+    private volatile java.lang.Object pageToken_;
     /**
      * <pre>
-     * Whether the path is a directory.
+     * Token indicating the page of metric history to fetch
      * </pre>
      *
-     * <code>optional bool is_dir = 2;</code>
-     * @return Whether the isDir field is set.
+     * <code>optional string page_token = 4;</code>
+     * @return Whether the pageToken field is set.
      */
     @java.lang.Override
-    public boolean hasIsDir() {
-      return ((bitField0_ & 0x00000002) != 0);
+    public boolean hasPageToken() {
+      return ((bitField0_ & 0x00000008) != 0);
     }
     /**
      * <pre>
-     * Whether the path is a directory.
+     * Token indicating the page of metric history to fetch
      * </pre>
      *
-     * <code>optional bool is_dir = 2;</code>
-     * @return The isDir.
+     * <code>optional string page_token = 4;</code>
+     * @return The pageToken.
      */
     @java.lang.Override
-    public boolean getIsDir() {
-      return isDir_;
+    public java.lang.String getPageToken() {
+      java.lang.Object ref = pageToken_;
+      if (ref instanceof java.lang.String) {
+        return (java.lang.String) ref;
+      } else {
+        com.google.protobuf.ByteString bs = 
+            (com.google.protobuf.ByteString) ref;
+        java.lang.String s = bs.toStringUtf8();
+        if (bs.isValidUtf8()) {
+          pageToken_ = s;
+        }
+        return s;
+      }
+    }
+    /**
+     * <pre>
+     * Token indicating the page of metric history to fetch
+     * </pre>
+     *
+     * <code>optional string page_token = 4;</code>
+     * @return The bytes for pageToken.
+     */
+    @java.lang.Override
+    public com.google.protobuf.ByteString
+        getPageTokenBytes() {
+      java.lang.Object ref = pageToken_;
+      if (ref instanceof java.lang.String) {
+        com.google.protobuf.ByteString b = 
+            com.google.protobuf.ByteString.copyFromUtf8(
+                (java.lang.String) ref);
+        pageToken_ = b;
+        return b;
+      } else {
+        return (com.google.protobuf.ByteString) ref;
+      }
     }
 
-    public static final int FILE_SIZE_FIELD_NUMBER = 3;
-    private long fileSize_;
+    public static final int MAX_RESULTS_FIELD_NUMBER = 5;
+    private int maxResults_;
     /**
      * <pre>
-     * Size in bytes. Unset for directories.
+     * Maximum number of logged instances of a metric for a run to return per call.
+     * Backend servers may restrict the value of `max_results` depending on performance requirements.
+     * Requests that do not specify this value will behave as non-paginated queries where all
+     * metric history values for a given metric within a run are returned in a single response.
      * </pre>
      *
-     * <code>optional int64 file_size = 3;</code>
-     * @return Whether the fileSize field is set.
+     * <code>optional int32 max_results = 5;</code>
+     * @return Whether the maxResults field is set.
      */
     @java.lang.Override
-    public boolean hasFileSize() {
-      return ((bitField0_ & 0x00000004) != 0);
+    public boolean hasMaxResults() {
+      return ((bitField0_ & 0x00000010) != 0);
     }
     /**
      * <pre>
-     * Size in bytes. Unset for directories.
+     * Maximum number of logged instances of a metric for a run to return per call.
+     * Backend servers may restrict the value of `max_results` depending on performance requirements.
+     * Requests that do not specify this value will behave as non-paginated queries where all
+     * metric history values for a given metric within a run are returned in a single response.
      * </pre>
      *
-     * <code>optional int64 file_size = 3;</code>
-     * @return The fileSize.
+     * <code>optional int32 max_results = 5;</code>
+     * @return The maxResults.
      */
     @java.lang.Override
-    public long getFileSize() {
-      return fileSize_;
+    public int getMaxResults() {
+      return maxResults_;
     }
 
     private byte memoizedIsInitialized = -1;
@@ -49230,14 +52901,20 @@ public final class Service {
     @java.lang.Override
     public void writeTo(com.google.protobuf.CodedOutputStream output)
                         throws java.io.IOException {
-      if (((bitField0_ & 0x00000001) != 0)) {
-        com.google.protobuf.GeneratedMessageV3.writeString(output, 1, path_);
-      }
       if (((bitField0_ & 0x00000002) != 0)) {
-        output.writeBool(2, isDir_);
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 1, runUuid_);
       }
       if (((bitField0_ & 0x00000004) != 0)) {
-        output.writeInt64(3, fileSize_);
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 2, metricKey_);
+      }
+      if (((bitField0_ & 0x00000001) != 0)) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 3, runId_);
+      }
+      if (((bitField0_ & 0x00000008) != 0)) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 4, pageToken_);
+      }
+      if (((bitField0_ & 0x00000010) != 0)) {
+        output.writeInt32(5, maxResults_);
       }
       unknownFields.writeTo(output);
     }
@@ -49248,16 +52925,21 @@ public final class Service {
       if (size != -1) return size;
 
       size = 0;
+      if (((bitField0_ & 0x00000002) != 0)) {
+        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(1, runUuid_);
+      }
+      if (((bitField0_ & 0x00000004) != 0)) {
+        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(2, metricKey_);
+      }
       if (((bitField0_ & 0x00000001) != 0)) {
-        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(1, path_);
+        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(3, runId_);
       }
-      if (((bitField0_ & 0x00000002) != 0)) {
-        size += com.google.protobuf.CodedOutputStream
-          .computeBoolSize(2, isDir_);
+      if (((bitField0_ & 0x00000008) != 0)) {
+        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(4, pageToken_);
       }
-      if (((bitField0_ & 0x00000004) != 0)) {
+      if (((bitField0_ & 0x00000010) != 0)) {
         size += com.google.protobuf.CodedOutputStream
-          .computeInt64Size(3, fileSize_);
+          .computeInt32Size(5, maxResults_);
       }
       size += unknownFields.getSerializedSize();
       memoizedSize = size;
@@ -49269,25 +52951,35 @@ public final class Service {
       if (obj == this) {
        return true;
       }
-      if (!(obj instanceof org.mlflow.api.proto.Service.FileInfo)) {
+      if (!(obj instanceof org.mlflow.api.proto.Service.GetMetricHistory)) {
         return super.equals(obj);
       }
-      org.mlflow.api.proto.Service.FileInfo other = (org.mlflow.api.proto.Service.FileInfo) obj;
+      org.mlflow.api.proto.Service.GetMetricHistory other = (org.mlflow.api.proto.Service.GetMetricHistory) obj;
 
-      if (hasPath() != other.hasPath()) return false;
-      if (hasPath()) {
-        if (!getPath()
-            .equals(other.getPath())) return false;
+      if (hasRunId() != other.hasRunId()) return false;
+      if (hasRunId()) {
+        if (!getRunId()
+            .equals(other.getRunId())) return false;
       }
-      if (hasIsDir() != other.hasIsDir()) return false;
-      if (hasIsDir()) {
-        if (getIsDir()
-            != other.getIsDir()) return false;
+      if (hasRunUuid() != other.hasRunUuid()) return false;
+      if (hasRunUuid()) {
+        if (!getRunUuid()
+            .equals(other.getRunUuid())) return false;
       }
-      if (hasFileSize() != other.hasFileSize()) return false;
-      if (hasFileSize()) {
-        if (getFileSize()
-            != other.getFileSize()) return false;
+      if (hasMetricKey() != other.hasMetricKey()) return false;
+      if (hasMetricKey()) {
+        if (!getMetricKey()
+            .equals(other.getMetricKey())) return false;
+      }
+      if (hasPageToken() != other.hasPageToken()) return false;
+      if (hasPageToken()) {
+        if (!getPageToken()
+            .equals(other.getPageToken())) return false;
+      }
+      if (hasMaxResults() != other.hasMaxResults()) return false;
+      if (hasMaxResults()) {
+        if (getMaxResults()
+            != other.getMaxResults()) return false;
       }
       if (!unknownFields.equals(other.unknownFields)) return false;
       return true;
@@ -49300,88 +52992,94 @@ public final class Service {
       }
       int hash = 41;
       hash = (19 * hash) + getDescriptor().hashCode();
-      if (hasPath()) {
-        hash = (37 * hash) + PATH_FIELD_NUMBER;
-        hash = (53 * hash) + getPath().hashCode();
+      if (hasRunId()) {
+        hash = (37 * hash) + RUN_ID_FIELD_NUMBER;
+        hash = (53 * hash) + getRunId().hashCode();
       }
-      if (hasIsDir()) {
-        hash = (37 * hash) + IS_DIR_FIELD_NUMBER;
-        hash = (53 * hash) + com.google.protobuf.Internal.hashBoolean(
-            getIsDir());
+      if (hasRunUuid()) {
+        hash = (37 * hash) + RUN_UUID_FIELD_NUMBER;
+        hash = (53 * hash) + getRunUuid().hashCode();
       }
-      if (hasFileSize()) {
-        hash = (37 * hash) + FILE_SIZE_FIELD_NUMBER;
-        hash = (53 * hash) + com.google.protobuf.Internal.hashLong(
-            getFileSize());
+      if (hasMetricKey()) {
+        hash = (37 * hash) + METRIC_KEY_FIELD_NUMBER;
+        hash = (53 * hash) + getMetricKey().hashCode();
+      }
+      if (hasPageToken()) {
+        hash = (37 * hash) + PAGE_TOKEN_FIELD_NUMBER;
+        hash = (53 * hash) + getPageToken().hashCode();
+      }
+      if (hasMaxResults()) {
+        hash = (37 * hash) + MAX_RESULTS_FIELD_NUMBER;
+        hash = (53 * hash) + getMaxResults();
       }
       hash = (29 * hash) + unknownFields.hashCode();
       memoizedHashCode = hash;
       return hash;
     }
 
-    public static org.mlflow.api.proto.Service.FileInfo parseFrom(
+    public static org.mlflow.api.proto.Service.GetMetricHistory parseFrom(
         java.nio.ByteBuffer data)
         throws com.google.protobuf.InvalidProtocolBufferException {
       return PARSER.parseFrom(data);
     }
-    public static org.mlflow.api.proto.Service.FileInfo parseFrom(
+    public static org.mlflow.api.proto.Service.GetMetricHistory parseFrom(
         java.nio.ByteBuffer data,
         com.google.protobuf.ExtensionRegistryLite extensionRegistry)
         throws com.google.protobuf.InvalidProtocolBufferException {
       return PARSER.parseFrom(data, extensionRegistry);
     }
-    public static org.mlflow.api.proto.Service.FileInfo parseFrom(
+    public static org.mlflow.api.proto.Service.GetMetricHistory parseFrom(
         com.google.protobuf.ByteString data)
         throws com.google.protobuf.InvalidProtocolBufferException {
       return PARSER.parseFrom(data);
     }
-    public static org.mlflow.api.proto.Service.FileInfo parseFrom(
+    public static org.mlflow.api.proto.Service.GetMetricHistory parseFrom(
         com.google.protobuf.ByteString data,
         com.google.protobuf.ExtensionRegistryLite extensionRegistry)
         throws com.google.protobuf.InvalidProtocolBufferException {
       return PARSER.parseFrom(data, extensionRegistry);
     }
-    public static org.mlflow.api.proto.Service.FileInfo parseFrom(byte[] data)
+    public static org.mlflow.api.proto.Service.GetMetricHistory parseFrom(byte[] data)
         throws com.google.protobuf.InvalidProtocolBufferException {
       return PARSER.parseFrom(data);
     }
-    public static org.mlflow.api.proto.Service.FileInfo parseFrom(
+    public static org.mlflow.api.proto.Service.GetMetricHistory parseFrom(
         byte[] data,
         com.google.protobuf.ExtensionRegistryLite extensionRegistry)
         throws com.google.protobuf.InvalidProtocolBufferException {
       return PARSER.parseFrom(data, extensionRegistry);
     }
-    public static org.mlflow.api.proto.Service.FileInfo parseFrom(java.io.InputStream input)
+    public static org.mlflow.api.proto.Service.GetMetricHistory parseFrom(java.io.InputStream input)
         throws java.io.IOException {
       return com.google.protobuf.GeneratedMessageV3
           .parseWithIOException(PARSER, input);
     }
-    public static org.mlflow.api.proto.Service.FileInfo parseFrom(
+    public static org.mlflow.api.proto.Service.GetMetricHistory parseFrom(
         java.io.InputStream input,
         com.google.protobuf.ExtensionRegistryLite extensionRegistry)
         throws java.io.IOException {
       return com.google.protobuf.GeneratedMessageV3
           .parseWithIOException(PARSER, input, extensionRegistry);
     }
-    public static org.mlflow.api.proto.Service.FileInfo parseDelimitedFrom(java.io.InputStream input)
+    public static org.mlflow.api.proto.Service.GetMetricHistory parseDelimitedFrom(java.io.InputStream input)
         throws java.io.IOException {
       return com.google.protobuf.GeneratedMessageV3
           .parseDelimitedWithIOException(PARSER, input);
     }
-    public static org.mlflow.api.proto.Service.FileInfo parseDelimitedFrom(
+    public static org.mlflow.api.proto.Service.GetMetricHistory parseDelimitedFrom(
         java.io.InputStream input,
         com.google.protobuf.ExtensionRegistryLite extensionRegistry)
         throws java.io.IOException {
       return com.google.protobuf.GeneratedMessageV3
           .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
     }
-    public static org.mlflow.api.proto.Service.FileInfo parseFrom(
+    public static org.mlflow.api.proto.Service.GetMetricHistory parseFrom(
         com.google.protobuf.CodedInputStream input)
         throws java.io.IOException {
       return com.google.protobuf.GeneratedMessageV3
           .parseWithIOException(PARSER, input);
     }
-    public static org.mlflow.api.proto.Service.FileInfo parseFrom(
+    public static org.mlflow.api.proto.Service.GetMetricHistory parseFrom(
         com.google.protobuf.CodedInputStream input,
         com.google.protobuf.ExtensionRegistryLite extensionRegistry)
         throws java.io.IOException {
@@ -49394,7 +53092,7 @@ public final class Service {
     public static Builder newBuilder() {
       return DEFAULT_INSTANCE.toBuilder();
     }
-    public static Builder newBuilder(org.mlflow.api.proto.Service.FileInfo prototype) {
+    public static Builder newBuilder(org.mlflow.api.proto.Service.GetMetricHistory prototype) {
       return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
     }
     @java.lang.Override
@@ -49410,30 +53108,26 @@ public final class Service {
       return builder;
     }
     /**
-     * <pre>
-     * Metadata of a single artifact file or directory.
-     * </pre>
-     *
-     * Protobuf type {@code mlflow.FileInfo}
+     * Protobuf type {@code mlflow.GetMetricHistory}
      */
     public static final class Builder extends
         com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
-        // @@protoc_insertion_point(builder_implements:mlflow.FileInfo)
-        org.mlflow.api.proto.Service.FileInfoOrBuilder {
+        // @@protoc_insertion_point(builder_implements:mlflow.GetMetricHistory)
+        org.mlflow.api.proto.Service.GetMetricHistoryOrBuilder {
       public static final com.google.protobuf.Descriptors.Descriptor
           getDescriptor() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_FileInfo_descriptor;
+        return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistory_descriptor;
       }
 
       @java.lang.Override
       protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
           internalGetFieldAccessorTable() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_FileInfo_fieldAccessorTable
+        return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistory_fieldAccessorTable
             .ensureFieldAccessorsInitialized(
-                org.mlflow.api.proto.Service.FileInfo.class, org.mlflow.api.proto.Service.FileInfo.Builder.class);
+                org.mlflow.api.proto.Service.GetMetricHistory.class, org.mlflow.api.proto.Service.GetMetricHistory.Builder.class);
       }
 
-      // Construct using org.mlflow.api.proto.Service.FileInfo.newBuilder()
+      // Construct using org.mlflow.api.proto.Service.GetMetricHistory.newBuilder()
       private Builder() {
         maybeForceBuilderInitialization();
       }
@@ -49451,29 +53145,33 @@ public final class Service {
       @java.lang.Override
       public Builder clear() {
         super.clear();
-        path_ = "";
+        runId_ = "";
         bitField0_ = (bitField0_ & ~0x00000001);
-        isDir_ = false;
+        runUuid_ = "";
         bitField0_ = (bitField0_ & ~0x00000002);
-        fileSize_ = 0L;
+        metricKey_ = "";
         bitField0_ = (bitField0_ & ~0x00000004);
+        pageToken_ = "";
+        bitField0_ = (bitField0_ & ~0x00000008);
+        maxResults_ = 0;
+        bitField0_ = (bitField0_ & ~0x00000010);
         return this;
       }
 
       @java.lang.Override
       public com.google.protobuf.Descriptors.Descriptor
           getDescriptorForType() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_FileInfo_descriptor;
+        return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistory_descriptor;
       }
 
       @java.lang.Override
-      public org.mlflow.api.proto.Service.FileInfo getDefaultInstanceForType() {
-        return org.mlflow.api.proto.Service.FileInfo.getDefaultInstance();
+      public org.mlflow.api.proto.Service.GetMetricHistory getDefaultInstanceForType() {
+        return org.mlflow.api.proto.Service.GetMetricHistory.getDefaultInstance();
       }
 
       @java.lang.Override
-      public org.mlflow.api.proto.Service.FileInfo build() {
-        org.mlflow.api.proto.Service.FileInfo result = buildPartial();
+      public org.mlflow.api.proto.Service.GetMetricHistory build() {
+        org.mlflow.api.proto.Service.GetMetricHistory result = buildPartial();
         if (!result.isInitialized()) {
           throw newUninitializedMessageException(result);
         }
@@ -49481,22 +53179,30 @@ public final class Service {
       }
 
       @java.lang.Override
-      public org.mlflow.api.proto.Service.FileInfo buildPartial() {
-        org.mlflow.api.proto.Service.FileInfo result = new org.mlflow.api.proto.Service.FileInfo(this);
+      public org.mlflow.api.proto.Service.GetMetricHistory buildPartial() {
+        org.mlflow.api.proto.Service.GetMetricHistory result = new org.mlflow.api.proto.Service.GetMetricHistory(this);
         int from_bitField0_ = bitField0_;
         int to_bitField0_ = 0;
         if (((from_bitField0_ & 0x00000001) != 0)) {
           to_bitField0_ |= 0x00000001;
         }
-        result.path_ = path_;
+        result.runId_ = runId_;
         if (((from_bitField0_ & 0x00000002) != 0)) {
-          result.isDir_ = isDir_;
           to_bitField0_ |= 0x00000002;
         }
+        result.runUuid_ = runUuid_;
         if (((from_bitField0_ & 0x00000004) != 0)) {
-          result.fileSize_ = fileSize_;
           to_bitField0_ |= 0x00000004;
         }
+        result.metricKey_ = metricKey_;
+        if (((from_bitField0_ & 0x00000008) != 0)) {
+          to_bitField0_ |= 0x00000008;
+        }
+        result.pageToken_ = pageToken_;
+        if (((from_bitField0_ & 0x00000010) != 0)) {
+          result.maxResults_ = maxResults_;
+          to_bitField0_ |= 0x00000010;
+        }
         result.bitField0_ = to_bitField0_;
         onBuilt();
         return result;
@@ -49536,26 +53242,38 @@ public final class Service {
       }
       @java.lang.Override
       public Builder mergeFrom(com.google.protobuf.Message other) {
-        if (other instanceof org.mlflow.api.proto.Service.FileInfo) {
-          return mergeFrom((org.mlflow.api.proto.Service.FileInfo)other);
+        if (other instanceof org.mlflow.api.proto.Service.GetMetricHistory) {
+          return mergeFrom((org.mlflow.api.proto.Service.GetMetricHistory)other);
         } else {
           super.mergeFrom(other);
           return this;
         }
       }
 
-      public Builder mergeFrom(org.mlflow.api.proto.Service.FileInfo other) {
-        if (other == org.mlflow.api.proto.Service.FileInfo.getDefaultInstance()) return this;
-        if (other.hasPath()) {
+      public Builder mergeFrom(org.mlflow.api.proto.Service.GetMetricHistory other) {
+        if (other == org.mlflow.api.proto.Service.GetMetricHistory.getDefaultInstance()) return this;
+        if (other.hasRunId()) {
           bitField0_ |= 0x00000001;
-          path_ = other.path_;
+          runId_ = other.runId_;
           onChanged();
         }
-        if (other.hasIsDir()) {
-          setIsDir(other.getIsDir());
+        if (other.hasRunUuid()) {
+          bitField0_ |= 0x00000002;
+          runUuid_ = other.runUuid_;
+          onChanged();
         }
-        if (other.hasFileSize()) {
-          setFileSize(other.getFileSize());
+        if (other.hasMetricKey()) {
+          bitField0_ |= 0x00000004;
+          metricKey_ = other.metricKey_;
+          onChanged();
+        }
+        if (other.hasPageToken()) {
+          bitField0_ |= 0x00000008;
+          pageToken_ = other.pageToken_;
+          onChanged();
+        }
+        if (other.hasMaxResults()) {
+          setMaxResults(other.getMaxResults());
         }
         this.mergeUnknownFields(other.unknownFields);
         onChanged();
@@ -49572,11 +53290,11 @@ public final class Service {
           com.google.protobuf.CodedInputStream input,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws java.io.IOException {
-        org.mlflow.api.proto.Service.FileInfo parsedMessage = null;
+        org.mlflow.api.proto.Service.GetMetricHistory parsedMessage = null;
         try {
           parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
         } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-          parsedMessage = (org.mlflow.api.proto.Service.FileInfo) e.getUnfinishedMessage();
+          parsedMessage = (org.mlflow.api.proto.Service.GetMetricHistory) e.getUnfinishedMessage();
           throw e.unwrapIOException();
         } finally {
           if (parsedMessage != null) {
@@ -49587,34 +53305,34 @@ public final class Service {
       }
       private int bitField0_;
 
-      private java.lang.Object path_ = "";
+      private java.lang.Object runId_ = "";
       /**
        * <pre>
-       * Path relative to the root artifact directory run.
+       * ID of the run from which to fetch metric values. Must be provided.
        * </pre>
        *
-       * <code>optional string path = 1;</code>
-       * @return Whether the path field is set.
+       * <code>optional string run_id = 3;</code>
+       * @return Whether the runId field is set.
        */
-      public boolean hasPath() {
+      public boolean hasRunId() {
         return ((bitField0_ & 0x00000001) != 0);
       }
       /**
        * <pre>
-       * Path relative to the root artifact directory run.
+       * ID of the run from which to fetch metric values. Must be provided.
        * </pre>
        *
-       * <code>optional string path = 1;</code>
-       * @return The path.
+       * <code>optional string run_id = 3;</code>
+       * @return The runId.
        */
-      public java.lang.String getPath() {
-        java.lang.Object ref = path_;
+      public java.lang.String getRunId() {
+        java.lang.Object ref = runId_;
         if (!(ref instanceof java.lang.String)) {
           com.google.protobuf.ByteString bs =
               (com.google.protobuf.ByteString) ref;
           java.lang.String s = bs.toStringUtf8();
           if (bs.isValidUtf8()) {
-            path_ = s;
+            runId_ = s;
           }
           return s;
         } else {
@@ -49623,20 +53341,20 @@ public final class Service {
       }
       /**
        * <pre>
-       * Path relative to the root artifact directory run.
+       * ID of the run from which to fetch metric values. Must be provided.
        * </pre>
        *
-       * <code>optional string path = 1;</code>
-       * @return The bytes for path.
+       * <code>optional string run_id = 3;</code>
+       * @return The bytes for runId.
        */
       public com.google.protobuf.ByteString
-          getPathBytes() {
-        java.lang.Object ref = path_;
+          getRunIdBytes() {
+        java.lang.Object ref = runId_;
         if (ref instanceof String) {
           com.google.protobuf.ByteString b = 
               com.google.protobuf.ByteString.copyFromUtf8(
                   (java.lang.String) ref);
-          path_ = b;
+          runId_ = b;
           return b;
         } else {
           return (com.google.protobuf.ByteString) ref;
@@ -49644,163 +53362,450 @@ public final class Service {
       }
       /**
        * <pre>
-       * Path relative to the root artifact directory run.
+       * ID of the run from which to fetch metric values. Must be provided.
        * </pre>
        *
-       * <code>optional string path = 1;</code>
-       * @param value The path to set.
+       * <code>optional string run_id = 3;</code>
+       * @param value The runId to set.
        * @return This builder for chaining.
        */
-      public Builder setPath(
+      public Builder setRunId(
           java.lang.String value) {
         if (value == null) {
     throw new NullPointerException();
   }
   bitField0_ |= 0x00000001;
-        path_ = value;
+        runId_ = value;
         onChanged();
         return this;
       }
       /**
        * <pre>
-       * Path relative to the root artifact directory run.
+       * ID of the run from which to fetch metric values. Must be provided.
        * </pre>
        *
-       * <code>optional string path = 1;</code>
+       * <code>optional string run_id = 3;</code>
        * @return This builder for chaining.
        */
-      public Builder clearPath() {
+      public Builder clearRunId() {
         bitField0_ = (bitField0_ & ~0x00000001);
-        path_ = getDefaultInstance().getPath();
+        runId_ = getDefaultInstance().getRunId();
         onChanged();
         return this;
       }
       /**
        * <pre>
-       * Path relative to the root artifact directory run.
+       * ID of the run from which to fetch metric values. Must be provided.
        * </pre>
        *
-       * <code>optional string path = 1;</code>
-       * @param value The bytes for path to set.
+       * <code>optional string run_id = 3;</code>
+       * @param value The bytes for runId to set.
        * @return This builder for chaining.
        */
-      public Builder setPathBytes(
+      public Builder setRunIdBytes(
           com.google.protobuf.ByteString value) {
         if (value == null) {
     throw new NullPointerException();
   }
   bitField0_ |= 0x00000001;
-        path_ = value;
+        runId_ = value;
+        onChanged();
+        return this;
+      }
+
+      private java.lang.Object runUuid_ = "";
+      /**
+       * <pre>
+       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
+       * will be removed in a future MLflow version.
+       * </pre>
+       *
+       * <code>optional string run_uuid = 1;</code>
+       * @return Whether the runUuid field is set.
+       */
+      public boolean hasRunUuid() {
+        return ((bitField0_ & 0x00000002) != 0);
+      }
+      /**
+       * <pre>
+       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
+       * will be removed in a future MLflow version.
+       * </pre>
+       *
+       * <code>optional string run_uuid = 1;</code>
+       * @return The runUuid.
+       */
+      public java.lang.String getRunUuid() {
+        java.lang.Object ref = runUuid_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            runUuid_ = s;
+          }
+          return s;
+        } else {
+          return (java.lang.String) ref;
+        }
+      }
+      /**
+       * <pre>
+       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
+       * will be removed in a future MLflow version.
+       * </pre>
+       *
+       * <code>optional string run_uuid = 1;</code>
+       * @return The bytes for runUuid.
+       */
+      public com.google.protobuf.ByteString
+          getRunUuidBytes() {
+        java.lang.Object ref = runUuid_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          runUuid_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
+      }
+      /**
+       * <pre>
+       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
+       * will be removed in a future MLflow version.
+       * </pre>
+       *
+       * <code>optional string run_uuid = 1;</code>
+       * @param value The runUuid to set.
+       * @return This builder for chaining.
+       */
+      public Builder setRunUuid(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000002;
+        runUuid_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
+       * will be removed in a future MLflow version.
+       * </pre>
+       *
+       * <code>optional string run_uuid = 1;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearRunUuid() {
+        bitField0_ = (bitField0_ & ~0x00000002);
+        runUuid_ = getDefaultInstance().getRunUuid();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
+       * will be removed in a future MLflow version.
+       * </pre>
+       *
+       * <code>optional string run_uuid = 1;</code>
+       * @param value The bytes for runUuid to set.
+       * @return This builder for chaining.
+       */
+      public Builder setRunUuidBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000002;
+        runUuid_ = value;
+        onChanged();
+        return this;
+      }
+
+      private java.lang.Object metricKey_ = "";
+      /**
+       * <pre>
+       * Name of the metric.
+       * </pre>
+       *
+       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+       * @return Whether the metricKey field is set.
+       */
+      public boolean hasMetricKey() {
+        return ((bitField0_ & 0x00000004) != 0);
+      }
+      /**
+       * <pre>
+       * Name of the metric.
+       * </pre>
+       *
+       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+       * @return The metricKey.
+       */
+      public java.lang.String getMetricKey() {
+        java.lang.Object ref = metricKey_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            metricKey_ = s;
+          }
+          return s;
+        } else {
+          return (java.lang.String) ref;
+        }
+      }
+      /**
+       * <pre>
+       * Name of the metric.
+       * </pre>
+       *
+       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+       * @return The bytes for metricKey.
+       */
+      public com.google.protobuf.ByteString
+          getMetricKeyBytes() {
+        java.lang.Object ref = metricKey_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          metricKey_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
+      }
+      /**
+       * <pre>
+       * Name of the metric.
+       * </pre>
+       *
+       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+       * @param value The metricKey to set.
+       * @return This builder for chaining.
+       */
+      public Builder setMetricKey(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000004;
+        metricKey_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Name of the metric.
+       * </pre>
+       *
+       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearMetricKey() {
+        bitField0_ = (bitField0_ & ~0x00000004);
+        metricKey_ = getDefaultInstance().getMetricKey();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Name of the metric.
+       * </pre>
+       *
+       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+       * @param value The bytes for metricKey to set.
+       * @return This builder for chaining.
+       */
+      public Builder setMetricKeyBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000004;
+        metricKey_ = value;
         onChanged();
         return this;
       }
-
-      private boolean isDir_ ;
+
+      private java.lang.Object pageToken_ = "";
+      /**
+       * <pre>
+       * Token indicating the page of metric history to fetch
+       * </pre>
+       *
+       * <code>optional string page_token = 4;</code>
+       * @return Whether the pageToken field is set.
+       */
+      public boolean hasPageToken() {
+        return ((bitField0_ & 0x00000008) != 0);
+      }
+      /**
+       * <pre>
+       * Token indicating the page of metric history to fetch
+       * </pre>
+       *
+       * <code>optional string page_token = 4;</code>
+       * @return The pageToken.
+       */
+      public java.lang.String getPageToken() {
+        java.lang.Object ref = pageToken_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            pageToken_ = s;
+          }
+          return s;
+        } else {
+          return (java.lang.String) ref;
+        }
+      }
       /**
        * <pre>
-       * Whether the path is a directory.
+       * Token indicating the page of metric history to fetch
        * </pre>
        *
-       * <code>optional bool is_dir = 2;</code>
-       * @return Whether the isDir field is set.
+       * <code>optional string page_token = 4;</code>
+       * @return The bytes for pageToken.
        */
-      @java.lang.Override
-      public boolean hasIsDir() {
-        return ((bitField0_ & 0x00000002) != 0);
+      public com.google.protobuf.ByteString
+          getPageTokenBytes() {
+        java.lang.Object ref = pageToken_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          pageToken_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
       }
       /**
        * <pre>
-       * Whether the path is a directory.
+       * Token indicating the page of metric history to fetch
        * </pre>
        *
-       * <code>optional bool is_dir = 2;</code>
-       * @return The isDir.
+       * <code>optional string page_token = 4;</code>
+       * @param value The pageToken to set.
+       * @return This builder for chaining.
        */
-      @java.lang.Override
-      public boolean getIsDir() {
-        return isDir_;
+      public Builder setPageToken(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000008;
+        pageToken_ = value;
+        onChanged();
+        return this;
       }
       /**
        * <pre>
-       * Whether the path is a directory.
+       * Token indicating the page of metric history to fetch
        * </pre>
        *
-       * <code>optional bool is_dir = 2;</code>
-       * @param value The isDir to set.
+       * <code>optional string page_token = 4;</code>
        * @return This builder for chaining.
        */
-      public Builder setIsDir(boolean value) {
-        bitField0_ |= 0x00000002;
-        isDir_ = value;
+      public Builder clearPageToken() {
+        bitField0_ = (bitField0_ & ~0x00000008);
+        pageToken_ = getDefaultInstance().getPageToken();
         onChanged();
         return this;
       }
       /**
        * <pre>
-       * Whether the path is a directory.
+       * Token indicating the page of metric history to fetch
        * </pre>
        *
-       * <code>optional bool is_dir = 2;</code>
+       * <code>optional string page_token = 4;</code>
+       * @param value The bytes for pageToken to set.
        * @return This builder for chaining.
        */
-      public Builder clearIsDir() {
-        bitField0_ = (bitField0_ & ~0x00000002);
-        isDir_ = false;
+      public Builder setPageTokenBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000008;
+        pageToken_ = value;
         onChanged();
         return this;
       }
 
-      private long fileSize_ ;
+      private int maxResults_ ;
       /**
        * <pre>
-       * Size in bytes. Unset for directories.
+       * Maximum number of logged instances of a metric for a run to return per call.
+       * Backend servers may restrict the value of `max_results` depending on performance requirements.
+       * Requests that do not specify this value will behave as non-paginated queries where all
+       * metric history values for a given metric within a run are returned in a single response.
        * </pre>
        *
-       * <code>optional int64 file_size = 3;</code>
-       * @return Whether the fileSize field is set.
+       * <code>optional int32 max_results = 5;</code>
+       * @return Whether the maxResults field is set.
        */
       @java.lang.Override
-      public boolean hasFileSize() {
-        return ((bitField0_ & 0x00000004) != 0);
+      public boolean hasMaxResults() {
+        return ((bitField0_ & 0x00000010) != 0);
       }
       /**
        * <pre>
-       * Size in bytes. Unset for directories.
+       * Maximum number of logged instances of a metric for a run to return per call.
+       * Backend servers may restrict the value of `max_results` depending on performance requirements.
+       * Requests that do not specify this value will behave as non-paginated queries where all
+       * metric history values for a given metric within a run are returned in a single response.
        * </pre>
        *
-       * <code>optional int64 file_size = 3;</code>
-       * @return The fileSize.
+       * <code>optional int32 max_results = 5;</code>
+       * @return The maxResults.
        */
       @java.lang.Override
-      public long getFileSize() {
-        return fileSize_;
+      public int getMaxResults() {
+        return maxResults_;
       }
       /**
        * <pre>
-       * Size in bytes. Unset for directories.
+       * Maximum number of logged instances of a metric for a run to return per call.
+       * Backend servers may restrict the value of `max_results` depending on performance requirements.
+       * Requests that do not specify this value will behave as non-paginated queries where all
+       * metric history values for a given metric within a run are returned in a single response.
        * </pre>
        *
-       * <code>optional int64 file_size = 3;</code>
-       * @param value The fileSize to set.
+       * <code>optional int32 max_results = 5;</code>
+       * @param value The maxResults to set.
        * @return This builder for chaining.
        */
-      public Builder setFileSize(long value) {
-        bitField0_ |= 0x00000004;
-        fileSize_ = value;
+      public Builder setMaxResults(int value) {
+        bitField0_ |= 0x00000010;
+        maxResults_ = value;
         onChanged();
         return this;
       }
       /**
        * <pre>
-       * Size in bytes. Unset for directories.
+       * Maximum number of logged instances of a metric for a run to return per call.
+       * Backend servers may restrict the value of `max_results` depending on performance requirements.
+       * Requests that do not specify this value will behave as non-paginated queries where all
+       * metric history values for a given metric within a run are returned in a single response.
        * </pre>
        *
-       * <code>optional int64 file_size = 3;</code>
+       * <code>optional int32 max_results = 5;</code>
        * @return This builder for chaining.
        */
-      public Builder clearFileSize() {
-        bitField0_ = (bitField0_ & ~0x00000004);
-        fileSize_ = 0L;
+      public Builder clearMaxResults() {
+        bitField0_ = (bitField0_ & ~0x00000010);
+        maxResults_ = 0;
         onChanged();
         return this;
       }
@@ -49817,1581 +53822,1372 @@ public final class Service {
       }
 
 
-      // @@protoc_insertion_point(builder_scope:mlflow.FileInfo)
+      // @@protoc_insertion_point(builder_scope:mlflow.GetMetricHistory)
     }
 
-    // @@protoc_insertion_point(class_scope:mlflow.FileInfo)
-    private static final org.mlflow.api.proto.Service.FileInfo DEFAULT_INSTANCE;
+    // @@protoc_insertion_point(class_scope:mlflow.GetMetricHistory)
+    private static final org.mlflow.api.proto.Service.GetMetricHistory DEFAULT_INSTANCE;
     static {
-      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.FileInfo();
+      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.GetMetricHistory();
     }
 
-    public static org.mlflow.api.proto.Service.FileInfo getDefaultInstance() {
+    public static org.mlflow.api.proto.Service.GetMetricHistory getDefaultInstance() {
       return DEFAULT_INSTANCE;
     }
 
-    @java.lang.Deprecated public static final com.google.protobuf.Parser<FileInfo>
-        PARSER = new com.google.protobuf.AbstractParser<FileInfo>() {
+    @java.lang.Deprecated public static final com.google.protobuf.Parser<GetMetricHistory>
+        PARSER = new com.google.protobuf.AbstractParser<GetMetricHistory>() {
       @java.lang.Override
-      public FileInfo parsePartialFrom(
+      public GetMetricHistory parsePartialFrom(
           com.google.protobuf.CodedInputStream input,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws com.google.protobuf.InvalidProtocolBufferException {
-        return new FileInfo(input, extensionRegistry);
+        return new GetMetricHistory(input, extensionRegistry);
       }
     };
 
-    public static com.google.protobuf.Parser<FileInfo> parser() {
+    public static com.google.protobuf.Parser<GetMetricHistory> parser() {
       return PARSER;
     }
 
     @java.lang.Override
-    public com.google.protobuf.Parser<FileInfo> getParserForType() {
+    public com.google.protobuf.Parser<GetMetricHistory> getParserForType() {
       return PARSER;
     }
 
     @java.lang.Override
-    public org.mlflow.api.proto.Service.FileInfo getDefaultInstanceForType() {
+    public org.mlflow.api.proto.Service.GetMetricHistory getDefaultInstanceForType() {
       return DEFAULT_INSTANCE;
     }
 
   }
 
-  public interface GetMetricHistoryOrBuilder extends
-      // @@protoc_insertion_point(interface_extends:mlflow.GetMetricHistory)
+  public interface MetricWithRunIdOrBuilder extends
+      // @@protoc_insertion_point(interface_extends:mlflow.MetricWithRunId)
       com.google.protobuf.MessageOrBuilder {
 
     /**
      * <pre>
-     * ID of the run from which to fetch metric values. Must be provided.
+     * Key identifying this metric.
      * </pre>
      *
-     * <code>optional string run_id = 3;</code>
-     * @return Whether the runId field is set.
+     * <code>optional string key = 1;</code>
+     * @return Whether the key field is set.
      */
-    boolean hasRunId();
+    boolean hasKey();
     /**
      * <pre>
-     * ID of the run from which to fetch metric values. Must be provided.
+     * Key identifying this metric.
      * </pre>
      *
-     * <code>optional string run_id = 3;</code>
-     * @return The runId.
+     * <code>optional string key = 1;</code>
+     * @return The key.
      */
-    java.lang.String getRunId();
+    java.lang.String getKey();
     /**
      * <pre>
-     * ID of the run from which to fetch metric values. Must be provided.
+     * Key identifying this metric.
      * </pre>
      *
-     * <code>optional string run_id = 3;</code>
-     * @return The bytes for runId.
+     * <code>optional string key = 1;</code>
+     * @return The bytes for key.
      */
     com.google.protobuf.ByteString
-        getRunIdBytes();
+        getKeyBytes();
 
     /**
      * <pre>
-     * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
-     * will be removed in a future MLflow version.
-     * </pre>
-     *
-     * <code>optional string run_uuid = 1;</code>
-     * @return Whether the runUuid field is set.
-     */
-    boolean hasRunUuid();
-    /**
-     * <pre>
-     * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
-     * will be removed in a future MLflow version.
+     * Value associated with this metric.
      * </pre>
      *
-     * <code>optional string run_uuid = 1;</code>
-     * @return The runUuid.
+     * <code>optional double value = 2;</code>
+     * @return Whether the value field is set.
      */
-    java.lang.String getRunUuid();
+    boolean hasValue();
     /**
      * <pre>
-     * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
-     * will be removed in a future MLflow version.
+     * Value associated with this metric.
      * </pre>
      *
-     * <code>optional string run_uuid = 1;</code>
-     * @return The bytes for runUuid.
+     * <code>optional double value = 2;</code>
+     * @return The value.
      */
-    com.google.protobuf.ByteString
-        getRunUuidBytes();
+    double getValue();
 
     /**
      * <pre>
-     * Name of the metric.
-     * </pre>
-     *
-     * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-     * @return Whether the metricKey field is set.
-     */
-    boolean hasMetricKey();
-    /**
-     * <pre>
-     * Name of the metric.
+     * The timestamp at which this metric was recorded.
      * </pre>
      *
-     * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-     * @return The metricKey.
+     * <code>optional int64 timestamp = 3;</code>
+     * @return Whether the timestamp field is set.
      */
-    java.lang.String getMetricKey();
+    boolean hasTimestamp();
     /**
      * <pre>
-     * Name of the metric.
+     * The timestamp at which this metric was recorded.
      * </pre>
      *
-     * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-     * @return The bytes for metricKey.
+     * <code>optional int64 timestamp = 3;</code>
+     * @return The timestamp.
      */
-    com.google.protobuf.ByteString
-        getMetricKeyBytes();
+    long getTimestamp();
 
     /**
      * <pre>
-     * Token indicating the page of metric history to fetch
+     * Step at which to log the metric.
      * </pre>
      *
-     * <code>optional string page_token = 4;</code>
-     * @return Whether the pageToken field is set.
+     * <code>optional int64 step = 4 [default = 0];</code>
+     * @return Whether the step field is set.
      */
-    boolean hasPageToken();
+    boolean hasStep();
     /**
      * <pre>
-     * Token indicating the page of metric history to fetch
+     * Step at which to log the metric.
      * </pre>
      *
-     * <code>optional string page_token = 4;</code>
-     * @return The pageToken.
+     * <code>optional int64 step = 4 [default = 0];</code>
+     * @return The step.
      */
-    java.lang.String getPageToken();
+    long getStep();
+
     /**
      * <pre>
-     * Token indicating the page of metric history to fetch
+     * The ID of the run containing the metric
      * </pre>
      *
-     * <code>optional string page_token = 4;</code>
-     * @return The bytes for pageToken.
+     * <code>optional string run_id = 5;</code>
+     * @return Whether the runId field is set.
      */
-    com.google.protobuf.ByteString
-        getPageTokenBytes();
-
+    boolean hasRunId();
     /**
      * <pre>
-     * Maximum number of logged instances of a metric for a run to return per call.
-     * Backend servers may restrict the value of `max_results` depending on performance requirements.
-     * Requests that do not specify this value will behave as non-paginated queries where all
-     * metric history values for a given metric within a run are returned in a single response.
+     * The ID of the run containing the metric
      * </pre>
      *
-     * <code>optional int32 max_results = 5;</code>
-     * @return Whether the maxResults field is set.
+     * <code>optional string run_id = 5;</code>
+     * @return The runId.
      */
-    boolean hasMaxResults();
+    java.lang.String getRunId();
     /**
      * <pre>
-     * Maximum number of logged instances of a metric for a run to return per call.
-     * Backend servers may restrict the value of `max_results` depending on performance requirements.
-     * Requests that do not specify this value will behave as non-paginated queries where all
-     * metric history values for a given metric within a run are returned in a single response.
+     * The ID of the run containing the metric
      * </pre>
      *
-     * <code>optional int32 max_results = 5;</code>
-     * @return The maxResults.
+     * <code>optional string run_id = 5;</code>
+     * @return The bytes for runId.
      */
-    int getMaxResults();
+    com.google.protobuf.ByteString
+        getRunIdBytes();
   }
   /**
-   * Protobuf type {@code mlflow.GetMetricHistory}
+   * Protobuf type {@code mlflow.MetricWithRunId}
    */
-  public static final class GetMetricHistory extends
+  public static final class MetricWithRunId extends
       com.google.protobuf.GeneratedMessageV3 implements
-      // @@protoc_insertion_point(message_implements:mlflow.GetMetricHistory)
-      GetMetricHistoryOrBuilder {
+      // @@protoc_insertion_point(message_implements:mlflow.MetricWithRunId)
+      MetricWithRunIdOrBuilder {
   private static final long serialVersionUID = 0L;
-    // Use GetMetricHistory.newBuilder() to construct.
-    private GetMetricHistory(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+    // Use MetricWithRunId.newBuilder() to construct.
+    private MetricWithRunId(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
       super(builder);
     }
-    private GetMetricHistory() {
+    private MetricWithRunId() {
+      key_ = "";
       runId_ = "";
-      runUuid_ = "";
-      metricKey_ = "";
-      pageToken_ = "";
     }
 
     @java.lang.Override
     @SuppressWarnings({"unused"})
     protected java.lang.Object newInstance(
         UnusedPrivateParameter unused) {
-      return new GetMetricHistory();
+      return new MetricWithRunId();
     }
 
     @java.lang.Override
     public final com.google.protobuf.UnknownFieldSet
-    getUnknownFields() {
-      return this.unknownFields;
-    }
-    private GetMetricHistory(
-        com.google.protobuf.CodedInputStream input,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      this();
-      if (extensionRegistry == null) {
-        throw new java.lang.NullPointerException();
-      }
-      int mutable_bitField0_ = 0;
-      com.google.protobuf.UnknownFieldSet.Builder unknownFields =
-          com.google.protobuf.UnknownFieldSet.newBuilder();
-      try {
-        boolean done = false;
-        while (!done) {
-          int tag = input.readTag();
-          switch (tag) {
-            case 0:
-              done = true;
-              break;
-            case 10: {
-              com.google.protobuf.ByteString bs = input.readBytes();
-              bitField0_ |= 0x00000002;
-              runUuid_ = bs;
-              break;
-            }
-            case 18: {
-              com.google.protobuf.ByteString bs = input.readBytes();
-              bitField0_ |= 0x00000004;
-              metricKey_ = bs;
-              break;
-            }
-            case 26: {
-              com.google.protobuf.ByteString bs = input.readBytes();
-              bitField0_ |= 0x00000001;
-              runId_ = bs;
-              break;
-            }
-            case 34: {
-              com.google.protobuf.ByteString bs = input.readBytes();
-              bitField0_ |= 0x00000008;
-              pageToken_ = bs;
-              break;
-            }
-            case 40: {
-              bitField0_ |= 0x00000010;
-              maxResults_ = input.readInt32();
-              break;
-            }
-            default: {
-              if (!parseUnknownField(
-                  input, unknownFields, extensionRegistry, tag)) {
-                done = true;
-              }
-              break;
-            }
-          }
-        }
-      } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-        throw e.setUnfinishedMessage(this);
-      } catch (java.io.IOException e) {
-        throw new com.google.protobuf.InvalidProtocolBufferException(
-            e).setUnfinishedMessage(this);
-      } finally {
-        this.unknownFields = unknownFields.build();
-        makeExtensionsImmutable();
-      }
-    }
-    public static final com.google.protobuf.Descriptors.Descriptor
-        getDescriptor() {
-      return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistory_descriptor;
-    }
-
-    @java.lang.Override
-    protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
-        internalGetFieldAccessorTable() {
-      return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistory_fieldAccessorTable
-          .ensureFieldAccessorsInitialized(
-              org.mlflow.api.proto.Service.GetMetricHistory.class, org.mlflow.api.proto.Service.GetMetricHistory.Builder.class);
-    }
-
-    public interface ResponseOrBuilder extends
-        // @@protoc_insertion_point(interface_extends:mlflow.GetMetricHistory.Response)
-        com.google.protobuf.MessageOrBuilder {
-
-      /**
-       * <pre>
-       * All logged values for this metric.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 1;</code>
-       */
-      java.util.List<org.mlflow.api.proto.Service.Metric> 
-          getMetricsList();
-      /**
-       * <pre>
-       * All logged values for this metric.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 1;</code>
-       */
-      org.mlflow.api.proto.Service.Metric getMetrics(int index);
-      /**
-       * <pre>
-       * All logged values for this metric.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 1;</code>
-       */
-      int getMetricsCount();
-      /**
-       * <pre>
-       * All logged values for this metric.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 1;</code>
-       */
-      java.util.List<? extends org.mlflow.api.proto.Service.MetricOrBuilder> 
-          getMetricsOrBuilderList();
-      /**
-       * <pre>
-       * All logged values for this metric.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 1;</code>
-       */
-      org.mlflow.api.proto.Service.MetricOrBuilder getMetricsOrBuilder(
-          int index);
-
-      /**
-       * <pre>
-       * Token that can be used to issue a query for the next page of metric history values.
-       * A missing token indicates that no additional metrics are available to fetch.
-       * </pre>
-       *
-       * <code>optional string next_page_token = 2;</code>
-       * @return Whether the nextPageToken field is set.
-       */
-      boolean hasNextPageToken();
-      /**
-       * <pre>
-       * Token that can be used to issue a query for the next page of metric history values.
-       * A missing token indicates that no additional metrics are available to fetch.
-       * </pre>
-       *
-       * <code>optional string next_page_token = 2;</code>
-       * @return The nextPageToken.
-       */
-      java.lang.String getNextPageToken();
-      /**
-       * <pre>
-       * Token that can be used to issue a query for the next page of metric history values.
-       * A missing token indicates that no additional metrics are available to fetch.
-       * </pre>
-       *
-       * <code>optional string next_page_token = 2;</code>
-       * @return The bytes for nextPageToken.
-       */
-      com.google.protobuf.ByteString
-          getNextPageTokenBytes();
-    }
-    /**
-     * Protobuf type {@code mlflow.GetMetricHistory.Response}
-     */
-    public static final class Response extends
-        com.google.protobuf.GeneratedMessageV3 implements
-        // @@protoc_insertion_point(message_implements:mlflow.GetMetricHistory.Response)
-        ResponseOrBuilder {
-    private static final long serialVersionUID = 0L;
-      // Use Response.newBuilder() to construct.
-      private Response(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
-        super(builder);
-      }
-      private Response() {
-        metrics_ = java.util.Collections.emptyList();
-        nextPageToken_ = "";
-      }
-
-      @java.lang.Override
-      @SuppressWarnings({"unused"})
-      protected java.lang.Object newInstance(
-          UnusedPrivateParameter unused) {
-        return new Response();
-      }
-
-      @java.lang.Override
-      public final com.google.protobuf.UnknownFieldSet
-      getUnknownFields() {
-        return this.unknownFields;
-      }
-      private Response(
-          com.google.protobuf.CodedInputStream input,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        this();
-        if (extensionRegistry == null) {
-          throw new java.lang.NullPointerException();
-        }
-        int mutable_bitField0_ = 0;
-        com.google.protobuf.UnknownFieldSet.Builder unknownFields =
-            com.google.protobuf.UnknownFieldSet.newBuilder();
-        try {
-          boolean done = false;
-          while (!done) {
-            int tag = input.readTag();
-            switch (tag) {
-              case 0:
+    getUnknownFields() {
+      return this.unknownFields;
+    }
+    private MetricWithRunId(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      this();
+      if (extensionRegistry == null) {
+        throw new java.lang.NullPointerException();
+      }
+      int mutable_bitField0_ = 0;
+      com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+          com.google.protobuf.UnknownFieldSet.newBuilder();
+      try {
+        boolean done = false;
+        while (!done) {
+          int tag = input.readTag();
+          switch (tag) {
+            case 0:
+              done = true;
+              break;
+            case 10: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000001;
+              key_ = bs;
+              break;
+            }
+            case 17: {
+              bitField0_ |= 0x00000002;
+              value_ = input.readDouble();
+              break;
+            }
+            case 24: {
+              bitField0_ |= 0x00000004;
+              timestamp_ = input.readInt64();
+              break;
+            }
+            case 32: {
+              bitField0_ |= 0x00000008;
+              step_ = input.readInt64();
+              break;
+            }
+            case 42: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000010;
+              runId_ = bs;
+              break;
+            }
+            default: {
+              if (!parseUnknownField(
+                  input, unknownFields, extensionRegistry, tag)) {
                 done = true;
-                break;
-              case 10: {
-                if (!((mutable_bitField0_ & 0x00000001) != 0)) {
-                  metrics_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Metric>();
-                  mutable_bitField0_ |= 0x00000001;
-                }
-                metrics_.add(
-                    input.readMessage(org.mlflow.api.proto.Service.Metric.PARSER, extensionRegistry));
-                break;
-              }
-              case 18: {
-                com.google.protobuf.ByteString bs = input.readBytes();
-                bitField0_ |= 0x00000001;
-                nextPageToken_ = bs;
-                break;
-              }
-              default: {
-                if (!parseUnknownField(
-                    input, unknownFields, extensionRegistry, tag)) {
-                  done = true;
-                }
-                break;
               }
+              break;
             }
           }
-        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-          throw e.setUnfinishedMessage(this);
-        } catch (java.io.IOException e) {
-          throw new com.google.protobuf.InvalidProtocolBufferException(
-              e).setUnfinishedMessage(this);
-        } finally {
-          if (((mutable_bitField0_ & 0x00000001) != 0)) {
-            metrics_ = java.util.Collections.unmodifiableList(metrics_);
-          }
-          this.unknownFields = unknownFields.build();
-          makeExtensionsImmutable();
         }
+      } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+        throw e.setUnfinishedMessage(this);
+      } catch (java.io.IOException e) {
+        throw new com.google.protobuf.InvalidProtocolBufferException(
+            e).setUnfinishedMessage(this);
+      } finally {
+        this.unknownFields = unknownFields.build();
+        makeExtensionsImmutable();
       }
-      public static final com.google.protobuf.Descriptors.Descriptor
-          getDescriptor() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistory_Response_descriptor;
-      }
-
-      @java.lang.Override
-      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
-          internalGetFieldAccessorTable() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistory_Response_fieldAccessorTable
-            .ensureFieldAccessorsInitialized(
-                org.mlflow.api.proto.Service.GetMetricHistory.Response.class, org.mlflow.api.proto.Service.GetMetricHistory.Response.Builder.class);
-      }
+    }
+    public static final com.google.protobuf.Descriptors.Descriptor
+        getDescriptor() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_MetricWithRunId_descriptor;
+    }
 
-      private int bitField0_;
-      public static final int METRICS_FIELD_NUMBER = 1;
-      private java.util.List<org.mlflow.api.proto.Service.Metric> metrics_;
-      /**
-       * <pre>
-       * All logged values for this metric.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 1;</code>
-       */
-      @java.lang.Override
-      public java.util.List<org.mlflow.api.proto.Service.Metric> getMetricsList() {
-        return metrics_;
-      }
-      /**
-       * <pre>
-       * All logged values for this metric.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 1;</code>
-       */
-      @java.lang.Override
-      public java.util.List<? extends org.mlflow.api.proto.Service.MetricOrBuilder> 
-          getMetricsOrBuilderList() {
-        return metrics_;
-      }
-      /**
-       * <pre>
-       * All logged values for this metric.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 1;</code>
-       */
-      @java.lang.Override
-      public int getMetricsCount() {
-        return metrics_.size();
-      }
-      /**
-       * <pre>
-       * All logged values for this metric.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 1;</code>
-       */
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.Metric getMetrics(int index) {
-        return metrics_.get(index);
-      }
-      /**
-       * <pre>
-       * All logged values for this metric.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 1;</code>
-       */
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.MetricOrBuilder getMetricsOrBuilder(
-          int index) {
-        return metrics_.get(index);
-      }
+    @java.lang.Override
+    protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+        internalGetFieldAccessorTable() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_MetricWithRunId_fieldAccessorTable
+          .ensureFieldAccessorsInitialized(
+              org.mlflow.api.proto.Service.MetricWithRunId.class, org.mlflow.api.proto.Service.MetricWithRunId.Builder.class);
+    }
 
-      public static final int NEXT_PAGE_TOKEN_FIELD_NUMBER = 2;
-      private volatile java.lang.Object nextPageToken_;
-      /**
-       * <pre>
-       * Token that can be used to issue a query for the next page of metric history values.
-       * A missing token indicates that no additional metrics are available to fetch.
-       * </pre>
-       *
-       * <code>optional string next_page_token = 2;</code>
-       * @return Whether the nextPageToken field is set.
-       */
-      @java.lang.Override
-      public boolean hasNextPageToken() {
-        return ((bitField0_ & 0x00000001) != 0);
-      }
-      /**
-       * <pre>
-       * Token that can be used to issue a query for the next page of metric history values.
-       * A missing token indicates that no additional metrics are available to fetch.
-       * </pre>
-       *
-       * <code>optional string next_page_token = 2;</code>
-       * @return The nextPageToken.
-       */
-      @java.lang.Override
-      public java.lang.String getNextPageToken() {
-        java.lang.Object ref = nextPageToken_;
-        if (ref instanceof java.lang.String) {
-          return (java.lang.String) ref;
-        } else {
-          com.google.protobuf.ByteString bs = 
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            nextPageToken_ = s;
-          }
-          return s;
+    private int bitField0_;
+    public static final int KEY_FIELD_NUMBER = 1;
+    private volatile java.lang.Object key_;
+    /**
+     * <pre>
+     * Key identifying this metric.
+     * </pre>
+     *
+     * <code>optional string key = 1;</code>
+     * @return Whether the key field is set.
+     */
+    @java.lang.Override
+    public boolean hasKey() {
+      return ((bitField0_ & 0x00000001) != 0);
+    }
+    /**
+     * <pre>
+     * Key identifying this metric.
+     * </pre>
+     *
+     * <code>optional string key = 1;</code>
+     * @return The key.
+     */
+    @java.lang.Override
+    public java.lang.String getKey() {
+      java.lang.Object ref = key_;
+      if (ref instanceof java.lang.String) {
+        return (java.lang.String) ref;
+      } else {
+        com.google.protobuf.ByteString bs = 
+            (com.google.protobuf.ByteString) ref;
+        java.lang.String s = bs.toStringUtf8();
+        if (bs.isValidUtf8()) {
+          key_ = s;
         }
+        return s;
       }
-      /**
-       * <pre>
-       * Token that can be used to issue a query for the next page of metric history values.
-       * A missing token indicates that no additional metrics are available to fetch.
-       * </pre>
-       *
-       * <code>optional string next_page_token = 2;</code>
-       * @return The bytes for nextPageToken.
-       */
-      @java.lang.Override
-      public com.google.protobuf.ByteString
-          getNextPageTokenBytes() {
-        java.lang.Object ref = nextPageToken_;
-        if (ref instanceof java.lang.String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          nextPageToken_ = b;
-          return b;
-        } else {
-          return (com.google.protobuf.ByteString) ref;
-        }
+    }
+    /**
+     * <pre>
+     * Key identifying this metric.
+     * </pre>
+     *
+     * <code>optional string key = 1;</code>
+     * @return The bytes for key.
+     */
+    @java.lang.Override
+    public com.google.protobuf.ByteString
+        getKeyBytes() {
+      java.lang.Object ref = key_;
+      if (ref instanceof java.lang.String) {
+        com.google.protobuf.ByteString b = 
+            com.google.protobuf.ByteString.copyFromUtf8(
+                (java.lang.String) ref);
+        key_ = b;
+        return b;
+      } else {
+        return (com.google.protobuf.ByteString) ref;
       }
+    }
 
-      private byte memoizedIsInitialized = -1;
-      @java.lang.Override
-      public final boolean isInitialized() {
-        byte isInitialized = memoizedIsInitialized;
-        if (isInitialized == 1) return true;
-        if (isInitialized == 0) return false;
-
-        memoizedIsInitialized = 1;
-        return true;
-      }
+    public static final int VALUE_FIELD_NUMBER = 2;
+    private double value_;
+    /**
+     * <pre>
+     * Value associated with this metric.
+     * </pre>
+     *
+     * <code>optional double value = 2;</code>
+     * @return Whether the value field is set.
+     */
+    @java.lang.Override
+    public boolean hasValue() {
+      return ((bitField0_ & 0x00000002) != 0);
+    }
+    /**
+     * <pre>
+     * Value associated with this metric.
+     * </pre>
+     *
+     * <code>optional double value = 2;</code>
+     * @return The value.
+     */
+    @java.lang.Override
+    public double getValue() {
+      return value_;
+    }
 
-      @java.lang.Override
-      public void writeTo(com.google.protobuf.CodedOutputStream output)
-                          throws java.io.IOException {
-        for (int i = 0; i < metrics_.size(); i++) {
-          output.writeMessage(1, metrics_.get(i));
-        }
-        if (((bitField0_ & 0x00000001) != 0)) {
-          com.google.protobuf.GeneratedMessageV3.writeString(output, 2, nextPageToken_);
-        }
-        unknownFields.writeTo(output);
-      }
+    public static final int TIMESTAMP_FIELD_NUMBER = 3;
+    private long timestamp_;
+    /**
+     * <pre>
+     * The timestamp at which this metric was recorded.
+     * </pre>
+     *
+     * <code>optional int64 timestamp = 3;</code>
+     * @return Whether the timestamp field is set.
+     */
+    @java.lang.Override
+    public boolean hasTimestamp() {
+      return ((bitField0_ & 0x00000004) != 0);
+    }
+    /**
+     * <pre>
+     * The timestamp at which this metric was recorded.
+     * </pre>
+     *
+     * <code>optional int64 timestamp = 3;</code>
+     * @return The timestamp.
+     */
+    @java.lang.Override
+    public long getTimestamp() {
+      return timestamp_;
+    }
 
-      @java.lang.Override
-      public int getSerializedSize() {
-        int size = memoizedSize;
-        if (size != -1) return size;
+    public static final int STEP_FIELD_NUMBER = 4;
+    private long step_;
+    /**
+     * <pre>
+     * Step at which to log the metric.
+     * </pre>
+     *
+     * <code>optional int64 step = 4 [default = 0];</code>
+     * @return Whether the step field is set.
+     */
+    @java.lang.Override
+    public boolean hasStep() {
+      return ((bitField0_ & 0x00000008) != 0);
+    }
+    /**
+     * <pre>
+     * Step at which to log the metric.
+     * </pre>
+     *
+     * <code>optional int64 step = 4 [default = 0];</code>
+     * @return The step.
+     */
+    @java.lang.Override
+    public long getStep() {
+      return step_;
+    }
 
-        size = 0;
-        for (int i = 0; i < metrics_.size(); i++) {
-          size += com.google.protobuf.CodedOutputStream
-            .computeMessageSize(1, metrics_.get(i));
-        }
-        if (((bitField0_ & 0x00000001) != 0)) {
-          size += com.google.protobuf.GeneratedMessageV3.computeStringSize(2, nextPageToken_);
+    public static final int RUN_ID_FIELD_NUMBER = 5;
+    private volatile java.lang.Object runId_;
+    /**
+     * <pre>
+     * The ID of the run containing the metric
+     * </pre>
+     *
+     * <code>optional string run_id = 5;</code>
+     * @return Whether the runId field is set.
+     */
+    @java.lang.Override
+    public boolean hasRunId() {
+      return ((bitField0_ & 0x00000010) != 0);
+    }
+    /**
+     * <pre>
+     * The ID of the run containing the metric
+     * </pre>
+     *
+     * <code>optional string run_id = 5;</code>
+     * @return The runId.
+     */
+    @java.lang.Override
+    public java.lang.String getRunId() {
+      java.lang.Object ref = runId_;
+      if (ref instanceof java.lang.String) {
+        return (java.lang.String) ref;
+      } else {
+        com.google.protobuf.ByteString bs = 
+            (com.google.protobuf.ByteString) ref;
+        java.lang.String s = bs.toStringUtf8();
+        if (bs.isValidUtf8()) {
+          runId_ = s;
         }
-        size += unknownFields.getSerializedSize();
-        memoizedSize = size;
-        return size;
+        return s;
       }
-
-      @java.lang.Override
-      public boolean equals(final java.lang.Object obj) {
-        if (obj == this) {
-         return true;
-        }
-        if (!(obj instanceof org.mlflow.api.proto.Service.GetMetricHistory.Response)) {
-          return super.equals(obj);
-        }
-        org.mlflow.api.proto.Service.GetMetricHistory.Response other = (org.mlflow.api.proto.Service.GetMetricHistory.Response) obj;
-
-        if (!getMetricsList()
-            .equals(other.getMetricsList())) return false;
-        if (hasNextPageToken() != other.hasNextPageToken()) return false;
-        if (hasNextPageToken()) {
-          if (!getNextPageToken()
-              .equals(other.getNextPageToken())) return false;
-        }
-        if (!unknownFields.equals(other.unknownFields)) return false;
-        return true;
+    }
+    /**
+     * <pre>
+     * The ID of the run containing the metric
+     * </pre>
+     *
+     * <code>optional string run_id = 5;</code>
+     * @return The bytes for runId.
+     */
+    @java.lang.Override
+    public com.google.protobuf.ByteString
+        getRunIdBytes() {
+      java.lang.Object ref = runId_;
+      if (ref instanceof java.lang.String) {
+        com.google.protobuf.ByteString b = 
+            com.google.protobuf.ByteString.copyFromUtf8(
+                (java.lang.String) ref);
+        runId_ = b;
+        return b;
+      } else {
+        return (com.google.protobuf.ByteString) ref;
       }
+    }
 
-      @java.lang.Override
-      public int hashCode() {
-        if (memoizedHashCode != 0) {
-          return memoizedHashCode;
-        }
-        int hash = 41;
-        hash = (19 * hash) + getDescriptor().hashCode();
-        if (getMetricsCount() > 0) {
-          hash = (37 * hash) + METRICS_FIELD_NUMBER;
-          hash = (53 * hash) + getMetricsList().hashCode();
-        }
-        if (hasNextPageToken()) {
-          hash = (37 * hash) + NEXT_PAGE_TOKEN_FIELD_NUMBER;
-          hash = (53 * hash) + getNextPageToken().hashCode();
-        }
-        hash = (29 * hash) + unknownFields.hashCode();
-        memoizedHashCode = hash;
-        return hash;
-      }
+    private byte memoizedIsInitialized = -1;
+    @java.lang.Override
+    public final boolean isInitialized() {
+      byte isInitialized = memoizedIsInitialized;
+      if (isInitialized == 1) return true;
+      if (isInitialized == 0) return false;
+
+      memoizedIsInitialized = 1;
+      return true;
+    }
 
-      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseFrom(
-          java.nio.ByteBuffer data)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return PARSER.parseFrom(data);
+    @java.lang.Override
+    public void writeTo(com.google.protobuf.CodedOutputStream output)
+                        throws java.io.IOException {
+      if (((bitField0_ & 0x00000001) != 0)) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 1, key_);
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseFrom(
-          java.nio.ByteBuffer data,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return PARSER.parseFrom(data, extensionRegistry);
+      if (((bitField0_ & 0x00000002) != 0)) {
+        output.writeDouble(2, value_);
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseFrom(
-          com.google.protobuf.ByteString data)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return PARSER.parseFrom(data);
+      if (((bitField0_ & 0x00000004) != 0)) {
+        output.writeInt64(3, timestamp_);
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseFrom(
-          com.google.protobuf.ByteString data,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return PARSER.parseFrom(data, extensionRegistry);
+      if (((bitField0_ & 0x00000008) != 0)) {
+        output.writeInt64(4, step_);
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseFrom(byte[] data)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return PARSER.parseFrom(data);
+      if (((bitField0_ & 0x00000010) != 0)) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 5, runId_);
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseFrom(
-          byte[] data,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return PARSER.parseFrom(data, extensionRegistry);
+      unknownFields.writeTo(output);
+    }
+
+    @java.lang.Override
+    public int getSerializedSize() {
+      int size = memoizedSize;
+      if (size != -1) return size;
+
+      size = 0;
+      if (((bitField0_ & 0x00000001) != 0)) {
+        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(1, key_);
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseFrom(java.io.InputStream input)
-          throws java.io.IOException {
-        return com.google.protobuf.GeneratedMessageV3
-            .parseWithIOException(PARSER, input);
+      if (((bitField0_ & 0x00000002) != 0)) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeDoubleSize(2, value_);
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseFrom(
-          java.io.InputStream input,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws java.io.IOException {
-        return com.google.protobuf.GeneratedMessageV3
-            .parseWithIOException(PARSER, input, extensionRegistry);
+      if (((bitField0_ & 0x00000004) != 0)) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeInt64Size(3, timestamp_);
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseDelimitedFrom(java.io.InputStream input)
-          throws java.io.IOException {
-        return com.google.protobuf.GeneratedMessageV3
-            .parseDelimitedWithIOException(PARSER, input);
+      if (((bitField0_ & 0x00000008) != 0)) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeInt64Size(4, step_);
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseDelimitedFrom(
-          java.io.InputStream input,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws java.io.IOException {
-        return com.google.protobuf.GeneratedMessageV3
-            .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+      if (((bitField0_ & 0x00000010) != 0)) {
+        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(5, runId_);
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseFrom(
-          com.google.protobuf.CodedInputStream input)
-          throws java.io.IOException {
-        return com.google.protobuf.GeneratedMessageV3
-            .parseWithIOException(PARSER, input);
+      size += unknownFields.getSerializedSize();
+      memoizedSize = size;
+      return size;
+    }
+
+    @java.lang.Override
+    public boolean equals(final java.lang.Object obj) {
+      if (obj == this) {
+       return true;
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistory.Response parseFrom(
-          com.google.protobuf.CodedInputStream input,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws java.io.IOException {
-        return com.google.protobuf.GeneratedMessageV3
-            .parseWithIOException(PARSER, input, extensionRegistry);
+      if (!(obj instanceof org.mlflow.api.proto.Service.MetricWithRunId)) {
+        return super.equals(obj);
       }
+      org.mlflow.api.proto.Service.MetricWithRunId other = (org.mlflow.api.proto.Service.MetricWithRunId) obj;
 
-      @java.lang.Override
-      public Builder newBuilderForType() { return newBuilder(); }
-      public static Builder newBuilder() {
-        return DEFAULT_INSTANCE.toBuilder();
+      if (hasKey() != other.hasKey()) return false;
+      if (hasKey()) {
+        if (!getKey()
+            .equals(other.getKey())) return false;
       }
-      public static Builder newBuilder(org.mlflow.api.proto.Service.GetMetricHistory.Response prototype) {
-        return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+      if (hasValue() != other.hasValue()) return false;
+      if (hasValue()) {
+        if (java.lang.Double.doubleToLongBits(getValue())
+            != java.lang.Double.doubleToLongBits(
+                other.getValue())) return false;
       }
-      @java.lang.Override
-      public Builder toBuilder() {
-        return this == DEFAULT_INSTANCE
-            ? new Builder() : new Builder().mergeFrom(this);
+      if (hasTimestamp() != other.hasTimestamp()) return false;
+      if (hasTimestamp()) {
+        if (getTimestamp()
+            != other.getTimestamp()) return false;
       }
-
-      @java.lang.Override
-      protected Builder newBuilderForType(
-          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
-        Builder builder = new Builder(parent);
-        return builder;
+      if (hasStep() != other.hasStep()) return false;
+      if (hasStep()) {
+        if (getStep()
+            != other.getStep()) return false;
       }
-      /**
-       * Protobuf type {@code mlflow.GetMetricHistory.Response}
-       */
-      public static final class Builder extends
-          com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
-          // @@protoc_insertion_point(builder_implements:mlflow.GetMetricHistory.Response)
-          org.mlflow.api.proto.Service.GetMetricHistory.ResponseOrBuilder {
-        public static final com.google.protobuf.Descriptors.Descriptor
-            getDescriptor() {
-          return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistory_Response_descriptor;
-        }
-
-        @java.lang.Override
-        protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
-            internalGetFieldAccessorTable() {
-          return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistory_Response_fieldAccessorTable
-              .ensureFieldAccessorsInitialized(
-                  org.mlflow.api.proto.Service.GetMetricHistory.Response.class, org.mlflow.api.proto.Service.GetMetricHistory.Response.Builder.class);
-        }
-
-        // Construct using org.mlflow.api.proto.Service.GetMetricHistory.Response.newBuilder()
-        private Builder() {
-          maybeForceBuilderInitialization();
-        }
-
-        private Builder(
-            com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
-          super(parent);
-          maybeForceBuilderInitialization();
-        }
-        private void maybeForceBuilderInitialization() {
-          if (com.google.protobuf.GeneratedMessageV3
-                  .alwaysUseFieldBuilders) {
-            getMetricsFieldBuilder();
-          }
-        }
-        @java.lang.Override
-        public Builder clear() {
-          super.clear();
-          if (metricsBuilder_ == null) {
-            metrics_ = java.util.Collections.emptyList();
-            bitField0_ = (bitField0_ & ~0x00000001);
-          } else {
-            metricsBuilder_.clear();
-          }
-          nextPageToken_ = "";
-          bitField0_ = (bitField0_ & ~0x00000002);
-          return this;
-        }
-
-        @java.lang.Override
-        public com.google.protobuf.Descriptors.Descriptor
-            getDescriptorForType() {
-          return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistory_Response_descriptor;
-        }
+      if (hasRunId() != other.hasRunId()) return false;
+      if (hasRunId()) {
+        if (!getRunId()
+            .equals(other.getRunId())) return false;
+      }
+      if (!unknownFields.equals(other.unknownFields)) return false;
+      return true;
+    }
 
-        @java.lang.Override
-        public org.mlflow.api.proto.Service.GetMetricHistory.Response getDefaultInstanceForType() {
-          return org.mlflow.api.proto.Service.GetMetricHistory.Response.getDefaultInstance();
-        }
+    @java.lang.Override
+    public int hashCode() {
+      if (memoizedHashCode != 0) {
+        return memoizedHashCode;
+      }
+      int hash = 41;
+      hash = (19 * hash) + getDescriptor().hashCode();
+      if (hasKey()) {
+        hash = (37 * hash) + KEY_FIELD_NUMBER;
+        hash = (53 * hash) + getKey().hashCode();
+      }
+      if (hasValue()) {
+        hash = (37 * hash) + VALUE_FIELD_NUMBER;
+        hash = (53 * hash) + com.google.protobuf.Internal.hashLong(
+            java.lang.Double.doubleToLongBits(getValue()));
+      }
+      if (hasTimestamp()) {
+        hash = (37 * hash) + TIMESTAMP_FIELD_NUMBER;
+        hash = (53 * hash) + com.google.protobuf.Internal.hashLong(
+            getTimestamp());
+      }
+      if (hasStep()) {
+        hash = (37 * hash) + STEP_FIELD_NUMBER;
+        hash = (53 * hash) + com.google.protobuf.Internal.hashLong(
+            getStep());
+      }
+      if (hasRunId()) {
+        hash = (37 * hash) + RUN_ID_FIELD_NUMBER;
+        hash = (53 * hash) + getRunId().hashCode();
+      }
+      hash = (29 * hash) + unknownFields.hashCode();
+      memoizedHashCode = hash;
+      return hash;
+    }
 
-        @java.lang.Override
-        public org.mlflow.api.proto.Service.GetMetricHistory.Response build() {
-          org.mlflow.api.proto.Service.GetMetricHistory.Response result = buildPartial();
-          if (!result.isInitialized()) {
-            throw newUninitializedMessageException(result);
-          }
-          return result;
-        }
+    public static org.mlflow.api.proto.Service.MetricWithRunId parseFrom(
+        java.nio.ByteBuffer data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.MetricWithRunId parseFrom(
+        java.nio.ByteBuffer data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.MetricWithRunId parseFrom(
+        com.google.protobuf.ByteString data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.MetricWithRunId parseFrom(
+        com.google.protobuf.ByteString data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.MetricWithRunId parseFrom(byte[] data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.MetricWithRunId parseFrom(
+        byte[] data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.MetricWithRunId parseFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.MetricWithRunId parseFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.MetricWithRunId parseDelimitedFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.MetricWithRunId parseDelimitedFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.MetricWithRunId parseFrom(
+        com.google.protobuf.CodedInputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.MetricWithRunId parseFrom(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
 
-        @java.lang.Override
-        public org.mlflow.api.proto.Service.GetMetricHistory.Response buildPartial() {
-          org.mlflow.api.proto.Service.GetMetricHistory.Response result = new org.mlflow.api.proto.Service.GetMetricHistory.Response(this);
-          int from_bitField0_ = bitField0_;
-          int to_bitField0_ = 0;
-          if (metricsBuilder_ == null) {
-            if (((bitField0_ & 0x00000001) != 0)) {
-              metrics_ = java.util.Collections.unmodifiableList(metrics_);
-              bitField0_ = (bitField0_ & ~0x00000001);
-            }
-            result.metrics_ = metrics_;
-          } else {
-            result.metrics_ = metricsBuilder_.build();
-          }
-          if (((from_bitField0_ & 0x00000002) != 0)) {
-            to_bitField0_ |= 0x00000001;
-          }
-          result.nextPageToken_ = nextPageToken_;
-          result.bitField0_ = to_bitField0_;
-          onBuilt();
-          return result;
-        }
+    @java.lang.Override
+    public Builder newBuilderForType() { return newBuilder(); }
+    public static Builder newBuilder() {
+      return DEFAULT_INSTANCE.toBuilder();
+    }
+    public static Builder newBuilder(org.mlflow.api.proto.Service.MetricWithRunId prototype) {
+      return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+    }
+    @java.lang.Override
+    public Builder toBuilder() {
+      return this == DEFAULT_INSTANCE
+          ? new Builder() : new Builder().mergeFrom(this);
+    }
 
-        @java.lang.Override
-        public Builder clone() {
-          return super.clone();
-        }
-        @java.lang.Override
-        public Builder setField(
-            com.google.protobuf.Descriptors.FieldDescriptor field,
-            java.lang.Object value) {
-          return super.setField(field, value);
-        }
-        @java.lang.Override
-        public Builder clearField(
-            com.google.protobuf.Descriptors.FieldDescriptor field) {
-          return super.clearField(field);
-        }
-        @java.lang.Override
-        public Builder clearOneof(
-            com.google.protobuf.Descriptors.OneofDescriptor oneof) {
-          return super.clearOneof(oneof);
-        }
-        @java.lang.Override
-        public Builder setRepeatedField(
-            com.google.protobuf.Descriptors.FieldDescriptor field,
-            int index, java.lang.Object value) {
-          return super.setRepeatedField(field, index, value);
-        }
-        @java.lang.Override
-        public Builder addRepeatedField(
-            com.google.protobuf.Descriptors.FieldDescriptor field,
-            java.lang.Object value) {
-          return super.addRepeatedField(field, value);
-        }
-        @java.lang.Override
-        public Builder mergeFrom(com.google.protobuf.Message other) {
-          if (other instanceof org.mlflow.api.proto.Service.GetMetricHistory.Response) {
-            return mergeFrom((org.mlflow.api.proto.Service.GetMetricHistory.Response)other);
-          } else {
-            super.mergeFrom(other);
-            return this;
-          }
-        }
+    @java.lang.Override
+    protected Builder newBuilderForType(
+        com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+      Builder builder = new Builder(parent);
+      return builder;
+    }
+    /**
+     * Protobuf type {@code mlflow.MetricWithRunId}
+     */
+    public static final class Builder extends
+        com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+        // @@protoc_insertion_point(builder_implements:mlflow.MetricWithRunId)
+        org.mlflow.api.proto.Service.MetricWithRunIdOrBuilder {
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_MetricWithRunId_descriptor;
+      }
 
-        public Builder mergeFrom(org.mlflow.api.proto.Service.GetMetricHistory.Response other) {
-          if (other == org.mlflow.api.proto.Service.GetMetricHistory.Response.getDefaultInstance()) return this;
-          if (metricsBuilder_ == null) {
-            if (!other.metrics_.isEmpty()) {
-              if (metrics_.isEmpty()) {
-                metrics_ = other.metrics_;
-                bitField0_ = (bitField0_ & ~0x00000001);
-              } else {
-                ensureMetricsIsMutable();
-                metrics_.addAll(other.metrics_);
-              }
-              onChanged();
-            }
-          } else {
-            if (!other.metrics_.isEmpty()) {
-              if (metricsBuilder_.isEmpty()) {
-                metricsBuilder_.dispose();
-                metricsBuilder_ = null;
-                metrics_ = other.metrics_;
-                bitField0_ = (bitField0_ & ~0x00000001);
-                metricsBuilder_ = 
-                  com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
-                     getMetricsFieldBuilder() : null;
-              } else {
-                metricsBuilder_.addAllMessages(other.metrics_);
-              }
-            }
-          }
-          if (other.hasNextPageToken()) {
-            bitField0_ |= 0x00000002;
-            nextPageToken_ = other.nextPageToken_;
-            onChanged();
-          }
-          this.mergeUnknownFields(other.unknownFields);
-          onChanged();
-          return this;
-        }
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_MetricWithRunId_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.MetricWithRunId.class, org.mlflow.api.proto.Service.MetricWithRunId.Builder.class);
+      }
 
-        @java.lang.Override
-        public final boolean isInitialized() {
-          return true;
-        }
+      // Construct using org.mlflow.api.proto.Service.MetricWithRunId.newBuilder()
+      private Builder() {
+        maybeForceBuilderInitialization();
+      }
 
-        @java.lang.Override
-        public Builder mergeFrom(
-            com.google.protobuf.CodedInputStream input,
-            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-            throws java.io.IOException {
-          org.mlflow.api.proto.Service.GetMetricHistory.Response parsedMessage = null;
-          try {
-            parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
-          } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-            parsedMessage = (org.mlflow.api.proto.Service.GetMetricHistory.Response) e.getUnfinishedMessage();
-            throw e.unwrapIOException();
-          } finally {
-            if (parsedMessage != null) {
-              mergeFrom(parsedMessage);
-            }
-          }
-          return this;
+      private Builder(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        super(parent);
+        maybeForceBuilderInitialization();
+      }
+      private void maybeForceBuilderInitialization() {
+        if (com.google.protobuf.GeneratedMessageV3
+                .alwaysUseFieldBuilders) {
         }
-        private int bitField0_;
+      }
+      @java.lang.Override
+      public Builder clear() {
+        super.clear();
+        key_ = "";
+        bitField0_ = (bitField0_ & ~0x00000001);
+        value_ = 0D;
+        bitField0_ = (bitField0_ & ~0x00000002);
+        timestamp_ = 0L;
+        bitField0_ = (bitField0_ & ~0x00000004);
+        step_ = 0L;
+        bitField0_ = (bitField0_ & ~0x00000008);
+        runId_ = "";
+        bitField0_ = (bitField0_ & ~0x00000010);
+        return this;
+      }
 
-        private java.util.List<org.mlflow.api.proto.Service.Metric> metrics_ =
-          java.util.Collections.emptyList();
-        private void ensureMetricsIsMutable() {
-          if (!((bitField0_ & 0x00000001) != 0)) {
-            metrics_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Metric>(metrics_);
-            bitField0_ |= 0x00000001;
-           }
-        }
+      @java.lang.Override
+      public com.google.protobuf.Descriptors.Descriptor
+          getDescriptorForType() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_MetricWithRunId_descriptor;
+      }
 
-        private com.google.protobuf.RepeatedFieldBuilderV3<
-            org.mlflow.api.proto.Service.Metric, org.mlflow.api.proto.Service.Metric.Builder, org.mlflow.api.proto.Service.MetricOrBuilder> metricsBuilder_;
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.MetricWithRunId getDefaultInstanceForType() {
+        return org.mlflow.api.proto.Service.MetricWithRunId.getDefaultInstance();
+      }
 
-        /**
-         * <pre>
-         * All logged values for this metric.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Metric metrics = 1;</code>
-         */
-        public java.util.List<org.mlflow.api.proto.Service.Metric> getMetricsList() {
-          if (metricsBuilder_ == null) {
-            return java.util.Collections.unmodifiableList(metrics_);
-          } else {
-            return metricsBuilder_.getMessageList();
-          }
-        }
-        /**
-         * <pre>
-         * All logged values for this metric.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Metric metrics = 1;</code>
-         */
-        public int getMetricsCount() {
-          if (metricsBuilder_ == null) {
-            return metrics_.size();
-          } else {
-            return metricsBuilder_.getCount();
-          }
-        }
-        /**
-         * <pre>
-         * All logged values for this metric.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Metric metrics = 1;</code>
-         */
-        public org.mlflow.api.proto.Service.Metric getMetrics(int index) {
-          if (metricsBuilder_ == null) {
-            return metrics_.get(index);
-          } else {
-            return metricsBuilder_.getMessage(index);
-          }
-        }
-        /**
-         * <pre>
-         * All logged values for this metric.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Metric metrics = 1;</code>
-         */
-        public Builder setMetrics(
-            int index, org.mlflow.api.proto.Service.Metric value) {
-          if (metricsBuilder_ == null) {
-            if (value == null) {
-              throw new NullPointerException();
-            }
-            ensureMetricsIsMutable();
-            metrics_.set(index, value);
-            onChanged();
-          } else {
-            metricsBuilder_.setMessage(index, value);
-          }
-          return this;
-        }
-        /**
-         * <pre>
-         * All logged values for this metric.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Metric metrics = 1;</code>
-         */
-        public Builder setMetrics(
-            int index, org.mlflow.api.proto.Service.Metric.Builder builderForValue) {
-          if (metricsBuilder_ == null) {
-            ensureMetricsIsMutable();
-            metrics_.set(index, builderForValue.build());
-            onChanged();
-          } else {
-            metricsBuilder_.setMessage(index, builderForValue.build());
-          }
-          return this;
-        }
-        /**
-         * <pre>
-         * All logged values for this metric.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Metric metrics = 1;</code>
-         */
-        public Builder addMetrics(org.mlflow.api.proto.Service.Metric value) {
-          if (metricsBuilder_ == null) {
-            if (value == null) {
-              throw new NullPointerException();
-            }
-            ensureMetricsIsMutable();
-            metrics_.add(value);
-            onChanged();
-          } else {
-            metricsBuilder_.addMessage(value);
-          }
-          return this;
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.MetricWithRunId build() {
+        org.mlflow.api.proto.Service.MetricWithRunId result = buildPartial();
+        if (!result.isInitialized()) {
+          throw newUninitializedMessageException(result);
         }
-        /**
-         * <pre>
-         * All logged values for this metric.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Metric metrics = 1;</code>
-         */
-        public Builder addMetrics(
-            int index, org.mlflow.api.proto.Service.Metric value) {
-          if (metricsBuilder_ == null) {
-            if (value == null) {
-              throw new NullPointerException();
-            }
-            ensureMetricsIsMutable();
-            metrics_.add(index, value);
-            onChanged();
-          } else {
-            metricsBuilder_.addMessage(index, value);
-          }
-          return this;
+        return result;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.MetricWithRunId buildPartial() {
+        org.mlflow.api.proto.Service.MetricWithRunId result = new org.mlflow.api.proto.Service.MetricWithRunId(this);
+        int from_bitField0_ = bitField0_;
+        int to_bitField0_ = 0;
+        if (((from_bitField0_ & 0x00000001) != 0)) {
+          to_bitField0_ |= 0x00000001;
         }
-        /**
-         * <pre>
-         * All logged values for this metric.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Metric metrics = 1;</code>
-         */
-        public Builder addMetrics(
-            org.mlflow.api.proto.Service.Metric.Builder builderForValue) {
-          if (metricsBuilder_ == null) {
-            ensureMetricsIsMutable();
-            metrics_.add(builderForValue.build());
-            onChanged();
-          } else {
-            metricsBuilder_.addMessage(builderForValue.build());
-          }
-          return this;
+        result.key_ = key_;
+        if (((from_bitField0_ & 0x00000002) != 0)) {
+          result.value_ = value_;
+          to_bitField0_ |= 0x00000002;
         }
-        /**
-         * <pre>
-         * All logged values for this metric.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Metric metrics = 1;</code>
-         */
-        public Builder addMetrics(
-            int index, org.mlflow.api.proto.Service.Metric.Builder builderForValue) {
-          if (metricsBuilder_ == null) {
-            ensureMetricsIsMutable();
-            metrics_.add(index, builderForValue.build());
-            onChanged();
-          } else {
-            metricsBuilder_.addMessage(index, builderForValue.build());
-          }
-          return this;
+        if (((from_bitField0_ & 0x00000004) != 0)) {
+          result.timestamp_ = timestamp_;
+          to_bitField0_ |= 0x00000004;
         }
-        /**
-         * <pre>
-         * All logged values for this metric.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Metric metrics = 1;</code>
-         */
-        public Builder addAllMetrics(
-            java.lang.Iterable<? extends org.mlflow.api.proto.Service.Metric> values) {
-          if (metricsBuilder_ == null) {
-            ensureMetricsIsMutable();
-            com.google.protobuf.AbstractMessageLite.Builder.addAll(
-                values, metrics_);
-            onChanged();
-          } else {
-            metricsBuilder_.addAllMessages(values);
-          }
-          return this;
+        if (((from_bitField0_ & 0x00000008) != 0)) {
+          result.step_ = step_;
+          to_bitField0_ |= 0x00000008;
         }
-        /**
-         * <pre>
-         * All logged values for this metric.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Metric metrics = 1;</code>
-         */
-        public Builder clearMetrics() {
-          if (metricsBuilder_ == null) {
-            metrics_ = java.util.Collections.emptyList();
-            bitField0_ = (bitField0_ & ~0x00000001);
-            onChanged();
-          } else {
-            metricsBuilder_.clear();
-          }
-          return this;
+        if (((from_bitField0_ & 0x00000010) != 0)) {
+          to_bitField0_ |= 0x00000010;
         }
-        /**
-         * <pre>
-         * All logged values for this metric.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Metric metrics = 1;</code>
-         */
-        public Builder removeMetrics(int index) {
-          if (metricsBuilder_ == null) {
-            ensureMetricsIsMutable();
-            metrics_.remove(index);
-            onChanged();
-          } else {
-            metricsBuilder_.remove(index);
-          }
+        result.runId_ = runId_;
+        result.bitField0_ = to_bitField0_;
+        onBuilt();
+        return result;
+      }
+
+      @java.lang.Override
+      public Builder clone() {
+        return super.clone();
+      }
+      @java.lang.Override
+      public Builder setField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return super.setField(field, value);
+      }
+      @java.lang.Override
+      public Builder clearField(
+          com.google.protobuf.Descriptors.FieldDescriptor field) {
+        return super.clearField(field);
+      }
+      @java.lang.Override
+      public Builder clearOneof(
+          com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+        return super.clearOneof(oneof);
+      }
+      @java.lang.Override
+      public Builder setRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          int index, java.lang.Object value) {
+        return super.setRepeatedField(field, index, value);
+      }
+      @java.lang.Override
+      public Builder addRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return super.addRepeatedField(field, value);
+      }
+      @java.lang.Override
+      public Builder mergeFrom(com.google.protobuf.Message other) {
+        if (other instanceof org.mlflow.api.proto.Service.MetricWithRunId) {
+          return mergeFrom((org.mlflow.api.proto.Service.MetricWithRunId)other);
+        } else {
+          super.mergeFrom(other);
           return this;
         }
-        /**
-         * <pre>
-         * All logged values for this metric.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Metric metrics = 1;</code>
-         */
-        public org.mlflow.api.proto.Service.Metric.Builder getMetricsBuilder(
-            int index) {
-          return getMetricsFieldBuilder().getBuilder(index);
-        }
-        /**
-         * <pre>
-         * All logged values for this metric.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Metric metrics = 1;</code>
-         */
-        public org.mlflow.api.proto.Service.MetricOrBuilder getMetricsOrBuilder(
-            int index) {
-          if (metricsBuilder_ == null) {
-            return metrics_.get(index);  } else {
-            return metricsBuilder_.getMessageOrBuilder(index);
-          }
+      }
+
+      public Builder mergeFrom(org.mlflow.api.proto.Service.MetricWithRunId other) {
+        if (other == org.mlflow.api.proto.Service.MetricWithRunId.getDefaultInstance()) return this;
+        if (other.hasKey()) {
+          bitField0_ |= 0x00000001;
+          key_ = other.key_;
+          onChanged();
         }
-        /**
-         * <pre>
-         * All logged values for this metric.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Metric metrics = 1;</code>
-         */
-        public java.util.List<? extends org.mlflow.api.proto.Service.MetricOrBuilder> 
-             getMetricsOrBuilderList() {
-          if (metricsBuilder_ != null) {
-            return metricsBuilder_.getMessageOrBuilderList();
-          } else {
-            return java.util.Collections.unmodifiableList(metrics_);
-          }
+        if (other.hasValue()) {
+          setValue(other.getValue());
         }
-        /**
-         * <pre>
-         * All logged values for this metric.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Metric metrics = 1;</code>
-         */
-        public org.mlflow.api.proto.Service.Metric.Builder addMetricsBuilder() {
-          return getMetricsFieldBuilder().addBuilder(
-              org.mlflow.api.proto.Service.Metric.getDefaultInstance());
+        if (other.hasTimestamp()) {
+          setTimestamp(other.getTimestamp());
         }
-        /**
-         * <pre>
-         * All logged values for this metric.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Metric metrics = 1;</code>
-         */
-        public org.mlflow.api.proto.Service.Metric.Builder addMetricsBuilder(
-            int index) {
-          return getMetricsFieldBuilder().addBuilder(
-              index, org.mlflow.api.proto.Service.Metric.getDefaultInstance());
+        if (other.hasStep()) {
+          setStep(other.getStep());
         }
-        /**
-         * <pre>
-         * All logged values for this metric.
-         * </pre>
-         *
-         * <code>repeated .mlflow.Metric metrics = 1;</code>
-         */
-        public java.util.List<org.mlflow.api.proto.Service.Metric.Builder> 
-             getMetricsBuilderList() {
-          return getMetricsFieldBuilder().getBuilderList();
+        if (other.hasRunId()) {
+          bitField0_ |= 0x00000010;
+          runId_ = other.runId_;
+          onChanged();
         }
-        private com.google.protobuf.RepeatedFieldBuilderV3<
-            org.mlflow.api.proto.Service.Metric, org.mlflow.api.proto.Service.Metric.Builder, org.mlflow.api.proto.Service.MetricOrBuilder> 
-            getMetricsFieldBuilder() {
-          if (metricsBuilder_ == null) {
-            metricsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
-                org.mlflow.api.proto.Service.Metric, org.mlflow.api.proto.Service.Metric.Builder, org.mlflow.api.proto.Service.MetricOrBuilder>(
-                    metrics_,
-                    ((bitField0_ & 0x00000001) != 0),
-                    getParentForChildren(),
-                    isClean());
-            metrics_ = null;
+        this.mergeUnknownFields(other.unknownFields);
+        onChanged();
+        return this;
+      }
+
+      @java.lang.Override
+      public final boolean isInitialized() {
+        return true;
+      }
+
+      @java.lang.Override
+      public Builder mergeFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        org.mlflow.api.proto.Service.MetricWithRunId parsedMessage = null;
+        try {
+          parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          parsedMessage = (org.mlflow.api.proto.Service.MetricWithRunId) e.getUnfinishedMessage();
+          throw e.unwrapIOException();
+        } finally {
+          if (parsedMessage != null) {
+            mergeFrom(parsedMessage);
           }
-          return metricsBuilder_;
         }
+        return this;
+      }
+      private int bitField0_;
 
-        private java.lang.Object nextPageToken_ = "";
-        /**
-         * <pre>
-         * Token that can be used to issue a query for the next page of metric history values.
-         * A missing token indicates that no additional metrics are available to fetch.
-         * </pre>
-         *
-         * <code>optional string next_page_token = 2;</code>
-         * @return Whether the nextPageToken field is set.
-         */
-        public boolean hasNextPageToken() {
-          return ((bitField0_ & 0x00000002) != 0);
-        }
-        /**
-         * <pre>
-         * Token that can be used to issue a query for the next page of metric history values.
-         * A missing token indicates that no additional metrics are available to fetch.
-         * </pre>
-         *
-         * <code>optional string next_page_token = 2;</code>
-         * @return The nextPageToken.
-         */
-        public java.lang.String getNextPageToken() {
-          java.lang.Object ref = nextPageToken_;
-          if (!(ref instanceof java.lang.String)) {
-            com.google.protobuf.ByteString bs =
-                (com.google.protobuf.ByteString) ref;
-            java.lang.String s = bs.toStringUtf8();
-            if (bs.isValidUtf8()) {
-              nextPageToken_ = s;
-            }
-            return s;
-          } else {
-            return (java.lang.String) ref;
+      private java.lang.Object key_ = "";
+      /**
+       * <pre>
+       * Key identifying this metric.
+       * </pre>
+       *
+       * <code>optional string key = 1;</code>
+       * @return Whether the key field is set.
+       */
+      public boolean hasKey() {
+        return ((bitField0_ & 0x00000001) != 0);
+      }
+      /**
+       * <pre>
+       * Key identifying this metric.
+       * </pre>
+       *
+       * <code>optional string key = 1;</code>
+       * @return The key.
+       */
+      public java.lang.String getKey() {
+        java.lang.Object ref = key_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            key_ = s;
           }
+          return s;
+        } else {
+          return (java.lang.String) ref;
         }
-        /**
-         * <pre>
-         * Token that can be used to issue a query for the next page of metric history values.
-         * A missing token indicates that no additional metrics are available to fetch.
-         * </pre>
-         *
-         * <code>optional string next_page_token = 2;</code>
-         * @return The bytes for nextPageToken.
-         */
-        public com.google.protobuf.ByteString
-            getNextPageTokenBytes() {
-          java.lang.Object ref = nextPageToken_;
-          if (ref instanceof String) {
-            com.google.protobuf.ByteString b = 
-                com.google.protobuf.ByteString.copyFromUtf8(
-                    (java.lang.String) ref);
-            nextPageToken_ = b;
-            return b;
-          } else {
-            return (com.google.protobuf.ByteString) ref;
-          }
+      }
+      /**
+       * <pre>
+       * Key identifying this metric.
+       * </pre>
+       *
+       * <code>optional string key = 1;</code>
+       * @return The bytes for key.
+       */
+      public com.google.protobuf.ByteString
+          getKeyBytes() {
+        java.lang.Object ref = key_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          key_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
         }
-        /**
-         * <pre>
-         * Token that can be used to issue a query for the next page of metric history values.
-         * A missing token indicates that no additional metrics are available to fetch.
-         * </pre>
-         *
-         * <code>optional string next_page_token = 2;</code>
-         * @param value The nextPageToken to set.
-         * @return This builder for chaining.
-         */
-        public Builder setNextPageToken(
-            java.lang.String value) {
-          if (value == null) {
+      }
+      /**
+       * <pre>
+       * Key identifying this metric.
+       * </pre>
+       *
+       * <code>optional string key = 1;</code>
+       * @param value The key to set.
+       * @return This builder for chaining.
+       */
+      public Builder setKey(
+          java.lang.String value) {
+        if (value == null) {
     throw new NullPointerException();
   }
-  bitField0_ |= 0x00000002;
-          nextPageToken_ = value;
-          onChanged();
-          return this;
-        }
-        /**
-         * <pre>
-         * Token that can be used to issue a query for the next page of metric history values.
-         * A missing token indicates that no additional metrics are available to fetch.
-         * </pre>
-         *
-         * <code>optional string next_page_token = 2;</code>
-         * @return This builder for chaining.
-         */
-        public Builder clearNextPageToken() {
-          bitField0_ = (bitField0_ & ~0x00000002);
-          nextPageToken_ = getDefaultInstance().getNextPageToken();
-          onChanged();
-          return this;
-        }
-        /**
-         * <pre>
-         * Token that can be used to issue a query for the next page of metric history values.
-         * A missing token indicates that no additional metrics are available to fetch.
-         * </pre>
-         *
-         * <code>optional string next_page_token = 2;</code>
-         * @param value The bytes for nextPageToken to set.
-         * @return This builder for chaining.
-         */
-        public Builder setNextPageTokenBytes(
-            com.google.protobuf.ByteString value) {
-          if (value == null) {
+  bitField0_ |= 0x00000001;
+        key_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Key identifying this metric.
+       * </pre>
+       *
+       * <code>optional string key = 1;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearKey() {
+        bitField0_ = (bitField0_ & ~0x00000001);
+        key_ = getDefaultInstance().getKey();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Key identifying this metric.
+       * </pre>
+       *
+       * <code>optional string key = 1;</code>
+       * @param value The bytes for key to set.
+       * @return This builder for chaining.
+       */
+      public Builder setKeyBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
     throw new NullPointerException();
   }
-  bitField0_ |= 0x00000002;
-          nextPageToken_ = value;
-          onChanged();
-          return this;
-        }
-        @java.lang.Override
-        public final Builder setUnknownFields(
-            final com.google.protobuf.UnknownFieldSet unknownFields) {
-          return super.setUnknownFields(unknownFields);
-        }
-
-        @java.lang.Override
-        public final Builder mergeUnknownFields(
-            final com.google.protobuf.UnknownFieldSet unknownFields) {
-          return super.mergeUnknownFields(unknownFields);
-        }
-
+  bitField0_ |= 0x00000001;
+        key_ = value;
+        onChanged();
+        return this;
+      }
 
-        // @@protoc_insertion_point(builder_scope:mlflow.GetMetricHistory.Response)
+      private double value_ ;
+      /**
+       * <pre>
+       * Value associated with this metric.
+       * </pre>
+       *
+       * <code>optional double value = 2;</code>
+       * @return Whether the value field is set.
+       */
+      @java.lang.Override
+      public boolean hasValue() {
+        return ((bitField0_ & 0x00000002) != 0);
+      }
+      /**
+       * <pre>
+       * Value associated with this metric.
+       * </pre>
+       *
+       * <code>optional double value = 2;</code>
+       * @return The value.
+       */
+      @java.lang.Override
+      public double getValue() {
+        return value_;
+      }
+      /**
+       * <pre>
+       * Value associated with this metric.
+       * </pre>
+       *
+       * <code>optional double value = 2;</code>
+       * @param value The value to set.
+       * @return This builder for chaining.
+       */
+      public Builder setValue(double value) {
+        bitField0_ |= 0x00000002;
+        value_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Value associated with this metric.
+       * </pre>
+       *
+       * <code>optional double value = 2;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearValue() {
+        bitField0_ = (bitField0_ & ~0x00000002);
+        value_ = 0D;
+        onChanged();
+        return this;
       }
 
-      // @@protoc_insertion_point(class_scope:mlflow.GetMetricHistory.Response)
-      private static final org.mlflow.api.proto.Service.GetMetricHistory.Response DEFAULT_INSTANCE;
-      static {
-        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.GetMetricHistory.Response();
+      private long timestamp_ ;
+      /**
+       * <pre>
+       * The timestamp at which this metric was recorded.
+       * </pre>
+       *
+       * <code>optional int64 timestamp = 3;</code>
+       * @return Whether the timestamp field is set.
+       */
+      @java.lang.Override
+      public boolean hasTimestamp() {
+        return ((bitField0_ & 0x00000004) != 0);
+      }
+      /**
+       * <pre>
+       * The timestamp at which this metric was recorded.
+       * </pre>
+       *
+       * <code>optional int64 timestamp = 3;</code>
+       * @return The timestamp.
+       */
+      @java.lang.Override
+      public long getTimestamp() {
+        return timestamp_;
+      }
+      /**
+       * <pre>
+       * The timestamp at which this metric was recorded.
+       * </pre>
+       *
+       * <code>optional int64 timestamp = 3;</code>
+       * @param value The timestamp to set.
+       * @return This builder for chaining.
+       */
+      public Builder setTimestamp(long value) {
+        bitField0_ |= 0x00000004;
+        timestamp_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * The timestamp at which this metric was recorded.
+       * </pre>
+       *
+       * <code>optional int64 timestamp = 3;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearTimestamp() {
+        bitField0_ = (bitField0_ & ~0x00000004);
+        timestamp_ = 0L;
+        onChanged();
+        return this;
       }
 
-      public static org.mlflow.api.proto.Service.GetMetricHistory.Response getDefaultInstance() {
-        return DEFAULT_INSTANCE;
+      private long step_ ;
+      /**
+       * <pre>
+       * Step at which to log the metric.
+       * </pre>
+       *
+       * <code>optional int64 step = 4 [default = 0];</code>
+       * @return Whether the step field is set.
+       */
+      @java.lang.Override
+      public boolean hasStep() {
+        return ((bitField0_ & 0x00000008) != 0);
+      }
+      /**
+       * <pre>
+       * Step at which to log the metric.
+       * </pre>
+       *
+       * <code>optional int64 step = 4 [default = 0];</code>
+       * @return The step.
+       */
+      @java.lang.Override
+      public long getStep() {
+        return step_;
+      }
+      /**
+       * <pre>
+       * Step at which to log the metric.
+       * </pre>
+       *
+       * <code>optional int64 step = 4 [default = 0];</code>
+       * @param value The step to set.
+       * @return This builder for chaining.
+       */
+      public Builder setStep(long value) {
+        bitField0_ |= 0x00000008;
+        step_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Step at which to log the metric.
+       * </pre>
+       *
+       * <code>optional int64 step = 4 [default = 0];</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearStep() {
+        bitField0_ = (bitField0_ & ~0x00000008);
+        step_ = 0L;
+        onChanged();
+        return this;
       }
 
-      @java.lang.Deprecated public static final com.google.protobuf.Parser<Response>
-          PARSER = new com.google.protobuf.AbstractParser<Response>() {
-        @java.lang.Override
-        public Response parsePartialFrom(
-            com.google.protobuf.CodedInputStream input,
-            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-            throws com.google.protobuf.InvalidProtocolBufferException {
-          return new Response(input, extensionRegistry);
+      private java.lang.Object runId_ = "";
+      /**
+       * <pre>
+       * The ID of the run containing the metric
+       * </pre>
+       *
+       * <code>optional string run_id = 5;</code>
+       * @return Whether the runId field is set.
+       */
+      public boolean hasRunId() {
+        return ((bitField0_ & 0x00000010) != 0);
+      }
+      /**
+       * <pre>
+       * The ID of the run containing the metric
+       * </pre>
+       *
+       * <code>optional string run_id = 5;</code>
+       * @return The runId.
+       */
+      public java.lang.String getRunId() {
+        java.lang.Object ref = runId_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            runId_ = s;
+          }
+          return s;
+        } else {
+          return (java.lang.String) ref;
         }
-      };
-
-      public static com.google.protobuf.Parser<Response> parser() {
-        return PARSER;
+      }
+      /**
+       * <pre>
+       * The ID of the run containing the metric
+       * </pre>
+       *
+       * <code>optional string run_id = 5;</code>
+       * @return The bytes for runId.
+       */
+      public com.google.protobuf.ByteString
+          getRunIdBytes() {
+        java.lang.Object ref = runId_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          runId_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
+      }
+      /**
+       * <pre>
+       * The ID of the run containing the metric
+       * </pre>
+       *
+       * <code>optional string run_id = 5;</code>
+       * @param value The runId to set.
+       * @return This builder for chaining.
+       */
+      public Builder setRunId(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000010;
+        runId_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * The ID of the run containing the metric
+       * </pre>
+       *
+       * <code>optional string run_id = 5;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearRunId() {
+        bitField0_ = (bitField0_ & ~0x00000010);
+        runId_ = getDefaultInstance().getRunId();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * The ID of the run containing the metric
+       * </pre>
+       *
+       * <code>optional string run_id = 5;</code>
+       * @param value The bytes for runId to set.
+       * @return This builder for chaining.
+       */
+      public Builder setRunIdBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000010;
+        runId_ = value;
+        onChanged();
+        return this;
+      }
+      @java.lang.Override
+      public final Builder setUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.setUnknownFields(unknownFields);
       }
 
       @java.lang.Override
-      public com.google.protobuf.Parser<Response> getParserForType() {
-        return PARSER;
+      public final Builder mergeUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.mergeUnknownFields(unknownFields);
       }
 
+
+      // @@protoc_insertion_point(builder_scope:mlflow.MetricWithRunId)
+    }
+
+    // @@protoc_insertion_point(class_scope:mlflow.MetricWithRunId)
+    private static final org.mlflow.api.proto.Service.MetricWithRunId DEFAULT_INSTANCE;
+    static {
+      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.MetricWithRunId();
+    }
+
+    public static org.mlflow.api.proto.Service.MetricWithRunId getDefaultInstance() {
+      return DEFAULT_INSTANCE;
+    }
+
+    @java.lang.Deprecated public static final com.google.protobuf.Parser<MetricWithRunId>
+        PARSER = new com.google.protobuf.AbstractParser<MetricWithRunId>() {
       @java.lang.Override
-      public org.mlflow.api.proto.Service.GetMetricHistory.Response getDefaultInstanceForType() {
-        return DEFAULT_INSTANCE;
+      public MetricWithRunId parsePartialFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return new MetricWithRunId(input, extensionRegistry);
       }
+    };
 
+    public static com.google.protobuf.Parser<MetricWithRunId> parser() {
+      return PARSER;
     }
 
-    private int bitField0_;
-    public static final int RUN_ID_FIELD_NUMBER = 3;
-    private volatile java.lang.Object runId_;
-    /**
-     * <pre>
-     * ID of the run from which to fetch metric values. Must be provided.
-     * </pre>
-     *
-     * <code>optional string run_id = 3;</code>
-     * @return Whether the runId field is set.
-     */
     @java.lang.Override
-    public boolean hasRunId() {
-      return ((bitField0_ & 0x00000001) != 0);
+    public com.google.protobuf.Parser<MetricWithRunId> getParserForType() {
+      return PARSER;
     }
-    /**
-     * <pre>
-     * ID of the run from which to fetch metric values. Must be provided.
-     * </pre>
-     *
-     * <code>optional string run_id = 3;</code>
-     * @return The runId.
-     */
+
     @java.lang.Override
-    public java.lang.String getRunId() {
-      java.lang.Object ref = runId_;
-      if (ref instanceof java.lang.String) {
-        return (java.lang.String) ref;
-      } else {
-        com.google.protobuf.ByteString bs = 
-            (com.google.protobuf.ByteString) ref;
-        java.lang.String s = bs.toStringUtf8();
-        if (bs.isValidUtf8()) {
-          runId_ = s;
-        }
-        return s;
-      }
+    public org.mlflow.api.proto.Service.MetricWithRunId getDefaultInstanceForType() {
+      return DEFAULT_INSTANCE;
     }
+
+  }
+
+  public interface GetMetricHistoryBulkIntervalOrBuilder extends
+      // @@protoc_insertion_point(interface_extends:mlflow.GetMetricHistoryBulkInterval)
+      com.google.protobuf.MessageOrBuilder {
+
     /**
      * <pre>
-     * ID of the run from which to fetch metric values. Must be provided.
+     * ID(s) of the run(s) from which to fetch metric values. Must be provided.
      * </pre>
      *
-     * <code>optional string run_id = 3;</code>
-     * @return The bytes for runId.
+     * <code>repeated string run_ids = 1;</code>
+     * @return A list containing the runIds.
      */
-    @java.lang.Override
-    public com.google.protobuf.ByteString
-        getRunIdBytes() {
-      java.lang.Object ref = runId_;
-      if (ref instanceof java.lang.String) {
-        com.google.protobuf.ByteString b = 
-            com.google.protobuf.ByteString.copyFromUtf8(
-                (java.lang.String) ref);
-        runId_ = b;
-        return b;
-      } else {
-        return (com.google.protobuf.ByteString) ref;
-      }
-    }
-
-    public static final int RUN_UUID_FIELD_NUMBER = 1;
-    private volatile java.lang.Object runUuid_;
+    java.util.List<java.lang.String>
+        getRunIdsList();
     /**
      * <pre>
-     * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
-     * will be removed in a future MLflow version.
+     * ID(s) of the run(s) from which to fetch metric values. Must be provided.
      * </pre>
      *
-     * <code>optional string run_uuid = 1;</code>
-     * @return Whether the runUuid field is set.
+     * <code>repeated string run_ids = 1;</code>
+     * @return The count of runIds.
      */
-    @java.lang.Override
-    public boolean hasRunUuid() {
-      return ((bitField0_ & 0x00000002) != 0);
-    }
+    int getRunIdsCount();
     /**
      * <pre>
-     * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
-     * will be removed in a future MLflow version.
+     * ID(s) of the run(s) from which to fetch metric values. Must be provided.
      * </pre>
      *
-     * <code>optional string run_uuid = 1;</code>
-     * @return The runUuid.
+     * <code>repeated string run_ids = 1;</code>
+     * @param index The index of the element to return.
+     * @return The runIds at the given index.
      */
-    @java.lang.Override
-    public java.lang.String getRunUuid() {
-      java.lang.Object ref = runUuid_;
-      if (ref instanceof java.lang.String) {
-        return (java.lang.String) ref;
-      } else {
-        com.google.protobuf.ByteString bs = 
-            (com.google.protobuf.ByteString) ref;
-        java.lang.String s = bs.toStringUtf8();
-        if (bs.isValidUtf8()) {
-          runUuid_ = s;
-        }
-        return s;
-      }
-    }
+    java.lang.String getRunIds(int index);
     /**
      * <pre>
-     * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
-     * will be removed in a future MLflow version.
+     * ID(s) of the run(s) from which to fetch metric values. Must be provided.
      * </pre>
      *
-     * <code>optional string run_uuid = 1;</code>
-     * @return The bytes for runUuid.
+     * <code>repeated string run_ids = 1;</code>
+     * @param index The index of the value to return.
+     * @return The bytes of the runIds at the given index.
      */
-    @java.lang.Override
-    public com.google.protobuf.ByteString
-        getRunUuidBytes() {
-      java.lang.Object ref = runUuid_;
-      if (ref instanceof java.lang.String) {
-        com.google.protobuf.ByteString b = 
-            com.google.protobuf.ByteString.copyFromUtf8(
-                (java.lang.String) ref);
-        runUuid_ = b;
-        return b;
-      } else {
-        return (com.google.protobuf.ByteString) ref;
-      }
-    }
+    com.google.protobuf.ByteString
+        getRunIdsBytes(int index);
 
-    public static final int METRIC_KEY_FIELD_NUMBER = 2;
-    private volatile java.lang.Object metricKey_;
     /**
      * <pre>
      * Name of the metric.
@@ -51400,10 +55196,7 @@ public final class Service {
      * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
      * @return Whether the metricKey field is set.
      */
-    @java.lang.Override
-    public boolean hasMetricKey() {
-      return ((bitField0_ & 0x00000004) != 0);
-    }
+    boolean hasMetricKey();
     /**
      * <pre>
      * Name of the metric.
@@ -51412,21 +55205,7 @@ public final class Service {
      * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
      * @return The metricKey.
      */
-    @java.lang.Override
-    public java.lang.String getMetricKey() {
-      java.lang.Object ref = metricKey_;
-      if (ref instanceof java.lang.String) {
-        return (java.lang.String) ref;
-      } else {
-        com.google.protobuf.ByteString bs = 
-            (com.google.protobuf.ByteString) ref;
-        java.lang.String s = bs.toStringUtf8();
-        if (bs.isValidUtf8()) {
-          metricKey_ = s;
-        }
-        return s;
-      }
-    }
+    java.lang.String getMetricKey();
     /**
      * <pre>
      * Name of the metric.
@@ -51435,1341 +55214,1169 @@ public final class Service {
      * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
      * @return The bytes for metricKey.
      */
-    @java.lang.Override
-    public com.google.protobuf.ByteString
-        getMetricKeyBytes() {
-      java.lang.Object ref = metricKey_;
-      if (ref instanceof java.lang.String) {
-        com.google.protobuf.ByteString b = 
-            com.google.protobuf.ByteString.copyFromUtf8(
-                (java.lang.String) ref);
-        metricKey_ = b;
-        return b;
-      } else {
-        return (com.google.protobuf.ByteString) ref;
-      }
-    }
+    com.google.protobuf.ByteString
+        getMetricKeyBytes();
 
-    public static final int PAGE_TOKEN_FIELD_NUMBER = 4;
-    private volatile java.lang.Object pageToken_;
     /**
      * <pre>
-     * Token indicating the page of metric history to fetch
+     * Optional start step to only fetch metrics after the specified step. Must be defined if
+     * end_step is defined.
      * </pre>
      *
-     * <code>optional string page_token = 4;</code>
-     * @return Whether the pageToken field is set.
+     * <code>optional int32 start_step = 3;</code>
+     * @return Whether the startStep field is set.
      */
-    @java.lang.Override
-    public boolean hasPageToken() {
-      return ((bitField0_ & 0x00000008) != 0);
-    }
+    boolean hasStartStep();
     /**
      * <pre>
-     * Token indicating the page of metric history to fetch
+     * Optional start step to only fetch metrics after the specified step. Must be defined if
+     * end_step is defined.
      * </pre>
      *
-     * <code>optional string page_token = 4;</code>
-     * @return The pageToken.
+     * <code>optional int32 start_step = 3;</code>
+     * @return The startStep.
      */
-    @java.lang.Override
-    public java.lang.String getPageToken() {
-      java.lang.Object ref = pageToken_;
-      if (ref instanceof java.lang.String) {
-        return (java.lang.String) ref;
-      } else {
-        com.google.protobuf.ByteString bs = 
-            (com.google.protobuf.ByteString) ref;
-        java.lang.String s = bs.toStringUtf8();
-        if (bs.isValidUtf8()) {
-          pageToken_ = s;
-        }
-        return s;
-      }
-    }
+    int getStartStep();
+
     /**
      * <pre>
-     * Token indicating the page of metric history to fetch
+     * Optional end step to only fetch metrics before the specified step. Must be defined if
+     * start_step is defined.
      * </pre>
      *
-     * <code>optional string page_token = 4;</code>
-     * @return The bytes for pageToken.
+     * <code>optional int32 end_step = 4;</code>
+     * @return Whether the endStep field is set.
      */
-    @java.lang.Override
-    public com.google.protobuf.ByteString
-        getPageTokenBytes() {
-      java.lang.Object ref = pageToken_;
-      if (ref instanceof java.lang.String) {
-        com.google.protobuf.ByteString b = 
-            com.google.protobuf.ByteString.copyFromUtf8(
-                (java.lang.String) ref);
-        pageToken_ = b;
-        return b;
-      } else {
-        return (com.google.protobuf.ByteString) ref;
-      }
-    }
+    boolean hasEndStep();
+    /**
+     * <pre>
+     * Optional end step to only fetch metrics before the specified step. Must be defined if
+     * start_step is defined.
+     * </pre>
+     *
+     * <code>optional int32 end_step = 4;</code>
+     * @return The endStep.
+     */
+    int getEndStep();
 
-    public static final int MAX_RESULTS_FIELD_NUMBER = 5;
-    private int maxResults_;
     /**
      * <pre>
-     * Maximum number of logged instances of a metric for a run to return per call.
-     * Backend servers may restrict the value of `max_results` depending on performance requirements.
-     * Requests that do not specify this value will behave as non-paginated queries where all
-     * metric history values for a given metric within a run are returned in a single response.
+     * Maximum number of results to fetch per run specified. Must be set to a positive number.
+     * Note, in reality, the API returns at most (max_results + # of run IDs) x (# run IDs) metric
+     * data points.
      * </pre>
      *
      * <code>optional int32 max_results = 5;</code>
      * @return Whether the maxResults field is set.
      */
-    @java.lang.Override
-    public boolean hasMaxResults() {
-      return ((bitField0_ & 0x00000010) != 0);
-    }
+    boolean hasMaxResults();
     /**
      * <pre>
-     * Maximum number of logged instances of a metric for a run to return per call.
-     * Backend servers may restrict the value of `max_results` depending on performance requirements.
-     * Requests that do not specify this value will behave as non-paginated queries where all
-     * metric history values for a given metric within a run are returned in a single response.
+     * Maximum number of results to fetch per run specified. Must be set to a positive number.
+     * Note, in reality, the API returns at most (max_results + # of run IDs) x (# run IDs) metric
+     * data points.
      * </pre>
      *
      * <code>optional int32 max_results = 5;</code>
      * @return The maxResults.
      */
-    @java.lang.Override
-    public int getMaxResults() {
-      return maxResults_;
+    int getMaxResults();
+  }
+  /**
+   * Protobuf type {@code mlflow.GetMetricHistoryBulkInterval}
+   */
+  public static final class GetMetricHistoryBulkInterval extends
+      com.google.protobuf.GeneratedMessageV3 implements
+      // @@protoc_insertion_point(message_implements:mlflow.GetMetricHistoryBulkInterval)
+      GetMetricHistoryBulkIntervalOrBuilder {
+  private static final long serialVersionUID = 0L;
+    // Use GetMetricHistoryBulkInterval.newBuilder() to construct.
+    private GetMetricHistoryBulkInterval(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+      super(builder);
+    }
+    private GetMetricHistoryBulkInterval() {
+      runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+      metricKey_ = "";
     }
 
-    private byte memoizedIsInitialized = -1;
     @java.lang.Override
-    public final boolean isInitialized() {
-      byte isInitialized = memoizedIsInitialized;
-      if (isInitialized == 1) return true;
-      if (isInitialized == 0) return false;
+    @SuppressWarnings({"unused"})
+    protected java.lang.Object newInstance(
+        UnusedPrivateParameter unused) {
+      return new GetMetricHistoryBulkInterval();
+    }
 
-      memoizedIsInitialized = 1;
-      return true;
+    @java.lang.Override
+    public final com.google.protobuf.UnknownFieldSet
+    getUnknownFields() {
+      return this.unknownFields;
+    }
+    private GetMetricHistoryBulkInterval(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      this();
+      if (extensionRegistry == null) {
+        throw new java.lang.NullPointerException();
+      }
+      int mutable_bitField0_ = 0;
+      com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+          com.google.protobuf.UnknownFieldSet.newBuilder();
+      try {
+        boolean done = false;
+        while (!done) {
+          int tag = input.readTag();
+          switch (tag) {
+            case 0:
+              done = true;
+              break;
+            case 10: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              if (!((mutable_bitField0_ & 0x00000001) != 0)) {
+                runIds_ = new com.google.protobuf.LazyStringArrayList();
+                mutable_bitField0_ |= 0x00000001;
+              }
+              runIds_.add(bs);
+              break;
+            }
+            case 18: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000001;
+              metricKey_ = bs;
+              break;
+            }
+            case 24: {
+              bitField0_ |= 0x00000002;
+              startStep_ = input.readInt32();
+              break;
+            }
+            case 32: {
+              bitField0_ |= 0x00000004;
+              endStep_ = input.readInt32();
+              break;
+            }
+            case 40: {
+              bitField0_ |= 0x00000008;
+              maxResults_ = input.readInt32();
+              break;
+            }
+            default: {
+              if (!parseUnknownField(
+                  input, unknownFields, extensionRegistry, tag)) {
+                done = true;
+              }
+              break;
+            }
+          }
+        }
+      } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+        throw e.setUnfinishedMessage(this);
+      } catch (java.io.IOException e) {
+        throw new com.google.protobuf.InvalidProtocolBufferException(
+            e).setUnfinishedMessage(this);
+      } finally {
+        if (((mutable_bitField0_ & 0x00000001) != 0)) {
+          runIds_ = runIds_.getUnmodifiableView();
+        }
+        this.unknownFields = unknownFields.build();
+        makeExtensionsImmutable();
+      }
+    }
+    public static final com.google.protobuf.Descriptors.Descriptor
+        getDescriptor() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistoryBulkInterval_descriptor;
     }
 
     @java.lang.Override
-    public void writeTo(com.google.protobuf.CodedOutputStream output)
-                        throws java.io.IOException {
-      if (((bitField0_ & 0x00000002) != 0)) {
-        com.google.protobuf.GeneratedMessageV3.writeString(output, 1, runUuid_);
+    protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+        internalGetFieldAccessorTable() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistoryBulkInterval_fieldAccessorTable
+          .ensureFieldAccessorsInitialized(
+              org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.class, org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Builder.class);
+    }
+
+    public interface ResponseOrBuilder extends
+        // @@protoc_insertion_point(interface_extends:mlflow.GetMetricHistoryBulkInterval.Response)
+        com.google.protobuf.MessageOrBuilder {
+
+      /**
+       * <pre>
+       * List of metrics representing history of values and metadata.
+       * </pre>
+       *
+       * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+       */
+      java.util.List<org.mlflow.api.proto.Service.MetricWithRunId> 
+          getMetricsList();
+      /**
+       * <pre>
+       * List of metrics representing history of values and metadata.
+       * </pre>
+       *
+       * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+       */
+      org.mlflow.api.proto.Service.MetricWithRunId getMetrics(int index);
+      /**
+       * <pre>
+       * List of metrics representing history of values and metadata.
+       * </pre>
+       *
+       * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+       */
+      int getMetricsCount();
+      /**
+       * <pre>
+       * List of metrics representing history of values and metadata.
+       * </pre>
+       *
+       * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+       */
+      java.util.List<? extends org.mlflow.api.proto.Service.MetricWithRunIdOrBuilder> 
+          getMetricsOrBuilderList();
+      /**
+       * <pre>
+       * List of metrics representing history of values and metadata.
+       * </pre>
+       *
+       * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+       */
+      org.mlflow.api.proto.Service.MetricWithRunIdOrBuilder getMetricsOrBuilder(
+          int index);
+    }
+    /**
+     * Protobuf type {@code mlflow.GetMetricHistoryBulkInterval.Response}
+     */
+    public static final class Response extends
+        com.google.protobuf.GeneratedMessageV3 implements
+        // @@protoc_insertion_point(message_implements:mlflow.GetMetricHistoryBulkInterval.Response)
+        ResponseOrBuilder {
+    private static final long serialVersionUID = 0L;
+      // Use Response.newBuilder() to construct.
+      private Response(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+        super(builder);
       }
-      if (((bitField0_ & 0x00000004) != 0)) {
-        com.google.protobuf.GeneratedMessageV3.writeString(output, 2, metricKey_);
+      private Response() {
+        metrics_ = java.util.Collections.emptyList();
       }
-      if (((bitField0_ & 0x00000001) != 0)) {
-        com.google.protobuf.GeneratedMessageV3.writeString(output, 3, runId_);
+
+      @java.lang.Override
+      @SuppressWarnings({"unused"})
+      protected java.lang.Object newInstance(
+          UnusedPrivateParameter unused) {
+        return new Response();
+      }
+
+      @java.lang.Override
+      public final com.google.protobuf.UnknownFieldSet
+      getUnknownFields() {
+        return this.unknownFields;
+      }
+      private Response(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        this();
+        if (extensionRegistry == null) {
+          throw new java.lang.NullPointerException();
+        }
+        int mutable_bitField0_ = 0;
+        com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+            com.google.protobuf.UnknownFieldSet.newBuilder();
+        try {
+          boolean done = false;
+          while (!done) {
+            int tag = input.readTag();
+            switch (tag) {
+              case 0:
+                done = true;
+                break;
+              case 10: {
+                if (!((mutable_bitField0_ & 0x00000001) != 0)) {
+                  metrics_ = new java.util.ArrayList<org.mlflow.api.proto.Service.MetricWithRunId>();
+                  mutable_bitField0_ |= 0x00000001;
+                }
+                metrics_.add(
+                    input.readMessage(org.mlflow.api.proto.Service.MetricWithRunId.PARSER, extensionRegistry));
+                break;
+              }
+              default: {
+                if (!parseUnknownField(
+                    input, unknownFields, extensionRegistry, tag)) {
+                  done = true;
+                }
+                break;
+              }
+            }
+          }
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          throw e.setUnfinishedMessage(this);
+        } catch (java.io.IOException e) {
+          throw new com.google.protobuf.InvalidProtocolBufferException(
+              e).setUnfinishedMessage(this);
+        } finally {
+          if (((mutable_bitField0_ & 0x00000001) != 0)) {
+            metrics_ = java.util.Collections.unmodifiableList(metrics_);
+          }
+          this.unknownFields = unknownFields.build();
+          makeExtensionsImmutable();
+        }
+      }
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistoryBulkInterval_Response_descriptor;
+      }
+
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistoryBulkInterval_Response_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response.class, org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response.Builder.class);
+      }
+
+      public static final int METRICS_FIELD_NUMBER = 1;
+      private java.util.List<org.mlflow.api.proto.Service.MetricWithRunId> metrics_;
+      /**
+       * <pre>
+       * List of metrics representing history of values and metadata.
+       * </pre>
+       *
+       * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+       */
+      @java.lang.Override
+      public java.util.List<org.mlflow.api.proto.Service.MetricWithRunId> getMetricsList() {
+        return metrics_;
+      }
+      /**
+       * <pre>
+       * List of metrics representing history of values and metadata.
+       * </pre>
+       *
+       * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+       */
+      @java.lang.Override
+      public java.util.List<? extends org.mlflow.api.proto.Service.MetricWithRunIdOrBuilder> 
+          getMetricsOrBuilderList() {
+        return metrics_;
+      }
+      /**
+       * <pre>
+       * List of metrics representing history of values and metadata.
+       * </pre>
+       *
+       * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+       */
+      @java.lang.Override
+      public int getMetricsCount() {
+        return metrics_.size();
+      }
+      /**
+       * <pre>
+       * List of metrics representing history of values and metadata.
+       * </pre>
+       *
+       * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+       */
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.MetricWithRunId getMetrics(int index) {
+        return metrics_.get(index);
+      }
+      /**
+       * <pre>
+       * List of metrics representing history of values and metadata.
+       * </pre>
+       *
+       * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+       */
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.MetricWithRunIdOrBuilder getMetricsOrBuilder(
+          int index) {
+        return metrics_.get(index);
+      }
+
+      private byte memoizedIsInitialized = -1;
+      @java.lang.Override
+      public final boolean isInitialized() {
+        byte isInitialized = memoizedIsInitialized;
+        if (isInitialized == 1) return true;
+        if (isInitialized == 0) return false;
+
+        memoizedIsInitialized = 1;
+        return true;
       }
-      if (((bitField0_ & 0x00000008) != 0)) {
-        com.google.protobuf.GeneratedMessageV3.writeString(output, 4, pageToken_);
+
+      @java.lang.Override
+      public void writeTo(com.google.protobuf.CodedOutputStream output)
+                          throws java.io.IOException {
+        for (int i = 0; i < metrics_.size(); i++) {
+          output.writeMessage(1, metrics_.get(i));
+        }
+        unknownFields.writeTo(output);
       }
-      if (((bitField0_ & 0x00000010) != 0)) {
-        output.writeInt32(5, maxResults_);
+
+      @java.lang.Override
+      public int getSerializedSize() {
+        int size = memoizedSize;
+        if (size != -1) return size;
+
+        size = 0;
+        for (int i = 0; i < metrics_.size(); i++) {
+          size += com.google.protobuf.CodedOutputStream
+            .computeMessageSize(1, metrics_.get(i));
+        }
+        size += unknownFields.getSerializedSize();
+        memoizedSize = size;
+        return size;
       }
-      unknownFields.writeTo(output);
-    }
 
-    @java.lang.Override
-    public int getSerializedSize() {
-      int size = memoizedSize;
-      if (size != -1) return size;
+      @java.lang.Override
+      public boolean equals(final java.lang.Object obj) {
+        if (obj == this) {
+         return true;
+        }
+        if (!(obj instanceof org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response)) {
+          return super.equals(obj);
+        }
+        org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response other = (org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response) obj;
 
-      size = 0;
-      if (((bitField0_ & 0x00000002) != 0)) {
-        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(1, runUuid_);
+        if (!getMetricsList()
+            .equals(other.getMetricsList())) return false;
+        if (!unknownFields.equals(other.unknownFields)) return false;
+        return true;
       }
-      if (((bitField0_ & 0x00000004) != 0)) {
-        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(2, metricKey_);
+
+      @java.lang.Override
+      public int hashCode() {
+        if (memoizedHashCode != 0) {
+          return memoizedHashCode;
+        }
+        int hash = 41;
+        hash = (19 * hash) + getDescriptor().hashCode();
+        if (getMetricsCount() > 0) {
+          hash = (37 * hash) + METRICS_FIELD_NUMBER;
+          hash = (53 * hash) + getMetricsList().hashCode();
+        }
+        hash = (29 * hash) + unknownFields.hashCode();
+        memoizedHashCode = hash;
+        return hash;
       }
-      if (((bitField0_ & 0x00000001) != 0)) {
-        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(3, runId_);
+
+      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseFrom(
+          java.nio.ByteBuffer data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
       }
-      if (((bitField0_ & 0x00000008) != 0)) {
-        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(4, pageToken_);
+      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseFrom(
+          java.nio.ByteBuffer data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
       }
-      if (((bitField0_ & 0x00000010) != 0)) {
-        size += com.google.protobuf.CodedOutputStream
-          .computeInt32Size(5, maxResults_);
+      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseFrom(
+          com.google.protobuf.ByteString data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
       }
-      size += unknownFields.getSerializedSize();
-      memoizedSize = size;
-      return size;
-    }
-
-    @java.lang.Override
-    public boolean equals(final java.lang.Object obj) {
-      if (obj == this) {
-       return true;
+      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseFrom(
+          com.google.protobuf.ByteString data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
       }
-      if (!(obj instanceof org.mlflow.api.proto.Service.GetMetricHistory)) {
-        return super.equals(obj);
+      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseFrom(byte[] data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
       }
-      org.mlflow.api.proto.Service.GetMetricHistory other = (org.mlflow.api.proto.Service.GetMetricHistory) obj;
-
-      if (hasRunId() != other.hasRunId()) return false;
-      if (hasRunId()) {
-        if (!getRunId()
-            .equals(other.getRunId())) return false;
+      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseFrom(
+          byte[] data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
       }
-      if (hasRunUuid() != other.hasRunUuid()) return false;
-      if (hasRunUuid()) {
-        if (!getRunUuid()
-            .equals(other.getRunUuid())) return false;
+      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
       }
-      if (hasMetricKey() != other.hasMetricKey()) return false;
-      if (hasMetricKey()) {
-        if (!getMetricKey()
-            .equals(other.getMetricKey())) return false;
+      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
       }
-      if (hasPageToken() != other.hasPageToken()) return false;
-      if (hasPageToken()) {
-        if (!getPageToken()
-            .equals(other.getPageToken())) return false;
+      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseDelimitedFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input);
       }
-      if (hasMaxResults() != other.hasMaxResults()) return false;
-      if (hasMaxResults()) {
-        if (getMaxResults()
-            != other.getMaxResults()) return false;
+      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseDelimitedFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
       }
-      if (!unknownFields.equals(other.unknownFields)) return false;
-      return true;
-    }
-
-    @java.lang.Override
-    public int hashCode() {
-      if (memoizedHashCode != 0) {
-        return memoizedHashCode;
+      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseFrom(
+          com.google.protobuf.CodedInputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
       }
-      int hash = 41;
-      hash = (19 * hash) + getDescriptor().hashCode();
-      if (hasRunId()) {
-        hash = (37 * hash) + RUN_ID_FIELD_NUMBER;
-        hash = (53 * hash) + getRunId().hashCode();
+      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
       }
-      if (hasRunUuid()) {
-        hash = (37 * hash) + RUN_UUID_FIELD_NUMBER;
-        hash = (53 * hash) + getRunUuid().hashCode();
+
+      @java.lang.Override
+      public Builder newBuilderForType() { return newBuilder(); }
+      public static Builder newBuilder() {
+        return DEFAULT_INSTANCE.toBuilder();
       }
-      if (hasMetricKey()) {
-        hash = (37 * hash) + METRIC_KEY_FIELD_NUMBER;
-        hash = (53 * hash) + getMetricKey().hashCode();
+      public static Builder newBuilder(org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response prototype) {
+        return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
       }
-      if (hasPageToken()) {
-        hash = (37 * hash) + PAGE_TOKEN_FIELD_NUMBER;
-        hash = (53 * hash) + getPageToken().hashCode();
+      @java.lang.Override
+      public Builder toBuilder() {
+        return this == DEFAULT_INSTANCE
+            ? new Builder() : new Builder().mergeFrom(this);
       }
-      if (hasMaxResults()) {
-        hash = (37 * hash) + MAX_RESULTS_FIELD_NUMBER;
-        hash = (53 * hash) + getMaxResults();
+
+      @java.lang.Override
+      protected Builder newBuilderForType(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        Builder builder = new Builder(parent);
+        return builder;
       }
-      hash = (29 * hash) + unknownFields.hashCode();
-      memoizedHashCode = hash;
-      return hash;
-    }
+      /**
+       * Protobuf type {@code mlflow.GetMetricHistoryBulkInterval.Response}
+       */
+      public static final class Builder extends
+          com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+          // @@protoc_insertion_point(builder_implements:mlflow.GetMetricHistoryBulkInterval.Response)
+          org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.ResponseOrBuilder {
+        public static final com.google.protobuf.Descriptors.Descriptor
+            getDescriptor() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistoryBulkInterval_Response_descriptor;
+        }
 
-    public static org.mlflow.api.proto.Service.GetMetricHistory parseFrom(
-        java.nio.ByteBuffer data)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data);
-    }
-    public static org.mlflow.api.proto.Service.GetMetricHistory parseFrom(
-        java.nio.ByteBuffer data,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.GetMetricHistory parseFrom(
-        com.google.protobuf.ByteString data)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data);
-    }
-    public static org.mlflow.api.proto.Service.GetMetricHistory parseFrom(
-        com.google.protobuf.ByteString data,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.GetMetricHistory parseFrom(byte[] data)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data);
-    }
-    public static org.mlflow.api.proto.Service.GetMetricHistory parseFrom(
-        byte[] data,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.GetMetricHistory parseFrom(java.io.InputStream input)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseWithIOException(PARSER, input);
-    }
-    public static org.mlflow.api.proto.Service.GetMetricHistory parseFrom(
-        java.io.InputStream input,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseWithIOException(PARSER, input, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.GetMetricHistory parseDelimitedFrom(java.io.InputStream input)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseDelimitedWithIOException(PARSER, input);
-    }
-    public static org.mlflow.api.proto.Service.GetMetricHistory parseDelimitedFrom(
-        java.io.InputStream input,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.GetMetricHistory parseFrom(
-        com.google.protobuf.CodedInputStream input)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseWithIOException(PARSER, input);
-    }
-    public static org.mlflow.api.proto.Service.GetMetricHistory parseFrom(
-        com.google.protobuf.CodedInputStream input,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseWithIOException(PARSER, input, extensionRegistry);
-    }
+        @java.lang.Override
+        protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+            internalGetFieldAccessorTable() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistoryBulkInterval_Response_fieldAccessorTable
+              .ensureFieldAccessorsInitialized(
+                  org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response.class, org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response.Builder.class);
+        }
 
-    @java.lang.Override
-    public Builder newBuilderForType() { return newBuilder(); }
-    public static Builder newBuilder() {
-      return DEFAULT_INSTANCE.toBuilder();
-    }
-    public static Builder newBuilder(org.mlflow.api.proto.Service.GetMetricHistory prototype) {
-      return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
-    }
-    @java.lang.Override
-    public Builder toBuilder() {
-      return this == DEFAULT_INSTANCE
-          ? new Builder() : new Builder().mergeFrom(this);
-    }
+        // Construct using org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response.newBuilder()
+        private Builder() {
+          maybeForceBuilderInitialization();
+        }
 
-    @java.lang.Override
-    protected Builder newBuilderForType(
-        com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
-      Builder builder = new Builder(parent);
-      return builder;
-    }
-    /**
-     * Protobuf type {@code mlflow.GetMetricHistory}
-     */
-    public static final class Builder extends
-        com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
-        // @@protoc_insertion_point(builder_implements:mlflow.GetMetricHistory)
-        org.mlflow.api.proto.Service.GetMetricHistoryOrBuilder {
-      public static final com.google.protobuf.Descriptors.Descriptor
-          getDescriptor() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistory_descriptor;
-      }
+        private Builder(
+            com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+          super(parent);
+          maybeForceBuilderInitialization();
+        }
+        private void maybeForceBuilderInitialization() {
+          if (com.google.protobuf.GeneratedMessageV3
+                  .alwaysUseFieldBuilders) {
+            getMetricsFieldBuilder();
+          }
+        }
+        @java.lang.Override
+        public Builder clear() {
+          super.clear();
+          if (metricsBuilder_ == null) {
+            metrics_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000001);
+          } else {
+            metricsBuilder_.clear();
+          }
+          return this;
+        }
 
-      @java.lang.Override
-      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
-          internalGetFieldAccessorTable() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistory_fieldAccessorTable
-            .ensureFieldAccessorsInitialized(
-                org.mlflow.api.proto.Service.GetMetricHistory.class, org.mlflow.api.proto.Service.GetMetricHistory.Builder.class);
-      }
+        @java.lang.Override
+        public com.google.protobuf.Descriptors.Descriptor
+            getDescriptorForType() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistoryBulkInterval_Response_descriptor;
+        }
 
-      // Construct using org.mlflow.api.proto.Service.GetMetricHistory.newBuilder()
-      private Builder() {
-        maybeForceBuilderInitialization();
-      }
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response getDefaultInstanceForType() {
+          return org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response.getDefaultInstance();
+        }
 
-      private Builder(
-          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
-        super(parent);
-        maybeForceBuilderInitialization();
-      }
-      private void maybeForceBuilderInitialization() {
-        if (com.google.protobuf.GeneratedMessageV3
-                .alwaysUseFieldBuilders) {
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response build() {
+          org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response result = buildPartial();
+          if (!result.isInitialized()) {
+            throw newUninitializedMessageException(result);
+          }
+          return result;
         }
-      }
-      @java.lang.Override
-      public Builder clear() {
-        super.clear();
-        runId_ = "";
-        bitField0_ = (bitField0_ & ~0x00000001);
-        runUuid_ = "";
-        bitField0_ = (bitField0_ & ~0x00000002);
-        metricKey_ = "";
-        bitField0_ = (bitField0_ & ~0x00000004);
-        pageToken_ = "";
-        bitField0_ = (bitField0_ & ~0x00000008);
-        maxResults_ = 0;
-        bitField0_ = (bitField0_ & ~0x00000010);
-        return this;
-      }
 
-      @java.lang.Override
-      public com.google.protobuf.Descriptors.Descriptor
-          getDescriptorForType() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistory_descriptor;
-      }
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response buildPartial() {
+          org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response result = new org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response(this);
+          int from_bitField0_ = bitField0_;
+          if (metricsBuilder_ == null) {
+            if (((bitField0_ & 0x00000001) != 0)) {
+              metrics_ = java.util.Collections.unmodifiableList(metrics_);
+              bitField0_ = (bitField0_ & ~0x00000001);
+            }
+            result.metrics_ = metrics_;
+          } else {
+            result.metrics_ = metricsBuilder_.build();
+          }
+          onBuilt();
+          return result;
+        }
 
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.GetMetricHistory getDefaultInstanceForType() {
-        return org.mlflow.api.proto.Service.GetMetricHistory.getDefaultInstance();
-      }
+        @java.lang.Override
+        public Builder clone() {
+          return super.clone();
+        }
+        @java.lang.Override
+        public Builder setField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return super.setField(field, value);
+        }
+        @java.lang.Override
+        public Builder clearField(
+            com.google.protobuf.Descriptors.FieldDescriptor field) {
+          return super.clearField(field);
+        }
+        @java.lang.Override
+        public Builder clearOneof(
+            com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+          return super.clearOneof(oneof);
+        }
+        @java.lang.Override
+        public Builder setRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            int index, java.lang.Object value) {
+          return super.setRepeatedField(field, index, value);
+        }
+        @java.lang.Override
+        public Builder addRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return super.addRepeatedField(field, value);
+        }
+        @java.lang.Override
+        public Builder mergeFrom(com.google.protobuf.Message other) {
+          if (other instanceof org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response) {
+            return mergeFrom((org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response)other);
+          } else {
+            super.mergeFrom(other);
+            return this;
+          }
+        }
 
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.GetMetricHistory build() {
-        org.mlflow.api.proto.Service.GetMetricHistory result = buildPartial();
-        if (!result.isInitialized()) {
-          throw newUninitializedMessageException(result);
+        public Builder mergeFrom(org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response other) {
+          if (other == org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response.getDefaultInstance()) return this;
+          if (metricsBuilder_ == null) {
+            if (!other.metrics_.isEmpty()) {
+              if (metrics_.isEmpty()) {
+                metrics_ = other.metrics_;
+                bitField0_ = (bitField0_ & ~0x00000001);
+              } else {
+                ensureMetricsIsMutable();
+                metrics_.addAll(other.metrics_);
+              }
+              onChanged();
+            }
+          } else {
+            if (!other.metrics_.isEmpty()) {
+              if (metricsBuilder_.isEmpty()) {
+                metricsBuilder_.dispose();
+                metricsBuilder_ = null;
+                metrics_ = other.metrics_;
+                bitField0_ = (bitField0_ & ~0x00000001);
+                metricsBuilder_ = 
+                  com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
+                     getMetricsFieldBuilder() : null;
+              } else {
+                metricsBuilder_.addAllMessages(other.metrics_);
+              }
+            }
+          }
+          this.mergeUnknownFields(other.unknownFields);
+          onChanged();
+          return this;
+        }
+
+        @java.lang.Override
+        public final boolean isInitialized() {
+          return true;
         }
-        return result;
-      }
 
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.GetMetricHistory buildPartial() {
-        org.mlflow.api.proto.Service.GetMetricHistory result = new org.mlflow.api.proto.Service.GetMetricHistory(this);
-        int from_bitField0_ = bitField0_;
-        int to_bitField0_ = 0;
-        if (((from_bitField0_ & 0x00000001) != 0)) {
-          to_bitField0_ |= 0x00000001;
+        @java.lang.Override
+        public Builder mergeFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws java.io.IOException {
+          org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parsedMessage = null;
+          try {
+            parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+          } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+            parsedMessage = (org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response) e.getUnfinishedMessage();
+            throw e.unwrapIOException();
+          } finally {
+            if (parsedMessage != null) {
+              mergeFrom(parsedMessage);
+            }
+          }
+          return this;
         }
-        result.runId_ = runId_;
-        if (((from_bitField0_ & 0x00000002) != 0)) {
-          to_bitField0_ |= 0x00000002;
+        private int bitField0_;
+
+        private java.util.List<org.mlflow.api.proto.Service.MetricWithRunId> metrics_ =
+          java.util.Collections.emptyList();
+        private void ensureMetricsIsMutable() {
+          if (!((bitField0_ & 0x00000001) != 0)) {
+            metrics_ = new java.util.ArrayList<org.mlflow.api.proto.Service.MetricWithRunId>(metrics_);
+            bitField0_ |= 0x00000001;
+           }
         }
-        result.runUuid_ = runUuid_;
-        if (((from_bitField0_ & 0x00000004) != 0)) {
-          to_bitField0_ |= 0x00000004;
+
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.MetricWithRunId, org.mlflow.api.proto.Service.MetricWithRunId.Builder, org.mlflow.api.proto.Service.MetricWithRunIdOrBuilder> metricsBuilder_;
+
+        /**
+         * <pre>
+         * List of metrics representing history of values and metadata.
+         * </pre>
+         *
+         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.MetricWithRunId> getMetricsList() {
+          if (metricsBuilder_ == null) {
+            return java.util.Collections.unmodifiableList(metrics_);
+          } else {
+            return metricsBuilder_.getMessageList();
+          }
         }
-        result.metricKey_ = metricKey_;
-        if (((from_bitField0_ & 0x00000008) != 0)) {
-          to_bitField0_ |= 0x00000008;
+        /**
+         * <pre>
+         * List of metrics representing history of values and metadata.
+         * </pre>
+         *
+         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+         */
+        public int getMetricsCount() {
+          if (metricsBuilder_ == null) {
+            return metrics_.size();
+          } else {
+            return metricsBuilder_.getCount();
+          }
         }
-        result.pageToken_ = pageToken_;
-        if (((from_bitField0_ & 0x00000010) != 0)) {
-          result.maxResults_ = maxResults_;
-          to_bitField0_ |= 0x00000010;
+        /**
+         * <pre>
+         * List of metrics representing history of values and metadata.
+         * </pre>
+         *
+         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.MetricWithRunId getMetrics(int index) {
+          if (metricsBuilder_ == null) {
+            return metrics_.get(index);
+          } else {
+            return metricsBuilder_.getMessage(index);
+          }
         }
-        result.bitField0_ = to_bitField0_;
-        onBuilt();
-        return result;
-      }
-
-      @java.lang.Override
-      public Builder clone() {
-        return super.clone();
-      }
-      @java.lang.Override
-      public Builder setField(
-          com.google.protobuf.Descriptors.FieldDescriptor field,
-          java.lang.Object value) {
-        return super.setField(field, value);
-      }
-      @java.lang.Override
-      public Builder clearField(
-          com.google.protobuf.Descriptors.FieldDescriptor field) {
-        return super.clearField(field);
-      }
-      @java.lang.Override
-      public Builder clearOneof(
-          com.google.protobuf.Descriptors.OneofDescriptor oneof) {
-        return super.clearOneof(oneof);
-      }
-      @java.lang.Override
-      public Builder setRepeatedField(
-          com.google.protobuf.Descriptors.FieldDescriptor field,
-          int index, java.lang.Object value) {
-        return super.setRepeatedField(field, index, value);
-      }
-      @java.lang.Override
-      public Builder addRepeatedField(
-          com.google.protobuf.Descriptors.FieldDescriptor field,
-          java.lang.Object value) {
-        return super.addRepeatedField(field, value);
-      }
-      @java.lang.Override
-      public Builder mergeFrom(com.google.protobuf.Message other) {
-        if (other instanceof org.mlflow.api.proto.Service.GetMetricHistory) {
-          return mergeFrom((org.mlflow.api.proto.Service.GetMetricHistory)other);
-        } else {
-          super.mergeFrom(other);
+        /**
+         * <pre>
+         * List of metrics representing history of values and metadata.
+         * </pre>
+         *
+         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+         */
+        public Builder setMetrics(
+            int index, org.mlflow.api.proto.Service.MetricWithRunId value) {
+          if (metricsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureMetricsIsMutable();
+            metrics_.set(index, value);
+            onChanged();
+          } else {
+            metricsBuilder_.setMessage(index, value);
+          }
           return this;
         }
-      }
-
-      public Builder mergeFrom(org.mlflow.api.proto.Service.GetMetricHistory other) {
-        if (other == org.mlflow.api.proto.Service.GetMetricHistory.getDefaultInstance()) return this;
-        if (other.hasRunId()) {
-          bitField0_ |= 0x00000001;
-          runId_ = other.runId_;
-          onChanged();
+        /**
+         * <pre>
+         * List of metrics representing history of values and metadata.
+         * </pre>
+         *
+         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+         */
+        public Builder setMetrics(
+            int index, org.mlflow.api.proto.Service.MetricWithRunId.Builder builderForValue) {
+          if (metricsBuilder_ == null) {
+            ensureMetricsIsMutable();
+            metrics_.set(index, builderForValue.build());
+            onChanged();
+          } else {
+            metricsBuilder_.setMessage(index, builderForValue.build());
+          }
+          return this;
         }
-        if (other.hasRunUuid()) {
-          bitField0_ |= 0x00000002;
-          runUuid_ = other.runUuid_;
-          onChanged();
+        /**
+         * <pre>
+         * List of metrics representing history of values and metadata.
+         * </pre>
+         *
+         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+         */
+        public Builder addMetrics(org.mlflow.api.proto.Service.MetricWithRunId value) {
+          if (metricsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureMetricsIsMutable();
+            metrics_.add(value);
+            onChanged();
+          } else {
+            metricsBuilder_.addMessage(value);
+          }
+          return this;
         }
-        if (other.hasMetricKey()) {
-          bitField0_ |= 0x00000004;
-          metricKey_ = other.metricKey_;
-          onChanged();
+        /**
+         * <pre>
+         * List of metrics representing history of values and metadata.
+         * </pre>
+         *
+         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+         */
+        public Builder addMetrics(
+            int index, org.mlflow.api.proto.Service.MetricWithRunId value) {
+          if (metricsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureMetricsIsMutable();
+            metrics_.add(index, value);
+            onChanged();
+          } else {
+            metricsBuilder_.addMessage(index, value);
+          }
+          return this;
         }
-        if (other.hasPageToken()) {
-          bitField0_ |= 0x00000008;
-          pageToken_ = other.pageToken_;
-          onChanged();
+        /**
+         * <pre>
+         * List of metrics representing history of values and metadata.
+         * </pre>
+         *
+         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+         */
+        public Builder addMetrics(
+            org.mlflow.api.proto.Service.MetricWithRunId.Builder builderForValue) {
+          if (metricsBuilder_ == null) {
+            ensureMetricsIsMutable();
+            metrics_.add(builderForValue.build());
+            onChanged();
+          } else {
+            metricsBuilder_.addMessage(builderForValue.build());
+          }
+          return this;
         }
-        if (other.hasMaxResults()) {
-          setMaxResults(other.getMaxResults());
+        /**
+         * <pre>
+         * List of metrics representing history of values and metadata.
+         * </pre>
+         *
+         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+         */
+        public Builder addMetrics(
+            int index, org.mlflow.api.proto.Service.MetricWithRunId.Builder builderForValue) {
+          if (metricsBuilder_ == null) {
+            ensureMetricsIsMutable();
+            metrics_.add(index, builderForValue.build());
+            onChanged();
+          } else {
+            metricsBuilder_.addMessage(index, builderForValue.build());
+          }
+          return this;
         }
-        this.mergeUnknownFields(other.unknownFields);
-        onChanged();
-        return this;
-      }
-
-      @java.lang.Override
-      public final boolean isInitialized() {
-        return true;
-      }
-
-      @java.lang.Override
-      public Builder mergeFrom(
-          com.google.protobuf.CodedInputStream input,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws java.io.IOException {
-        org.mlflow.api.proto.Service.GetMetricHistory parsedMessage = null;
-        try {
-          parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
-        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-          parsedMessage = (org.mlflow.api.proto.Service.GetMetricHistory) e.getUnfinishedMessage();
-          throw e.unwrapIOException();
-        } finally {
-          if (parsedMessage != null) {
-            mergeFrom(parsedMessage);
+        /**
+         * <pre>
+         * List of metrics representing history of values and metadata.
+         * </pre>
+         *
+         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+         */
+        public Builder addAllMetrics(
+            java.lang.Iterable<? extends org.mlflow.api.proto.Service.MetricWithRunId> values) {
+          if (metricsBuilder_ == null) {
+            ensureMetricsIsMutable();
+            com.google.protobuf.AbstractMessageLite.Builder.addAll(
+                values, metrics_);
+            onChanged();
+          } else {
+            metricsBuilder_.addAllMessages(values);
           }
+          return this;
         }
-        return this;
-      }
-      private int bitField0_;
-
-      private java.lang.Object runId_ = "";
-      /**
-       * <pre>
-       * ID of the run from which to fetch metric values. Must be provided.
-       * </pre>
-       *
-       * <code>optional string run_id = 3;</code>
-       * @return Whether the runId field is set.
-       */
-      public boolean hasRunId() {
-        return ((bitField0_ & 0x00000001) != 0);
-      }
-      /**
-       * <pre>
-       * ID of the run from which to fetch metric values. Must be provided.
-       * </pre>
-       *
-       * <code>optional string run_id = 3;</code>
-       * @return The runId.
-       */
-      public java.lang.String getRunId() {
-        java.lang.Object ref = runId_;
-        if (!(ref instanceof java.lang.String)) {
-          com.google.protobuf.ByteString bs =
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            runId_ = s;
+        /**
+         * <pre>
+         * List of metrics representing history of values and metadata.
+         * </pre>
+         *
+         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+         */
+        public Builder clearMetrics() {
+          if (metricsBuilder_ == null) {
+            metrics_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000001);
+            onChanged();
+          } else {
+            metricsBuilder_.clear();
           }
-          return s;
-        } else {
-          return (java.lang.String) ref;
+          return this;
         }
-      }
-      /**
-       * <pre>
-       * ID of the run from which to fetch metric values. Must be provided.
-       * </pre>
-       *
-       * <code>optional string run_id = 3;</code>
-       * @return The bytes for runId.
-       */
-      public com.google.protobuf.ByteString
-          getRunIdBytes() {
-        java.lang.Object ref = runId_;
-        if (ref instanceof String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          runId_ = b;
-          return b;
-        } else {
-          return (com.google.protobuf.ByteString) ref;
+        /**
+         * <pre>
+         * List of metrics representing history of values and metadata.
+         * </pre>
+         *
+         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+         */
+        public Builder removeMetrics(int index) {
+          if (metricsBuilder_ == null) {
+            ensureMetricsIsMutable();
+            metrics_.remove(index);
+            onChanged();
+          } else {
+            metricsBuilder_.remove(index);
+          }
+          return this;
         }
-      }
-      /**
-       * <pre>
-       * ID of the run from which to fetch metric values. Must be provided.
-       * </pre>
-       *
-       * <code>optional string run_id = 3;</code>
-       * @param value The runId to set.
-       * @return This builder for chaining.
-       */
-      public Builder setRunId(
-          java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000001;
-        runId_ = value;
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * ID of the run from which to fetch metric values. Must be provided.
-       * </pre>
-       *
-       * <code>optional string run_id = 3;</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearRunId() {
-        bitField0_ = (bitField0_ & ~0x00000001);
-        runId_ = getDefaultInstance().getRunId();
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * ID of the run from which to fetch metric values. Must be provided.
-       * </pre>
-       *
-       * <code>optional string run_id = 3;</code>
-       * @param value The bytes for runId to set.
-       * @return This builder for chaining.
-       */
-      public Builder setRunIdBytes(
-          com.google.protobuf.ByteString value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000001;
-        runId_ = value;
-        onChanged();
-        return this;
-      }
-
-      private java.lang.Object runUuid_ = "";
-      /**
-       * <pre>
-       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
-       * will be removed in a future MLflow version.
-       * </pre>
-       *
-       * <code>optional string run_uuid = 1;</code>
-       * @return Whether the runUuid field is set.
-       */
-      public boolean hasRunUuid() {
-        return ((bitField0_ & 0x00000002) != 0);
-      }
-      /**
-       * <pre>
-       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
-       * will be removed in a future MLflow version.
-       * </pre>
-       *
-       * <code>optional string run_uuid = 1;</code>
-       * @return The runUuid.
-       */
-      public java.lang.String getRunUuid() {
-        java.lang.Object ref = runUuid_;
-        if (!(ref instanceof java.lang.String)) {
-          com.google.protobuf.ByteString bs =
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            runUuid_ = s;
+        /**
+         * <pre>
+         * List of metrics representing history of values and metadata.
+         * </pre>
+         *
+         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.MetricWithRunId.Builder getMetricsBuilder(
+            int index) {
+          return getMetricsFieldBuilder().getBuilder(index);
+        }
+        /**
+         * <pre>
+         * List of metrics representing history of values and metadata.
+         * </pre>
+         *
+         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.MetricWithRunIdOrBuilder getMetricsOrBuilder(
+            int index) {
+          if (metricsBuilder_ == null) {
+            return metrics_.get(index);  } else {
+            return metricsBuilder_.getMessageOrBuilder(index);
+          }
+        }
+        /**
+         * <pre>
+         * List of metrics representing history of values and metadata.
+         * </pre>
+         *
+         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+         */
+        public java.util.List<? extends org.mlflow.api.proto.Service.MetricWithRunIdOrBuilder> 
+             getMetricsOrBuilderList() {
+          if (metricsBuilder_ != null) {
+            return metricsBuilder_.getMessageOrBuilderList();
+          } else {
+            return java.util.Collections.unmodifiableList(metrics_);
           }
-          return s;
-        } else {
-          return (java.lang.String) ref;
         }
-      }
-      /**
-       * <pre>
-       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
-       * will be removed in a future MLflow version.
-       * </pre>
-       *
-       * <code>optional string run_uuid = 1;</code>
-       * @return The bytes for runUuid.
-       */
-      public com.google.protobuf.ByteString
-          getRunUuidBytes() {
-        java.lang.Object ref = runUuid_;
-        if (ref instanceof String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          runUuid_ = b;
-          return b;
-        } else {
-          return (com.google.protobuf.ByteString) ref;
+        /**
+         * <pre>
+         * List of metrics representing history of values and metadata.
+         * </pre>
+         *
+         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.MetricWithRunId.Builder addMetricsBuilder() {
+          return getMetricsFieldBuilder().addBuilder(
+              org.mlflow.api.proto.Service.MetricWithRunId.getDefaultInstance());
         }
-      }
-      /**
-       * <pre>
-       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
-       * will be removed in a future MLflow version.
-       * </pre>
-       *
-       * <code>optional string run_uuid = 1;</code>
-       * @param value The runUuid to set.
-       * @return This builder for chaining.
-       */
-      public Builder setRunUuid(
-          java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000002;
-        runUuid_ = value;
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
-       * will be removed in a future MLflow version.
-       * </pre>
-       *
-       * <code>optional string run_uuid = 1;</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearRunUuid() {
-        bitField0_ = (bitField0_ & ~0x00000002);
-        runUuid_ = getDefaultInstance().getRunUuid();
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
-       * will be removed in a future MLflow version.
-       * </pre>
-       *
-       * <code>optional string run_uuid = 1;</code>
-       * @param value The bytes for runUuid to set.
-       * @return This builder for chaining.
-       */
-      public Builder setRunUuidBytes(
-          com.google.protobuf.ByteString value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000002;
-        runUuid_ = value;
-        onChanged();
-        return this;
-      }
-
-      private java.lang.Object metricKey_ = "";
-      /**
-       * <pre>
-       * Name of the metric.
-       * </pre>
-       *
-       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-       * @return Whether the metricKey field is set.
-       */
-      public boolean hasMetricKey() {
-        return ((bitField0_ & 0x00000004) != 0);
-      }
-      /**
-       * <pre>
-       * Name of the metric.
-       * </pre>
-       *
-       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-       * @return The metricKey.
-       */
-      public java.lang.String getMetricKey() {
-        java.lang.Object ref = metricKey_;
-        if (!(ref instanceof java.lang.String)) {
-          com.google.protobuf.ByteString bs =
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            metricKey_ = s;
-          }
-          return s;
-        } else {
-          return (java.lang.String) ref;
+        /**
+         * <pre>
+         * List of metrics representing history of values and metadata.
+         * </pre>
+         *
+         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.MetricWithRunId.Builder addMetricsBuilder(
+            int index) {
+          return getMetricsFieldBuilder().addBuilder(
+              index, org.mlflow.api.proto.Service.MetricWithRunId.getDefaultInstance());
         }
-      }
-      /**
-       * <pre>
-       * Name of the metric.
-       * </pre>
-       *
-       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-       * @return The bytes for metricKey.
-       */
-      public com.google.protobuf.ByteString
-          getMetricKeyBytes() {
-        java.lang.Object ref = metricKey_;
-        if (ref instanceof String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          metricKey_ = b;
-          return b;
-        } else {
-          return (com.google.protobuf.ByteString) ref;
+        /**
+         * <pre>
+         * List of metrics representing history of values and metadata.
+         * </pre>
+         *
+         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.MetricWithRunId.Builder> 
+             getMetricsBuilderList() {
+          return getMetricsFieldBuilder().getBuilderList();
         }
-      }
-      /**
-       * <pre>
-       * Name of the metric.
-       * </pre>
-       *
-       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-       * @param value The metricKey to set.
-       * @return This builder for chaining.
-       */
-      public Builder setMetricKey(
-          java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000004;
-        metricKey_ = value;
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * Name of the metric.
-       * </pre>
-       *
-       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearMetricKey() {
-        bitField0_ = (bitField0_ & ~0x00000004);
-        metricKey_ = getDefaultInstance().getMetricKey();
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * Name of the metric.
-       * </pre>
-       *
-       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-       * @param value The bytes for metricKey to set.
-       * @return This builder for chaining.
-       */
-      public Builder setMetricKeyBytes(
-          com.google.protobuf.ByteString value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000004;
-        metricKey_ = value;
-        onChanged();
-        return this;
-      }
-
-      private java.lang.Object pageToken_ = "";
-      /**
-       * <pre>
-       * Token indicating the page of metric history to fetch
-       * </pre>
-       *
-       * <code>optional string page_token = 4;</code>
-       * @return Whether the pageToken field is set.
-       */
-      public boolean hasPageToken() {
-        return ((bitField0_ & 0x00000008) != 0);
-      }
-      /**
-       * <pre>
-       * Token indicating the page of metric history to fetch
-       * </pre>
-       *
-       * <code>optional string page_token = 4;</code>
-       * @return The pageToken.
-       */
-      public java.lang.String getPageToken() {
-        java.lang.Object ref = pageToken_;
-        if (!(ref instanceof java.lang.String)) {
-          com.google.protobuf.ByteString bs =
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            pageToken_ = s;
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.MetricWithRunId, org.mlflow.api.proto.Service.MetricWithRunId.Builder, org.mlflow.api.proto.Service.MetricWithRunIdOrBuilder> 
+            getMetricsFieldBuilder() {
+          if (metricsBuilder_ == null) {
+            metricsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
+                org.mlflow.api.proto.Service.MetricWithRunId, org.mlflow.api.proto.Service.MetricWithRunId.Builder, org.mlflow.api.proto.Service.MetricWithRunIdOrBuilder>(
+                    metrics_,
+                    ((bitField0_ & 0x00000001) != 0),
+                    getParentForChildren(),
+                    isClean());
+            metrics_ = null;
           }
-          return s;
-        } else {
-          return (java.lang.String) ref;
+          return metricsBuilder_;
         }
-      }
-      /**
-       * <pre>
-       * Token indicating the page of metric history to fetch
-       * </pre>
-       *
-       * <code>optional string page_token = 4;</code>
-       * @return The bytes for pageToken.
-       */
-      public com.google.protobuf.ByteString
-          getPageTokenBytes() {
-        java.lang.Object ref = pageToken_;
-        if (ref instanceof String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          pageToken_ = b;
-          return b;
-        } else {
-          return (com.google.protobuf.ByteString) ref;
+        @java.lang.Override
+        public final Builder setUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.setUnknownFields(unknownFields);
         }
-      }
-      /**
-       * <pre>
-       * Token indicating the page of metric history to fetch
-       * </pre>
-       *
-       * <code>optional string page_token = 4;</code>
-       * @param value The pageToken to set.
-       * @return This builder for chaining.
-       */
-      public Builder setPageToken(
-          java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000008;
-        pageToken_ = value;
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * Token indicating the page of metric history to fetch
-       * </pre>
-       *
-       * <code>optional string page_token = 4;</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearPageToken() {
-        bitField0_ = (bitField0_ & ~0x00000008);
-        pageToken_ = getDefaultInstance().getPageToken();
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * Token indicating the page of metric history to fetch
-       * </pre>
-       *
-       * <code>optional string page_token = 4;</code>
-       * @param value The bytes for pageToken to set.
-       * @return This builder for chaining.
-       */
-      public Builder setPageTokenBytes(
-          com.google.protobuf.ByteString value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000008;
-        pageToken_ = value;
-        onChanged();
-        return this;
-      }
-
-      private int maxResults_ ;
-      /**
-       * <pre>
-       * Maximum number of logged instances of a metric for a run to return per call.
-       * Backend servers may restrict the value of `max_results` depending on performance requirements.
-       * Requests that do not specify this value will behave as non-paginated queries where all
-       * metric history values for a given metric within a run are returned in a single response.
-       * </pre>
-       *
-       * <code>optional int32 max_results = 5;</code>
-       * @return Whether the maxResults field is set.
-       */
-      @java.lang.Override
-      public boolean hasMaxResults() {
-        return ((bitField0_ & 0x00000010) != 0);
-      }
-      /**
-       * <pre>
-       * Maximum number of logged instances of a metric for a run to return per call.
-       * Backend servers may restrict the value of `max_results` depending on performance requirements.
-       * Requests that do not specify this value will behave as non-paginated queries where all
-       * metric history values for a given metric within a run are returned in a single response.
-       * </pre>
-       *
-       * <code>optional int32 max_results = 5;</code>
-       * @return The maxResults.
-       */
-      @java.lang.Override
-      public int getMaxResults() {
-        return maxResults_;
-      }
-      /**
-       * <pre>
-       * Maximum number of logged instances of a metric for a run to return per call.
-       * Backend servers may restrict the value of `max_results` depending on performance requirements.
-       * Requests that do not specify this value will behave as non-paginated queries where all
-       * metric history values for a given metric within a run are returned in a single response.
-       * </pre>
-       *
-       * <code>optional int32 max_results = 5;</code>
-       * @param value The maxResults to set.
-       * @return This builder for chaining.
-       */
-      public Builder setMaxResults(int value) {
-        bitField0_ |= 0x00000010;
-        maxResults_ = value;
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * Maximum number of logged instances of a metric for a run to return per call.
-       * Backend servers may restrict the value of `max_results` depending on performance requirements.
-       * Requests that do not specify this value will behave as non-paginated queries where all
-       * metric history values for a given metric within a run are returned in a single response.
-       * </pre>
-       *
-       * <code>optional int32 max_results = 5;</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearMaxResults() {
-        bitField0_ = (bitField0_ & ~0x00000010);
-        maxResults_ = 0;
-        onChanged();
-        return this;
-      }
-      @java.lang.Override
-      public final Builder setUnknownFields(
-          final com.google.protobuf.UnknownFieldSet unknownFields) {
-        return super.setUnknownFields(unknownFields);
-      }
-
-      @java.lang.Override
-      public final Builder mergeUnknownFields(
-          final com.google.protobuf.UnknownFieldSet unknownFields) {
-        return super.mergeUnknownFields(unknownFields);
-      }
-
 
-      // @@protoc_insertion_point(builder_scope:mlflow.GetMetricHistory)
-    }
-
-    // @@protoc_insertion_point(class_scope:mlflow.GetMetricHistory)
-    private static final org.mlflow.api.proto.Service.GetMetricHistory DEFAULT_INSTANCE;
-    static {
-      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.GetMetricHistory();
-    }
+        @java.lang.Override
+        public final Builder mergeUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.mergeUnknownFields(unknownFields);
+        }
 
-    public static org.mlflow.api.proto.Service.GetMetricHistory getDefaultInstance() {
-      return DEFAULT_INSTANCE;
-    }
 
-    @java.lang.Deprecated public static final com.google.protobuf.Parser<GetMetricHistory>
-        PARSER = new com.google.protobuf.AbstractParser<GetMetricHistory>() {
-      @java.lang.Override
-      public GetMetricHistory parsePartialFrom(
-          com.google.protobuf.CodedInputStream input,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return new GetMetricHistory(input, extensionRegistry);
+        // @@protoc_insertion_point(builder_scope:mlflow.GetMetricHistoryBulkInterval.Response)
       }
-    };
-
-    public static com.google.protobuf.Parser<GetMetricHistory> parser() {
-      return PARSER;
-    }
-
-    @java.lang.Override
-    public com.google.protobuf.Parser<GetMetricHistory> getParserForType() {
-      return PARSER;
-    }
 
-    @java.lang.Override
-    public org.mlflow.api.proto.Service.GetMetricHistory getDefaultInstanceForType() {
-      return DEFAULT_INSTANCE;
-    }
+      // @@protoc_insertion_point(class_scope:mlflow.GetMetricHistoryBulkInterval.Response)
+      private static final org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response DEFAULT_INSTANCE;
+      static {
+        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response();
+      }
 
-  }
+      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response getDefaultInstance() {
+        return DEFAULT_INSTANCE;
+      }
 
-  public interface MetricWithRunIdOrBuilder extends
-      // @@protoc_insertion_point(interface_extends:mlflow.MetricWithRunId)
-      com.google.protobuf.MessageOrBuilder {
+      @java.lang.Deprecated public static final com.google.protobuf.Parser<Response>
+          PARSER = new com.google.protobuf.AbstractParser<Response>() {
+        @java.lang.Override
+        public Response parsePartialFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws com.google.protobuf.InvalidProtocolBufferException {
+          return new Response(input, extensionRegistry);
+        }
+      };
 
-    /**
-     * <pre>
-     * Key identifying this metric.
-     * </pre>
-     *
-     * <code>optional string key = 1;</code>
-     * @return Whether the key field is set.
-     */
-    boolean hasKey();
-    /**
-     * <pre>
-     * Key identifying this metric.
-     * </pre>
-     *
-     * <code>optional string key = 1;</code>
-     * @return The key.
-     */
-    java.lang.String getKey();
-    /**
-     * <pre>
-     * Key identifying this metric.
-     * </pre>
-     *
-     * <code>optional string key = 1;</code>
-     * @return The bytes for key.
-     */
-    com.google.protobuf.ByteString
-        getKeyBytes();
+      public static com.google.protobuf.Parser<Response> parser() {
+        return PARSER;
+      }
 
-    /**
-     * <pre>
-     * Value associated with this metric.
-     * </pre>
-     *
-     * <code>optional double value = 2;</code>
-     * @return Whether the value field is set.
-     */
-    boolean hasValue();
-    /**
-     * <pre>
-     * Value associated with this metric.
-     * </pre>
-     *
-     * <code>optional double value = 2;</code>
-     * @return The value.
-     */
-    double getValue();
+      @java.lang.Override
+      public com.google.protobuf.Parser<Response> getParserForType() {
+        return PARSER;
+      }
 
-    /**
-     * <pre>
-     * The timestamp at which this metric was recorded.
-     * </pre>
-     *
-     * <code>optional int64 timestamp = 3;</code>
-     * @return Whether the timestamp field is set.
-     */
-    boolean hasTimestamp();
-    /**
-     * <pre>
-     * The timestamp at which this metric was recorded.
-     * </pre>
-     *
-     * <code>optional int64 timestamp = 3;</code>
-     * @return The timestamp.
-     */
-    long getTimestamp();
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response getDefaultInstanceForType() {
+        return DEFAULT_INSTANCE;
+      }
 
+    }
+
+    private int bitField0_;
+    public static final int RUN_IDS_FIELD_NUMBER = 1;
+    private com.google.protobuf.LazyStringList runIds_;
     /**
      * <pre>
-     * Step at which to log the metric.
-     * </pre>
-     *
-     * <code>optional int64 step = 4 [default = 0];</code>
-     * @return Whether the step field is set.
-     */
-    boolean hasStep();
-    /**
-     * <pre>
-     * Step at which to log the metric.
+     * ID(s) of the run(s) from which to fetch metric values. Must be provided.
      * </pre>
      *
-     * <code>optional int64 step = 4 [default = 0];</code>
-     * @return The step.
+     * <code>repeated string run_ids = 1;</code>
+     * @return A list containing the runIds.
      */
-    long getStep();
-
+    public com.google.protobuf.ProtocolStringList
+        getRunIdsList() {
+      return runIds_;
+    }
     /**
      * <pre>
-     * The ID of the run containing the metric
+     * ID(s) of the run(s) from which to fetch metric values. Must be provided.
      * </pre>
      *
-     * <code>optional string run_id = 5;</code>
-     * @return Whether the runId field is set.
+     * <code>repeated string run_ids = 1;</code>
+     * @return The count of runIds.
      */
-    boolean hasRunId();
+    public int getRunIdsCount() {
+      return runIds_.size();
+    }
     /**
      * <pre>
-     * The ID of the run containing the metric
+     * ID(s) of the run(s) from which to fetch metric values. Must be provided.
      * </pre>
      *
-     * <code>optional string run_id = 5;</code>
-     * @return The runId.
+     * <code>repeated string run_ids = 1;</code>
+     * @param index The index of the element to return.
+     * @return The runIds at the given index.
      */
-    java.lang.String getRunId();
+    public java.lang.String getRunIds(int index) {
+      return runIds_.get(index);
+    }
     /**
      * <pre>
-     * The ID of the run containing the metric
+     * ID(s) of the run(s) from which to fetch metric values. Must be provided.
      * </pre>
      *
-     * <code>optional string run_id = 5;</code>
-     * @return The bytes for runId.
+     * <code>repeated string run_ids = 1;</code>
+     * @param index The index of the value to return.
+     * @return The bytes of the runIds at the given index.
      */
-    com.google.protobuf.ByteString
-        getRunIdBytes();
-  }
-  /**
-   * Protobuf type {@code mlflow.MetricWithRunId}
-   */
-  public static final class MetricWithRunId extends
-      com.google.protobuf.GeneratedMessageV3 implements
-      // @@protoc_insertion_point(message_implements:mlflow.MetricWithRunId)
-      MetricWithRunIdOrBuilder {
-  private static final long serialVersionUID = 0L;
-    // Use MetricWithRunId.newBuilder() to construct.
-    private MetricWithRunId(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
-      super(builder);
-    }
-    private MetricWithRunId() {
-      key_ = "";
-      runId_ = "";
-    }
-
-    @java.lang.Override
-    @SuppressWarnings({"unused"})
-    protected java.lang.Object newInstance(
-        UnusedPrivateParameter unused) {
-      return new MetricWithRunId();
-    }
-
-    @java.lang.Override
-    public final com.google.protobuf.UnknownFieldSet
-    getUnknownFields() {
-      return this.unknownFields;
-    }
-    private MetricWithRunId(
-        com.google.protobuf.CodedInputStream input,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      this();
-      if (extensionRegistry == null) {
-        throw new java.lang.NullPointerException();
-      }
-      int mutable_bitField0_ = 0;
-      com.google.protobuf.UnknownFieldSet.Builder unknownFields =
-          com.google.protobuf.UnknownFieldSet.newBuilder();
-      try {
-        boolean done = false;
-        while (!done) {
-          int tag = input.readTag();
-          switch (tag) {
-            case 0:
-              done = true;
-              break;
-            case 10: {
-              com.google.protobuf.ByteString bs = input.readBytes();
-              bitField0_ |= 0x00000001;
-              key_ = bs;
-              break;
-            }
-            case 17: {
-              bitField0_ |= 0x00000002;
-              value_ = input.readDouble();
-              break;
-            }
-            case 24: {
-              bitField0_ |= 0x00000004;
-              timestamp_ = input.readInt64();
-              break;
-            }
-            case 32: {
-              bitField0_ |= 0x00000008;
-              step_ = input.readInt64();
-              break;
-            }
-            case 42: {
-              com.google.protobuf.ByteString bs = input.readBytes();
-              bitField0_ |= 0x00000010;
-              runId_ = bs;
-              break;
-            }
-            default: {
-              if (!parseUnknownField(
-                  input, unknownFields, extensionRegistry, tag)) {
-                done = true;
-              }
-              break;
-            }
-          }
-        }
-      } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-        throw e.setUnfinishedMessage(this);
-      } catch (java.io.IOException e) {
-        throw new com.google.protobuf.InvalidProtocolBufferException(
-            e).setUnfinishedMessage(this);
-      } finally {
-        this.unknownFields = unknownFields.build();
-        makeExtensionsImmutable();
-      }
-    }
-    public static final com.google.protobuf.Descriptors.Descriptor
-        getDescriptor() {
-      return org.mlflow.api.proto.Service.internal_static_mlflow_MetricWithRunId_descriptor;
-    }
-
-    @java.lang.Override
-    protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
-        internalGetFieldAccessorTable() {
-      return org.mlflow.api.proto.Service.internal_static_mlflow_MetricWithRunId_fieldAccessorTable
-          .ensureFieldAccessorsInitialized(
-              org.mlflow.api.proto.Service.MetricWithRunId.class, org.mlflow.api.proto.Service.MetricWithRunId.Builder.class);
+    public com.google.protobuf.ByteString
+        getRunIdsBytes(int index) {
+      return runIds_.getByteString(index);
     }
 
-    private int bitField0_;
-    public static final int KEY_FIELD_NUMBER = 1;
-    private volatile java.lang.Object key_;
+    public static final int METRIC_KEY_FIELD_NUMBER = 2;
+    private volatile java.lang.Object metricKey_;
     /**
      * <pre>
-     * Key identifying this metric.
+     * Name of the metric.
      * </pre>
      *
-     * <code>optional string key = 1;</code>
-     * @return Whether the key field is set.
+     * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+     * @return Whether the metricKey field is set.
      */
     @java.lang.Override
-    public boolean hasKey() {
+    public boolean hasMetricKey() {
       return ((bitField0_ & 0x00000001) != 0);
     }
     /**
      * <pre>
-     * Key identifying this metric.
+     * Name of the metric.
      * </pre>
      *
-     * <code>optional string key = 1;</code>
-     * @return The key.
+     * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+     * @return The metricKey.
      */
     @java.lang.Override
-    public java.lang.String getKey() {
-      java.lang.Object ref = key_;
+    public java.lang.String getMetricKey() {
+      java.lang.Object ref = metricKey_;
       if (ref instanceof java.lang.String) {
         return (java.lang.String) ref;
       } else {
@@ -52777,173 +56384,121 @@ public final class Service {
             (com.google.protobuf.ByteString) ref;
         java.lang.String s = bs.toStringUtf8();
         if (bs.isValidUtf8()) {
-          key_ = s;
+          metricKey_ = s;
         }
         return s;
       }
     }
     /**
      * <pre>
-     * Key identifying this metric.
+     * Name of the metric.
      * </pre>
      *
-     * <code>optional string key = 1;</code>
-     * @return The bytes for key.
+     * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+     * @return The bytes for metricKey.
      */
     @java.lang.Override
     public com.google.protobuf.ByteString
-        getKeyBytes() {
-      java.lang.Object ref = key_;
+        getMetricKeyBytes() {
+      java.lang.Object ref = metricKey_;
       if (ref instanceof java.lang.String) {
         com.google.protobuf.ByteString b = 
             com.google.protobuf.ByteString.copyFromUtf8(
                 (java.lang.String) ref);
-        key_ = b;
+        metricKey_ = b;
         return b;
       } else {
         return (com.google.protobuf.ByteString) ref;
       }
     }
 
-    public static final int VALUE_FIELD_NUMBER = 2;
-    private double value_;
+    public static final int START_STEP_FIELD_NUMBER = 3;
+    private int startStep_;
     /**
      * <pre>
-     * Value associated with this metric.
+     * Optional start step to only fetch metrics after the specified step. Must be defined if
+     * end_step is defined.
      * </pre>
      *
-     * <code>optional double value = 2;</code>
-     * @return Whether the value field is set.
+     * <code>optional int32 start_step = 3;</code>
+     * @return Whether the startStep field is set.
      */
     @java.lang.Override
-    public boolean hasValue() {
+    public boolean hasStartStep() {
       return ((bitField0_ & 0x00000002) != 0);
     }
     /**
      * <pre>
-     * Value associated with this metric.
+     * Optional start step to only fetch metrics after the specified step. Must be defined if
+     * end_step is defined.
      * </pre>
      *
-     * <code>optional double value = 2;</code>
-     * @return The value.
+     * <code>optional int32 start_step = 3;</code>
+     * @return The startStep.
      */
     @java.lang.Override
-    public double getValue() {
-      return value_;
+    public int getStartStep() {
+      return startStep_;
     }
 
-    public static final int TIMESTAMP_FIELD_NUMBER = 3;
-    private long timestamp_;
+    public static final int END_STEP_FIELD_NUMBER = 4;
+    private int endStep_;
     /**
      * <pre>
-     * The timestamp at which this metric was recorded.
+     * Optional end step to only fetch metrics before the specified step. Must be defined if
+     * start_step is defined.
      * </pre>
      *
-     * <code>optional int64 timestamp = 3;</code>
-     * @return Whether the timestamp field is set.
+     * <code>optional int32 end_step = 4;</code>
+     * @return Whether the endStep field is set.
      */
     @java.lang.Override
-    public boolean hasTimestamp() {
+    public boolean hasEndStep() {
       return ((bitField0_ & 0x00000004) != 0);
     }
     /**
      * <pre>
-     * The timestamp at which this metric was recorded.
+     * Optional end step to only fetch metrics before the specified step. Must be defined if
+     * start_step is defined.
      * </pre>
      *
-     * <code>optional int64 timestamp = 3;</code>
-     * @return The timestamp.
+     * <code>optional int32 end_step = 4;</code>
+     * @return The endStep.
      */
     @java.lang.Override
-    public long getTimestamp() {
-      return timestamp_;
+    public int getEndStep() {
+      return endStep_;
     }
 
-    public static final int STEP_FIELD_NUMBER = 4;
-    private long step_;
+    public static final int MAX_RESULTS_FIELD_NUMBER = 5;
+    private int maxResults_;
     /**
      * <pre>
-     * Step at which to log the metric.
+     * Maximum number of results to fetch per run specified. Must be set to a positive number.
+     * Note, in reality, the API returns at most (max_results + # of run IDs) x (# run IDs) metric
+     * data points.
      * </pre>
      *
-     * <code>optional int64 step = 4 [default = 0];</code>
-     * @return Whether the step field is set.
+     * <code>optional int32 max_results = 5;</code>
+     * @return Whether the maxResults field is set.
      */
     @java.lang.Override
-    public boolean hasStep() {
+    public boolean hasMaxResults() {
       return ((bitField0_ & 0x00000008) != 0);
     }
     /**
      * <pre>
-     * Step at which to log the metric.
-     * </pre>
-     *
-     * <code>optional int64 step = 4 [default = 0];</code>
-     * @return The step.
-     */
-    @java.lang.Override
-    public long getStep() {
-      return step_;
-    }
-
-    public static final int RUN_ID_FIELD_NUMBER = 5;
-    private volatile java.lang.Object runId_;
-    /**
-     * <pre>
-     * The ID of the run containing the metric
-     * </pre>
-     *
-     * <code>optional string run_id = 5;</code>
-     * @return Whether the runId field is set.
-     */
-    @java.lang.Override
-    public boolean hasRunId() {
-      return ((bitField0_ & 0x00000010) != 0);
-    }
-    /**
-     * <pre>
-     * The ID of the run containing the metric
-     * </pre>
-     *
-     * <code>optional string run_id = 5;</code>
-     * @return The runId.
-     */
-    @java.lang.Override
-    public java.lang.String getRunId() {
-      java.lang.Object ref = runId_;
-      if (ref instanceof java.lang.String) {
-        return (java.lang.String) ref;
-      } else {
-        com.google.protobuf.ByteString bs = 
-            (com.google.protobuf.ByteString) ref;
-        java.lang.String s = bs.toStringUtf8();
-        if (bs.isValidUtf8()) {
-          runId_ = s;
-        }
-        return s;
-      }
-    }
-    /**
-     * <pre>
-     * The ID of the run containing the metric
+     * Maximum number of results to fetch per run specified. Must be set to a positive number.
+     * Note, in reality, the API returns at most (max_results + # of run IDs) x (# run IDs) metric
+     * data points.
      * </pre>
      *
-     * <code>optional string run_id = 5;</code>
-     * @return The bytes for runId.
+     * <code>optional int32 max_results = 5;</code>
+     * @return The maxResults.
      */
     @java.lang.Override
-    public com.google.protobuf.ByteString
-        getRunIdBytes() {
-      java.lang.Object ref = runId_;
-      if (ref instanceof java.lang.String) {
-        com.google.protobuf.ByteString b = 
-            com.google.protobuf.ByteString.copyFromUtf8(
-                (java.lang.String) ref);
-        runId_ = b;
-        return b;
-      } else {
-        return (com.google.protobuf.ByteString) ref;
-      }
+    public int getMaxResults() {
+      return maxResults_;
     }
 
     private byte memoizedIsInitialized = -1;
@@ -52960,20 +56515,20 @@ public final class Service {
     @java.lang.Override
     public void writeTo(com.google.protobuf.CodedOutputStream output)
                         throws java.io.IOException {
+      for (int i = 0; i < runIds_.size(); i++) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 1, runIds_.getRaw(i));
+      }
       if (((bitField0_ & 0x00000001) != 0)) {
-        com.google.protobuf.GeneratedMessageV3.writeString(output, 1, key_);
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 2, metricKey_);
       }
       if (((bitField0_ & 0x00000002) != 0)) {
-        output.writeDouble(2, value_);
+        output.writeInt32(3, startStep_);
       }
       if (((bitField0_ & 0x00000004) != 0)) {
-        output.writeInt64(3, timestamp_);
+        output.writeInt32(4, endStep_);
       }
       if (((bitField0_ & 0x00000008) != 0)) {
-        output.writeInt64(4, step_);
-      }
-      if (((bitField0_ & 0x00000010) != 0)) {
-        com.google.protobuf.GeneratedMessageV3.writeString(output, 5, runId_);
+        output.writeInt32(5, maxResults_);
       }
       unknownFields.writeTo(output);
     }
@@ -52984,23 +56539,28 @@ public final class Service {
       if (size != -1) return size;
 
       size = 0;
+      {
+        int dataSize = 0;
+        for (int i = 0; i < runIds_.size(); i++) {
+          dataSize += computeStringSizeNoTag(runIds_.getRaw(i));
+        }
+        size += dataSize;
+        size += 1 * getRunIdsList().size();
+      }
       if (((bitField0_ & 0x00000001) != 0)) {
-        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(1, key_);
+        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(2, metricKey_);
       }
       if (((bitField0_ & 0x00000002) != 0)) {
         size += com.google.protobuf.CodedOutputStream
-          .computeDoubleSize(2, value_);
+          .computeInt32Size(3, startStep_);
       }
       if (((bitField0_ & 0x00000004) != 0)) {
         size += com.google.protobuf.CodedOutputStream
-          .computeInt64Size(3, timestamp_);
+          .computeInt32Size(4, endStep_);
       }
       if (((bitField0_ & 0x00000008) != 0)) {
         size += com.google.protobuf.CodedOutputStream
-          .computeInt64Size(4, step_);
-      }
-      if (((bitField0_ & 0x00000010) != 0)) {
-        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(5, runId_);
+          .computeInt32Size(5, maxResults_);
       }
       size += unknownFields.getSerializedSize();
       memoizedSize = size;
@@ -53012,36 +56572,32 @@ public final class Service {
       if (obj == this) {
        return true;
       }
-      if (!(obj instanceof org.mlflow.api.proto.Service.MetricWithRunId)) {
+      if (!(obj instanceof org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval)) {
         return super.equals(obj);
       }
-      org.mlflow.api.proto.Service.MetricWithRunId other = (org.mlflow.api.proto.Service.MetricWithRunId) obj;
+      org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval other = (org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval) obj;
 
-      if (hasKey() != other.hasKey()) return false;
-      if (hasKey()) {
-        if (!getKey()
-            .equals(other.getKey())) return false;
-      }
-      if (hasValue() != other.hasValue()) return false;
-      if (hasValue()) {
-        if (java.lang.Double.doubleToLongBits(getValue())
-            != java.lang.Double.doubleToLongBits(
-                other.getValue())) return false;
+      if (!getRunIdsList()
+          .equals(other.getRunIdsList())) return false;
+      if (hasMetricKey() != other.hasMetricKey()) return false;
+      if (hasMetricKey()) {
+        if (!getMetricKey()
+            .equals(other.getMetricKey())) return false;
       }
-      if (hasTimestamp() != other.hasTimestamp()) return false;
-      if (hasTimestamp()) {
-        if (getTimestamp()
-            != other.getTimestamp()) return false;
+      if (hasStartStep() != other.hasStartStep()) return false;
+      if (hasStartStep()) {
+        if (getStartStep()
+            != other.getStartStep()) return false;
       }
-      if (hasStep() != other.hasStep()) return false;
-      if (hasStep()) {
-        if (getStep()
-            != other.getStep()) return false;
+      if (hasEndStep() != other.hasEndStep()) return false;
+      if (hasEndStep()) {
+        if (getEndStep()
+            != other.getEndStep()) return false;
       }
-      if (hasRunId() != other.hasRunId()) return false;
-      if (hasRunId()) {
-        if (!getRunId()
-            .equals(other.getRunId())) return false;
+      if (hasMaxResults() != other.hasMaxResults()) return false;
+      if (hasMaxResults()) {
+        if (getMaxResults()
+            != other.getMaxResults()) return false;
       }
       if (!unknownFields.equals(other.unknownFields)) return false;
       return true;
@@ -53054,97 +56610,94 @@ public final class Service {
       }
       int hash = 41;
       hash = (19 * hash) + getDescriptor().hashCode();
-      if (hasKey()) {
-        hash = (37 * hash) + KEY_FIELD_NUMBER;
-        hash = (53 * hash) + getKey().hashCode();
+      if (getRunIdsCount() > 0) {
+        hash = (37 * hash) + RUN_IDS_FIELD_NUMBER;
+        hash = (53 * hash) + getRunIdsList().hashCode();
       }
-      if (hasValue()) {
-        hash = (37 * hash) + VALUE_FIELD_NUMBER;
-        hash = (53 * hash) + com.google.protobuf.Internal.hashLong(
-            java.lang.Double.doubleToLongBits(getValue()));
+      if (hasMetricKey()) {
+        hash = (37 * hash) + METRIC_KEY_FIELD_NUMBER;
+        hash = (53 * hash) + getMetricKey().hashCode();
       }
-      if (hasTimestamp()) {
-        hash = (37 * hash) + TIMESTAMP_FIELD_NUMBER;
-        hash = (53 * hash) + com.google.protobuf.Internal.hashLong(
-            getTimestamp());
+      if (hasStartStep()) {
+        hash = (37 * hash) + START_STEP_FIELD_NUMBER;
+        hash = (53 * hash) + getStartStep();
       }
-      if (hasStep()) {
-        hash = (37 * hash) + STEP_FIELD_NUMBER;
-        hash = (53 * hash) + com.google.protobuf.Internal.hashLong(
-            getStep());
+      if (hasEndStep()) {
+        hash = (37 * hash) + END_STEP_FIELD_NUMBER;
+        hash = (53 * hash) + getEndStep();
       }
-      if (hasRunId()) {
-        hash = (37 * hash) + RUN_ID_FIELD_NUMBER;
-        hash = (53 * hash) + getRunId().hashCode();
+      if (hasMaxResults()) {
+        hash = (37 * hash) + MAX_RESULTS_FIELD_NUMBER;
+        hash = (53 * hash) + getMaxResults();
       }
       hash = (29 * hash) + unknownFields.hashCode();
       memoizedHashCode = hash;
       return hash;
     }
 
-    public static org.mlflow.api.proto.Service.MetricWithRunId parseFrom(
+    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseFrom(
         java.nio.ByteBuffer data)
         throws com.google.protobuf.InvalidProtocolBufferException {
       return PARSER.parseFrom(data);
     }
-    public static org.mlflow.api.proto.Service.MetricWithRunId parseFrom(
+    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseFrom(
         java.nio.ByteBuffer data,
         com.google.protobuf.ExtensionRegistryLite extensionRegistry)
         throws com.google.protobuf.InvalidProtocolBufferException {
       return PARSER.parseFrom(data, extensionRegistry);
     }
-    public static org.mlflow.api.proto.Service.MetricWithRunId parseFrom(
+    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseFrom(
         com.google.protobuf.ByteString data)
         throws com.google.protobuf.InvalidProtocolBufferException {
       return PARSER.parseFrom(data);
     }
-    public static org.mlflow.api.proto.Service.MetricWithRunId parseFrom(
+    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseFrom(
         com.google.protobuf.ByteString data,
         com.google.protobuf.ExtensionRegistryLite extensionRegistry)
         throws com.google.protobuf.InvalidProtocolBufferException {
       return PARSER.parseFrom(data, extensionRegistry);
     }
-    public static org.mlflow.api.proto.Service.MetricWithRunId parseFrom(byte[] data)
+    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseFrom(byte[] data)
         throws com.google.protobuf.InvalidProtocolBufferException {
       return PARSER.parseFrom(data);
     }
-    public static org.mlflow.api.proto.Service.MetricWithRunId parseFrom(
+    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseFrom(
         byte[] data,
         com.google.protobuf.ExtensionRegistryLite extensionRegistry)
         throws com.google.protobuf.InvalidProtocolBufferException {
       return PARSER.parseFrom(data, extensionRegistry);
     }
-    public static org.mlflow.api.proto.Service.MetricWithRunId parseFrom(java.io.InputStream input)
+    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseFrom(java.io.InputStream input)
         throws java.io.IOException {
       return com.google.protobuf.GeneratedMessageV3
           .parseWithIOException(PARSER, input);
     }
-    public static org.mlflow.api.proto.Service.MetricWithRunId parseFrom(
+    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseFrom(
         java.io.InputStream input,
         com.google.protobuf.ExtensionRegistryLite extensionRegistry)
         throws java.io.IOException {
       return com.google.protobuf.GeneratedMessageV3
           .parseWithIOException(PARSER, input, extensionRegistry);
     }
-    public static org.mlflow.api.proto.Service.MetricWithRunId parseDelimitedFrom(java.io.InputStream input)
+    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseDelimitedFrom(java.io.InputStream input)
         throws java.io.IOException {
       return com.google.protobuf.GeneratedMessageV3
           .parseDelimitedWithIOException(PARSER, input);
     }
-    public static org.mlflow.api.proto.Service.MetricWithRunId parseDelimitedFrom(
+    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseDelimitedFrom(
         java.io.InputStream input,
         com.google.protobuf.ExtensionRegistryLite extensionRegistry)
         throws java.io.IOException {
       return com.google.protobuf.GeneratedMessageV3
           .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
     }
-    public static org.mlflow.api.proto.Service.MetricWithRunId parseFrom(
+    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseFrom(
         com.google.protobuf.CodedInputStream input)
         throws java.io.IOException {
       return com.google.protobuf.GeneratedMessageV3
           .parseWithIOException(PARSER, input);
     }
-    public static org.mlflow.api.proto.Service.MetricWithRunId parseFrom(
+    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseFrom(
         com.google.protobuf.CodedInputStream input,
         com.google.protobuf.ExtensionRegistryLite extensionRegistry)
         throws java.io.IOException {
@@ -53157,7 +56710,7 @@ public final class Service {
     public static Builder newBuilder() {
       return DEFAULT_INSTANCE.toBuilder();
     }
-    public static Builder newBuilder(org.mlflow.api.proto.Service.MetricWithRunId prototype) {
+    public static Builder newBuilder(org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval prototype) {
       return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
     }
     @java.lang.Override
@@ -53173,26 +56726,26 @@ public final class Service {
       return builder;
     }
     /**
-     * Protobuf type {@code mlflow.MetricWithRunId}
+     * Protobuf type {@code mlflow.GetMetricHistoryBulkInterval}
      */
     public static final class Builder extends
         com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
-        // @@protoc_insertion_point(builder_implements:mlflow.MetricWithRunId)
-        org.mlflow.api.proto.Service.MetricWithRunIdOrBuilder {
+        // @@protoc_insertion_point(builder_implements:mlflow.GetMetricHistoryBulkInterval)
+        org.mlflow.api.proto.Service.GetMetricHistoryBulkIntervalOrBuilder {
       public static final com.google.protobuf.Descriptors.Descriptor
           getDescriptor() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_MetricWithRunId_descriptor;
+        return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistoryBulkInterval_descriptor;
       }
 
       @java.lang.Override
       protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
           internalGetFieldAccessorTable() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_MetricWithRunId_fieldAccessorTable
+        return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistoryBulkInterval_fieldAccessorTable
             .ensureFieldAccessorsInitialized(
-                org.mlflow.api.proto.Service.MetricWithRunId.class, org.mlflow.api.proto.Service.MetricWithRunId.Builder.class);
+                org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.class, org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Builder.class);
       }
 
-      // Construct using org.mlflow.api.proto.Service.MetricWithRunId.newBuilder()
+      // Construct using org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.newBuilder()
       private Builder() {
         maybeForceBuilderInitialization();
       }
@@ -53210,15 +56763,15 @@ public final class Service {
       @java.lang.Override
       public Builder clear() {
         super.clear();
-        key_ = "";
+        runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
         bitField0_ = (bitField0_ & ~0x00000001);
-        value_ = 0D;
+        metricKey_ = "";
         bitField0_ = (bitField0_ & ~0x00000002);
-        timestamp_ = 0L;
+        startStep_ = 0;
         bitField0_ = (bitField0_ & ~0x00000004);
-        step_ = 0L;
+        endStep_ = 0;
         bitField0_ = (bitField0_ & ~0x00000008);
-        runId_ = "";
+        maxResults_ = 0;
         bitField0_ = (bitField0_ & ~0x00000010);
         return this;
       }
@@ -53226,17 +56779,17 @@ public final class Service {
       @java.lang.Override
       public com.google.protobuf.Descriptors.Descriptor
           getDescriptorForType() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_MetricWithRunId_descriptor;
+        return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistoryBulkInterval_descriptor;
       }
 
       @java.lang.Override
-      public org.mlflow.api.proto.Service.MetricWithRunId getDefaultInstanceForType() {
-        return org.mlflow.api.proto.Service.MetricWithRunId.getDefaultInstance();
+      public org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval getDefaultInstanceForType() {
+        return org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.getDefaultInstance();
       }
 
       @java.lang.Override
-      public org.mlflow.api.proto.Service.MetricWithRunId build() {
-        org.mlflow.api.proto.Service.MetricWithRunId result = buildPartial();
+      public org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval build() {
+        org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval result = buildPartial();
         if (!result.isInitialized()) {
           throw newUninitializedMessageException(result);
         }
@@ -53244,30 +56797,31 @@ public final class Service {
       }
 
       @java.lang.Override
-      public org.mlflow.api.proto.Service.MetricWithRunId buildPartial() {
-        org.mlflow.api.proto.Service.MetricWithRunId result = new org.mlflow.api.proto.Service.MetricWithRunId(this);
+      public org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval buildPartial() {
+        org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval result = new org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval(this);
         int from_bitField0_ = bitField0_;
         int to_bitField0_ = 0;
-        if (((from_bitField0_ & 0x00000001) != 0)) {
-          to_bitField0_ |= 0x00000001;
+        if (((bitField0_ & 0x00000001) != 0)) {
+          runIds_ = runIds_.getUnmodifiableView();
+          bitField0_ = (bitField0_ & ~0x00000001);
         }
-        result.key_ = key_;
+        result.runIds_ = runIds_;
         if (((from_bitField0_ & 0x00000002) != 0)) {
-          result.value_ = value_;
-          to_bitField0_ |= 0x00000002;
+          to_bitField0_ |= 0x00000001;
         }
+        result.metricKey_ = metricKey_;
         if (((from_bitField0_ & 0x00000004) != 0)) {
-          result.timestamp_ = timestamp_;
-          to_bitField0_ |= 0x00000004;
+          result.startStep_ = startStep_;
+          to_bitField0_ |= 0x00000002;
         }
         if (((from_bitField0_ & 0x00000008) != 0)) {
-          result.step_ = step_;
-          to_bitField0_ |= 0x00000008;
+          result.endStep_ = endStep_;
+          to_bitField0_ |= 0x00000004;
         }
         if (((from_bitField0_ & 0x00000010) != 0)) {
-          to_bitField0_ |= 0x00000010;
+          result.maxResults_ = maxResults_;
+          to_bitField0_ |= 0x00000008;
         }
-        result.runId_ = runId_;
         result.bitField0_ = to_bitField0_;
         onBuilt();
         return result;
@@ -53307,34 +56861,39 @@ public final class Service {
       }
       @java.lang.Override
       public Builder mergeFrom(com.google.protobuf.Message other) {
-        if (other instanceof org.mlflow.api.proto.Service.MetricWithRunId) {
-          return mergeFrom((org.mlflow.api.proto.Service.MetricWithRunId)other);
+        if (other instanceof org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval) {
+          return mergeFrom((org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval)other);
         } else {
           super.mergeFrom(other);
           return this;
         }
       }
 
-      public Builder mergeFrom(org.mlflow.api.proto.Service.MetricWithRunId other) {
-        if (other == org.mlflow.api.proto.Service.MetricWithRunId.getDefaultInstance()) return this;
-        if (other.hasKey()) {
-          bitField0_ |= 0x00000001;
-          key_ = other.key_;
+      public Builder mergeFrom(org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval other) {
+        if (other == org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.getDefaultInstance()) return this;
+        if (!other.runIds_.isEmpty()) {
+          if (runIds_.isEmpty()) {
+            runIds_ = other.runIds_;
+            bitField0_ = (bitField0_ & ~0x00000001);
+          } else {
+            ensureRunIdsIsMutable();
+            runIds_.addAll(other.runIds_);
+          }
           onChanged();
         }
-        if (other.hasValue()) {
-          setValue(other.getValue());
+        if (other.hasMetricKey()) {
+          bitField0_ |= 0x00000002;
+          metricKey_ = other.metricKey_;
+          onChanged();
         }
-        if (other.hasTimestamp()) {
-          setTimestamp(other.getTimestamp());
+        if (other.hasStartStep()) {
+          setStartStep(other.getStartStep());
         }
-        if (other.hasStep()) {
-          setStep(other.getStep());
+        if (other.hasEndStep()) {
+          setEndStep(other.getEndStep());
         }
-        if (other.hasRunId()) {
-          bitField0_ |= 0x00000010;
-          runId_ = other.runId_;
-          onChanged();
+        if (other.hasMaxResults()) {
+          setMaxResults(other.getMaxResults());
         }
         this.mergeUnknownFields(other.unknownFields);
         onChanged();
@@ -53351,11 +56910,11 @@ public final class Service {
           com.google.protobuf.CodedInputStream input,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws java.io.IOException {
-        org.mlflow.api.proto.Service.MetricWithRunId parsedMessage = null;
+        org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parsedMessage = null;
         try {
           parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
         } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-          parsedMessage = (org.mlflow.api.proto.Service.MetricWithRunId) e.getUnfinishedMessage();
+          parsedMessage = (org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval) e.getUnfinishedMessage();
           throw e.unwrapIOException();
         } finally {
           if (parsedMessage != null) {
@@ -53366,383 +56925,436 @@ public final class Service {
       }
       private int bitField0_;
 
-      private java.lang.Object key_ = "";
+      private com.google.protobuf.LazyStringList runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+      private void ensureRunIdsIsMutable() {
+        if (!((bitField0_ & 0x00000001) != 0)) {
+          runIds_ = new com.google.protobuf.LazyStringArrayList(runIds_);
+          bitField0_ |= 0x00000001;
+         }
+      }
       /**
        * <pre>
-       * Key identifying this metric.
+       * ID(s) of the run(s) from which to fetch metric values. Must be provided.
        * </pre>
        *
-       * <code>optional string key = 1;</code>
-       * @return Whether the key field is set.
+       * <code>repeated string run_ids = 1;</code>
+       * @return A list containing the runIds.
        */
-      public boolean hasKey() {
-        return ((bitField0_ & 0x00000001) != 0);
+      public com.google.protobuf.ProtocolStringList
+          getRunIdsList() {
+        return runIds_.getUnmodifiableView();
       }
       /**
        * <pre>
-       * Key identifying this metric.
+       * ID(s) of the run(s) from which to fetch metric values. Must be provided.
        * </pre>
        *
-       * <code>optional string key = 1;</code>
-       * @return The key.
+       * <code>repeated string run_ids = 1;</code>
+       * @return The count of runIds.
        */
-      public java.lang.String getKey() {
-        java.lang.Object ref = key_;
-        if (!(ref instanceof java.lang.String)) {
-          com.google.protobuf.ByteString bs =
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            key_ = s;
-          }
-          return s;
-        } else {
-          return (java.lang.String) ref;
-        }
+      public int getRunIdsCount() {
+        return runIds_.size();
       }
       /**
        * <pre>
-       * Key identifying this metric.
+       * ID(s) of the run(s) from which to fetch metric values. Must be provided.
        * </pre>
        *
-       * <code>optional string key = 1;</code>
-       * @return The bytes for key.
+       * <code>repeated string run_ids = 1;</code>
+       * @param index The index of the element to return.
+       * @return The runIds at the given index.
+       */
+      public java.lang.String getRunIds(int index) {
+        return runIds_.get(index);
+      }
+      /**
+       * <pre>
+       * ID(s) of the run(s) from which to fetch metric values. Must be provided.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       * @param index The index of the value to return.
+       * @return The bytes of the runIds at the given index.
        */
       public com.google.protobuf.ByteString
-          getKeyBytes() {
-        java.lang.Object ref = key_;
-        if (ref instanceof String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          key_ = b;
-          return b;
-        } else {
-          return (com.google.protobuf.ByteString) ref;
-        }
+          getRunIdsBytes(int index) {
+        return runIds_.getByteString(index);
       }
       /**
        * <pre>
-       * Key identifying this metric.
+       * ID(s) of the run(s) from which to fetch metric values. Must be provided.
        * </pre>
        *
-       * <code>optional string key = 1;</code>
-       * @param value The key to set.
+       * <code>repeated string run_ids = 1;</code>
+       * @param index The index to set the value at.
+       * @param value The runIds to set.
        * @return This builder for chaining.
        */
-      public Builder setKey(
+      public Builder setRunIds(
+          int index, java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureRunIdsIsMutable();
+        runIds_.set(index, value);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * ID(s) of the run(s) from which to fetch metric values. Must be provided.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       * @param value The runIds to add.
+       * @return This builder for chaining.
+       */
+      public Builder addRunIds(
           java.lang.String value) {
         if (value == null) {
     throw new NullPointerException();
   }
-  bitField0_ |= 0x00000001;
-        key_ = value;
+  ensureRunIdsIsMutable();
+        runIds_.add(value);
         onChanged();
         return this;
       }
       /**
        * <pre>
-       * Key identifying this metric.
+       * ID(s) of the run(s) from which to fetch metric values. Must be provided.
        * </pre>
        *
-       * <code>optional string key = 1;</code>
+       * <code>repeated string run_ids = 1;</code>
+       * @param values The runIds to add.
        * @return This builder for chaining.
        */
-      public Builder clearKey() {
+      public Builder addAllRunIds(
+          java.lang.Iterable<java.lang.String> values) {
+        ensureRunIdsIsMutable();
+        com.google.protobuf.AbstractMessageLite.Builder.addAll(
+            values, runIds_);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * ID(s) of the run(s) from which to fetch metric values. Must be provided.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearRunIds() {
+        runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
         bitField0_ = (bitField0_ & ~0x00000001);
-        key_ = getDefaultInstance().getKey();
         onChanged();
         return this;
       }
       /**
        * <pre>
-       * Key identifying this metric.
+       * ID(s) of the run(s) from which to fetch metric values. Must be provided.
        * </pre>
        *
-       * <code>optional string key = 1;</code>
-       * @param value The bytes for key to set.
+       * <code>repeated string run_ids = 1;</code>
+       * @param value The bytes of the runIds to add.
        * @return This builder for chaining.
        */
-      public Builder setKeyBytes(
+      public Builder addRunIdsBytes(
           com.google.protobuf.ByteString value) {
         if (value == null) {
     throw new NullPointerException();
   }
-  bitField0_ |= 0x00000001;
-        key_ = value;
+  ensureRunIdsIsMutable();
+        runIds_.add(value);
         onChanged();
         return this;
       }
 
-      private double value_ ;
+      private java.lang.Object metricKey_ = "";
       /**
        * <pre>
-       * Value associated with this metric.
+       * Name of the metric.
        * </pre>
        *
-       * <code>optional double value = 2;</code>
-       * @return Whether the value field is set.
+       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+       * @return Whether the metricKey field is set.
        */
-      @java.lang.Override
-      public boolean hasValue() {
+      public boolean hasMetricKey() {
         return ((bitField0_ & 0x00000002) != 0);
       }
       /**
        * <pre>
-       * Value associated with this metric.
+       * Name of the metric.
        * </pre>
        *
-       * <code>optional double value = 2;</code>
-       * @return The value.
+       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+       * @return The metricKey.
        */
-      @java.lang.Override
-      public double getValue() {
-        return value_;
+      public java.lang.String getMetricKey() {
+        java.lang.Object ref = metricKey_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            metricKey_ = s;
+          }
+          return s;
+        } else {
+          return (java.lang.String) ref;
+        }
       }
       /**
        * <pre>
-       * Value associated with this metric.
+       * Name of the metric.
        * </pre>
        *
-       * <code>optional double value = 2;</code>
-       * @param value The value to set.
+       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+       * @return The bytes for metricKey.
+       */
+      public com.google.protobuf.ByteString
+          getMetricKeyBytes() {
+        java.lang.Object ref = metricKey_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          metricKey_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
+      }
+      /**
+       * <pre>
+       * Name of the metric.
+       * </pre>
+       *
+       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+       * @param value The metricKey to set.
        * @return This builder for chaining.
        */
-      public Builder setValue(double value) {
-        bitField0_ |= 0x00000002;
-        value_ = value;
+      public Builder setMetricKey(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000002;
+        metricKey_ = value;
         onChanged();
         return this;
       }
       /**
        * <pre>
-       * Value associated with this metric.
+       * Name of the metric.
        * </pre>
        *
-       * <code>optional double value = 2;</code>
+       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
        * @return This builder for chaining.
        */
-      public Builder clearValue() {
+      public Builder clearMetricKey() {
         bitField0_ = (bitField0_ & ~0x00000002);
-        value_ = 0D;
+        metricKey_ = getDefaultInstance().getMetricKey();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Name of the metric.
+       * </pre>
+       *
+       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+       * @param value The bytes for metricKey to set.
+       * @return This builder for chaining.
+       */
+      public Builder setMetricKeyBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000002;
+        metricKey_ = value;
         onChanged();
         return this;
       }
 
-      private long timestamp_ ;
+      private int startStep_ ;
       /**
        * <pre>
-       * The timestamp at which this metric was recorded.
+       * Optional start step to only fetch metrics after the specified step. Must be defined if
+       * end_step is defined.
        * </pre>
        *
-       * <code>optional int64 timestamp = 3;</code>
-       * @return Whether the timestamp field is set.
+       * <code>optional int32 start_step = 3;</code>
+       * @return Whether the startStep field is set.
        */
       @java.lang.Override
-      public boolean hasTimestamp() {
+      public boolean hasStartStep() {
         return ((bitField0_ & 0x00000004) != 0);
       }
       /**
        * <pre>
-       * The timestamp at which this metric was recorded.
+       * Optional start step to only fetch metrics after the specified step. Must be defined if
+       * end_step is defined.
        * </pre>
        *
-       * <code>optional int64 timestamp = 3;</code>
-       * @return The timestamp.
+       * <code>optional int32 start_step = 3;</code>
+       * @return The startStep.
        */
       @java.lang.Override
-      public long getTimestamp() {
-        return timestamp_;
+      public int getStartStep() {
+        return startStep_;
       }
       /**
        * <pre>
-       * The timestamp at which this metric was recorded.
+       * Optional start step to only fetch metrics after the specified step. Must be defined if
+       * end_step is defined.
        * </pre>
        *
-       * <code>optional int64 timestamp = 3;</code>
-       * @param value The timestamp to set.
+       * <code>optional int32 start_step = 3;</code>
+       * @param value The startStep to set.
        * @return This builder for chaining.
        */
-      public Builder setTimestamp(long value) {
+      public Builder setStartStep(int value) {
         bitField0_ |= 0x00000004;
-        timestamp_ = value;
+        startStep_ = value;
         onChanged();
         return this;
       }
       /**
        * <pre>
-       * The timestamp at which this metric was recorded.
+       * Optional start step to only fetch metrics after the specified step. Must be defined if
+       * end_step is defined.
        * </pre>
        *
-       * <code>optional int64 timestamp = 3;</code>
+       * <code>optional int32 start_step = 3;</code>
        * @return This builder for chaining.
        */
-      public Builder clearTimestamp() {
+      public Builder clearStartStep() {
         bitField0_ = (bitField0_ & ~0x00000004);
-        timestamp_ = 0L;
+        startStep_ = 0;
         onChanged();
         return this;
       }
 
-      private long step_ ;
+      private int endStep_ ;
       /**
        * <pre>
-       * Step at which to log the metric.
+       * Optional end step to only fetch metrics before the specified step. Must be defined if
+       * start_step is defined.
        * </pre>
        *
-       * <code>optional int64 step = 4 [default = 0];</code>
-       * @return Whether the step field is set.
+       * <code>optional int32 end_step = 4;</code>
+       * @return Whether the endStep field is set.
        */
       @java.lang.Override
-      public boolean hasStep() {
+      public boolean hasEndStep() {
         return ((bitField0_ & 0x00000008) != 0);
       }
       /**
        * <pre>
-       * Step at which to log the metric.
+       * Optional end step to only fetch metrics before the specified step. Must be defined if
+       * start_step is defined.
        * </pre>
        *
-       * <code>optional int64 step = 4 [default = 0];</code>
-       * @return The step.
+       * <code>optional int32 end_step = 4;</code>
+       * @return The endStep.
        */
       @java.lang.Override
-      public long getStep() {
-        return step_;
+      public int getEndStep() {
+        return endStep_;
       }
       /**
        * <pre>
-       * Step at which to log the metric.
+       * Optional end step to only fetch metrics before the specified step. Must be defined if
+       * start_step is defined.
        * </pre>
        *
-       * <code>optional int64 step = 4 [default = 0];</code>
-       * @param value The step to set.
+       * <code>optional int32 end_step = 4;</code>
+       * @param value The endStep to set.
        * @return This builder for chaining.
        */
-      public Builder setStep(long value) {
+      public Builder setEndStep(int value) {
         bitField0_ |= 0x00000008;
-        step_ = value;
+        endStep_ = value;
         onChanged();
         return this;
       }
       /**
        * <pre>
-       * Step at which to log the metric.
+       * Optional end step to only fetch metrics before the specified step. Must be defined if
+       * start_step is defined.
        * </pre>
        *
-       * <code>optional int64 step = 4 [default = 0];</code>
+       * <code>optional int32 end_step = 4;</code>
        * @return This builder for chaining.
        */
-      public Builder clearStep() {
+      public Builder clearEndStep() {
         bitField0_ = (bitField0_ & ~0x00000008);
-        step_ = 0L;
+        endStep_ = 0;
         onChanged();
         return this;
       }
 
-      private java.lang.Object runId_ = "";
+      private int maxResults_ ;
       /**
        * <pre>
-       * The ID of the run containing the metric
+       * Maximum number of results to fetch per run specified. Must be set to a positive number.
+       * Note, in reality, the API returns at most (max_results + # of run IDs) x (# run IDs) metric
+       * data points.
        * </pre>
        *
-       * <code>optional string run_id = 5;</code>
-       * @return Whether the runId field is set.
+       * <code>optional int32 max_results = 5;</code>
+       * @return Whether the maxResults field is set.
        */
-      public boolean hasRunId() {
+      @java.lang.Override
+      public boolean hasMaxResults() {
         return ((bitField0_ & 0x00000010) != 0);
       }
       /**
        * <pre>
-       * The ID of the run containing the metric
-       * </pre>
-       *
-       * <code>optional string run_id = 5;</code>
-       * @return The runId.
-       */
-      public java.lang.String getRunId() {
-        java.lang.Object ref = runId_;
-        if (!(ref instanceof java.lang.String)) {
-          com.google.protobuf.ByteString bs =
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            runId_ = s;
-          }
-          return s;
-        } else {
-          return (java.lang.String) ref;
-        }
-      }
-      /**
-       * <pre>
-       * The ID of the run containing the metric
-       * </pre>
-       *
-       * <code>optional string run_id = 5;</code>
-       * @return The bytes for runId.
-       */
-      public com.google.protobuf.ByteString
-          getRunIdBytes() {
-        java.lang.Object ref = runId_;
-        if (ref instanceof String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          runId_ = b;
-          return b;
-        } else {
-          return (com.google.protobuf.ByteString) ref;
-        }
-      }
-      /**
-       * <pre>
-       * The ID of the run containing the metric
+       * Maximum number of results to fetch per run specified. Must be set to a positive number.
+       * Note, in reality, the API returns at most (max_results + # of run IDs) x (# run IDs) metric
+       * data points.
        * </pre>
        *
-       * <code>optional string run_id = 5;</code>
-       * @param value The runId to set.
-       * @return This builder for chaining.
+       * <code>optional int32 max_results = 5;</code>
+       * @return The maxResults.
        */
-      public Builder setRunId(
-          java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000010;
-        runId_ = value;
-        onChanged();
-        return this;
+      @java.lang.Override
+      public int getMaxResults() {
+        return maxResults_;
       }
       /**
        * <pre>
-       * The ID of the run containing the metric
+       * Maximum number of results to fetch per run specified. Must be set to a positive number.
+       * Note, in reality, the API returns at most (max_results + # of run IDs) x (# run IDs) metric
+       * data points.
        * </pre>
        *
-       * <code>optional string run_id = 5;</code>
+       * <code>optional int32 max_results = 5;</code>
+       * @param value The maxResults to set.
        * @return This builder for chaining.
        */
-      public Builder clearRunId() {
-        bitField0_ = (bitField0_ & ~0x00000010);
-        runId_ = getDefaultInstance().getRunId();
+      public Builder setMaxResults(int value) {
+        bitField0_ |= 0x00000010;
+        maxResults_ = value;
         onChanged();
         return this;
       }
       /**
        * <pre>
-       * The ID of the run containing the metric
+       * Maximum number of results to fetch per run specified. Must be set to a positive number.
+       * Note, in reality, the API returns at most (max_results + # of run IDs) x (# run IDs) metric
+       * data points.
        * </pre>
        *
-       * <code>optional string run_id = 5;</code>
-       * @param value The bytes for runId to set.
+       * <code>optional int32 max_results = 5;</code>
        * @return This builder for chaining.
        */
-      public Builder setRunIdBytes(
-          com.google.protobuf.ByteString value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000010;
-        runId_ = value;
+      public Builder clearMaxResults() {
+        bitField0_ = (bitField0_ & ~0x00000010);
+        maxResults_ = 0;
         onChanged();
         return this;
       }
@@ -53759,53 +57371,53 @@ public final class Service {
       }
 
 
-      // @@protoc_insertion_point(builder_scope:mlflow.MetricWithRunId)
+      // @@protoc_insertion_point(builder_scope:mlflow.GetMetricHistoryBulkInterval)
     }
 
-    // @@protoc_insertion_point(class_scope:mlflow.MetricWithRunId)
-    private static final org.mlflow.api.proto.Service.MetricWithRunId DEFAULT_INSTANCE;
+    // @@protoc_insertion_point(class_scope:mlflow.GetMetricHistoryBulkInterval)
+    private static final org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval DEFAULT_INSTANCE;
     static {
-      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.MetricWithRunId();
+      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval();
     }
 
-    public static org.mlflow.api.proto.Service.MetricWithRunId getDefaultInstance() {
+    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval getDefaultInstance() {
       return DEFAULT_INSTANCE;
     }
 
-    @java.lang.Deprecated public static final com.google.protobuf.Parser<MetricWithRunId>
-        PARSER = new com.google.protobuf.AbstractParser<MetricWithRunId>() {
+    @java.lang.Deprecated public static final com.google.protobuf.Parser<GetMetricHistoryBulkInterval>
+        PARSER = new com.google.protobuf.AbstractParser<GetMetricHistoryBulkInterval>() {
       @java.lang.Override
-      public MetricWithRunId parsePartialFrom(
+      public GetMetricHistoryBulkInterval parsePartialFrom(
           com.google.protobuf.CodedInputStream input,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws com.google.protobuf.InvalidProtocolBufferException {
-        return new MetricWithRunId(input, extensionRegistry);
+        return new GetMetricHistoryBulkInterval(input, extensionRegistry);
       }
     };
 
-    public static com.google.protobuf.Parser<MetricWithRunId> parser() {
+    public static com.google.protobuf.Parser<GetMetricHistoryBulkInterval> parser() {
       return PARSER;
     }
 
     @java.lang.Override
-    public com.google.protobuf.Parser<MetricWithRunId> getParserForType() {
+    public com.google.protobuf.Parser<GetMetricHistoryBulkInterval> getParserForType() {
       return PARSER;
     }
 
     @java.lang.Override
-    public org.mlflow.api.proto.Service.MetricWithRunId getDefaultInstanceForType() {
+    public org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval getDefaultInstanceForType() {
       return DEFAULT_INSTANCE;
     }
 
   }
 
-  public interface GetMetricHistoryBulkIntervalOrBuilder extends
-      // @@protoc_insertion_point(interface_extends:mlflow.GetMetricHistoryBulkInterval)
+  public interface ExportMetricsOrBuilder extends
+      // @@protoc_insertion_point(interface_extends:mlflow.ExportMetrics)
       com.google.protobuf.MessageOrBuilder {
 
     /**
      * <pre>
-     * ID(s) of the run(s) from which to fetch metric values. Must be provided.
+     * ID(s) of the run(s) whose metrics to export. Must be provided.
      * </pre>
      *
      * <code>repeated string run_ids = 1;</code>
@@ -53815,7 +57427,7 @@ public final class Service {
         getRunIdsList();
     /**
      * <pre>
-     * ID(s) of the run(s) from which to fetch metric values. Must be provided.
+     * ID(s) of the run(s) whose metrics to export. Must be provided.
      * </pre>
      *
      * <code>repeated string run_ids = 1;</code>
@@ -53824,7 +57436,7 @@ public final class Service {
     int getRunIdsCount();
     /**
      * <pre>
-     * ID(s) of the run(s) from which to fetch metric values. Must be provided.
+     * ID(s) of the run(s) whose metrics to export. Must be provided.
      * </pre>
      *
      * <code>repeated string run_ids = 1;</code>
@@ -53834,7 +57446,7 @@ public final class Service {
     java.lang.String getRunIds(int index);
     /**
      * <pre>
-     * ID(s) of the run(s) from which to fetch metric values. Must be provided.
+     * ID(s) of the run(s) whose metrics to export. Must be provided.
      * </pre>
      *
      * <code>repeated string run_ids = 1;</code>
@@ -53846,120 +57458,107 @@ public final class Service {
 
     /**
      * <pre>
-     * Name of the metric.
+     * Name(s) of the metric(s) to export. If empty, every metric logged to the runs is exported.
      * </pre>
      *
-     * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-     * @return Whether the metricKey field is set.
+     * <code>repeated string metric_keys = 2;</code>
+     * @return A list containing the metricKeys.
      */
-    boolean hasMetricKey();
+    java.util.List<java.lang.String>
+        getMetricKeysList();
     /**
      * <pre>
-     * Name of the metric.
+     * Name(s) of the metric(s) to export. If empty, every metric logged to the runs is exported.
      * </pre>
      *
-     * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-     * @return The metricKey.
+     * <code>repeated string metric_keys = 2;</code>
+     * @return The count of metricKeys.
      */
-    java.lang.String getMetricKey();
+    int getMetricKeysCount();
     /**
      * <pre>
-     * Name of the metric.
+     * Name(s) of the metric(s) to export. If empty, every metric logged to the runs is exported.
      * </pre>
      *
-     * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-     * @return The bytes for metricKey.
+     * <code>repeated string metric_keys = 2;</code>
+     * @param index The index of the element to return.
+     * @return The metricKeys at the given index.
+     */
+    java.lang.String getMetricKeys(int index);
+    /**
+     * <pre>
+     * Name(s) of the metric(s) to export. If empty, every metric logged to the runs is exported.
+     * </pre>
+     *
+     * <code>repeated string metric_keys = 2;</code>
+     * @param index The index of the value to return.
+     * @return The bytes of the metricKeys at the given index.
      */
     com.google.protobuf.ByteString
-        getMetricKeyBytes();
+        getMetricKeysBytes(int index);
 
     /**
      * <pre>
-     * Optional start step to only fetch metrics after the specified step. Must be defined if
-     * end_step is defined.
+     * Optional first step of the range of steps to export. Must be defined if end_step is defined.
      * </pre>
      *
-     * <code>optional int32 start_step = 3;</code>
+     * <code>optional int64 start_step = 3;</code>
      * @return Whether the startStep field is set.
      */
     boolean hasStartStep();
     /**
      * <pre>
-     * Optional start step to only fetch metrics after the specified step. Must be defined if
-     * end_step is defined.
+     * Optional first step of the range of steps to export. Must be defined if end_step is defined.
      * </pre>
      *
-     * <code>optional int32 start_step = 3;</code>
+     * <code>optional int64 start_step = 3;</code>
      * @return The startStep.
      */
-    int getStartStep();
+    long getStartStep();
 
     /**
      * <pre>
-     * Optional end step to only fetch metrics before the specified step. Must be defined if
+     * Optional last step (inclusive) of the range of steps to export. Must be defined if
      * start_step is defined.
      * </pre>
      *
-     * <code>optional int32 end_step = 4;</code>
+     * <code>optional int64 end_step = 4;</code>
      * @return Whether the endStep field is set.
      */
     boolean hasEndStep();
     /**
      * <pre>
-     * Optional end step to only fetch metrics before the specified step. Must be defined if
+     * Optional last step (inclusive) of the range of steps to export. Must be defined if
      * start_step is defined.
      * </pre>
      *
-     * <code>optional int32 end_step = 4;</code>
+     * <code>optional int64 end_step = 4;</code>
      * @return The endStep.
      */
-    int getEndStep();
-
-    /**
-     * <pre>
-     * Maximum number of results to fetch per run specified. Must be set to a positive number.
-     * Note, in reality, the API returns at most (max_results + # of run IDs) x (# run IDs) metric
-     * data points.
-     * </pre>
-     *
-     * <code>optional int32 max_results = 5;</code>
-     * @return Whether the maxResults field is set.
-     */
-    boolean hasMaxResults();
-    /**
-     * <pre>
-     * Maximum number of results to fetch per run specified. Must be set to a positive number.
-     * Note, in reality, the API returns at most (max_results + # of run IDs) x (# run IDs) metric
-     * data points.
-     * </pre>
-     *
-     * <code>optional int32 max_results = 5;</code>
-     * @return The maxResults.
-     */
-    int getMaxResults();
+    long getEndStep();
   }
   /**
-   * Protobuf type {@code mlflow.GetMetricHistoryBulkInterval}
+   * Protobuf type {@code mlflow.ExportMetrics}
    */
-  public static final class GetMetricHistoryBulkInterval extends
+  public static final class ExportMetrics extends
       com.google.protobuf.GeneratedMessageV3 implements
-      // @@protoc_insertion_point(message_implements:mlflow.GetMetricHistoryBulkInterval)
-      GetMetricHistoryBulkIntervalOrBuilder {
+      // @@protoc_insertion_point(message_implements:mlflow.ExportMetrics)
+      ExportMetricsOrBuilder {
   private static final long serialVersionUID = 0L;
-    // Use GetMetricHistoryBulkInterval.newBuilder() to construct.
-    private GetMetricHistoryBulkInterval(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+    // Use ExportMetrics.newBuilder() to construct.
+    private ExportMetrics(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
       super(builder);
     }
-    private GetMetricHistoryBulkInterval() {
+    private ExportMetrics() {
       runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
-      metricKey_ = "";
+      metricKeys_ = com.google.protobuf.LazyStringArrayList.EMPTY;
     }
 
     @java.lang.Override
     @SuppressWarnings({"unused"})
     protected java.lang.Object newInstance(
         UnusedPrivateParameter unused) {
-      return new GetMetricHistoryBulkInterval();
+      return new ExportMetrics();
     }
 
     @java.lang.Override
@@ -53967,7 +57566,7 @@ public final class Service {
     getUnknownFields() {
       return this.unknownFields;
     }
-    private GetMetricHistoryBulkInterval(
+    private ExportMetrics(
         com.google.protobuf.CodedInputStream input,
         com.google.protobuf.ExtensionRegistryLite extensionRegistry)
         throws com.google.protobuf.InvalidProtocolBufferException {
@@ -53997,23 +57596,21 @@ public final class Service {
             }
             case 18: {
               com.google.protobuf.ByteString bs = input.readBytes();
-              bitField0_ |= 0x00000001;
-              metricKey_ = bs;
+              if (!((mutable_bitField0_ & 0x00000002) != 0)) {
+                metricKeys_ = new com.google.protobuf.LazyStringArrayList();
+                mutable_bitField0_ |= 0x00000002;
+              }
+              metricKeys_.add(bs);
               break;
             }
             case 24: {
-              bitField0_ |= 0x00000002;
-              startStep_ = input.readInt32();
+              bitField0_ |= 0x00000001;
+              startStep_ = input.readInt64();
               break;
             }
             case 32: {
-              bitField0_ |= 0x00000004;
-              endStep_ = input.readInt32();
-              break;
-            }
-            case 40: {
-              bitField0_ |= 0x00000008;
-              maxResults_ = input.readInt32();
+              bitField0_ |= 0x00000002;
+              endStep_ = input.readInt64();
               break;
             }
             default: {
@@ -54034,77 +57631,41 @@ public final class Service {
         if (((mutable_bitField0_ & 0x00000001) != 0)) {
           runIds_ = runIds_.getUnmodifiableView();
         }
+        if (((mutable_bitField0_ & 0x00000002) != 0)) {
+          metricKeys_ = metricKeys_.getUnmodifiableView();
+        }
         this.unknownFields = unknownFields.build();
         makeExtensionsImmutable();
       }
     }
     public static final com.google.protobuf.Descriptors.Descriptor
         getDescriptor() {
-      return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistoryBulkInterval_descriptor;
+      return org.mlflow.api.proto.Service.internal_static_mlflow_ExportMetrics_descriptor;
     }
 
     @java.lang.Override
     protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
         internalGetFieldAccessorTable() {
-      return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistoryBulkInterval_fieldAccessorTable
+      return org.mlflow.api.proto.Service.internal_static_mlflow_ExportMetrics_fieldAccessorTable
           .ensureFieldAccessorsInitialized(
-              org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.class, org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Builder.class);
+              org.mlflow.api.proto.Service.ExportMetrics.class, org.mlflow.api.proto.Service.ExportMetrics.Builder.class);
     }
 
     public interface ResponseOrBuilder extends
-        // @@protoc_insertion_point(interface_extends:mlflow.GetMetricHistoryBulkInterval.Response)
+        // @@protoc_insertion_point(interface_extends:mlflow.ExportMetrics.Response)
         com.google.protobuf.MessageOrBuilder {
-
-      /**
-       * <pre>
-       * List of metrics representing history of values and metadata.
-       * </pre>
-       *
-       * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-       */
-      java.util.List<org.mlflow.api.proto.Service.MetricWithRunId> 
-          getMetricsList();
-      /**
-       * <pre>
-       * List of metrics representing history of values and metadata.
-       * </pre>
-       *
-       * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-       */
-      org.mlflow.api.proto.Service.MetricWithRunId getMetrics(int index);
-      /**
-       * <pre>
-       * List of metrics representing history of values and metadata.
-       * </pre>
-       *
-       * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-       */
-      int getMetricsCount();
-      /**
-       * <pre>
-       * List of metrics representing history of values and metadata.
-       * </pre>
-       *
-       * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-       */
-      java.util.List<? extends org.mlflow.api.proto.Service.MetricWithRunIdOrBuilder> 
-          getMetricsOrBuilderList();
-      /**
-       * <pre>
-       * List of metrics representing history of values and metadata.
-       * </pre>
-       *
-       * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-       */
-      org.mlflow.api.proto.Service.MetricWithRunIdOrBuilder getMetricsOrBuilder(
-          int index);
     }
     /**
-     * Protobuf type {@code mlflow.GetMetricHistoryBulkInterval.Response}
+     * <pre>
+     * The exported metrics are sent as an Arrow IPC stream with the
+     * ``application/vnd.apache.arrow.stream`` content type, rather than as a message.
+     * </pre>
+     *
+     * Protobuf type {@code mlflow.ExportMetrics.Response}
      */
     public static final class Response extends
         com.google.protobuf.GeneratedMessageV3 implements
-        // @@protoc_insertion_point(message_implements:mlflow.GetMetricHistoryBulkInterval.Response)
+        // @@protoc_insertion_point(message_implements:mlflow.ExportMetrics.Response)
         ResponseOrBuilder {
     private static final long serialVersionUID = 0L;
       // Use Response.newBuilder() to construct.
@@ -54112,7 +57673,6 @@ public final class Service {
         super(builder);
       }
       private Response() {
-        metrics_ = java.util.Collections.emptyList();
       }
 
       @java.lang.Override
@@ -54135,7 +57695,6 @@ public final class Service {
         if (extensionRegistry == null) {
           throw new java.lang.NullPointerException();
         }
-        int mutable_bitField0_ = 0;
         com.google.protobuf.UnknownFieldSet.Builder unknownFields =
             com.google.protobuf.UnknownFieldSet.newBuilder();
         try {
@@ -54146,15 +57705,6 @@ public final class Service {
               case 0:
                 done = true;
                 break;
-              case 10: {
-                if (!((mutable_bitField0_ & 0x00000001) != 0)) {
-                  metrics_ = new java.util.ArrayList<org.mlflow.api.proto.Service.MetricWithRunId>();
-                  mutable_bitField0_ |= 0x00000001;
-                }
-                metrics_.add(
-                    input.readMessage(org.mlflow.api.proto.Service.MetricWithRunId.PARSER, extensionRegistry));
-                break;
-              }
               default: {
                 if (!parseUnknownField(
                     input, unknownFields, extensionRegistry, tag)) {
@@ -54170,84 +57720,21 @@ public final class Service {
           throw new com.google.protobuf.InvalidProtocolBufferException(
               e).setUnfinishedMessage(this);
         } finally {
-          if (((mutable_bitField0_ & 0x00000001) != 0)) {
-            metrics_ = java.util.Collections.unmodifiableList(metrics_);
-          }
           this.unknownFields = unknownFields.build();
           makeExtensionsImmutable();
         }
       }
       public static final com.google.protobuf.Descriptors.Descriptor
           getDescriptor() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistoryBulkInterval_Response_descriptor;
+        return org.mlflow.api.proto.Service.internal_static_mlflow_ExportMetrics_Response_descriptor;
       }
 
       @java.lang.Override
       protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
           internalGetFieldAccessorTable() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistoryBulkInterval_Response_fieldAccessorTable
+        return org.mlflow.api.proto.Service.internal_static_mlflow_ExportMetrics_Response_fieldAccessorTable
             .ensureFieldAccessorsInitialized(
-                org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response.class, org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response.Builder.class);
-      }
-
-      public static final int METRICS_FIELD_NUMBER = 1;
-      private java.util.List<org.mlflow.api.proto.Service.MetricWithRunId> metrics_;
-      /**
-       * <pre>
-       * List of metrics representing history of values and metadata.
-       * </pre>
-       *
-       * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-       */
-      @java.lang.Override
-      public java.util.List<org.mlflow.api.proto.Service.MetricWithRunId> getMetricsList() {
-        return metrics_;
-      }
-      /**
-       * <pre>
-       * List of metrics representing history of values and metadata.
-       * </pre>
-       *
-       * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-       */
-      @java.lang.Override
-      public java.util.List<? extends org.mlflow.api.proto.Service.MetricWithRunIdOrBuilder> 
-          getMetricsOrBuilderList() {
-        return metrics_;
-      }
-      /**
-       * <pre>
-       * List of metrics representing history of values and metadata.
-       * </pre>
-       *
-       * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-       */
-      @java.lang.Override
-      public int getMetricsCount() {
-        return metrics_.size();
-      }
-      /**
-       * <pre>
-       * List of metrics representing history of values and metadata.
-       * </pre>
-       *
-       * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-       */
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.MetricWithRunId getMetrics(int index) {
-        return metrics_.get(index);
-      }
-      /**
-       * <pre>
-       * List of metrics representing history of values and metadata.
-       * </pre>
-       *
-       * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-       */
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.MetricWithRunIdOrBuilder getMetricsOrBuilder(
-          int index) {
-        return metrics_.get(index);
+                org.mlflow.api.proto.Service.ExportMetrics.Response.class, org.mlflow.api.proto.Service.ExportMetrics.Response.Builder.class);
       }
 
       private byte memoizedIsInitialized = -1;
@@ -54264,9 +57751,6 @@ public final class Service {
       @java.lang.Override
       public void writeTo(com.google.protobuf.CodedOutputStream output)
                           throws java.io.IOException {
-        for (int i = 0; i < metrics_.size(); i++) {
-          output.writeMessage(1, metrics_.get(i));
-        }
         unknownFields.writeTo(output);
       }
 
@@ -54276,10 +57760,6 @@ public final class Service {
         if (size != -1) return size;
 
         size = 0;
-        for (int i = 0; i < metrics_.size(); i++) {
-          size += com.google.protobuf.CodedOutputStream
-            .computeMessageSize(1, metrics_.get(i));
-        }
         size += unknownFields.getSerializedSize();
         memoizedSize = size;
         return size;
@@ -54290,13 +57770,11 @@ public final class Service {
         if (obj == this) {
          return true;
         }
-        if (!(obj instanceof org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response)) {
+        if (!(obj instanceof org.mlflow.api.proto.Service.ExportMetrics.Response)) {
           return super.equals(obj);
         }
-        org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response other = (org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response) obj;
+        org.mlflow.api.proto.Service.ExportMetrics.Response other = (org.mlflow.api.proto.Service.ExportMetrics.Response) obj;
 
-        if (!getMetricsList()
-            .equals(other.getMetricsList())) return false;
         if (!unknownFields.equals(other.unknownFields)) return false;
         return true;
       }
@@ -54308,78 +57786,74 @@ public final class Service {
         }
         int hash = 41;
         hash = (19 * hash) + getDescriptor().hashCode();
-        if (getMetricsCount() > 0) {
-          hash = (37 * hash) + METRICS_FIELD_NUMBER;
-          hash = (53 * hash) + getMetricsList().hashCode();
-        }
         hash = (29 * hash) + unknownFields.hashCode();
         memoizedHashCode = hash;
         return hash;
       }
 
-      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseFrom(
+      public static org.mlflow.api.proto.Service.ExportMetrics.Response parseFrom(
           java.nio.ByteBuffer data)
           throws com.google.protobuf.InvalidProtocolBufferException {
         return PARSER.parseFrom(data);
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseFrom(
+      public static org.mlflow.api.proto.Service.ExportMetrics.Response parseFrom(
           java.nio.ByteBuffer data,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws com.google.protobuf.InvalidProtocolBufferException {
         return PARSER.parseFrom(data, extensionRegistry);
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseFrom(
+      public static org.mlflow.api.proto.Service.ExportMetrics.Response parseFrom(
           com.google.protobuf.ByteString data)
           throws com.google.protobuf.InvalidProtocolBufferException {
         return PARSER.parseFrom(data);
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseFrom(
+      public static org.mlflow.api.proto.Service.ExportMetrics.Response parseFrom(
           com.google.protobuf.ByteString data,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws com.google.protobuf.InvalidProtocolBufferException {
         return PARSER.parseFrom(data, extensionRegistry);
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseFrom(byte[] data)
+      public static org.mlflow.api.proto.Service.ExportMetrics.Response parseFrom(byte[] data)
           throws com.google.protobuf.InvalidProtocolBufferException {
         return PARSER.parseFrom(data);
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseFrom(
+      public static org.mlflow.api.proto.Service.ExportMetrics.Response parseFrom(
           byte[] data,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws com.google.protobuf.InvalidProtocolBufferException {
         return PARSER.parseFrom(data, extensionRegistry);
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseFrom(java.io.InputStream input)
+      public static org.mlflow.api.proto.Service.ExportMetrics.Response parseFrom(java.io.InputStream input)
           throws java.io.IOException {
         return com.google.protobuf.GeneratedMessageV3
             .parseWithIOException(PARSER, input);
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseFrom(
+      public static org.mlflow.api.proto.Service.ExportMetrics.Response parseFrom(
           java.io.InputStream input,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws java.io.IOException {
         return com.google.protobuf.GeneratedMessageV3
             .parseWithIOException(PARSER, input, extensionRegistry);
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseDelimitedFrom(java.io.InputStream input)
+      public static org.mlflow.api.proto.Service.ExportMetrics.Response parseDelimitedFrom(java.io.InputStream input)
           throws java.io.IOException {
         return com.google.protobuf.GeneratedMessageV3
             .parseDelimitedWithIOException(PARSER, input);
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseDelimitedFrom(
+      public static org.mlflow.api.proto.Service.ExportMetrics.Response parseDelimitedFrom(
           java.io.InputStream input,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws java.io.IOException {
         return com.google.protobuf.GeneratedMessageV3
             .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseFrom(
+      public static org.mlflow.api.proto.Service.ExportMetrics.Response parseFrom(
           com.google.protobuf.CodedInputStream input)
           throws java.io.IOException {
         return com.google.protobuf.GeneratedMessageV3
             .parseWithIOException(PARSER, input);
       }
-      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parseFrom(
+      public static org.mlflow.api.proto.Service.ExportMetrics.Response parseFrom(
           com.google.protobuf.CodedInputStream input,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws java.io.IOException {
@@ -54392,7 +57866,7 @@ public final class Service {
       public static Builder newBuilder() {
         return DEFAULT_INSTANCE.toBuilder();
       }
-      public static Builder newBuilder(org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response prototype) {
+      public static Builder newBuilder(org.mlflow.api.proto.Service.ExportMetrics.Response prototype) {
         return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
       }
       @java.lang.Override
@@ -54408,26 +57882,31 @@ public final class Service {
         return builder;
       }
       /**
-       * Protobuf type {@code mlflow.GetMetricHistoryBulkInterval.Response}
+       * <pre>
+       * The exported metrics are sent as an Arrow IPC stream with the
+       * ``application/vnd.apache.arrow.stream`` content type, rather than as a message.
+       * </pre>
+       *
+       * Protobuf type {@code mlflow.ExportMetrics.Response}
        */
       public static final class Builder extends
           com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
-          // @@protoc_insertion_point(builder_implements:mlflow.GetMetricHistoryBulkInterval.Response)
-          org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.ResponseOrBuilder {
+          // @@protoc_insertion_point(builder_implements:mlflow.ExportMetrics.Response)
+          org.mlflow.api.proto.Service.ExportMetrics.ResponseOrBuilder {
         public static final com.google.protobuf.Descriptors.Descriptor
             getDescriptor() {
-          return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistoryBulkInterval_Response_descriptor;
+          return org.mlflow.api.proto.Service.internal_static_mlflow_ExportMetrics_Response_descriptor;
         }
 
         @java.lang.Override
         protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
             internalGetFieldAccessorTable() {
-          return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistoryBulkInterval_Response_fieldAccessorTable
+          return org.mlflow.api.proto.Service.internal_static_mlflow_ExportMetrics_Response_fieldAccessorTable
               .ensureFieldAccessorsInitialized(
-                  org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response.class, org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response.Builder.class);
+                  org.mlflow.api.proto.Service.ExportMetrics.Response.class, org.mlflow.api.proto.Service.ExportMetrics.Response.Builder.class);
         }
 
-        // Construct using org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response.newBuilder()
+        // Construct using org.mlflow.api.proto.Service.ExportMetrics.Response.newBuilder()
         private Builder() {
           maybeForceBuilderInitialization();
         }
@@ -54438,470 +57917,114 @@ public final class Service {
           maybeForceBuilderInitialization();
         }
         private void maybeForceBuilderInitialization() {
-          if (com.google.protobuf.GeneratedMessageV3
-                  .alwaysUseFieldBuilders) {
-            getMetricsFieldBuilder();
-          }
-        }
-        @java.lang.Override
-        public Builder clear() {
-          super.clear();
-          if (metricsBuilder_ == null) {
-            metrics_ = java.util.Collections.emptyList();
-            bitField0_ = (bitField0_ & ~0x00000001);
-          } else {
-            metricsBuilder_.clear();
-          }
-          return this;
-        }
-
-        @java.lang.Override
-        public com.google.protobuf.Descriptors.Descriptor
-            getDescriptorForType() {
-          return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistoryBulkInterval_Response_descriptor;
-        }
-
-        @java.lang.Override
-        public org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response getDefaultInstanceForType() {
-          return org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response.getDefaultInstance();
-        }
-
-        @java.lang.Override
-        public org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response build() {
-          org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response result = buildPartial();
-          if (!result.isInitialized()) {
-            throw newUninitializedMessageException(result);
-          }
-          return result;
-        }
-
-        @java.lang.Override
-        public org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response buildPartial() {
-          org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response result = new org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response(this);
-          int from_bitField0_ = bitField0_;
-          if (metricsBuilder_ == null) {
-            if (((bitField0_ & 0x00000001) != 0)) {
-              metrics_ = java.util.Collections.unmodifiableList(metrics_);
-              bitField0_ = (bitField0_ & ~0x00000001);
-            }
-            result.metrics_ = metrics_;
-          } else {
-            result.metrics_ = metricsBuilder_.build();
-          }
-          onBuilt();
-          return result;
-        }
-
-        @java.lang.Override
-        public Builder clone() {
-          return super.clone();
-        }
-        @java.lang.Override
-        public Builder setField(
-            com.google.protobuf.Descriptors.FieldDescriptor field,
-            java.lang.Object value) {
-          return super.setField(field, value);
-        }
-        @java.lang.Override
-        public Builder clearField(
-            com.google.protobuf.Descriptors.FieldDescriptor field) {
-          return super.clearField(field);
-        }
-        @java.lang.Override
-        public Builder clearOneof(
-            com.google.protobuf.Descriptors.OneofDescriptor oneof) {
-          return super.clearOneof(oneof);
-        }
-        @java.lang.Override
-        public Builder setRepeatedField(
-            com.google.protobuf.Descriptors.FieldDescriptor field,
-            int index, java.lang.Object value) {
-          return super.setRepeatedField(field, index, value);
-        }
-        @java.lang.Override
-        public Builder addRepeatedField(
-            com.google.protobuf.Descriptors.FieldDescriptor field,
-            java.lang.Object value) {
-          return super.addRepeatedField(field, value);
-        }
-        @java.lang.Override
-        public Builder mergeFrom(com.google.protobuf.Message other) {
-          if (other instanceof org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response) {
-            return mergeFrom((org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response)other);
-          } else {
-            super.mergeFrom(other);
-            return this;
-          }
-        }
-
-        public Builder mergeFrom(org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response other) {
-          if (other == org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response.getDefaultInstance()) return this;
-          if (metricsBuilder_ == null) {
-            if (!other.metrics_.isEmpty()) {
-              if (metrics_.isEmpty()) {
-                metrics_ = other.metrics_;
-                bitField0_ = (bitField0_ & ~0x00000001);
-              } else {
-                ensureMetricsIsMutable();
-                metrics_.addAll(other.metrics_);
-              }
-              onChanged();
-            }
-          } else {
-            if (!other.metrics_.isEmpty()) {
-              if (metricsBuilder_.isEmpty()) {
-                metricsBuilder_.dispose();
-                metricsBuilder_ = null;
-                metrics_ = other.metrics_;
-                bitField0_ = (bitField0_ & ~0x00000001);
-                metricsBuilder_ = 
-                  com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
-                     getMetricsFieldBuilder() : null;
-              } else {
-                metricsBuilder_.addAllMessages(other.metrics_);
-              }
-            }
-          }
-          this.mergeUnknownFields(other.unknownFields);
-          onChanged();
-          return this;
-        }
-
-        @java.lang.Override
-        public final boolean isInitialized() {
-          return true;
-        }
-
-        @java.lang.Override
-        public Builder mergeFrom(
-            com.google.protobuf.CodedInputStream input,
-            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-            throws java.io.IOException {
-          org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response parsedMessage = null;
-          try {
-            parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
-          } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-            parsedMessage = (org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response) e.getUnfinishedMessage();
-            throw e.unwrapIOException();
-          } finally {
-            if (parsedMessage != null) {
-              mergeFrom(parsedMessage);
-            }
-          }
-          return this;
-        }
-        private int bitField0_;
-
-        private java.util.List<org.mlflow.api.proto.Service.MetricWithRunId> metrics_ =
-          java.util.Collections.emptyList();
-        private void ensureMetricsIsMutable() {
-          if (!((bitField0_ & 0x00000001) != 0)) {
-            metrics_ = new java.util.ArrayList<org.mlflow.api.proto.Service.MetricWithRunId>(metrics_);
-            bitField0_ |= 0x00000001;
-           }
-        }
-
-        private com.google.protobuf.RepeatedFieldBuilderV3<
-            org.mlflow.api.proto.Service.MetricWithRunId, org.mlflow.api.proto.Service.MetricWithRunId.Builder, org.mlflow.api.proto.Service.MetricWithRunIdOrBuilder> metricsBuilder_;
-
-        /**
-         * <pre>
-         * List of metrics representing history of values and metadata.
-         * </pre>
-         *
-         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-         */
-        public java.util.List<org.mlflow.api.proto.Service.MetricWithRunId> getMetricsList() {
-          if (metricsBuilder_ == null) {
-            return java.util.Collections.unmodifiableList(metrics_);
-          } else {
-            return metricsBuilder_.getMessageList();
-          }
-        }
-        /**
-         * <pre>
-         * List of metrics representing history of values and metadata.
-         * </pre>
-         *
-         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-         */
-        public int getMetricsCount() {
-          if (metricsBuilder_ == null) {
-            return metrics_.size();
-          } else {
-            return metricsBuilder_.getCount();
-          }
-        }
-        /**
-         * <pre>
-         * List of metrics representing history of values and metadata.
-         * </pre>
-         *
-         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-         */
-        public org.mlflow.api.proto.Service.MetricWithRunId getMetrics(int index) {
-          if (metricsBuilder_ == null) {
-            return metrics_.get(index);
-          } else {
-            return metricsBuilder_.getMessage(index);
+          if (com.google.protobuf.GeneratedMessageV3
+                  .alwaysUseFieldBuilders) {
           }
         }
-        /**
-         * <pre>
-         * List of metrics representing history of values and metadata.
-         * </pre>
-         *
-         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-         */
-        public Builder setMetrics(
-            int index, org.mlflow.api.proto.Service.MetricWithRunId value) {
-          if (metricsBuilder_ == null) {
-            if (value == null) {
-              throw new NullPointerException();
-            }
-            ensureMetricsIsMutable();
-            metrics_.set(index, value);
-            onChanged();
-          } else {
-            metricsBuilder_.setMessage(index, value);
-          }
+        @java.lang.Override
+        public Builder clear() {
+          super.clear();
           return this;
         }
-        /**
-         * <pre>
-         * List of metrics representing history of values and metadata.
-         * </pre>
-         *
-         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-         */
-        public Builder setMetrics(
-            int index, org.mlflow.api.proto.Service.MetricWithRunId.Builder builderForValue) {
-          if (metricsBuilder_ == null) {
-            ensureMetricsIsMutable();
-            metrics_.set(index, builderForValue.build());
-            onChanged();
-          } else {
-            metricsBuilder_.setMessage(index, builderForValue.build());
-          }
-          return this;
+
+        @java.lang.Override
+        public com.google.protobuf.Descriptors.Descriptor
+            getDescriptorForType() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_ExportMetrics_Response_descriptor;
         }
-        /**
-         * <pre>
-         * List of metrics representing history of values and metadata.
-         * </pre>
-         *
-         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-         */
-        public Builder addMetrics(org.mlflow.api.proto.Service.MetricWithRunId value) {
-          if (metricsBuilder_ == null) {
-            if (value == null) {
-              throw new NullPointerException();
-            }
-            ensureMetricsIsMutable();
-            metrics_.add(value);
-            onChanged();
-          } else {
-            metricsBuilder_.addMessage(value);
-          }
-          return this;
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.ExportMetrics.Response getDefaultInstanceForType() {
+          return org.mlflow.api.proto.Service.ExportMetrics.Response.getDefaultInstance();
         }
-        /**
-         * <pre>
-         * List of metrics representing history of values and metadata.
-         * </pre>
-         *
-         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-         */
-        public Builder addMetrics(
-            int index, org.mlflow.api.proto.Service.MetricWithRunId value) {
-          if (metricsBuilder_ == null) {
-            if (value == null) {
-              throw new NullPointerException();
-            }
-            ensureMetricsIsMutable();
-            metrics_.add(index, value);
-            onChanged();
-          } else {
-            metricsBuilder_.addMessage(index, value);
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.ExportMetrics.Response build() {
+          org.mlflow.api.proto.Service.ExportMetrics.Response result = buildPartial();
+          if (!result.isInitialized()) {
+            throw newUninitializedMessageException(result);
           }
-          return this;
+          return result;
         }
-        /**
-         * <pre>
-         * List of metrics representing history of values and metadata.
-         * </pre>
-         *
-         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-         */
-        public Builder addMetrics(
-            org.mlflow.api.proto.Service.MetricWithRunId.Builder builderForValue) {
-          if (metricsBuilder_ == null) {
-            ensureMetricsIsMutable();
-            metrics_.add(builderForValue.build());
-            onChanged();
-          } else {
-            metricsBuilder_.addMessage(builderForValue.build());
-          }
-          return this;
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.ExportMetrics.Response buildPartial() {
+          org.mlflow.api.proto.Service.ExportMetrics.Response result = new org.mlflow.api.proto.Service.ExportMetrics.Response(this);
+          onBuilt();
+          return result;
         }
-        /**
-         * <pre>
-         * List of metrics representing history of values and metadata.
-         * </pre>
-         *
-         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-         */
-        public Builder addMetrics(
-            int index, org.mlflow.api.proto.Service.MetricWithRunId.Builder builderForValue) {
-          if (metricsBuilder_ == null) {
-            ensureMetricsIsMutable();
-            metrics_.add(index, builderForValue.build());
-            onChanged();
-          } else {
-            metricsBuilder_.addMessage(index, builderForValue.build());
-          }
-          return this;
+
+        @java.lang.Override
+        public Builder clone() {
+          return super.clone();
         }
-        /**
-         * <pre>
-         * List of metrics representing history of values and metadata.
-         * </pre>
-         *
-         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-         */
-        public Builder addAllMetrics(
-            java.lang.Iterable<? extends org.mlflow.api.proto.Service.MetricWithRunId> values) {
-          if (metricsBuilder_ == null) {
-            ensureMetricsIsMutable();
-            com.google.protobuf.AbstractMessageLite.Builder.addAll(
-                values, metrics_);
-            onChanged();
-          } else {
-            metricsBuilder_.addAllMessages(values);
-          }
-          return this;
+        @java.lang.Override
+        public Builder setField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return super.setField(field, value);
         }
-        /**
-         * <pre>
-         * List of metrics representing history of values and metadata.
-         * </pre>
-         *
-         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-         */
-        public Builder clearMetrics() {
-          if (metricsBuilder_ == null) {
-            metrics_ = java.util.Collections.emptyList();
-            bitField0_ = (bitField0_ & ~0x00000001);
-            onChanged();
-          } else {
-            metricsBuilder_.clear();
-          }
-          return this;
+        @java.lang.Override
+        public Builder clearField(
+            com.google.protobuf.Descriptors.FieldDescriptor field) {
+          return super.clearField(field);
         }
-        /**
-         * <pre>
-         * List of metrics representing history of values and metadata.
-         * </pre>
-         *
-         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-         */
-        public Builder removeMetrics(int index) {
-          if (metricsBuilder_ == null) {
-            ensureMetricsIsMutable();
-            metrics_.remove(index);
-            onChanged();
-          } else {
-            metricsBuilder_.remove(index);
-          }
-          return this;
+        @java.lang.Override
+        public Builder clearOneof(
+            com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+          return super.clearOneof(oneof);
         }
-        /**
-         * <pre>
-         * List of metrics representing history of values and metadata.
-         * </pre>
-         *
-         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-         */
-        public org.mlflow.api.proto.Service.MetricWithRunId.Builder getMetricsBuilder(
-            int index) {
-          return getMetricsFieldBuilder().getBuilder(index);
+        @java.lang.Override
+        public Builder setRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            int index, java.lang.Object value) {
+          return super.setRepeatedField(field, index, value);
         }
-        /**
-         * <pre>
-         * List of metrics representing history of values and metadata.
-         * </pre>
-         *
-         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-         */
-        public org.mlflow.api.proto.Service.MetricWithRunIdOrBuilder getMetricsOrBuilder(
-            int index) {
-          if (metricsBuilder_ == null) {
-            return metrics_.get(index);  } else {
-            return metricsBuilder_.getMessageOrBuilder(index);
-          }
+        @java.lang.Override
+        public Builder addRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return super.addRepeatedField(field, value);
         }
-        /**
-         * <pre>
-         * List of metrics representing history of values and metadata.
-         * </pre>
-         *
-         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-         */
-        public java.util.List<? extends org.mlflow.api.proto.Service.MetricWithRunIdOrBuilder> 
-             getMetricsOrBuilderList() {
-          if (metricsBuilder_ != null) {
-            return metricsBuilder_.getMessageOrBuilderList();
+        @java.lang.Override
+        public Builder mergeFrom(com.google.protobuf.Message other) {
+          if (other instanceof org.mlflow.api.proto.Service.ExportMetrics.Response) {
+            return mergeFrom((org.mlflow.api.proto.Service.ExportMetrics.Response)other);
           } else {
-            return java.util.Collections.unmodifiableList(metrics_);
+            super.mergeFrom(other);
+            return this;
           }
         }
-        /**
-         * <pre>
-         * List of metrics representing history of values and metadata.
-         * </pre>
-         *
-         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-         */
-        public org.mlflow.api.proto.Service.MetricWithRunId.Builder addMetricsBuilder() {
-          return getMetricsFieldBuilder().addBuilder(
-              org.mlflow.api.proto.Service.MetricWithRunId.getDefaultInstance());
-        }
-        /**
-         * <pre>
-         * List of metrics representing history of values and metadata.
-         * </pre>
-         *
-         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-         */
-        public org.mlflow.api.proto.Service.MetricWithRunId.Builder addMetricsBuilder(
-            int index) {
-          return getMetricsFieldBuilder().addBuilder(
-              index, org.mlflow.api.proto.Service.MetricWithRunId.getDefaultInstance());
+
+        public Builder mergeFrom(org.mlflow.api.proto.Service.ExportMetrics.Response other) {
+          if (other == org.mlflow.api.proto.Service.ExportMetrics.Response.getDefaultInstance()) return this;
+          this.mergeUnknownFields(other.unknownFields);
+          onChanged();
+          return this;
         }
-        /**
-         * <pre>
-         * List of metrics representing history of values and metadata.
-         * </pre>
-         *
-         * <code>repeated .mlflow.MetricWithRunId metrics = 1;</code>
-         */
-        public java.util.List<org.mlflow.api.proto.Service.MetricWithRunId.Builder> 
-             getMetricsBuilderList() {
-          return getMetricsFieldBuilder().getBuilderList();
+
+        @java.lang.Override
+        public final boolean isInitialized() {
+          return true;
         }
-        private com.google.protobuf.RepeatedFieldBuilderV3<
-            org.mlflow.api.proto.Service.MetricWithRunId, org.mlflow.api.proto.Service.MetricWithRunId.Builder, org.mlflow.api.proto.Service.MetricWithRunIdOrBuilder> 
-            getMetricsFieldBuilder() {
-          if (metricsBuilder_ == null) {
-            metricsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
-                org.mlflow.api.proto.Service.MetricWithRunId, org.mlflow.api.proto.Service.MetricWithRunId.Builder, org.mlflow.api.proto.Service.MetricWithRunIdOrBuilder>(
-                    metrics_,
-                    ((bitField0_ & 0x00000001) != 0),
-                    getParentForChildren(),
-                    isClean());
-            metrics_ = null;
+
+        @java.lang.Override
+        public Builder mergeFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws java.io.IOException {
+          org.mlflow.api.proto.Service.ExportMetrics.Response parsedMessage = null;
+          try {
+            parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+          } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+            parsedMessage = (org.mlflow.api.proto.Service.ExportMetrics.Response) e.getUnfinishedMessage();
+            throw e.unwrapIOException();
+          } finally {
+            if (parsedMessage != null) {
+              mergeFrom(parsedMessage);
+            }
           }
-          return metricsBuilder_;
+          return this;
         }
         @java.lang.Override
         public final Builder setUnknownFields(
@@ -54916,16 +58039,16 @@ public final class Service {
         }
 
 
-        // @@protoc_insertion_point(builder_scope:mlflow.GetMetricHistoryBulkInterval.Response)
+        // @@protoc_insertion_point(builder_scope:mlflow.ExportMetrics.Response)
       }
 
-      // @@protoc_insertion_point(class_scope:mlflow.GetMetricHistoryBulkInterval.Response)
-      private static final org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response DEFAULT_INSTANCE;
+      // @@protoc_insertion_point(class_scope:mlflow.ExportMetrics.Response)
+      private static final org.mlflow.api.proto.Service.ExportMetrics.Response DEFAULT_INSTANCE;
       static {
-        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response();
+        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.ExportMetrics.Response();
       }
 
-      public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response getDefaultInstance() {
+      public static org.mlflow.api.proto.Service.ExportMetrics.Response getDefaultInstance() {
         return DEFAULT_INSTANCE;
       }
 
@@ -54950,7 +58073,7 @@ public final class Service {
       }
 
       @java.lang.Override
-      public org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Response getDefaultInstanceForType() {
+      public org.mlflow.api.proto.Service.ExportMetrics.Response getDefaultInstanceForType() {
         return DEFAULT_INSTANCE;
       }
 
@@ -54961,7 +58084,7 @@ public final class Service {
     private com.google.protobuf.LazyStringList runIds_;
     /**
      * <pre>
-     * ID(s) of the run(s) from which to fetch metric values. Must be provided.
+     * ID(s) of the run(s) whose metrics to export. Must be provided.
      * </pre>
      *
      * <code>repeated string run_ids = 1;</code>
@@ -54973,7 +58096,7 @@ public final class Service {
     }
     /**
      * <pre>
-     * ID(s) of the run(s) from which to fetch metric values. Must be provided.
+     * ID(s) of the run(s) whose metrics to export. Must be provided.
      * </pre>
      *
      * <code>repeated string run_ids = 1;</code>
@@ -54984,7 +58107,7 @@ public final class Service {
     }
     /**
      * <pre>
-     * ID(s) of the run(s) from which to fetch metric values. Must be provided.
+     * ID(s) of the run(s) whose metrics to export. Must be provided.
      * </pre>
      *
      * <code>repeated string run_ids = 1;</code>
@@ -54996,7 +58119,7 @@ public final class Service {
     }
     /**
      * <pre>
-     * ID(s) of the run(s) from which to fetch metric values. Must be provided.
+     * ID(s) of the run(s) whose metrics to export. Must be provided.
      * </pre>
      *
      * <code>repeated string run_ids = 1;</code>
@@ -55008,155 +58131,113 @@ public final class Service {
       return runIds_.getByteString(index);
     }
 
-    public static final int METRIC_KEY_FIELD_NUMBER = 2;
-    private volatile java.lang.Object metricKey_;
+    public static final int METRIC_KEYS_FIELD_NUMBER = 2;
+    private com.google.protobuf.LazyStringList metricKeys_;
     /**
      * <pre>
-     * Name of the metric.
+     * Name(s) of the metric(s) to export. If empty, every metric logged to the runs is exported.
      * </pre>
      *
-     * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-     * @return Whether the metricKey field is set.
+     * <code>repeated string metric_keys = 2;</code>
+     * @return A list containing the metricKeys.
      */
-    @java.lang.Override
-    public boolean hasMetricKey() {
-      return ((bitField0_ & 0x00000001) != 0);
+    public com.google.protobuf.ProtocolStringList
+        getMetricKeysList() {
+      return metricKeys_;
     }
     /**
      * <pre>
-     * Name of the metric.
+     * Name(s) of the metric(s) to export. If empty, every metric logged to the runs is exported.
      * </pre>
      *
-     * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-     * @return The metricKey.
+     * <code>repeated string metric_keys = 2;</code>
+     * @return The count of metricKeys.
      */
-    @java.lang.Override
-    public java.lang.String getMetricKey() {
-      java.lang.Object ref = metricKey_;
-      if (ref instanceof java.lang.String) {
-        return (java.lang.String) ref;
-      } else {
-        com.google.protobuf.ByteString bs = 
-            (com.google.protobuf.ByteString) ref;
-        java.lang.String s = bs.toStringUtf8();
-        if (bs.isValidUtf8()) {
-          metricKey_ = s;
-        }
-        return s;
-      }
+    public int getMetricKeysCount() {
+      return metricKeys_.size();
     }
     /**
      * <pre>
-     * Name of the metric.
+     * Name(s) of the metric(s) to export. If empty, every metric logged to the runs is exported.
      * </pre>
      *
-     * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-     * @return The bytes for metricKey.
+     * <code>repeated string metric_keys = 2;</code>
+     * @param index The index of the element to return.
+     * @return The metricKeys at the given index.
+     */
+    public java.lang.String getMetricKeys(int index) {
+      return metricKeys_.get(index);
+    }
+    /**
+     * <pre>
+     * Name(s) of the metric(s) to export. If empty, every metric logged to the runs is exported.
+     * </pre>
+     *
+     * <code>repeated string metric_keys = 2;</code>
+     * @param index The index of the value to return.
+     * @return The bytes of the metricKeys at the given index.
      */
-    @java.lang.Override
     public com.google.protobuf.ByteString
-        getMetricKeyBytes() {
-      java.lang.Object ref = metricKey_;
-      if (ref instanceof java.lang.String) {
-        com.google.protobuf.ByteString b = 
-            com.google.protobuf.ByteString.copyFromUtf8(
-                (java.lang.String) ref);
-        metricKey_ = b;
-        return b;
-      } else {
-        return (com.google.protobuf.ByteString) ref;
-      }
+        getMetricKeysBytes(int index) {
+      return metricKeys_.getByteString(index);
     }
 
     public static final int START_STEP_FIELD_NUMBER = 3;
-    private int startStep_;
+    private long startStep_;
     /**
      * <pre>
-     * Optional start step to only fetch metrics after the specified step. Must be defined if
-     * end_step is defined.
+     * Optional first step of the range of steps to export. Must be defined if end_step is defined.
      * </pre>
      *
-     * <code>optional int32 start_step = 3;</code>
+     * <code>optional int64 start_step = 3;</code>
      * @return Whether the startStep field is set.
      */
     @java.lang.Override
     public boolean hasStartStep() {
-      return ((bitField0_ & 0x00000002) != 0);
+      return ((bitField0_ & 0x00000001) != 0);
     }
     /**
      * <pre>
-     * Optional start step to only fetch metrics after the specified step. Must be defined if
-     * end_step is defined.
+     * Optional first step of the range of steps to export. Must be defined if end_step is defined.
      * </pre>
      *
-     * <code>optional int32 start_step = 3;</code>
+     * <code>optional int64 start_step = 3;</code>
      * @return The startStep.
      */
     @java.lang.Override
-    public int getStartStep() {
+    public long getStartStep() {
       return startStep_;
     }
 
     public static final int END_STEP_FIELD_NUMBER = 4;
-    private int endStep_;
+    private long endStep_;
     /**
      * <pre>
-     * Optional end step to only fetch metrics before the specified step. Must be defined if
+     * Optional last step (inclusive) of the range of steps to export. Must be defined if
      * start_step is defined.
      * </pre>
      *
-     * <code>optional int32 end_step = 4;</code>
+     * <code>optional int64 end_step = 4;</code>
      * @return Whether the endStep field is set.
      */
     @java.lang.Override
     public boolean hasEndStep() {
-      return ((bitField0_ & 0x00000004) != 0);
+      return ((bitField0_ & 0x00000002) != 0);
     }
     /**
      * <pre>
-     * Optional end step to only fetch metrics before the specified step. Must be defined if
+     * Optional last step (inclusive) of the range of steps to export. Must be defined if
      * start_step is defined.
      * </pre>
      *
-     * <code>optional int32 end_step = 4;</code>
+     * <code>optional int64 end_step = 4;</code>
      * @return The endStep.
      */
     @java.lang.Override
-    public int getEndStep() {
+    public long getEndStep() {
       return endStep_;
     }
 
-    public static final int MAX_RESULTS_FIELD_NUMBER = 5;
-    private int maxResults_;
-    /**
-     * <pre>
-     * Maximum number of results to fetch per run specified. Must be set to a positive number.
-     * Note, in reality, the API returns at most (max_results + # of run IDs) x (# run IDs) metric
-     * data points.
-     * </pre>
-     *
-     * <code>optional int32 max_results = 5;</code>
-     * @return Whether the maxResults field is set.
-     */
-    @java.lang.Override
-    public boolean hasMaxResults() {
-      return ((bitField0_ & 0x00000008) != 0);
-    }
-    /**
-     * <pre>
-     * Maximum number of results to fetch per run specified. Must be set to a positive number.
-     * Note, in reality, the API returns at most (max_results + # of run IDs) x (# run IDs) metric
-     * data points.
-     * </pre>
-     *
-     * <code>optional int32 max_results = 5;</code>
-     * @return The maxResults.
-     */
-    @java.lang.Override
-    public int getMaxResults() {
-      return maxResults_;
-    }
-
     private byte memoizedIsInitialized = -1;
     @java.lang.Override
     public final boolean isInitialized() {
@@ -55174,17 +58255,14 @@ public final class Service {
       for (int i = 0; i < runIds_.size(); i++) {
         com.google.protobuf.GeneratedMessageV3.writeString(output, 1, runIds_.getRaw(i));
       }
+      for (int i = 0; i < metricKeys_.size(); i++) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 2, metricKeys_.getRaw(i));
+      }
       if (((bitField0_ & 0x00000001) != 0)) {
-        com.google.protobuf.GeneratedMessageV3.writeString(output, 2, metricKey_);
+        output.writeInt64(3, startStep_);
       }
       if (((bitField0_ & 0x00000002) != 0)) {
-        output.writeInt32(3, startStep_);
-      }
-      if (((bitField0_ & 0x00000004) != 0)) {
-        output.writeInt32(4, endStep_);
-      }
-      if (((bitField0_ & 0x00000008) != 0)) {
-        output.writeInt32(5, maxResults_);
+        output.writeInt64(4, endStep_);
       }
       unknownFields.writeTo(output);
     }
@@ -55203,20 +58281,21 @@ public final class Service {
         size += dataSize;
         size += 1 * getRunIdsList().size();
       }
-      if (((bitField0_ & 0x00000001) != 0)) {
-        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(2, metricKey_);
-      }
-      if (((bitField0_ & 0x00000002) != 0)) {
-        size += com.google.protobuf.CodedOutputStream
-          .computeInt32Size(3, startStep_);
+      {
+        int dataSize = 0;
+        for (int i = 0; i < metricKeys_.size(); i++) {
+          dataSize += computeStringSizeNoTag(metricKeys_.getRaw(i));
+        }
+        size += dataSize;
+        size += 1 * getMetricKeysList().size();
       }
-      if (((bitField0_ & 0x00000004) != 0)) {
+      if (((bitField0_ & 0x00000001) != 0)) {
         size += com.google.protobuf.CodedOutputStream
-          .computeInt32Size(4, endStep_);
+          .computeInt64Size(3, startStep_);
       }
-      if (((bitField0_ & 0x00000008) != 0)) {
+      if (((bitField0_ & 0x00000002) != 0)) {
         size += com.google.protobuf.CodedOutputStream
-          .computeInt32Size(5, maxResults_);
+          .computeInt64Size(4, endStep_);
       }
       size += unknownFields.getSerializedSize();
       memoizedSize = size;
@@ -55228,18 +58307,15 @@ public final class Service {
       if (obj == this) {
        return true;
       }
-      if (!(obj instanceof org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval)) {
+      if (!(obj instanceof org.mlflow.api.proto.Service.ExportMetrics)) {
         return super.equals(obj);
       }
-      org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval other = (org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval) obj;
+      org.mlflow.api.proto.Service.ExportMetrics other = (org.mlflow.api.proto.Service.ExportMetrics) obj;
 
       if (!getRunIdsList()
           .equals(other.getRunIdsList())) return false;
-      if (hasMetricKey() != other.hasMetricKey()) return false;
-      if (hasMetricKey()) {
-        if (!getMetricKey()
-            .equals(other.getMetricKey())) return false;
-      }
+      if (!getMetricKeysList()
+          .equals(other.getMetricKeysList())) return false;
       if (hasStartStep() != other.hasStartStep()) return false;
       if (hasStartStep()) {
         if (getStartStep()
@@ -55250,11 +58326,6 @@ public final class Service {
         if (getEndStep()
             != other.getEndStep()) return false;
       }
-      if (hasMaxResults() != other.hasMaxResults()) return false;
-      if (hasMaxResults()) {
-        if (getMaxResults()
-            != other.getMaxResults()) return false;
-      }
       if (!unknownFields.equals(other.unknownFields)) return false;
       return true;
     }
@@ -55270,90 +58341,88 @@ public final class Service {
         hash = (37 * hash) + RUN_IDS_FIELD_NUMBER;
         hash = (53 * hash) + getRunIdsList().hashCode();
       }
-      if (hasMetricKey()) {
-        hash = (37 * hash) + METRIC_KEY_FIELD_NUMBER;
-        hash = (53 * hash) + getMetricKey().hashCode();
+      if (getMetricKeysCount() > 0) {
+        hash = (37 * hash) + METRIC_KEYS_FIELD_NUMBER;
+        hash = (53 * hash) + getMetricKeysList().hashCode();
       }
       if (hasStartStep()) {
         hash = (37 * hash) + START_STEP_FIELD_NUMBER;
-        hash = (53 * hash) + getStartStep();
+        hash = (53 * hash) + com.google.protobuf.Internal.hashLong(
+            getStartStep());
       }
       if (hasEndStep()) {
         hash = (37 * hash) + END_STEP_FIELD_NUMBER;
-        hash = (53 * hash) + getEndStep();
-      }
-      if (hasMaxResults()) {
-        hash = (37 * hash) + MAX_RESULTS_FIELD_NUMBER;
-        hash = (53 * hash) + getMaxResults();
+        hash = (53 * hash) + com.google.protobuf.Internal.hashLong(
+            getEndStep());
       }
       hash = (29 * hash) + unknownFields.hashCode();
       memoizedHashCode = hash;
       return hash;
     }
 
-    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseFrom(
+    public static org.mlflow.api.proto.Service.ExportMetrics parseFrom(
         java.nio.ByteBuffer data)
         throws com.google.protobuf.InvalidProtocolBufferException {
       return PARSER.parseFrom(data);
     }
-    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseFrom(
+    public static org.mlflow.api.proto.Service.ExportMetrics parseFrom(
         java.nio.ByteBuffer data,
         com.google.protobuf.ExtensionRegistryLite extensionRegistry)
         throws com.google.protobuf.InvalidProtocolBufferException {
       return PARSER.parseFrom(data, extensionRegistry);
     }
-    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseFrom(
+    public static org.mlflow.api.proto.Service.ExportMetrics parseFrom(
         com.google.protobuf.ByteString data)
         throws com.google.protobuf.InvalidProtocolBufferException {
       return PARSER.parseFrom(data);
     }
-    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseFrom(
+    public static org.mlflow.api.proto.Service.ExportMetrics parseFrom(
         com.google.protobuf.ByteString data,
         com.google.protobuf.ExtensionRegistryLite extensionRegistry)
         throws com.google.protobuf.InvalidProtocolBufferException {
       return PARSER.parseFrom(data, extensionRegistry);
     }
-    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseFrom(byte[] data)
+    public static org.mlflow.api.proto.Service.ExportMetrics parseFrom(byte[] data)
         throws com.google.protobuf.InvalidProtocolBufferException {
       return PARSER.parseFrom(data);
     }
-    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseFrom(
+    public static org.mlflow.api.proto.Service.ExportMetrics parseFrom(
         byte[] data,
         com.google.protobuf.ExtensionRegistryLite extensionRegistry)
         throws com.google.protobuf.InvalidProtocolBufferException {
       return PARSER.parseFrom(data, extensionRegistry);
     }
-    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseFrom(java.io.InputStream input)
+    public static org.mlflow.api.proto.Service.ExportMetrics parseFrom(java.io.InputStream input)
         throws java.io.IOException {
       return com.google.protobuf.GeneratedMessageV3
           .parseWithIOException(PARSER, input);
     }
-    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseFrom(
+    public static org.mlflow.api.proto.Service.ExportMetrics parseFrom(
         java.io.InputStream input,
         com.google.protobuf.ExtensionRegistryLite extensionRegistry)
         throws java.io.IOException {
       return com.google.protobuf.GeneratedMessageV3
           .parseWithIOException(PARSER, input, extensionRegistry);
     }
-    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseDelimitedFrom(java.io.InputStream input)
+    public static org.mlflow.api.proto.Service.ExportMetrics parseDelimitedFrom(java.io.InputStream input)
         throws java.io.IOException {
       return com.google.protobuf.GeneratedMessageV3
           .parseDelimitedWithIOException(PARSER, input);
     }
-    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseDelimitedFrom(
+    public static org.mlflow.api.proto.Service.ExportMetrics parseDelimitedFrom(
         java.io.InputStream input,
         com.google.protobuf.ExtensionRegistryLite extensionRegistry)
         throws java.io.IOException {
       return com.google.protobuf.GeneratedMessageV3
           .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
     }
-    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseFrom(
+    public static org.mlflow.api.proto.Service.ExportMetrics parseFrom(
         com.google.protobuf.CodedInputStream input)
         throws java.io.IOException {
       return com.google.protobuf.GeneratedMessageV3
           .parseWithIOException(PARSER, input);
     }
-    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parseFrom(
+    public static org.mlflow.api.proto.Service.ExportMetrics parseFrom(
         com.google.protobuf.CodedInputStream input,
         com.google.protobuf.ExtensionRegistryLite extensionRegistry)
         throws java.io.IOException {
@@ -55366,7 +58435,7 @@ public final class Service {
     public static Builder newBuilder() {
       return DEFAULT_INSTANCE.toBuilder();
     }
-    public static Builder newBuilder(org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval prototype) {
+    public static Builder newBuilder(org.mlflow.api.proto.Service.ExportMetrics prototype) {
       return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
     }
     @java.lang.Override
@@ -55382,26 +58451,26 @@ public final class Service {
       return builder;
     }
     /**
-     * Protobuf type {@code mlflow.GetMetricHistoryBulkInterval}
+     * Protobuf type {@code mlflow.ExportMetrics}
      */
     public static final class Builder extends
         com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
-        // @@protoc_insertion_point(builder_implements:mlflow.GetMetricHistoryBulkInterval)
-        org.mlflow.api.proto.Service.GetMetricHistoryBulkIntervalOrBuilder {
+        // @@protoc_insertion_point(builder_implements:mlflow.ExportMetrics)
+        org.mlflow.api.proto.Service.ExportMetricsOrBuilder {
       public static final com.google.protobuf.Descriptors.Descriptor
           getDescriptor() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistoryBulkInterval_descriptor;
+        return org.mlflow.api.proto.Service.internal_static_mlflow_ExportMetrics_descriptor;
       }
 
       @java.lang.Override
       protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
           internalGetFieldAccessorTable() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistoryBulkInterval_fieldAccessorTable
+        return org.mlflow.api.proto.Service.internal_static_mlflow_ExportMetrics_fieldAccessorTable
             .ensureFieldAccessorsInitialized(
-                org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.class, org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.Builder.class);
+                org.mlflow.api.proto.Service.ExportMetrics.class, org.mlflow.api.proto.Service.ExportMetrics.Builder.class);
       }
 
-      // Construct using org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.newBuilder()
+      // Construct using org.mlflow.api.proto.Service.ExportMetrics.newBuilder()
       private Builder() {
         maybeForceBuilderInitialization();
       }
@@ -55421,31 +58490,29 @@ public final class Service {
         super.clear();
         runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
         bitField0_ = (bitField0_ & ~0x00000001);
-        metricKey_ = "";
+        metricKeys_ = com.google.protobuf.LazyStringArrayList.EMPTY;
         bitField0_ = (bitField0_ & ~0x00000002);
-        startStep_ = 0;
+        startStep_ = 0L;
         bitField0_ = (bitField0_ & ~0x00000004);
-        endStep_ = 0;
+        endStep_ = 0L;
         bitField0_ = (bitField0_ & ~0x00000008);
-        maxResults_ = 0;
-        bitField0_ = (bitField0_ & ~0x00000010);
         return this;
       }
 
       @java.lang.Override
       public com.google.protobuf.Descriptors.Descriptor
           getDescriptorForType() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_GetMetricHistoryBulkInterval_descriptor;
+        return org.mlflow.api.proto.Service.internal_static_mlflow_ExportMetrics_descriptor;
       }
 
       @java.lang.Override
-      public org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval getDefaultInstanceForType() {
-        return org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.getDefaultInstance();
+      public org.mlflow.api.proto.Service.ExportMetrics getDefaultInstanceForType() {
+        return org.mlflow.api.proto.Service.ExportMetrics.getDefaultInstance();
       }
 
       @java.lang.Override
-      public org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval build() {
-        org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval result = buildPartial();
+      public org.mlflow.api.proto.Service.ExportMetrics build() {
+        org.mlflow.api.proto.Service.ExportMetrics result = buildPartial();
         if (!result.isInitialized()) {
           throw newUninitializedMessageException(result);
         }
@@ -55453,8 +58520,8 @@ public final class Service {
       }
 
       @java.lang.Override
-      public org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval buildPartial() {
-        org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval result = new org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval(this);
+      public org.mlflow.api.proto.Service.ExportMetrics buildPartial() {
+        org.mlflow.api.proto.Service.ExportMetrics result = new org.mlflow.api.proto.Service.ExportMetrics(this);
         int from_bitField0_ = bitField0_;
         int to_bitField0_ = 0;
         if (((bitField0_ & 0x00000001) != 0)) {
@@ -55462,21 +58529,18 @@ public final class Service {
           bitField0_ = (bitField0_ & ~0x00000001);
         }
         result.runIds_ = runIds_;
-        if (((from_bitField0_ & 0x00000002) != 0)) {
-          to_bitField0_ |= 0x00000001;
+        if (((bitField0_ & 0x00000002) != 0)) {
+          metricKeys_ = metricKeys_.getUnmodifiableView();
+          bitField0_ = (bitField0_ & ~0x00000002);
         }
-        result.metricKey_ = metricKey_;
+        result.metricKeys_ = metricKeys_;
         if (((from_bitField0_ & 0x00000004) != 0)) {
           result.startStep_ = startStep_;
-          to_bitField0_ |= 0x00000002;
+          to_bitField0_ |= 0x00000001;
         }
         if (((from_bitField0_ & 0x00000008) != 0)) {
           result.endStep_ = endStep_;
-          to_bitField0_ |= 0x00000004;
-        }
-        if (((from_bitField0_ & 0x00000010) != 0)) {
-          result.maxResults_ = maxResults_;
-          to_bitField0_ |= 0x00000008;
+          to_bitField0_ |= 0x00000002;
         }
         result.bitField0_ = to_bitField0_;
         onBuilt();
@@ -55517,16 +58581,16 @@ public final class Service {
       }
       @java.lang.Override
       public Builder mergeFrom(com.google.protobuf.Message other) {
-        if (other instanceof org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval) {
-          return mergeFrom((org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval)other);
+        if (other instanceof org.mlflow.api.proto.Service.ExportMetrics) {
+          return mergeFrom((org.mlflow.api.proto.Service.ExportMetrics)other);
         } else {
           super.mergeFrom(other);
           return this;
         }
       }
 
-      public Builder mergeFrom(org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval other) {
-        if (other == org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval.getDefaultInstance()) return this;
+      public Builder mergeFrom(org.mlflow.api.proto.Service.ExportMetrics other) {
+        if (other == org.mlflow.api.proto.Service.ExportMetrics.getDefaultInstance()) return this;
         if (!other.runIds_.isEmpty()) {
           if (runIds_.isEmpty()) {
             runIds_ = other.runIds_;
@@ -55537,9 +58601,14 @@ public final class Service {
           }
           onChanged();
         }
-        if (other.hasMetricKey()) {
-          bitField0_ |= 0x00000002;
-          metricKey_ = other.metricKey_;
+        if (!other.metricKeys_.isEmpty()) {
+          if (metricKeys_.isEmpty()) {
+            metricKeys_ = other.metricKeys_;
+            bitField0_ = (bitField0_ & ~0x00000002);
+          } else {
+            ensureMetricKeysIsMutable();
+            metricKeys_.addAll(other.metricKeys_);
+          }
           onChanged();
         }
         if (other.hasStartStep()) {
@@ -55548,9 +58617,6 @@ public final class Service {
         if (other.hasEndStep()) {
           setEndStep(other.getEndStep());
         }
-        if (other.hasMaxResults()) {
-          setMaxResults(other.getMaxResults());
-        }
         this.mergeUnknownFields(other.unknownFields);
         onChanged();
         return this;
@@ -55566,11 +58632,11 @@ public final class Service {
           com.google.protobuf.CodedInputStream input,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws java.io.IOException {
-        org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval parsedMessage = null;
+        org.mlflow.api.proto.Service.ExportMetrics parsedMessage = null;
         try {
           parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
         } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-          parsedMessage = (org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval) e.getUnfinishedMessage();
+          parsedMessage = (org.mlflow.api.proto.Service.ExportMetrics) e.getUnfinishedMessage();
           throw e.unwrapIOException();
         } finally {
           if (parsedMessage != null) {
@@ -55590,7 +58656,7 @@ public final class Service {
       }
       /**
        * <pre>
-       * ID(s) of the run(s) from which to fetch metric values. Must be provided.
+       * ID(s) of the run(s) whose metrics to export. Must be provided.
        * </pre>
        *
        * <code>repeated string run_ids = 1;</code>
@@ -55602,7 +58668,7 @@ public final class Service {
       }
       /**
        * <pre>
-       * ID(s) of the run(s) from which to fetch metric values. Must be provided.
+       * ID(s) of the run(s) whose metrics to export. Must be provided.
        * </pre>
        *
        * <code>repeated string run_ids = 1;</code>
@@ -55613,7 +58679,7 @@ public final class Service {
       }
       /**
        * <pre>
-       * ID(s) of the run(s) from which to fetch metric values. Must be provided.
+       * ID(s) of the run(s) whose metrics to export. Must be provided.
        * </pre>
        *
        * <code>repeated string run_ids = 1;</code>
@@ -55625,7 +58691,7 @@ public final class Service {
       }
       /**
        * <pre>
-       * ID(s) of the run(s) from which to fetch metric values. Must be provided.
+       * ID(s) of the run(s) whose metrics to export. Must be provided.
        * </pre>
        *
        * <code>repeated string run_ids = 1;</code>
@@ -55638,7 +58704,7 @@ public final class Service {
       }
       /**
        * <pre>
-       * ID(s) of the run(s) from which to fetch metric values. Must be provided.
+       * ID(s) of the run(s) whose metrics to export. Must be provided.
        * </pre>
        *
        * <code>repeated string run_ids = 1;</code>
@@ -55658,7 +58724,7 @@ public final class Service {
       }
       /**
        * <pre>
-       * ID(s) of the run(s) from which to fetch metric values. Must be provided.
+       * ID(s) of the run(s) whose metrics to export. Must be provided.
        * </pre>
        *
        * <code>repeated string run_ids = 1;</code>
@@ -55677,7 +58743,7 @@ public final class Service {
       }
       /**
        * <pre>
-       * ID(s) of the run(s) from which to fetch metric values. Must be provided.
+       * ID(s) of the run(s) whose metrics to export. Must be provided.
        * </pre>
        *
        * <code>repeated string run_ids = 1;</code>
@@ -55694,7 +58760,7 @@ public final class Service {
       }
       /**
        * <pre>
-       * ID(s) of the run(s) from which to fetch metric values. Must be provided.
+       * ID(s) of the run(s) whose metrics to export. Must be provided.
        * </pre>
        *
        * <code>repeated string run_ids = 1;</code>
@@ -55708,7 +58774,7 @@ public final class Service {
       }
       /**
        * <pre>
-       * ID(s) of the run(s) from which to fetch metric values. Must be provided.
+       * ID(s) of the run(s) whose metrics to export. Must be provided.
        * </pre>
        *
        * <code>repeated string run_ids = 1;</code>
@@ -55726,122 +58792,158 @@ public final class Service {
         return this;
       }
 
-      private java.lang.Object metricKey_ = "";
+      private com.google.protobuf.LazyStringList metricKeys_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+      private void ensureMetricKeysIsMutable() {
+        if (!((bitField0_ & 0x00000002) != 0)) {
+          metricKeys_ = new com.google.protobuf.LazyStringArrayList(metricKeys_);
+          bitField0_ |= 0x00000002;
+         }
+      }
       /**
        * <pre>
-       * Name of the metric.
+       * Name(s) of the metric(s) to export. If empty, every metric logged to the runs is exported.
        * </pre>
        *
-       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-       * @return Whether the metricKey field is set.
+       * <code>repeated string metric_keys = 2;</code>
+       * @return A list containing the metricKeys.
        */
-      public boolean hasMetricKey() {
-        return ((bitField0_ & 0x00000002) != 0);
+      public com.google.protobuf.ProtocolStringList
+          getMetricKeysList() {
+        return metricKeys_.getUnmodifiableView();
       }
       /**
        * <pre>
-       * Name of the metric.
+       * Name(s) of the metric(s) to export. If empty, every metric logged to the runs is exported.
        * </pre>
        *
-       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-       * @return The metricKey.
+       * <code>repeated string metric_keys = 2;</code>
+       * @return The count of metricKeys.
        */
-      public java.lang.String getMetricKey() {
-        java.lang.Object ref = metricKey_;
-        if (!(ref instanceof java.lang.String)) {
-          com.google.protobuf.ByteString bs =
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            metricKey_ = s;
-          }
-          return s;
-        } else {
-          return (java.lang.String) ref;
-        }
+      public int getMetricKeysCount() {
+        return metricKeys_.size();
       }
       /**
        * <pre>
-       * Name of the metric.
+       * Name(s) of the metric(s) to export. If empty, every metric logged to the runs is exported.
        * </pre>
        *
-       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-       * @return The bytes for metricKey.
+       * <code>repeated string metric_keys = 2;</code>
+       * @param index The index of the element to return.
+       * @return The metricKeys at the given index.
+       */
+      public java.lang.String getMetricKeys(int index) {
+        return metricKeys_.get(index);
+      }
+      /**
+       * <pre>
+       * Name(s) of the metric(s) to export. If empty, every metric logged to the runs is exported.
+       * </pre>
+       *
+       * <code>repeated string metric_keys = 2;</code>
+       * @param index The index of the value to return.
+       * @return The bytes of the metricKeys at the given index.
        */
       public com.google.protobuf.ByteString
-          getMetricKeyBytes() {
-        java.lang.Object ref = metricKey_;
-        if (ref instanceof String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          metricKey_ = b;
-          return b;
-        } else {
-          return (com.google.protobuf.ByteString) ref;
-        }
+          getMetricKeysBytes(int index) {
+        return metricKeys_.getByteString(index);
       }
       /**
        * <pre>
-       * Name of the metric.
+       * Name(s) of the metric(s) to export. If empty, every metric logged to the runs is exported.
        * </pre>
        *
-       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-       * @param value The metricKey to set.
+       * <code>repeated string metric_keys = 2;</code>
+       * @param index The index to set the value at.
+       * @param value The metricKeys to set.
        * @return This builder for chaining.
        */
-      public Builder setMetricKey(
+      public Builder setMetricKeys(
+          int index, java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureMetricKeysIsMutable();
+        metricKeys_.set(index, value);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Name(s) of the metric(s) to export. If empty, every metric logged to the runs is exported.
+       * </pre>
+       *
+       * <code>repeated string metric_keys = 2;</code>
+       * @param value The metricKeys to add.
+       * @return This builder for chaining.
+       */
+      public Builder addMetricKeys(
           java.lang.String value) {
         if (value == null) {
     throw new NullPointerException();
   }
-  bitField0_ |= 0x00000002;
-        metricKey_ = value;
+  ensureMetricKeysIsMutable();
+        metricKeys_.add(value);
         onChanged();
         return this;
       }
       /**
        * <pre>
-       * Name of the metric.
+       * Name(s) of the metric(s) to export. If empty, every metric logged to the runs is exported.
        * </pre>
        *
-       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+       * <code>repeated string metric_keys = 2;</code>
+       * @param values The metricKeys to add.
        * @return This builder for chaining.
        */
-      public Builder clearMetricKey() {
+      public Builder addAllMetricKeys(
+          java.lang.Iterable<java.lang.String> values) {
+        ensureMetricKeysIsMutable();
+        com.google.protobuf.AbstractMessageLite.Builder.addAll(
+            values, metricKeys_);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Name(s) of the metric(s) to export. If empty, every metric logged to the runs is exported.
+       * </pre>
+       *
+       * <code>repeated string metric_keys = 2;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearMetricKeys() {
+        metricKeys_ = com.google.protobuf.LazyStringArrayList.EMPTY;
         bitField0_ = (bitField0_ & ~0x00000002);
-        metricKey_ = getDefaultInstance().getMetricKey();
         onChanged();
         return this;
       }
       /**
        * <pre>
-       * Name of the metric.
+       * Name(s) of the metric(s) to export. If empty, every metric logged to the runs is exported.
        * </pre>
        *
-       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-       * @param value The bytes for metricKey to set.
+       * <code>repeated string metric_keys = 2;</code>
+       * @param value The bytes of the metricKeys to add.
        * @return This builder for chaining.
        */
-      public Builder setMetricKeyBytes(
+      public Builder addMetricKeysBytes(
           com.google.protobuf.ByteString value) {
         if (value == null) {
     throw new NullPointerException();
   }
-  bitField0_ |= 0x00000002;
-        metricKey_ = value;
+  ensureMetricKeysIsMutable();
+        metricKeys_.add(value);
         onChanged();
         return this;
       }
 
-      private int startStep_ ;
+      private long startStep_ ;
       /**
        * <pre>
-       * Optional start step to only fetch metrics after the specified step. Must be defined if
-       * end_step is defined.
+       * Optional first step of the range of steps to export. Must be defined if end_step is defined.
        * </pre>
        *
-       * <code>optional int32 start_step = 3;</code>
+       * <code>optional int64 start_step = 3;</code>
        * @return Whether the startStep field is set.
        */
       @java.lang.Override
@@ -55850,28 +58952,26 @@ public final class Service {
       }
       /**
        * <pre>
-       * Optional start step to only fetch metrics after the specified step. Must be defined if
-       * end_step is defined.
+       * Optional first step of the range of steps to export. Must be defined if end_step is defined.
        * </pre>
        *
-       * <code>optional int32 start_step = 3;</code>
+       * <code>optional int64 start_step = 3;</code>
        * @return The startStep.
        */
       @java.lang.Override
-      public int getStartStep() {
+      public long getStartStep() {
         return startStep_;
       }
       /**
        * <pre>
-       * Optional start step to only fetch metrics after the specified step. Must be defined if
-       * end_step is defined.
+       * Optional first step of the range of steps to export. Must be defined if end_step is defined.
        * </pre>
        *
-       * <code>optional int32 start_step = 3;</code>
+       * <code>optional int64 start_step = 3;</code>
        * @param value The startStep to set.
        * @return This builder for chaining.
        */
-      public Builder setStartStep(int value) {
+      public Builder setStartStep(long value) {
         bitField0_ |= 0x00000004;
         startStep_ = value;
         onChanged();
@@ -55879,28 +58979,27 @@ public final class Service {
       }
       /**
        * <pre>
-       * Optional start step to only fetch metrics after the specified step. Must be defined if
-       * end_step is defined.
+       * Optional first step of the range of steps to export. Must be defined if end_step is defined.
        * </pre>
        *
-       * <code>optional int32 start_step = 3;</code>
+       * <code>optional int64 start_step = 3;</code>
        * @return This builder for chaining.
        */
       public Builder clearStartStep() {
         bitField0_ = (bitField0_ & ~0x00000004);
-        startStep_ = 0;
+        startStep_ = 0L;
         onChanged();
         return this;
       }
 
-      private int endStep_ ;
+      private long endStep_ ;
       /**
        * <pre>
-       * Optional end step to only fetch metrics before the specified step. Must be defined if
+       * Optional last step (inclusive) of the range of steps to export. Must be defined if
        * start_step is defined.
        * </pre>
        *
-       * <code>optional int32 end_step = 4;</code>
+       * <code>optional int64 end_step = 4;</code>
        * @return Whether the endStep field is set.
        */
       @java.lang.Override
@@ -55909,28 +59008,28 @@ public final class Service {
       }
       /**
        * <pre>
-       * Optional end step to only fetch metrics before the specified step. Must be defined if
+       * Optional last step (inclusive) of the range of steps to export. Must be defined if
        * start_step is defined.
        * </pre>
        *
-       * <code>optional int32 end_step = 4;</code>
+       * <code>optional int64 end_step = 4;</code>
        * @return The endStep.
        */
       @java.lang.Override
-      public int getEndStep() {
+      public long getEndStep() {
         return endStep_;
       }
       /**
        * <pre>
-       * Optional end step to only fetch metrics before the specified step. Must be defined if
+       * Optional last step (inclusive) of the range of steps to export. Must be defined if
        * start_step is defined.
        * </pre>
        *
-       * <code>optional int32 end_step = 4;</code>
+       * <code>optional int64 end_step = 4;</code>
        * @param value The endStep to set.
        * @return This builder for chaining.
        */
-      public Builder setEndStep(int value) {
+      public Builder setEndStep(long value) {
         bitField0_ |= 0x00000008;
         endStep_ = value;
         onChanged();
@@ -55938,79 +59037,16 @@ public final class Service {
       }
       /**
        * <pre>
-       * Optional end step to only fetch metrics before the specified step. Must be defined if
+       * Optional last step (inclusive) of the range of steps to export. Must be defined if
        * start_step is defined.
        * </pre>
        *
-       * <code>optional int32 end_step = 4;</code>
+       * <code>optional int64 end_step = 4;</code>
        * @return This builder for chaining.
        */
       public Builder clearEndStep() {
         bitField0_ = (bitField0_ & ~0x00000008);
-        endStep_ = 0;
-        onChanged();
-        return this;
-      }
-
-      private int maxResults_ ;
-      /**
-       * <pre>
-       * Maximum number of results to fetch per run specified. Must be set to a positive number.
-       * Note, in reality, the API returns at most (max_results + # of run IDs) x (# run IDs) metric
-       * data points.
-       * </pre>
-       *
-       * <code>optional int32 max_results = 5;</code>
-       * @return Whether the maxResults field is set.
-       */
-      @java.lang.Override
-      public boolean hasMaxResults() {
-        return ((bitField0_ & 0x00000010) != 0);
-      }
-      /**
-       * <pre>
-       * Maximum number of results to fetch per run specified. Must be set to a positive number.
-       * Note, in reality, the API returns at most (max_results + # of run IDs) x (# run IDs) metric
-       * data points.
-       * </pre>
-       *
-       * <code>optional int32 max_results = 5;</code>
-       * @return The maxResults.
-       */
-      @java.lang.Override
-      public int getMaxResults() {
-        return maxResults_;
-      }
-      /**
-       * <pre>
-       * Maximum number of results to fetch per run specified. Must be set to a positive number.
-       * Note, in reality, the API returns at most (max_results + # of run IDs) x (# run IDs) metric
-       * data points.
-       * </pre>
-       *
-       * <code>optional int32 max_results = 5;</code>
-       * @param value The maxResults to set.
-       * @return This builder for chaining.
-       */
-      public Builder setMaxResults(int value) {
-        bitField0_ |= 0x00000010;
-        maxResults_ = value;
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * Maximum number of results to fetch per run specified. Must be set to a positive number.
-       * Note, in reality, the API returns at most (max_results + # of run IDs) x (# run IDs) metric
-       * data points.
-       * </pre>
-       *
-       * <code>optional int32 max_results = 5;</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearMaxResults() {
-        bitField0_ = (bitField0_ & ~0x00000010);
-        maxResults_ = 0;
+        endStep_ = 0L;
         onChanged();
         return this;
       }
@@ -56027,41 +59063,41 @@ public final class Service {
       }
 
 
-      // @@protoc_insertion_point(builder_scope:mlflow.GetMetricHistoryBulkInterval)
+      // @@protoc_insertion_point(builder_scope:mlflow.ExportMetrics)
     }
 
-    // @@protoc_insertion_point(class_scope:mlflow.GetMetricHistoryBulkInterval)
-    private static final org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval DEFAULT_INSTANCE;
+    // @@protoc_insertion_point(class_scope:mlflow.ExportMetrics)
+    private static final org.mlflow.api.proto.Service.ExportMetrics DEFAULT_INSTANCE;
     static {
-      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval();
+      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.ExportMetrics();
     }
 
-    public static org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval getDefaultInstance() {
+    public static org.mlflow.api.proto.Service.ExportMetrics getDefaultInstance() {
       return DEFAULT_INSTANCE;
     }
 
-    @java.lang.Deprecated public static final com.google.protobuf.Parser<GetMetricHistoryBulkInterval>
-        PARSER = new com.google.protobuf.AbstractParser<GetMetricHistoryBulkInterval>() {
+    @java.lang.Deprecated public static final com.google.protobuf.Parser<ExportMetrics>
+        PARSER = new com.google.protobuf.AbstractParser<ExportMetrics>() {
       @java.lang.Override
-      public GetMetricHistoryBulkInterval parsePartialFrom(
+      public ExportMetrics parsePartialFrom(
           com.google.protobuf.CodedInputStream input,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws com.google.protobuf.InvalidProtocolBufferException {
-        return new GetMetricHistoryBulkInterval(input, extensionRegistry);
+        return new ExportMetrics(input, extensionRegistry);
       }
     };
 
-    public static com.google.protobuf.Parser<GetMetricHistoryBulkInterval> parser() {
+    public static com.google.protobuf.Parser<ExportMetrics> parser() {
       return PARSER;
     }
 
     @java.lang.Override
-    public com.google.protobuf.Parser<GetMetricHistoryBulkInterval> getParserForType() {
+    public com.google.protobuf.Parser<ExportMetrics> getParserForType() {
       return PARSER;
     }
 
     @java.lang.Override
-    public org.mlflow.api.proto.Service.GetMetricHistoryBulkInterval getDefaultInstanceForType() {
+    public org.mlflow.api.proto.Service.ExportMetrics getDefaultInstanceForType() {
       return DEFAULT_INSTANCE;
     }
 
@@ -80823,6 +83859,11 @@ public final class Service {
   private static final 
     com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
       internal_static_mlflow_SearchRuns_fieldAccessorTable;
+  private static final com.google.protobuf.Descriptors.Descriptor
+    internal_static_mlflow_SearchRuns_KeyList_descriptor;
+  private static final 
+    com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+      internal_static_mlflow_SearchRuns_KeyList_fieldAccessorTable;
   private static final com.google.protobuf.Descriptors.Descriptor
     internal_static_mlflow_SearchRuns_Response_descriptor;
   private static final 
@@ -80868,6 +83909,16 @@ public final class Service {
   private static final 
     com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
       internal_static_mlflow_GetMetricHistoryBulkInterval_Response_fieldAccessorTable;
+  private static final com.google.protobuf.Descriptors.Descriptor
+    internal_static_mlflow_ExportMetrics_descriptor;
+  private static final 
+    com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+      internal_static_mlflow_ExportMetrics_fieldAccessorTable;
+  private static final com.google.protobuf.Descriptors.Descriptor
+    internal_static_mlflow_ExportMetrics_Response_descriptor;
+  private static final 
+    com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+      internal_static_mlflow_ExportMetrics_Response_fieldAccessorTable;
   private static final com.google.protobuf.Descriptors.Descriptor
     internal_static_mlflow_LogBatch_descriptor;
   private static final 
@@ -81091,12 +84142,16 @@ public final class Service {
       "abricks.rpc.RPC[$this.Response]\"}\n\006GetRu" +
       "n\022\016\n\006run_id\030\002 \001(\t\022\020\n\010run_uuid\030\001 \001(\t\032$\n\010R" +
       "esponse\022\030\n\003run\030\001 \001(\0132\013.mlflow.Run:+\342?(\n&" +
-      "com.databricks.rpc.RPC[$this.Response]\"\230" +
-      "\002\n\nSearchRuns\022\026\n\016experiment_ids\030\001 \003(\t\022\016\n" +
+      "com.databricks.rpc.RPC[$this.Response]\"\270" +
+      "\003\n\nSearchRuns\022\026\n\016experiment_ids\030\001 \003(\t\022\016\n" +
       "\006filter\030\004 \001(\t\0224\n\rrun_view_type\030\003 \001(\0162\020.m" +
       "lflow.ViewType:\013ACTIVE_ONLY\022\031\n\013max_resul" +
       "ts\030\005 \001(\005:\0041000\022\020\n\010order_by\030\006 \003(\t\022\022\n\npage" +
-      "_token\030\007 \001(\t\032>\n\010Response\022\031\n\004runs\030\001 \003(\0132\013" +
+      "_token\030\007 \001(\t\0223\n\017include_metrics\030\010 \001(\0132\032." +
+      "mlflow.SearchRuns.KeyList\0222\n\016include_par" +
+      "ams\030\t \001(\0132\032.mlflow.SearchRuns.KeyList\022\034\n" +
+      "\016include_inputs\030\n \001(\010:\004true\032\027\n\007KeyList\022\014" +
+      "\n\004keys\030\001 \003(\t\032>\n\010Response\022\031\n\004runs\030\001 \003(\0132\013" +
       ".mlflow.Run\022\027\n\017next_page_token\030\002 \001(\t:+\342?" +
       "(\n&com.databricks.rpc.RPC[$this.Response" +
       "]\"\330\001\n\rListArtifacts\022\016\n\006run_id\030\003 \001(\t\022\020\n\010r" +
@@ -81121,185 +84176,193 @@ public final class Service {
       "onse\022(\n\007metrics\030\001 \003(\0132\027.mlflow.MetricWit" +
       "hRunId:_\342?(\n&com.databricks.rpc.RPC[$thi" +
       "s.Response]\342?1\n/com.databricks.mlflow.ap" +
-      "i.MlflowTrackingMessage\"\261\001\n\010LogBatch\022\016\n\006" +
-      "run_id\030\001 \001(\t\022\037\n\007metrics\030\002 \003(\0132\016.mlflow.M" +
-      "etric\022\035\n\006params\030\003 \003(\0132\r.mlflow.Param\022\034\n\004" +
-      "tags\030\004 \003(\0132\016.mlflow.RunTag\032\n\n\010Response:+" +
-      "\342?(\n&com.databricks.rpc.RPC[$this.Respon" +
-      "se]\"g\n\010LogModel\022\016\n\006run_id\030\001 \001(\t\022\022\n\nmodel" +
-      "_json\030\002 \001(\t\032\n\n\010Response:+\342?(\n&com.databr" +
-      "icks.rpc.RPC[$this.Response]\"\266\001\n\tLogInpu" +
-      "ts\022\024\n\006run_id\030\001 \001(\tB\004\370\206\031\001\022&\n\010datasets\030\002 \003" +
-      "(\0132\024.mlflow.DatasetInput\032\n\n\010Response:_\342?" +
+      "i.MlflowTrackingMessage\"\310\001\n\rExportMetric" +
+      "s\022\017\n\007run_ids\030\001 \003(\t\022\023\n\013metric_keys\030\002 \003(\t\022" +
+      "\022\n\nstart_step\030\003 \001(\003\022\020\n\010end_step\030\004 \001(\003\032\n\n" +
+      "\010Response:_\342?(\n&com.databricks.rpc.RPC[$" +
+      "this.Response]\342?1\n/com.databricks.mlflow" +
+      ".api.MlflowTrackingMessage\"\261\001\n\010LogBatch\022" +
+      "\016\n\006run_id\030\001 \001(\t\022\037\n\007metrics\030\002 \003(\0132\016.mlflo" +
+      "w.Metric\022\035\n\006params\030\003 \003(\0132\r.mlflow.Param\022" +
+      "\034\n\004tags\030\004 \003(\0132\016.mlflow.RunTag\032\n\n\010Respons" +
+      "e:+\342?(\n&com.databricks.rpc.RPC[$this.Res" +
+      "ponse]\"g\n\010LogModel\022\016\n\006run_id\030\001 \001(\t\022\022\n\nmo" +
+      "del_json\030\002 \001(\t\032\n\n\010Response:+\342?(\n&com.dat" +
+      "abricks.rpc.RPC[$this.Response]\"\266\001\n\tLogI" +
+      "nputs\022\024\n\006run_id\030\001 \001(\tB\004\370\206\031\001\022&\n\010datasets\030" +
+      "\002 \003(\0132\024.mlflow.DatasetInput\032\n\n\010Response:" +
+      "_\342?(\n&com.databricks.rpc.RPC[$this.Respo" +
+      "nse]\342?1\n/com.databricks.mlflow.api.Mlflo" +
+      "wTrackingMessage\"\225\001\n\023GetExperimentByName" +
+      "\022\035\n\017experiment_name\030\001 \001(\tB\004\370\206\031\001\0322\n\010Respo" +
+      "nse\022&\n\nexperiment\030\001 \001(\0132\022.mlflow.Experim" +
+      "ent:+\342?(\n&com.databricks.rpc.RPC[$this.R" +
+      "esponse]\"\344\001\n\tTraceInfo\022\022\n\nrequest_id\030\001 \001" +
+      "(\t\022\025\n\rexperiment_id\030\002 \001(\t\022\024\n\014timestamp_m" +
+      "s\030\003 \001(\003\022\031\n\021execution_time_ms\030\004 \001(\003\022#\n\006st" +
+      "atus\030\005 \001(\0162\023.mlflow.TraceStatus\0226\n\020reque" +
+      "st_metadata\030\006 \003(\0132\034.mlflow.TraceRequestM" +
+      "etadata\022\036\n\004tags\030\007 \003(\0132\020.mlflow.TraceTag\"" +
+      "2\n\024TraceRequestMetadata\022\013\n\003key\030\001 \001(\t\022\r\n\005" +
+      "value\030\002 \001(\t\"&\n\010TraceTag\022\013\n\003key\030\001 \001(\t\022\r\n\005" +
+      "value\030\002 \001(\t\"\245\002\n\nStartTrace\022\025\n\rexperiment" +
+      "_id\030\001 \001(\t\022\024\n\014timestamp_ms\030\002 \001(\003\0226\n\020reque" +
+      "st_metadata\030\003 \003(\0132\034.mlflow.TraceRequestM" +
+      "etadata\022\036\n\004tags\030\004 \003(\0132\020.mlflow.TraceTag\032" +
+      "1\n\010Response\022%\n\ntrace_info\030\001 \001(\0132\021.mlflow" +
+      ".TraceInfo:_\342?(\n&com.databricks.rpc.RPC[" +
+      "$this.Response]\342?1\n/com.databricks.mlflo" +
+      "w.api.MlflowTrackingMessage\"\305\002\n\010EndTrace" +
+      "\022\022\n\nrequest_id\030\001 \001(\t\022\024\n\014timestamp_ms\030\002 \001" +
+      "(\003\022#\n\006status\030\003 \001(\0162\023.mlflow.TraceStatus\022" +
+      "6\n\020request_metadata\030\004 \003(\0132\034.mlflow.Trace" +
+      "RequestMetadata\022\036\n\004tags\030\005 \003(\0132\020.mlflow.T" +
+      "raceTag\0321\n\010Response\022%\n\ntrace_info\030\001 \001(\0132" +
+      "\021.mlflow.TraceInfo:_\342?(\n&com.databricks." +
+      "rpc.RPC[$this.Response]\342?1\n/com.databric" +
+      "ks.mlflow.api.MlflowTrackingMessage\"\266\001\n\014" +
+      "GetTraceInfo\022\022\n\nrequest_id\030\001 \001(\t\0321\n\010Resp" +
+      "onse\022%\n\ntrace_info\030\001 \001(\0132\021.mlflow.TraceI" +
+      "nfo:_\342?(\n&com.databricks.rpc.RPC[$this.R" +
+      "esponse]\342?1\n/com.databricks.mlflow.api.M" +
+      "lflowTrackingMessage\"\237\002\n\014SearchTraces\022\026\n" +
+      "\016experiment_ids\030\001 \003(\t\022\016\n\006filter\030\002 \001(\t\022\030\n" +
+      "\013max_results\030\003 \001(\005:\003100\022\020\n\010order_by\030\004 \003(" +
+      "\t\022\022\n\npage_token\030\005 \001(\t\032F\n\010Response\022!\n\006tra" +
+      "ces\030\001 \003(\0132\021.mlflow.TraceInfo\022\027\n\017next_pag" +
+      "e_token\030\002 \001(\t:_\342?(\n&com.databricks.rpc.R" +
+      "PC[$this.Response]\342?1\n/com.databricks.ml" +
+      "flow.api.MlflowTrackingMessage\"\367\001\n\014Delet" +
+      "eTraces\022\033\n\rexperiment_id\030\001 \001(\tB\004\370\206\031\001\022\034\n\024" +
+      "max_timestamp_millis\030\002 \001(\003\022\022\n\nmax_traces" +
+      "\030\003 \001(\005\022\023\n\013request_ids\030\004 \003(\t\032\"\n\010Response\022" +
+      "\026\n\016traces_deleted\030\001 \001(\005:_\342?(\n&com.databr" +
+      "icks.rpc.RPC[$this.Response]\342?1\n/com.dat" +
+      "abricks.mlflow.api.MlflowTrackingMessage" +
+      "\"\252\001\n\013SetTraceTag\022\022\n\nrequest_id\030\001 \001(\t\022\013\n\003" +
+      "key\030\002 \001(\t\022\r\n\005value\030\003 \001(\t\032\n\n\010Response:_\342?" +
       "(\n&com.databricks.rpc.RPC[$this.Response" +
       "]\342?1\n/com.databricks.mlflow.api.MlflowTr" +
-      "ackingMessage\"\225\001\n\023GetExperimentByName\022\035\n" +
-      "\017experiment_name\030\001 \001(\tB\004\370\206\031\001\0322\n\010Response" +
-      "\022&\n\nexperiment\030\001 \001(\0132\022.mlflow.Experiment" +
-      ":+\342?(\n&com.databricks.rpc.RPC[$this.Resp" +
-      "onse]\"\344\001\n\tTraceInfo\022\022\n\nrequest_id\030\001 \001(\t\022" +
-      "\025\n\rexperiment_id\030\002 \001(\t\022\024\n\014timestamp_ms\030\003" +
-      " \001(\003\022\031\n\021execution_time_ms\030\004 \001(\003\022#\n\006statu" +
-      "s\030\005 \001(\0162\023.mlflow.TraceStatus\0226\n\020request_" +
-      "metadata\030\006 \003(\0132\034.mlflow.TraceRequestMeta" +
-      "data\022\036\n\004tags\030\007 \003(\0132\020.mlflow.TraceTag\"2\n\024" +
-      "TraceRequestMetadata\022\013\n\003key\030\001 \001(\t\022\r\n\005val" +
-      "ue\030\002 \001(\t\"&\n\010TraceTag\022\013\n\003key\030\001 \001(\t\022\r\n\005val" +
-      "ue\030\002 \001(\t\"\245\002\n\nStartTrace\022\025\n\rexperiment_id" +
-      "\030\001 \001(\t\022\024\n\014timestamp_ms\030\002 \001(\003\0226\n\020request_" +
-      "metadata\030\003 \003(\0132\034.mlflow.TraceRequestMeta" +
-      "data\022\036\n\004tags\030\004 \003(\0132\020.mlflow.TraceTag\0321\n\010" +
-      "Response\022%\n\ntrace_info\030\001 \001(\0132\021.mlflow.Tr" +
-      "aceInfo:_\342?(\n&com.databricks.rpc.RPC[$th" +
-      "is.Response]\342?1\n/com.databricks.mlflow.a" +
-      "pi.MlflowTrackingMessage\"\305\002\n\010EndTrace\022\022\n" +
-      "\nrequest_id\030\001 \001(\t\022\024\n\014timestamp_ms\030\002 \001(\003\022" +
-      "#\n\006status\030\003 \001(\0162\023.mlflow.TraceStatus\0226\n\020" +
-      "request_metadata\030\004 \003(\0132\034.mlflow.TraceReq" +
-      "uestMetadata\022\036\n\004tags\030\005 \003(\0132\020.mlflow.Trac" +
-      "eTag\0321\n\010Response\022%\n\ntrace_info\030\001 \001(\0132\021.m" +
-      "lflow.TraceInfo:_\342?(\n&com.databricks.rpc" +
-      ".RPC[$this.Response]\342?1\n/com.databricks." +
-      "mlflow.api.MlflowTrackingMessage\"\266\001\n\014Get" +
-      "TraceInfo\022\022\n\nrequest_id\030\001 \001(\t\0321\n\010Respons" +
-      "e\022%\n\ntrace_info\030\001 \001(\0132\021.mlflow.TraceInfo" +
-      ":_\342?(\n&com.databricks.rpc.RPC[$this.Resp" +
-      "onse]\342?1\n/com.databricks.mlflow.api.Mlfl" +
-      "owTrackingMessage\"\237\002\n\014SearchTraces\022\026\n\016ex" +
-      "periment_ids\030\001 \003(\t\022\016\n\006filter\030\002 \001(\t\022\030\n\013ma" +
-      "x_results\030\003 \001(\005:\003100\022\020\n\010order_by\030\004 \003(\t\022\022" +
-      "\n\npage_token\030\005 \001(\t\032F\n\010Response\022!\n\006traces" +
-      "\030\001 \003(\0132\021.mlflow.TraceInfo\022\027\n\017next_page_t" +
-      "oken\030\002 \001(\t:_\342?(\n&com.databricks.rpc.RPC[" +
-      "$this.Response]\342?1\n/com.databricks.mlflo" +
-      "w.api.MlflowTrackingMessage\"\367\001\n\014DeleteTr" +
-      "aces\022\033\n\rexperiment_id\030\001 \001(\tB\004\370\206\031\001\022\034\n\024max" +
-      "_timestamp_millis\030\002 \001(\003\022\022\n\nmax_traces\030\003 " +
-      "\001(\005\022\023\n\013request_ids\030\004 \003(\t\032\"\n\010Response\022\026\n\016" +
-      "traces_deleted\030\001 \001(\005:_\342?(\n&com.databrick" +
-      "s.rpc.RPC[$this.Response]\342?1\n/com.databr" +
-      "icks.mlflow.api.MlflowTrackingMessage\"\252\001" +
-      "\n\013SetTraceTag\022\022\n\nrequest_id\030\001 \001(\t\022\013\n\003key" +
-      "\030\002 \001(\t\022\r\n\005value\030\003 \001(\t\032\n\n\010Response:_\342?(\n&" +
-      "com.databricks.rpc.RPC[$this.Response]\342?" +
-      "1\n/com.databricks.mlflow.api.MlflowTrack" +
-      "ingMessage\"\236\001\n\016DeleteTraceTag\022\022\n\nrequest" +
-      "_id\030\001 \001(\t\022\013\n\003key\030\002 \001(\t\032\n\n\010Response:_\342?(\n" +
-      "&com.databricks.rpc.RPC[$this.Response]\342" +
-      "?1\n/com.databricks.mlflow.api.MlflowTrac" +
-      "kingMessage*6\n\010ViewType\022\017\n\013ACTIVE_ONLY\020\001" +
-      "\022\020\n\014DELETED_ONLY\020\002\022\007\n\003ALL\020\003*I\n\nSourceTyp" +
-      "e\022\014\n\010NOTEBOOK\020\001\022\007\n\003JOB\020\002\022\013\n\007PROJECT\020\003\022\t\n" +
-      "\005LOCAL\020\004\022\014\n\007UNKNOWN\020\350\007*M\n\tRunStatus\022\013\n\007R" +
-      "UNNING\020\001\022\r\n\tSCHEDULED\020\002\022\014\n\010FINISHED\020\003\022\n\n" +
-      "\006FAILED\020\004\022\n\n\006KILLED\020\005*O\n\013TraceStatus\022\034\n\030" +
-      "TRACE_STATUS_UNSPECIFIED\020\000\022\006\n\002OK\020\001\022\t\n\005ER" +
-      "ROR\020\002\022\017\n\013IN_PROGRESS\020\0032\321 \n\rMlflowService" +
-      "\022\246\001\n\023getExperimentByName\022\033.mlflow.GetExp" +
-      "erimentByName\032$.mlflow.GetExperimentByNa" +
-      "me.Response\"L\362\206\031H\n,\n\003GET\022\037/mlflow/experi" +
-      "ments/get-by-name\032\004\010\002\020\000\020\001*\026Get Experimen" +
-      "t By Name\022\224\001\n\020createExperiment\022\030.mlflow." +
-      "CreateExperiment\032!.mlflow.CreateExperime" +
-      "nt.Response\"C\362\206\031?\n(\n\004POST\022\032/mlflow/exper" +
-      "iments/create\032\004\010\002\020\000\020\001*\021Create Experiment" +
-      "\022\301\001\n\021searchExperiments\022\031.mlflow.SearchEx" +
-      "periments\032\".mlflow.SearchExperiments.Res" +
-      "ponse\"m\362\206\031i\n(\n\004POST\022\032/mlflow/experiments" +
-      "/search\032\004\010\002\020\000\n\'\n\003GET\022\032/mlflow/experiment" +
-      "s/search\032\004\010\002\020\000\020\001*\022Search Experiments\022\210\001\n" +
-      "\rgetExperiment\022\025.mlflow.GetExperiment\032\036." +
-      "mlflow.GetExperiment.Response\"@\362\206\0318\n$\n\003G" +
-      "ET\022\027/mlflow/experiments/get\032\004\010\002\020\000\020\001*\016Get" +
-      " Experiment\272\214\031\000\022\224\001\n\020deleteExperiment\022\030.m" +
-      "lflow.DeleteExperiment\032!.mlflow.DeleteEx" +
-      "periment.Response\"C\362\206\031?\n(\n\004POST\022\032/mlflow" +
-      "/experiments/delete\032\004\010\002\020\000\020\001*\021Delete Expe" +
-      "riment\022\231\001\n\021restoreExperiment\022\031.mlflow.Re" +
-      "storeExperiment\032\".mlflow.RestoreExperime" +
-      "nt.Response\"E\362\206\031A\n)\n\004POST\022\033/mlflow/exper" +
-      "iments/restore\032\004\010\002\020\000\020\001*\022Restore Experime" +
-      "nt\022\224\001\n\020updateExperiment\022\030.mlflow.UpdateE" +
-      "xperiment\032!.mlflow.UpdateExperiment.Resp" +
-      "onse\"C\362\206\031?\n(\n\004POST\022\032/mlflow/experiments/" +
-      "update\032\004\010\002\020\000\020\001*\021Update Experiment\022q\n\tcre" +
-      "ateRun\022\021.mlflow.CreateRun\032\032.mlflow.Creat" +
-      "eRun.Response\"5\362\206\0311\n!\n\004POST\022\023/mlflow/run" +
-      "s/create\032\004\010\002\020\000\020\001*\nCreate Run\022q\n\tupdateRu" +
-      "n\022\021.mlflow.UpdateRun\032\032.mlflow.UpdateRun." +
-      "Response\"5\362\206\0311\n!\n\004POST\022\023/mlflow/runs/upd" +
-      "ate\032\004\010\002\020\000\020\001*\nUpdate Run\022q\n\tdeleteRun\022\021.m" +
-      "lflow.DeleteRun\032\032.mlflow.DeleteRun.Respo" +
-      "nse\"5\362\206\0311\n!\n\004POST\022\023/mlflow/runs/delete\032\004" +
-      "\010\002\020\000\020\001*\nDelete Run\022v\n\nrestoreRun\022\022.mlflo" +
-      "w.RestoreRun\032\033.mlflow.RestoreRun.Respons" +
-      "e\"7\362\206\0313\n\"\n\004POST\022\024/mlflow/runs/restore\032\004\010" +
-      "\002\020\000\020\001*\013Restore Run\022u\n\tlogMetric\022\021.mlflow" +
-      ".LogMetric\032\032.mlflow.LogMetric.Response\"9" +
-      "\362\206\0315\n%\n\004POST\022\027/mlflow/runs/log-metric\032\004\010" +
-      "\002\020\000\020\001*\nLog Metric\022t\n\010logParam\022\020.mlflow.L" +
-      "ogParam\032\031.mlflow.LogParam.Response\";\362\206\0317" +
-      "\n(\n\004POST\022\032/mlflow/runs/log-parameter\032\004\010\002" +
-      "\020\000\020\001*\tLog Param\022\241\001\n\020setExperimentTag\022\030.m" +
-      "lflow.SetExperimentTag\032!.mlflow.SetExper" +
-      "imentTag.Response\"P\362\206\031L\n4\n\004POST\022&/mlflow" +
-      "/experiments/set-experiment-tag\032\004\010\002\020\000\020\001*" +
-      "\022Set Experiment Tag\022f\n\006setTag\022\016.mlflow.S" +
-      "etTag\032\027.mlflow.SetTag.Response\"3\362\206\031/\n\"\n\004" +
-      "POST\022\024/mlflow/runs/set-tag\032\004\010\002\020\000\020\001*\007Set " +
-      "Tag\022\210\001\n\013setTraceTag\022\023.mlflow.SetTraceTag" +
-      "\032\034.mlflow.SetTraceTag.Response\"F\362\206\031B\n/\n\005" +
-      "PATCH\022 /mlflow/traces/{request_id}/tags\032" +
-      "\004\010\002\020\000\020\003*\rSet Trace Tag\022\225\001\n\016deleteTraceTa" +
-      "g\022\026.mlflow.DeleteTraceTag\032\037.mlflow.Delet" +
-      "eTraceTag.Response\"J\362\206\031F\n0\n\006DELETE\022 /mlf" +
-      "low/traces/{request_id}/tags\032\004\010\002\020\000\020\003*\020De" +
-      "lete Trace Tag\022u\n\tdeleteTag\022\021.mlflow.Del" +
-      "eteTag\032\032.mlflow.DeleteTag.Response\"9\362\206\0315" +
-      "\n%\n\004POST\022\027/mlflow/runs/delete-tag\032\004\010\002\020\000\020" +
-      "\001*\nDelete Tag\022e\n\006getRun\022\016.mlflow.GetRun\032" +
-      "\027.mlflow.GetRun.Response\"2\362\206\031*\n\035\n\003GET\022\020/" +
-      "mlflow/runs/get\032\004\010\002\020\000\020\001*\007Get Run\272\214\031\000\022u\n\n" +
-      "searchRuns\022\022.mlflow.SearchRuns\032\033.mlflow." +
-      "SearchRuns.Response\"6\362\206\0312\n!\n\004POST\022\023/mlfl" +
-      "ow/runs/search\032\004\010\002\020\000\020\001*\013Search Runs\022\203\001\n\r" +
-      "listArtifacts\022\025.mlflow.ListArtifacts\032\036.m" +
-      "lflow.ListArtifacts.Response\";\362\206\0317\n#\n\003GE" +
-      "T\022\026/mlflow/artifacts/list\032\004\010\002\020\000\020\001*\016List " +
-      "Artifacts\022\225\001\n\020getMetricHistory\022\030.mlflow." +
-      "GetMetricHistory\032!.mlflow.GetMetricHisto" +
-      "ry.Response\"D\362\206\031@\n(\n\003GET\022\033/mlflow/metric" +
-      "s/get-history\032\004\010\002\020\000\020\001*\022Get Metric Histor" +
-      "y\022\263\001\n\034getMetricHistoryBulkInterval\022$.mlf" +
-      "low.GetMetricHistoryBulkInterval\032-.mlflo" +
-      "w.GetMetricHistoryBulkInterval.Response\"" +
-      ">\362\206\031:\n6\n\003GET\022)/mlflow/metrics/get-histor" +
-      "y-bulk-interval\032\004\010\002\020\013\020\003\022p\n\010logBatch\022\020.ml" +
-      "flow.LogBatch\032\031.mlflow.LogBatch.Response" +
-      "\"7\362\206\0313\n$\n\004POST\022\026/mlflow/runs/log-batch\032\004" +
-      "\010\002\020\000\020\001*\tLog Batch\022p\n\010logModel\022\020.mlflow.L" +
-      "ogModel\032\031.mlflow.LogModel.Response\"7\362\206\0313" +
-      "\n$\n\004POST\022\026/mlflow/runs/log-model\032\004\010\002\020\000\020\001" +
-      "*\tLog Model\022u\n\tlogInputs\022\021.mlflow.LogInp" +
-      "uts\032\032.mlflow.LogInputs.Response\"9\362\206\0315\n%\n" +
-      "\004POST\022\027/mlflow/runs/log-inputs\032\004\010\002\020\000\020\001*\n" +
-      "Log Inputs\022p\n\nstartTrace\022\022.mlflow.StartT" +
-      "race\032\033.mlflow.StartTrace.Response\"1\362\206\031-\n" +
-      "\034\n\004POST\022\016/mlflow/traces\032\004\010\002\020\000\020\003*\013Start T" +
-      "race\022v\n\010endTrace\022\020.mlflow.EndTrace\032\031.mlf" +
-      "low.EndTrace.Response\"=\362\206\0319\n*\n\005PATCH\022\033/m" +
-      "lflow/traces/{request_id}\032\004\010\002\020\000\020\003*\tEnd T" +
-      "race\022\211\001\n\014getTraceInfo\022\024.mlflow.GetTraceI" +
-      "nfo\032\035.mlflow.GetTraceInfo.Response\"D\362\206\031@" +
-      "\n-\n\003GET\022 /mlflow/traces/{request_id}/inf" +
-      "o\032\004\010\002\020\000\020\003*\rGet TraceInfo\022w\n\014searchTraces" +
-      "\022\024.mlflow.SearchTraces\032\035.mlflow.SearchTr" +
-      "aces.Response\"2\362\206\031.\n\033\n\003GET\022\016/mlflow/trac" +
-      "es\032\004\010\002\020\000\020\003*\rSearch Traces\022\206\001\n\014deleteTrac" +
-      "es\022\024.mlflow.DeleteTraces\032\035.mlflow.Delete" +
-      "Traces.Response\"A\362\206\031=\n*\n\004POST\022\034/mlflow/t" +
-      "races/delete-traces\032\004\010\002\020\000\020\003*\rDelete Trac" +
-      "esB\036\n\024org.mlflow.api.proto\220\001\001\342?\002\020\001"
+      "ackingMessage\"\236\001\n\016DeleteTraceTag\022\022\n\nrequ" +
+      "est_id\030\001 \001(\t\022\013\n\003key\030\002 \001(\t\032\n\n\010Response:_\342" +
+      "?(\n&com.databricks.rpc.RPC[$this.Respons" +
+      "e]\342?1\n/com.databricks.mlflow.api.MlflowT" +
+      "rackingMessage*6\n\010ViewType\022\017\n\013ACTIVE_ONL" +
+      "Y\020\001\022\020\n\014DELETED_ONLY\020\002\022\007\n\003ALL\020\003*I\n\nSource" +
+      "Type\022\014\n\010NOTEBOOK\020\001\022\007\n\003JOB\020\002\022\013\n\007PROJECT\020\003" +
+      "\022\t\n\005LOCAL\020\004\022\014\n\007UNKNOWN\020\350\007*M\n\tRunStatus\022\013" +
+      "\n\007RUNNING\020\001\022\r\n\tSCHEDULED\020\002\022\014\n\010FINISHED\020\003" +
+      "\022\n\n\006FAILED\020\004\022\n\n\006KILLED\020\005*O\n\013TraceStatus\022" +
+      "\034\n\030TRACE_STATUS_UNSPECIFIED\020\000\022\006\n\002OK\020\001\022\t\n" +
+      "\005ERROR\020\002\022\017\n\013IN_PROGRESS\020\0032\307!\n\rMlflowServ" +
+      "ice\022\246\001\n\023getExperimentByName\022\033.mlflow.Get" +
+      "ExperimentByName\032$.mlflow.GetExperimentB" +
+      "yName.Response\"L\362\206\031H\n,\n\003GET\022\037/mlflow/exp" +
+      "eriments/get-by-name\032\004\010\002\020\000\020\001*\026Get Experi" +
+      "ment By Name\022\224\001\n\020createExperiment\022\030.mlfl" +
+      "ow.CreateExperiment\032!.mlflow.CreateExper" +
+      "iment.Response\"C\362\206\031?\n(\n\004POST\022\032/mlflow/ex" +
+      "periments/create\032\004\010\002\020\000\020\001*\021Create Experim" +
+      "ent\022\301\001\n\021searchExperiments\022\031.mlflow.Searc" +
+      "hExperiments\032\".mlflow.SearchExperiments." +
+      "Response\"m\362\206\031i\n(\n\004POST\022\032/mlflow/experime" +
+      "nts/search\032\004\010\002\020\000\n\'\n\003GET\022\032/mlflow/experim" +
+      "ents/search\032\004\010\002\020\000\020\001*\022Search Experiments\022" +
+      "\210\001\n\rgetExperiment\022\025.mlflow.GetExperiment" +
+      "\032\036.mlflow.GetExperiment.Response\"@\362\206\0318\n$" +
+      "\n\003GET\022\027/mlflow/experiments/get\032\004\010\002\020\000\020\001*\016" +
+      "Get Experiment\272\214\031\000\022\224\001\n\020deleteExperiment\022" +
+      "\030.mlflow.DeleteExperiment\032!.mlflow.Delet" +
+      "eExperiment.Response\"C\362\206\031?\n(\n\004POST\022\032/mlf" +
+      "low/experiments/delete\032\004\010\002\020\000\020\001*\021Delete E" +
+      "xperiment\022\231\001\n\021restoreExperiment\022\031.mlflow" +
+      ".RestoreExperiment\032\".mlflow.RestoreExper" +
+      "iment.Response\"E\362\206\031A\n)\n\004POST\022\033/mlflow/ex" +
+      "periments/restore\032\004\010\002\020\000\020\001*\022Restore Exper" +
+      "iment\022\224\001\n\020updateExperiment\022\030.mlflow.Upda" +
+      "teExperiment\032!.mlflow.UpdateExperiment.R" +
+      "esponse\"C\362\206\031?\n(\n\004POST\022\032/mlflow/experimen" +
+      "ts/update\032\004\010\002\020\000\020\001*\021Update Experiment\022q\n\t" +
+      "createRun\022\021.mlflow.CreateRun\032\032.mlflow.Cr" +
+      "eateRun.Response\"5\362\206\0311\n!\n\004POST\022\023/mlflow/" +
+      "runs/create\032\004\010\002\020\000\020\001*\nCreate Run\022q\n\tupdat" +
+      "eRun\022\021.mlflow.UpdateRun\032\032.mlflow.UpdateR" +
+      "un.Response\"5\362\206\0311\n!\n\004POST\022\023/mlflow/runs/" +
+      "update\032\004\010\002\020\000\020\001*\nUpdate Run\022q\n\tdeleteRun\022" +
+      "\021.mlflow.DeleteRun\032\032.mlflow.DeleteRun.Re" +
+      "sponse\"5\362\206\0311\n!\n\004POST\022\023/mlflow/runs/delet" +
+      "e\032\004\010\002\020\000\020\001*\nDelete Run\022v\n\nrestoreRun\022\022.ml" +
+      "flow.RestoreRun\032\033.mlflow.RestoreRun.Resp" +
+      "onse\"7\362\206\0313\n\"\n\004POST\022\024/mlflow/runs/restore" +
+      "\032\004\010\002\020\000\020\001*\013Restore Run\022u\n\tlogMetric\022\021.mlf" +
+      "low.LogMetric\032\032.mlflow.LogMetric.Respons" +
+      "e\"9\362\206\0315\n%\n\004POST\022\027/mlflow/runs/log-metric" +
+      "\032\004\010\002\020\000\020\001*\nLog Metric\022t\n\010logParam\022\020.mlflo" +
+      "w.LogParam\032\031.mlflow.LogParam.Response\";\362" +
+      "\206\0317\n(\n\004POST\022\032/mlflow/runs/log-parameter\032" +
+      "\004\010\002\020\000\020\001*\tLog Param\022\241\001\n\020setExperimentTag\022" +
+      "\030.mlflow.SetExperimentTag\032!.mlflow.SetEx" +
+      "perimentTag.Response\"P\362\206\031L\n4\n\004POST\022&/mlf" +
+      "low/experiments/set-experiment-tag\032\004\010\002\020\000" +
+      "\020\001*\022Set Experiment Tag\022f\n\006setTag\022\016.mlflo" +
+      "w.SetTag\032\027.mlflow.SetTag.Response\"3\362\206\031/\n" +
+      "\"\n\004POST\022\024/mlflow/runs/set-tag\032\004\010\002\020\000\020\001*\007S" +
+      "et Tag\022\210\001\n\013setTraceTag\022\023.mlflow.SetTrace" +
+      "Tag\032\034.mlflow.SetTraceTag.Response\"F\362\206\031B\n" +
+      "/\n\005PATCH\022 /mlflow/traces/{request_id}/ta" +
+      "gs\032\004\010\002\020\000\020\003*\rSet Trace Tag\022\225\001\n\016deleteTrac" +
+      "eTag\022\026.mlflow.DeleteTraceTag\032\037.mlflow.De" +
+      "leteTraceTag.Response\"J\362\206\031F\n0\n\006DELETE\022 /" +
+      "mlflow/traces/{request_id}/tags\032\004\010\002\020\000\020\003*" +
+      "\020Delete Trace Tag\022u\n\tdeleteTag\022\021.mlflow." +
+      "DeleteTag\032\032.mlflow.DeleteTag.Response\"9\362" +
+      "\206\0315\n%\n\004POST\022\027/mlflow/runs/delete-tag\032\004\010\002" +
+      "\020\000\020\001*\nDelete Tag\022e\n\006getRun\022\016.mlflow.GetR" +
+      "un\032\027.mlflow.GetRun.Response\"2\362\206\031*\n\035\n\003GET" +
+      "\022\020/mlflow/runs/get\032\004\010\002\020\000\020\001*\007Get Run\272\214\031\000\022" +
+      "u\n\nsearchRuns\022\022.mlflow.SearchRuns\032\033.mlfl" +
+      "ow.SearchRuns.Response\"6\362\206\0312\n!\n\004POST\022\023/m" +
+      "lflow/runs/search\032\004\010\002\020\000\020\001*\013Search Runs\022\203" +
+      "\001\n\rlistArtifacts\022\025.mlflow.ListArtifacts\032" +
+      "\036.mlflow.ListArtifacts.Response\";\362\206\0317\n#\n" +
+      "\003GET\022\026/mlflow/artifacts/list\032\004\010\002\020\000\020\001*\016Li" +
+      "st Artifacts\022\225\001\n\020getMetricHistory\022\030.mlfl" +
+      "ow.GetMetricHistory\032!.mlflow.GetMetricHi" +
+      "story.Response\"D\362\206\031@\n(\n\003GET\022\033/mlflow/met" +
+      "rics/get-history\032\004\010\002\020\000\020\001*\022Get Metric His" +
+      "tory\022\263\001\n\034getMetricHistoryBulkInterval\022$." +
+      "mlflow.GetMetricHistoryBulkInterval\032-.ml" +
+      "flow.GetMetricHistoryBulkInterval.Respon" +
+      "se\">\362\206\031:\n6\n\003GET\022)/mlflow/metrics/get-his" +
+      "tory-bulk-interval\032\004\010\002\020\013\020\003\022t\n\rexportMetr" +
+      "ics\022\025.mlflow.ExportMetrics\032\036.mlflow.Expo" +
+      "rtMetrics.Response\",\362\206\031(\n$\n\004POST\022\026/mlflo" +
+      "w/metrics/export\032\004\010\002\020\016\020\003\022p\n\010logBatch\022\020.m" +
+      "lflow.LogBatch\032\031.mlflow.LogBatch.Respons" +
+      "e\"7\362\206\0313\n$\n\004POST\022\026/mlflow/runs/log-batch\032" +
+      "\004\010\002\020\000\020\001*\tLog Batch\022p\n\010logModel\022\020.mlflow." +
+      "LogModel\032\031.mlflow.LogModel.Response\"7\362\206\031" +
+      "3\n$\n\004POST\022\026/mlflow/runs/log-model\032\004\010\002\020\000\020" +
+      "\001*\tLog Model\022u\n\tlogInputs\022\021.mlflow.LogIn" +
+      "puts\032\032.mlflow.LogInputs.Response\"9\362\206\0315\n%" +
+      "\n\004POST\022\027/mlflow/runs/log-inputs\032\004\010\002\020\000\020\001*" +
+      "\nLog Inputs\022p\n\nstartTrace\022\022.mlflow.Start" +
+      "Trace\032\033.mlflow.StartTrace.Response\"1\362\206\031-" +
+      "\n\034\n\004POST\022\016/mlflow/traces\032\004\010\002\020\000\020\003*\013Start " +
+      "Trace\022v\n\010endTrace\022\020.mlflow.EndTrace\032\031.ml" +
+      "flow.EndTrace.Response\"=\362\206\0319\n*\n\005PATCH\022\033/" +
+      "mlflow/traces/{request_id}\032\004\010\002\020\000\020\003*\tEnd " +
+      "Trace\022\211\001\n\014getTraceInfo\022\024.mlflow.GetTrace" +
+      "Info\032\035.mlflow.GetTraceInfo.Response\"D\362\206\031" +
+      "@\n-\n\003GET\022 /mlflow/traces/{request_id}/in" +
+      "fo\032\004\010\002\020\000\020\003*\rGet TraceInfo\022w\n\014searchTrace" +
+      "s\022\024.mlflow.SearchTraces\032\035.mlflow.SearchT" +
+      "races.Response\"2\362\206\031.\n\033\n\003GET\022\016/mlflow/tra" +
+      "ces\032\004\010\002\020\000\020\003*\rSearch Traces\022\206\001\n\014deleteTra" +
+      "ces\022\024.mlflow.DeleteTraces\032\035.mlflow.Delet" +
+      "eTraces.Response\"A\362\206\031=\n*\n\004POST\022\034/mlflow/" +
+      "traces/delete-traces\032\004\010\002\020\000\020\003*\rDelete Tra" +
+      "cesB\036\n\024org.mlflow.api.proto\220\001\001\342?\002\020\001"
     };
     descriptor = com.google.protobuf.Descriptors.FileDescriptor
       .internalBuildGeneratedFileFrom(descriptorData,
@@ -81576,9 +84639,15 @@ public final class Service {
     internal_static_mlflow_SearchRuns_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_SearchRuns_descriptor,
-        new java.lang.String[] { "ExperimentIds", "Filter", "RunViewType", "MaxResults", "OrderBy", "PageToken", });
-    internal_static_mlflow_SearchRuns_Response_descriptor =
+        new java.lang.String[] { "ExperimentIds", "Filter", "RunViewType", "MaxResults", "OrderBy", "PageToken", "IncludeMetrics", "IncludeParams", "IncludeInputs", });
+    internal_static_mlflow_SearchRuns_KeyList_descriptor =
       internal_static_mlflow_SearchRuns_descriptor.getNestedTypes().get(0);
+    internal_static_mlflow_SearchRuns_KeyList_fieldAccessorTable = new
+      com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
+        internal_static_mlflow_SearchRuns_KeyList_descriptor,
+        new java.lang.String[] { "Keys", });
+    internal_static_mlflow_SearchRuns_Response_descriptor =
+      internal_static_mlflow_SearchRuns_descriptor.getNestedTypes().get(1);
     internal_static_mlflow_SearchRuns_Response_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_SearchRuns_Response_descriptor,
@@ -81631,8 +84700,20 @@ public final class Service {
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_GetMetricHistoryBulkInterval_Response_descriptor,
         new java.lang.String[] { "Metrics", });
-    internal_static_mlflow_LogBatch_descriptor =
+    internal_static_mlflow_ExportMetrics_descriptor =
       getDescriptor().getMessageTypes().get(34);
+    internal_static_mlflow_ExportMetrics_fieldAccessorTable = new
+      com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
+        internal_static_mlflow_ExportMetrics_descriptor,
+        new java.lang.String[] { "RunIds", "MetricKeys", "StartStep", "EndStep", });
+    internal_static_mlflow_ExportMetrics_Response_descriptor =
+      internal_static_mlflow_ExportMetrics_descriptor.getNestedTypes().get(0);
+    internal_static_mlflow_ExportMetrics_Response_fieldAccessorTable = new
+      com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
+        internal_static_mlflow_ExportMetrics_Response_descriptor,
+        new java.lang.String[] { });
+    internal_static_mlflow_LogBatch_descriptor =
+      getDescriptor().getMessageTypes().get(35);
     internal_static_mlflow_LogBatch_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_LogBatch_descriptor,
@@ -81644,7 +84725,7 @@ public final class Service {
         internal_static_mlflow_LogBatch_Response_descriptor,
         new java.lang.String[] { });
     internal_static_mlflow_LogModel_descriptor =
-      getDescriptor().getMessageTypes().get(35);
+      getDescriptor().getMessageTypes().get(36);
     internal_static_mlflow_LogModel_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_LogModel_descriptor,
@@ -81656,7 +84737,7 @@ public final class Service {
         internal_static_mlflow_LogModel_Response_descriptor,
         new java.lang.String[] { });
     internal_static_mlflow_LogInputs_descriptor =
-      getDescriptor().getMessageTypes().get(36);
+      getDescriptor().getMessageTypes().get(37);
     internal_static_mlflow_LogInputs_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_LogInputs_descriptor,
@@ -81668,7 +84749,7 @@ public final class Service {
         internal_static_mlflow_LogInputs_Response_descriptor,
         new java.lang.String[] { });
     internal_static_mlflow_GetExperimentByName_descriptor =
-      getDescriptor().getMessageTypes().get(37);
+      getDescriptor().getMessageTypes().get(38);
     internal_static_mlflow_GetExperimentByName_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_GetExperimentByName_descriptor,
@@ -81680,25 +84761,25 @@ public final class Service {
         internal_static_mlflow_GetExperimentByName_Response_descriptor,
         new java.lang.String[] { "Experiment", });
     internal_static_mlflow_TraceInfo_descriptor =
-      getDescriptor().getMessageTypes().get(38);
+      getDescriptor().getMessageTypes().get(39);
     internal_static_mlflow_TraceInfo_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_TraceInfo_descriptor,
         new java.lang.String[] { "RequestId", "ExperimentId", "TimestampMs", "ExecutionTimeMs", "Status", "RequestMetadata", "Tags", });
     internal_static_mlflow_TraceRequestMetadata_descriptor =
-      getDescriptor().getMessageTypes().get(39);
+      getDescriptor().getMessageTypes().get(40);
     internal_static_mlflow_TraceRequestMetadata_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_TraceRequestMetadata_descriptor,
         new java.lang.String[] { "Key", "Value", });
     internal_static_mlflow_TraceTag_descriptor =
-      getDescriptor().getMessageTypes().get(40);
+      getDescriptor().getMessageTypes().get(41);
     internal_static_mlflow_TraceTag_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_TraceTag_descriptor,
         new java.lang.String[] { "Key", "Value", });
     internal_static_mlflow_StartTrace_descriptor =
-      getDescriptor().getMessageTypes().get(41);
+      getDescriptor().getMessageTypes().get(42);
     internal_static_mlflow_StartTrace_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_StartTrace_descriptor,
@@ -81710,7 +84791,7 @@ public final class Service {
         internal_static_mlflow_StartTrace_Response_descriptor,
         new java.lang.String[] { "TraceInfo", });
     internal_static_mlflow_EndTrace_descriptor =
-      getDescriptor().getMessageTypes().get(42);
+      getDescriptor().getMessageTypes().get(43);
     internal_static_mlflow_EndTrace_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_EndTrace_descriptor,
@@ -81722,7 +84803,7 @@ public final class Service {
         internal_static_mlflow_EndTrace_Response_descriptor,
         new java.lang.String[] { "TraceInfo", });
     internal_static_mlflow_GetTraceInfo_descriptor =
-      getDescriptor().getMessageTypes().get(43);
+      getDescriptor().getMessageTypes().get(44);
     internal_static_mlflow_GetTraceInfo_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_GetTraceInfo_descriptor,
@@ -81734,7 +84815,7 @@ public final class Service {
         internal_static_mlflow_GetTraceInfo_Response_descriptor,
         new java.lang.String[] { "TraceInfo", });
     internal_static_mlflow_SearchTraces_descriptor =
-      getDescriptor().getMessageTypes().get(44);
+      getDescriptor().getMessageTypes().get(45);
     internal_static_mlflow_SearchTraces_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_SearchTraces_descriptor,
@@ -81746,7 +84827,7 @@ public final class Service {
         internal_static_mlflow_SearchTraces_Response_descriptor,
         new java.lang.String[] { "Traces", "NextPageToken", });
     internal_static_mlflow_DeleteTraces_descriptor =
-      getDescriptor().getMessageTypes().get(45);
+      getDescriptor().getMessageTypes().get(46);
     internal_static_mlflow_DeleteTraces_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_DeleteTraces_descriptor,
@@ -81758,7 +84839,7 @@ public final class Service {
         internal_static_mlflow_DeleteTraces_Response_descriptor,
         new java.lang.String[] { "TracesDeleted", });
     internal_static_mlflow_SetTraceTag_descriptor =
-      getDescriptor().getMessageTypes().get(46);
+      getDescriptor().getMessageTypes().get(47);
     internal_static_mlflow_SetTraceTag_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_SetTraceTag_descriptor,
@@ -81770,7 +84851,7 @@ public final class Service {
         internal_static_mlflow_SetTraceTag_Response_descriptor,
         new java.lang.String[] { });
     internal_static_mlflow_DeleteTraceTag_descriptor =
-      getDescriptor().getMessageTypes().get(47);
+      getDescriptor().getMessageTypes().get(48);
     internal_static_mlflow_DeleteTraceTag_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_DeleteTraceTag_descriptor,
@@ -56,6 +56,7 @@ from typing import Any, Dict, Optional
 import yaml
 
 import mlflow
+import mlflow.tracking.fluent
 from mlflow import mleap, pyfunc
 from mlflow.environment_variables import MLFLOW_DFS_TMP
 from mlflow.models import Model
@@ -30,16 +30,9 @@ The built-in flavors are:
 
 For details, see `MLflow Models <../models.html>`_.
 """
+from typing import TYPE_CHECKING
+
 from mlflow.models.dependencies_schemas import set_retriever_schema
-from mlflow.models.evaluation import (
-    EvaluationArtifact,
-    EvaluationMetric,
-    EvaluationResult,
-    MetricThreshold,
-    evaluate,
-    list_evaluators,
-    make_metric,
-)
 from mlflow.models.flavor_backend import FlavorBackend
 from mlflow.models.model import Model, get_model_info, set_model
 from mlflow.models.model_config import ModelConfig
@@ -47,6 +40,29 @@ from mlflow.models.python_api import build_docker
 from mlflow.models.resources import Resource, ResourceType
 from mlflow.utils.environment import infer_pip_requirements
 
+# Model evaluation depends on `mlflow.data` and the evaluators, which are only imported on first use
+# so that loading models, e.g. with `mlflow.pyfunc.load_model`, doesn't import them
+_EVALUATION_ATTRIBUTES = {
+    "EvaluationArtifact",
+    "EvaluationMetric",
+    "EvaluationResult",
+    "MetricThreshold",
+    "evaluate",
+    "list_evaluators",
+    "make_metric",
+}
+
+if TYPE_CHECKING:
+    from mlflow.models.evaluation import (
+        EvaluationArtifact,
+        EvaluationMetric,
+        EvaluationResult,
+        MetricThreshold,
+        evaluate,
+        list_evaluators,
+        make_metric,
+    )
+
 __all__ = [
     "Model",
     "FlavorBackend",
@@ -86,3 +102,11 @@ try:
     ]
 except ImportError:
     pass
+
+
+def __getattr__(name):
+    if name in _EVALUATION_ATTRIBUTES:
+        from mlflow.models import evaluation
+
+        return getattr(evaluation, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
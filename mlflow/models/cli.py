@@ -1,4 +1,5 @@
 import logging
+import tempfile
 
 import click
 from packaging.requirements import InvalidRequirement, Requirement
@@ -32,6 +33,9 @@ def commands():
 @cli_args.NO_CONDA
 @cli_args.INSTALL_MLFLOW
 @cli_args.ENABLE_MLSERVER
+@cli_args.ENABLE_BATCHING
+@cli_args.MAX_BATCH_SIZE
+@cli_args.MAX_BATCH_DELAY_MS
 def serve(
     model_uri,
     port,
@@ -42,6 +46,9 @@ def serve(
     no_conda=False,
     install_mlflow=False,
     enable_mlserver=False,
+    enable_batching=False,
+    max_batch_size=64,
+    max_batch_delay_ms=5,
 ):
     """
     Serve a model saved with MLflow by launching a webserver on the specified host and port.
@@ -97,11 +104,25 @@ def serve(
             ]
         }'
 
+    To score concurrent requests in batches of up to 64 rows, waiting at most 5 milliseconds for
+    a batch to fill up:
+
+    .. code-block:: bash
+
+        $ mlflow models serve -m runs:/my-run-id/model-path \\
+            --enable-batching --max-batch-size 64 --max-batch-delay-ms 5
+
     """
     env_manager = _EnvManager.LOCAL if no_conda else env_manager
 
     return get_flavor_backend(
-        model_uri, env_manager=env_manager, workers=workers, install_mlflow=install_mlflow
+        model_uri,
+        env_manager=env_manager,
+        workers=workers,
+        install_mlflow=install_mlflow,
+        enable_batching=enable_batching,
+        max_batch_size=max_batch_size,
+        max_batch_delay_ms=max_batch_delay_ms,
     ).serve(
         model_uri=model_uri, port=port, host=host, timeout=timeout, enable_mlserver=enable_mlserver
     )
@@ -161,6 +182,71 @@ def prepare_env(
     ).prepare_env(model_uri=model_uri)
 
 
+@commands.group("env-cache")
+def env_cache_commands():
+    """
+    Manage a cache of packed virtualenv environments of models, see ``MLFLOW_ENV_CACHE_DIR``.
+    """
+
+
+_ENV_CACHE_DIR = click.option(
+    "--env-cache-dir",
+    envvar="MLFLOW_ENV_CACHE_DIR",
+    required=True,
+    metavar="PATH",
+    help="The environment cache directory. Defaults to the value of MLFLOW_ENV_CACHE_DIR.",
+)
+
+
+@env_cache_commands.command("prewarm")
+@cli_args.MODEL_URI
+@_ENV_CACHE_DIR
+@cli_args.INSTALL_MLFLOW
+def prewarm_env_cache(model_uri, env_cache_dir, install_mlflow):
+    """
+    Create the virtualenv environment of a model and add it to the environment cache, so that
+    processes using the cache, e.g. ``mlflow models serve`` or the executors of ``spark_udf``,
+    restore the environment without installing its requirements.
+    """
+    from mlflow.utils._spark_utils import modified_environ
+
+    with tempfile.TemporaryDirectory() as env_root, modified_environ(
+        # Create the environment in a temporary directory, so that it is packed into the cache
+        # even if it already exists in the default environment root
+        {"MLFLOW_ENV_CACHE_DIR": env_cache_dir, "MLFLOW_ENV_ROOT": env_root}
+    ):
+        get_flavor_backend(
+            model_uri, env_manager=_EnvManager.VIRTUALENV, install_mlflow=install_mlflow
+        ).prepare_env(model_uri=model_uri)
+
+
+@env_cache_commands.command("gc")
+@_ENV_CACHE_DIR
+@click.option(
+    "--older-than",
+    default=None,
+    help="Remove the environments that haven't been used for the specified duration, in "
+    "#d#h#m#s format. For example: --older-than 7d, --older-than 1d12h",
+)
+@click.option(
+    "--max-size",
+    type=int,
+    default=None,
+    help="Remove the least recently used environments until the cache takes at most the "
+    "specified number of bytes.",
+)
+def gc_env_cache(env_cache_dir, older_than, max_size):
+    """
+    Remove environments from the environment cache.
+    """
+    from mlflow.utils import env_cache
+    from mlflow.utils.time import parse_duration
+
+    older_than_seconds = parse_duration(older_than).total_seconds() if older_than else None
+    for path in env_cache.gc_env_cache(env_cache_dir, older_than_seconds, max_size):
+        click.echo(f"Removed {path}")
+
+
 @commands.command("generate-dockerfile")
 @cli_args.MODEL_URI_BUILD_DOCKER
 @click.option(
@@ -13,6 +13,8 @@ from urllib.parse import urlparse
 import yaml
 
 import mlflow
+import mlflow.tracking._model_registry.fluent
+import mlflow.tracking.fluent
 from mlflow.artifacts import download_artifacts
 from mlflow.exceptions import MlflowException
 from mlflow.models.resources import Resource, ResourceType, _ResourceBuilder
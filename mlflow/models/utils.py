@@ -581,6 +581,21 @@ def _enforce_tensor_spec(
     return values
 
 
+def _is_upcast(source_dtype: np.dtype, target_dtype: np.dtype) -> bool:
+    """
+    Returns whether values of a NumPy dtype can be converted to another one of the same kind,
+    or of a numeric kind, without altering them.
+    """
+    if source_dtype.kind == target_dtype.kind:
+        return source_dtype.itemsize <= target_dtype.itemsize
+    if source_dtype.kind == "u" and target_dtype.kind == "i":
+        return source_dtype.itemsize < target_dtype.itemsize
+    if source_dtype.kind in ("i", "u") and target_dtype == np.float64:
+        # allow (u)int => double conversion
+        return source_dtype.itemsize <= 6
+    return False
+
+
 def _enforce_mlflow_datatype(name, values: pd.Series, t: DataType):
     """
     Enforce the input column type matches the declared in model input schema.
@@ -655,17 +670,7 @@ def _enforce_mlflow_datatype(name, values: pd.Series, t: DataType):
             )
 
     numpy_type = t.to_numpy()
-    if values.dtype.kind == numpy_type.kind:
-        is_upcast = values.dtype.itemsize <= numpy_type.itemsize
-    elif values.dtype.kind == "u" and numpy_type.kind == "i":
-        is_upcast = values.dtype.itemsize < numpy_type.itemsize
-    elif values.dtype.kind in ("i", "u") and numpy_type == np.float64:
-        # allow (u)int => double conversion
-        is_upcast = values.dtype.itemsize <= 6
-    else:
-        is_upcast = False
-
-    if is_upcast:
+    if _is_upcast(values.dtype, numpy_type):
         return values.astype(numpy_type, errors="raise")
     else:
         # NB: conversion between incompatible types (e.g. floats -> ints or
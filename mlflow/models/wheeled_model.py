@@ -7,6 +7,7 @@ import sys
 import yaml
 
 import mlflow
+import mlflow.tracking.fluent
 from mlflow import MlflowClient
 from mlflow.environment_variables import MLFLOW_WHEELED_MODEL_PIP_DOWNLOAD_OPTIONS
 from mlflow.exceptions import MlflowException
@@ -387,6 +387,7 @@ import inspect
 import json
 import logging
 import os
+import shutil
 import signal
 import subprocess
 import sys
@@ -409,6 +410,7 @@ import mlflow.pyfunc.loaders
 import mlflow.pyfunc.model
 from mlflow.environment_variables import (
     _MLFLOW_TESTING,
+    MLFLOW_ENV_CACHE_DIR,
     MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT,
 )
 from mlflow.exceptions import MlflowException
@@ -1585,6 +1587,36 @@ def _convert_struct_values(
     return result_dict
 
 
+def _add_virtualenv_archive_to_spark(spark, local_model_path, install_mlflow):
+    """
+    Create the virtualenv environment of a model on the driver, and distribute its archive from
+    the environment cache to the executors, so that they unpack it instead of installing the
+    requirements of the model.
+
+    Returns:
+        The path to pass to ``_SparkDirectoryDistributor.get_or_extract`` on executors to get an
+        environment cache directory containing the archive, or ``None`` if the environment
+        couldn't be cached.
+    """
+    from mlflow.utils._spark_utils import _SparkDirectoryDistributor
+    from mlflow.utils.virtualenv import _get_model_virtualenv_archive_path
+
+    # NB: Use a separate backend, the environment prepared by a backend is reused by its copies
+    backend = get_flavor_backend(
+        local_model_path,
+        env_manager=_EnvManager.VIRTUALENV,
+        install_mlflow=install_mlflow,
+        create_env_root_dir=True,
+    )
+    backend.prepare_env(model_uri=local_model_path, capture_output=is_in_databricks_runtime())
+    env_archive_path = _get_model_virtualenv_archive_path(local_model_path, backend._env_id)
+    if env_archive_path is None or not env_archive_path.exists():
+        return None
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        shutil.copy(env_archive_path, tmp_dir)
+        return _SparkDirectoryDistributor.add_dir(spark, tmp_dir)
+
+
 def _is_spark_connect():
     try:
         from pyspark.sql.utils import is_remote
@@ -1824,6 +1856,16 @@ def spark_udf(
         # Broadcast local model directory to remote worker if needed.
         archive_path = SparkModelCache.add_local_model(spark, local_model_path)
 
+    env_cache_archive_path = None
+    if (
+        should_use_spark_to_broadcast_file
+        and env_manager == _EnvManager.VIRTUALENV
+        and MLFLOW_ENV_CACHE_DIR.get()
+    ):
+        env_cache_archive_path = _add_virtualenv_archive_to_spark(
+            spark, local_model_path, install_mlflow=mlflow_home is not None
+        )
+
     model_metadata = Model.load(os.path.join(local_model_path, MLMODEL_FILE_NAME))
 
     if result_type is None:
@@ -1994,9 +2036,16 @@ Compound types:
                     # Set "capture_output" so that if "conda env create" command failed, the command
                     # stdout/stderr output will be attached to the exception message and included in
                     # driver side exception.
-                    pyfunc_backend.prepare_env(
-                        model_uri=local_model_path_on_executor, capture_output=True
-                    )
+                    env_cache_envs = {}
+                    if env_cache_archive_path is not None:
+                        # Unpack the environment created on the driver instead of creating it
+                        env_cache_envs[
+                            MLFLOW_ENV_CACHE_DIR.name
+                        ] = _SparkDirectoryDistributor.get_or_extract(env_cache_archive_path)
+                    with modified_environ(update=env_cache_envs):
+                        pyfunc_backend.prepare_env(
+                            model_uri=local_model_path_on_executor, capture_output=True
+                        )
                 else:
                     local_model_path_on_executor = None
 
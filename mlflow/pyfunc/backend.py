@@ -74,6 +74,9 @@ class PyFuncBackend(FlavorBackend):
         install_mlflow=False,
         create_env_root_dir=False,
         env_root_dir=None,
+        enable_batching=False,
+        max_batch_size=None,
+        max_batch_delay_ms=None,
         **kwargs,
     ):
         """
@@ -87,9 +90,17 @@ class PyFuncBackend(FlavorBackend):
                 path, and pip package cache path becomes
                 "{env_root_dir}/pip_cache_pkgs" instead of the global package cache
                 path.
+            enable_batching: If True, the servers started by ``serve`` group concurrent requests
+                into batches scored with a single ``predict`` call.
+            max_batch_size: The maximum number of rows of the batches when batching is enabled.
+            max_batch_delay_ms: The maximum time in milliseconds to wait for a batch to fill up
+                when batching is enabled.
         """
         super().__init__(config=config, **kwargs)
         self._nworkers = workers or 1
+        self._enable_batching = enable_batching
+        self._max_batch_size = max_batch_size
+        self._max_batch_delay_ms = max_batch_delay_ms
         if env_manager == em.CONDA and ENV not in config:
             warnings.warn(
                 "Conda environment is not specified in config `env`. Using local environment."
@@ -233,7 +244,14 @@ class PyFuncBackend(FlavorBackend):
 
         server_implementation = mlserver if enable_mlserver else scoring_server
         command, command_env = server_implementation.get_cmd(
-            local_path, port, host, timeout, self._nworkers
+            local_path,
+            port,
+            host,
+            timeout,
+            self._nworkers,
+            enable_batching=self._enable_batching,
+            max_batch_size=self._max_batch_size,
+            max_batch_delay_ms=self._max_batch_delay_ms,
         )
 
         if sys.platform.startswith("linux"):
@@ -16,6 +16,9 @@ def get_cmd(
     nworkers: Optional[int] = None,
     model_name: Optional[str] = None,
     model_version: Optional[str] = None,
+    enable_batching: bool = False,
+    max_batch_size: Optional[int] = None,
+    max_batch_delay_ms: Optional[float] = None,
 ) -> Tuple[str, Dict[str, str]]:
     cmd = f"mlserver start {model_uri}"
 
@@ -33,6 +36,13 @@ def get_cmd(
     if nworkers:
         cmd_env["MLSERVER_PARALLEL_WORKERS"] = str(nworkers)
 
+    # MLServer implements its own adaptive batching
+    if enable_batching:
+        if max_batch_size:
+            cmd_env["MLSERVER_MODEL_MAX_BATCH_SIZE"] = str(max_batch_size)
+        if max_batch_delay_ms:
+            cmd_env["MLSERVER_MODEL_MAX_BATCH_TIME"] = str(max_batch_delay_ms / 1000)
+
     # give precedence to user env var input
     cmd_env["MLSERVER_MODEL_NAME"] = (
         cmd_env.get("MLSERVER_MODEL_NAME") or model_name or MLServerDefaultModelName
@@ -3,14 +3,19 @@ Scoring server for python model format.
 The passed int model is expected to have function:
    predict(pandas.Dataframe) -> pandas.DataFrame
 
-Input, expected in text/csv or application/json format,
-is parsed into pandas.DataFrame and passed to the model.
+Input, expected in text/csv, application/json, application/vnd.apache.arrow.stream,
+application/x-parquet or application/x-npy format, is parsed into pandas.DataFrame (or
+numpy.ndarray for application/x-npy) and passed to the model. Predictions are returned as JSON,
+unless the request explicitly accepts one of the binary formats.
 
 Defines four endpoints:
     /ping used for health check
     /health (same as /ping)
     /version used for getting the mlflow version
     /invocations used for scoring
+
+When batching is enabled, concurrent requests are scored in batches and a fifth endpoint,
+/metrics, exposes batching metrics in the Prometheus text format.
 """
 import inspect
 import json
@@ -23,7 +28,12 @@ from typing import Dict, NamedTuple, Optional, Tuple
 
 import flask
 
-from mlflow.environment_variables import MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT
+from mlflow.environment_variables import (
+    MLFLOW_SCORING_SERVER_ENABLE_BATCHING,
+    MLFLOW_SCORING_SERVER_MAX_BATCH_DELAY_MS,
+    MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE,
+    MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT,
+)
 
 # NB: We need to be careful what we import form mlflow here. Scoring server is used from within
 # model's conda environment. The version of mlflow doing the serving (outside) and the version of
@@ -31,8 +41,9 @@ from mlflow.environment_variables import MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT
 # dependencies to the minimum here.
 # ALl of the mlflow dependencies below need to be backwards compatible.
 from mlflow.exceptions import MlflowException
+from mlflow.models.utils import _is_upcast
 from mlflow.pyfunc.model import _log_warning_if_params_not_in_predict_signature
-from mlflow.types import ParamSchema, Schema
+from mlflow.types import DataType, ParamSchema, Schema
 from mlflow.utils import reraise
 from mlflow.utils.annotations import deprecated
 from mlflow.utils.file_utils import path_to_local_file_uri
@@ -50,7 +61,7 @@ try:
     from mlflow.pyfunc import PyFuncModel, load_model
 except ImportError:
     from mlflow.pyfunc import load_pyfunc as load_model
-from io import StringIO
+from io import BytesIO, StringIO
 
 from mlflow.protos.databricks_pb2 import BAD_REQUEST, INVALID_PARAMETER_VALUE
 from mlflow.server.handlers import catch_mlflow_exception
@@ -59,12 +70,31 @@ _SERVER_MODEL_PATH = "__pyfunc_model_path__"
 
 CONTENT_TYPE_CSV = "text/csv"
 CONTENT_TYPE_JSON = "application/json"
+CONTENT_TYPE_ARROW = "application/vnd.apache.arrow.stream"
+CONTENT_TYPE_PARQUET = "application/x-parquet"
+CONTENT_TYPE_NPY = "application/x-npy"
 
 CONTENT_TYPES = [
     CONTENT_TYPE_CSV,
     CONTENT_TYPE_JSON,
+    CONTENT_TYPE_ARROW,
+    CONTENT_TYPE_PARQUET,
+    CONTENT_TYPE_NPY,
+]
+
+# Content types whose payloads are passed to `invocations` as bytes instead of strings
+BINARY_CONTENT_TYPES = [
+    CONTENT_TYPE_ARROW,
+    CONTENT_TYPE_PARQUET,
+    CONTENT_TYPE_NPY,
 ]
 
+# The key of the Arrow schema metadata holding the JSON-encoded inference params of Arrow requests
+ARROW_PARAMS_METADATA_KEY = b"mlflow.params"
+# The key of the Arrow schema metadata marking predictions whose columns are named after their
+# positions, whose labels are integers once deserialized, as in their JSON representation
+ARROW_POSITIONAL_COLUMNS_METADATA_KEY = b"mlflow.positional_columns"
+
 _logger = logging.getLogger(__name__)
 
 DF_RECORDS = "dataframe_records"
@@ -256,6 +286,273 @@ def parse_csv_input(csv_input, schema: Schema = None):
         )
 
 
+def _read_arrow_table(read_table, data, format_name):
+    # Columns are converted to the types of the model schema by its schema enforcement, like the
+    # columns of DataFrames parsed from JSON
+    try:
+        table = read_table(data)
+        params = (table.schema.metadata or {}).get(ARROW_PARAMS_METADATA_KEY)
+        return table.to_pandas(), (json.loads(params) if params is not None else None)
+    except Exception as e:
+        _handle_serving_error(
+            error_message=(
+                "Failed to parse input as a Pandas DataFrame. Ensure that the input is a valid"
+                f" {format_name}. Error: '{e}'"
+            ),
+            error_code=BAD_REQUEST,
+        )
+
+
+def parse_arrow_input(arrow_input):
+    """
+    Args:
+        arrow_input: An Arrow IPC stream of a Pandas DataFrame, as bytes or as a readable binary
+            file object.
+
+    Returns:
+        A tuple of the Pandas DataFrame and of the inference params stored in the metadata of the
+        stream schema, or ``None`` if the stream doesn't contain params.
+    """
+    import pyarrow as pa
+
+    def read_table(source):
+        if isinstance(source, bytes):
+            source = pa.py_buffer(source)
+        with pa.ipc.open_stream(source) as reader:
+            return reader.read_all()
+
+    return _read_arrow_table(read_table, arrow_input, "Arrow IPC stream")
+
+
+def parse_parquet_input(parquet_input):
+    """
+    Args:
+        parquet_input: A Parquet file of a Pandas DataFrame, as bytes or as a readable binary
+            file object.
+
+    Returns:
+        A tuple of the Pandas DataFrame and of the inference params stored in the metadata of the
+        file schema, or ``None`` if the file doesn't contain params.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    def read_table(source):
+        if isinstance(source, bytes):
+            source = pa.BufferReader(source)
+        return pq.read_table(source)
+
+    return _read_arrow_table(read_table, parquet_input, "Parquet file")
+
+
+def parse_npy_input(npy_input, schema: Schema = None):
+    """
+    Args:
+        npy_input: A NumPy array in the ``.npy`` format, as bytes or as a readable binary file
+            object. Arrays of Python objects aren't supported.
+        schema: Optional schema specification to be used during parsing.
+
+    Returns:
+        The NumPy array, or a Pandas DataFrame if the schema is column-based and the array holds
+        one column per input of the schema.
+    """
+    import numpy as np
+    import pandas as pd
+
+    try:
+        if isinstance(npy_input, bytes):
+            npy_input = BytesIO(npy_input)
+        array = np.load(npy_input, allow_pickle=False)
+    except Exception as e:
+        _handle_serving_error(
+            error_message=(
+                "Failed to parse input as a NumPy array. Ensure that the input is a valid NumPy"
+                f" array produced using the `numpy.save()` method. Error: '{e}'"
+            ),
+            error_code=BAD_REQUEST,
+        )
+    if schema is None:
+        return array
+
+    def should_upcast(target_dtype):
+        # Only numeric arrays are converted here, e.g. NumPy silently overflows when changing the
+        # precision of datetimes, which are left to the schema enforcement of the model
+        return (
+            target_dtype is not None
+            and array.dtype.kind in "iuf"
+            and array.dtype != target_dtype
+            and _is_upcast(array.dtype, target_dtype)
+        )
+
+    if schema.is_tensor_spec():
+        if len(schema.inputs) == 1 and should_upcast(schema.inputs[0].type):
+            array = array.astype(schema.inputs[0].type)
+        return array
+
+    if array.ndim != 2 or array.shape[1] != len(schema.inputs):
+        return array
+    # Upcast all the columns at once when they share the same type, instead of having the schema
+    # enforcement of the model convert the columns of the DataFrame one by one
+    target_dtypes = {
+        t.to_numpy() if isinstance(t, DataType) else None for t in schema.input_types()
+    }
+    if len(target_dtypes) == 1:
+        (target_dtype,) = target_dtypes
+        if should_upcast(target_dtype):
+            array = array.astype(target_dtype)
+    return pd.DataFrame(array, columns=schema.input_names())
+
+
+def _predictions_to_arrow_table(raw_predictions):
+    """
+    Convert predictions into an Arrow table. Pandas Series and NumPy arrays are converted into
+    DataFrames whose columns are named after their positions, as they would be when parsing their
+    JSON representation, i.e. ``"0"`` for Series and integers for NumPy arrays. Since Arrow field
+    names are strings, tables of NumPy arrays are marked with the
+    ``ARROW_POSITIONAL_COLUMNS_METADATA_KEY`` metadata, see :py:func:`arrow_table_to_predictions`.
+
+    Returns:
+        A ``pyarrow.Table``, or ``None`` if the predictions can't be represented as an Arrow table.
+    """
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+
+    if isinstance(raw_predictions, pd.DataFrame):
+        df = raw_predictions
+        positional_columns = False
+    elif isinstance(raw_predictions, pd.Series):
+        df = pd.DataFrame({"0": raw_predictions.to_numpy()})
+        positional_columns = False
+    elif isinstance(raw_predictions, np.ndarray) and raw_predictions.ndim in (1, 2):
+        df = pd.DataFrame(raw_predictions)
+        positional_columns = True
+    else:
+        return None
+
+    try:
+        table = pa.Table.from_pandas(df.rename(columns=str), preserve_index=False)
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+    if positional_columns:
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), ARROW_POSITIONAL_COLUMNS_METADATA_KEY: b"true"}
+        )
+    return table
+
+
+def arrow_table_to_predictions(table):
+    """
+    Convert an Arrow table of predictions serialized by :py:func:`predictions_to_arrow` or
+    :py:func:`predictions_to_parquet` into a Pandas DataFrame, restoring the integer labels of
+    the columns of NumPy array predictions.
+    """
+    df = table.to_pandas()
+    if (table.schema.metadata or {}).get(ARROW_POSITIONAL_COLUMNS_METADATA_KEY) == b"true":
+        df.columns = range(len(df.columns))
+    return df
+
+
+def predictions_to_arrow(raw_predictions):
+    """
+    Serialize predictions into an Arrow IPC stream.
+
+    Returns:
+        The Arrow IPC stream as a ``pyarrow.Buffer``, or ``None`` if the predictions can't be
+        represented as an Arrow table, in which case they should be serialized as JSON.
+    """
+    import pyarrow as pa
+
+    table = _predictions_to_arrow_table(raw_predictions)
+    if table is None:
+        return None
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def predictions_to_parquet(raw_predictions):
+    """
+    Serialize predictions into a Parquet file.
+
+    Returns:
+        The Parquet file as a ``pyarrow.Buffer``, or ``None`` if the predictions can't be
+        represented as an Arrow table, in which case they should be serialized as JSON.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = _predictions_to_arrow_table(raw_predictions)
+    if table is None:
+        return None
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink)
+    return sink.getvalue()
+
+
+def predictions_to_npy(raw_predictions):
+    """
+    Serialize predictions into a NumPy array in the ``.npy`` format.
+
+    Returns:
+        The ``.npy`` file as bytes, or ``None`` if the predictions can't be represented as a NumPy
+        array of a non-object dtype, in which case they should be serialized as JSON.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(raw_predictions, (pd.DataFrame, pd.Series)):
+        raw_predictions = raw_predictions.to_numpy()
+    if not isinstance(raw_predictions, np.ndarray) or raw_predictions.dtype.hasobject:
+        return None
+    output = BytesIO()
+    np.save(output, raw_predictions, allow_pickle=False)
+    return output.getvalue()
+
+
+_PREDICTIONS_SERIALIZERS = {
+    CONTENT_TYPE_ARROW: predictions_to_arrow,
+    CONTENT_TYPE_PARQUET: predictions_to_parquet,
+    CONTENT_TYPE_NPY: predictions_to_npy,
+}
+
+
+def _get_binary_response_types(accept):
+    """
+    Returns:
+        The binary content types explicitly included in the value of an ``Accept`` header, from
+        the most to the least preferred. Types listed after ``application/json`` or after a
+        wildcard with the same or a higher quality are excluded, so that clients that don't
+        explicitly ask for binary responses keep getting JSON.
+    """
+    if not accept:
+        return []
+
+    media_ranges = []
+    for media_range in accept.split(","):
+        mime_type, *parameters = (part.strip() for part in media_range.split(";"))
+        quality = 1.0
+        for parameter in parameters:
+            key, _, value = parameter.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if mime_type and quality > 0:
+            media_ranges.append((mime_type, quality))
+
+    response_types = []
+    # NB: `sorted` is stable, so media ranges of equal quality keep the order of the header
+    for mime_type, _ in sorted(media_ranges, key=lambda media_range: -media_range[1]):
+        if mime_type in _PREDICTIONS_SERIALIZERS:
+            response_types.append(mime_type)
+        elif mime_type == CONTENT_TYPE_JSON or "*" in mime_type:
+            break
+    return response_types
+
+
 def unwrapped_predictions_to_json(raw_predictions, output):
     predictions = _get_jsonable_obj(raw_predictions, pandas_orient="records")
     return json.dump(predictions, output, cls=NumpyEncoder)
@@ -298,7 +595,7 @@ class InvocationsResponse(NamedTuple):
     mimetype: str
 
 
-def invocations(data, content_type, model, input_schema):
+def invocations(data, content_type, model, input_schema, accept=None, batcher=None):
     type_parts = list(map(str.strip, content_type.split(";")))
     mime_type = type_parts[0]
     parameter_value_pairs = type_parts[1:]
@@ -336,6 +633,13 @@ def invocations(data, content_type, model, input_schema):
         csv_input = StringIO(data)
         data = parse_csv_input(csv_input=csv_input, schema=input_schema)
         params = None
+    elif mime_type == CONTENT_TYPE_ARROW:
+        data, params = parse_arrow_input(data)
+    elif mime_type == CONTENT_TYPE_PARQUET:
+        data, params = parse_parquet_input(data)
+    elif mime_type == CONTENT_TYPE_NPY:
+        data = parse_npy_input(data, schema=input_schema)
+        params = None
     elif mime_type == CONTENT_TYPE_JSON:
         json_input = _decode_json_input(data)
         should_parse_as_unified_llm_input = any(x in json_input for x in SUPPORTED_LLM_FORMATS)
@@ -363,7 +667,9 @@ def invocations(data, content_type, model, input_schema):
 
     # Do the prediction
     try:
-        if inspect.signature(model.predict).parameters.get("params"):
+        if batcher is not None:
+            raw_predictions = batcher.predict(data, params=params)
+        elif inspect.signature(model.predict).parameters.get("params"):
             raw_predictions = model.predict(data, params=params)
         else:
             _log_warning_if_params_not_in_predict_signature(_logger, params)
@@ -389,6 +695,14 @@ def invocations(data, content_type, model, input_schema):
             error_code=BAD_REQUEST,
             stack_trace=traceback.format_exc(),
         )
+    if not should_parse_as_unified_llm_input:
+        for response_type in _get_binary_response_types(accept):
+            serialized_predictions = _PREDICTIONS_SERIALIZERS[response_type](raw_predictions)
+            if serialized_predictions is not None:
+                return InvocationsResponse(
+                    response=bytes(serialized_predictions), status=200, mimetype=response_type
+                )
+
     result = StringIO()
 
     # if the data was formatted using the unified LLM format,
@@ -407,6 +721,26 @@ def init(model: PyFuncModel):
     """
     app = flask.Flask(__name__)
     input_schema = model.metadata.get_input_schema()
+    batcher = None
+    if MLFLOW_SCORING_SERVER_ENABLE_BATCHING.get():
+        from mlflow.pyfunc.scoring_server.batching import MicroBatcher
+
+        batcher = MicroBatcher(
+            model,
+            max_batch_size=MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE.get(),
+            max_batch_delay_ms=MLFLOW_SCORING_SERVER_MAX_BATCH_DELAY_MS.get(),
+        )
+
+        @app.route("/metrics", methods=["GET"])
+        def metrics():
+            """
+            Returns the batching metrics of this worker process.
+            """
+            return flask.Response(
+                response=batcher.metrics.render(),
+                status=200,
+                mimetype="text/plain; version=0.0.4",
+            )
 
     @app.route("/ping", methods=["GET"])
     @app.route("/health", methods=["GET"])
@@ -438,9 +772,14 @@ def init(model: PyFuncModel):
         # Content-Type can include other attributes like CHARSET
         # Content-type RFC: https://datatracker.ietf.org/doc/html/rfc2045#section-5.1
         # TODO: Suport ";" in quoted parameter values
-        data = flask.request.data.decode("utf-8")
         content_type = flask.request.content_type
-        result = invocations(data, content_type, model, input_schema)
+        data = flask.request.data
+        if flask.request.mimetype not in BINARY_CONTENT_TYPES:
+            data = data.decode("utf-8")
+        accept = flask.request.headers.get("Accept")
+        result = invocations(
+            data, content_type, model, input_schema, accept=accept, batcher=batcher
+        )
 
         return flask.Response(
             response=result.response, status=result.status, mimetype=result.mimetype
@@ -490,9 +829,16 @@ def get_cmd(
     host: Optional[int] = None,
     timeout: Optional[int] = None,
     nworkers: Optional[int] = None,
+    enable_batching: bool = False,
+    max_batch_size: Optional[int] = None,
+    max_batch_delay_ms: Optional[float] = None,
 ) -> Tuple[str, Dict[str, str]]:
     local_uri = path_to_local_file_uri(model_uri)
     timeout = timeout or MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT.get()
+    # Requests can only be batched if each worker serves several of them concurrently
+    nthreads = (
+        (max_batch_size or MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE.get()) if enable_batching else None
+    )
 
     # NB: Absolute windows paths do not work with mlflow apis, use file uri to ensure
     # platform compatibility.
@@ -507,6 +853,9 @@ def get_cmd(
         if nworkers:
             args.append(f"-w {nworkers}")
 
+        if nthreads:
+            args.append(f"--threads {nthreads}")
+
         command = (
             f"gunicorn {' '.join(args)} ${{GUNICORN_CMD_ARGS}}"
             " -- mlflow.pyfunc.scoring_server.wsgi:app"
@@ -519,6 +868,9 @@ def get_cmd(
         if port:
             args.append(f"--port={port}")
 
+        if nthreads:
+            args.append(f"--threads={nthreads}")
+
         command = (
             f"waitress-serve {' '.join(args)} "
             "--ident=mlflow mlflow.pyfunc.scoring_server.wsgi:app"
@@ -526,5 +878,11 @@ def get_cmd(
 
     command_env = os.environ.copy()
     command_env[_SERVER_MODEL_PATH] = local_uri
+    if enable_batching:
+        command_env[MLFLOW_SCORING_SERVER_ENABLE_BATCHING.name] = "true"
+        if max_batch_size is not None:
+            command_env[MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE.name] = str(max_batch_size)
+        if max_batch_delay_ms is not None:
+            command_env[MLFLOW_SCORING_SERVER_MAX_BATCH_DELAY_MS.name] = str(max_batch_delay_ms)
 
     return command, command_env
@@ -0,0 +1,365 @@
+"""
+Dynamic micro-batching for the pyfunc scoring server.
+
+When batching is enabled, the inputs of concurrent ``/invocations`` requests are queued, grouped
+into batches of compatible inputs and scored with a single ``predict`` call on a background
+thread, so that small requests benefit from vectorized model implementations. The predictions of
+each batch are then split back into the predictions of the individual requests.
+"""
+import json
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future
+from typing import Any, Dict, List, NamedTuple, Optional
+
+_logger = logging.getLogger(__name__)
+
+_BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+_QUEUE_WAIT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+# Enqueued to stop the worker thread of a `MicroBatcher`
+_STOP = object()
+
+
+class _Histogram:
+    """
+    A thread-safe histogram rendered in the Prometheus text exposition format.
+    """
+
+    def __init__(self, name, description, buckets):
+        self.name = name
+        self.description = description
+        self.buckets = buckets
+        self._counts = [0] * len(buckets)
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        with self._lock:
+            for i, upper_bound in enumerate(self.buckets):
+                if value <= upper_bound:
+                    self._counts[i] += 1
+            self._count += 1
+            self._sum += value
+
+    def render(self):
+        with self._lock:
+            lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+            lines.extend(
+                f'{self.name}_bucket{{le="{upper_bound}"}} {count}'
+                for upper_bound, count in zip(self.buckets, self._counts)
+            )
+            lines.append(f'{self.name}_bucket{{le="+Inf"}} {self._count}')
+            lines.append(f"{self.name}_sum {self._sum}")
+            lines.append(f"{self.name}_count {self._count}")
+        return "\n".join(lines)
+
+
+class _Counter:
+    """
+    A thread-safe counter rendered in the Prometheus text exposition format.
+    """
+
+    def __init__(self, name, description):
+        self.name = name
+        self.description = description
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, value=1):
+        with self._lock:
+            self._value += value
+
+    def render(self):
+        with self._lock:
+            return "\n".join(
+                [
+                    f"# HELP {self.name} {self.description}",
+                    f"# TYPE {self.name} counter",
+                    f"{self.name} {self._value}",
+                ]
+            )
+
+
+class BatchingMetrics:
+    """
+    Metrics of the batches scored by a :py:class:`MicroBatcher`. Each scoring server worker
+    process holds its own metrics.
+    """
+
+    def __init__(self):
+        self.batch_size = _Histogram(
+            "mlflow_scoring_server_batch_size",
+            "Number of rows of the batches passed to the model.",
+            _BATCH_SIZE_BUCKETS,
+        )
+        self.batch_requests = _Histogram(
+            "mlflow_scoring_server_batch_requests",
+            "Number of requests grouped into the batches passed to the model.",
+            _BATCH_SIZE_BUCKETS,
+        )
+        self.queue_wait_seconds = _Histogram(
+            "mlflow_scoring_server_batch_queue_wait_seconds",
+            "Time spent by requests in the batching queue before being scored.",
+            _QUEUE_WAIT_BUCKETS,
+        )
+        self.unbatched_requests = _Counter(
+            "mlflow_scoring_server_unbatched_requests_total",
+            "Number of requests scored individually, because their inputs can't be batched or"
+            " because scoring or splitting the predictions of their batch failed.",
+        )
+
+    def render(self):
+        """
+        Returns:
+            The metrics in the Prometheus text exposition format.
+        """
+        metrics = [
+            self.batch_size,
+            self.batch_requests,
+            self.queue_wait_seconds,
+            self.unbatched_requests,
+        ]
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+class _PendingRequest(NamedTuple):
+    data: Any
+    params: Optional[Dict[str, Any]]
+    num_rows: int
+    key: Any
+    enqueued_at: float
+    future: Future
+
+
+def _get_num_rows(data):
+    """
+    Returns:
+        The number of rows of a batchable model input, or ``None`` if the input can't be
+        concatenated with other inputs.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(data, pd.DataFrame) or (isinstance(data, np.ndarray) and data.ndim >= 1):
+        return len(data)
+    return None
+
+
+def _get_batch_key(data, params):
+    """
+    Returns:
+        A hashable key that is equal for inputs that can be concatenated into the same batch, i.e.
+        DataFrames with the same columns and dtypes, or arrays with the same dtype and the same
+        shape along all dimensions but the first one, scored with the same params.
+    """
+    import pandas as pd
+
+    if isinstance(data, pd.DataFrame):
+        data_key = ("dataframe", tuple(data.columns), tuple(map(str, data.dtypes)))
+    else:
+        data_key = ("ndarray", str(data.dtype), data.shape[1:])
+    return data_key, json.dumps(params, sort_keys=True, default=str)
+
+
+def _concat_inputs(inputs):
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(inputs[0], pd.DataFrame):
+        return pd.concat(inputs, ignore_index=True)
+    return np.concatenate(inputs)
+
+
+def _split_predictions(predictions, sizes):
+    """
+    Split the predictions of a batch into the predictions of the inputs it was made of.
+
+    Returns:
+        A list of predictions, or ``None`` if the predictions don't have one row per input row.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if not isinstance(predictions, (pd.DataFrame, pd.Series, np.ndarray, list)):
+        return None
+    if isinstance(predictions, np.ndarray) and predictions.ndim == 0:
+        return None
+    if len(predictions) != sum(sizes):
+        return None
+
+    splits = []
+    start = 0
+    for size in sizes:
+        if isinstance(predictions, (pd.DataFrame, pd.Series)):
+            splits.append(predictions.iloc[start : start + size].reset_index(drop=True))
+        else:
+            splits.append(predictions[start : start + size])
+        start += size
+    return splits
+
+
+class MicroBatcher:
+    """
+    Scores the inputs of concurrent requests in batches.
+
+    Requests are enqueued after their inputs went through the schema enforcement of the model, so
+    that invalid inputs are rejected without failing the other requests of their batch. A
+    background thread waits for up to ``max_batch_delay_ms`` after the first queued request for
+    more requests to arrive, or until ``max_batch_size`` rows are queued, concatenates compatible
+    inputs and scores them with a single ``predict`` call.
+
+    Inputs that can't be batched, e.g. dictionaries of LLM inputs, are scored directly. If scoring
+    a batch fails, or its predictions can't be split back per request, the requests of the batch
+    are scored individually, so that each request gets its own predictions or error.
+
+    Args:
+        model: The :py:class:`PyFuncModel <mlflow.pyfunc.PyFuncModel>` to score inputs with.
+        max_batch_size: The maximum number of rows of a batch. Inputs with more rows are scored
+            in batches of their own.
+        max_batch_delay_ms: The maximum time to wait for a batch to fill up, in milliseconds.
+    """
+
+    def __init__(self, model, max_batch_size=64, max_batch_delay_ms=5):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay = max_batch_delay_ms / 1000
+        self.metrics = BatchingMetrics()
+        self._queue = queue.Queue()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+
+    def predict(self, data, params: Optional[Dict[str, Any]] = None):
+        """
+        Score a model input, blocking until the predictions of its batch are available.
+        """
+        data, params = self.model._validate_prediction_input(data, params)
+
+        num_rows = _get_num_rows(data)
+        if num_rows is None:
+            self.metrics.unbatched_requests.inc()
+            return self._predict(data, params)
+
+        future = Future()
+        self._ensure_worker_started()
+        self._queue.put(
+            _PendingRequest(
+                data=data,
+                params=params,
+                num_rows=num_rows,
+                key=_get_batch_key(data, params),
+                enqueued_at=time.monotonic(),
+                future=future,
+            )
+        )
+        return future.result()
+
+    def shutdown(self):
+        """
+        Stop the background thread, after scoring the requests that are already queued.
+        """
+        with self._thread_lock:
+            thread, self._thread = self._thread, None
+        if thread is not None and thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join()
+
+    def _predict(self, data, params):
+        return self.model.predict(data, params=params)
+
+    def _ensure_worker_started(self):
+        # NB: The worker thread is started lazily, so that it runs in the process serving the
+        # requests when the application is loaded before forking, e.g. with `gunicorn --preload`
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="MlflowScoringServerBatcher", daemon=True
+                )
+                self._thread.start()
+
+    def _collect_requests(self) -> Optional[List[_PendingRequest]]:
+        first_request = self._queue.get()
+        if first_request is _STOP:
+            return None
+        requests = [first_request]
+        num_rows = first_request.num_rows
+        deadline = first_request.enqueued_at + self.max_batch_delay
+        while num_rows < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                request = (
+                    self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if request is _STOP:
+                # Score the collected requests before stopping
+                self._queue.put(_STOP)
+                break
+            requests.append(request)
+            num_rows += request.num_rows
+        return requests
+
+    def _run(self):
+        while (requests := self._collect_requests()) is not None:
+            dequeued_at = time.monotonic()
+            for request in requests:
+                self.metrics.queue_wait_seconds.observe(dequeued_at - request.enqueued_at)
+
+            batches = defaultdict(list)
+            for request in requests:
+                batches[request.key].append(request)
+            for batch in batches.values():
+                try:
+                    self._score_batch(batch)
+                except BaseException as e:
+                    # Never leave requests waiting for predictions that won't be set
+                    for request in batch:
+                        if not request.future.done():
+                            request.future.set_exception(e)
+
+    def _score_batch(self, batch: List[_PendingRequest]):
+        # Inputs exceeding the maximum batch size are scored in batches of their own
+        chunks = [[]]
+        num_rows = 0
+        for request in batch:
+            if chunks[-1] and num_rows + request.num_rows > self.max_batch_size:
+                chunks.append([])
+                num_rows = 0
+            chunks[-1].append(request)
+            num_rows += request.num_rows
+
+        for chunk in chunks:
+            predictions = None
+            if len(chunk) > 1:
+                try:
+                    predictions = _split_predictions(
+                        self._predict(_concat_inputs([r.data for r in chunk]), chunk[0].params),
+                        [r.num_rows for r in chunk],
+                    )
+                except Exception:
+                    _logger.debug(
+                        "Failed to score a batch of %d requests", len(chunk), exc_info=True
+                    )
+                if predictions is None:
+                    self.metrics.unbatched_requests.inc(len(chunk))
+            if predictions is not None:
+                self.metrics.batch_size.observe(sum(r.num_rows for r in chunk))
+                self.metrics.batch_requests.observe(len(chunk))
+                for request, request_predictions in zip(chunk, predictions):
+                    request.future.set_result(request_predictions)
+                continue
+
+            for request in chunk:
+                try:
+                    request_predictions = self._predict(request.data, request.params)
+                except BaseException as e:
+                    request.future.set_exception(e)
+                else:
+                    if len(chunk) == 1:
+                        self.metrics.batch_size.observe(request.num_rows)
+                        self.metrics.batch_requests.observe(1)
+                    request.future.set_result(request_predictions)
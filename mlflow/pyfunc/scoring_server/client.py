@@ -1,9 +1,11 @@
+import importlib.util
 import json
 import logging
 import tempfile
 import time
 import uuid
 from abc import ABC, abstractmethod
+from io import BytesIO
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -16,6 +18,97 @@ from mlflow.utils.proto_json_utils import dump_input_data
 
 _logger = logging.getLogger(__name__)
 
+# The error code of the responses of the stdin scoring server to requests whose content type isn't
+# supported by the model environment
+_UNSUPPORTED_CONTENT_TYPE = "UNSUPPORTED_CONTENT_TYPE"
+
+
+def _dump_arrow_input(data, params=None):
+    """
+    Serialize a Pandas DataFrame into an Arrow IPC stream, storing the inference params in the
+    metadata of the stream schema.
+
+    Returns:
+        The Arrow IPC stream as bytes, or ``None`` if the data can't be represented as an Arrow
+        table, in which case it should be sent as JSON.
+    """
+    import pandas as pd
+
+    if not isinstance(data, pd.DataFrame) or importlib.util.find_spec("pyarrow") is None:
+        return None
+
+    import pyarrow as pa
+
+    try:
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        if params is not None:
+            table = table.replace_schema_metadata(
+                {
+                    **(table.schema.metadata or {}),
+                    scoring_server.ARROW_PARAMS_METADATA_KEY: json.dumps(params),
+                }
+            )
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _dump_npy_input(data, params=None):
+    """
+    Serialize a NumPy array into the ``.npy`` format.
+
+    Returns:
+        The ``.npy`` file as bytes, or ``None`` if the array holds Python objects or if inference
+        params are given, since they can't be stored in ``.npy`` files. The data should then be
+        sent as JSON.
+    """
+    import numpy as np
+
+    if not isinstance(data, np.ndarray) or data.dtype.hasobject or params is not None:
+        return None
+    output = BytesIO()
+    np.save(output, data, allow_pickle=False)
+    return output.getvalue()
+
+
+def _load_arrow_predictions(source):
+    """
+    Deserialize the predictions of an Arrow IPC stream, given as bytes, into a Pandas DataFrame.
+    """
+    import pyarrow as pa
+
+    with pa.ipc.open_stream(pa.py_buffer(source)) as reader:
+        return scoring_server.arrow_table_to_predictions(reader.read_all())
+
+
+def _load_parquet_predictions(source):
+    """
+    Deserialize the predictions of a Parquet file, given as bytes, into a Pandas DataFrame.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    return scoring_server.arrow_table_to_predictions(pq.read_table(pa.BufferReader(source)))
+
+
+def _load_npy_predictions(source):
+    """
+    Deserialize the predictions of a ``.npy`` file, given as bytes, into a NumPy array.
+    """
+    import numpy as np
+
+    return np.load(BytesIO(source), allow_pickle=False)
+
+
+_PREDICTIONS_LOADERS = {
+    scoring_server.CONTENT_TYPE_ARROW: _load_arrow_predictions,
+    scoring_server.CONTENT_TYPE_PARQUET: _load_parquet_predictions,
+    scoring_server.CONTENT_TYPE_NPY: _load_npy_predictions,
+}
+
 
 class BaseScoringServerClient(ABC):
     @abstractmethod
@@ -42,6 +135,9 @@ class BaseScoringServerClient(ABC):
 class ScoringServerClient(BaseScoringServerClient):
     def __init__(self, host, port):
         self.url_prefix = f"http://{host}:{port}"
+        # Pandas DataFrames are sent as Arrow IPC streams and NumPy arrays as .npy files, unless
+        # the server doesn't support binary content types
+        self._use_binary_formats = True
 
     def ping(self):
         ping_status = requests.get(url=self.url_prefix + "/ping")
@@ -81,17 +177,52 @@ class ScoringServerClient(BaseScoringServerClient):
         Returns:
             :py:class:`PredictionsResponse <mlflow.deployments.PredictionsResponse>` result.
         """
-        response = requests.post(
-            url=self.url_prefix + "/invocations",
-            data=dump_input_data(data, params=params),
-            headers={"Content-Type": scoring_server.CONTENT_TYPE_JSON},
-        )
+        binary_input = None
+        if self._use_binary_formats:
+            if (binary_input := _dump_arrow_input(data, params)) is not None:
+                accept = [scoring_server.CONTENT_TYPE_ARROW]
+            elif (binary_input := _dump_npy_input(data, params)) is not None:
+                accept = [scoring_server.CONTENT_TYPE_NPY, scoring_server.CONTENT_TYPE_ARROW]
+        if binary_input is None:
+            response = self._invoke_json(data, params)
+        else:
+            response = requests.post(
+                url=self.url_prefix + "/invocations",
+                data=binary_input,
+                headers={
+                    "Content-Type": accept[0],
+                    "Accept": ", ".join([*accept, scoring_server.CONTENT_TYPE_JSON]),
+                },
+            )
+            if response.status_code != 200:
+                # Servers running older versions of MLflow, e.g. in model environments restored
+                # with virtualenv or conda, only support CSV and JSON, and may fail with any error,
+                # e.g. a 500 when decoding binary payloads as UTF-8. The request is retried as
+                # JSON, and binary content types aren't used anymore if the retry succeeds.
+                response = self._invoke_json(data, params)
+                if response.status_code == 200:
+                    _logger.debug(
+                        "The scoring server failed to handle a binary payload, falling back to JSON"
+                    )
+                    self._use_binary_formats = False
         if response.status_code != 200:
             raise Exception(
                 f"Invocation failed (error code {response.status_code}, response: {response.text})"
             )
+        response_type = response.headers.get("Content-Type", "").split(";")[0].strip()
+        if response_type in _PREDICTIONS_LOADERS:
+            return PredictionsResponse(
+                predictions=_PREDICTIONS_LOADERS[response_type](response.content)
+            )
         return PredictionsResponse.from_json(response.text)
 
+    def _invoke_json(self, data, params):
+        return requests.post(
+            url=self.url_prefix + "/invocations",
+            data=dump_input_data(data, params=params),
+            headers={"Content-Type": scoring_server.CONTENT_TYPE_JSON},
+        )
+
 
 class StdinScoringServerClient(BaseScoringServerClient):
     def __init__(self, process):
@@ -99,6 +230,11 @@ class StdinScoringServerClient(BaseScoringServerClient):
         self.process = process
         self.tmpdir = Path(tempfile.mkdtemp())
         self.output_json = self.tmpdir.joinpath("output.json")
+        self.input_arrow = self.tmpdir.joinpath("input.arrow")
+        self.output_arrow = self.tmpdir.joinpath("output.arrow")
+        # Pandas DataFrames are exchanged through Arrow IPC files, unless the MLflow version of the
+        # model environment doesn't support them
+        self._use_arrow = True
 
     def wait_server_ready(self, timeout=30, scoring_server_proc=None):
         return_code = self.process.poll()
@@ -117,24 +253,48 @@ class StdinScoringServerClient(BaseScoringServerClient):
         Returns:
             :py:class:`PredictionsResponse <mlflow.deployments.PredictionsResponse>` result.
         """
+        arrow_input = _dump_arrow_input(data, params) if self._use_arrow else None
+        if arrow_input is not None:
+            self.input_arrow.write_bytes(arrow_input)
+            resp = self._send_request(
+                {
+                    "content_type": scoring_server.CONTENT_TYPE_ARROW,
+                    "input_file": str(self.input_arrow),
+                    "predictions_file": str(self.output_arrow),
+                }
+            )
+            if "predictions_file" in resp:
+                return PredictionsResponse(
+                    id=resp["id"],
+                    predictions=_load_arrow_predictions(
+                        Path(resp["predictions_file"]).read_bytes()
+                    ),
+                )
+            if resp.get("error_code") == _UNSUPPORTED_CONTENT_TYPE:
+                _logger.debug("The model environment doesn't support Arrow, falling back to JSON")
+                self._use_arrow = False
+            else:
+                return PredictionsResponse(resp)
+        return PredictionsResponse(
+            self._send_request({"data": dump_input_data(data, params=params)})
+        )
+
+    def _send_request(self, request):
         if not self.output_json.exists():
             self.output_json.touch()
 
         request_id = str(uuid.uuid4())
-        request = {
-            "id": request_id,
-            "data": dump_input_data(data, params=params),
-            "output_file": str(self.output_json),
-        }
+        request = {**request, "id": request_id, "output_file": str(self.output_json)}
         self.process.stdin.write(json.dumps(request) + "\n")
         self.process.stdin.flush()
 
         begin_time = time.time()
+        poll_interval = 0.005
         while True:
-            _logger.info("Waiting for scoring to complete...")
+            _logger.debug("Waiting for scoring to complete...")
             try:
                 with self.output_json.open(mode="r+") as f:
-                    resp = PredictionsResponse.from_json(f.read())
+                    resp = json.loads(f.read())
                     if resp.get("id") == request_id:
                         f.truncate(0)
                         return resp
@@ -142,4 +302,6 @@ class StdinScoringServerClient(BaseScoringServerClient):
                 _logger.debug("Exception while waiting for scoring to complete: %s", e)
             if time.time() - begin_time > 60:
                 raise MlflowException("Scoring timeout")
-            time.sleep(1)
+            # Poll frequently at first, so that small batches don't wait for a full second
+            time.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, 1)
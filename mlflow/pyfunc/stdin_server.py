@@ -1,4 +1,5 @@
 import argparse
+import importlib.util
 import inspect
 import json
 import logging
@@ -20,15 +21,44 @@ model = mlflow.pyfunc.load_model(args.model_uri)
 input_schema = model.metadata.get_input_schema()
 _logger.info("Loaded model")
 
+# NB: This script is run with the MLflow version installed in the model environment, which may not
+# support Arrow inputs
+try:
+    from mlflow.pyfunc.scoring_server import parse_arrow_input, predictions_to_arrow
+except ImportError:
+    parse_arrow_input = predictions_to_arrow = None
+
+
+def _write_arrow_predictions(preds, request):
+    arrow_predictions = predictions_to_arrow(preds)
+    if arrow_predictions is None:
+        return False
+    with open(request["predictions_file"], "wb") as f:
+        f.write(arrow_predictions)
+    with open(request["output_file"], "a") as f:
+        json.dump({"id": request["id"], "predictions_file": request["predictions_file"]}, f)
+    return True
+
+
 _logger.info("Waiting for request")
 for line in sys.stdin:
     _logger.info("Received request")
     request = json.loads(line)
 
     _logger.info("Parsing input data")
-    data = request["data"]
-    data, params = scoring_server._split_data_and_params(data)
-    data = scoring_server.infer_and_parse_data(data, input_schema)
+    is_arrow_request = "input_file" in request
+    if is_arrow_request:
+        if parse_arrow_input is None or importlib.util.find_spec("pyarrow") is None:
+            _logger.info("Arrow inputs aren't supported by the model environment")
+            with open(request["output_file"], "a") as f:
+                json.dump({"id": request["id"], "error_code": "UNSUPPORTED_CONTENT_TYPE"}, f)
+            continue
+        with open(request["input_file"], "rb") as f:
+            data, params = parse_arrow_input(f)
+    else:
+        data = request["data"]
+        data, params = scoring_server._split_data_and_params(data)
+        data = scoring_server.infer_and_parse_data(data, input_schema)
 
     _logger.info("Making predictions")
     if inspect.signature(model.predict).parameters.get("params"):
@@ -38,7 +68,8 @@ for line in sys.stdin:
         preds = model.predict(data)
 
     _logger.info("Writing predictions")
-    with open(request["output_file"], "a") as f:
-        scoring_server.predictions_to_json(preds, f, {"id": request["id"]})
+    if not (is_arrow_request and _write_arrow_predictions(preds, request)):
+        with open(request["output_file"], "a") as f:
+            scoring_server.predictions_to_json(preds, f, {"id": request["id"]})
 
     _logger.info("Done")
@@ -383,6 +383,10 @@ class MlflowModelCheckpointCallback(pl.Callback, MlflowModelCheckpointCallbackBa
                 metric_dict={k: float(v) for k, v in trainer.callback_metrics.items()},
             )
 
+    @rank_zero_only
+    def on_train_end(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule") -> None:
+        self.flush()
+
 
 # PyTorch-Lightning refactored the LoggerConnector class in version 1.4.0 and made metrics
 # update on demand. Prior to this, the metrics from the current step were not available to
@@ -4,8 +4,11 @@ import os
 import pathlib
 import posixpath
 import sys
+import tempfile
 from abc import abstractmethod
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
 from typing import Any, Dict, List, Optional, Union
 from urllib.parse import urlparse
 
@@ -370,27 +373,207 @@ class _DownloadThenConvertDataset(_LocationBasedDataset):
         """
 
 
+class _IncompatibleSchemaError(Exception):
+    pass
+
+
+def _conform_arrow_table_to_schema(table, schema):
+    """
+    Reorders the columns of the specified Arrow table to match the specified schema.
+
+    Raises:
+        _IncompatibleSchemaError: If the table has different columns or column types.
+    """
+    if table.schema.equals(schema):
+        return table
+    if sorted(table.column_names) != sorted(schema.names):
+        raise _IncompatibleSchemaError(
+            f"Columns {table.column_names} don't match columns {schema.names}"
+        )
+    table = table.select(schema.names)
+    if not table.schema.equals(schema):
+        raise _IncompatibleSchemaError(
+            f"Column types {table.schema.types} don't match column types {schema.types}"
+        )
+    return table
+
+
+def _promote_arrow_schemas(schema, other_schema):
+    """
+    Returns the schema of the concatenation of Arrow tables with the specified schemas, promoting
+    numeric columns with different types like ``pd.concat`` does, e.g. integer columns to floats
+    when other files have float values, and columns without values to the types of the other
+    schema. The pandas metadata of the first schema is kept.
+
+    Raises:
+        _IncompatibleSchemaError: If the schemas have different columns, or columns with
+            different types which aren't both numeric.
+    """
+    import numpy as np
+    import pyarrow as pa
+
+    if sorted(schema.names) != sorted(other_schema.names):
+        raise _IncompatibleSchemaError(
+            f"Columns {other_schema.names} don't match columns {schema.names}"
+        )
+    fields = []
+    for field in schema:
+        other_type = other_schema.field(field.name).type
+        if pa.types.is_null(field.type):
+            # Columns without values, e.g. empty object columns, take the types of other files
+            field = field.with_type(other_type)
+        elif field.type != other_type and not pa.types.is_null(other_type):
+            types = (field.type, other_type)
+            if not all(pa.types.is_integer(t) or pa.types.is_floating(t) for t in types):
+                raise _IncompatibleSchemaError(
+                    f"Column {field.name} has types {field.type} and {other_type}"
+                )
+            common_dtype = np.result_type(*(t.to_pandas_dtype() for t in types))
+            field = field.with_type(pa.from_numpy_dtype(common_dtype))
+        fields.append(field)
+    return pa.schema(fields, metadata=schema.metadata)
+
+
+def _pandas_dataframe_to_arrow_table(df, num_files):
+    import pyarrow as pa
+
+    # Store the indexes of datasets with several files as columns, including range indexes, so
+    # that the aggregated dataset has the same index as the concatenation of the DataFrames of its
+    # files. Range indexes of single files are only stored in the pandas metadata, like
+    # `DataFrame.to_parquet` does.
+    return pa.Table.from_pandas(df, preserve_index=True if num_files > 1 else None)
+
+
 class _PandasConvertibleDataset(_DownloadThenConvertDataset):
     """
     Base class representing a location-based ingestable dataset that can be parsed and converted to
     parquet using a series of Pandas DataFrame ``read_*`` and ``concat`` operations.
+
+    Dataset files are converted to Arrow tables in parallel and appended to the resolved parquet
+    file one at a time, so that only a bounded number of files are held in memory. Numeric columns
+    whose types differ across files are promoted like ``pd.concat`` does. Datasets whose files have
+    other schema differences, e.g. different columns, are aggregated in memory with ``pd.concat``
+    instead.
     """
 
     def _convert_to_parquet(self, dataset_file_paths: List[str], dst_path: str):
-        import pandas as pd
+        # Segments are written next to the resolved parquet file, so that a single segment can be
+        # moved in place
+        with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(dst_path))) as tmpdir:
+            # Close the generator explicitly to stop loading files as soon as writing fails
+            with closing(self._iter_files_as_arrow_tables(dataset_file_paths)) as tables:
+                try:
+                    segment_paths, schema = self._write_arrow_tables_as_parquet_segments(
+                        tables, tmpdir
+                    )
+                except _IncompatibleSchemaError as e:
+                    incompatible_schema_error = e
+                else:
+                    self._merge_parquet_segments(segment_paths, schema, dst_path)
+                    return
 
-        aggregated_dataframe = None
-        for data_file_path in dataset_file_paths:
-            _path = pathlib.Path(data_file_path)
-            data_file_as_dataframe = self._load_file_as_pandas_dataframe(
-                local_data_file_path=data_file_path,
-            )
-            aggregated_dataframe = (
-                pd.concat([aggregated_dataframe, data_file_as_dataframe])
-                if aggregated_dataframe is not None
-                else data_file_as_dataframe
-            )
+        _logger.warning(
+            "Dataset files have different schemas, aggregating them in memory instead of"
+            " streaming them to parquet: %s",
+            incompatible_schema_error,
+        )
+        self._convert_to_parquet_in_memory(dataset_file_paths, dst_path)
+
+    @staticmethod
+    def _write_arrow_tables_as_parquet_segments(tables, segments_dir: str):
+        """
+        Writes the specified Arrow tables to parquet files in ``segments_dir``, starting a new
+        file whenever the schema of the tables changes.
 
+        Returns:
+            A tuple of the paths of the written files, in order, and of the schema of their
+            concatenation, see :py:func:`_promote_arrow_schemas`.
+
+        Raises:
+            _IncompatibleSchemaError: As soon as a table has a schema which can't be promoted to
+                the schema of the previous tables.
+        """
+        import pyarrow.parquet as pq
+
+        segment_paths = []
+        schema = None
+        writer = None
+        try:
+            for table in tables:
+                if writer is not None:
+                    try:
+                        table = _conform_arrow_table_to_schema(table, writer.schema)
+                    except _IncompatibleSchemaError:
+                        writer.close()
+                        writer = None
+                if writer is None:
+                    schema = (
+                        table.schema
+                        if schema is None
+                        else _promote_arrow_schemas(schema, table.schema)
+                    )
+                    segment_paths.append(
+                        os.path.join(segments_dir, f"segment-{len(segment_paths)}.parquet")
+                    )
+                    writer = pq.ParquetWriter(segment_paths[-1], table.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        return segment_paths, schema
+
+    @staticmethod
+    def _merge_parquet_segments(segment_paths: List[str], schema, dst_path: str):
+        """
+        Concatenates the specified parquet files into a parquet file with the specified schema,
+        one row group at a time.
+        """
+        import pyarrow.parquet as pq
+
+        if len(segment_paths) == 1:
+            os.replace(segment_paths[0], dst_path)
+            return
+
+        with pq.ParquetWriter(dst_path, schema) as writer:
+            for segment_path in segment_paths:
+                segment = pq.ParquetFile(segment_path)
+                for i in range(segment.num_row_groups):
+                    row_group = segment.read_row_group(i).select(schema.names)
+                    writer.write_table(row_group.cast(schema))
+
+    def _iter_files_as_arrow_tables(self, dataset_file_paths: List[str]):
+        """
+        Loads the specified dataset files as Pandas DataFrames in parallel and yields them as
+        Arrow tables, in the order of the files. At most one file per worker thread is loaded
+        ahead of the file being yielded.
+        """
+        max_workers = min(os.cpu_count() or _NUM_DEFAULT_CPUS, len(dataset_file_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = deque()
+            for data_file_path in dataset_file_paths:
+                if len(futures) >= max_workers:
+                    yield _pandas_dataframe_to_arrow_table(
+                        futures.popleft().result(), len(dataset_file_paths)
+                    )
+                futures.append(
+                    executor.submit(
+                        self._load_file_as_pandas_dataframe, local_data_file_path=data_file_path
+                    )
+                )
+            while futures:
+                yield _pandas_dataframe_to_arrow_table(
+                    futures.popleft().result(), len(dataset_file_paths)
+                )
+
+    def _convert_to_parquet_in_memory(self, dataset_file_paths: List[str], dst_path: str):
+        import pandas as pd
+
+        aggregated_dataframe = pd.concat(
+            [
+                self._load_file_as_pandas_dataframe(local_data_file_path=data_file_path)
+                for data_file_path in dataset_file_paths
+            ]
+        )
         write_pandas_df_as_parquet(df=aggregated_dataframe, data_parquet_path=dst_path)
 
     @abstractmethod
@@ -417,6 +600,31 @@ class ParquetDataset(_PandasConvertibleDataset):
     Representation of a dataset in parquet format with files having the `.parquet` extension.
     """
 
+    _BATCH_SIZE = 100_000
+
+    def _iter_files_as_arrow_tables(self, dataset_file_paths: List[str]):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        for data_file_path in dataset_file_paths:
+            parquet_file = pq.ParquetFile(data_file_path)
+            schema = parquet_file.schema_arrow
+            index_columns = (schema.pandas_metadata or {}).get("index_columns")
+            # Range indexes are only described in the pandas metadata of files and need to be
+            # materialized by pandas, files with indexes stored as columns are streamed in batches
+            if not index_columns or not all(isinstance(c, str) for c in index_columns):
+                yield _pandas_dataframe_to_arrow_table(
+                    self._load_file_as_pandas_dataframe(local_data_file_path=data_file_path),
+                    len(dataset_file_paths),
+                )
+                continue
+
+            if parquet_file.metadata.num_rows == 0:
+                yield schema.empty_table()
+            for batch in parquet_file.iter_batches(batch_size=ParquetDataset._BATCH_SIZE):
+                # Keep the pandas metadata of the file, which is dropped from record batches
+                yield pa.Table.from_batches([batch], schema=schema)
+
     def _load_file_as_pandas_dataframe(self, local_data_file_path: str):
         return read_parquet_as_pandas_df(data_parquet_path=local_data_file_path)
 
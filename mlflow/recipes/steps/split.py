@@ -4,12 +4,9 @@ import os
 import sys
 import time
 from enum import Enum
-from functools import partial
-from multiprocessing.pool import Pool, ThreadPool
 
 import numpy as np
 import pandas as pd
-from packaging.version import Version
 
 from mlflow.exceptions import BAD_REQUEST, INVALID_PARAMETER_VALUE, MlflowException
 from mlflow.recipes.artifacts import DataframeArtifact
@@ -17,7 +14,6 @@ from mlflow.recipes.cards import BaseCard
 from mlflow.recipes.step import BaseStep, StepClass
 from mlflow.recipes.utils.execution import get_step_output_path
 from mlflow.recipes.utils.step import get_pandas_data_profiles, validate_classification_config
-from mlflow.store.artifact.artifact_repo import _NUM_DEFAULT_CPUS
 from mlflow.utils.time import Timer
 
 _logger = logging.getLogger(__name__)
@@ -64,32 +60,17 @@ def _run_split(task, input_df, split_ratios, target_col):
 
 
 def _perform_stratified_split_per_class(input_df, split_ratios, target_col):
-    classes = np.unique(input_df[target_col])
-    partial_func = partial(
-        _perform_split_for_one_class,
-        input_df=input_df,
-        split_ratios=split_ratios,
-        target_col=target_col,
-    )
-
-    with ThreadPool(os.cpu_count() or _NUM_DEFAULT_CPUS) as p:
-        zipped_dfs = p.map(partial_func, classes)
-        train_df, validation_df, test_df = [pd.concat(x) for x in list(zip(*zipped_dfs))]
-        return train_df, validation_df, test_df
+    # Row hashes don't depend on the other rows, so the rows of every class are split at once.
+    # Rows are grouped by class in the order of the sorted classes, preserving the order of the
+    # rows of each class.
+    hash_buckets = _create_hash_buckets(input_df)
+    _, class_indices = np.unique(input_df[target_col], return_inverse=True)
+    order = np.argsort(class_indices.ravel(), kind="stable")
+    return _get_split_df(input_df.iloc[order], hash_buckets[order], split_ratios)
 
 
-def _perform_split_for_one_class(
-    class_value,
-    input_df,
-    split_ratios,
-    target_col,
-):
-    filtered_df = input_df[input_df[target_col] == class_value]
-    return _perform_split(filtered_df, split_ratios, n_jobs=2)
-
-
-def _perform_split(input_df, split_ratios, n_jobs=-1):
-    hash_buckets = _create_hash_buckets(input_df, n_jobs=n_jobs)
+def _perform_split(input_df, split_ratios):
+    hash_buckets = _create_hash_buckets(input_df)
     train_df, validation_df, test_df = _get_split_df(input_df, hash_buckets, split_ratios)
     return train_df, validation_df, test_df
 
@@ -100,11 +81,12 @@ def _get_split_df(input_df, hash_buckets, split_ratios):
     ratio_sum = train_ratio + validation_ratio + test_ratio
     train_bucket_end = train_ratio / ratio_sum
     validation_bucket_end = (train_ratio + validation_ratio) / ratio_sum
-    train_df = input_df[hash_buckets.map(lambda x: x < train_bucket_end)]
+    hash_buckets = np.asarray(hash_buckets)
+    train_df = input_df[hash_buckets < train_bucket_end]
     validation_df = input_df[
-        hash_buckets.map(lambda x: train_bucket_end <= x < validation_bucket_end)
+        (train_bucket_end <= hash_buckets) & (hash_buckets < validation_bucket_end)
     ]
-    test_df = input_df[hash_buckets.map(lambda x: x >= validation_bucket_end)]
+    test_df = input_df[hash_buckets >= validation_bucket_end]
 
     empty_splits = [
         split_name
@@ -120,41 +102,39 @@ def _get_split_df(input_df, hash_buckets, split_ratios):
     return train_df, validation_df, test_df
 
 
-def _parallelize(data, func, n_jobs=-1):
-    n_jobs = n_jobs if 0 < n_jobs <= _NUM_DEFAULT_CPUS else _NUM_DEFAULT_CPUS
-    data_split = np.array_split(data, n_jobs)
-    pool = Pool(n_jobs)
-    data = pd.concat(pool.map(func, data_split))
-    pool.close()
-    pool.join()
-    return data
-
+def _make_column_hashable(column):
+    # Converts the column like mapping `_make_elem_hashable` over its elements does, without
+    # boxing the elements of numeric columns, which are converted to 64-bit types
+    if isinstance(column.dtype, np.dtype):
+        if column.dtype.kind == "b":
+            return column.array
+        if column.dtype.kind == "u" and column.dtype.itemsize == 8:
+            return column.array
+        if column.dtype.kind in "iu":
+            return column.to_numpy(dtype=np.int64)
+        if column.dtype.kind == "f":
+            return column.to_numpy(dtype=np.float64)
+    return column.map(_make_elem_hashable).array
 
-def _run_on_subset(func, data_subset):
-    if Version(pd.__version__) >= Version("2.1.0"):
-        return data_subset.map(func)
-    return data_subset.applymap(func)
 
-
-def _parallelize_on_rows(data, func, n_jobs=-1):
-    return _parallelize(data, partial(_run_on_subset, func), n_jobs=n_jobs)
-
-
-def _hash_pandas_dataframe(input_df, n_jobs=-1):
+def _hash_pandas_dataframe(input_df):
     from pandas.util import hash_pandas_object
 
-    hashed_input_df = _parallelize_on_rows(input_df, _make_elem_hashable, n_jobs=n_jobs)
-    return hash_pandas_object(hashed_input_df)
+    hashable_input_df = pd.DataFrame(
+        {i: _make_column_hashable(input_df.iloc[:, i]) for i in range(input_df.shape[1])},
+        index=input_df.index,
+    )
+    return hash_pandas_object(hashable_input_df)
 
 
-def _create_hash_buckets(input_df, n_jobs=-1):
+def _create_hash_buckets(input_df):
     # Create hash bucket used for splitting dataset
     # Note: use `hash_pandas_object` instead of python builtin hash because it is stable
     # across different process runs / different python versions
     with Timer() as t:
-        hash_buckets = _hash_pandas_dataframe(input_df, n_jobs=n_jobs).map(
-            lambda x: (x % _SPLIT_HASH_BUCKET_NUM) / _SPLIT_HASH_BUCKET_NUM
-        )
+        hash_buckets = (
+            _hash_pandas_dataframe(input_df).to_numpy() % _SPLIT_HASH_BUCKET_NUM
+        ) / _SPLIT_HASH_BUCKET_NUM
     _logger.debug(
         f"Creating hash buckets on input dataset containing {len(input_df)} "
         f"rows consumes {t:.3f} seconds."
@@ -56,6 +56,7 @@ from mlflow.protos.service_pb2 import (
     DeleteExperiment,
     DeleteRun,
     DeleteTag,
+    ExportMetrics,
     GetExperiment,
     GetExperimentByName,
     GetMetricHistory,
@@ -74,6 +75,7 @@ from mlflow.protos.service_pb2 import (
     UpdateRun,
 )
 from mlflow.server import app
+from mlflow.server.auth.cache import AuthCache
 from mlflow.server.auth.config import read_auth_config
 from mlflow.server.auth.logo import MLFLOW_LOGO
 from mlflow.server.auth.permissions import MANAGE, Permission, get_permission
@@ -111,6 +113,10 @@ _logger = logging.getLogger(__name__)
 
 auth_config = read_auth_config()
 store = SqlAlchemyStore()
+auth_cache = AuthCache(auth_config.cache_ttl_seconds, auth_config.cache_max_size)
+
+_EXPERIMENT_RESOURCE = "experiment"
+_REGISTERED_MODEL_RESOURCE = "registered_model"
 
 
 def is_unprotected_route(path: str) -> bool:
@@ -172,12 +178,39 @@ def _get_permission_from_store_or_default(store_permission_func: Callable[[], st
     return get_permission(perm)
 
 
+def _get_experiment_permission(experiment_id: str, username: str) -> Permission:
+    return auth_cache.get_permission(
+        _EXPERIMENT_RESOURCE,
+        str(experiment_id),
+        username,
+        lambda: _get_permission_from_store_or_default(
+            lambda: store.get_experiment_permission(experiment_id, username).permission
+        ),
+    )
+
+
+def _get_registered_model_permission(name: str, username: str) -> Permission:
+    return auth_cache.get_permission(
+        _REGISTERED_MODEL_RESOURCE,
+        name,
+        username,
+        lambda: _get_permission_from_store_or_default(
+            lambda: store.get_registered_model_permission(name, username).permission
+        ),
+    )
+
+
+def _get_run_experiment_id(run_id: str) -> str:
+    # Runs can't be moved to another experiment, so their experiment IDs can be cached safely
+    return auth_cache.get_run_experiment_id(
+        run_id, lambda: _get_tracking_store().get_run(run_id).info.experiment_id
+    )
+
+
 def _get_permission_from_experiment_id() -> Permission:
     experiment_id = _get_request_param("experiment_id")
     username = authenticate_request().username
-    return _get_permission_from_store_or_default(
-        lambda: store.get_experiment_permission(experiment_id, username).permission
-    )
+    return _get_experiment_permission(experiment_id, username)
 
 
 _EXPERIMENT_ID_PATTERN = re.compile(r"^(\d+)/")
@@ -193,9 +226,7 @@ def _get_experiment_id_from_view_args():
 def _get_permission_from_experiment_id_artifact_proxy() -> Permission:
     if experiment_id := _get_experiment_id_from_view_args():
         username = authenticate_request().username
-        return _get_permission_from_store_or_default(
-            lambda: store.get_experiment_permission(experiment_id, username).permission
-        )
+        return _get_experiment_permission(experiment_id, username)
     return get_permission(auth_config.default_permission)
 
 
@@ -208,29 +239,22 @@ def _get_permission_from_experiment_name() -> Permission:
             error_code=RESOURCE_DOES_NOT_EXIST,
         )
     username = authenticate_request().username
-    return _get_permission_from_store_or_default(
-        lambda: store.get_experiment_permission(store_exp.experiment_id, username).permission
-    )
+    return _get_experiment_permission(store_exp.experiment_id, username)
 
 
 def _get_permission_from_run_id() -> Permission:
     # run permissions inherit from parent resource (experiment)
     # so we just get the experiment permission
     run_id = _get_request_param("run_id")
-    run = _get_tracking_store().get_run(run_id)
-    experiment_id = run.info.experiment_id
+    experiment_id = _get_run_experiment_id(run_id)
     username = authenticate_request().username
-    return _get_permission_from_store_or_default(
-        lambda: store.get_experiment_permission(experiment_id, username).permission
-    )
+    return _get_experiment_permission(experiment_id, username)
 
 
 def _get_permission_from_registered_model_name() -> Permission:
     name = _get_request_param("name")
     username = authenticate_request().username
-    return _get_permission_from_store_or_default(
-        lambda: store.get_registered_model_permission(name, username).permission
-    )
+    return _get_registered_model_permission(name, username)
 
 
 def validate_can_read_experiment():
@@ -269,6 +293,18 @@ def validate_can_read_run():
     return _get_permission_from_run_id().can_read
 
 
+def validate_can_read_runs():
+    # Requests spanning several runs, e.g. metric exports, require read permission on the
+    # experiments of all of them
+    run_ids = _get_request_param("run_ids")
+    experiment_ids = {_get_run_experiment_id(run_id) for run_id in run_ids}
+    username = authenticate_request().username
+    return all(
+        _get_experiment_permission(experiment_id, username).can_read
+        for experiment_id in experiment_ids
+    )
+
+
 def validate_can_update_run():
     return _get_permission_from_run_id().can_update
 
@@ -300,7 +336,7 @@ def validate_can_manage_registered_model():
 def sender_is_admin():
     """Validate if the sender is admin"""
     username = authenticate_request().username
-    return store.get_user(username).is_admin
+    return auth_cache.get_is_admin(username, lambda: store.get_user(username).is_admin)
 
 
 def username_is_sender():
@@ -354,6 +390,7 @@ BEFORE_REQUEST_HANDLERS = {
     DeleteTag: validate_can_update_run,
     LogParam: validate_can_update_run,
     GetMetricHistory: validate_can_read_run,
+    ExportMetrics: validate_can_read_runs,
     ListArtifacts: validate_can_read_run,
     # Routes for model registry
     GetRegisteredModel: validate_can_read_registered_model,
@@ -450,7 +487,11 @@ def authenticate_request_basic_auth() -> Union[Authorization, Response]:
 
     username = request.authorization.username
     password = request.authorization.password
-    if store.authenticate_user(username, password):
+    if auth_cache.authenticate(
+        request.headers.get("Authorization", ""),
+        username,
+        lambda: store.authenticate_user(username, password),
+    ):
         return request.authorization
     else:
         # let user attempt login again
@@ -492,6 +533,7 @@ def set_can_manage_experiment_permission(resp: Response):
     experiment_id = response_message.experiment_id
     username = authenticate_request().username
     store.create_experiment_permission(experiment_id, username, MANAGE.name)
+    auth_cache.invalidate_permissions(_EXPERIMENT_RESOURCE, experiment_id, username)
 
 
 def set_can_manage_registered_model_permission(resp: Response):
@@ -500,6 +542,7 @@ def set_can_manage_registered_model_permission(resp: Response):
     name = response_message.registered_model.name
     username = authenticate_request().username
     store.create_registered_model_permission(name, username, MANAGE.name)
+    auth_cache.invalidate_permissions(_REGISTERED_MODEL_RESOURCE, name, username)
 
 
 def delete_can_manage_registered_model_permission(resp: Response):
@@ -515,6 +558,7 @@ def delete_can_manage_registered_model_permission(resp: Response):
     name = request.get_json(force=True, silent=True)["name"]
     username = authenticate_request().username
     store.delete_registered_model_permission(name, username)
+    auth_cache.invalidate_permissions(_REGISTERED_MODEL_RESOURCE, name)
 
 
 def filter_search_experiments(resp: Response):
@@ -803,6 +847,7 @@ def update_user_password():
     username = _get_request_param("username")
     password = _get_request_param("password")
     store.update_user(username, password=password)
+    auth_cache.invalidate_user(username)
     return make_response({})
 
 
@@ -811,6 +856,7 @@ def update_user_admin():
     username = _get_request_param("username")
     is_admin = _get_request_param("is_admin")
     store.update_user(username, is_admin=is_admin)
+    auth_cache.invalidate_user(username)
     return make_response({})
 
 
@@ -818,6 +864,7 @@ def update_user_admin():
 def delete_user():
     username = _get_request_param("username")
     store.delete_user(username)
+    auth_cache.invalidate_user(username)
     return make_response({})
 
 
@@ -827,6 +874,7 @@ def create_experiment_permission():
     username = _get_request_param("username")
     permission = _get_request_param("permission")
     ep = store.create_experiment_permission(experiment_id, username, permission)
+    auth_cache.invalidate_permissions(_EXPERIMENT_RESOURCE, str(experiment_id), username)
     return jsonify({"experiment_permission": ep.to_json()})
 
 
@@ -844,6 +892,7 @@ def update_experiment_permission():
     username = _get_request_param("username")
     permission = _get_request_param("permission")
     store.update_experiment_permission(experiment_id, username, permission)
+    auth_cache.invalidate_permissions(_EXPERIMENT_RESOURCE, str(experiment_id), username)
     return make_response({})
 
 
@@ -852,6 +901,7 @@ def delete_experiment_permission():
     experiment_id = _get_request_param("experiment_id")
     username = _get_request_param("username")
     store.delete_experiment_permission(experiment_id, username)
+    auth_cache.invalidate_permissions(_EXPERIMENT_RESOURCE, str(experiment_id), username)
     return make_response({})
 
 
@@ -861,6 +911,7 @@ def create_registered_model_permission():
     username = _get_request_param("username")
     permission = _get_request_param("permission")
     rmp = store.create_registered_model_permission(name, username, permission)
+    auth_cache.invalidate_permissions(_REGISTERED_MODEL_RESOURCE, name, username)
     return make_response({"registered_model_permission": rmp.to_json()})
 
 
@@ -878,6 +929,7 @@ def update_registered_model_permission():
     username = _get_request_param("username")
     permission = _get_request_param("permission")
     store.update_registered_model_permission(name, username, permission)
+    auth_cache.invalidate_permissions(_REGISTERED_MODEL_RESOURCE, name, username)
     return make_response({})
 
 
@@ -886,6 +938,7 @@ def delete_registered_model_permission():
     name = _get_request_param("name")
     username = _get_request_param("username")
     store.delete_registered_model_permission(name, username)
+    auth_cache.invalidate_permissions(_REGISTERED_MODEL_RESOURCE, name, username)
     return make_response({})
 
 
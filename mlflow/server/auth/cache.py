@@ -0,0 +1,159 @@
+"""
+Caches of the authentication and authorization decisions of the basic auth app.
+
+Verifying credentials requires hashing the password with a deliberately slow key derivation
+function, and authorizing a request requires several database reads. Since clients typically send
+many requests with the same credentials, e.g. a training job logging metrics, the outcomes of
+these operations are cached for a bounded amount of time.
+"""
+import hashlib
+import hmac
+import os
+import threading
+from typing import Any, Callable, Hashable, Optional
+
+from cachetools import TTLCache
+
+
+class _Cache:
+    """
+    A thread-safe TTL cache. Values are computed outside of the lock, and values computed while
+    the cache was being invalidated are not stored, so that they can't outlive the invalidation.
+    The cache is disabled, i.e. values are always computed, if ``max_size`` or ``ttl_seconds``
+    is 0.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        enabled = max_size > 0 and ttl_seconds > 0
+        self._cache = TTLCache(maxsize=max_size, ttl=ttl_seconds) if enabled else None
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        if self._cache is None:
+            return loader()
+        with self._lock:
+            try:
+                return self._cache[key]
+            except KeyError:
+                generation = self._generation
+        value = loader()
+        with self._lock:
+            if generation == self._generation:
+                self._cache[key] = value
+        return value
+
+    def invalidate(self, predicate: Callable[[Hashable, Any], bool]):
+        if self._cache is None:
+            return
+        with self._lock:
+            self._generation += 1
+            for key, value in list(self._cache.items()):
+                if predicate(key, value):
+                    self._cache.pop(key, None)
+
+    def clear(self):
+        if self._cache is None:
+            return
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+
+
+class AuthCache:
+    """
+    Bounded TTL caches of verified credentials, admin flags of users, experiments of runs and
+    resource permissions of users.
+
+    Each server worker process holds its own caches. Entries are invalidated when users and
+    permissions are updated through this process; other processes keep their entries until they
+    expire.
+
+    Args:
+        ttl_seconds: The number of seconds entries are cached for. Caching is disabled if it is 0.
+        max_size: The maximum number of entries of each cache.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self._credentials = _Cache(max_size, ttl_seconds)
+        self._admin_flags = _Cache(max_size, ttl_seconds)
+        self._run_experiment_ids = _Cache(max_size, ttl_seconds)
+        self._permissions = _Cache(max_size, ttl_seconds)
+        # Credentials are only kept as keyed digests, which can't be reversed or brute forced
+        # without the key of this process
+        self._digest_key = os.urandom(32)
+
+    def _credentials_digest(self, authorization_header: str) -> bytes:
+        return hmac.new(
+            self._digest_key, authorization_header.encode("utf-8"), hashlib.sha256
+        ).digest()
+
+    def authenticate(
+        self, authorization_header: str, username: str, authenticate: Callable[[], bool]
+    ) -> bool:
+        """
+        Returns whether the credentials of a request are valid. Only successful authentications
+        are cached, so that failed attempts keep going through ``authenticate``.
+
+        Args:
+            authorization_header: The value of the ``Authorization`` header of the request.
+            username: The username of the credentials.
+            authenticate: A function verifying the credentials.
+        """
+
+        def load():
+            if not authenticate():
+                raise _AuthenticationFailed()
+            return username
+
+        try:
+            return (
+                self._credentials.get_or_load(self._credentials_digest(authorization_header), load)
+                == username
+            )
+        except _AuthenticationFailed:
+            return False
+
+    def get_is_admin(self, username: str, loader: Callable[[], bool]) -> bool:
+        return self._admin_flags.get_or_load(username, loader)
+
+    def get_run_experiment_id(self, run_id: str, loader: Callable[[], str]) -> str:
+        return self._run_experiment_ids.get_or_load(run_id, loader)
+
+    def get_permission(
+        self, resource_type: str, resource_id: str, username: str, loader: Callable[[], Any]
+    ) -> Any:
+        return self._permissions.get_or_load((resource_type, resource_id, username), loader)
+
+    def invalidate_user(self, username: str):
+        """
+        Invalidate the credentials, the admin flag and the permissions of a user.
+        """
+        self._credentials.invalidate(lambda _, cached_username: cached_username == username)
+        self._admin_flags.invalidate(lambda cached_username, _: cached_username == username)
+        self._permissions.invalidate(lambda key, _: key[2] == username)
+
+    def invalidate_permissions(
+        self, resource_type: str, resource_id: str, username: Optional[str] = None
+    ):
+        """
+        Invalidate the permissions of a user, or of all users if ``username`` is None, on a
+        resource.
+        """
+        self._permissions.invalidate(
+            lambda key, _: key[:2] == (resource_type, resource_id)
+            and (username is None or key[2] == username)
+        )
+
+    def clear(self):
+        for cache in (
+            self._credentials,
+            self._admin_flags,
+            self._run_experiment_ids,
+            self._permissions,
+        ):
+            cache.clear()
+
+
+class _AuthenticationFailed(Exception):
+    pass
@@ -11,6 +11,8 @@ class AuthConfig(NamedTuple):
     admin_username: str
     admin_password: str
     authorization_function: str
+    cache_ttl_seconds: float
+    cache_max_size: int
 
 
 def _get_auth_config_path() -> str:
@@ -31,4 +33,6 @@ def read_auth_config() -> AuthConfig:
         authorization_function=config["mlflow"].get(
             "authorization_function", "mlflow.server.auth:authenticate_request_basic_auth"
         ),
+        cache_ttl_seconds=config["mlflow"].getfloat("cache_ttl_seconds", 0),
+        cache_max_size=config["mlflow"].getint("cache_max_size", 10000),
     )
@@ -1,6 +1,6 @@
 # Define all the service endpoint handlers here.
-import bisect
 import io
+import itertools
 import json
 import logging
 import os
@@ -11,7 +11,6 @@ import tempfile
 import time
 import urllib
 from functools import wraps
-from typing import List, Set
 
 import requests
 from flask import Response, current_app, jsonify, request, send_file
@@ -23,7 +22,10 @@ from mlflow.entities.model_registry import ModelVersionTag, RegisteredModelTag
 from mlflow.entities.multipart_upload import MultipartUploadPart
 from mlflow.entities.trace_info import TraceInfo
 from mlflow.entities.trace_status import TraceStatus
-from mlflow.environment_variables import MLFLOW_DEPLOYMENTS_TARGET
+from mlflow.environment_variables import (
+    MLFLOW_DEPLOYMENTS_TARGET,
+    MLFLOW_SERVER_ENABLE_METRIC_BUFFERING,
+)
 from mlflow.exceptions import MlflowException, _UnsupportedMultipartUploadException
 from mlflow.models import Model
 from mlflow.protos import databricks_pb2
@@ -77,6 +79,7 @@ from mlflow.protos.service_pb2 import (
     DeleteTraces,
     DeleteTraceTag,
     EndTrace,
+    ExportMetrics,
     GetExperiment,
     GetExperimentByName,
     GetMetricHistory,
@@ -106,6 +109,7 @@ from mlflow.server.validation import _validate_content_type
 from mlflow.store.artifact.artifact_repo import MultipartUploadMixin
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.db.db_types import DATABASE_ENGINES
+from mlflow.store.tracking.metrics_export import ARROW_STREAM_CONTENT_TYPE, write_metrics_ipc_stream
 from mlflow.tracing.artifact_utils import TRACE_DATA_FILE_NAME, get_artifact_uri_for_trace
 from mlflow.tracking._model_registry import utils as registry_utils
 from mlflow.tracking._model_registry.registry import ModelRegistryStoreRegistry
@@ -115,7 +119,11 @@ from mlflow.tracking.registry import UnsupportedModelRegistryStoreURIException
 from mlflow.utils.file_utils import local_file_uri_to_path
 from mlflow.utils.mime_type_utils import _guess_mime_type
 from mlflow.utils.promptlab_utils import _create_promptlab_run_impl
-from mlflow.utils.proto_json_utils import message_to_json, parse_dict
+from mlflow.utils.proto_json_utils import (
+    iter_message_json_chunks,
+    message_to_compact_json,
+    parse_dict,
+)
 from mlflow.utils.string_utils import is_string_type
 from mlflow.utils.uri import is_local_uri, validate_path_is_safe, validate_query_string
 from mlflow.utils.validation import _validate_batch_log_api_req
@@ -125,6 +133,8 @@ _tracking_store = None
 _model_registry_store = None
 _artifact_repo = None
 STATIC_PREFIX_ENV_VAR = "_MLFLOW_STATIC_PREFIX"
+# Size of the chunks in which proxied artifacts are streamed between clients and artifact stores
+_ARTIFACT_STREAM_CHUNK_SIZE = 1024 * 1024  # 1 MB
 
 
 class TrackingStoreRegistryWrapper(TrackingStoreRegistry):
@@ -325,7 +335,12 @@ def _get_tracking_store(backend_store_uri=None, default_artifact_root=None):
     if _tracking_store is None:
         store_uri = backend_store_uri or os.environ.get(BACKEND_STORE_URI_ENV_VAR, None)
         artifact_root = default_artifact_root or os.environ.get(ARTIFACT_ROOT_ENV_VAR, None)
-        _tracking_store = _tracking_store_registry.get_store(store_uri, artifact_root)
+        store = _tracking_store_registry.get_store(store_uri, artifact_root)
+        if MLFLOW_SERVER_ENABLE_METRIC_BUFFERING.get():
+            from mlflow.server.metric_buffer import create_metric_buffering_store
+
+            store = create_metric_buffering_store(store, store_uri)
+        _tracking_store = store
         utils.set_tracking_uri(store_uri)
     return _tracking_store
 
@@ -665,7 +680,7 @@ def _create_experiment():
     response_message = CreateExperiment.Response()
     response_message.experiment_id = experiment_id
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -677,7 +692,7 @@ def _get_experiment():
     )
     response_message = get_experiment_impl(request_message)
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -704,7 +719,7 @@ def _get_experiment_by_name():
     experiment = store_exp.to_proto()
     response_message.experiment.MergeFrom(experiment)
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -717,7 +732,7 @@ def _delete_experiment():
     _get_tracking_store().delete_experiment(request_message.experiment_id)
     response_message = DeleteExperiment.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -730,7 +745,7 @@ def _restore_experiment():
     _get_tracking_store().restore_experiment(request_message.experiment_id)
     response_message = RestoreExperiment.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -750,7 +765,7 @@ def _update_experiment():
         )
     response_message = UpdateExperiment.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -778,7 +793,7 @@ def _create_run():
     response_message = CreateRun.Response()
     response_message.run.MergeFrom(run.to_proto())
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -801,7 +816,7 @@ def _update_run():
     updated_info = _get_tracking_store().update_run_info(run_id, status, end_time, run_name)
     response_message = UpdateRun.Response(run_info=updated_info.to_proto())
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -814,7 +829,7 @@ def _delete_run():
     _get_tracking_store().delete_run(request_message.run_id)
     response_message = DeleteRun.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -827,7 +842,7 @@ def _restore_run():
     _get_tracking_store().restore_run(request_message.run_id)
     response_message = RestoreRun.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -851,7 +866,7 @@ def _log_metric():
     _get_tracking_store().log_metric(run_id, metric)
     response_message = LogMetric.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -871,7 +886,7 @@ def _log_param():
     _get_tracking_store().log_param(run_id, param)
     response_message = LogParam.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -894,7 +909,7 @@ def _log_inputs():
     _get_tracking_store().log_inputs(run_id, datasets=datasets)
     response_message = LogInputs.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -913,7 +928,7 @@ def _set_experiment_tag():
     _get_tracking_store().set_experiment_tag(request_message.experiment_id, tag)
     response_message = SetExperimentTag.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -933,7 +948,7 @@ def _set_tag():
     _get_tracking_store().set_tag(run_id, tag)
     response_message = SetTag.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -950,7 +965,7 @@ def _delete_tag():
     _get_tracking_store().delete_tag(request_message.run_id, request_message.key)
     response_message = DeleteTag.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -962,7 +977,7 @@ def _get_run():
     )
     response_message = get_run_impl(request_message)
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -994,14 +1009,28 @@ def _search_runs():
     experiment_ids = request_message.experiment_ids
     order_by = request_message.order_by
     page_token = request_message.page_token
+    include_metrics = None
+    if request_message.HasField("include_metrics"):
+        include_metrics = list(request_message.include_metrics.keys)
+    include_params = None
+    if request_message.HasField("include_params"):
+        include_params = list(request_message.include_params.keys)
     run_entities = _get_tracking_store().search_runs(
-        experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
+        experiment_ids,
+        filter_string,
+        run_view_type,
+        max_results,
+        order_by,
+        page_token,
+        include_metrics=include_metrics,
+        include_params=include_params,
+        include_inputs=request_message.include_inputs,
     )
     response_message.runs.extend([r.to_proto() for r in run_entities])
     if run_entities.token:
         response_message.next_page_token = run_entities.token
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -1036,7 +1065,7 @@ def _list_artifacts():
     response_message.files.extend([a.to_proto() for a in artifact_entities])
     response_message.root_uri = run.info.artifact_uri
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -1090,9 +1119,7 @@ def _get_metric_history():
     run_id = request_message.run_id or request_message.run_uuid
     metric_entities = _get_tracking_store().get_metric_history(run_id, request_message.metric_key)
     response_message.metrics.extend([m.to_proto() for m in metric_entities])
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_streamed_response(response_message)
 
 
 @catch_mlflow_exception
@@ -1169,29 +1196,6 @@ def get_metric_history_bulk_handler():
     }
 
 
-def _get_sampled_steps_from_steps(
-    start_step: int, end_step: int, max_results: int, all_steps: List[int]
-) -> Set[int]:
-    # NOTE: all_steps should be sorted before
-    # being passed to this function
-    start_idx = bisect.bisect_left(all_steps, start_step)
-    end_idx = bisect.bisect_right(all_steps, end_step)
-    if end_idx - start_idx <= max_results:
-        return set(all_steps[start_idx:end_idx])
-
-    num_steps = end_idx - start_idx
-    interval = num_steps / max_results
-    sampled_steps = []
-
-    for i in range(0, max_results):
-        idx = start_idx + int(i * interval)
-        if idx < num_steps:
-            sampled_steps.append(all_steps[idx])
-
-    sampled_steps.append(all_steps[end_idx - 1])
-    return set(sampled_steps)
-
-
 @catch_mlflow_exception
 @_disable_if_artifacts_only
 def get_metric_history_bulk_interval_handler():
@@ -1233,73 +1237,83 @@ def get_metric_history_bulk_interval_handler():
     metric_key = request_message.metric_key
     max_results = int(args.get("max_results", MAX_RESULTS_PER_RUN))
 
-    store = _get_tracking_store()
+    # cannot fetch from request_message as the default value is 0
+    start_step = args.get("start_step")
+    end_step = args.get("end_step")
 
-    def _get_sampled_steps(run_ids, metric_key, max_results):
-        # cannot fetch from request_message as the default value is 0
-        start_step = args.get("start_step")
-        end_step = args.get("end_step")
-
-        # perform validation before any data fetching occurs
-        if start_step is not None and end_step is not None:
-            start_step = int(start_step)
-            end_step = int(end_step)
-            if start_step > end_step:
-                raise MlflowException.invalid_parameter_value(
-                    "end_step must be greater than start_step. "
-                    f"Found start_step={start_step} and end_step={end_step}."
-                )
-        elif start_step is not None or end_step is not None:
+    # perform validation before any data fetching occurs
+    if start_step is not None and end_step is not None:
+        start_step = int(start_step)
+        end_step = int(end_step)
+        if start_step > end_step:
             raise MlflowException.invalid_parameter_value(
-                "If either start step or end step are specified, both must be specified."
+                "end_step must be greater than start_step. "
+                f"Found start_step={start_step} and end_step={end_step}."
             )
+    elif start_step is not None or end_step is not None:
+        raise MlflowException.invalid_parameter_value(
+            "If either start step or end step are specified, both must be specified."
+        )
 
-        # get a list of all steps for all runs. this is necessary
-        # because we can't assume that every step was logged, so
-        # sampling needs to be done on the steps that actually exist
-        all_runs = [
-            [m.step for m in store.get_metric_history(run_id, metric_key)] for run_id in run_ids
-        ]
-
-        # save mins and maxes to be added back later
-        all_mins_and_maxes = {step for run in all_runs if run for step in [min(run), max(run)]}
-        all_steps = sorted({step for sublist in all_runs for step in sublist})
-
-        # init start and end step if not provided in args
-        if start_step is None and end_step is None:
-            start_step = 0
-            end_step = all_steps[-1] if all_steps else 0
+    # Downsampling is pushed down into the store, which can select the first, minimum and
+    # maximum values of each step bucket without fetching the full metric histories
+    store = _get_tracking_store()
+    metrics_with_run_ids = store.get_sampled_metric_history(
+        run_ids=run_ids,
+        metric_key=metric_key,
+        start_step=start_step,
+        end_step=end_step,
+        max_points=max_results,
+    )
 
-        # remove any steps outside of the range
-        all_mins_and_maxes = {step for step in all_mins_and_maxes if start_step <= step <= end_step}
+    response_message = GetMetricHistoryBulkInterval.Response()
+    # Every value logged at a sampled step is returned, so cap the number of values per run
+    for _, run_metrics in itertools.groupby(metrics_with_run_ids, key=lambda m: m.run_id):
+        response_message.metrics.extend(
+            m.to_proto() for m in itertools.islice(run_metrics, MAX_RESULTS_GET_METRIC_HISTORY)
+        )
+    return _wrap_streamed_response(response_message)
 
-        # doing extra iterations here shouldn't badly affect performance,
-        # since the number of steps at this point should be relatively small
-        # (MAX_RESULTS_PER_RUN + len(all_mins_and_maxes))
-        sampled_steps = _get_sampled_steps_from_steps(start_step, end_step, max_results, all_steps)
-        return sorted(sampled_steps.union(all_mins_and_maxes))
 
-    def _default_history_bulk_interval_impl():
-        steps = _get_sampled_steps(run_ids, metric_key, max_results)
-        metrics_with_run_ids = []
-        for run_id in run_ids:
-            metrics_with_run_ids.extend(
-                store.get_metric_history_bulk_interval_from_steps(
-                    run_id=run_id,
-                    metric_key=metric_key,
-                    steps=steps,
-                    max_results=MAX_RESULTS_GET_METRIC_HISTORY,
-                )
+@catch_mlflow_exception
+@_disable_if_artifacts_only
+def _export_metrics():
+    request_message = _get_request_message(
+        ExportMetrics(),
+        schema={
+            "run_ids": [_assert_required, _assert_array, _assert_item_type_string],
+            "metric_keys": [_assert_array, _assert_item_type_string],
+            "start_step": [_assert_intlike],
+            "end_step": [_assert_intlike],
+        },
+    )
+    has_start_step = request_message.HasField("start_step")
+    if has_start_step != request_message.HasField("end_step"):
+        raise MlflowException.invalid_parameter_value(
+            "If either start step or end step are specified, both must be specified."
+        )
+    step_range = None
+    if has_start_step:
+        step_range = (request_message.start_step, request_message.end_step)
+        if step_range[0] > step_range[1]:
+            raise MlflowException.invalid_parameter_value(
+                "end_step must be greater than start_step. "
+                f"Found start_step={step_range[0]} and end_step={step_range[1]}."
             )
-        return metrics_with_run_ids
 
-    metrics_with_run_ids = _default_history_bulk_interval_impl()
-
-    response_message = GetMetricHistoryBulkInterval.Response()
-    response_message.metrics.extend([m.to_proto() for m in metrics_with_run_ids])
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    batches = iter(
+        _get_tracking_store().export_metrics(
+            run_ids=list(request_message.run_ids),
+            metric_keys=list(request_message.metric_keys) or None,
+            step_range=step_range,
+        )
+    )
+    # Fetch the first batch before streaming the response, so that errors raised by the store
+    # (e.g. for a nonexistent run) are returned with the appropriate status code
+    first_batch = next(batches, None)
+    if first_batch is not None:
+        batches = itertools.chain([first_batch], batches)
+    return Response(write_metrics_ipc_stream(batches), mimetype=ARROW_STREAM_CONTENT_TYPE)
 
 
 @catch_mlflow_exception
@@ -1429,7 +1443,7 @@ def create_promptlab_run_handler():
     response_message = CreateRun.Response()
     response_message.run.MergeFrom(run.to_proto())
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -1522,7 +1536,7 @@ def _search_experiments():
     if experiment_entities.token:
         response_message.next_page_token = experiment_entities.token
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -1562,7 +1576,7 @@ def _log_batch():
     )
     response_message = LogBatch.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -1596,16 +1610,24 @@ def _log_model():
     )
     response_message = LogModel.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
 def _wrap_response(response_message):
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
+def _wrap_streamed_response(response_message):
+    """
+    Wraps a response message with large repeated fields, e.g. metric histories, into a response
+    whose JSON is generated while it is sent.
+    """
+    return Response(iter_message_json_chunks(response_message), mimetype="application/json")
+
+
 # Model Registry APIs
 
 
@@ -2092,22 +2114,41 @@ def _get_model_version_by_alias():
 def _download_artifact(artifact_path):
     """
     A request handler for `GET /mlflow-artifacts/artifacts/<artifact_path>` to download an artifact
-    from `artifact_path` (a relative path from the root artifact directory).
+    from `artifact_path` (a relative path from the root artifact directory). A single byte range
+    can be requested with a `Range` header.
     """
     artifact_path = validate_path_is_safe(artifact_path)
-    tmp_dir = tempfile.TemporaryDirectory()
     artifact_repo = _get_artifact_repo_mlflow_artifacts()
-    dst = artifact_repo.download_artifacts(artifact_path, tmp_dir.name)
-
-    # Ref: https://stackoverflow.com/a/24613980/6943581
-    file_handle = open(dst, "rb")  # noqa: SIM115
+    stream = artifact_repo.open_read_stream(artifact_path)
+    status = 200
+    headers = {}
+    if stream.size is not None:
+        headers["Accept-Ranges"] = "bytes"
+        headers["Content-Length"] = str(stream.size)
+        byte_range = request.range
+        if byte_range is not None and byte_range.units == "bytes" and len(byte_range.ranges) == 1:
+            start_stop = byte_range.range_for_length(stream.size)
+            if start_stop is None:
+                stream.close()
+                return Response(status=416, headers={"Content-Range": f"bytes */{stream.size}"})
+            start, stop = start_stop
+            if (start, stop) != (0, stream.size):
+                stream.close()
+                stream = artifact_repo.open_read_stream(
+                    artifact_path, offset=start, length=stop - start
+                )
+            status = 206
+            headers["Content-Range"] = f"bytes {start}-{stop - 1}/{stream.size}"
+            headers["Content-Length"] = str(stop - start)
 
-    def stream_and_remove_file():
-        yield from file_handle
-        file_handle.close()
-        tmp_dir.cleanup()
+    def stream_artifact():
+        with stream:
+            while chunk := stream.read(_ARTIFACT_STREAM_CHUNK_SIZE):
+                yield chunk
 
-    file_sender_response = current_app.response_class(stream_and_remove_file())
+    file_sender_response = current_app.response_class(
+        stream_artifact(), status=status, headers=headers
+    )
 
     return _response_with_file_attachment_headers(artifact_path, file_sender_response)
 
@@ -2120,19 +2161,10 @@ def _upload_artifact(artifact_path):
     to `artifact_path` (a relative path from the root artifact directory).
     """
     artifact_path = validate_path_is_safe(artifact_path)
-    head, tail = posixpath.split(artifact_path)
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp_path = os.path.join(tmp_dir, tail)
-        with open(tmp_path, "wb") as f:
-            chunk_size = 1024 * 1024  # 1 MB
-            while True:
-                chunk = request.stream.read(chunk_size)
-                if len(chunk) == 0:
-                    break
-                f.write(chunk)
-
-        artifact_repo = _get_artifact_repo_mlflow_artifacts()
-        artifact_repo.log_artifact(tmp_path, artifact_path=head or None)
+    artifact_repo = _get_artifact_repo_mlflow_artifacts()
+    with artifact_repo.open_write_stream(artifact_path) as f:
+        while chunk := request.stream.read(_ARTIFACT_STREAM_CHUNK_SIZE):
+            f.write(chunk)
 
     return _wrap_response(UploadArtifact.Response())
 
@@ -2155,7 +2187,7 @@ def _list_artifacts_mlflow_artifacts():
     response_message = ListArtifacts.Response()
     response_message.files.extend(files)
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -2172,7 +2204,7 @@ def _delete_artifact_mlflow_artifacts(artifact_path):
     artifact_repo.delete_artifacts(artifact_path)
     response_message = DeleteArtifact.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -2233,7 +2265,7 @@ def _create_multipart_upload_artifact(artifact_path):
     )
     response_message = create_response.to_proto()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(message_to_compact_json(response_message))
     return response
 
 
@@ -2598,6 +2630,7 @@ HANDLERS = {
     ListArtifacts: _list_artifacts,
     GetMetricHistory: _get_metric_history,
     GetMetricHistoryBulkInterval: get_metric_history_bulk_interval_handler,
+    ExportMetrics: _export_metrics,
     SearchExperiments: _search_experiments,
     LogInputs: _log_inputs,
     # Model Registry APIs
@@ -0,0 +1,475 @@
+"""
+Write-behind buffering of the metrics logged through the tracking server.
+
+When ``MLFLOW_SERVER_ENABLE_METRIC_BUFFERING`` is set, the metrics of ``log_metric`` and
+``log_batch`` requests are appended to a write-ahead log in ``MLFLOW_SERVER_METRIC_BUFFER_DIR`` and
+buffered in memory per run, and the requests are acknowledged as soon as the log is synced to disk.
+A background thread writes the buffered metrics of each run to the tracking store with bulk
+``log_batch`` calls every ``MLFLOW_SERVER_METRIC_BUFFER_FLUSH_INTERVAL`` seconds, or as soon as
+``MLFLOW_SERVER_METRIC_BUFFER_MAX_SIZE`` metrics are buffered, instead of running one transaction
+per request.
+
+Reads of runs and metrics write the buffered metrics of the runs they read first, so that clients
+read their own writes. Each server worker process buffers the metrics of the requests it handles
+and can't see the metrics buffered by the others, so ``mlflow server`` only enables buffering with
+a single gunicorn worker.
+
+Each worker process appends to its own segment of the write-ahead log, which it locks, and removes
+its segments once their metrics are written to the store. Segments left by processes that exited
+without writing their buffered metrics, e.g. because they crashed, are replayed by the next worker
+starting. Since the metrics of a segment may have been partially written already, replaying a
+segment relies on the store ignoring metrics that were already logged, so buffering is only
+supported by SQL stores.
+"""
+import atexit
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import uuid
+from collections import defaultdict
+from pathlib import Path
+
+from cachetools import LRUCache
+
+from mlflow.entities import Metric
+from mlflow.entities.lifecycle_stage import LifecycleStage
+from mlflow.environment_variables import (
+    MLFLOW_SERVER_METRIC_BUFFER_DIR,
+    MLFLOW_SERVER_METRIC_BUFFER_FLUSH_INTERVAL,
+    MLFLOW_SERVER_METRIC_BUFFER_MAX_SIZE,
+)
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import (
+    INVALID_PARAMETER_VALUE,
+    RESOURCE_DOES_NOT_EXIST,
+    ErrorCode,
+)
+from mlflow.utils.validation import MAX_METRICS_PER_BATCH, _validate_batch_log_data
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+
+_logger = logging.getLogger(__name__)
+
+_SEGMENT_SUFFIX = ".wal"
+# Errors of the store that logging the same metrics again would raise again, e.g. because their
+# run was deleted. The metrics of such writes are dropped instead of being retried.
+_PERMANENT_ERROR_CODES = {
+    ErrorCode.Name(INVALID_PARAMETER_VALUE),
+    ErrorCode.Name(RESOURCE_DOES_NOT_EXIST),
+}
+
+
+def _is_permanent_error(e):
+    return isinstance(e, MlflowException) and e.error_code in _PERMANENT_ERROR_CODES
+
+
+def _serialize_metrics(run_id, metrics):
+    fields = [[m.key, m.value, m.timestamp, m.step] for m in metrics]
+    return (json.dumps([run_id, fields]) + "\n").encode("utf-8")
+
+
+def _read_segment(path):
+    """
+    Returns:
+        A dictionary mapping run IDs to the metrics logged to them in the segment at ``path``. A
+        trailing partial entry, left by an interrupted append, is ignored.
+    """
+    metrics_by_run_id = defaultdict(list)
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                run_id, fields = json.loads(line)
+            except ValueError:
+                continue
+            metrics_by_run_id[run_id].extend(Metric(*field) for field in fields)
+    return metrics_by_run_id
+
+
+class _WriteAheadLog:
+    """
+    The write-ahead log of the buffered metrics of a server worker process, made of segment files
+    named after the process. Appends go to the current segment, which is rotated when all the
+    buffered metrics are written to the store, so that the previous segment can be removed.
+    """
+
+    def __init__(self, wal_dir):
+        self.wal_dir = Path(wal_dir)
+        self.wal_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = None
+        self._open_segment()
+
+    def _open_segment(self):
+        path = self.wal_dir / f"{os.getpid()}-{uuid.uuid4().hex}{_SEGMENT_SUFFIX}"
+        self._file = open(path, "ab")  # noqa: SIM115
+        if fcntl is not None:
+            # Held until the segment is closed, so that other processes don't replay it
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+
+    @property
+    def current_segment(self):
+        return Path(self._file.name)
+
+    def is_empty(self):
+        return self._file.tell() == 0
+
+    def append(self, run_id, metrics):
+        """
+        Append the metrics logged to a run to the current segment and sync it to disk.
+        """
+        data = _serialize_metrics(run_id, metrics)
+        with self._lock:
+            self._file.write(data)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def rotate(self):
+        """
+        Start a new segment.
+
+        Returns:
+            The path of the previous segment, which can be removed once the metrics appended to it
+            are written to the store.
+        """
+        with self._lock:
+            previous_file = self._file
+            self._open_segment()
+        previous_file.close()
+        return Path(previous_file.name)
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def iter_orphaned_segments(self):
+        """
+        Yields the paths of the segments of other processes that exited, locked by this process
+        until the next iteration. Segments can't be told apart from the segments of running
+        processes without file locks, so none is yielded on Windows.
+        """
+        if fcntl is None:
+            return
+        for path in sorted(self.wal_dir.glob(f"*{_SEGMENT_SUFFIX}")):
+            if path == self.current_segment:
+                continue
+            try:
+                with open(path, "rb") as f:
+                    try:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    except OSError:
+                        # Locked by a running process
+                        continue
+                    # The segment may have been replayed and removed by another process between
+                    # the glob and the lock
+                    if path.exists():
+                        yield path
+            except FileNotFoundError:
+                # Replayed by another process in the meantime
+                continue
+
+
+class MetricBuffer:
+    """
+    Buffers the metrics logged to the runs of a tracking store, and writes them to the store in
+    bulk from a background thread.
+
+    Args:
+        store: The tracking store to write metrics to.
+        wal_dir: The directory of the write-ahead log.
+        flush_interval: The maximum number of seconds metrics are buffered for.
+        max_size: The number of buffered metrics above which they are written to the store
+            without waiting for the flush interval.
+    """
+
+    def __init__(self, store, wal_dir, flush_interval=1.0, max_size=10000):
+        self.store = store
+        self.flush_interval = flush_interval
+        self.max_size = max_size
+        self._wal = _WriteAheadLog(wal_dir)
+        self._buffers = defaultdict(list)
+        self._num_buffered = 0
+        self._lock = threading.Lock()
+        self._flush_requested = threading.Condition(self._lock)
+        # Held while metrics are written to the store, so that reads wait for the metrics that
+        # are being written instead of missing them
+        self._flush_lock = threading.RLock()
+        # IDs of runs recently checked to be active, to avoid reading the run for every request
+        self._active_run_ids = LRUCache(maxsize=10000)
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._stopped = False
+        self._replay_orphaned_segments()
+        atexit.register(self.shutdown)
+
+    def _replay_orphaned_segments(self):
+        for path in self._wal.iter_orphaned_segments():
+            _logger.info("Replaying the buffered metrics of %s", path)
+            failed = False
+            for run_id, metrics in _read_segment(path).items():
+                failed |= not self._write_metrics(run_id, metrics)
+            if failed:
+                _logger.warning(
+                    "Failed to write some of the buffered metrics of %s, which will be replayed"
+                    " by the next server worker starting",
+                    path,
+                )
+            else:
+                path.unlink(missing_ok=True)
+
+    def _check_run_is_active(self, run_id):
+        if run_id in self._active_run_ids:
+            return
+        run = self.store.get_run(run_id)
+        if run.info.lifecycle_stage != LifecycleStage.ACTIVE:
+            raise MlflowException(
+                (
+                    f"The run {run_id} must be in the 'active' state. "
+                    f"Current state is {run.info.lifecycle_stage}."
+                ),
+                INVALID_PARAMETER_VALUE,
+            )
+        self._active_run_ids[run_id] = True
+
+    def validate_metrics(self, run_id, metrics):
+        """
+        Raise the exceptions that logging ``metrics`` to the store would raise for invalid
+        metrics or inactive runs.
+        """
+        _validate_batch_log_data(metrics, [], [])
+        self._check_run_is_active(run_id)
+
+    def log_metrics(self, run_id, metrics):
+        """
+        Validate ``metrics``, append them to the write-ahead log and buffer them.
+        """
+        if not metrics:
+            return
+        self.validate_metrics(run_id, metrics)
+        self._ensure_worker_started()
+        with self._lock:
+            # Appended with the lock held, so that the segment isn't rotated and removed between
+            # the append and the buffering of the metrics
+            self._wal.append(run_id, metrics)
+            self._buffers[run_id].extend(metrics)
+            self._num_buffered += len(metrics)
+            if self._num_buffered >= self.max_size:
+                self._flush_requested.notify()
+
+    def forget_run(self, run_id):
+        """
+        Stop considering ``run_id`` active, e.g. because it's being deleted.
+        """
+        self._active_run_ids.pop(run_id, None)
+
+    def _write_metrics(self, run_id, metrics):
+        """
+        Write metrics to the store.
+
+        Returns:
+            ``False`` if writing the metrics failed with an error that may be transient, in which
+            case they need to be written again, ``True`` otherwise.
+        """
+        try:
+            for i in range(0, len(metrics), MAX_METRICS_PER_BATCH):
+                self.store.log_batch(
+                    run_id, metrics=metrics[i : i + MAX_METRICS_PER_BATCH], params=[], tags=[]
+                )
+        except Exception as e:
+            if _is_permanent_error(e):
+                _logger.error("Dropping %d buffered metrics of run %s: %s", len(metrics), run_id, e)
+                self.forget_run(run_id)
+                return True
+            _logger.warning(
+                "Failed to write %d buffered metrics of run %s, they will be written again later",
+                len(metrics),
+                run_id,
+                exc_info=True,
+            )
+            return False
+        return True
+
+    def _rebuffer(self, run_id, metrics):
+        with self._lock:
+            self._buffers[run_id][:0] = metrics
+            self._num_buffered += len(metrics)
+
+    def flush_runs(self, run_ids):
+        """
+        Write the buffered metrics of the given runs to the store.
+        """
+        if not self._num_buffered:
+            return
+        with self._flush_lock:
+            for run_id in run_ids:
+                with self._lock:
+                    metrics = self._buffers.pop(run_id, [])
+                    self._num_buffered -= len(metrics)
+                # The metrics remain in the current segment of the write-ahead log, which is
+                # removed by the next call to `flush`
+                if metrics and not self._write_metrics(run_id, metrics):
+                    self._rebuffer(run_id, metrics)
+
+    def flush(self):
+        """
+        Write all the buffered metrics to the store.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._buffers and self._wal.is_empty():
+                    return
+                buffers, self._buffers = self._buffers, defaultdict(list)
+                self._num_buffered = 0
+                segment = self._wal.rotate()
+            for run_id, metrics in buffers.items():
+                if not self._write_metrics(run_id, metrics):
+                    # Log the metrics to the new segment before removing the previous one
+                    self._wal.append(run_id, metrics)
+                    self._rebuffer(run_id, metrics)
+            segment.unlink(missing_ok=True)
+
+    def _ensure_worker_started(self):
+        # NB: The worker thread is started lazily, so that it runs in the worker process when the
+        # application is loaded before forking, e.g. with `gunicorn --preload`
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="MlflowMetricBufferFlusher", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._stopped and self._num_buffered < self.max_size:
+                    self._flush_requested.wait(timeout=self.flush_interval)
+                stopped = self._stopped
+            if stopped:
+                return
+            try:
+                self.flush()
+            except Exception:
+                _logger.exception("Failed to flush buffered metrics")
+
+    def shutdown(self):
+        """
+        Stop the background thread and write the buffered metrics to the store.
+        """
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            self._flush_requested.notify()
+        with self._thread_lock:
+            thread = self._thread
+        if thread is not None and thread.is_alive():
+            thread.join()
+        self.flush()
+        self._wal.close()
+        # Metrics that failed to be written remain in the last segment, which is replayed by the
+        # next worker starting
+        if not self._num_buffered:
+            self._wal.current_segment.unlink(missing_ok=True)
+
+
+class MetricBufferingTrackingStore:
+    """
+    Wraps a tracking store to buffer the metrics logged through it in a :py:class:`MetricBuffer`.
+    Reads of runs and metrics write the buffered metrics of the runs they read first. Other
+    methods are delegated to the wrapped store.
+    """
+
+    def __init__(self, store, metric_buffer):
+        self._store = store
+        self.metric_buffer = metric_buffer
+
+    def __getattr__(self, name):
+        attr = getattr(self._store, name)
+        # Optional method of stores, see `get_metric_history_bulk_handler`
+        if name == "get_metric_history_bulk":
+
+            def get_metric_history_bulk(run_ids, *args, **kwargs):
+                self.metric_buffer.flush_runs(run_ids)
+                return attr(run_ids, *args, **kwargs)
+
+            return get_metric_history_bulk
+        return attr
+
+    def log_metric(self, run_id, metric):
+        self.metric_buffer.log_metrics(run_id, [metric])
+
+    def log_batch(self, run_id, metrics, params, tags):
+        if params or tags:
+            # Reject invalid metrics before logging params and tags
+            self.metric_buffer.validate_metrics(run_id, metrics)
+            self._store.log_batch(run_id, metrics=[], params=params, tags=tags)
+        self.metric_buffer.log_metrics(run_id, metrics)
+
+    def delete_run(self, run_id):
+        self.metric_buffer.flush_runs([run_id])
+        self.metric_buffer.forget_run(run_id)
+        self._store.delete_run(run_id)
+
+    def get_run(self, run_id):
+        self.metric_buffer.flush_runs([run_id])
+        return self._store.get_run(run_id)
+
+    def get_metric_history(self, run_id, metric_key, *args, **kwargs):
+        self.metric_buffer.flush_runs([run_id])
+        return self._store.get_metric_history(run_id, metric_key, *args, **kwargs)
+
+    def get_metric_history_bulk_interval_from_steps(self, run_id, *args, **kwargs):
+        self.metric_buffer.flush_runs([run_id])
+        return self._store.get_metric_history_bulk_interval_from_steps(run_id, *args, **kwargs)
+
+    def get_sampled_metric_history(self, run_ids, *args, **kwargs):
+        self.metric_buffer.flush_runs(run_ids)
+        return self._store.get_sampled_metric_history(run_ids, *args, **kwargs)
+
+    def export_metrics(self, run_ids, *args, **kwargs):
+        self.metric_buffer.flush_runs(run_ids)
+        return self._store.export_metrics(run_ids, *args, **kwargs)
+
+    def search_runs(self, *args, **kwargs):
+        # The runs matching the search aren't known beforehand
+        self.metric_buffer.flush()
+        return self._store.search_runs(*args, **kwargs)
+
+
+def create_metric_buffering_store(store, store_uri):
+    """
+    Wrap ``store`` to buffer the metrics logged through it, as configured by the
+    ``MLFLOW_SERVER_METRIC_BUFFER_*`` environment variables.
+
+    Args:
+        store: The tracking store to wrap.
+        store_uri: The URI of the tracking store. Write-ahead logs are kept in a subdirectory
+            specific to the store, so that servers of different stores sharing the same buffer
+            directory don't replay each other's metrics.
+    """
+    from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+
+    # Replaying the write-ahead log of a crashed worker logs the metrics it already wrote again,
+    # which SQL stores ignore but other stores, e.g. file stores, would duplicate
+    if not isinstance(store, SqlAlchemyStore):
+        raise MlflowException.invalid_parameter_value(
+            "Metric buffering is only supported by database-backed tracking stores, got a "
+            f"{type(store).__name__} for '{store_uri}'."
+        )
+    base_dir = MLFLOW_SERVER_METRIC_BUFFER_DIR.get() or os.path.join(
+        tempfile.gettempdir(), "mlflow-metric-buffer"
+    )
+    store_dir = hashlib.sha256(str(store_uri).encode("utf-8")).hexdigest()[:16]
+    metric_buffer = MetricBuffer(
+        store,
+        os.path.join(base_dir, store_dir),
+        flush_interval=MLFLOW_SERVER_METRIC_BUFFER_FLUSH_INTERVAL.get(),
+        max_size=MLFLOW_SERVER_METRIC_BUFFER_MAX_SIZE.get(),
+    )
+    return MetricBufferingTrackingStore(store, metric_buffer)
@@ -30,6 +30,7 @@ import yaml
 from packaging.version import Version
 
 import mlflow
+import mlflow.tracking.fluent
 from mlflow import environment_variables, mleap, pyfunc
 from mlflow.environment_variables import MLFLOW_DFS_TMP
 from mlflow.exceptions import MlflowException
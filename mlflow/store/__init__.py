@@ -1,6 +1,4 @@
-from mlflow.store import _unity_catalog  # noqa: F401
-from mlflow.store.artifact import artifact_repo
-from mlflow.store.tracking import abstract_store
+import importlib
 
 __all__ = [
     # tracking server meta-data stores
@@ -8,3 +6,16 @@ __all__ = [
     # artifact repository stores
     "artifact_repo",
 ]
+
+# Stores are imported on first use, so that importing lightweight modules of this package, e.g.
+# `mlflow.store.db.db_types`, doesn't import all the stores and their dependencies
+_LAZY_SUBMODULES = {
+    "abstract_store": "mlflow.store.tracking.abstract_store",
+    "artifact_repo": "mlflow.store.artifact.artifact_repo",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(_LAZY_SUBMODULES[name])
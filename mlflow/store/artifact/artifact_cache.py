@@ -0,0 +1,307 @@
+"""
+An opt-in local cache of downloaded model version artifacts, shared by the processes of a machine.
+
+When ``MLFLOW_ARTIFACT_CACHE_DIR`` is set, the files of registered model versions downloaded from
+``models:/`` URIs are stored in that directory, so that loading the same model version again
+doesn't download its files again. Only model versions are cached, since their files aren't
+expected to change once they are registered, whereas run artifacts can be overwritten in place.
+Files are keyed by a digest of their model version, their absolute URI and their size. Cached
+files are materialized in the destination directory as copy-on-write clones where the file system
+supports them, or copies otherwise, so that modifying them doesn't affect the cache.
+
+The least recently used files are evicted once the cache exceeds
+``MLFLOW_ARTIFACT_CACHE_MAX_SIZE`` bytes. Files are added with atomic renames, so that concurrent
+processes never observe partially downloaded files.
+"""
+import hashlib
+import json
+import os
+import posixpath
+import shutil
+import stat
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+
+from mlflow.environment_variables import MLFLOW_ARTIFACT_CACHE_DIR, MLFLOW_ARTIFACT_CACHE_MAX_SIZE
+from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.utils.uri import append_to_uri_path
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+
+# The `FICLONE` ioctl request code of Linux, which clones a file on copy-on-write file systems
+# such as Btrfs and XFS
+_FICLONE = 0x40049409
+# Temporary files of crashed downloads are removed after this duration
+_STALE_TMP_FILE_SECONDS = 24 * 60 * 60
+
+
+def _reflink(src, dst):
+    """
+    Clone ``src`` to ``dst`` without copying its contents, if the file system supports it.
+
+    Returns:
+        ``True`` if ``dst`` was created, ``False`` otherwise.
+    """
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    with open(src, "rb") as src_file:
+        try:
+            with open(dst, "xb") as dst_file:
+                fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+            return True
+        except OSError:
+            if os.path.exists(dst):
+                os.remove(dst)
+            return False
+
+
+class ArtifactCache:
+    """
+    A directory of cached artifact files.
+
+    Args:
+        cache_dir: The directory of the cache, which is created if it doesn't exist.
+        max_size: The maximum total size of the cached files, in bytes.
+    """
+
+    def __init__(self, cache_dir, max_size):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_size = max_size
+        self._objects_dir = os.path.join(self.cache_dir, "objects")
+        self._tmp_dir = os.path.join(self.cache_dir, "tmp")
+        os.makedirs(self._objects_dir, exist_ok=True)
+        os.makedirs(self._tmp_dir, exist_ok=True)
+
+    @staticmethod
+    def get_key(model_name, model_version, artifact_uri, size):
+        """
+        Returns:
+            The key of the file of the given model version at the absolute ``artifact_uri``, with
+            the given size in bytes.
+        """
+        return hashlib.sha256(
+            json.dumps([model_name, str(model_version), artifact_uri, size]).encode("utf-8")
+        ).hexdigest()
+
+    def _get_object_path(self, key):
+        return os.path.join(self._objects_dir, key[:2], key)
+
+    def _materialize(self, object_path, local_path):
+        tmp_path = f"{local_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            if not _reflink(object_path, tmp_path):
+                shutil.copyfile(object_path, tmp_path)
+            os.replace(tmp_path, local_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def get_or_download(self, key, size, download_file, local_path):
+        """
+        Materialize the cached file of ``key`` at ``local_path``, downloading it first if it isn't
+        cached.
+
+        Args:
+            key: The key of the file, see :py:meth:`get_key`.
+            size: The expected size of the file, in bytes. Downloaded files of a different size,
+                e.g. because the artifact was overwritten after it was listed, aren't cached.
+            download_file: A function downloading the file to the local path it is called with.
+            local_path: The path at which to materialize the file.
+
+        Returns:
+            ``True`` if a file was added to the cache, ``False`` otherwise.
+        """
+        object_path = self._get_object_path(key)
+        try:
+            self._materialize(object_path, local_path)
+        except FileNotFoundError:
+            pass
+        else:
+            try:
+                # Evictions are based on modification times, which are more reliable than access
+                # times, e.g. on file systems mounted with `noatime`
+                os.utime(object_path)
+            except OSError:
+                pass
+            return False
+
+        tmp_path = os.path.join(self._tmp_dir, uuid.uuid4().hex)
+        try:
+            download_file(tmp_path)
+            if os.path.getsize(tmp_path) != size:
+                shutil.move(tmp_path, local_path)
+                return False
+            os.chmod(tmp_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            os.replace(tmp_path, object_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        try:
+            self._materialize(object_path, local_path)
+        except FileNotFoundError:
+            # The file was evicted by another process in the meantime
+            download_file(local_path)
+        return True
+
+    @contextmanager
+    def _eviction_lock(self):
+        """
+        Yields whether the eviction lock of the cache was acquired. Only one process evicts files
+        at a time, and the others skip their evictions instead of waiting for it.
+        """
+        if fcntl is None:
+            yield True
+            return
+        with open(os.path.join(self.cache_dir, ".lock"), "a") as lock_file:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def evict(self):
+        """
+        Remove the least recently used files until the cache fits in its maximum size, as well as
+        the temporary files left by crashed downloads.
+        """
+        with self._eviction_lock() as acquired:
+            if not acquired:
+                return
+            now = time.time()
+            for entry in os.scandir(self._tmp_dir):
+                try:
+                    if now - entry.stat().st_mtime > _STALE_TMP_FILE_SECONDS:
+                        os.remove(entry.path)
+                except OSError:
+                    pass
+
+            objects = []
+            for root, _, files in os.walk(self._objects_dir):
+                for name in files:
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    objects.append((st.st_mtime, st.st_size, path))
+            total_size = sum(size for _, size, _ in objects)
+            for _, size, path in sorted(objects):
+                if total_size <= self.max_size:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    # E.g. the file is being copied on Windows
+                    continue
+                total_size -= size
+
+
+def get_artifact_cache():
+    """
+    Returns:
+        The :py:class:`ArtifactCache` configured by ``MLFLOW_ARTIFACT_CACHE_DIR``, or ``None`` if
+        caching is disabled.
+    """
+    if cache_dir := MLFLOW_ARTIFACT_CACHE_DIR.get():
+        return ArtifactCache(cache_dir, MLFLOW_ARTIFACT_CACHE_MAX_SIZE.get())
+    return None
+
+
+class CachingArtifactRepository(ArtifactRepository):
+    """
+    Downloads the files of a registered model version from the artifact repository storing them
+    through an :py:class:`ArtifactCache`.
+
+    The sizes of the files are taken from the listings made while downloading directories, or
+    from the listing of their parent directory when downloading single files. Files of unknown
+    sizes are downloaded without being cached.
+    """
+
+    def __init__(self, repo, cache, model_name, model_version):
+        self.repo = repo
+        self.cache = cache
+        self.model_name = model_name
+        self.model_version = model_version
+        self._file_sizes = {}
+        self._added_files = False
+        super().__init__(repo.artifact_uri)
+
+    def _create_thread_pool(self):
+        return self.repo.thread_pool
+
+    def log_artifact(self, local_file, artifact_path=None):
+        self.repo.log_artifact(local_file, artifact_path)
+
+    def log_artifacts(self, local_dir, artifact_path=None):
+        self.repo.log_artifacts(local_dir, artifact_path)
+
+    def list_artifacts(self, path=None):
+        file_infos = self.repo.list_artifacts(path)
+        for file_info in file_infos:
+            if not file_info.is_dir and file_info.file_size is not None:
+                self._file_sizes[file_info.path] = file_info.file_size
+        return file_infos
+
+    def _is_directory(self, artifact_path):
+        return self.repo._is_directory(artifact_path)
+
+    def _get_file_size(self, remote_file_path):
+        if remote_file_path not in self._file_sizes:
+            parent = posixpath.dirname(remote_file_path.rstrip("/"))
+            self.list_artifacts(parent or None)
+        return self._file_sizes.get(remote_file_path)
+
+    def _download_file(self, remote_file_path, local_path):
+        size = self._get_file_size(remote_file_path)
+        if size is None:
+            self.repo._download_file(remote_file_path, local_path)
+            return
+        key = ArtifactCache.get_key(
+            self.model_name,
+            self.model_version,
+            append_to_uri_path(self.repo.artifact_uri, remote_file_path),
+            size,
+        )
+        if self.cache.get_or_download(
+            key, size, lambda path: self.repo._download_file(remote_file_path, path), local_path
+        ):
+            self._added_files = True
+
+    def download_artifacts(self, artifact_path, dst_path=None):
+        try:
+            return super().download_artifacts(artifact_path, dst_path)
+        finally:
+            if self._added_files:
+                self.cache.evict()
+
+    def delete_artifacts(self, artifact_path=None):
+        self.repo.delete_artifacts(artifact_path)
+
+
+def download_model_version_artifacts(repo, model_name, model_version, artifact_path, dst_path=None):
+    """
+    Download the artifacts of a registered model version from ``repo``, the repository storing
+    them, through the artifact cache if it is enabled. See
+    :py:meth:`ArtifactRepository.download_artifacts
+    <mlflow.store.artifact.artifact_repo.ArtifactRepository.download_artifacts>`.
+    """
+    cache = get_artifact_cache()
+    # Repositories implementing their own downloads, e.g. local repositories which return the
+    # paths of artifacts instead of copying them, aren't cached
+    if cache is None or type(repo).download_artifacts is not ArtifactRepository.download_artifacts:
+        return repo.download_artifacts(artifact_path, dst_path)
+    return CachingArtifactRepository(repo, cache, model_name, model_version).download_artifacts(
+        artifact_path, dst_path
+    )
@@ -1,8 +1,11 @@
+import io
 import json
 import logging
 import os
 import posixpath
+import queue
 import tempfile
+import threading
 from abc import ABC, ABCMeta, abstractmethod
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
@@ -28,6 +31,8 @@ assert _NUM_MAX_THREADS >= _NUM_MAX_THREADS_PER_CPU
 assert _NUM_MAX_THREADS_PER_CPU > 0
 # Default number of CPUs to assume on the machine if unavailable to fetch it using os.cpu_count()
 _NUM_DEFAULT_CPUS = _NUM_MAX_THREADS // _NUM_MAX_THREADS_PER_CPU
+# Max number of chunks buffered between the writer of a streaming upload and the upload thread
+_STREAMING_UPLOAD_MAX_QUEUED_CHUNKS = 8
 _logger = logging.getLogger(__name__)
 
 
@@ -339,6 +344,235 @@ class ArtifactRepository:
         with write_local_temp_trace_data_file(trace_data) as temp_file:
             self.log_artifact(temp_file)
 
+    def open_read_stream(self, artifact_path, offset=0, length=None):
+        """
+        Open a readable binary stream over the content of an artifact file, or over a byte range
+        of it. The default implementation downloads the artifact to a temporary directory,
+        repositories that can read objects incrementally override it.
+
+        Args:
+            artifact_path: Relative path of the artifact file to read.
+            offset: Position of the first byte to read.
+            length: Maximum number of bytes to read. If unspecified, the artifact is read until
+                its end.
+
+        Returns:
+            An :py:class:`ArtifactReadStream` that must be closed once consumed.
+        """
+        tmp_dir = tempfile.TemporaryDirectory()
+        try:
+            local_path = self.download_artifacts(artifact_path, tmp_dir.name)
+            f = open(local_path, "rb")  # noqa: SIM115
+        except BaseException:
+            tmp_dir.cleanup()
+            raise
+        f.seek(offset)
+        return ArtifactReadStream(
+            f, os.path.getsize(local_path), length=length, on_close=tmp_dir.cleanup
+        )
+
+    @contextmanager
+    def open_write_stream(self, artifact_path):
+        """
+        Open a writable binary stream to an artifact file. The artifact is committed when the
+        context manager exits, and discarded if it exits with an exception. The default
+        implementation spools the content to a temporary file and logs it with
+        :py:meth:`log_artifact`, repositories that can upload objects incrementally override it.
+
+        Args:
+            artifact_path: Relative path of the artifact file to write.
+
+        Yields:
+            A writable binary file object.
+        """
+        head, tail = posixpath.split(artifact_path)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, tail)
+            with open(tmp_path, "wb") as f:
+                yield f
+            self.log_artifact(tmp_path, head or None)
+
+
+class ArtifactReadStream(io.RawIOBase):
+    """
+    A readable binary stream over a byte range of an artifact file, returned by
+    :py:meth:`ArtifactRepository.open_read_stream`.
+
+    Args:
+        fileobj: A binary file object positioned at the start of the range.
+        size: The total size of the artifact file in bytes, or ``None`` if it is unknown.
+        length: The maximum number of bytes to read from ``fileobj``. If unspecified,
+            ``fileobj`` is read until its end.
+        on_close: Optional function called when the stream is closed.
+    """
+
+    def __init__(self, fileobj, size, length=None, on_close=None):
+        super().__init__()
+        self.size = size
+        self._fileobj = fileobj
+        self._remaining = length
+        self._on_close = on_close
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        n = len(buffer) if self._remaining is None else min(len(buffer), self._remaining)
+        if n == 0:
+            return 0
+        data = self._fileobj.read(n)
+        buffer[: len(data)] = data
+        if self._remaining is not None:
+            self._remaining -= len(data)
+        return len(data)
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            self._fileobj.close()
+            if self._on_close is not None:
+                self._on_close()
+        finally:
+            super().close()
+
+
+class _ChunkIteratorReader(io.RawIOBase):
+    """
+    Adapts an iterator of ``bytes`` chunks to a readable binary file object.
+    """
+
+    def __init__(self, chunks, on_close=None):
+        super().__init__()
+        self._chunks = iter(chunks)
+        self._buffer = memoryview(b"")
+        self._on_close = on_close
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buffer = memoryview(chunk)
+        n = min(len(buffer), len(self._buffer))
+        buffer[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self._on_close is not None:
+                self._on_close()
+        finally:
+            super().close()
+
+
+class _StreamingUploadWriter(io.RawIOBase):
+    """
+    A writable binary file object whose content is consumed, as a readable file object, by an
+    upload function running in a background thread. At most
+    ``_STREAMING_UPLOAD_MAX_QUEUED_CHUNKS`` written chunks are buffered in memory.
+    """
+
+    def __init__(self, upload):
+        super().__init__()
+        self._queue = queue.Queue(maxsize=_STREAMING_UPLOAD_MAX_QUEUED_CHUNKS)
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._upload, args=(upload,), name="MlflowStreamingUpload", daemon=True
+        )
+        self._thread.start()
+
+    def _iter_chunks(self):
+        while (item := self._queue.get()) is not None:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    def _upload(self, upload):
+        try:
+            upload(io.BufferedReader(_ChunkIteratorReader(self._iter_chunks())))
+        except BaseException as e:
+            self._error = e
+
+    def _put(self, item):
+        while self._thread.is_alive():
+            try:
+                self._queue.put(item, timeout=1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if not self._put(bytes(data)):
+            raise MlflowException(f"Streaming upload failed: {self._error}") from self._error
+        return len(data)
+
+    def abort(self, error):
+        """
+        Interrupt the upload so that no partial artifact is committed.
+        """
+        if not self.closed:
+            self._put(error)
+            self._thread.join()
+            super().close()
+
+    def close(self):
+        if self.closed:
+            return
+        self._put(None)
+        self._thread.join()
+        super().close()
+        if self._error is not None:
+            raise MlflowException(f"Streaming upload failed: {self._error}") from self._error
+
+
+@contextmanager
+def _streaming_upload(upload):
+    """
+    Yield a writable binary file object whose content is uploaded by ``upload``, a function
+    taking a readable binary file object, while it is being written. The upload is interrupted
+    if the context manager exits with an exception.
+    """
+    writer = _StreamingUploadWriter(upload)
+    try:
+        yield writer
+    except BaseException as e:
+        writer.abort(e)
+        raise
+    writer.close()
+
+
+def _format_range_header(offset, length=None):
+    """
+    Format the value of an HTTP ``Range`` header requesting ``length`` bytes from ``offset``,
+    or ``None`` if the whole content is requested.
+    """
+    if offset == 0 and length is None:
+        return None
+    end = "" if length is None else offset + length - 1
+    return f"bytes={offset}-{end}"
+
+
+def _parse_content_range_size(content_range):
+    """
+    Parse the total size of the content from the value of an HTTP ``Content-Range`` header,
+    e.g. ``bytes 0-99/1234``, returning ``None`` if it is unknown.
+    """
+    if not content_range:
+        return None
+    _, _, size = content_range.rpartition("/")
+    return int(size) if size.isdigit() else None
+
 
 @contextmanager
 def write_local_temp_trace_data_file(trace_data: str):
@@ -13,7 +13,13 @@ from mlflow.entities.multipart_upload import (
 )
 from mlflow.environment_variables import MLFLOW_ARTIFACT_UPLOAD_DOWNLOAD_TIMEOUT
 from mlflow.exceptions import MlflowException
-from mlflow.store.artifact.artifact_repo import ArtifactRepository, MultipartUploadMixin
+from mlflow.store.artifact.artifact_repo import (
+    ArtifactReadStream,
+    ArtifactRepository,
+    MultipartUploadMixin,
+    _ChunkIteratorReader,
+    _streaming_upload,
+)
 from mlflow.utils.credentials import get_default_host_creds
 
 
@@ -196,6 +202,30 @@ class AzureBlobArtifactRepository(ArtifactRepository, MultipartUploadMixin):
         with open(local_path, "wb") as file:
             blob.readinto(file)
 
+    def open_read_stream(self, artifact_path, offset=0, length=None):
+        (container, _, remote_root_path, _) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        remote_full_path = posixpath.join(remote_root_path, artifact_path)
+        downloader = container_client.download_blob(
+            remote_full_path, offset=offset if offset or length else None, length=length
+        )
+        # `properties.size` is the size of the whole blob, not of the downloaded range
+        return ArtifactReadStream(
+            _ChunkIteratorReader(downloader.chunks()), downloader.properties.size
+        )
+
+    def open_write_stream(self, artifact_path):
+        (container, _, dest_path, _) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        dest_path = posixpath.join(dest_path, artifact_path)
+        # A stream of unknown length is uploaded as staged blocks, which are only committed once
+        # the stream is fully read
+        return _streaming_upload(
+            lambda f: container_client.upload_blob(
+                dest_path, f, overwrite=True, timeout=self.write_timeout
+            )
+        )
+
     def delete_artifacts(self, artifact_path=None):
         raise MlflowException("Not implemented yet")
 
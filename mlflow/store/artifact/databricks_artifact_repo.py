@@ -8,7 +8,7 @@ from typing import Any, Dict
 
 import requests
 
-import mlflow.tracking
+import mlflow
 from mlflow.azure.client import (
     patch_adls_file_upload,
     patch_adls_flush,
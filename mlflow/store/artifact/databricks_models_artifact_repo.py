@@ -3,7 +3,7 @@ import logging
 import os
 import posixpath
 
-import mlflow.tracking
+import mlflow
 from mlflow.entities import FileInfo
 from mlflow.environment_variables import (
     MLFLOW_ENABLE_MULTIPART_DOWNLOAD,
@@ -4,6 +4,7 @@ import os
 import posixpath
 import urllib.parse
 from collections import namedtuple
+from contextlib import contextmanager
 
 from packaging.version import Version
 
@@ -18,9 +19,15 @@ from mlflow.environment_variables import (
     MLFLOW_GCS_DOWNLOAD_CHUNK_SIZE,
     MLFLOW_GCS_UPLOAD_CHUNK_SIZE,
 )
-from mlflow.exceptions import _UnsupportedMultipartUploadException
-from mlflow.store.artifact.artifact_repo import ArtifactRepository, MultipartUploadMixin
+from mlflow.exceptions import MlflowException, _UnsupportedMultipartUploadException
+from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST
+from mlflow.store.artifact.artifact_repo import (
+    ArtifactReadStream,
+    ArtifactRepository,
+    MultipartUploadMixin,
+)
 from mlflow.utils.file_utils import relative_path_to_artifact_path
+from mlflow.utils.mime_type_utils import _guess_mime_type
 
 GCSMPUArguments = namedtuple("GCSMPUArguments", ["transport", "url", "headers", "content_type"])
 
@@ -145,6 +152,40 @@ class GCSArtifactRepository(ArtifactRepository, MultipartUploadMixin):
             remote_full_path, chunk_size=self._GCS_DOWNLOAD_CHUNK_SIZE
         ).download_to_filename(local_path, timeout=self._GCS_DEFAULT_TIMEOUT)
 
+    def open_read_stream(self, artifact_path, offset=0, length=None):
+        (bucket, remote_root_path) = self.parse_gcs_uri(self.artifact_uri)
+        remote_full_path = posixpath.join(remote_root_path, artifact_path)
+        blob = self._get_bucket(bucket).get_blob(
+            remote_full_path, timeout=self._GCS_DEFAULT_TIMEOUT
+        )
+        if blob is None:
+            raise MlflowException(
+                f"No such artifact: '{artifact_path}'", error_code=RESOURCE_DOES_NOT_EXIST
+            )
+        # The reader downloads the blob with ranged requests of `chunk_size` bytes
+        reader = blob.open(
+            "rb", chunk_size=self._GCS_DOWNLOAD_CHUNK_SIZE, timeout=self._GCS_DEFAULT_TIMEOUT
+        )
+        reader.seek(offset)
+        return ArtifactReadStream(reader, blob.size, length=length)
+
+    @contextmanager
+    def open_write_stream(self, artifact_path):
+        (bucket, dest_path) = self.parse_gcs_uri(self.artifact_uri)
+        dest_path = posixpath.join(dest_path, artifact_path)
+        blob = self._get_bucket(bucket).blob(dest_path)
+        writer = blob.open(
+            "wb",
+            chunk_size=self._GCS_UPLOAD_CHUNK_SIZE,
+            ignore_flush=True,
+            content_type=_guess_mime_type(artifact_path),
+            timeout=self._GCS_DEFAULT_TIMEOUT,
+        )
+        # The writer performs a resumable upload, which is only finalized when the writer is
+        # closed. If writing fails, the upload is left unfinished and no blob is created.
+        yield writer
+        writer.close()
+
     def delete_artifacts(self, artifact_path=None):
         (bucket_name, dest_path) = self.parse_gcs_uri(self.artifact_uri)
         if artifact_path:
@@ -18,8 +18,12 @@ from mlflow.environment_variables import (
 )
 from mlflow.exceptions import MlflowException, _UnsupportedMultipartUploadException
 from mlflow.store.artifact.artifact_repo import (
+    ArtifactReadStream,
     ArtifactRepository,
     MultipartUploadMixin,
+    _ChunkIteratorReader,
+    _format_range_header,
+    _parse_content_range_size,
     verify_artifact_path,
 )
 from mlflow.store.artifact.cloud_artifact_repo import _complete_futures, _compute_num_chunks
@@ -108,6 +112,29 @@ class HttpArtifactRepository(ArtifactRepository, MultipartUploadMixin):
             for chunk in resp.iter_content(chunk_size=chunk_size):
                 f.write(chunk)
 
+    def open_read_stream(self, artifact_path, offset=0, length=None):
+        endpoint = posixpath.join("/", artifact_path)
+        byte_range = _format_range_header(offset, length)
+        resp = http_request(
+            self._host_creds,
+            endpoint,
+            "GET",
+            stream=True,
+            extra_headers={"Range": byte_range} if byte_range else None,
+        )
+        augmented_raise_for_status(resp)
+        chunk_size = 1024 * 1024  # 1 MB
+        reader = _ChunkIteratorReader(resp.iter_content(chunk_size=chunk_size), resp.close)
+        if resp.status_code == 206:
+            size = _parse_content_range_size(resp.headers.get("Content-Range"))
+        else:
+            # The server ignored the range and sent the whole artifact
+            content_length = resp.headers.get("Content-Length")
+            size = int(content_length) if content_length is not None else None
+            while offset > 0 and (skipped := len(reader.read(min(offset, chunk_size)))):
+                offset -= skipped
+        return ArtifactReadStream(reader, size, length=length)
+
     def delete_artifacts(self, artifact_path=None):
         endpoint = posixpath.join("/", artifact_path) if artifact_path else "/"
         resp = http_request(self._host_creds, endpoint, "DELETE", stream=True)
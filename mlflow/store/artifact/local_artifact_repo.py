@@ -1,8 +1,11 @@
 import os
 import shutil
+import uuid
+from contextlib import contextmanager
 from typing import Any, Dict
 
 from mlflow.store.artifact.artifact_repo import (
+    ArtifactReadStream,
     ArtifactRepository,
     try_read_trace_data,
     verify_artifact_path,
@@ -116,6 +119,36 @@ class LocalArtifactRepository(ArtifactRepository):
         remote_file_path = os.path.join(self.artifact_dir, os.path.normpath(remote_file_path))
         shutil.copy2(remote_file_path, local_path)
 
+    def open_read_stream(self, artifact_path, offset=0, length=None):
+        # NOTE: The artifact_path is expected to be a relative path in posix format.
+        # Posix paths work fine on windows but just in case we normalize it here.
+        artifact_path = validate_path_is_safe(artifact_path)
+        local_path = os.path.join(self.artifact_dir, os.path.normpath(artifact_path))
+        f = open(local_path, "rb")  # noqa: SIM115
+        f.seek(offset)
+        return ArtifactReadStream(f, os.fstat(f.fileno()).st_size, length=length)
+
+    @contextmanager
+    def open_write_stream(self, artifact_path):
+        # NOTE: The artifact_path is expected to be a relative path in posix format.
+        # Posix paths work fine on windows but just in case we normalize it here.
+        artifact_path = validate_path_is_safe(artifact_path)
+        local_path = os.path.join(self.artifact_dir, os.path.normpath(artifact_path))
+        local_dir = os.path.dirname(local_path)
+        if not os.path.exists(local_dir):
+            mkdir(local_dir)
+        # Write to a temporary file next to the artifact, so that readers never observe a
+        # partially written artifact
+        tmp_path = os.path.join(local_dir, f".{os.path.basename(local_path)}.{uuid.uuid4().hex}")
+        try:
+            with open(tmp_path, "xb") as f:
+                yield f
+            os.replace(tmp_path, local_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
     def delete_artifacts(self, artifact_path=None):
         artifact_path = local_file_uri_to_path(
             os.path.join(self._artifact_dir, artifact_path) if artifact_path else self._artifact_dir
@@ -4,6 +4,7 @@ import urllib.parse
 
 import mlflow
 from mlflow.exceptions import MlflowException
+from mlflow.store.artifact import artifact_cache
 from mlflow.store.artifact.artifact_repo import ArtifactRepository
 from mlflow.store.artifact.databricks_models_artifact_repo import DatabricksModelsArtifactRepository
 from mlflow.store.artifact.unity_catalog_models_artifact_repo import (
@@ -187,7 +188,9 @@ class ModelsArtifactRepository(ArtifactRepository):
                 artifact_path, dst_path, lineage_header_info=lineage_header_info
             )
         else:
-            model_path = self.repo.download_artifacts(artifact_path, dst_path)
+            model_path = artifact_cache.download_model_version_artifacts(
+                self.repo, self.model_name, self.model_version, artifact_path, dst_path
+            )
         # NB: only add the registered model metadata iff the artifact path is at the root model
         # directory. For individual files or subdirectories within the model directory, do not
         # create the metadata file.
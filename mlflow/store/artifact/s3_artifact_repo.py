@@ -19,8 +19,12 @@ from mlflow.environment_variables import (
 )
 from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.artifact_repo import (
+    ArtifactReadStream,
     ArtifactRepository,
     MultipartUploadMixin,
+    _format_range_header,
+    _parse_content_range_size,
+    _streaming_upload,
 )
 from mlflow.utils.file_utils import relative_path_to_artifact_path
 
@@ -156,9 +160,9 @@ class S3ArtifactRepository(ArtifactRepository, MultipartUploadMixin):
         else:
             return None
 
-    def _upload_file(self, s3_client, local_file, bucket, key):
+    def _get_upload_extra_args(self, file_name):
         extra_args = {}
-        guessed_type, guessed_encoding = guess_type(local_file)
+        guessed_type, guessed_encoding = guess_type(file_name)
         if guessed_type is not None:
             extra_args["ContentType"] = guessed_type
         if guessed_encoding is not None:
@@ -166,6 +170,10 @@ class S3ArtifactRepository(ArtifactRepository, MultipartUploadMixin):
         environ_extra_args = self.get_s3_file_upload_extra_args()
         if environ_extra_args is not None:
             extra_args.update(environ_extra_args)
+        return extra_args
+
+    def _upload_file(self, s3_client, local_file, bucket, key):
+        extra_args = self._get_upload_extra_args(local_file)
         s3_client.upload_file(Filename=local_file, Bucket=bucket, Key=key, ExtraArgs=extra_args)
 
     def log_artifact(self, local_file, artifact_path=None):
@@ -249,6 +257,31 @@ class S3ArtifactRepository(ArtifactRepository, MultipartUploadMixin):
         s3_client = self._get_s3_client()
         s3_client.download_file(bucket, s3_full_path, local_path)
 
+    def open_read_stream(self, artifact_path, offset=0, length=None):
+        (bucket, s3_root_path) = self.parse_s3_compliant_uri(self.artifact_uri)
+        s3_full_path = posixpath.join(s3_root_path, artifact_path)
+        kwargs = {}
+        if byte_range := _format_range_header(offset, length):
+            kwargs["Range"] = byte_range
+        response = self._get_s3_client().get_object(Bucket=bucket, Key=s3_full_path, **kwargs)
+        size = _parse_content_range_size(response.get("ContentRange"))
+        return ArtifactReadStream(
+            response["Body"], response["ContentLength"] if size is None else size
+        )
+
+    def open_write_stream(self, artifact_path):
+        (bucket, s3_root_path) = self.parse_s3_compliant_uri(self.artifact_uri)
+        s3_full_path = posixpath.join(s3_root_path, artifact_path)
+        s3_client = self._get_s3_client()
+        extra_args = self._get_upload_extra_args(artifact_path)
+        # `upload_fileobj` reads the stream part by part and aborts the multipart upload if
+        # reading fails
+        return _streaming_upload(
+            lambda f: s3_client.upload_fileobj(
+                Fileobj=f, Bucket=bucket, Key=s3_full_path, ExtraArgs=extra_args
+            )
+        )
+
     def delete_artifacts(self, artifact_path=None):
         (bucket, dest_path) = self.parse_s3_compliant_uri(self.artifact_uri)
         if artifact_path:
@@ -1,7 +1,7 @@
 import urllib.parse
 from typing import NamedTuple, Optional
 
-import mlflow.tracking
+import mlflow
 from mlflow.exceptions import MlflowException
 from mlflow.utils.uri import get_databricks_profile_uri_from_artifact_uri, is_databricks_uri
 
@@ -1,8 +1,14 @@
+import math
 from abc import ABCMeta, abstractmethod
 from typing import Dict, List, Optional, Tuple
 
 from mlflow.entities import (
     DatasetInput,
+    Param,
+    Run,
+    RunData,
+    RunInputs,
+    RunTag,
     TraceInfo,
     ViewType,
 )
@@ -516,6 +522,104 @@ class AbstractStore:
             for metric in metrics_for_run
         ]
 
+    def get_sampled_metric_history(
+        self, run_ids, metric_key, start_step=None, end_step=None, max_points=None
+    ):
+        """
+        Return a downsampled view of the history of a metric across several runs.
+
+        At most ``max_points`` steps are retained per run. The step range
+        ``[start_step, end_step]`` is divided into equal-width buckets, and for every run and
+        bucket, the first logged step as well as the steps holding the minimum and maximum values
+        are retained, so that spikes remain visible after downsampling. The last step of each run
+        within the range is always retained. When ``max_points`` is less than 4, only the first
+        step of every bucket is retained. Runs with at most ``max_points`` steps within the range
+        aren't downsampled. All values logged at a retained step are returned.
+
+        Args:
+            run_ids: Unique identifiers of the runs from which to fetch the metric histories.
+            metric_key: Metric name within the runs.
+            start_step: First step of the range to sample. If neither ``start_step`` nor
+                ``end_step`` is specified, the range spans from step 0 to the largest step
+                logged for the metric across all of the runs.
+            end_step: Last step of the range to sample (inclusive).
+            max_points: The maximum number of steps to retain per run. If ``None``, no
+                downsampling is performed.
+
+        Returns:
+            A list of MetricWithRunId objects, ordered by the position of their run ID in
+            ``run_ids``, followed by step, timestamp and value.
+        """
+        histories = {run_id: self.get_metric_history(run_id, metric_key) for run_id in run_ids}
+        if start_step is None and end_step is None:
+            start_step = 0
+            end_step = max((m.step for h in histories.values() for m in h), default=0)
+
+        metrics_with_run_ids = []
+        for run_id in run_ids:
+            history = histories[run_id]
+            steps = _get_sampled_steps(
+                ((m.step, m.value) for m in history), start_step, end_step, max_points
+            )
+            metrics_with_run_ids.extend(
+                MetricWithRunId(run_id=run_id, metric=m)
+                for m in sorted(
+                    (m for m in history if m.step in steps),
+                    key=lambda m: (m.step, m.timestamp, m.value),
+                )
+            )
+        return metrics_with_run_ids
+
+    def export_metrics(self, run_ids, metric_keys=None, step_range=None):
+        """
+        Export the histories of metrics logged to several runs in a columnar format.
+
+        The default implementation fetches the history of every requested metric of every run
+        with :py:meth:`get_metric_history`. Stores should override it to read the values in bulk.
+
+        Args:
+            run_ids: Unique identifiers of the runs whose metrics to export.
+            metric_keys: Names of the metrics to export. If ``None``, every metric logged to the
+                runs is exported.
+            step_range: Optional ``(min_step, max_step)`` tuple. If specified, only the values
+                logged at steps within this inclusive range are exported.
+
+        Returns:
+            An iterator of ``pyarrow.RecordBatch`` with the schema returned by
+            :py:func:`mlflow.store.tracking.metrics_export.get_metrics_export_schema`. Rows are
+            ordered by run ID, metric key, step and timestamp.
+        """
+        from mlflow.store.tracking.metrics_export import (
+            coalesce_record_batches,
+            make_metrics_record_batch,
+        )
+
+        min_step, max_step = step_range or (None, None)
+
+        def _iter_histories():
+            for run_id in sorted(set(run_ids)):
+                keys = self.get_run(run_id).data.metrics if metric_keys is None else metric_keys
+                for key in sorted(set(keys)):
+                    history = sorted(
+                        (
+                            m
+                            for m in self.get_metric_history(run_id, key)
+                            if (min_step is None or m.step >= min_step)
+                            and (max_step is None or m.step <= max_step)
+                        ),
+                        key=lambda m: (m.step, m.timestamp),
+                    )
+                    if history:
+                        yield make_metrics_record_batch(
+                            run_id,
+                            key,
+                            [m.step for m in history],
+                            [m.timestamp for m in history],
+                            [m.value for m in history],
+                        )
+
+        return coalesce_record_batches(_iter_histories())
+
     def search_runs(
         self,
         experiment_ids,
@@ -524,6 +628,9 @@ class AbstractStore:
         max_results=SEARCH_MAX_RESULTS_DEFAULT,
         order_by=None,
         page_token=None,
+        include_metrics=None,
+        include_params=None,
+        include_inputs=True,
     ):
         """
         Return runs that match the given list of search expressions within the experiments.
@@ -536,6 +643,11 @@ class AbstractStore:
             order_by: List of order_by clauses.
             page_token: Token specifying the next page of results. It should be obtained from
                 a ``search_runs`` call.
+            include_metrics: If specified, only the latest metrics with these keys are returned
+                with each run. By default, all the latest metrics of the runs are returned.
+            include_params: If specified, only the params with these keys are returned with each
+                run. By default, all the params of the runs are returned.
+            include_inputs: Whether to return the dataset inputs of the runs.
 
         Returns:
             A :py:class:`PagedList <mlflow.store.entities.PagedList>` of
@@ -545,14 +657,27 @@ class AbstractStore:
             implementations may not support pagination and thus the returned token would not be
             meaningful in such cases.
         """
-        runs, token = self._search_runs(
-            experiment_ids,
-            filter_string,
-            run_view_type,
-            max_results,
-            order_by,
-            page_token,
-        )
+        if include_metrics is None and include_params is None and include_inputs:
+            runs, token = self._search_runs(
+                experiment_ids,
+                filter_string,
+                run_view_type,
+                max_results,
+                order_by,
+                page_token,
+            )
+        else:
+            runs, token = self._search_runs_with_projection(
+                experiment_ids,
+                filter_string,
+                run_view_type,
+                max_results,
+                order_by,
+                page_token,
+                include_metrics,
+                include_params,
+                include_inputs,
+            )
         return PagedList(runs, token)
 
     @abstractmethod
@@ -579,6 +704,38 @@ class AbstractStore:
             and ``token`` is the pagination token for the next page of results.
         """
 
+    def _search_runs_with_projection(
+        self,
+        experiment_ids,
+        filter_string,
+        run_view_type,
+        max_results,
+        order_by,
+        page_token,
+        include_metrics,
+        include_params,
+        include_inputs,
+    ):
+        """
+        Same as ``_search_runs``, but only returns the data of the runs requested by
+        ``include_metrics``, ``include_params`` and ``include_inputs``. By default, the data is
+        removed from the runs returned by ``_search_runs``. Subclasses of ``AbstractStore`` can
+        override this method to avoid loading the excluded data.
+
+        See ``search_runs`` for parameter descriptions.
+        """
+        runs, token = self._search_runs(
+            experiment_ids,
+            filter_string,
+            run_view_type,
+            max_results,
+            order_by,
+            page_token,
+        )
+        return [
+            _project_run(run, include_metrics, include_params, include_inputs) for run in runs
+        ], token
+
     @abstractmethod
     def log_batch(self, run_id, metrics, params, tags):
         """
@@ -667,3 +824,101 @@ class AbstractStore:
         Returns:
             None.
         """
+
+
+def _get_sampling_buckets(max_points):
+    """
+    Returns:
+        A ``(num_buckets, keep_extrema)`` tuple: the number of buckets to divide the step range
+        into, and whether the steps holding the minimum and maximum values of every bucket are
+        retained along with its first step, so that at most ``max_points`` steps are retained
+        including the last step.
+    """
+    if max_points >= 4:
+        return (max_points - 1) // 3, True
+    return max_points - 1, False
+
+
+def _get_sampled_steps(points, start_step, end_step, max_points):
+    """
+    Select the steps to retain when downsampling a metric history, as described in
+    :py:meth:`AbstractStore.get_sampled_metric_history`.
+
+    Args:
+        points: Iterable of ``(step, value)`` tuples. It's consumed in a single pass.
+        start_step: First step of the range to sample.
+        end_step: Last step of the range to sample (inclusive).
+        max_points: The maximum number of steps to retain. If ``None``, every step within the
+            range is retained.
+
+    Returns:
+        The set of steps to retain.
+    """
+
+    # Mirrors the ordering used by SQL stores, which persist NaN as 0 along with an ``is_nan``
+    # flag: NaN values sort after every other value for both the minimum and the maximum.
+    def _sort_keys(step, value):
+        is_nan = math.isnan(value)
+        value = 0 if is_nan else value
+        return (is_nan, value, step), (is_nan, -value, step)
+
+    if max_points:
+        num_buckets, keep_extrema = _get_sampling_buckets(max_points)
+        scale = num_buckets / (end_step - start_step + 1)
+    else:
+        scale = None
+    # bucket -> [first step, min sort key, max sort key]
+    buckets = {}
+    last_step = None
+    # The steps within the range, as long as there are at most `max_points` of them
+    all_steps = set()
+    for step, value in points:
+        if not start_step <= step <= end_step:
+            continue
+        if scale is None:
+            buckets[step] = [step, (step,), (step,)]
+            continue
+        if all_steps is not None:
+            all_steps.add(step)
+            if len(all_steps) > max_points:
+                all_steps = None
+        last_step = step if last_step is None else max(last_step, step)
+        if num_buckets == 0:
+            continue
+        min_key, max_key = _sort_keys(step, value)
+        bucket = math.floor((step - start_step) * scale)
+        if stats := buckets.get(bucket):
+            stats[0] = min(stats[0], step)
+            stats[1] = min(stats[1], min_key)
+            stats[2] = min(stats[2], max_key)
+        else:
+            buckets[bucket] = [step, min_key, max_key]
+
+    if scale is not None and all_steps is not None:
+        return all_steps
+
+    steps = {last_step} if last_step is not None else set()
+    for first_step, min_key, max_key in buckets.values():
+        steps.add(first_step)
+        if scale is None or keep_extrema:
+            steps.update((min_key[-1], max_key[-1]))
+    return steps
+
+
+def _project_run(run, include_metrics, include_params, include_inputs):
+    """
+    Returns a copy of ``run`` that only contains the latest metrics with the keys in
+    ``include_metrics`` and the params with the keys in ``include_params``, or all of them if
+    ``None``, and no dataset inputs unless ``include_inputs`` is true.
+    """
+    metrics = run.data._metric_objs
+    if include_metrics is not None:
+        include_metrics = set(include_metrics)
+        metrics = [m for m in metrics if m.key in include_metrics]
+    params = [Param(k, v) for k, v in run.data.params.items()]
+    if include_params is not None:
+        include_params = set(include_params)
+        params = [p for p in params if p.key in include_params]
+    tags = [RunTag(k, v) for k, v in run.data.tags.items()]
+    inputs = run.inputs if include_inputs else RunInputs(dataset_inputs=[])
+    return Run(run.info, RunData(metrics=metrics, params=params, tags=tags), inputs)
@@ -8,6 +8,8 @@ import uuid
 from dataclasses import dataclass
 from typing import Dict, List, NamedTuple, Optional, Tuple
 
+import numpy as np
+
 from mlflow.entities import (
     Dataset,
     DatasetInput,
@@ -28,9 +30,14 @@ from mlflow.entities import (
     _DatasetSummary,
 )
 from mlflow.entities.lifecycle_stage import LifecycleStage
+from mlflow.entities.metric import MetricWithRunId
 from mlflow.entities.run_info import check_run_is_active
 from mlflow.entities.trace_status import TraceStatus
-from mlflow.environment_variables import MLFLOW_TRACKING_DIR
+from mlflow.environment_variables import (
+    MLFLOW_FILE_STORE_METRIC_FORMAT,
+    MLFLOW_FILE_STORE_RUN_INDEX,
+    MLFLOW_TRACKING_DIR,
+)
 from mlflow.exceptions import MissingConfigException, MlflowException
 from mlflow.protos import databricks_pb2
 from mlflow.protos.databricks_pb2 import (
@@ -47,11 +54,19 @@ from mlflow.store.tracking import (
     SEARCH_MAX_RESULTS_THRESHOLD,
     SEARCH_TRACES_DEFAULT_MAX_RESULTS,
 )
-from mlflow.store.tracking.abstract_store import AbstractStore
+from mlflow.store.tracking.abstract_store import AbstractStore, _get_sampled_steps
+from mlflow.store.tracking.file_store_metrics import (
+    METRIC_FORMAT_BINARY,
+    METRIC_FORMATS,
+    append_metric_fields,
+    get_metric_file_format,
+    read_binary_metric_records,
+    write_metric_file,
+)
+from mlflow.store.tracking.file_store_run_index import RunIndex
 from mlflow.tracing.utils import generate_request_id
 from mlflow.utils import get_results_from_paginated_fn, insecure_hash
 from mlflow.utils.file_utils import (
-    append_to,
     exists,
     find,
     get_parent_dir,
@@ -101,6 +116,9 @@ from mlflow.utils.validation import (
 
 _logger = logging.getLogger(__name__)
 
+# The number of records of binary metric files converted to Python objects at once
+_METRIC_RECORDS_CHUNK_SIZE = 10_000
+
 
 def _default_root_dir():
     return MLFLOW_TRACKING_DIR.get() or os.path.abspath(DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH)
@@ -169,6 +187,7 @@ class FileStore(AbstractStore):
         EXPERIMENT_TAGS_FOLDER_NAME,
         DATASETS_FOLDER_NAME,
         TRACES_FOLDER_NAME,
+        RunIndex.FOLDER_NAME,
     ]
 
     def __init__(self, root_directory=None, artifact_root_uri=None):
@@ -576,6 +595,40 @@ class FileStore(AbstractStore):
 
         return deleted_run_ids
 
+    def _convert_metric_files(self, metric_format, experiment_ids=None):
+        """
+        Rewrite the metric files of the runs of the given experiments in another format.
+        This is used by the ``mlflow migrate-metrics`` command line and is not intended to be used
+        elsewhere.
+
+        Args:
+            metric_format: The format of the rewritten metric files, ``text`` or ``binary``.
+            experiment_ids: IDs of the experiments whose runs to convert. Defaults to all
+                experiments, including deleted ones.
+
+        Returns:
+            The number of converted metric files.
+        """
+        if experiment_ids is None:
+            experiment_ids = self._get_active_experiments() + self._get_deleted_experiments()
+        num_converted = 0
+        for experiment_id in experiment_ids:
+            for run_info in self._list_run_infos(experiment_id, ViewType.ALL):
+                run_dir = self._get_run_dir(run_info.experiment_id, run_info.run_id)
+                _, metric_keys = self._get_run_files(run_info, "metric")
+                for metric_key in metric_keys:
+                    metric_path = self._get_metric_path(
+                        run_info.experiment_id, run_info.run_id, metric_key
+                    )
+                    if get_metric_file_format(metric_path) in (None, metric_format):
+                        continue
+                    fields = list(self._iter_metric_fields(run_info, metric_key))
+                    # The new file is written to the run directory, outside of the metrics folder,
+                    # so that it isn't listed as a metric if the conversion is interrupted
+                    write_metric_file(metric_path, fields, metric_format, tmp_dir=run_dir)
+                    num_converted += 1
+        return num_converted
+
     def restore_run(self, run_id):
         run_info = self._get_run_info(run_id)
         if run_info is None:
@@ -611,7 +664,9 @@ class FileStore(AbstractStore):
         check_run_is_active(run_info)
         new_info = run_info._copy_with_overrides(run_status, end_time, run_name=run_name)
         if run_name:
-            self._set_run_tag(run_info, RunTag(MLFLOW_RUN_NAME, run_name))
+            run_name_tag = RunTag(MLFLOW_RUN_NAME, run_name)
+            self._set_run_tag(run_info, run_name_tag)
+            self._update_run_index(run_info, tags=[run_name_tag])
         self._overwrite_run_info(new_info)
         return new_info
 
@@ -753,6 +808,15 @@ class FileStore(AbstractStore):
     @staticmethod
     def _get_metric_from_file(parent_path, metric_name, exp_id):
         _validate_metric_name(metric_name)
+        metric_path = os.path.join(parent_path, metric_name)
+        if get_metric_file_format(metric_path) == METRIC_FORMAT_BINARY:
+            records = read_binary_metric_records(metric_path)
+            if len(records) == 0:
+                raise ValueError(f"Metric '{metric_name}' is malformed. No data found.")
+            # The last key of `lexsort` is the primary one
+            latest = records[np.lexsort((records["value"], records["timestamp"], records["step"]))]
+            ts, val, step = latest[-1].item()
+            return Metric(key=metric_name, value=val, timestamp=ts, step=step)
         metric_objs = [
             FileStore._get_metric_from_line(metric_name, line, exp_id)
             for line in read_file_lines(parent_path, metric_name)
@@ -781,6 +845,11 @@ class FileStore(AbstractStore):
 
     @staticmethod
     def _get_metric_from_line(metric_name, metric_line, exp_id):
+        ts, val, step = FileStore._get_metric_fields_from_line(metric_name, metric_line, exp_id)
+        return Metric(key=metric_name, value=val, timestamp=ts, step=step)
+
+    @staticmethod
+    def _get_metric_fields_from_line(metric_name, metric_line, exp_id):
         metric_parts = metric_line.strip().split(" ")
         if len(metric_parts) != 2 and len(metric_parts) != 3:
             raise MlflowException(
@@ -792,7 +861,7 @@ class FileStore(AbstractStore):
         ts = int(metric_parts[0])
         val = float(metric_parts[1])
         step = int(metric_parts[2]) if len(metric_parts) == 3 else 0
-        return Metric(key=metric_name, value=val, timestamp=ts, step=step)
+        return ts, val, step
 
     def get_metric_history(self, run_id, metric_key, max_results=None, page_token=None):
         """
@@ -829,6 +898,14 @@ class FileStore(AbstractStore):
         parent_path, metric_files = self._get_run_files(run_info, "metric")
         if metric_key not in metric_files:
             return PagedList([], None)
+        if get_metric_file_format(os.path.join(parent_path, metric_key)) == METRIC_FORMAT_BINARY:
+            return PagedList(
+                [
+                    Metric(key=metric_key, value=val, timestamp=ts, step=step)
+                    for ts, val, step in self._iter_metric_fields(run_info, metric_key)
+                ],
+                None,
+            )
         return PagedList(
             [
                 FileStore._get_metric_from_line(metric_key, line, run_info.experiment_id)
@@ -837,6 +914,139 @@ class FileStore(AbstractStore):
             None,
         )
 
+    def _iter_metric_fields(self, run_info, metric_key):
+        """
+        Lazily yields the ``(timestamp, value, step)`` fields of every value logged for a metric,
+        without loading the whole metric file into memory.
+        """
+        metric_path = self._get_metric_path(run_info.experiment_id, run_info.run_id, metric_key)
+        if not os.path.isfile(metric_path):
+            return
+        if get_metric_file_format(metric_path) == METRIC_FORMAT_BINARY:
+            records = read_binary_metric_records(metric_path)
+            for start in range(0, len(records), _METRIC_RECORDS_CHUNK_SIZE):
+                yield from records[start : start + _METRIC_RECORDS_CHUNK_SIZE].tolist()
+            return
+        with open(metric_path, encoding="utf-8") as f:
+            for line in f:
+                yield FileStore._get_metric_fields_from_line(
+                    metric_key, line, run_info.experiment_id
+                )
+
+    def get_sampled_metric_history(
+        self, run_ids, metric_key, start_step=None, end_step=None, max_points=None
+    ):
+        _validate_metric_name(metric_key)
+        run_infos = {run_id: self._get_run_info(run_id) for run_id in run_ids}
+        if start_step is None and end_step is None:
+            start_step = 0
+            end_step = max(
+                (
+                    step
+                    for run_info in run_infos.values()
+                    for _, _, step in self._iter_metric_fields(run_info, metric_key)
+                ),
+                default=0,
+            )
+
+        metrics_with_run_ids = []
+        for run_id, run_info in run_infos.items():
+            # The metric file is streamed twice: once to select the steps to retain, and once to
+            # collect the values logged at those steps
+            steps = _get_sampled_steps(
+                (
+                    (step, value)
+                    for _, value, step in self._iter_metric_fields(run_info, metric_key)
+                ),
+                start_step,
+                end_step,
+                max_points,
+            )
+            metrics = [
+                Metric(key=metric_key, value=value, timestamp=ts, step=step)
+                for ts, value, step in self._iter_metric_fields(run_info, metric_key)
+                if step in steps
+            ]
+            metrics.sort(key=lambda m: (m.step, m.timestamp, m.value))
+            metrics_with_run_ids.extend(
+                MetricWithRunId(run_id=run_id, metric=metric) for metric in metrics
+            )
+        return metrics_with_run_ids
+
+    def _read_metric_table(self, run_info, metric_key):
+        """
+        Read the values logged for a metric into a ``pyarrow.Table`` with the ``step``,
+        ``timestamp`` and ``value`` columns, without building a Python object per value.
+        """
+        import pyarrow as pa
+        import pyarrow.csv
+
+        metric_path = self._get_metric_path(run_info.experiment_id, run_info.run_id, metric_key)
+        if get_metric_file_format(metric_path) == METRIC_FORMAT_BINARY:
+            records = read_binary_metric_records(metric_path)
+            return pa.table(
+                {name: np.array(records[name]) for name in ["step", "timestamp", "value"]}
+            )
+
+        column_types = {"timestamp": pa.int64(), "value": pa.float64(), "step": pa.int64()}
+        try:
+            table = pyarrow.csv.read_csv(
+                metric_path,
+                read_options=pyarrow.csv.ReadOptions(column_names=list(column_types)),
+                parse_options=pyarrow.csv.ParseOptions(delimiter=" "),
+                convert_options=pyarrow.csv.ConvertOptions(
+                    column_types=column_types, null_values=[], strings_can_be_null=False
+                ),
+            )
+        except pa.ArrowInvalid:
+            # Empty files and files written by older versions of MLflow, whose lines don't all
+            # contain a step, are parsed line by line
+            rows = list(self._iter_metric_fields(run_info, metric_key))
+            timestamp, value, step = zip(*rows) if rows else ((), (), ())
+            table = pa.table(
+                {"timestamp": timestamp, "value": value, "step": step},
+                schema=pa.schema(list(column_types.items())),
+            )
+        return table.select(["step", "timestamp", "value"])
+
+    def export_metrics(self, run_ids, metric_keys=None, step_range=None):
+        import pyarrow.compute as pc
+
+        from mlflow.store.tracking.metrics_export import (
+            coalesce_record_batches,
+            make_metrics_record_batch,
+        )
+
+        run_infos = [self._get_run_info(run_id) for run_id in sorted(set(run_ids))]
+
+        def _iter_histories():
+            for run_info in run_infos:
+                _, metric_files = self._get_run_files(run_info, "metric")
+                keys = set(metric_files)
+                if metric_keys is not None:
+                    keys &= set(metric_keys)
+                for key in sorted(keys):
+                    table = self._read_metric_table(run_info, key)
+                    if step_range is not None:
+                        min_step, max_step = step_range
+                        table = table.filter(
+                            pc.and_(
+                                pc.greater_equal(table["step"], min_step),
+                                pc.less_equal(table["step"], max_step),
+                            )
+                        )
+                    table = table.sort_by([("step", "ascending"), ("timestamp", "ascending")])
+                    if table.num_rows:
+                        yield make_metrics_record_batch(
+                            run_info.run_id,
+                            key,
+                            table["step"].combine_chunks(),
+                            table["timestamp"].combine_chunks(),
+                            table["value"].combine_chunks(),
+                        )
+
+        return coalesce_record_batches(_iter_histories())
+
     @staticmethod
     def _get_param_from_file(parent_path, param_name):
         _validate_param_name(param_name)
@@ -886,12 +1096,9 @@ class FileStore(AbstractStore):
             tags.append(self._get_tag_from_file(parent_path, tag_file))
         return tags
 
-    def _list_run_infos(self, experiment_id, view_type):
-        self._check_root_dir()
-        if not self._has_experiment(experiment_id):
-            return []
+    def _list_run_dirs(self, experiment_id):
         experiment_dir = self._get_experiment_path(experiment_id, assert_exists=True)
-        run_dirs = list_all(
+        return list_all(
             experiment_dir,
             filter_func=lambda x: all(
                 os.path.basename(os.path.normpath(x)) != reservedFolderName
@@ -900,33 +1107,100 @@ class FileStore(AbstractStore):
             and os.path.isdir(x),
             full_path=True,
         )
-        run_infos = []
-        for r_dir in run_dirs:
-            try:
-                # trap and warn known issues, will raise unexpected exceptions to caller
-                run_info = self._get_run_info_from_dir(r_dir)
-                if run_info.experiment_id != experiment_id:
-                    logging.warning(
-                        "Wrong experiment ID (%s) recorded for run '%s'. "
-                        "It should be %s. Run will be ignored.",
-                        str(run_info.experiment_id),
-                        str(run_info.run_id),
-                        str(experiment_id),
-                        exc_info=True,
-                    )
-                    continue
-                if LifecycleStage.matches_view_type(view_type, run_info.lifecycle_stage):
-                    run_infos.append(run_info)
-            except MissingConfigException as rnfe:
-                # trap malformed run exception and log
-                # this is at debug level because if the same store is used for
-                # artifact storage, it's common the folder is not a run folder
-                r_id = os.path.basename(r_dir)
-                logging.debug(
-                    "Malformed run '%s'. Detailed error %s", r_id, str(rnfe), exc_info=True
+
+    def _get_valid_run_info_from_dir(self, run_dir, experiment_id):
+        """
+        Returns the run info stored in ``run_dir``, or ``None`` if the directory doesn't contain a
+        valid run of the specified experiment.
+        """
+        try:
+            # trap and warn known issues, will raise unexpected exceptions to caller
+            run_info = self._get_run_info_from_dir(run_dir)
+            if run_info.experiment_id != experiment_id:
+                logging.warning(
+                    "Wrong experiment ID (%s) recorded for run '%s'. "
+                    "It should be %s. Run will be ignored.",
+                    str(run_info.experiment_id),
+                    str(run_info.run_id),
+                    str(experiment_id),
+                    exc_info=True,
                 )
+                return None
+            return run_info
+        except MissingConfigException as rnfe:
+            # trap malformed run exception and log
+            # this is at debug level because if the same store is used for
+            # artifact storage, it's common the folder is not a run folder
+            r_id = os.path.basename(run_dir)
+            logging.debug("Malformed run '%s'. Detailed error %s", r_id, str(rnfe), exc_info=True)
+            return None
+
+    def _list_run_infos(self, experiment_id, view_type):
+        self._check_root_dir()
+        if not self._has_experiment(experiment_id):
+            return []
+        run_infos = []
+        for r_dir in self._list_run_dirs(experiment_id):
+            run_info = self._get_valid_run_info_from_dir(r_dir, experiment_id)
+            if run_info and LifecycleStage.matches_view_type(view_type, run_info.lifecycle_stage):
+                run_infos.append(run_info)
         return run_infos
 
+    def _get_run_index(self, experiment_id):
+        return RunIndex(self._get_experiment_path(experiment_id, assert_exists=True))
+
+    def _update_run_index(self, run_info, **updates):
+        """
+        Applies an update of a run to the run index of its experiment, if the index exists. This
+        is done regardless of ``MLFLOW_FILE_STORE_RUN_INDEX``, so that processes that only log
+        to runs keep the index used by searching processes up to date.
+        """
+        run_index = self._get_run_index(run_info.experiment_id)
+        if run_index.exists():
+            run_index.update_run(run_info.run_id, **updates)
+
+    def _invalidate_run_index(self, run_info):
+        run_index = self._get_run_index(run_info.experiment_id)
+        if run_index.exists():
+            run_index.invalidate_run(run_info.run_id)
+
+    def _search_indexed_runs(self, experiment_ids, filter_string, run_view_type):
+        self._check_root_dir()
+        runs = []
+        for experiment_id in experiment_ids:
+            if not self._has_experiment(experiment_id):
+                continue
+
+            def list_run_ids():
+                return [os.path.basename(d) for d in self._list_run_dirs(experiment_id)]
+
+            def load_run(run_id):
+                run_dir = self._get_run_dir(experiment_id, run_id)
+                run_info = self._get_valid_run_info_from_dir(run_dir, experiment_id)
+                return self._get_run_from_info(run_info) if run_info else None
+
+            run_index = self._get_run_index(experiment_id)
+            run_index.sync(list_run_ids, load_run)
+            runs.extend(
+                run
+                for run in run_index.get_runs()
+                if LifecycleStage.matches_view_type(run_view_type, run.info.lifecycle_stage)
+            )
+
+        # Dataset inputs aren't indexed, so they have to be read from the run directories if
+        # they're needed to filter runs
+        if filter_string and any(
+            clause["type"] == SearchUtils._DATASET_IDENTIFIER
+            for clause in SearchUtils.parse_search_filter(filter_string)
+        ):
+            runs = [self._with_run_inputs(run) for run in runs]
+        return runs
+
+    def _with_run_inputs(self, run):
+        if run.inputs is not None:
+            return run
+        return Run(run.info, run.data, self._get_all_inputs(run.info))
+
     def _search_runs(
         self, experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
     ):
@@ -936,13 +1210,20 @@ class FileStore(AbstractStore):
                 f"most {SEARCH_MAX_RESULTS_THRESHOLD}, but got value {max_results}",
                 databricks_pb2.INVALID_PARAMETER_VALUE,
             )
-        runs = []
-        for experiment_id in experiment_ids:
-            run_infos = self._list_run_infos(experiment_id, run_view_type)
-            runs.extend(self._get_run_from_info(r) for r in run_infos)
+        use_run_index = MLFLOW_FILE_STORE_RUN_INDEX.get()
+        if use_run_index:
+            runs = self._search_indexed_runs(experiment_ids, filter_string, run_view_type)
+        else:
+            runs = []
+            for experiment_id in experiment_ids:
+                run_infos = self._list_run_infos(experiment_id, run_view_type)
+                runs.extend(self._get_run_from_info(r) for r in run_infos)
         filtered = SearchUtils.filter(runs, filter_string)
         sorted_runs = SearchUtils.sort(filtered, order_by)
         runs, next_page_token = SearchUtils.paginate(sorted_runs, page_token, max_results)
+        if use_run_index:
+            # Only read the dataset inputs of the runs of the requested page
+            runs = [self._with_run_inputs(run) for run in runs]
         return runs, next_page_token
 
     def log_metric(self, run_id, metric):
@@ -950,12 +1231,24 @@ class FileStore(AbstractStore):
         _validate_metric(metric.key, metric.value, metric.timestamp, metric.step)
         run_info = self._get_run_info(run_id)
         check_run_is_active(run_info)
-        self._log_run_metric(run_info, metric)
+        self._log_run_metrics(run_info, [metric])
+        self._update_run_index(run_info, metrics=[metric])
 
-    def _log_run_metric(self, run_info, metric):
-        metric_path = self._get_metric_path(run_info.experiment_id, run_info.run_id, metric.key)
+    def _log_run_metrics(self, run_info, metrics):
+        """
+        Append the values of a metric to its file with a single write.
+        """
+        metric_format = MLFLOW_FILE_STORE_METRIC_FORMAT.get()
+        if metric_format not in METRIC_FORMATS:
+            raise MlflowException.invalid_parameter_value(
+                f"Invalid value '{metric_format}' for {MLFLOW_FILE_STORE_METRIC_FORMAT.name}. "
+                f"Must be one of {list(METRIC_FORMATS)}."
+            )
+        metric_path = self._get_metric_path(run_info.experiment_id, run_info.run_id, metrics[0].key)
         make_containing_dirs(metric_path)
-        append_to(metric_path, f"{metric.timestamp} {metric.value} {metric.step}\n")
+        append_metric_fields(
+            metric_path, [(m.timestamp, m.value, m.step) for m in metrics], metric_format
+        )
 
     def _writeable_value(self, tag_value):
         if tag_value is None:
@@ -971,6 +1264,7 @@ class FileStore(AbstractStore):
         run_info = self._get_run_info(run_id)
         check_run_is_active(run_info)
         self._log_run_param(run_info, param)
+        self._update_run_index(run_info, params=[param])
 
     def _log_run_param(self, run_info, param):
         param_path = self._get_param_path(run_info.experiment_id, run_info.run_id, param.key)
@@ -1029,6 +1323,7 @@ class FileStore(AbstractStore):
         run_info = self._get_run_info(run_id)
         check_run_is_active(run_info)
         self._set_run_tag(run_info, tag)
+        self._update_run_index(run_info, tags=[tag])
         if tag.key == MLFLOW_RUN_NAME:
             run_status = RunStatus.from_string(run_info.status)
             self.update_run_info(run_id, run_status, run_info.end_time, tag.value)
@@ -1057,6 +1352,7 @@ class FileStore(AbstractStore):
                 error_code=RESOURCE_DOES_NOT_EXIST,
             )
         os.remove(tag_path)
+        self._update_run_index(run_info, deleted_tag_keys=[key])
 
     def _overwrite_run_info(self, run_info, deleted_time=None):
         run_dir = self._get_run_dir(run_info.experiment_id, run_info.run_id)
@@ -1064,6 +1360,7 @@ class FileStore(AbstractStore):
         if deleted_time is not None:
             run_info_dict["deleted_time"] = deleted_time
         write_yaml(run_dir, FileStore.META_DATA_FILE_NAME, run_info_dict, overwrite=True)
+        self._update_run_index(run_info, info=run_info)
 
     def log_batch(self, run_id, metrics, params, tags):
         _validate_run_id(run_id)
@@ -1075,8 +1372,11 @@ class FileStore(AbstractStore):
         try:
             for param in params:
                 self._log_run_param(run_info, param)
+            metrics_by_key = {}
             for metric in metrics:
-                self._log_run_metric(run_info, metric)
+                metrics_by_key.setdefault(metric.key, []).append(metric)
+            for key_metrics in metrics_by_key.values():
+                self._log_run_metrics(run_info, key_metrics)
             for tag in tags:
                 # NB: If the tag run name value is set, update the run info to assure
                 # synchronization.
@@ -1085,7 +1385,10 @@ class FileStore(AbstractStore):
                     self.update_run_info(run_id, run_status, run_info.end_time, tag.value)
                 self._set_run_tag(run_info, tag)
         except Exception as e:
+            # Some of the values may have been written, reload the run from its directory
+            self._invalidate_run_index(run_info)
             raise MlflowException(e, INTERNAL_ERROR)
+        self._update_run_index(run_info, metrics=metrics, params=params, tags=tags)
 
     def record_logged_model(self, run_id, mlflow_model):
         from mlflow.models import Model
@@ -1111,6 +1414,7 @@ class FileStore(AbstractStore):
             self._set_run_tag(run_info, tag)
         except Exception as e:
             raise MlflowException(e, INTERNAL_ERROR)
+        self._update_run_index(run_info, tags=[tag])
 
     def log_inputs(self, run_id: str, datasets: Optional[List[DatasetInput]] = None):
         """
@@ -0,0 +1,109 @@
+"""
+Readers and writers of the metric files of :py:class:`FileStore
+<mlflow.store.tracking.file_store.FileStore>` runs.
+
+Metric files are stored in one of two formats:
+
+- ``text``: one ``"{timestamp} {value} {step}"`` line per logged value. Files written by MLflow
+  < 1.0 don't contain steps.
+- ``binary``: a header followed by one fixed-width little-endian record per logged value, made of
+  the int64 timestamp, the float64 value and the int64 step. Binary files are memory-mapped
+  instead of being parsed, and take 24 bytes per logged value.
+
+The format of a metric file is detected from its first bytes, so that files of both formats can
+be read regardless of the format used to create new files.
+"""
+import os
+import uuid
+
+import numpy as np
+
+METRIC_FORMAT_TEXT = "text"
+METRIC_FORMAT_BINARY = "binary"
+METRIC_FORMATS = (METRIC_FORMAT_TEXT, METRIC_FORMAT_BINARY)
+
+# Text metric files start with a digit or a minus sign, so they can't start with this header. The
+# byte preceding the line feed is the version of the binary format.
+_BINARY_HEADER = b"\x93MLFLOW_METRIC\x01\n"
+RECORD_DTYPE = np.dtype([("timestamp", "<i8"), ("value", "<f8"), ("step", "<i8")])
+
+
+def get_metric_file_format(path):
+    """
+    Returns:
+        The format of the metric file at ``path``, or ``None`` if the file doesn't exist or is
+        empty.
+    """
+    try:
+        with open(path, "rb") as f:
+            header = f.read(len(_BINARY_HEADER))
+    except FileNotFoundError:
+        return None
+    if not header:
+        return None
+    return METRIC_FORMAT_BINARY if header == _BINARY_HEADER else METRIC_FORMAT_TEXT
+
+
+def read_binary_metric_records(path):
+    """
+    Memory-map the records of a binary metric file.
+
+    Returns:
+        A read-only structured NumPy array of ``RECORD_DTYPE``. A trailing partial record, left by
+        an interrupted write, is ignored.
+    """
+    num_records = (os.path.getsize(path) - len(_BINARY_HEADER)) // RECORD_DTYPE.itemsize
+    if num_records <= 0:
+        return np.empty(0, dtype=RECORD_DTYPE)
+    return np.memmap(
+        path, dtype=RECORD_DTYPE, mode="r", offset=len(_BINARY_HEADER), shape=(num_records,)
+    )
+
+
+def _serialize_metric_fields(fields, metric_format, header):
+    """
+    Serialize ``(timestamp, value, step)`` tuples in the given format, preceded by the file header
+    if ``header`` is true.
+    """
+    if metric_format == METRIC_FORMAT_BINARY:
+        records = np.array(list(fields), dtype=RECORD_DTYPE)
+        return (_BINARY_HEADER if header else b"") + records.tobytes()
+    return "".join(f"{ts} {value} {step}\n" for ts, value, step in fields).encode("utf-8")
+
+
+def append_metric_fields(path, fields, metric_format):
+    """
+    Append ``(timestamp, value, step)`` tuples to a metric file with a single write.
+
+    Args:
+        path: The path of the metric file, which is created if it doesn't exist.
+        fields: The ``(timestamp, value, step)`` tuples of the logged values.
+        metric_format: The format of the file if it has to be created. Values appended to an
+            existing file are written in the format of that file.
+    """
+    with open(path, "ab") as f:
+        if f.tell() != 0:
+            metric_format = get_metric_file_format(path)
+        f.write(_serialize_metric_fields(fields, metric_format, header=f.tell() == 0))
+
+
+def write_metric_file(path, fields, metric_format, tmp_dir):
+    """
+    Atomically replace a metric file with the given ``(timestamp, value, step)`` tuples.
+
+    Args:
+        path: The path of the metric file.
+        fields: The ``(timestamp, value, step)`` tuples of the logged values.
+        metric_format: The format of the new file.
+        tmp_dir: A directory on the same file system as ``path``, in which the new file is written
+            before replacing the existing one.
+    """
+    tmp_path = os.path.join(tmp_dir, f".{os.path.basename(path)}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp_path, "xb") as f:
+            f.write(_serialize_metric_fields(fields, metric_format, header=True))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
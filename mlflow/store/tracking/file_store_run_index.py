@@ -0,0 +1,208 @@
+"""
+An on-disk index of the runs of a single :py:class:`FileStore
+<mlflow.store.tracking.file_store.FileStore>` experiment.
+
+The index is a SQLite database stored under the experiment directory. It holds the run info,
+latest metrics, params and tags of every run, which allows ``search_runs`` to filter, sort and
+paginate without reading each run directory. The index is updated incrementally by the write
+methods of ``FileStore``, and run directories that are added or removed outside of those methods
+are reconciled lazily, based on the modification time of the experiment directory.
+"""
+import contextlib
+import logging
+import os
+import sqlite3
+
+from mlflow.entities import Param, Run, RunData, RunInfo, RunTag
+from mlflow.protos.service_pb2 import Run as ProtoRun
+
+_logger = logging.getLogger(__name__)
+
+_SCHEMA = (
+    # `run` is NULL if the run has to be (re)loaded from its directory, and empty if the
+    # directory doesn't contain a valid run. `version` is incremented by every update, which
+    # allows reloads performed outside of a transaction to detect concurrent updates.
+    """
+    CREATE TABLE IF NOT EXISTS runs (
+        run_id TEXT PRIMARY KEY,
+        run BLOB,
+        version INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    "CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT)",
+)
+_EXPERIMENT_DIR_MTIME = "experiment_dir_mtime_ns"
+
+
+def _serialize_run(run):
+    return Run(run.info, run.data).to_proto().SerializeToString()
+
+
+def _deserialize_run(blob):
+    proto = ProtoRun.FromString(blob)
+    return Run(RunInfo.from_proto(proto.info), RunData.from_proto(proto.data))
+
+
+class RunIndex:
+    """
+    SQLite-backed index of the runs of a FileStore experiment.
+
+    Args:
+        experiment_dir: The directory of the experiment to index.
+    """
+
+    FOLDER_NAME = "run_index"
+    FILE_NAME = "runs.sqlite"
+
+    def __init__(self, experiment_dir):
+        self.experiment_dir = experiment_dir
+        self.path = os.path.join(experiment_dir, RunIndex.FOLDER_NAME, RunIndex.FILE_NAME)
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=20, isolation_level=None)
+        try:
+            # Take the write lock upfront so that read-modify-write cycles performed by concurrent
+            # processes are serialized
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def update_run(self, run_id, info=None, metrics=(), params=(), tags=(), deleted_tag_keys=()):
+        """
+        Apply an update performed on the directory of a run to its index entry.
+
+        Args:
+            run_id: The ID of the updated run.
+            info: The new :py:class:`RunInfo <mlflow.entities.RunInfo>` of the run, if any.
+            metrics: Metrics logged to the run.
+            params: Params logged to the run.
+            tags: Tags set on the run.
+            deleted_tag_keys: Keys of the tags deleted from the run.
+        """
+        with self._transaction() as conn:
+            row = conn.execute("SELECT run FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+            if row is None:
+                conn.execute(
+                    "INSERT INTO runs (run_id, run, version) VALUES (?, NULL, 1)", (run_id,)
+                )
+                return
+            if not row[0]:
+                # The run isn't indexed yet, make sure that it's (re)loaded from its directory
+                conn.execute(
+                    "UPDATE runs SET run = NULL, version = version + 1 WHERE run_id = ?", (run_id,)
+                )
+                return
+
+            run = _deserialize_run(row[0])
+            latest_metrics = {m.key: m for m in run.data._metric_objs}
+            for metric in metrics:
+                # Mirrors the selection of the latest metric values performed by FileStore
+                latest = latest_metrics.get(metric.key)
+                if latest is None or (metric.step, metric.timestamp, metric.value) > (
+                    latest.step,
+                    latest.timestamp,
+                    latest.value,
+                ):
+                    latest_metrics[metric.key] = metric
+            run_params = {**run.data.params, **{p.key: p.value for p in params}}
+            run_tags = {**run.data.tags, **{t.key: t.value for t in tags}}
+            for key in deleted_tag_keys:
+                run_tags.pop(key, None)
+            data = RunData(
+                metrics=list(latest_metrics.values()),
+                params=[Param(k, v) for k, v in run_params.items()],
+                tags=[RunTag(k, v) for k, v in run_tags.items()],
+            )
+            conn.execute(
+                "UPDATE runs SET run = ?, version = version + 1 WHERE run_id = ?",
+                (_serialize_run(Run(info if info is not None else run.info, data)), run_id),
+            )
+
+    def invalidate_run(self, run_id):
+        """
+        Mark the index entry of a run as stale, so that the run is reloaded from its directory by
+        the next :py:meth:`sync`.
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO runs (run_id, run, version) VALUES (?, NULL, 1) "
+                "ON CONFLICT (run_id) DO UPDATE SET run = NULL, version = version + 1",
+                (run_id,),
+            )
+
+    def sync(self, list_run_ids, load_run):
+        """
+        Bring the index up to date with the experiment directory.
+
+        If the modification time of the experiment directory changed since the last
+        synchronization, runs whose directories were added or removed are reconciled. Then, runs
+        that aren't indexed yet are loaded from their directories.
+
+        Args:
+            list_run_ids: Function returning the IDs of the runs present in the experiment
+                directory.
+            load_run: Function loading a :py:class:`Run <mlflow.entities.Run>` from its
+                directory given its ID, or returning ``None`` if the directory doesn't contain
+                a valid run.
+        """
+        # Read the modification time before listing the directory, so that runs added while
+        # listing are picked up by the next synchronization
+        mtime = str(os.stat(self.experiment_dir).st_mtime_ns)
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT value FROM state WHERE key = ?", (_EXPERIMENT_DIR_MTIME,)
+            ).fetchone()
+        if row is None or row[0] != mtime:
+            run_ids = set(list_run_ids())
+            with self._transaction() as conn:
+                indexed_run_ids = {r for (r,) in conn.execute("SELECT run_id FROM runs")}
+                conn.executemany(
+                    "DELETE FROM runs WHERE run_id = ?",
+                    [(r,) for r in indexed_run_ids - run_ids],
+                )
+                conn.executemany(
+                    "INSERT INTO runs (run_id, run, version) VALUES (?, NULL, 0)",
+                    [(r,) for r in run_ids - indexed_run_ids],
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)",
+                    (_EXPERIMENT_DIR_MTIME, mtime),
+                )
+
+        with self._transaction() as conn:
+            pending = conn.execute("SELECT run_id, version FROM runs WHERE run IS NULL").fetchall()
+        if not pending:
+            return
+        _logger.debug("Indexing %d runs of %s", len(pending), self.experiment_dir)
+        loaded = []
+        for run_id, version in pending:
+            run = load_run(run_id)
+            loaded.append((_serialize_run(run) if run is not None else b"", run_id, version))
+        with self._transaction() as conn:
+            # Runs updated while being loaded stay pending and are reloaded by the next sync
+            conn.executemany(
+                "UPDATE runs SET run = ? WHERE run_id = ? AND version = ? AND run IS NULL", loaded
+            )
+
+    def get_runs(self):
+        """
+        Returns:
+            A list of the indexed :py:class:`Run <mlflow.entities.Run>` entities. Their inputs are
+            ``None``, since dataset inputs aren't indexed.
+        """
+        with self._transaction() as conn:
+            blobs = conn.execute("SELECT run FROM runs WHERE run IS NOT NULL").fetchall()
+        return [_deserialize_run(blob) for (blob,) in blobs if blob]
@@ -0,0 +1,152 @@
+"""
+Utilities for the columnar export of metric histories performed by ``export_metrics``.
+
+Metric values are exported as Arrow record batches with the schema returned by
+:py:func:`get_metrics_export_schema`, and are sent by the tracking server as an Arrow IPC stream,
+so that large histories can be transferred without building a ``Metric`` entity or a protobuf
+message per logged value.
+"""
+import io
+
+# The maximum number of rows of the record batches produced by stores
+EXPORT_METRICS_BATCH_SIZE = 100_000
+# The content type of the Arrow IPC streams sent by the tracking server
+ARROW_STREAM_CONTENT_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def get_metrics_export_schema():
+    """
+    Returns:
+        The ``pyarrow.Schema`` of exported metrics: ``run_id`` and ``key`` strings, ``step`` and
+        ``timestamp`` 64-bit integers and ``value`` 64-bit floats.
+    """
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("run_id", pa.string()),
+            ("key", pa.string()),
+            ("step", pa.int64()),
+            ("timestamp", pa.int64()),
+            ("value", pa.float64()),
+        ]
+    )
+
+
+def make_metrics_record_batch(run_id, key, step, timestamp, value):
+    """
+    Build a record batch of exported metrics from columns of equal length.
+
+    Args:
+        run_id: A sequence of run IDs, or a single run ID shared by every row.
+        key: A sequence of metric keys, or a single metric key shared by every row.
+        step: A sequence or array of steps.
+        timestamp: A sequence or array of timestamps.
+        value: A sequence or array of values.
+
+    Returns:
+        A ``pyarrow.RecordBatch`` with the schema returned by :py:func:`get_metrics_export_schema`.
+    """
+    import pyarrow as pa
+
+    def _column(column, arrow_type):
+        if isinstance(column, pa.Array):
+            return column.cast(arrow_type)
+        return pa.array(column, type=arrow_type)
+
+    step = _column(step, pa.int64())
+    num_rows = len(step)
+
+    def _string_column(column):
+        if isinstance(column, str):
+            return pa.repeat(pa.scalar(column, type=pa.string()), num_rows)
+        return _column(column, pa.string())
+
+    return pa.RecordBatch.from_arrays(
+        [
+            _string_column(run_id),
+            _string_column(key),
+            step,
+            _column(timestamp, pa.int64()),
+            _column(value, pa.float64()),
+        ],
+        schema=get_metrics_export_schema(),
+    )
+
+
+def coalesce_record_batches(batches, batch_size=EXPORT_METRICS_BATCH_SIZE):
+    """
+    Merge consecutive small record batches of exported metrics, e.g. the histories of individual
+    metrics, into record batches of at most ``batch_size`` rows.
+
+    Args:
+        batches: An iterable of ``pyarrow.RecordBatch``.
+        batch_size: The maximum number of rows of the merged record batches.
+
+    Returns:
+        A generator of ``pyarrow.RecordBatch``.
+    """
+    import pyarrow as pa
+
+    schema = get_metrics_export_schema()
+    pending = []
+    num_pending_rows = 0
+
+    def _flush():
+        table = pa.Table.from_batches(pending, schema=schema).combine_chunks()
+        pending.clear()
+        return table.to_batches(max_chunksize=batch_size)
+
+    for batch in batches:
+        pending.append(batch)
+        num_pending_rows += batch.num_rows
+        if num_pending_rows >= batch_size:
+            yield from _flush()
+            num_pending_rows = 0
+    if num_pending_rows:
+        yield from _flush()
+
+
+def write_metrics_ipc_stream(batches):
+    """
+    Serialize record batches of exported metrics into an Arrow IPC stream.
+
+    Args:
+        batches: An iterable of ``pyarrow.RecordBatch``.
+
+    Returns:
+        A generator of ``bytes`` chunks, one per record batch, preceded by the stream schema and
+        followed by the end-of-stream marker.
+    """
+    import pyarrow as pa
+
+    sink = io.BytesIO()
+
+    def _flush():
+        data = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return data
+
+    with pa.ipc.new_stream(sink, get_metrics_export_schema()) as writer:
+        yield _flush()
+        for batch in batches:
+            writer.write_batch(batch)
+            yield _flush()
+    yield _flush()
+
+
+def read_metrics_ipc_stream(source):
+    """
+    Deserialize an Arrow IPC stream of exported metrics.
+
+    Args:
+        source: A readable binary file object.
+
+    Returns:
+        A generator of ``pyarrow.RecordBatch``.
+    """
+    import pyarrow as pa
+
+    with pa.ipc.open_stream(source) as reader:
+        yield from reader
@@ -1,3 +1,4 @@
+import json
 import logging
 from typing import Dict, List, Optional
 
@@ -14,6 +15,7 @@ from mlflow.protos.service_pb2 import (
     DeleteTraces,
     DeleteTraceTag,
     EndTrace,
+    ExportMetrics,
     GetExperiment,
     GetExperimentByName,
     GetMetricHistory,
@@ -45,11 +47,14 @@ from mlflow.store.tracking.abstract_store import AbstractStore
 from mlflow.utils.proto_json_utils import message_to_json
 from mlflow.utils.rest_utils import (
     _REST_API_PATH_PREFIX,
+    _can_parse_as_json_object,
     call_endpoint,
     extract_api_info_for_service,
     get_set_trace_tag_endpoint,
     get_single_trace_endpoint,
     get_trace_info_endpoint,
+    http_request,
+    verify_rest_response,
 )
 
 _METHOD_TO_INFO = extract_api_info_for_service(MlflowService, _REST_API_PATH_PREFIX)
@@ -483,8 +488,75 @@ class RestStore(AbstractStore):
         metric_history = [Metric.from_proto(metric) for metric in response_proto.metrics]
         return PagedList(metric_history, response_proto.next_page_token or None)
 
+    def export_metrics(self, run_ids, metric_keys=None, step_range=None):
+        """
+        Export the histories of metrics logged to several runs, streamed by the tracking server as
+        an Arrow IPC stream. Falls back to fetching the history of every metric for tracking
+        servers that don't support metric exports.
+
+        Args:
+            run_ids: Unique identifiers of the runs whose metrics to export.
+            metric_keys: Names of the metrics to export. If ``None``, every metric logged to the
+                runs is exported.
+            step_range: Optional ``(min_step, max_step)`` tuple. If specified, only the values
+                logged at steps within this inclusive range are exported.
+
+        Returns:
+            An iterator of ``pyarrow.RecordBatch``.
+        """
+        from mlflow.store.tracking.metrics_export import read_metrics_ipc_stream
+
+        min_step, max_step = step_range or (None, None)
+        req_body = message_to_json(
+            ExportMetrics(
+                run_ids=run_ids,
+                metric_keys=metric_keys or [],
+                start_step=min_step,
+                end_step=max_step,
+            )
+        )
+        endpoint, method = _METHOD_TO_INFO[ExportMetrics]
+        response = http_request(
+            host_creds=self.get_host_creds(),
+            endpoint=endpoint,
+            method=method,
+            json=json.loads(req_body),
+            stream=True,
+        )
+        if response.status_code == 404 and not _can_parse_as_json_object(response.text):
+            _logger.debug("Metric exports are not supported by the tracking server")
+            return super().export_metrics(run_ids, metric_keys, step_range)
+        if response.status_code != 200:
+            verify_rest_response(response, endpoint)
+        response.raw.decode_content = True
+        return read_metrics_ipc_stream(response.raw)
+
     def _search_runs(
         self, experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
+    ):
+        return self._search_runs_with_projection(
+            experiment_ids,
+            filter_string,
+            run_view_type,
+            max_results,
+            order_by,
+            page_token,
+            include_metrics=None,
+            include_params=None,
+            include_inputs=True,
+        )
+
+    def _search_runs_with_projection(
+        self,
+        experiment_ids,
+        filter_string,
+        run_view_type,
+        max_results,
+        order_by,
+        page_token,
+        include_metrics,
+        include_params,
+        include_inputs,
     ):
         experiment_ids = [str(experiment_id) for experiment_id in experiment_ids]
         sr = SearchRuns(
@@ -495,6 +567,14 @@ class RestStore(AbstractStore):
             order_by=order_by,
             page_token=page_token,
         )
+        if include_metrics is not None:
+            sr.include_metrics.SetInParent()
+            sr.include_metrics.keys.extend(include_metrics)
+        if include_params is not None:
+            sr.include_params.SetInParent()
+            sr.include_params.keys.extend(include_params)
+        if not include_inputs:
+            sr.include_inputs = False
         req_body = message_to_json(sr)
         response_proto = self._call_endpoint(SearchRuns, req_body)
         runs = [Run.from_proto(proto_run) for proto_run in response_proto.runs]
@@ -5,13 +5,17 @@ import random
 import threading
 import time
 import uuid
+from collections import defaultdict
 from functools import reduce
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import sqlalchemy
 import sqlalchemy.sql.expression as sql
 from sqlalchemy import and_, func, sql, text
 from sqlalchemy.future import select
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import Label, UnaryExpression
 
 import mlflow.store.db.utils
 from mlflow.entities import (
@@ -37,14 +41,14 @@ from mlflow.protos.databricks_pb2 import (
     RESOURCE_ALREADY_EXISTS,
     RESOURCE_DOES_NOT_EXIST,
 )
-from mlflow.store.db.db_types import MSSQL, MYSQL
+from mlflow.store.db.db_types import MSSQL, MYSQL, POSTGRES, SQLITE
 from mlflow.store.entities.paged_list import PagedList
 from mlflow.store.tracking import (
     SEARCH_MAX_RESULTS_DEFAULT,
     SEARCH_MAX_RESULTS_THRESHOLD,
     SEARCH_TRACES_DEFAULT_MAX_RESULTS,
 )
-from mlflow.store.tracking.abstract_store import AbstractStore
+from mlflow.store.tracking.abstract_store import AbstractStore, _get_sampling_buckets
 from mlflow.store.tracking.dbmodels.models import (
     SqlDataset,
     SqlExperiment,
@@ -61,6 +65,7 @@ from mlflow.store.tracking.dbmodels.models import (
     SqlTraceTag,
 )
 from mlflow.tracing.utils import generate_request_id
+from mlflow.utils import chunk_list
 from mlflow.utils.file_utils import local_file_uri_to_path, mkdir
 from mlflow.utils.mlflow_tags import (
     MLFLOW_ARTIFACT_LOCATION,
@@ -95,6 +100,10 @@ from mlflow.utils.validation import (
 
 _logger = logging.getLogger(__name__)
 
+# The maximum number of run IDs bound to a single query by `export_metrics`, which stays below
+# the limit on the number of host parameters of older SQLite versions
+_MAX_RUN_IDS_PER_EXPORT_QUERY = 500
+
 # For each database table, fetch its columns and define an appropriate attribute for each column
 # on the table's associated object representation (Mapper). This is necessary to ensure that
 # columns defined via backreference are available as Mapper instance attributes (e.g.,
@@ -531,53 +540,73 @@ class SqlAlchemyStore(AbstractStore):
         return runs[0]
 
     def _get_run_inputs(self, session, run_uuids):
-        datasets = (
-            session.query(
-                SqlInput.input_uuid, SqlInput.destination_id.label("run_uuid"), SqlDataset
-            )
-            .select_from(SqlDataset)
-            .join(SqlInput, SqlInput.source_id == SqlDataset.dataset_uuid)
-            .filter(SqlInput.destination_type == "RUN", SqlInput.destination_id.in_(run_uuids))
-            .order_by("run_uuid")
-        ).all()
-        input_uuids = [dataset.input_uuid for dataset in datasets]
-        input_tags = (
-            session.query(
-                SqlInput.input_uuid, SqlInput.destination_id.label("run_uuid"), SqlInputTag
-            )
-            .join(SqlInput, (SqlInput.input_uuid == SqlInputTag.input_uuid))
-            .filter(SqlInput.input_uuid.in_(input_uuids))
-            .order_by("run_uuid")
-        ).all()
-
-        all_dataset_inputs = []
-        for run_uuid in run_uuids:
-            dataset_inputs = []
-            for input_uuid, dataset_run_uuid, dataset_sql in datasets:
-                if run_uuid == dataset_run_uuid:
-                    dataset_entity = dataset_sql.to_mlflow_entity()
-                    tags = []
-                    for tag_input_uuid, tag_run_uuid, tag_sql in input_tags:
-                        if input_uuid == tag_input_uuid and run_uuid == tag_run_uuid:
-                            tags.append(tag_sql.to_mlflow_entity())
-                    dataset_input_entity = DatasetInput(dataset=dataset_entity, tags=tags)
-                    dataset_inputs.append(dataset_input_entity)
-            all_dataset_inputs.append(dataset_inputs)
-        return all_dataset_inputs
+        """
+        Load the dataset inputs of several runs.
+
+        Inputs, datasets and input tags are loaded with one query each rather than with a single
+        join, which would repeat the source, schema and profile of a dataset for each run and
+        each tag it's logged with. Datasets shared by several runs are loaded and converted to
+        entities once, and shared by the inputs of these runs.
+
+        Returns:
+            A list of the lists of dataset inputs of each run, in the order of ``run_uuids``.
+        """
+        run_inputs_filter = (
+            SqlInput.destination_type == "RUN",
+            SqlInput.destination_id.in_(run_uuids),
+        )
+        inputs = (
+            session.query(SqlInput.input_uuid, SqlInput.destination_id, SqlInput.source_id)
+            .filter(*run_inputs_filter)
+            .all()
+        )
+        if not inputs:
+            return [[] for _ in run_uuids]
+
+        datasets = session.query(SqlDataset).filter(
+            SqlDataset.dataset_uuid.in_(select(SqlInput.source_id).where(*run_inputs_filter))
+        )
+        datasets_by_uuid = {
+            dataset.dataset_uuid: dataset.to_mlflow_entity() for dataset in datasets
+        }
+        input_tags = session.query(SqlInputTag).filter(
+            SqlInputTag.input_uuid.in_(select(SqlInput.input_uuid).where(*run_inputs_filter))
+        )
+        tags_by_input_uuid = defaultdict(list)
+        for tag in input_tags:
+            tags_by_input_uuid[tag.input_uuid].append(tag.to_mlflow_entity())
+
+        dataset_inputs_by_run_uuid = defaultdict(list)
+        for input_uuid, run_uuid, dataset_uuid in inputs:
+            if dataset := datasets_by_uuid.get(dataset_uuid):
+                dataset_inputs_by_run_uuid[run_uuid].append(
+                    DatasetInput(dataset=dataset, tags=tags_by_input_uuid[input_uuid])
+                )
+        return [dataset_inputs_by_run_uuid[run_uuid] for run_uuid in run_uuids]
 
     @staticmethod
-    def _get_eager_run_query_options():
+    def _get_eager_run_query_options(include_metrics=None, include_params=None):
         """
         A list of SQLAlchemy query options that can be used to eagerly load the following
         run attributes when fetching a run: ``latest_metrics``, ``params``, and ``tags``.
+
+        Args:
+            include_metrics: If specified, only the latest metrics with these keys are loaded.
+            include_params: If specified, only the params with these keys are loaded.
         """
+        latest_metrics = SqlRun.latest_metrics
+        if include_metrics is not None:
+            latest_metrics = latest_metrics.and_(SqlLatestMetric.key.in_(include_metrics))
+        params = SqlRun.params
+        if include_params is not None:
+            params = params.and_(SqlParam.key.in_(include_params))
         return [
             # Use a select in load rather than a joined load in order to minimize the memory
             # overhead of the eager loading procedure. For more information about relationship
             # loading techniques, see https://docs.sqlalchemy.org/en/13/orm/
             # loading_relationships.html#relationship-loading-techniques
-            sqlalchemy.orm.selectinload(SqlRun.latest_metrics),
-            sqlalchemy.orm.selectinload(SqlRun.params),
+            sqlalchemy.orm.selectinload(latest_metrics),
+            sqlalchemy.orm.selectinload(params),
             sqlalchemy.orm.selectinload(SqlRun.tags),
         ]
 
@@ -708,20 +737,20 @@ class SqlAlchemyStore(AbstractStore):
 
         # Duplicate metric values are eliminated here to maintain
         # the same behavior in log_metric
-        metric_instances = []
+        metric_rows = []
         seen = set()
         for metric in metrics:
             metric, value, is_nan = self._get_metric_value_details(metric)
             if metric not in seen:
-                metric_instances.append(
-                    SqlMetric(
-                        run_uuid=run_id,
-                        key=metric.key,
-                        value=value,
-                        timestamp=metric.timestamp,
-                        step=metric.step,
-                        is_nan=is_nan,
-                    )
+                metric_rows.append(
+                    {
+                        "run_uuid": run_id,
+                        "key": metric.key,
+                        "value": value,
+                        "timestamp": metric.timestamp,
+                        "step": metric.step,
+                        "is_nan": is_nan,
+                    }
                 )
             seen.add(metric)
 
@@ -729,6 +758,12 @@ class SqlAlchemyStore(AbstractStore):
             run = self._get_run(run_uuid=run_id, session=session)
             self._check_run_is_active(run)
 
+            if self.db_type != MSSQL:
+                self._bulk_insert_metrics(metric_rows, session)
+                return
+
+            metric_instances = [SqlMetric(**row) for row in metric_rows]
+
             def _insert_metrics(metric_instances):
                 session.add_all(metric_instances)
                 self._update_latest_metrics_if_necessary(metric_instances, session)
@@ -771,6 +806,88 @@ class SqlAlchemyStore(AbstractStore):
                     # though they were not violating the PK, log them
                     _insert_metrics(non_existing_metrics)
 
+    def _get_metric_upsert_statement(self, model):
+        """
+        Returns a dialect-specific ``INSERT`` statement for the table of ``model`` that supports
+        conflict handling (``ON CONFLICT`` / ``ON DUPLICATE KEY``). Only PostgreSQL, MySQL and
+        SQLite are supported.
+        """
+        if self.db_type == POSTGRES:
+            from sqlalchemy.dialects.postgresql import insert
+        elif self.db_type == MYSQL:
+            from sqlalchemy.dialects.mysql import insert
+        elif self.db_type == SQLITE:
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            raise MlflowException(
+                f"Bulk metric insertion is not supported for database type '{self.db_type}'",
+                INTERNAL_ERROR,
+            )
+        return insert(model.__table__)
+
+    def _bulk_insert_metrics(self, rows, session):
+        """
+        Inserts the metric ``rows`` (dictionaries keyed by column name) into the ``metrics`` table
+        with a single multi-row ``INSERT`` that skips rows violating the primary key, then updates
+        the ``latest_metrics`` table with a single set-based upsert. This avoids the ORM unit of
+        work, which dominates CPU time when logging large batches of metrics.
+        """
+        metrics_table = SqlMetric.__table__
+        stmt = self._get_metric_upsert_statement(SqlMetric)
+        if self.db_type == MYSQL:
+            # Assigning a column to itself turns a duplicate primary key into a no-op. Unlike
+            # ``INSERT IGNORE``, this doesn't downgrade unrelated errors to warnings.
+            stmt = stmt.on_duplicate_key_update(run_uuid=metrics_table.c.run_uuid)
+        else:
+            stmt = stmt.on_conflict_do_nothing()
+        session.execute(stmt, rows)
+
+        # Only the most recent value logged for each key can affect ``latest_metrics``, so reduce
+        # the batch to one candidate row per key before touching the table
+        latest_rows = {}
+        for row in rows:
+            current = latest_rows.get(row["key"])
+            if current is None or (row["step"], row["timestamp"], row["value"]) > (
+                current["step"],
+                current["timestamp"],
+                current["value"],
+            ):
+                latest_rows[row["key"]] = row
+        # Sort by key to ensure a consistent locking order across transactions, reducing deadlock
+        # likelihood
+        latest_rows = [latest_rows[key] for key in sorted(latest_rows)]
+
+        latest_table = SqlLatestMetric.__table__
+        stmt = self._get_metric_upsert_statement(SqlLatestMetric)
+        if self.db_type == MYSQL:
+            new = stmt.inserted
+            old = latest_table.c
+            # MySQL evaluates assignments from left to right and later assignments observe the
+            # values written by earlier ones. Updating ``is_nan``, ``value``, ``timestamp`` and
+            # ``step`` in that order keeps the "is strictly newer" comparison correct for every
+            # assignment: once a column has been overwritten, it compares equal and the decision
+            # falls through to the columns with higher precedence that haven't changed yet.
+            is_newer = _is_strictly_newer_metric(new, old)
+            stmt = stmt.on_duplicate_key_update(
+                [
+                    (col, sqlalchemy.func.IF(is_newer, getattr(new, col), getattr(old, col)))
+                    for col in ("is_nan", "value", "timestamp", "step")
+                ]
+            )
+        else:
+            new = stmt.excluded
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[latest_table.c.key, latest_table.c.run_uuid],
+                set_={
+                    "value": new.value,
+                    "timestamp": new.timestamp,
+                    "step": new.step,
+                    "is_nan": new.is_nan,
+                },
+                where=_is_strictly_newer_metric(new, latest_table.c),
+            )
+        session.execute(stmt, latest_rows)
+
     def _update_latest_metrics_if_necessary(self, logged_metrics, session):
         def _compare_metrics(metric_a, metric_b):
             """
@@ -998,6 +1115,157 @@ class SqlAlchemyStore(AbstractStore):
                 for metric in metrics
             ]
 
+    def get_sampled_metric_history(
+        self, run_ids, metric_key, start_step=None, end_step=None, max_points=None
+    ):
+        with self.ManagedSessionMaker() as session:
+            if start_step is None and end_step is None:
+                start_step = 0
+                end_step = (
+                    session.query(func.max(SqlMetric.step))
+                    .filter(SqlMetric.key == metric_key, SqlMetric.run_uuid.in_(run_ids))
+                    .scalar()
+                ) or 0
+
+            in_range = and_(
+                SqlMetric.key == metric_key,
+                SqlMetric.run_uuid.in_(run_ids),
+                SqlMetric.step.between(start_step, end_step),
+            )
+            if max_points:
+                # Assign each value to one of `num_buckets` equal-width step buckets and rank
+                # the values of each bucket by step and by value in both directions, so that the
+                # first step as well as the minimum and maximum values of every bucket can be
+                # selected in a single pass. NaN values are persisted as 0 and sorted last.
+                num_buckets, keep_extrema = _get_sampling_buckets(max_points)
+                bucket = func.floor(
+                    (SqlMetric.step - start_step) * (num_buckets / (end_step - start_step + 1))
+                )
+                partition_by = [SqlMetric.run_uuid, bucket]
+                ranked = (
+                    select(
+                        SqlMetric.run_uuid,
+                        SqlMetric.step,
+                        func.row_number()
+                        .over(partition_by=partition_by, order_by=SqlMetric.step)
+                        .label("first_rank"),
+                        func.row_number()
+                        .over(
+                            partition_by=partition_by,
+                            order_by=[SqlMetric.is_nan, SqlMetric.value, SqlMetric.step],
+                        )
+                        .label("min_rank"),
+                        func.row_number()
+                        .over(
+                            partition_by=partition_by,
+                            order_by=[SqlMetric.is_nan, SqlMetric.value.desc(), SqlMetric.step],
+                        )
+                        .label("max_rank"),
+                        func.max(SqlMetric.step)
+                        .over(partition_by=SqlMetric.run_uuid)
+                        .label("last_step"),
+                    )
+                    .where(in_range)
+                    .subquery()
+                )
+                # Runs with at most `max_points` steps in the range aren't downsampled
+                num_steps = (
+                    select(
+                        SqlMetric.run_uuid,
+                        func.count(sqlalchemy.distinct(SqlMetric.step)).label("num_steps"),
+                    )
+                    .where(in_range)
+                    .group_by(SqlMetric.run_uuid)
+                    .subquery()
+                )
+                retained = [
+                    num_steps.c.num_steps <= max_points,
+                    ranked.c.step == ranked.c.last_step,
+                ]
+                if num_buckets > 0:
+                    retained.append(ranked.c.first_rank == 1)
+                if keep_extrema:
+                    retained.extend([ranked.c.min_rank == 1, ranked.c.max_rank == 1])
+                sampled_steps = (
+                    select(ranked.c.run_uuid, ranked.c.step)
+                    .join(num_steps, ranked.c.run_uuid == num_steps.c.run_uuid)
+                    .where(sqlalchemy.or_(*retained))
+                    .distinct()
+                    .subquery()
+                )
+                query = session.query(SqlMetric).join(
+                    sampled_steps,
+                    and_(
+                        SqlMetric.run_uuid == sampled_steps.c.run_uuid,
+                        SqlMetric.step == sampled_steps.c.step,
+                    ),
+                )
+            else:
+                query = session.query(SqlMetric)
+
+            metrics = (
+                query.filter(in_range)
+                .order_by(
+                    SqlMetric.run_uuid,
+                    SqlMetric.step,
+                    SqlMetric.timestamp,
+                    SqlMetric.value,
+                )
+                .all()
+            )
+            metrics_by_run_id = {run_id: [] for run_id in run_ids}
+            for metric in metrics:
+                metrics_by_run_id[metric.run_uuid].append(
+                    MetricWithRunId(run_id=metric.run_uuid, metric=metric.to_mlflow_entity())
+                )
+            return [m for run_metrics in metrics_by_run_id.values() for m in run_metrics]
+
+    def export_metrics(self, run_ids, metric_keys=None, step_range=None):
+        from mlflow.store.tracking.metrics_export import (
+            EXPORT_METRICS_BATCH_SIZE,
+            make_metrics_record_batch,
+        )
+
+        run_ids = sorted(set(run_ids))
+        with self.ManagedSessionMaker() as session:
+            for run_ids_chunk in chunk_list(run_ids, _MAX_RUN_IDS_PER_EXPORT_QUERY):
+                existing_run_ids = {
+                    run_id
+                    for (run_id,) in session.query(SqlRun.run_uuid).filter(
+                        SqlRun.run_uuid.in_(run_ids_chunk)
+                    )
+                }
+                if missing_run_ids := [r for r in run_ids_chunk if r not in existing_run_ids]:
+                    raise MlflowException(
+                        f"Run with id={missing_run_ids[0]} not found", RESOURCE_DOES_NOT_EXIST
+                    )
+
+            for run_ids_chunk in chunk_list(run_ids, _MAX_RUN_IDS_PER_EXPORT_QUERY):
+                stmt = select(
+                    SqlMetric.run_uuid,
+                    SqlMetric.key,
+                    SqlMetric.step,
+                    SqlMetric.timestamp,
+                    SqlMetric.value,
+                    SqlMetric.is_nan,
+                ).where(SqlMetric.run_uuid.in_(run_ids_chunk))
+                if metric_keys is not None:
+                    stmt = stmt.where(SqlMetric.key.in_(set(metric_keys)))
+                if step_range is not None:
+                    stmt = stmt.where(SqlMetric.step.between(*step_range))
+                stmt = stmt.order_by(
+                    SqlMetric.run_uuid, SqlMetric.key, SqlMetric.step, SqlMetric.timestamp
+                )
+                # Fetch the rows in chunks as plain tuples, and transpose each chunk into the
+                # columns of a record batch
+                result = session.execute(stmt.execution_options(stream_results=True))
+                for rows in result.partitions(EXPORT_METRICS_BATCH_SIZE):
+                    run_uuid, key, step, timestamp, value, is_nan = zip(*rows)
+                    # NaN values are persisted as 0 along with an `is_nan` flag
+                    value = np.array(value, dtype=np.float64)
+                    value[np.array(is_nan, dtype=bool)] = np.nan
+                    yield make_metrics_record_batch(run_uuid, key, step, timestamp, value)
+
     def _search_datasets(self, experiment_ids):
         """
         Return all dataset summaries associated to the given experiments.
@@ -1268,27 +1536,49 @@ class SqlAlchemyStore(AbstractStore):
     def _search_runs(
         self, experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
     ):
-        def compute_next_token(current_size):
-            next_token = None
-            if max_results == current_size:
-                final_offset = offset + max_results
-                next_token = SearchUtils.create_page_token(final_offset)
-
-            return next_token
+        return self._search_runs_with_projection(
+            experiment_ids,
+            filter_string,
+            run_view_type,
+            max_results,
+            order_by,
+            page_token,
+            include_metrics=None,
+            include_params=None,
+            include_inputs=True,
+        )
 
+    def _search_runs_with_projection(
+        self,
+        experiment_ids,
+        filter_string,
+        run_view_type,
+        max_results,
+        order_by,
+        page_token,
+        include_metrics,
+        include_params,
+        include_inputs,
+    ):
         self._validate_max_results_param(max_results, allow_null=True)
 
         stages = set(LifecycleStage.view_type_to_stages(run_view_type))
 
         with self.ManagedSessionMaker() as session:
-            # Fetch the appropriate runs and eagerly load their summary metrics, params, and
-            # tags. These run attributes are referenced during the invocation of
-            # ``run.to_mlflow_entity()``, so eager loading helps avoid additional database queries
-            # that are otherwise executed at attribute access time under a lazy loading model.
+            # The search is performed in two phases: the IDs of the runs of the page are selected
+            # first, without loading any data of the runs. Then, the runs are loaded along with
+            # the requested data, using a single query per table.
             parsed_filters = SearchUtils.parse_search_filter(filter_string)
             cases_orderby, parsed_orderby, sorting_joins = _get_orderby_clauses(order_by, session)
-
-            stmt = select(SqlRun, *cases_orderby)
+            sort_keys = _get_sort_keys(cases_orderby, parsed_orderby)
+
+            # The sort key values are selected so that the last run of the page can be encoded
+            # into a keyset page token
+            stmt = select(
+                SqlRun.run_uuid,
+                *cases_orderby,
+                *(key.label(f"sort_key_{i}") for i, (key, _) in enumerate(sort_keys)),
+            )
             (
                 attribute_filters,
                 non_attribute_filters,
@@ -1308,10 +1598,28 @@ class SqlAlchemyStore(AbstractStore):
             for j in sorting_joins:
                 stmt = stmt.outerjoin(j)
 
-            offset = SearchUtils.parse_start_offset_from_page_token(page_token)
+            # Keyset page tokens resume the search after the last run of the previous page,
+            # which doesn't require scanning the preceding pages. Offset page tokens issued by
+            # previous versions of MLflow are still supported.
+            sort_key_values = SearchUtils.parse_sort_key_values_from_page_token(page_token)
+            if sort_key_values is None:
+                offset = SearchUtils.parse_start_offset_from_page_token(page_token)
+            else:
+                if len(sort_key_values) != len(sort_keys):
+                    raise MlflowException(
+                        "Invalid page token, it doesn't match the `order_by` of the search",
+                        error_code=INVALID_PARAMETER_VALUE,
+                    )
+                offset = 0
+                attribute_filters.append(
+                    _get_keyset_filter(
+                        sort_keys,
+                        sort_key_values,
+                        nulls_first=self.db_type != POSTGRES,
+                    )
+                )
             stmt = (
                 stmt.distinct()
-                .options(*self._get_eager_run_query_options())
                 .filter(
                     SqlRun.experiment_id.in_(experiment_ids),
                     SqlRun.lifecycle_stage.in_(stages),
@@ -1321,20 +1629,32 @@ class SqlAlchemyStore(AbstractStore):
                 .offset(offset)
                 .limit(max_results)
             )
-            queried_runs = session.execute(stmt).scalars(SqlRun).all()
+            queried_rows = session.execute(stmt).all()
+            run_ids = [row[0] for row in queried_rows]
 
-            runs = [run.to_mlflow_entity() for run in queried_runs]
-            run_ids = [run.info.run_id for run in runs]
+            query_options = self._get_eager_run_query_options(include_metrics, include_params)
+            sql_runs = (
+                session.query(SqlRun).options(*query_options).filter(SqlRun.run_uuid.in_(run_ids))
+            )
+            runs_by_id = {sql_run.run_uuid: sql_run.to_mlflow_entity() for sql_run in sql_runs}
+            runs = [runs_by_id[run_id] for run_id in run_ids]
 
             # add inputs to runs
-            inputs = self._get_run_inputs(run_uuids=run_ids, session=session)
+            if include_inputs:
+                inputs = self._get_run_inputs(run_uuids=run_ids, session=session)
+            else:
+                inputs = [[] for _ in run_ids]
             runs_with_inputs = []
             for i, run in enumerate(runs):
                 runs_with_inputs.append(
                     Run(run.info, run.data, RunInputs(dataset_inputs=inputs[i]))
                 )
 
-            next_page_token = compute_next_token(len(runs_with_inputs))
+            next_page_token = None
+            if max_results == len(queried_rows):
+                next_page_token = SearchUtils.create_keyset_page_token(
+                    list(queried_rows[-1][-len(sort_keys) :])
+                )
 
         return runs_with_inputs, next_page_token
 
@@ -1795,6 +2115,24 @@ class SqlAlchemyStore(AbstractStore):
             )
 
 
+def _is_strictly_newer_metric(new, old):
+    """
+    Builds a SQL expression that is true if the metric columns of ``new`` are strictly more recent
+    than those of ``old``, as determined by ``step``, ``timestamp``, and ``value``. This mirrors
+    the tuple comparison used when updating ``latest_metrics`` in Python.
+    """
+    return sqlalchemy.or_(
+        new.step > old.step,
+        and_(
+            new.step == old.step,
+            sqlalchemy.or_(
+                new.timestamp > old.timestamp,
+                and_(new.timestamp == old.timestamp, new.value > old.value),
+            ),
+        ),
+    )
+
+
 def _get_sqlalchemy_filter_clauses(parsed, session, dialect):
     """
     Creates run attribute filters and subqueries that will be inner-joined to SqlRun to act as
@@ -1967,6 +2305,55 @@ def _get_orderby_clauses(order_by_list, session):
     return select_clauses, clauses, ordering_joins
 
 
+def _get_sort_keys(select_clauses, orderby_clauses):
+    """
+    Returns the keys runs are sorted by as a list of ``(expression, ascending)`` tuples, given the
+    select and order by clauses returned by ``_get_orderby_clauses``.
+    """
+    # The CASE WHEN clauses are referenced by their labels in the order by clauses, but filters
+    # can't reference labels of the select list
+    labeled_clauses = {c.name: c.element for c in select_clauses if isinstance(c, Label)}
+    sort_keys = []
+    for clause in orderby_clauses:
+        if isinstance(clause, str):
+            sort_keys.append((labeled_clauses[clause], True))
+        elif isinstance(clause, UnaryExpression) and clause.modifier is operators.desc_op:
+            sort_keys.append((clause.element, False))
+        else:
+            sort_keys.append((clause, True))
+    return sort_keys
+
+
+def _get_keyset_filter(sort_keys, sort_key_values, nulls_first):
+    """
+    Builds a filter matching the rows that come after the row whose sort key values are
+    ``sort_key_values``, i.e. the row value comparison ``(k1, k2, ...) > (v1, v2, ...)``. The
+    comparison is expanded into ``k1 > v1 OR (k1 = v1 AND k2 > v2) OR ...`` to support sort keys
+    with mixed directions and NULL values.
+
+    Args:
+        sort_keys: The keys the rows are sorted by, as returned by ``_get_sort_keys``.
+        sort_key_values: The values of the sort keys for the last row of the previous page.
+        nulls_first: Whether NULL values come first in ascending order, which depends on the
+            database.
+    """
+    conditions = []
+    equalities = []
+    for (key, ascending), value in zip(sort_keys, sort_key_values):
+        if value is None:
+            after = key.is_not(None) if nulls_first == ascending else None
+            equal = key.is_(None)
+        else:
+            after = key > value if ascending else key < value
+            if nulls_first != ascending:
+                after = sqlalchemy.or_(after, key.is_(None))
+            equal = key == value
+        if after is not None:
+            conditions.append(and_(*equalities, after))
+        equalities.append(equal)
+    return sqlalchemy.or_(*conditions)
+
+
 def _get_search_experiments_filter_clauses(parsed_filters, dialect):
     attribute_filters = []
     non_attribute_filters = []
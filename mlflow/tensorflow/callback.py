@@ -231,3 +231,6 @@ class MlflowModelCheckpointCallback(Callback, MlflowModelCheckpointCallbackBase)
                 global_step=self.global_step,
                 metric_dict={k: float(v) for k, v in logs.items()},
             )
+
+    def on_train_end(self, logs=None):
+        self.flush()
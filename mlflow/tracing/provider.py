@@ -8,10 +8,6 @@ from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.util._once import Once
 
 from mlflow.tracing.constant import SpanAttributeKey
-from mlflow.utils.databricks_utils import (
-    is_in_databricks_model_serving_environment,
-    is_mlflow_tracing_enabled_in_model_serving,
-)
 
 # Once() object ensures a function is executed only once in a process.
 # Note that it doesn't work as expected in a distributed environment.
@@ -76,6 +72,12 @@ def _setup_tracer_provider(disabled=False):
     """
     Instantiate a tracer provider and set it as the global tracer provider.
     """
+    # Imported here to avoid a circular import through `mlflow.entities`, which imports this module
+    from mlflow.utils.databricks_utils import (
+        is_in_databricks_model_serving_environment,
+        is_mlflow_tracing_enabled_in_model_serving,
+    )
+
     if disabled:
         _force_set_otel_tracer_provider(trace.NoOpTracerProvider())
         return
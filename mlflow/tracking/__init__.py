@@ -5,6 +5,8 @@ and runs. This is a lower level API that directly translates to MLflow
 For a higher level API for managing an "active run", use the :py:mod:`mlflow` module.
 """
 
+from typing import TYPE_CHECKING
+
 from mlflow.tracking._model_registry.utils import (
     get_registry_uri,
     set_registry_uri,
@@ -16,7 +18,9 @@ from mlflow.tracking._tracking_service.utils import (
     is_tracking_uri_set,
     set_tracking_uri,
 )
-from mlflow.tracking.client import MlflowClient
+
+if TYPE_CHECKING:
+    from mlflow.tracking.client import MlflowClient
 
 __all__ = [
     "MlflowClient",
@@ -28,3 +32,13 @@ __all__ = [
     "set_registry_uri",
     "_get_artifact_repo",
 ]
+
+
+def __getattr__(name):
+    # `MlflowClient` is imported on first use, since artifact repositories import the utilities of
+    # this package and are in turn imported by `mlflow.tracking.client`
+    if name == "MlflowClient":
+        from mlflow.tracking.client import MlflowClient
+
+        return MlflowClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
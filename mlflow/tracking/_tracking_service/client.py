@@ -136,6 +136,43 @@ class TrackingServiceClient:
             token = paged_history.token
         return history
 
+    def export_metrics(self, run_ids, keys=None, step_range=None):
+        """Export the histories of metrics logged to several runs as a single table.
+
+        Args:
+            run_ids: Unique identifiers of the runs whose metrics to export.
+            keys: Names of the metrics to export. If ``None``, every metric logged to the runs is
+                exported.
+            step_range: Optional ``(min_step, max_step)`` tuple of the inclusive range of steps
+                to export.
+
+        Returns:
+            A ``pyarrow.Table`` with the ``run_id``, ``key``, ``step``, ``timestamp`` and
+            ``value`` columns, ordered by run ID, metric key, step and timestamp.
+        """
+        import pyarrow as pa
+
+        from mlflow.store.tracking.metrics_export import get_metrics_export_schema
+
+        run_ids = list(run_ids)
+        for run_id in run_ids:
+            _validate_run_id(run_id)
+        if step_range is not None:
+            if len(step_range) != 2 or step_range[0] > step_range[1]:
+                raise MlflowException(
+                    "step_range must be a (min_step, max_step) tuple with min_step <= max_step. "
+                    f"Got {step_range!r}.",
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+            step_range = (int(step_range[0]), int(step_range[1]))
+        schema = get_metrics_export_schema()
+        if not run_ids or (keys is not None and len(keys) == 0):
+            return schema.empty_table()
+        batches = self.store.export_metrics(
+            run_ids, metric_keys=None if keys is None else list(keys), step_range=step_range
+        )
+        return pa.Table.from_batches(batches, schema=schema)
+
     def create_run(self, experiment_id, start_time=None, tags=None, run_name=None):
         """Create a :py:class:`mlflow.entities.Run` object that can be associated with
         metrics, parameters, artifacts, etc.
@@ -913,6 +950,9 @@ class TrackingServiceClient:
         max_results=SEARCH_MAX_RESULTS_DEFAULT,
         order_by=None,
         page_token=None,
+        include_metrics=None,
+        include_params=None,
+        include_inputs=True,
     ):
         """Search experiments that fit the search criteria.
 
@@ -927,6 +967,11 @@ class TrackingServiceClient:
                 The default ordering is to sort by ``start_time DESC``, then ``run_id``.
             page_token: Token specifying the next page of results. It should be obtained from
                 a ``search_runs`` call.
+            include_metrics: If specified, only the latest metrics with these keys are returned
+                with each run.
+            include_params: If specified, only the params with these keys are returned with each
+                run.
+            include_inputs: Whether to return the dataset inputs of the runs.
 
         Returns:
             A :py:class:`PagedList <mlflow.store.entities.PagedList>` of
@@ -937,6 +982,15 @@ class TrackingServiceClient:
         """
         if isinstance(experiment_ids, int) or is_string_type(experiment_ids):
             experiment_ids = [experiment_ids]
+        # Only pass the projection to the store if one is requested, since stores implemented by
+        # plugins may not support it
+        projection = {}
+        if include_metrics is not None:
+            projection["include_metrics"] = include_metrics
+        if include_params is not None:
+            projection["include_params"] = include_params
+        if not include_inputs:
+            projection["include_inputs"] = include_inputs
         return self.store.search_runs(
             experiment_ids=experiment_ids,
             filter_string=filter_string,
@@ -944,4 +998,5 @@ class TrackingServiceClient:
             max_results=max_results,
             order_by=order_by,
             page_token=page_token,
+            **projection,
         )
@@ -14,7 +14,7 @@ import tempfile
 import urllib
 import uuid
 import warnings
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import yaml
 
@@ -99,6 +99,7 @@ if TYPE_CHECKING:
     import pandas
     import PIL
     import plotly
+    import pyarrow
 
 
 _logger = logging.getLogger(__name__)
@@ -336,6 +337,62 @@ class MlflowClient:
         """
         return self._tracking_client.get_metric_history(run_id, key)
 
+    def export_metrics(
+        self,
+        run_ids: List[str],
+        keys: Optional[List[str]] = None,
+        step_range: Optional[Tuple[int, int]] = None,
+        output_format: str = "pyarrow",
+    ) -> Union["pyarrow.Table", "pandas.DataFrame"]:
+        """Export the full histories of metrics logged to several runs as a single table.
+
+        Unlike :py:meth:`get_metric_history`, which returns a
+        :py:class:`mlflow.entities.Metric` per logged value, metric values are read by the tracking
+        store in bulk and, for remote tracking servers, transferred as an Arrow IPC stream. This
+        makes it possible to export histories of millions of values.
+
+        Args:
+            run_ids: Unique identifiers of the runs whose metrics to export.
+            keys: Names of the metrics to export. If ``None``, every metric logged to the runs is
+                exported.
+            step_range: Optional ``(min_step, max_step)`` tuple. If specified, only the values
+                logged at steps within this inclusive range are exported.
+            output_format: The type of the returned table, either ``"pyarrow"`` for a
+                ``pyarrow.Table`` or ``"pandas"`` for a ``pandas.DataFrame``.
+
+        Returns:
+            A table with the ``run_id``, ``key``, ``step``, ``timestamp`` and ``value`` columns,
+            ordered by run ID, metric key, step and timestamp.
+
+        .. code-block:: python
+            :caption: Example
+
+            from mlflow import MlflowClient
+
+            client = MlflowClient()
+            run = client.create_run(experiment_id="0")
+            for step in range(3):
+                client.log_metric(run.info.run_id, "loss", 1 / (step + 1), step=step)
+            client.set_terminated(run.info.run_id)
+
+            df = client.export_metrics([run.info.run_id], keys=["loss"], output_format="pandas")
+            print(df[["key", "step", "value"]])
+
+        .. code-block:: text
+            :caption: Output
+
+                key  step     value
+            0  loss     0  1.000000
+            1  loss     1  0.500000
+            2  loss     2  0.333333
+        """
+        if output_format not in ("pyarrow", "pandas"):
+            raise MlflowException.invalid_parameter_value(
+                f"Invalid output_format {output_format!r}. Must be one of 'pyarrow' or 'pandas'."
+            )
+        table = self._tracking_client.export_metrics(run_ids, keys, step_range)
+        return table.to_pandas() if output_format == "pandas" else table
+
     def create_run(
         self,
         experiment_id: str,
@@ -2954,6 +3011,9 @@ class MlflowClient:
         max_results: int = SEARCH_MAX_RESULTS_DEFAULT,
         order_by: Optional[List[str]] = None,
         page_token: Optional[str] = None,
+        include_metrics: Optional[List[str]] = None,
+        include_params: Optional[List[str]] = None,
+        include_inputs: bool = True,
     ) -> PagedList[Run]:
         """
         Search for Runs that fit the specified criteria.
@@ -2969,6 +3029,14 @@ class MlflowClient:
                 The default ordering is to sort by ``start_time DESC``, then ``run_id``.
             page_token: Token specifying the next page of results. It should be obtained from
                 a ``search_runs`` call.
+            include_metrics: If specified, only the latest metrics with these keys are returned
+                with each run, e.g. ``["loss"]``. By default, all the latest metrics of the runs
+                are returned.
+            include_params: If specified, only the params with these keys are returned with each
+                run. Pass an empty list to exclude all the params, which avoids loading and
+                transferring the params of runs with many params. By default, all the params of
+                the runs are returned.
+            include_inputs: Whether to return the dataset inputs of the runs.
 
         Returns:
             A :py:class:`PagedList <mlflow.store.entities.PagedList>` of
@@ -3036,7 +3104,15 @@ class MlflowClient:
             tags: {'s.release': '1.1.0-RC'}
         """
         return self._tracking_client.search_runs(
-            experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
+            experiment_ids,
+            filter_string,
+            run_view_type,
+            max_results,
+            order_by,
+            page_token,
+            include_metrics=include_metrics,
+            include_params=include_params,
+            include_inputs=include_inputs,
         )
 
     # Registry API
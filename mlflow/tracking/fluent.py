@@ -12,7 +12,6 @@ from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 import mlflow
-from mlflow.data.dataset import Dataset
 from mlflow.entities import (
     DatasetInput,
     Experiment,
@@ -73,6 +72,8 @@ if TYPE_CHECKING:
     import PIL
     import plotly
 
+    from mlflow.data.dataset import Dataset
+
 
 _active_run_stack = []
 run_id_to_system_metrics_monitor = {}
@@ -924,7 +925,7 @@ def log_params(
 
 
 def log_input(
-    dataset: Dataset, context: Optional[str] = None, tags: Optional[Dict[str, str]] = None
+    dataset: "Dataset", context: Optional[str] = None, tags: Optional[Dict[str, str]] = None
 ) -> None:
     """
     Log a dataset used in the current run.
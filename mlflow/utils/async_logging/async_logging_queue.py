@@ -7,19 +7,27 @@ import atexit
 import enum
 import logging
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
 from queue import Empty, Queue
-from typing import List
+from typing import Any, Dict, List
 
 from mlflow.entities.metric import Metric
 from mlflow.entities.param import Param
 from mlflow.entities.run_tag import RunTag
 from mlflow.environment_variables import (
     MLFLOW_ASYNC_LOGGING_BUFFERING_SECONDS,
+    MLFLOW_ASYNC_LOGGING_MAX_IN_FLIGHT_RECORDS,
+    MLFLOW_ASYNC_LOGGING_OVERFLOW_POLICY,
     MLFLOW_ASYNC_LOGGING_THREADPOOL_SIZE,
 )
 from mlflow.utils.async_logging.run_batch import RunBatch
 from mlflow.utils.async_logging.run_operations import RunOperations
+from mlflow.utils.validation import (
+    MAX_ENTITIES_PER_BATCH,
+    MAX_METRICS_PER_BATCH,
+    MAX_PARAMS_TAGS_PER_BATCH,
+)
 
 _logger = logging.getLogger(__name__)
 
@@ -39,6 +47,15 @@ class QueueStatus(enum.Enum):
     IDLE = 3
 
 
+class OverflowPolicy(str, enum.Enum):
+    """Handling of the logged data when the maximum number of in-flight records is reached"""
+
+    # Wait until enough in-flight records are logged.
+    BLOCK = "block"
+    # Discard the logged data.
+    DROP = "drop"
+
+
 class AsyncLoggingQueue:
     """
     This is a queue based run data processor that queues incoming batches and processes them using
@@ -59,6 +76,88 @@ class AsyncLoggingQueue:
 
         self._stop_data_logging_thread_event = threading.Event()
         self._status = QueueStatus.IDLE
+        self._set_up_flow_control()
+
+    def _set_up_flow_control(self) -> None:
+        # Number of records (metrics, params and tags) that are queued or being logged. The
+        # condition is notified whenever it decreases, and also guards the counters below.
+        self._in_flight_records = 0
+        self._in_flight_condition = threading.Condition()
+        self._logged_batches = 0
+        self._failed_batches = 0
+        self._dropped_batches = 0
+        self._total_latency_seconds = 0.0
+        self._max_latency_seconds = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Returns counters describing the state of the queue.
+
+        Returns:
+            A dictionary containing:
+
+            - ``queue_depth``: The number of batches waiting to be logged.
+            - ``in_flight_records``: The number of metrics, params and tags queued or being logged.
+            - ``logged_batches``: The number of batches successfully logged.
+            - ``failed_batches``: The number of batches that failed to be logged.
+            - ``dropped_batches``: The number of batches discarded because the maximum number of
+              in-flight records was reached.
+            - ``mean_latency_seconds`` and ``max_latency_seconds``: The time elapsed between the
+              queueing of the logged and failed batches and the end of their logging.
+        """
+        with self._in_flight_condition:
+            completed_batches = self._logged_batches + self._failed_batches
+            return {
+                "queue_depth": self._queue.qsize(),
+                "in_flight_records": self._in_flight_records,
+                "logged_batches": self._logged_batches,
+                "failed_batches": self._failed_batches,
+                "dropped_batches": self._dropped_batches,
+                "mean_latency_seconds": (
+                    self._total_latency_seconds / completed_batches if completed_batches else 0.0
+                ),
+                "max_latency_seconds": self._max_latency_seconds,
+            }
+
+    def _acquire_in_flight_records(self, num_records: int) -> bool:
+        """Reserves room for ``num_records`` in-flight records.
+
+        Returns:
+            True if the records can be queued, False if they must be dropped.
+        """
+        max_records = MLFLOW_ASYNC_LOGGING_MAX_IN_FLIGHT_RECORDS.get()
+        with self._in_flight_condition:
+            if max_records is not None:
+
+                def has_room():
+                    # Batches larger than the limit are accepted once the queue is drained
+                    return (
+                        self._in_flight_records == 0
+                        or self._in_flight_records + num_records <= max_records
+                    )
+
+                if not has_room():
+                    if _get_overflow_policy() == OverflowPolicy.DROP:
+                        self._dropped_batches += 1
+                        return False
+                    self._in_flight_condition.wait_for(has_room)
+            self._in_flight_records += num_records
+            return True
+
+    def _release_in_flight_records(self, run_batch: RunBatch, succeeded: bool) -> None:
+        """Releases the in-flight records of a logged batch, including its child batches."""
+        now = time.monotonic()
+        batches = [run_batch, *run_batch.child_batches]
+        with self._in_flight_condition:
+            self._in_flight_records -= run_batch.num_records
+            if succeeded:
+                self._logged_batches += len(batches)
+            else:
+                self._failed_batches += len(batches)
+            for batch in batches:
+                latency = now - batch.creation_time
+                self._total_latency_seconds += latency
+                self._max_latency_seconds = max(self._max_latency_seconds, latency)
+            self._in_flight_condition.notify_all()
 
     def _at_exit_callback(self) -> None:
         """Callback function to be executed when the program is exiting.
@@ -117,37 +216,43 @@ class AsyncLoggingQueue:
             raise MlflowException(f"Exception inside the run data logging thread: {e}")
 
     def _fetch_batch_from_queue(self) -> List[RunBatch]:
-        """Fetches a batch of run data from the queue.
+        """Fetches the queued run data, merging the batches of each run.
+
+        Batches of the same run are merged even if batches of other runs were queued in between,
+        as long as the merged batch doesn't exceed the limits of ``log_batch``.
 
         Returns:
-            RunBatch: A batch of run data.
+            List[RunBatch]: The merged batches of run data.
         """
         batches = []
         if self._queue.empty():
             return batches
         queue_size = self._queue.qsize()  # Estimate the queue's size.
-        merged_batch = self._queue.get()
-        for i in range(queue_size - 1):
+        merged_batches = {}
+        for _ in range(queue_size):
             if self._queue.empty():
                 # `queue_size` is an estimate, so we need to check if the queue is empty.
                 break
             batch = self._queue.get()
-            if (
-                merged_batch.run_id != batch.run_id
-                or len(merged_batch.metrics) + len(batch.metrics) >= 1000
-                or len(merged_batch.params) + len(batch.params) >= 100
-                or len(merged_batch.tags) + len(batch.tags) >= 100
+            merged_batch = merged_batches.get(batch.run_id)
+            if merged_batch is None:
+                merged_batches[batch.run_id] = batch
+            elif (
+                len(merged_batch.metrics) + len(batch.metrics) > MAX_METRICS_PER_BATCH
+                or len(merged_batch.params) + len(batch.params) > MAX_PARAMS_TAGS_PER_BATCH
+                or len(merged_batch.tags) + len(batch.tags) > MAX_PARAMS_TAGS_PER_BATCH
+                or merged_batch.num_records + batch.num_records > MAX_ENTITIES_PER_BATCH
             ):
-                # Make a new batch if the run_id is different or the batch is full.
+                # Make a new batch for the run if the merged batch is full.
                 batches.append(merged_batch)
-                merged_batch = batch
+                merged_batches[batch.run_id] = batch
             else:
                 merged_batch.add_child_batch(batch)
                 merged_batch.params.extend(batch.params)
                 merged_batch.tags.extend(batch.tags)
                 merged_batch.metrics.extend(batch.metrics)
 
-        batches.append(merged_batch)
+        batches.extend(merged_batches.values())
         return batches
 
     def _log_run_data(self) -> None:
@@ -182,6 +287,7 @@ class AsyncLoggingQueue:
                     tags=run_batch.tags,
                 )
 
+                self._release_in_flight_records(run_batch, succeeded=True)
                 # Signal the batch processing is done.
                 run_batch.completion_event.set()
                 for child_batch in run_batch.child_batches:
@@ -190,10 +296,12 @@ class AsyncLoggingQueue:
 
             except Exception as e:
                 _logger.error(f"Run Id {run_batch.run_id}: Failed to log run data: Exception: {e}")
+                self._release_in_flight_records(run_batch, succeeded=False)
                 run_batch.exception = e
                 run_batch.completion_event.set()
                 for child_batch in run_batch.child_batches:
                     # Signal the child batch processing is done.
+                    child_batch.exception = e
                     child_batch.completion_event.set()
 
         for run_batch in run_batches:
@@ -225,6 +333,7 @@ class AsyncLoggingQueue:
         del state["_queue"]
         del state["_lock"]
         del state["_status"]
+        del state["_in_flight_condition"]
 
         if "_run_data_logging_thread" in state:
             del state["_run_data_logging_thread"]
@@ -258,6 +367,7 @@ class AsyncLoggingQueue:
         self._batch_logging_worker_threadpool = None
         self._batch_status_check_threadpool = None
         self._stop_data_logging_thread_event = threading.Event()
+        self._set_up_flow_control()
 
     def log_batch_async(
         self, run_id: str, params: [Param], tags: [RunTag], metrics: [Metric]
@@ -288,7 +398,17 @@ class AsyncLoggingQueue:
             metrics=metrics,
             completion_event=threading.Event(),
         )
-        self._queue.put(batch)
+        if self._acquire_in_flight_records(batch.num_records):
+            self._queue.put(batch)
+        else:
+            message = (
+                f"Run Id {run_id}: Dropped {batch.num_records} records, since the maximum number "
+                f"of in-flight records ({MLFLOW_ASYNC_LOGGING_MAX_IN_FLIGHT_RECORDS.get()}) "
+                "of the async logging queue is reached."
+            )
+            _logger.warning(message)
+            batch.exception = MlflowException(message)
+            batch.completion_event.set()
         operation_future = self._batch_status_check_threadpool.submit(self._wait_for_batch, batch)
         return RunOperations(operation_futures=[operation_future])
 
@@ -339,3 +459,16 @@ class AsyncLoggingQueue:
             atexit.register(self._at_exit_callback)
 
             self._status = QueueStatus.ACTIVE
+
+
+def _get_overflow_policy() -> OverflowPolicy:
+    from mlflow.exceptions import MlflowException
+
+    policy = MLFLOW_ASYNC_LOGGING_OVERFLOW_POLICY.get()
+    try:
+        return OverflowPolicy(policy.lower())
+    except ValueError:
+        raise MlflowException.invalid_parameter_value(
+            f"Invalid value {policy!r} for {MLFLOW_ASYNC_LOGGING_OVERFLOW_POLICY.name}. "
+            f"Expected one of {[p.value for p in OverflowPolicy]}."
+        )
@@ -1,4 +1,5 @@
 import threading
+import time
 from typing import List, Optional
 
 from mlflow.entities.metric import Metric
@@ -25,12 +26,19 @@ class RunBatch:
             completion_event: A threading.Event object. Default is None.
         """
         self.run_id = run_id
-        self.params = params or []
-        self.tags = tags or []
-        self.metrics = metrics or []
+        # Copy the lists since they are extended when merging child batches
+        self.params = list(params or [])
+        self.tags = list(tags or [])
+        self.metrics = list(metrics or [])
         self.completion_event = completion_event
         self._exception = None
         self.child_batches = []
+        self.creation_time = time.monotonic()
+
+    @property
+    def num_records(self):
+        """Total number of metrics, params and tags in the batch, including merged child batches."""
+        return len(self.params) + len(self.tags) + len(self.metrics)
 
     @property
     def exception(self):
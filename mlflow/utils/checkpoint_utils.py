@@ -1,13 +1,24 @@
+import atexit
+import json
 import logging
 import os
 import posixpath
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
 
 import mlflow
+from mlflow.environment_variables import (
+    MLFLOW_CHECKPOINT_ASYNC_UPLOAD,
+    MLFLOW_CHECKPOINT_MAX_PENDING_UPLOADS,
+    MLFLOW_CHECKPOINT_UPLOAD_MAX_WORKERS,
+)
 from mlflow.exceptions import MlflowException
 from mlflow.utils.autologging_utils import (
     ExceptionSafeAbstractClass,
 )
-from mlflow.utils.file_utils import TempDir
 from mlflow.utils.mlflow_tags import LATEST_CHECKPOINT_ARTIFACT_TAG_KEY
 
 _logger = logging.getLogger(__name__)
@@ -22,6 +33,196 @@ _CHECKPOINT_GLOBAL_STEP_PREFIX = "global_step_"
 _WEIGHT_ONLY_CHECKPOINT_SUFFIX = ".weights"
 
 
+class _Checkpoint:
+    """
+    A checkpoint saved to the local directory ``local_dir``, to be uploaded to the
+    ``artifact_dir`` artifact directory of the run ``run_id``.
+    """
+
+    def __init__(self, run_id, local_dir, artifact_dir, artifact_path, sequence_number):
+        self.run_id = run_id
+        self.local_dir = local_dir
+        self.artifact_dir = artifact_dir
+        # The artifact path of the checkpoint model file, recorded in the latest checkpoint tag
+        self.artifact_path = artifact_path
+        self.sequence_number = sequence_number
+
+
+def _upload_checkpoint(client, checkpoint):
+    client.log_artifacts(checkpoint.run_id, checkpoint.local_dir, checkpoint.artifact_dir)
+    client.set_tag(checkpoint.run_id, LATEST_CHECKPOINT_ARTIFACT_TAG_KEY, checkpoint.artifact_path)
+
+
+class AsyncCheckpointUploader:
+    """
+    Uploads checkpoints saved to the local disk in background threads, so that training doesn't
+    wait for the uploads of checkpoints.
+
+    Args:
+        tracking_uri: The tracking URI of the runs of the checkpoints.
+        max_workers: The maximum number of checkpoints uploaded concurrently.
+        max_pending: The maximum number of checkpoints waiting to be uploaded. :py:meth:`submit`
+            blocks until an upload starts when this number is reached, which bounds the disk space
+            used by pending checkpoints. A pending checkpoint is replaced, without being uploaded,
+            by a newer checkpoint to the same artifact directory. Checkpoints to the same artifact
+            directory are uploaded one at a time, so that older checkpoint files never overwrite
+            newer ones.
+    """
+
+    def __init__(self, tracking_uri, max_workers, max_pending):
+        self.tracking_uri = tracking_uri
+        self.max_workers = max(max_workers, 1)
+        self.max_pending = max(max_pending, 1)
+        self._init_state()
+
+    def _init_state(self):
+        self._condition = threading.Condition()
+        # Checkpoints waiting to be uploaded, keyed by run ID and artifact directory
+        self._pending = OrderedDict()
+        self._uploading_keys = set()
+        self._num_uploading = 0
+        self._workers = []
+        self._failures = []
+        self._latest_sequence_number = -1
+        # Guards the latest checkpoint tag, which is set without holding the condition lock
+        self._tag_lock = threading.Lock()
+        self._tagged_sequence_number = -1
+        self._at_exit_registered = False
+
+    def __getstate__(self):
+        # Callbacks are pickled to the workers of distributed trainings, which upload their own
+        # checkpoints
+        return {
+            "tracking_uri": self.tracking_uri,
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+        }
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_state()
+
+    @property
+    def num_pending(self):
+        """The number of checkpoints which haven't been uploaded yet."""
+        with self._condition:
+            return len(self._pending) + self._num_uploading
+
+    def submit(self, run_id, local_dir, artifact_dir, artifact_path):
+        """
+        Schedule the upload of the checkpoint files in ``local_dir`` to the ``artifact_dir``
+        artifact directory of the run ``run_id``. ``local_dir`` is owned by the uploader, which
+        removes it once the checkpoint is uploaded or replaced.
+
+        Args:
+            run_id: The ID of the run of the checkpoint.
+            local_dir: The local directory containing the checkpoint files.
+            artifact_dir: The artifact directory to upload the checkpoint files to.
+            artifact_path: The artifact path of the checkpoint model file, which is recorded in
+                the latest checkpoint tag of the run once the checkpoint is uploaded.
+        """
+        key = (run_id, artifact_dir)
+        with self._condition:
+            self._latest_sequence_number += 1
+            checkpoint = _Checkpoint(
+                run_id, local_dir, artifact_dir, artifact_path, self._latest_sequence_number
+            )
+            if replaced := self._pending.pop(key, None):
+                _logger.debug("Replacing pending checkpoint upload to %s", artifact_dir)
+                shutil.rmtree(replaced.local_dir, ignore_errors=True)
+            while len(self._pending) >= self.max_pending:
+                self._condition.wait()
+            self._pending[key] = checkpoint
+            self._condition.notify_all()
+            self._start_workers()
+
+    def _start_workers(self):
+        if not self._at_exit_registered:
+            atexit.register(self._at_exit_callback)
+            self._at_exit_registered = True
+        self._workers = [w for w in self._workers if w.is_alive()]
+        for _ in range(min(len(self._pending), self.max_workers - len(self._workers))):
+            worker = threading.Thread(
+                target=self._upload_loop, name="MLflowCheckpointUploader", daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def _upload_loop(self):
+        from mlflow.tracking import MlflowClient
+
+        client = MlflowClient(self.tracking_uri)
+        while True:
+            with self._condition:
+                # Checkpoints to artifact directories being uploaded to wait for these uploads,
+                # which pick them up once they complete
+                key = next((k for k in self._pending if k not in self._uploading_keys), None)
+                if key is None:
+                    # Workers exit when they are idle and are started again by `submit`
+                    self._workers.remove(threading.current_thread())
+                    return
+                checkpoint = self._pending.pop(key)
+                self._uploading_keys.add(key)
+                self._num_uploading += 1
+                self._condition.notify_all()
+
+            try:
+                self._upload(client, checkpoint)
+            finally:
+                shutil.rmtree(checkpoint.local_dir, ignore_errors=True)
+                with self._condition:
+                    self._uploading_keys.discard(key)
+                    self._num_uploading -= 1
+                    self._condition.notify_all()
+
+    def _upload(self, client, checkpoint):
+        start_time = time.time()
+        try:
+            client.log_artifacts(checkpoint.run_id, checkpoint.local_dir, checkpoint.artifact_dir)
+            # Concurrent uploads may complete out of order, the latest checkpoint tag only moves
+            # forward. Tags are set one at a time, so that a tag can't be overwritten by the one of
+            # an older checkpoint checked before it
+            with self._tag_lock:
+                if checkpoint.sequence_number < self._tagged_sequence_number:
+                    return
+                client.set_tag(
+                    checkpoint.run_id, LATEST_CHECKPOINT_ARTIFACT_TAG_KEY, checkpoint.artifact_path
+                )
+                self._tagged_sequence_number = checkpoint.sequence_number
+        except Exception as e:
+            _logger.warning("Failed to upload checkpoint to %s: %s", checkpoint.artifact_dir, e)
+            with self._condition:
+                self._failures.append((checkpoint.artifact_dir, e))
+        else:
+            _logger.info(
+                "Uploaded checkpoint to %s in %.1f seconds, %d checkpoint uploads pending",
+                checkpoint.artifact_dir,
+                time.time() - start_time,
+                self.num_pending - 1,
+            )
+
+    def flush(self):
+        """
+        Wait for the uploads of the submitted checkpoints to complete.
+
+        Raises:
+            MlflowException: If checkpoints failed to be uploaded since the last flush.
+        """
+        with self._condition:
+            while self._pending or self._num_uploading:
+                self._condition.wait()
+            failures, self._failures = self._failures, []
+        if failures:
+            details = ", ".join(f"{artifact_dir} ({e})" for artifact_dir, e in failures)
+            raise MlflowException(f"Failed to upload {len(failures)} checkpoint(s): {details}")
+
+    def _at_exit_callback(self):
+        try:
+            self.flush()
+        except Exception as e:
+            _logger.error("Encountered error while uploading checkpoints: %s", e)
+
+
 class MlflowModelCheckpointCallbackBase(metaclass=ExceptionSafeAbstractClass):
     """Callback base class for automatic model checkpointing to MLflow.
 
@@ -48,6 +249,9 @@ class MlflowModelCheckpointCallbackBase(metaclass=ExceptionSafeAbstractClass):
             aligned to epochs, the monitored metric may potentially be less reliable (it
             could reflect as little as 1 batch, since the metrics get reset
             every epoch). Defaults to `"epoch"`.
+
+    Checkpoints are uploaded in background threads unless ``MLFLOW_CHECKPOINT_ASYNC_UPLOAD`` is
+    disabled, and subclasses must call `flush` at the end of training to wait for their uploads.
     """
 
     def __init__(
@@ -68,6 +272,15 @@ class MlflowModelCheckpointCallbackBase(metaclass=ExceptionSafeAbstractClass):
         self.last_monitor_value = None
 
         self.mlflow_tracking_uri = mlflow.get_tracking_uri()
+        self.checkpoint_uploader = (
+            AsyncCheckpointUploader(
+                self.mlflow_tracking_uri,
+                max_workers=MLFLOW_CHECKPOINT_UPLOAD_MAX_WORKERS.get(),
+                max_pending=MLFLOW_CHECKPOINT_MAX_PENDING_UPLOADS.get(),
+            )
+            if MLFLOW_CHECKPOINT_ASYNC_UPLOAD.get()
+            else None
+        )
 
         if self.save_best_only:
             if self.monitor is None:
@@ -94,6 +307,13 @@ class MlflowModelCheckpointCallbackBase(metaclass=ExceptionSafeAbstractClass):
     def save_checkpoint(self, filepath: str):
         raise NotImplementedError()
 
+    def flush(self):
+        """
+        Wait for the uploads of the checkpoints saved so far to complete.
+        """
+        if self.checkpoint_uploader is not None:
+            self.checkpoint_uploader.flush()
+
     def check_and_save_checkpoint_if_needed(self, current_epoch, global_step, metric_dict):
         # For distributed model training, trainer workers need to use the driver process
         # mlflow_tracking_uri.
@@ -150,20 +370,31 @@ class MlflowModelCheckpointCallbackBase(metaclass=ExceptionSafeAbstractClass):
             checkpoint_metrics_filename = _CHECKPOINT_METRIC_FILENAME
             checkpoint_artifact_dir = f"{_CHECKPOINT_DIR}/{sub_dir_name}"
 
-        mlflow.set_tag(
-            LATEST_CHECKPOINT_ARTIFACT_TAG_KEY,
-            f"{checkpoint_artifact_dir}/{checkpoint_model_filename}",
-        )
-
-        mlflow.log_dict(
-            {**metric_dict, "epoch": current_epoch, "global_step": global_step},
-            f"{checkpoint_artifact_dir}/{checkpoint_metrics_filename}",
-        )
-
-        with TempDir() as tmp_dir:
-            tmp_model_save_path = os.path.join(tmp_dir.path(), checkpoint_model_filename)
-            self.save_checkpoint(tmp_model_save_path)
-            mlflow.log_artifact(tmp_model_save_path, checkpoint_artifact_dir)
+        run_id = mlflow.tracking.fluent._get_or_start_run().info.run_id
+        local_dir = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(local_dir, checkpoint_metrics_filename), "w") as f:
+                json.dump(
+                    {**metric_dict, "epoch": current_epoch, "global_step": global_step}, f, indent=2
+                )
+            self.save_checkpoint(os.path.join(local_dir, checkpoint_model_filename))
+            checkpoint_artifact_path = f"{checkpoint_artifact_dir}/{checkpoint_model_filename}"
+            if self.checkpoint_uploader is not None:
+                self.checkpoint_uploader.submit(
+                    run_id, local_dir, checkpoint_artifact_dir, checkpoint_artifact_path
+                )
+                # The uploader removes the directory once the checkpoint is uploaded
+                local_dir = None
+            else:
+                _upload_checkpoint(
+                    mlflow.MlflowClient(self.mlflow_tracking_uri),
+                    _Checkpoint(
+                        run_id, local_dir, checkpoint_artifact_dir, checkpoint_artifact_path, 0
+                    ),
+                )
+        finally:
+            if local_dir is not None:
+                shutil.rmtree(local_dir, ignore_errors=True)
 
 
 def download_checkpoint_artifact(run_id=None, epoch=None, global_step=None, dst_path=None):
@@ -202,6 +202,39 @@ ENABLE_MLSERVER = click.option(
     ),
 )
 
+ENABLE_BATCHING = click.option(
+    "--enable-batching",
+    is_flag=True,
+    envvar="MLFLOW_SCORING_SERVER_ENABLE_BATCHING",
+    default=False,
+    help=(
+        "Group concurrent requests into batches scored with a single call to the model's"
+        " `predict` method. Each worker then serves requests from `--max-batch-size` threads."
+        " Batching metrics are exposed on the `/metrics` endpoint."
+    ),
+)
+
+MAX_BATCH_SIZE = click.option(
+    "--max-batch-size",
+    type=click.IntRange(min=1),
+    envvar="MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE",
+    default=64,
+    show_default=True,
+    help="Maximum number of rows of the batches scored when batching is enabled.",
+)
+
+MAX_BATCH_DELAY_MS = click.option(
+    "--max-batch-delay-ms",
+    type=click.FloatRange(min=0),
+    envvar="MLFLOW_SCORING_SERVER_MAX_BATCH_DELAY_MS",
+    default=5,
+    show_default=True,
+    help=(
+        "Maximum time in milliseconds to wait for concurrent requests to fill a batch when"
+        " batching is enabled."
+    ),
+)
+
 ARTIFACTS_DESTINATION = click.option(
     "--artifacts-destination",
     envvar="MLFLOW_ARTIFACTS_DESTINATION",
@@ -0,0 +1,175 @@
+"""
+A cache of packed virtualenv environments, shared by the processes and machines that restore
+model environments.
+
+When ``MLFLOW_ENV_CACHE_DIR`` is set, virtualenv environments created to restore the environment
+of a model are packed into ``<env name>-<platform>.tar.gz`` archives in that directory. The names of
+environments are digests of their Python version and requirements, so other processes, e.g.
+Spark executors or later ``mlflow models serve`` invocations, restoring an environment with the
+same requirements unpack the archive instead of installing the requirements again.
+
+Virtualenv environments contain their absolute path, e.g. in the shebangs of their scripts, and
+links to the Python interpreter they were created with. Links to the interpreter are left out of
+archives, and the absolute path of the packed environment is replaced with the path of the
+unpacked environment in its scripts.
+"""
+import json
+import logging
+import os
+import platform
+import sys
+import tarfile
+import time
+import uuid
+from pathlib import Path
+
+_logger = logging.getLogger(__name__)
+
+_ARCHIVE_SUFFIX = ".tar.gz"
+# Archive member recording the path of the packed environment
+_METADATA_FILE_NAME = ".mlflow-env-cache.json"
+# Temporary archives of crashed processes are removed by `gc_env_cache` after this duration
+_STALE_TMP_FILE_SECONDS = 24 * 60 * 60
+
+
+def get_env_archive_path(env_cache_dir, env_name):
+    """
+    Returns:
+        The path of the archive of the environment named ``env_name`` in ``env_cache_dir``.
+        Environments contain compiled extensions, so archives are specific to the platform they
+        were created on.
+    """
+    platform_tag = f"{sys.platform}-{platform.machine()}".lower()
+    return Path(env_cache_dir, f"{env_name}-{platform_tag}{_ARCHIVE_SUFFIX}")
+
+
+def _is_interpreter_link(path):
+    # Links to the interpreter are absolute, while the other links of environments, e.g.
+    # `bin/python3 -> python`, are relative
+    return path.is_symlink() and os.path.isabs(os.readlink(path))
+
+
+def pack_env(env_dir, archive_path):
+    """
+    Pack the environment at ``env_dir`` into the archive at ``archive_path``. The archive is
+    written to a temporary file first and atomically renamed, so that concurrent processes never
+    unpack a partially written archive.
+    """
+    env_dir = Path(env_dir)
+    archive_path = Path(archive_path)
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = archive_path.with_name(f".{archive_path.name}.{uuid.uuid4().hex}.tmp")
+    metadata_path = env_dir / _METADATA_FILE_NAME
+    try:
+        metadata_path.write_text(json.dumps({"prefix": str(env_dir)}))
+        # Environments are mostly made of compressed wheels content, so favor speed over size
+        with tarfile.open(tmp_path, "w:gz", compresslevel=1) as tar:
+            for path in sorted(env_dir.rglob("*")):
+                if _is_interpreter_link(path):
+                    continue
+                tar.add(path, arcname=path.relative_to(env_dir).as_posix(), recursive=False)
+        os.replace(tmp_path, archive_path)
+    finally:
+        metadata_path.unlink(missing_ok=True)
+        tmp_path.unlink(missing_ok=True)
+
+
+def _replace_prefix(env_dir, old_prefix, new_prefix):
+    """
+    Replace the absolute path of the packed environment with the path of the unpacked one in the
+    scripts of the environment, e.g. in the shebangs of console scripts.
+    """
+    old_prefix = old_prefix.encode()
+    new_prefix = new_prefix.encode()
+    for path in env_dir.joinpath("bin").iterdir():
+        if path.is_symlink() or not path.is_file():
+            continue
+        content = path.read_bytes()
+        # Only rewrite text files, compiled executables can't change length
+        if old_prefix not in content or b"\0" in content:
+            continue
+        mode = path.stat().st_mode
+        path.write_bytes(content.replace(old_prefix, new_prefix))
+        path.chmod(mode)
+
+
+def unpack_env(archive_path, env_dir):
+    """
+    Unpack the environment archive at ``archive_path`` into ``env_dir``. The links of the
+    environment to its Python interpreter need to be recreated afterwards, e.g. by running
+    ``virtualenv --no-seed`` on ``env_dir``.
+    """
+    env_dir = Path(env_dir)
+    env_dir.mkdir(parents=True)
+    with tarfile.open(archive_path, "r:gz") as tar:
+        if hasattr(tarfile, "data_filter"):
+            tar.extractall(env_dir, filter="data")
+        else:
+            tar.extractall(env_dir)
+    metadata_path = env_dir / _METADATA_FILE_NAME
+    old_prefix = json.loads(metadata_path.read_text())["prefix"]
+    metadata_path.unlink()
+    if old_prefix != str(env_dir):
+        _replace_prefix(env_dir, old_prefix, str(env_dir))
+    try:
+        # Mark the archive as recently used for `gc_env_cache`
+        os.utime(archive_path)
+    except OSError:
+        pass
+
+
+def list_cached_envs(env_cache_dir):
+    """
+    Returns:
+        A list of the ``(path, size, last_used_time)`` tuples of the environment archives in
+        ``env_cache_dir``, from the least to the most recently used.
+    """
+    archives = []
+    for path in Path(env_cache_dir).glob(f"*{_ARCHIVE_SUFFIX}"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        archives.append((path, st.st_size, st.st_mtime))
+    return sorted(archives, key=lambda archive: archive[2])
+
+
+def gc_env_cache(env_cache_dir, older_than_seconds=None, max_size=None):
+    """
+    Remove environment archives from ``env_cache_dir``, as well as temporary archives left by
+    crashed processes.
+
+    Args:
+        env_cache_dir: The environment cache directory.
+        older_than_seconds: If specified, remove archives that haven't been used for this number
+            of seconds.
+        max_size: If specified, remove the least recently used archives until the total size of
+            the archives is at most this number of bytes.
+
+    Returns:
+        The paths of the removed archives.
+    """
+    now = time.time()
+    for path in Path(env_cache_dir).glob(".*.tmp"):
+        try:
+            if now - path.stat().st_mtime > _STALE_TMP_FILE_SECONDS:
+                path.unlink()
+        except OSError:
+            pass
+
+    archives = list_cached_envs(env_cache_dir)
+    total_size = sum(size for _, size, _ in archives)
+    removed = []
+    for path, size, last_used_time in archives:
+        expired = older_than_seconds is not None and now - last_used_time > older_than_seconds
+        oversized = max_size is not None and total_size > max_size
+        if not (expired or oversized):
+            continue
+        try:
+            path.unlink()
+        except OSError as e:
+            _logger.warning("Failed to remove cached environment %s: %s", path, e)
+            continue
+        total_size -= size
+        removed.append(path)
+    return removed
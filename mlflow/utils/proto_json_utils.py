@@ -2,6 +2,7 @@ import base64
 import datetime
 import importlib
 import json
+import math
 import os
 from collections import defaultdict
 from copy import deepcopy
@@ -10,7 +11,8 @@ from json import JSONEncoder
 from typing import Any, Dict, Optional
 
 from google.protobuf.descriptor import FieldDescriptor
-from google.protobuf.json_format import MessageToJson, ParseDict
+from google.protobuf.internal.type_checkers import ToShortestFloat
+from google.protobuf.json_format import MessageToDict, MessageToJson, ParseDict
 
 from mlflow.exceptions import MlflowException
 
@@ -123,6 +125,153 @@ def message_to_json(message):
     return json.dumps(json_dict_with_int64_as_numbers, indent=2)
 
 
+# Converters of the values of fields to JSON objects, keyed by field descriptor. Fields whose
+# values are JSON objects as is, e.g. strings and integers, are mapped to `None`.
+_FIELD_JSON_CONVERTERS = {}
+# Repeated fields with more elements than this number are streamed in batches of this size by
+# `iter_message_json_chunks`
+_JSON_CHUNK_SIZE = 1000
+
+
+def _float_to_json(value):
+    if math.isfinite(value):
+        return value
+    if math.isnan(value):
+        return "NaN"
+    return "Infinity" if value > 0 else "-Infinity"
+
+
+def _float32_to_json(value):
+    return ToShortestFloat(value) if math.isfinite(value) else _float_to_json(value)
+
+
+def _bytes_to_json(value):
+    return base64.b64encode(value).decode("utf-8")
+
+
+def _map_key_to_json(key):
+    if isinstance(key, bool):
+        return "true" if key else "false"
+    return str(key)
+
+
+def _well_known_message_to_json(message):
+    return MessageToDict(message, preserving_proto_field_name=True)
+
+
+def _is_map_field(field):
+    return (
+        field.type == FieldDescriptor.TYPE_MESSAGE
+        and field.message_type.has_options
+        and field.message_type.GetOptions().map_entry
+    )
+
+
+def _get_value_converter(field):
+    if field.type == FieldDescriptor.TYPE_MESSAGE:
+        if field.message_type.full_name.startswith("google.protobuf."):
+            # Well-known types, e.g. `Timestamp`, have special JSON representations
+            return _well_known_message_to_json
+        return _message_to_json_dict
+    if field.type == FieldDescriptor.TYPE_ENUM:
+        names = {v.number: v.name for v in field.enum_type.values}
+        return lambda value: names.get(value, value)
+    if field.type == FieldDescriptor.TYPE_DOUBLE:
+        return _float_to_json
+    if field.type == FieldDescriptor.TYPE_FLOAT:
+        return _float32_to_json
+    if field.type == FieldDescriptor.TYPE_BYTES:
+        return _bytes_to_json
+    return None
+
+
+def _get_field_converter(field):
+    try:
+        return _FIELD_JSON_CONVERTERS[field]
+    except KeyError:
+        pass
+
+    if _is_map_field(field):
+        convert_value = _get_value_converter(field.message_type.fields_by_name["value"])
+        if convert_value is None:
+            convert_value = lambda value: value  # noqa: E731
+
+        def converter(value):
+            return {_map_key_to_json(k): convert_value(v) for k, v in value.items()}
+
+    elif field.label == FieldDescriptor.LABEL_REPEATED:
+        convert_value = _get_value_converter(field)
+        if convert_value is None:
+            converter = list
+        else:
+
+            def converter(value):
+                return [convert_value(v) for v in value]
+
+    else:
+        converter = _get_value_converter(field)
+
+    _FIELD_JSON_CONVERTERS[field] = converter
+    return converter
+
+
+def _get_field_json_name(field):
+    return f"[{field.full_name}]" if field.is_extension else field.name
+
+
+def _message_to_json_dict(message):
+    """
+    Converts a message to a JSON dict in a single pass over its fields, using snake_case for field
+    names and JSON numbers for int64 fields. The dict is equal to the one decoded from the output of
+    :py:func:`message_to_json`, except for int64 extension fields which are JSON numbers as well.
+    """
+    json_dict = {}
+    for field, value in message.ListFields():
+        converter = _get_field_converter(field)
+        json_dict[_get_field_json_name(field)] = value if converter is None else converter(value)
+    return json_dict
+
+
+def message_to_compact_json(message):
+    """
+    Converts a message to compact JSON, using snake_case for field names and JSON numbers for int64
+    fields. Unlike :py:func:`message_to_json`, messages are converted in a single pass and the JSON
+    isn't indented, which makes it suitable for the large responses of the tracking server.
+    """
+    return json.dumps(_message_to_json_dict(message), separators=(",", ":"))
+
+
+def _dumps_compact(obj):
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def iter_message_json_chunks(message, chunk_size=_JSON_CHUNK_SIZE):
+    """
+    Yields the compact JSON of a message in chunks, see :py:func:`message_to_compact_json`. The
+    elements of large repeated fields, e.g. the metrics of a metric history, are converted
+    ``chunk_size`` at a time instead of all at once, so that the whole JSON of the message is never
+    held in memory.
+    """
+    yield "{"
+    for i, (field, value) in enumerate(message.ListFields()):
+        prefix = ("," if i else "") + _dumps_compact(_get_field_json_name(field)) + ":"
+        if (
+            field.label == FieldDescriptor.LABEL_REPEATED
+            and len(value) > chunk_size
+            and not _is_map_field(field)
+        ):
+            converter = _get_field_converter(field)
+            for start in range(0, len(value), chunk_size):
+                chunk = converter(value[start : start + chunk_size])
+                # Strip the brackets of the JSON array of each chunk
+                yield (prefix + "[" if start == 0 else ",") + _dumps_compact(chunk)[1:-1]
+            yield "]"
+        else:
+            converter = _get_field_converter(field)
+            yield prefix + _dumps_compact(value if converter is None else converter(value))
+    yield "}"
+
+
 def _stringify_all_experiment_ids(x):
     """Converts experiment_id fields which are defined as ints into strings in the given json.
     This is necessary for backwards- and forwards-compatibility with MLflow clients/servers
@@ -3,13 +3,18 @@ This module provides a set of utilities for interpreting and creating requiremen
 (e.g. pip's `requirements.txt`), which is useful for managing ML software environments.
 """
 
+import hashlib
 import json
 import logging
 import os
+import pickle
+import pickletools
 import re
 import subprocess
 import sys
 import tempfile
+import uuid
+import zipfile
 from collections import namedtuple
 from itertools import chain, filterfalse
 from pathlib import Path
@@ -18,11 +23,13 @@ from typing import List, NamedTuple, Optional
 
 import importlib_metadata
 import pkg_resources  # noqa: TID251
+import yaml
 from packaging.requirements import Requirement
 from packaging.version import InvalidVersion, Version
 
 import mlflow
 from mlflow.environment_variables import (
+    MLFLOW_REQUIREMENTS_INFERENCE_CACHE_DIR,
     MLFLOW_REQUIREMENTS_INFERENCE_RAISE_ERRORS,
     MLFLOW_REQUIREMENTS_INFERENCE_TIMEOUT,
 )
@@ -408,10 +415,11 @@ def _init_modules_to_packages_map():
 def _init_packages_to_modules_map():
     _init_modules_to_packages_map()
     global _PACKAGES_TO_MODULES
-    _PACKAGES_TO_MODULES = {}
-    for module, pkg_list in _MODULES_TO_PACKAGES.items():
-        for pkg_name in pkg_list:
-            _PACKAGES_TO_MODULES[pkg_name] = module
+    if _PACKAGES_TO_MODULES is None:
+        _PACKAGES_TO_MODULES = {}
+        for module, pkg_list in _MODULES_TO_PACKAGES.items():
+            for pkg_name in pkg_list:
+                _PACKAGES_TO_MODULES[pkg_name] = module
 
 
 # Represents the PyPI package index at a particular date
@@ -433,10 +441,164 @@ def _load_pypi_package_index():
 _PYPI_PACKAGE_INDEX = None
 
 
+_INSTALLED_DISTRIBUTIONS_FINGERPRINT = None
+
+
+def _get_installed_distributions_fingerprint():
+    """Returns a digest of the Python version, the platform, and the names and versions of the
+    installed distributions, which determine the modules imported while loading models and the
+    versions their requirements are pinned to. Like the modules-to-packages map, it's computed
+    once per process.
+    """
+    global _INSTALLED_DISTRIBUTIONS_FINGERPRINT
+    if _INSTALLED_DISTRIBUTIONS_FINGERPRINT is None:
+        distributions = sorted(
+            {
+                f"{dist.metadata['Name']}=={dist.version}"
+                for dist in importlib_metadata.distributions()
+            }
+        )
+        fingerprint = [
+            sys.version,
+            sys.platform,
+            mlflow.__version__,
+            is_in_databricks_runtime(),
+            distributions,
+        ]
+        _INSTALLED_DISTRIBUTIONS_FINGERPRINT = hashlib.sha256(
+            json.dumps(fingerprint).encode("utf-8")
+        ).hexdigest()
+    return _INSTALLED_DISTRIBUTIONS_FINGERPRINT
+
+
+# Extensions of the model files whose contents decide the modules imported while loading the
+# model, e.g. code and configuration files. The contents of other files, e.g. weights, don't
+_MODEL_FINGERPRINT_CONTENT_EXTENSIONS = (".py", ".json", ".yaml", ".yml", ".txt", ".cfg", ".toml")
+
+
+def _get_pickle_fingerprint(f):
+    """Returns a digest of the string arguments of the opcodes of the pickle read from `f`, i.e.
+    the modules and classes it references and the names used by the code of functions and classes
+    pickled by value. Other arguments, e.g. numbers and array buffers, are skipped, so that pickles
+    of models which only differ by their weights have the same fingerprint.
+    """
+    digest = hashlib.sha256()
+    for opcode, arg, _ in pickletools.genops(f):
+        if isinstance(arg, str):
+            digest.update(json.dumps([opcode.name, arg]).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _get_model_file_fingerprint(path):
+    """Returns a digest of the parts of a model file deciding the modules imported while loading
+    it, i.e. the contents of code and configuration files, the references of pickles, including
+    the pickles of zip archives, e.g. PyTorch models, or None for other files.
+    """
+    if not path.endswith(_MODEL_FINGERPRINT_CONTENT_EXTENSIONS):
+        try:
+            if zipfile.is_zipfile(path):
+                with zipfile.ZipFile(path) as archive:
+                    members = []
+                    for name in sorted(archive.namelist()):
+                        if name.endswith(".pkl"):
+                            with archive.open(name) as f:
+                                members.append([name, _get_pickle_fingerprint(f)])
+                        else:
+                            members.append([name, None])
+                    return members
+            with open(path, "rb") as f:
+                if f.read(1) != pickle.PROTO:
+                    return None
+                f.seek(0)
+                return _get_pickle_fingerprint(f)
+        except Exception:
+            _logger.debug("Failed to fingerprint the references of %s", path, exc_info=True)
+
+    file_digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            file_digest.update(chunk)
+    return file_digest.hexdigest()
+
+
+def _get_model_fingerprint(local_model_path):
+    """Returns a digest of the MLflow model at `local_model_path`, or None if `local_model_path`
+    isn't an MLflow model directory. The digest covers what decides the modules imported while
+    loading the model: the configurations of its flavors, the relative paths of its files and
+    the parts of the files returned by `_get_model_file_fingerprint`. Models which only differ by
+    their weights, e.g. the models of a hyperparameter sweep, have the same fingerprint.
+    """
+    # Lazily import `MLMODEL_FILE_NAME` here to avoid circular imports.
+    from mlflow.models.model import MLMODEL_FILE_NAME
+
+    mlmodel_path = os.path.join(local_model_path, MLMODEL_FILE_NAME)
+    if not os.path.isfile(mlmodel_path):
+        return None
+    with open(mlmodel_path) as f:
+        flavors = yaml.safe_load(f).get("flavors", {})
+
+    files = []
+    for root, dirs, names in os.walk(local_model_path):
+        dirs.sort()
+        for name in sorted(names):
+            path = os.path.join(root, name)
+            relative_path = Path(path).relative_to(local_model_path).as_posix()
+            if relative_path == MLMODEL_FILE_NAME:
+                continue
+            files.append([relative_path, _get_model_file_fingerprint(path)])
+    return hashlib.sha256(
+        json.dumps([flavors, files], sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def _get_requirements_cache_key(model_uri, flavor):
+    """Returns the key of the inferred requirements of a model in the requirements cache, or None
+    if the cache is disabled or the model isn't a local MLflow model directory.
+    """
+    if not MLFLOW_REQUIREMENTS_INFERENCE_CACHE_DIR.get() or not os.path.isdir(model_uri):
+        return None
+    model_fingerprint = _get_model_fingerprint(model_uri)
+    if model_fingerprint is None:
+        return None
+    key = [flavor, model_fingerprint, _get_installed_distributions_fingerprint()]
+    return hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+
+
+def _get_requirements_cache_path(key):
+    return Path(MLFLOW_REQUIREMENTS_INFERENCE_CACHE_DIR.get(), key[:2], f"{key}.json")
+
+
+def _load_cached_requirements(key):
+    try:
+        return json.loads(_get_requirements_cache_path(key).read_text())["requirements"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _cache_requirements(key, requirements):
+    path = _get_requirements_cache_path(key)
+    # Entries are written to temporary files first and atomically renamed, so that concurrent
+    # processes never read partially written entries
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps({"requirements": requirements}))
+        os.replace(tmp_path, path)
+    except OSError:
+        _logger.debug("Failed to cache the inferred requirements in %s", path, exc_info=True)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
 def _infer_requirements(model_uri, flavor):
     """Infers the pip requirements of the specified model by creating a subprocess and loading
     the model in it to determine which packages are imported.
 
+    If `MLFLOW_REQUIREMENTS_INFERENCE_CACHE_DIR` is set, the inferred requirements of local
+    MLflow model directories are cached, keyed by the flavor, the parts of the model deciding the
+    modules imported while loading it and the installed distributions, see
+    `_get_requirements_cache_key`.
+
     Args:
         model_uri: The URI of the model.
         flavor: The flavor name of the model.
@@ -444,6 +606,26 @@ def _infer_requirements(model_uri, flavor):
     Returns:
         A list of inferred pip requirements.
 
+    """
+    cache_key = _get_requirements_cache_key(model_uri, flavor)
+    if cache_key and (requirements := _load_cached_requirements(cache_key)) is not None:
+        return requirements
+
+    requirements = _get_requirements_from_modules(_capture_imported_modules(model_uri, flavor))
+    if cache_key:
+        _cache_requirements(cache_key, requirements)
+    return requirements
+
+
+def _get_requirements_from_modules(modules):
+    """Maps captured modules to the pinned requirements of the packages providing them.
+
+    Args:
+        modules: A list of captured modules.
+
+    Returns:
+        A list of pinned pip requirements.
+
     """
     raise_on_error = MLFLOW_REQUIREMENTS_INFERENCE_RAISE_ERRORS.get()
     _init_modules_to_packages_map()
@@ -451,7 +633,6 @@ def _infer_requirements(model_uri, flavor):
     if _PYPI_PACKAGE_INDEX is None:
         _PYPI_PACKAGE_INDEX = _load_pypi_package_index()
 
-    modules = _capture_imported_modules(model_uri, flavor)
     packages = _flatten([_MODULES_TO_PACKAGES.get(module, []) for module in modules])
     packages = map(_normalize_package_name, packages)
     packages = _prune_packages(packages)
@@ -781,13 +781,7 @@ class SearchUtils:
         return runs
 
     @classmethod
-    def parse_start_offset_from_page_token(cls, page_token):
-        # Note: the page_token is expected to be a base64-encoded JSON that looks like
-        # { "offset": xxx }. However, this format is not stable, so it should not be
-        # relied upon outside of this method.
-        if not page_token:
-            return 0
-
+    def _decode_page_token(cls, page_token):
         try:
             decoded_token = base64.b64decode(page_token)
         except TypeError:
@@ -807,6 +801,23 @@ class SearchUtils:
                 error_code=INVALID_PARAMETER_VALUE,
             )
 
+        if not isinstance(parsed_token, dict):
+            raise MlflowException(
+                f"Invalid page token, parsed value={parsed_token}",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+
+        return parsed_token
+
+    @classmethod
+    def parse_start_offset_from_page_token(cls, page_token):
+        # Note: the page_token is expected to be a base64-encoded JSON that looks like
+        # { "offset": xxx }. However, this format is not stable, so it should not be
+        # relied upon outside of this method.
+        if not page_token:
+            return 0
+
+        parsed_token = cls._decode_page_token(page_token)
         offset_str = parsed_token.get("offset")
         if not offset_str:
             raise MlflowException(
@@ -828,6 +839,37 @@ class SearchUtils:
     def create_page_token(cls, offset):
         return base64.b64encode(json.dumps({"offset": offset}).encode("utf-8"))
 
+    @classmethod
+    def parse_sort_key_values_from_page_token(cls, page_token):
+        """
+        Returns the sort key values of the last row of the previous page encoded into a keyset
+        page token created by :py:meth:`create_keyset_page_token`, or ``None`` if ``page_token``
+        is empty or is an offset page token.
+        """
+        if not page_token:
+            return None
+
+        parsed_token = cls._decode_page_token(page_token)
+        if "sort_key_values" not in parsed_token:
+            return None
+
+        sort_key_values = parsed_token["sort_key_values"]
+        if not isinstance(sort_key_values, list):
+            raise MlflowException(
+                f"Invalid page token, parsed value={parsed_token}",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        return sort_key_values
+
+    @classmethod
+    def create_keyset_page_token(cls, sort_key_values):
+        """
+        Creates a page token resuming a search after the row whose sort key values, including the
+        tie-breaking key, are ``sort_key_values``. Contrary to offset page tokens, the next page
+        doesn't depend on the number of rows preceding that row.
+        """
+        return base64.b64encode(json.dumps({"sort_key_values": sort_key_values}).encode("utf-8"))
+
     @classmethod
     def paginate(cls, runs, page_token, max_results):
         """Paginates a set of runs based on an offset encoded into the page_token and a max
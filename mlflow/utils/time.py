@@ -1,8 +1,17 @@
 import datetime
+import re
 import time
 
 from pytz import reference
 
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+_DURATION_REGEX = re.compile(
+    r"^((?P<days>[\.\d]+?)d)?((?P<hours>[\.\d]+?)h)?((?P<minutes>[\.\d]+?)m)"
+    r"?((?P<seconds>[\.\d]+?)s)?$"
+)
+
 
 def get_current_time_millis():
     """
@@ -20,6 +29,24 @@ def conv_longdate_to_str(longdate, local_tz=True):
     return str_long_date
 
 
+def parse_duration(duration):
+    """
+    Parses a duration in the ``#d#h#m#s`` format, e.g. ``2d8h5m20s`` or ``1.5h``.
+
+    Returns:
+        A ``datetime.timedelta``.
+    """
+    parts = _DURATION_REGEX.match(duration)
+    if parts is None:
+        raise MlflowException(
+            f"Could not parse any time information from '{duration}'. "
+            "Examples of valid strings: '8h', '2d8h5m20s', '2m4s'",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    time_params = {name: float(param) for name, param in parts.groupdict().items() if param}
+    return datetime.timedelta(**time_params)
+
+
 class Timer:
     """
     Measures elapsed time.
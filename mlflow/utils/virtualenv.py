@@ -10,11 +10,12 @@ from pathlib import Path
 from packaging.version import Version
 
 import mlflow
-from mlflow.environment_variables import MLFLOW_ENV_ROOT
+from mlflow.environment_variables import MLFLOW_ENV_CACHE_DIR, MLFLOW_ENV_ROOT
 from mlflow.exceptions import MlflowException
 from mlflow.models.model import MLMODEL_FILE_NAME, Model
 from mlflow.utils.conda import _PIP_CACHE_DIR
 from mlflow.utils.databricks_utils import is_in_databricks_runtime
+from mlflow.utils.env_cache import get_env_archive_path, pack_env, unpack_env
 from mlflow.utils.environment import (
     _CONDA_ENV_FILE_NAME,
     _PYTHON_ENV_FILE_NAME,
@@ -233,8 +234,59 @@ def _get_virtualenv_name(python_env, work_dir_path, env_id=None):
     )
 
 
+def _get_virtualenv_archive_path(env_name):
+    """
+    Returns:
+        The path of the archive of the environment named ``env_name`` in the environment cache,
+        or ``None`` if the cache is disabled. Environments aren't cached on Windows, where the
+        paths of the environments are embedded in the executables of their scripts.
+    """
+    env_cache_dir = MLFLOW_ENV_CACHE_DIR.get()
+    if env_cache_dir is None or is_windows():
+        return None
+    return get_env_archive_path(env_cache_dir, env_name)
+
+
+def _get_model_virtualenv_archive_path(local_model_path, env_id=None):
+    """
+    Returns:
+        The path of the archive of the virtualenv environment of the model at
+        ``local_model_path`` in the environment cache, or ``None`` if the cache is disabled.
+    """
+    local_model_path = Path(local_model_path)
+    python_env = _get_python_env(local_model_path)
+    return _get_virtualenv_archive_path(_get_virtualenv_name(python_env, local_model_path, env_id))
+
+
+def _restore_virtualenv_from_archive(archive_path, python_bin_path, env_dir, capture_output=False):
+    with remove_on_error(
+        env_dir,
+        onerror=lambda e: _logger.warning(
+            "Encountered an unexpected error: %s while restoring a virtualenv environment from %s"
+            " in %s, removing the environment directory...",
+            repr(e),
+            archive_path,
+            env_dir,
+        ),
+    ):
+        _logger.info("Restoring the environment %s from %s", env_dir, archive_path)
+        unpack_env(archive_path, env_dir)
+        # Recreate the links to the interpreter and the activation scripts, keeping the packages
+        # installed in the environment
+        _exec_cmd(
+            [sys.executable, "-m", "virtualenv", "--no-seed", "--python", python_bin_path, env_dir],
+            capture_output=capture_output,
+        )
+
+
 def _create_virtualenv(
-    local_model_path, python_bin_path, env_dir, python_env, extra_env=None, capture_output=False
+    local_model_path,
+    python_bin_path,
+    env_dir,
+    python_env,
+    extra_env=None,
+    capture_output=False,
+    archive_path=None,
 ):
     # Created a command to activate the environment
     paths = ("bin", "activate") if not is_windows() else ("Scripts", "activate.bat")
@@ -245,6 +297,10 @@ def _create_virtualenv(
         _logger.info("Environment %s already exists", env_dir)
         return activate_cmd
 
+    if archive_path is not None and archive_path.exists():
+        _restore_virtualenv_from_archive(archive_path, python_bin_path, env_dir, capture_output)
+        return activate_cmd
+
     with remove_on_error(
         env_dir,
         onerror=lambda e: _logger.warning(
@@ -288,6 +344,12 @@ def _create_virtualenv(
                 )
                 _exec_cmd(cmd, capture_output=capture_output, cwd=tmpdir, extra_env=extra_env)
 
+    if archive_path is not None:
+        try:
+            pack_env(env_dir, archive_path)
+        except Exception as e:
+            _logger.warning("Failed to add the environment %s to the cache: %s", env_dir, e)
+
     return activate_cmd
 
 
@@ -383,6 +445,7 @@ def _get_or_create_virtualenv(
             python_env,
             extra_env=extra_env,
             capture_output=capture_output,
+            archive_path=_get_virtualenv_archive_path(env_name),
         )
 
         # Install additional dependencies specified by `requirements_override`
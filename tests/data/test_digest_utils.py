@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mlflow.data.digest_utils import (
+    MAX_ROWS,
+    compute_numpy_digest,
+    compute_pandas_digest,
+    get_sample_indices,
+)
+
+
+def _compute_legacy_digest(monkeypatch, compute_digest, *args):
+    with monkeypatch.context() as m:
+        m.setenv("MLFLOW_USE_LEGACY_DATASET_DIGEST", "true")
+        return compute_digest(*args)
+
+
+def _create_df(num_rows):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "int": rng.integers(0, 100, num_rows),
+            "float": rng.random(num_rows),
+            "str": [f"s{i}" for i in range(num_rows)],
+            "category": pd.Categorical(rng.choice(["a", "b"], num_rows)),
+            "mixed": [i if i % 2 else str(i) for i in range(num_rows)],
+            "list": [[i] for i in range(num_rows)],
+        }
+    )
+
+
+def test_get_sample_indices():
+    np.testing.assert_array_equal(get_sample_indices(5, max_rows=10), np.arange(5))
+    indices = get_sample_indices(1000, max_rows=100)
+    assert len(indices) == 100
+    np.testing.assert_array_equal(indices[:25], np.arange(25))
+    np.testing.assert_array_equal(indices[-25:], np.arange(975, 1000))
+    assert np.all(np.diff(indices) > 0)
+
+
+@pytest.mark.parametrize("num_rows", [0, 1, 100, MAX_ROWS])
+def test_pandas_digest_matches_legacy_digest_of_small_dataframes(num_rows, monkeypatch):
+    df = _create_df(num_rows)
+    legacy_digest = _compute_legacy_digest(monkeypatch, compute_pandas_digest, df)
+    assert compute_pandas_digest(df) == legacy_digest
+
+
+def test_pandas_digest_of_large_dataframes_depends_on_rows_across_the_dataframe():
+    df = _create_df(5 * MAX_ROWS)
+    digest = compute_pandas_digest(df)
+    assert compute_pandas_digest(df.copy()) == digest
+    middle_row = get_sample_indices(len(df))[MAX_ROWS // 2]
+    for row in [0, middle_row, len(df) - 1]:
+        modified_df = df.copy()
+        modified_df.loc[row, "float"] = -1.0
+        assert compute_pandas_digest(modified_df) != digest
+    assert compute_pandas_digest(df.iloc[:-1]) != digest
+
+
+@pytest.mark.parametrize("shape", [(0,), (10,), (100, 100), (3, 4, 5)])
+def test_numpy_digest_matches_legacy_digest_of_small_arrays(shape, monkeypatch):
+    features = np.arange(np.prod(shape)).reshape(shape)
+    targets = np.arange(shape[0])
+    legacy_digest = _compute_legacy_digest(monkeypatch, compute_numpy_digest, features, targets)
+    assert compute_numpy_digest(features, targets) == legacy_digest
+
+
+def test_numpy_digest_of_large_arrays_depends_on_elements_across_the_array():
+    features = np.arange(100 * MAX_ROWS, dtype=np.float64).reshape(-1, 4)
+    digest = compute_numpy_digest(features)
+    # Non-contiguous arrays are sampled without being copied
+    assert compute_numpy_digest(np.asfortranarray(features)) == digest
+    middle_index = np.unravel_index(
+        get_sample_indices(features.size)[MAX_ROWS // 2], features.shape
+    )
+    for index in [(0, 0), middle_index, (-1, -1)]:
+        modified_features = features.copy()
+        modified_features[index] = -1.0
+        assert compute_numpy_digest(modified_features) != digest
@@ -1,7 +1,12 @@
+from contextlib import asynccontextmanager
+
 import pytest
+from aiohttp import web
 
 from mlflow.gateway.providers.utils import (
+    ClientSessionPool,
     rename_payload_keys,
+    send_request,
 )
 
 
@@ -34,3 +39,42 @@ def test_rename_payload_keys():
 )
 def test_rename_payload_keys_parametrized(payload, mapping, expected):
     assert rename_payload_keys(payload, mapping) == expected
+
+
+@asynccontextmanager
+async def upstream_server():
+    peers = []
+
+    async def handler(request):
+        peers.append(request.transport.get_extra_info("peername"))
+        return web.json_response({"authorization": request.headers.get("Authorization")})
+
+    app = web.Application()
+    app.router.add_post("/v1/chat", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", peers
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_send_request_reuses_connections_of_session_pool():
+    async with upstream_server() as (base_url, peers):
+        async with ClientSessionPool() as pool:
+            for i in range(3):
+                headers = {"Authorization": f"Bearer {i}"}
+                resp = await send_request(headers, base_url, "v1/chat", {})
+                assert resp == {"authorization": f"Bearer {i}"}
+            assert pool.get_session(base_url) is pool.get_session(f"{base_url}/other")
+            session = pool.get_session(base_url)
+        assert session.closed
+        assert len(set(peers)) == 1
+
+        # Without a session pool, each request opens a new connection
+        peers.clear()
+        for _ in range(2):
+            await send_request({}, base_url, "v1/chat", {})
+        assert len(set(peers)) == 2
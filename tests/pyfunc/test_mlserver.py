@@ -45,6 +45,14 @@ from mlflow.pyfunc.mlserver import MLServerDefaultModelName, MLServerMLflowRunti
             {"MLSERVER_MODEL_NAME": "mymodel", "MLSERVER_MODEL_VERSION": "12"},
         ),
         ({}, {"MLSERVER_MODEL_NAME": MLServerDefaultModelName}),
+        (
+            {"enable_batching": True, "max_batch_size": 64, "max_batch_delay_ms": 5},
+            {
+                "MLSERVER_MODEL_NAME": MLServerDefaultModelName,
+                "MLSERVER_MODEL_MAX_BATCH_SIZE": "64",
+                "MLSERVER_MODEL_MAX_BATCH_TIME": "0.005",
+            },
+        ),
     ],
 )
 def test_get_cmd(params: dict, expected: dict):
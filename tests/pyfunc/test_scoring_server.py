@@ -3,12 +3,17 @@ import math
 import os
 import random
 import signal
+import threading
 from collections import namedtuple
-from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, StringIO
+from unittest import mock
 
 import keras
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 import sklearn.neighbors as knn
 from packaging.version import Version
@@ -736,6 +741,10 @@ def test_parse_json_input_including_path():
         ({"port": 5000, "nworkers": 4, "timeout": 60}, "--timeout=60 -w 4"),
         ({"nworkers": 4, "timeout": 60}, "--timeout=60 -w 4"),
         ({"timeout": 60}, "--timeout=60"),
+        (
+            {"timeout": 60, "nworkers": 2, "enable_batching": True, "max_batch_size": 16},
+            "--timeout=60 -w 2 --threads 16",
+        ),
     ],
 )
 def test_get_cmd(args: dict, expected: str):
@@ -746,6 +755,19 @@ def test_get_cmd(args: dict, expected: str):
     )
 
 
+def test_get_cmd_sets_batching_env_vars(monkeypatch):
+    monkeypatch.delenv("MLFLOW_SCORING_SERVER_ENABLE_BATCHING", raising=False)
+    _, env = get_cmd(model_uri="foo")
+    assert "MLFLOW_SCORING_SERVER_ENABLE_BATCHING" not in env
+
+    _, env = get_cmd(
+        model_uri="foo", enable_batching=True, max_batch_size=8, max_batch_delay_ms=2.5
+    )
+    assert env["MLFLOW_SCORING_SERVER_ENABLE_BATCHING"] == "true"
+    assert env["MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE"] == "8"
+    assert env["MLFLOW_SCORING_SERVER_MAX_BATCH_DELAY_MS"] == "2.5"
+
+
 def test_scoring_server_client(sklearn_model, model_path):
     from mlflow.models.flavor_backend_registry import get_flavor_backend
     from mlflow.pyfunc.scoring_server.client import ScoringServerClient
@@ -785,6 +807,385 @@ def test_scoring_server_client(sklearn_model, model_path):
             os.kill(server_proc.pid, signal.SIGTERM)
 
 
+class _EchoParamsModel(PythonModel):
+    def predict(self, context, model_input, params=None):
+        return model_input.assign(param=(params or {}).get("multiplier", 1) * model_input["x"])
+
+
+def _to_arrow_stream(df, metadata=None):
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if metadata is not None:
+        table = table.replace_schema_metadata(metadata)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def test_scoring_server_arrow_input_and_output(model_path):
+    signature = ModelSignature(
+        inputs=Schema([ColSpec(DataType.long, "x")]),
+        params=ParamSchema([ParamSpec("multiplier", DataType.long, 1)]),
+    )
+    mlflow.pyfunc.save_model(model_path, python_model=_EchoParamsModel(), signature=signature)
+    app = pyfunc_scoring_server.init(mlflow.pyfunc.load_model(model_path))
+    df = pd.DataFrame({"x": [1, 2, 3]})
+    data = _to_arrow_stream(
+        df, {pyfunc_scoring_server.ARROW_PARAMS_METADATA_KEY: '{"multiplier": 2}'}
+    )
+
+    with app.test_client() as client:
+        response = client.post(
+            "/invocations",
+            data=data,
+            headers={
+                "Content-Type": pyfunc_scoring_server.CONTENT_TYPE_ARROW,
+                "Accept": pyfunc_scoring_server.CONTENT_TYPE_ARROW,
+            },
+        )
+        expect_status_code(response, 200)
+        assert response.mimetype == pyfunc_scoring_server.CONTENT_TYPE_ARROW
+        with pa.ipc.open_stream(response.data) as reader:
+            predictions = reader.read_all().to_pandas()
+        pd.testing.assert_frame_equal(predictions, df.assign(param=[2, 4, 6]))
+
+        # Predictions are serialized as JSON unless Arrow is accepted
+        response = client.post(
+            "/invocations",
+            data=data,
+            headers={"Content-Type": pyfunc_scoring_server.CONTENT_TYPE_ARROW},
+        )
+        expect_status_code(response, 200)
+        assert response.mimetype == pyfunc_scoring_server.CONTENT_TYPE_JSON
+        assert json.loads(response.data)["predictions"] == [
+            {"x": 1, "param": 2},
+            {"x": 2, "param": 4},
+            {"x": 3, "param": 6},
+        ]
+
+        response = client.post(
+            "/invocations",
+            data=b"not an arrow stream",
+            headers={"Content-Type": pyfunc_scoring_server.CONTENT_TYPE_ARROW},
+        )
+        expect_status_code(response, 400)
+
+
+class _DtypesModel(PythonModel):
+    def predict(self, context, model_input, params=None):
+        return np.array([[str(dtype) for dtype in model_input.dtypes]] * len(model_input))
+
+
+def test_scoring_server_parquet_and_npy_input_and_output(model_path):
+    signature = ModelSignature(
+        inputs=Schema([ColSpec(DataType.double, "a"), ColSpec(DataType.double, "b")])
+    )
+    mlflow.pyfunc.save_model(model_path, python_model=_DtypesModel(), signature=signature)
+    app = pyfunc_scoring_server.init(mlflow.pyfunc.load_model(model_path))
+    df = pd.DataFrame({"a": np.array([1, 2], np.float32), "b": np.array([3, 4], np.int32)})
+    parquet_buffer = BytesIO()
+    df.to_parquet(parquet_buffer)
+    npy_buffer = BytesIO()
+    np.save(npy_buffer, df.to_numpy(np.float32))
+
+    with app.test_client() as client:
+        # Columns are upcast to the types of the schema before reaching the model
+        response = client.post(
+            "/invocations",
+            data=parquet_buffer.getvalue(),
+            headers={
+                "Content-Type": pyfunc_scoring_server.CONTENT_TYPE_PARQUET,
+                "Accept": pyfunc_scoring_server.CONTENT_TYPE_PARQUET,
+            },
+        )
+        expect_status_code(response, 200)
+        assert response.mimetype == pyfunc_scoring_server.CONTENT_TYPE_PARQUET
+        predictions = pd.read_parquet(BytesIO(response.data))
+        assert predictions.to_numpy().tolist() == [["float64", "float64"]] * 2
+
+        response = client.post(
+            "/invocations",
+            data=npy_buffer.getvalue(),
+            headers={
+                "Content-Type": pyfunc_scoring_server.CONTENT_TYPE_NPY,
+                "Accept": pyfunc_scoring_server.CONTENT_TYPE_NPY,
+            },
+        )
+        expect_status_code(response, 200)
+        assert response.mimetype == pyfunc_scoring_server.CONTENT_TYPE_NPY
+        predictions = np.load(BytesIO(response.data))
+        assert predictions.tolist() == [["float64", "float64"]] * 2
+
+        response = client.post(
+            "/invocations",
+            data=npy_buffer.getvalue(),
+            headers={"Content-Type": pyfunc_scoring_server.CONTENT_TYPE_NPY, "Accept": "*/*"},
+        )
+        expect_status_code(response, 200)
+        assert response.mimetype == pyfunc_scoring_server.CONTENT_TYPE_JSON
+
+        response = client.post(
+            "/invocations",
+            data=b"not a npy file",
+            headers={"Content-Type": pyfunc_scoring_server.CONTENT_TYPE_NPY},
+        )
+        expect_status_code(response, 400)
+
+
+@pytest.mark.parametrize("content_type", ["arrow", "parquet"])
+def test_scoring_server_responds_to_out_of_range_timestamps_with_bad_request(
+    model_path, content_type
+):
+    signature = ModelSignature(inputs=Schema([ColSpec(DataType.datetime, "t")]))
+    mlflow.pyfunc.save_model(model_path, python_model=_DtypesModel(), signature=signature)
+    app = pyfunc_scoring_server.init(mlflow.pyfunc.load_model(model_path))
+    # Seconds since the epoch of 3000-01-01, which overflow nanosecond timestamps
+    table = pa.table({"t": pa.array([32503680000], pa.timestamp("s"))})
+    if content_type == "arrow":
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        data = sink.getvalue().to_pybytes()
+        mime_type = pyfunc_scoring_server.CONTENT_TYPE_ARROW
+    else:
+        buffer = BytesIO()
+        pq.write_table(table, buffer)
+        data = buffer.getvalue()
+        mime_type = pyfunc_scoring_server.CONTENT_TYPE_PARQUET
+
+    with app.test_client() as client:
+        response = client.post("/invocations", data=data, headers={"Content-Type": mime_type})
+        expect_status_code(response, 400)
+        assert response.mimetype == "application/json"
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        (None, []),
+        ("*/*", []),
+        ("application/json, application/x-npy", []),
+        ("application/x-npy, */*;q=0.8", ["application/x-npy"]),
+        (
+            "application/x-parquet;q=0.5, application/vnd.apache.arrow.stream, application/json",
+            ["application/vnd.apache.arrow.stream"],
+        ),
+        (
+            "application/x-parquet;q=0.5, application/x-npy;q=0.9",
+            ["application/x-npy", "application/x-parquet"],
+        ),
+        ("application/x-npy;q=0", []),
+    ],
+)
+def test_get_binary_response_types(accept, expected):
+    assert pyfunc_scoring_server._get_binary_response_types(accept) == expected
+
+
+def test_scoring_server_client_sends_numpy_arrays_as_npy():
+    from mlflow.pyfunc.scoring_server.client import ScoringServerClient
+
+    predictions = BytesIO()
+    np.save(predictions, np.array([1.0, 2.0]))
+    ok = mock.Mock(
+        status_code=200,
+        content=predictions.getvalue(),
+        headers={"Content-Type": pyfunc_scoring_server.CONTENT_TYPE_NPY},
+    )
+    client = ScoringServerClient(host="127.0.0.1", port=5000)
+    data = np.array([[1.0, 2.0], [3.0, 4.0]])
+    with mock.patch("requests.post", return_value=ok) as mock_post:
+        result = client.invoke(data).get_predictions(predictions_format="ndarray")
+
+    np.testing.assert_array_equal(result, [1.0, 2.0])
+    headers = mock_post.call_args.kwargs["headers"]
+    assert headers["Content-Type"] == pyfunc_scoring_server.CONTENT_TYPE_NPY
+    np.testing.assert_array_equal(np.load(BytesIO(mock_post.call_args.kwargs["data"])), data)
+
+
+class _FlattenModel(PythonModel):
+    def predict(self, context, model_input, params=None):
+        return pd.DataFrame({"x": np.asarray(model_input).ravel()})
+
+
+@pytest.fixture
+def legacy_scoring_server(model_path):
+    """
+    A scoring server behaving like the ones of older MLflow versions, which decode payloads as
+    UTF-8 before checking their content type, and fail with a 500 on binary payloads.
+    """
+    import flask
+    from werkzeug.serving import make_server
+
+    mlflow.pyfunc.save_model(model_path, python_model=_FlattenModel())
+    model = mlflow.pyfunc.load_model(model_path)
+    app = flask.Flask(__name__)
+    content_types = []
+
+    @app.route("/invocations", methods=["POST"])
+    def invocations():
+        content_types.append(flask.request.content_type)
+        data = flask.request.data.decode("utf-8")
+        result = pyfunc_scoring_server.invocations(
+            data, flask.request.content_type, model, input_schema=None
+        )
+        return flask.Response(
+            response=result.response, status=result.status, mimetype=result.mimetype
+        )
+
+    server = make_server("127.0.0.1", 0, app)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.server_port, content_types
+    finally:
+        server.shutdown()
+        thread.join()
+
+
+@pytest.mark.parametrize(
+    "data", [pd.DataFrame({"x": [1, 2]}), np.array([[1.0], [2.0]])], ids=["arrow", "npy"]
+)
+def test_scoring_server_client_falls_back_to_json_on_legacy_servers(legacy_scoring_server, data):
+    from mlflow.pyfunc.scoring_server.client import ScoringServerClient
+
+    port, content_types = legacy_scoring_server
+    client = ScoringServerClient(host="127.0.0.1", port=port)
+    for _ in range(2):
+        predictions = client.invoke(data).get_predictions()
+        assert predictions["x"].tolist() == [1, 2]
+
+    # Binary payloads aren't sent anymore once the server failed to handle them
+    binary_content_type = (
+        pyfunc_scoring_server.CONTENT_TYPE_ARROW
+        if isinstance(data, pd.DataFrame)
+        else pyfunc_scoring_server.CONTENT_TYPE_NPY
+    )
+    assert content_types == [
+        binary_content_type,
+        pyfunc_scoring_server.CONTENT_TYPE_JSON,
+        pyfunc_scoring_server.CONTENT_TYPE_JSON,
+    ]
+
+
+@pytest.mark.parametrize(
+    "raw_predictions",
+    [np.array([[1.0, 2.0], [3.0, 4.0]]), np.array([1, 2]), pd.Series([1, 2])],
+)
+@pytest.mark.parametrize(
+    ("serialize", "load"),
+    [
+        ("predictions_to_arrow", "_load_arrow_predictions"),
+        ("predictions_to_parquet", "_load_parquet_predictions"),
+    ],
+)
+def test_binary_predictions_have_the_column_labels_of_json_predictions(
+    raw_predictions, serialize, load
+):
+    from mlflow.deployments import PredictionsResponse
+    from mlflow.pyfunc.scoring_server import client
+
+    serialized = getattr(pyfunc_scoring_server, serialize)(raw_predictions)
+    predictions = getattr(client, load)(serialized.to_pybytes())
+    json_predictions = StringIO()
+    pyfunc_scoring_server.predictions_to_json(raw_predictions, json_predictions)
+    expected = PredictionsResponse.from_json(json_predictions.getvalue()).get_predictions()
+    pd.testing.assert_frame_equal(predictions, expected)
+
+
+class _BatchRecordingModel(PythonModel):
+    def __init__(self):
+        self.batch_sizes = []
+
+    def predict(self, context, model_input, params=None):
+        if (model_input["x"] < 0).any():
+            raise ValueError("Negative inputs aren't supported")
+        self.batch_sizes.append(len(model_input))
+        return model_input["x"] * (params or {}).get("multiplier", 1)
+
+
+def _score_concurrently(batcher, inputs):
+    def score(args):
+        try:
+            return batcher.predict(*args)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=len(inputs)) as executor:
+        return list(executor.map(score, inputs))
+
+
+def test_micro_batcher_scores_concurrent_requests_in_batches(model_path):
+    from mlflow.pyfunc.scoring_server.batching import MicroBatcher
+
+    mlflow.pyfunc.save_model(model_path, python_model=_BatchRecordingModel())
+    model = mlflow.pyfunc.load_model(model_path)
+    python_model = model.unwrap_python_model()
+    batcher = MicroBatcher(model, max_batch_size=8, max_batch_delay_ms=200)
+    inputs = [(pd.DataFrame({"x": [i, i + 100]}), None) for i in range(8)]
+
+    results = _score_concurrently(batcher, inputs)
+    batcher.shutdown()
+
+    for (data, _), result in zip(inputs, results):
+        pd.testing.assert_series_equal(result, data["x"])
+    assert sum(python_model.batch_sizes) == 16
+    assert max(python_model.batch_sizes) == 8
+    assert len(python_model.batch_sizes) < len(inputs)
+    metrics = batcher.metrics.render()
+    assert "mlflow_scoring_server_batch_size_count" in metrics
+    assert 'mlflow_scoring_server_batch_size_bucket{le="+Inf"} ' in metrics
+
+
+def test_micro_batcher_isolates_failures_and_incompatible_inputs(model_path):
+    from mlflow.pyfunc.scoring_server.batching import MicroBatcher
+
+    signature = ModelSignature(
+        inputs=Schema([ColSpec(DataType.double, "x")]),
+        params=ParamSchema([ParamSpec("multiplier", DataType.long, 1)]),
+    )
+    mlflow.pyfunc.save_model(model_path, python_model=_BatchRecordingModel(), signature=signature)
+    model = mlflow.pyfunc.load_model(model_path)
+    batcher = MicroBatcher(model, max_batch_size=64, max_batch_delay_ms=200)
+    inputs = [
+        (pd.DataFrame({"x": [1.0]}), None),
+        (pd.DataFrame({"x": [-1.0]}), None),
+        (pd.DataFrame({"x": [2.0]}), {"multiplier": 10}),
+        (pd.DataFrame({"x": [3.5]}), None),
+        (pd.DataFrame({"x": ["a"]}), None),
+    ]
+
+    results = _score_concurrently(batcher, inputs)
+    batcher.shutdown()
+
+    assert results[0].tolist() == [1.0]
+    assert isinstance(results[1], ValueError)
+    assert results[2].tolist() == [20.0]
+    assert results[3].tolist() == [3.5]
+    # Inputs are validated against the schema of the model before being batched
+    assert isinstance(results[4], mlflow.exceptions.MlflowException)
+    assert "mlflow_scoring_server_unbatched_requests_total" in batcher.metrics.render()
+
+
+def test_scoring_server_with_batching_exposes_metrics(model_path, monkeypatch):
+    monkeypatch.setenv("MLFLOW_SCORING_SERVER_ENABLE_BATCHING", "true")
+    mlflow.pyfunc.save_model(model_path, python_model=_EchoParamsModel())
+    app = pyfunc_scoring_server.init(mlflow.pyfunc.load_model(model_path))
+
+    with app.test_client() as client:
+        response = client.post(
+            "/invocations",
+            json={"dataframe_split": {"columns": ["x"], "data": [[1], [2]]}},
+        )
+        expect_status_code(response, 200)
+        assert json.loads(response.data)["predictions"] == [
+            {"x": 1, "param": 1},
+            {"x": 2, "param": 2},
+        ]
+        response = client.get("/metrics")
+        expect_status_code(response, 200)
+        assert "mlflow_scoring_server_batch_size_count 1" in response.get_data(as_text=True)
+
+
 _LLM_CHAT_INPUT_SCHEMA = Schema(
     [
         ColSpec(
@@ -12,6 +12,7 @@ from pyspark.sql import SparkSession
 
 from mlflow.exceptions import MlflowException
 from mlflow.recipes.steps.ingest import IngestStep
+from mlflow.recipes.steps.ingest.datasets import _PandasConvertibleDataset
 from mlflow.recipes.utils import _RECIPE_CONFIG_FILE_NAME
 from mlflow.store.artifact.s3_artifact_repo import S3ArtifactRepository
 from mlflow.utils.file_utils import read_yaml
@@ -59,6 +60,66 @@ def spark_df(spark_session):
     ).cache()
 
 
+@pytest.mark.usefixtures("enter_test_recipe_directory")
+def test_ingests_parquet_files_with_different_column_types(tmp_path):
+    dataset_path = tmp_path / "dataset"
+    dataset_path.mkdir()
+    pandas_df_part1 = pd.DataFrame({"A": ["x", "y"], "B": [1, 2]})
+    pandas_df_part2 = pd.DataFrame({"A": ["z"], "B": [3.0]})
+    pandas_df_part1.to_parquet(dataset_path / "df1.parquet")
+    pandas_df_part2.to_parquet(dataset_path / "df2.parquet")
+
+    with mock.patch.object(
+        _PandasConvertibleDataset, "_convert_to_parquet_in_memory"
+    ) as mock_convert_to_parquet_in_memory:
+        IngestStep.from_recipe_config(
+            recipe_config={
+                "target_col": "B",
+                "steps": {
+                    "ingest": {
+                        "using": "parquet",
+                        "location": str(dataset_path),
+                    }
+                },
+            },
+            recipe_root=os.getcwd(),
+        ).run(output_directory=tmp_path)
+
+    # Integers are promoted to floats, as by `pd.concat`, while streaming the files
+    mock_convert_to_parquet_in_memory.assert_not_called()
+    assert not any(name.startswith("tmp") for name in os.listdir(tmp_path))
+    reloaded_df = pd.read_parquet(str(tmp_path / "dataset.parquet"))
+    assert reloaded_df["B"].dtype == "float64"
+    pd.testing.assert_frame_equal(reloaded_df, pd.concat([pandas_df_part1, pandas_df_part2]))
+
+
+@pytest.mark.usefixtures("enter_test_recipe_directory")
+def test_ingests_single_file_without_storing_range_index(tmp_path):
+    import pyarrow.parquet as pq
+
+    dataset_path = tmp_path / "dataset"
+    dataset_path.mkdir()
+    pandas_df = pd.DataFrame({"A": ["x", "y", "z"], "B": [1, 2, 3]})
+    pandas_df.to_parquet(dataset_path / "df.parquet")
+
+    IngestStep.from_recipe_config(
+        recipe_config={
+            "target_col": "B",
+            "steps": {
+                "ingest": {
+                    "using": "parquet",
+                    "location": str(dataset_path / "df.parquet"),
+                }
+            },
+        },
+        recipe_root=os.getcwd(),
+    ).run(output_directory=tmp_path)
+
+    assert pq.read_schema(tmp_path / "dataset.parquet").names == ["A", "B"]
+    reloaded_df = pd.read_parquet(str(tmp_path / "dataset.parquet"))
+    pd.testing.assert_frame_equal(reloaded_df, pandas_df)
+
+
 @pytest.mark.parametrize("use_relative_path", [False, True])
 @pytest.mark.parametrize("multiple_files", [False, True])
 @pytest.mark.usefixtures("enter_test_recipe_directory")
@@ -134,6 +195,70 @@ def test_ingests_custom_format(pandas_df, tmp_recipe_root_path, tmp_path):
         pd.testing.assert_frame_equal(reloaded_df, pandas_df)
 
 
+def test_ingests_custom_format_files_with_different_schemas(tmp_recipe_root_path, tmp_path):
+    dataset_path = tmp_path / "dataset"
+    dataset_path.mkdir()
+    pandas_df_part1 = pd.DataFrame({"A": ["x", "y"], "B": [1, 2]})
+    pandas_df_part2 = pd.DataFrame({"A": ["z"], "B": [3.5], "C": [True]})
+    pandas_df_part1.to_csv(dataset_path / "df1.csv")
+    pandas_df_part2.to_csv(dataset_path / "df2.csv")
+
+    recipe_yaml = tmp_recipe_root_path.joinpath(_RECIPE_CONFIG_FILE_NAME)
+    recipe_yaml.write_text(
+        f"""
+        recipe: "regression/v1"
+        target_col: "B"
+        steps:
+            ingest:
+                skip_data_profiling: True
+                using: csv
+                location: {dataset_path}
+                loader_method: load_file_as_dataframe
+        """
+    )
+    tmp_recipe_root_path.joinpath("steps").mkdir(parents=True)
+
+    m_ingest = Mock()
+    m_ingest.load_file_as_dataframe = custom_load_csv
+    with mock.patch.dict("sys.modules", {"steps.ingest": m_ingest}):
+        recipe_config = read_yaml(tmp_recipe_root_path, _RECIPE_CONFIG_FILE_NAME)
+        ingest_step = IngestStep.from_recipe_config(recipe_config, str(tmp_recipe_root_path))
+        ingest_step.run(output_directory=tmp_path)
+
+        reloaded_df = pd.read_parquet(str(tmp_path / "dataset.parquet"))
+        pd.testing.assert_frame_equal(reloaded_df, pd.concat([pandas_df_part1, pandas_df_part2]))
+
+
+@pytest.mark.usefixtures("enter_test_recipe_directory")
+def test_ingests_parquet_files_in_batches(pandas_df, tmp_path, monkeypatch):
+    from mlflow.recipes.steps.ingest.datasets import ParquetDataset
+
+    monkeypatch.setattr(ParquetDataset, "_BATCH_SIZE", 1)
+    dataset_path = tmp_path / "dataset"
+    dataset_path.mkdir()
+    # Files with indexes stored as columns are streamed in batches
+    pandas_df = pandas_df.set_index("B")
+    pandas_df[:2].to_parquet(dataset_path / "df1.parquet")
+    pandas_df[2:].to_parquet(dataset_path / "df2.parquet")
+    pandas_df[:0].to_parquet(dataset_path / "df3.parquet")
+
+    IngestStep.from_recipe_config(
+        recipe_config={
+            "target_col": "C",
+            "steps": {
+                "ingest": {
+                    "using": "parquet",
+                    "location": str(dataset_path),
+                }
+            },
+        },
+        recipe_root=os.getcwd(),
+    ).run(output_directory=tmp_path)
+
+    reloaded_df = pd.read_parquet(str(tmp_path / "dataset.parquet"))
+    pd.testing.assert_frame_equal(reloaded_df, pandas_df)
+
+
 @pytest.mark.parametrize("use_relative_path", [False, True])
 @pytest.mark.parametrize("multiple_files", [False, True])
 @pytest.mark.parametrize("explicit_file_list", [False, True])
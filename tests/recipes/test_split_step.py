@@ -18,6 +18,8 @@ from mlflow.recipes.steps.split import (
     _get_split_df,
     _hash_pandas_dataframe,
     _make_elem_hashable,
+    _perform_split,
+    _run_split,
     _validate_user_code_output,
 )
 from mlflow.recipes.utils import _RECIPE_CONFIG_FILE_NAME
@@ -154,6 +156,28 @@ def test_get_split_df():
         assert test_df.v.tolist() == [20]
 
 
+def test_stratified_split_matches_split_of_each_class():
+    rng = np.random.default_rng(42)
+    dataset = pd.DataFrame(
+        {
+            "a": rng.integers(0, 1000, 300).astype("int32"),
+            "b": [str(i) for i in range(300)],
+            "y": rng.choice(["c2", "c0", "c1"], 300),
+        }
+    )
+    split_ratios = [0.6, 0.2, 0.2]
+
+    splits = _run_split("classification", dataset, split_ratios, "y")
+
+    class_splits = [
+        _perform_split(dataset[dataset.y == class_value], split_ratios)
+        for class_value in ["c0", "c1", "c2"]
+    ]
+    for split_df, expected_class_split_dfs in zip(splits, zip(*class_splits)):
+        pd.testing.assert_frame_equal(split_df, pd.concat(expected_class_split_dfs))
+    assert sum(len(split_df) for split_df in splits) == len(dataset)
+
+
 def test_from_recipe_config_fails_without_target_col(tmp_path, monkeypatch):
     monkeypatch.setenv(MLFLOW_RECIPES_EXECUTION_DIRECTORY.name, str(tmp_path))
     with mock.patch("mlflow.recipes.step.get_recipe_name", return_value="fake_name"):
@@ -0,0 +1,120 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from mlflow.server.auth.cache import AuthCache
+
+
+@pytest.fixture
+def cache():
+    return AuthCache(ttl_seconds=30, max_size=100)
+
+
+def test_authenticate_caches_successful_authentications(cache):
+    authenticate = mock.Mock(return_value=True)
+    for _ in range(3):
+        assert cache.authenticate("Basic dXNlcjpwYXNz", "user", authenticate)
+    authenticate.assert_called_once()
+
+
+def test_authenticate_does_not_cache_failed_authentications(cache):
+    authenticate = mock.Mock(return_value=False)
+    for _ in range(3):
+        assert not cache.authenticate("Basic dXNlcjp3cm9uZw==", "user", authenticate)
+    assert authenticate.call_count == 3
+
+
+def test_authenticate_does_not_store_credentials_in_plain_text(cache):
+    header = "Basic dXNlcjpwYXNz"
+    cache.authenticate(header, "user", lambda: True)
+    assert all(header.encode() not in key for key in cache._credentials._cache)
+
+
+def test_entries_expire_after_ttl():
+    cache = AuthCache(ttl_seconds=0.1, max_size=100)
+    loader = mock.Mock(return_value=True)
+    cache.get_is_admin("user", loader)
+    cache.get_is_admin("user", loader)
+    assert loader.call_count == 1
+    time.sleep(0.2)
+    cache.get_is_admin("user", loader)
+    assert loader.call_count == 2
+
+
+def test_cache_size_is_bounded():
+    cache = AuthCache(ttl_seconds=30, max_size=2)
+    for i in range(5):
+        cache.get_run_experiment_id(f"run{i}", lambda: "0")
+    assert len(cache._run_experiment_ids._cache) == 2
+
+
+@pytest.mark.parametrize(("ttl_seconds", "max_size"), [(0, 100), (30, 0)])
+def test_cache_can_be_disabled(ttl_seconds, max_size):
+    cache = AuthCache(ttl_seconds=ttl_seconds, max_size=max_size)
+    authenticate = mock.Mock(return_value=True)
+    loader = mock.Mock(return_value="READ")
+    for _ in range(2):
+        assert cache.authenticate("Basic dXNlcjpwYXNz", "user", authenticate)
+        assert cache.get_permission("experiment", "1", "user", loader) == "READ"
+    assert authenticate.call_count == 2
+    assert loader.call_count == 2
+    cache.invalidate_user("user")
+    cache.clear()
+
+
+def test_invalidate_user(cache):
+    cache.authenticate("Basic dXNlcjpwYXNz", "user", lambda: True)
+    cache.authenticate("Basic b3RoZXI6cGFzcw==", "other", lambda: True)
+    cache.get_is_admin("user", lambda: False)
+    cache.get_permission("experiment", "1", "user", lambda: "READ")
+    cache.get_permission("experiment", "1", "other", lambda: "READ")
+
+    cache.invalidate_user("user")
+
+    authenticate = mock.Mock(return_value=False)
+    assert not cache.authenticate("Basic dXNlcjpwYXNz", "user", authenticate)
+    authenticate.assert_called_once()
+    assert cache.get_is_admin("user", lambda: True)
+    assert cache.get_permission("experiment", "1", "user", lambda: "MANAGE") == "MANAGE"
+    # Entries of other users are kept
+    assert cache.authenticate("Basic b3RoZXI6cGFzcw==", "other", lambda: False)
+    assert cache.get_permission("experiment", "1", "other", lambda: "MANAGE") == "READ"
+
+
+def test_invalidate_permissions(cache):
+    cache.get_permission("experiment", "1", "user", lambda: "READ")
+    cache.get_permission("experiment", "1", "other", lambda: "READ")
+    cache.get_permission("experiment", "2", "user", lambda: "READ")
+    cache.get_permission("registered_model", "1", "user", lambda: "READ")
+
+    cache.invalidate_permissions("experiment", "1", "user")
+    assert cache.get_permission("experiment", "1", "user", lambda: "EDIT") == "EDIT"
+    assert cache.get_permission("experiment", "1", "other", lambda: "EDIT") == "READ"
+    assert cache.get_permission("experiment", "2", "user", lambda: "EDIT") == "READ"
+    assert cache.get_permission("registered_model", "1", "user", lambda: "EDIT") == "READ"
+
+    cache.invalidate_permissions("experiment", "1")
+    assert cache.get_permission("experiment", "1", "other", lambda: "EDIT") == "EDIT"
+
+
+def test_values_loaded_during_invalidation_are_not_cached(cache):
+    loading = threading.Event()
+    invalidated = threading.Event()
+
+    def stale_loader():
+        loading.set()
+        invalidated.wait()
+        return "READ"
+
+    thread = threading.Thread(
+        target=lambda: cache.get_permission("experiment", "1", "user", stale_loader)
+    )
+    thread.start()
+    loading.wait()
+    cache.invalidate_permissions("experiment", "1", "user")
+    invalidated.set()
+    thread.join()
+
+    assert cache.get_permission("experiment", "1", "user", lambda: "MANAGE") == "MANAGE"
@@ -0,0 +1,139 @@
+import time
+
+import pytest
+
+from mlflow.entities import Metric, Param
+from mlflow.exceptions import MlflowException
+from mlflow.server.metric_buffer import (
+    MetricBuffer,
+    MetricBufferingTrackingStore,
+    create_metric_buffering_store,
+)
+from mlflow.store.tracking.file_store import FileStore
+from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+from mlflow.utils.os import is_windows
+
+
+@pytest.fixture
+def store(tmp_path):
+    artifact_dir = tmp_path / "artifacts"
+    artifact_dir.mkdir()
+    return SqlAlchemyStore(f"sqlite:///{tmp_path / 'mlflow.db'}", artifact_dir.as_uri())
+
+
+@pytest.fixture
+def run_id(store):
+    experiment_id = store.create_experiment("test")
+    return store.create_run(experiment_id, "user", 0, [], "run").info.run_id
+
+
+@pytest.fixture
+def metric_buffer(store, tmp_path):
+    metric_buffer = MetricBuffer(store, tmp_path / "wal", flush_interval=60)
+    yield metric_buffer
+    metric_buffer.shutdown()
+
+
+@pytest.fixture
+def buffering_store(store, metric_buffer):
+    return MetricBufferingTrackingStore(store, metric_buffer)
+
+
+def _history(store, run_id, key="m"):
+    return sorted((m.step, m.value) for m in store.get_metric_history(run_id, key))
+
+
+def test_metrics_are_buffered_and_read_back(store, buffering_store, run_id):
+    buffering_store.log_metric(run_id, Metric("m", 1.0, 0, 0))
+    buffering_store.log_batch(run_id, [Metric("m", 2.0, 0, 1)], [], [])
+    assert _history(store, run_id) == []
+
+    assert _history(buffering_store, run_id) == [(0, 1.0), (1, 2.0)]
+    assert _history(store, run_id) == [(0, 1.0), (1, 2.0)]
+
+    buffering_store.log_metric(run_id, Metric("m", 3.0, 0, 2))
+    assert buffering_store.get_run(run_id).data.metrics == {"m": 3.0}
+    buffering_store.log_metric(run_id, Metric("m", 4.0, 0, 3))
+    experiment_id = store.get_run(run_id).info.experiment_id
+    (run,) = buffering_store.search_runs([experiment_id], None, 1)
+    assert run.data.metrics == {"m": 4.0}
+
+
+def test_params_are_logged_immediately_and_invalid_metrics_are_rejected(
+    store, buffering_store, run_id
+):
+    buffering_store.log_batch(run_id, [Metric("m", 1.0, 0, 0)], [Param("p", "a")], [])
+    assert store.get_run(run_id).data.params == {"p": "a"}
+    assert _history(store, run_id) == []
+
+    with pytest.raises(MlflowException, match="Got invalid value"):
+        buffering_store.log_batch(run_id, [Metric("m", "x", 0, 0)], [Param("q", "b")], [])
+    assert "q" not in store.get_run(run_id).data.params
+
+
+def test_metrics_of_inactive_runs_are_rejected(store, buffering_store, run_id):
+    store.delete_run(run_id)
+    with pytest.raises(MlflowException, match="must be in the 'active' state"):
+        buffering_store.log_metric(run_id, Metric("m", 1.0, 0, 0))
+
+
+def test_metrics_are_flushed_when_the_buffer_is_full(store, tmp_path, run_id):
+    metric_buffer = MetricBuffer(store, tmp_path / "wal", flush_interval=60, max_size=3)
+    try:
+        metric_buffer.log_metrics(run_id, [Metric("m", float(i), 0, i) for i in range(3)])
+        deadline = time.time() + 10
+        while not _history(store, run_id) and time.time() < deadline:
+            time.sleep(0.05)
+        assert len(_history(store, run_id)) == 3
+    finally:
+        metric_buffer.shutdown()
+    # Segments are removed once their metrics are written
+    assert list((tmp_path / "wal").iterdir()) == []
+
+
+@pytest.mark.skipif(is_windows(), reason="Orphaned segments are only detected with file locks")
+def test_metrics_of_crashed_processes_are_replayed(store, tmp_path, run_id):
+    crashed_buffer = MetricBuffer(store, tmp_path / "wal", flush_interval=60)
+    crashed_buffer.log_metrics(run_id, [Metric("m", 1.0, 0, 0), Metric("m", 2.0, 0, 1)])
+    # Metrics already written before the crash are ignored when they are replayed
+    crashed_buffer.flush_runs([run_id])
+    crashed_buffer.log_metrics(run_id, [Metric("m", 3.0, 0, 2)])
+    # Simulate a crash, which releases the lock of the segment without writing the buffer
+    with crashed_buffer._lock:
+        crashed_buffer._stopped = True
+        crashed_buffer._flush_requested.notify()
+    crashed_buffer._wal.close()
+    assert _history(store, run_id) == [(0, 1.0), (1, 2.0)]
+
+    metric_buffer = MetricBuffer(store, tmp_path / "wal", flush_interval=60)
+    try:
+        assert _history(store, run_id) == [(0, 1.0), (1, 2.0), (2, 3.0)]
+        assert list((tmp_path / "wal").iterdir()) == [metric_buffer._wal.current_segment]
+    finally:
+        metric_buffer.shutdown()
+
+
+def test_tracking_server_buffers_metrics_when_enabled(tmp_path, monkeypatch):
+    from mlflow.server import handlers
+
+    monkeypatch.setenv("MLFLOW_SERVER_ENABLE_METRIC_BUFFERING", "true")
+    monkeypatch.setenv("MLFLOW_SERVER_METRIC_BUFFER_DIR", str(tmp_path / "wal"))
+    monkeypatch.setattr(handlers, "_tracking_store", None)
+    store = handlers._get_tracking_store(
+        f"sqlite:///{tmp_path / 'mlflow.db'}", (tmp_path / "artifacts").as_uri()
+    )
+    try:
+        assert isinstance(store, MetricBufferingTrackingStore)
+        assert isinstance(store._store, SqlAlchemyStore)
+        # Write-ahead logs are kept in a directory specific to the store
+        assert [p.parent.parent for p in (tmp_path / "wal").glob("*/*.wal")] == [tmp_path / "wal"]
+    finally:
+        store.metric_buffer.shutdown()
+
+
+def test_metric_buffering_requires_sql_store(tmp_path, monkeypatch):
+    monkeypatch.setenv("MLFLOW_SERVER_METRIC_BUFFER_DIR", str(tmp_path / "wal"))
+    store = FileStore(str(tmp_path / "mlruns"))
+    with pytest.raises(MlflowException, match="only supported by database-backed tracking stores"):
+        create_metric_buffering_store(store, str(tmp_path / "mlruns"))
+    assert not (tmp_path / "wal").exists()
@@ -0,0 +1,216 @@
+import os
+import stat
+from unittest import mock
+
+import pytest
+
+from mlflow.store.artifact import artifact_cache
+from mlflow.store.artifact.artifact_cache import ArtifactCache, get_artifact_cache
+from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
+from mlflow.store.artifact.models_artifact_repo import ModelsArtifactRepository
+from mlflow.store.artifact.runs_artifact_repo import RunsArtifactRepository
+
+
+class CountingArtifactRepository(ArtifactRepository):
+    """
+    A repository of local artifacts which records the files it downloads.
+    """
+
+    def __init__(self, artifact_uri):
+        super().__init__(artifact_uri)
+        self.local_repo = LocalArtifactRepository(artifact_uri)
+        self.downloaded_files = []
+
+    def log_artifact(self, local_file, artifact_path=None):
+        self.local_repo.log_artifact(local_file, artifact_path)
+
+    def log_artifacts(self, local_dir, artifact_path=None):
+        self.local_repo.log_artifacts(local_dir, artifact_path)
+
+    def list_artifacts(self, path=None):
+        return self.local_repo.list_artifacts(path)
+
+    def _download_file(self, remote_file_path, local_path):
+        self.downloaded_files.append(remote_file_path)
+        self.local_repo._download_file(remote_file_path, local_path)
+
+
+@pytest.fixture
+def artifact_root(tmp_path):
+    root = tmp_path.joinpath("artifacts")
+    root.joinpath("model", "data").mkdir(parents=True)
+    root.joinpath("model", "MLmodel").write_text("flavors: {}")
+    root.joinpath("model", "data", "weights.bin").write_bytes(b"\x00" * 1000)
+    return root
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path.joinpath("cache")
+    monkeypatch.setenv("MLFLOW_ARTIFACT_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+def _download(repo, artifact_path, dst_path, model_version=1):
+    dst_path.mkdir(exist_ok=True)
+    return artifact_cache.download_model_version_artifacts(
+        repo, "model", model_version, artifact_path, str(dst_path)
+    )
+
+
+def test_get_artifact_cache(cache_dir, monkeypatch):
+    monkeypatch.setenv("MLFLOW_ARTIFACT_CACHE_MAX_SIZE", "1000")
+    cache = get_artifact_cache()
+    assert cache.cache_dir == str(cache_dir)
+    assert cache.max_size == 1000
+
+    monkeypatch.delenv("MLFLOW_ARTIFACT_CACHE_DIR")
+    assert get_artifact_cache() is None
+
+
+def test_download_artifacts_caches_files(artifact_root, cache_dir, tmp_path):
+    repo = CountingArtifactRepository(str(artifact_root))
+    first = _download(repo, "model", tmp_path.joinpath("first"))
+    assert sorted(repo.downloaded_files) == ["model/MLmodel", "model/data/weights.bin"]
+
+    repo.downloaded_files.clear()
+    second = _download(repo, "model", tmp_path.joinpath("second"))
+    assert repo.downloaded_files == []
+    for path in ["MLmodel", os.path.join("data", "weights.bin")]:
+        with open(os.path.join(first, path), "rb") as f1, open(
+            os.path.join(second, path), "rb"
+        ) as f2:
+            assert f1.read() == f2.read()
+
+    # Single files are served from the cache too
+    single = _download(repo, "model/data/weights.bin", tmp_path.joinpath("single"))
+    assert repo.downloaded_files == []
+    assert os.path.getsize(single) == 1000
+
+
+def test_download_artifacts_without_cache_dir(artifact_root, tmp_path):
+    repo = CountingArtifactRepository(str(artifact_root))
+    _download(repo, "model", tmp_path.joinpath("first"))
+    _download(repo, "model", tmp_path.joinpath("second"))
+    assert len(repo.downloaded_files) == 4
+
+
+def test_download_artifacts_does_not_cache_local_repositories(artifact_root, cache_dir, tmp_path):
+    repo = LocalArtifactRepository(str(artifact_root))
+    with mock.patch.object(artifact_cache, "CachingArtifactRepository") as caching_repo:
+        _download(repo, "model", tmp_path.joinpath("dst"))
+    caching_repo.assert_not_called()
+
+
+def test_download_artifacts_downloads_modified_files(artifact_root, cache_dir, tmp_path):
+    repo = CountingArtifactRepository(str(artifact_root))
+    _download(repo, "model", tmp_path.joinpath("first"))
+    artifact_root.joinpath("model", "data", "weights.bin").write_bytes(b"\x01" * 2000)
+
+    repo.downloaded_files.clear()
+    dst = _download(repo, "model", tmp_path.joinpath("second"))
+    assert repo.downloaded_files == ["model/data/weights.bin"]
+    with open(os.path.join(dst, "data", "weights.bin"), "rb") as f:
+        assert f.read() == b"\x01" * 2000
+
+
+def test_download_artifacts_does_not_share_files_between_model_versions(
+    artifact_root, cache_dir, tmp_path
+):
+    repo = CountingArtifactRepository(str(artifact_root))
+    _download(repo, "model", tmp_path.joinpath("first"), model_version=1)
+    # Same URIs and sizes, but different contents
+    artifact_root.joinpath("model", "data", "weights.bin").write_bytes(b"\x01" * 1000)
+
+    repo.downloaded_files.clear()
+    dst = _download(repo, "model", tmp_path.joinpath("second"), model_version=2)
+    assert sorted(repo.downloaded_files) == ["model/MLmodel", "model/data/weights.bin"]
+    with open(os.path.join(dst, "data", "weights.bin"), "rb") as f:
+        assert f.read() == b"\x01" * 1000
+
+
+def test_downloaded_files_are_writable_copies(artifact_root, cache_dir, tmp_path):
+    repo = CountingArtifactRepository(str(artifact_root))
+    _download(repo, "model", tmp_path.joinpath("first"))
+    dst = _download(repo, "model", tmp_path.joinpath("second"))
+    assert sorted(repo.downloaded_files) == ["model/MLmodel", "model/data/weights.bin"]
+
+    weights_path = os.path.join(dst, "data", "weights.bin")
+    cached_paths = [
+        os.path.join(root, name)
+        for root, _, files in os.walk(cache_dir.joinpath("objects"))
+        for name in files
+    ]
+    assert len(cached_paths) == 2
+    for path in cached_paths:
+        assert stat.S_IMODE(os.stat(path).st_mode) & 0o222 == 0
+        assert not os.path.samefile(path, weights_path)
+
+    with open(weights_path, "wb") as f:
+        f.write(b"\x02" * 1000)
+    third = _download(repo, "model", tmp_path.joinpath("third"))
+    with open(os.path.join(third, "data", "weights.bin"), "rb") as f:
+        assert f.read() == b"\x00" * 1000
+
+
+def test_evict_removes_least_recently_used_files(tmp_path):
+    cache = ArtifactCache(str(tmp_path.joinpath("cache")), max_size=2500)
+    for i, name in enumerate(["a", "b", "c"]):
+        src = tmp_path.joinpath(name)
+        src.write_bytes(b"\x00" * 1000)
+        key = ArtifactCache.get_key("model", 1, f"s3://bucket/{name}", 1000)
+        cache.get_or_download(key, 1000, lambda p, s=src: os.link(s, p), str(tmp_path / f"{name}1"))
+        os.utime(cache._get_object_path(key), (i, i))
+
+    # Use "a" again, so that "b" becomes the least recently used file
+    key_a = ArtifactCache.get_key("model", 1, "s3://bucket/a", 1000)
+    download = mock.Mock()
+    assert not cache.get_or_download(key_a, 1000, download, str(tmp_path / "a2"))
+    download.assert_not_called()
+
+    cache.evict()
+    remaining = {
+        name
+        for name in ["a", "b", "c"]
+        if os.path.exists(
+            cache._get_object_path(ArtifactCache.get_key("model", 1, f"s3://bucket/{name}", 1000))
+        )
+    }
+    assert remaining == {"a", "c"}
+
+
+def test_models_artifact_repository_downloads_through_cache(artifact_root, cache_dir, tmp_path):
+    underlying_repo = CountingArtifactRepository(str(artifact_root))
+    with mock.patch.object(
+        ModelsArtifactRepository,
+        "_get_model_uri_infos",
+        return_value=("model", "1", str(artifact_root)),
+    ), mock.patch(
+        "mlflow.store.artifact.artifact_repository_registry.get_artifact_repository",
+        return_value=underlying_repo,
+    ):
+        repo = ModelsArtifactRepository("models:/model/1")
+    for dst in ["first", "second"]:
+        tmp_path.joinpath(dst).mkdir()
+        repo.download_artifacts("model", str(tmp_path.joinpath(dst)))
+    assert len(underlying_repo.downloaded_files) == 2
+
+
+def test_runs_artifact_repository_does_not_download_through_cache(
+    artifact_root, cache_dir, tmp_path
+):
+    underlying_repo = CountingArtifactRepository(str(artifact_root))
+    with mock.patch(
+        "mlflow.store.artifact.runs_artifact_repo.RunsArtifactRepository.get_underlying_uri",
+        return_value=str(artifact_root),
+    ), mock.patch(
+        "mlflow.store.artifact.artifact_repository_registry.get_artifact_repository",
+        return_value=underlying_repo,
+    ):
+        repo = RunsArtifactRepository("runs:/1234")
+    for dst in ["first", "second"]:
+        tmp_path.joinpath(dst).mkdir()
+        repo.download_artifacts("model", str(tmp_path.joinpath(dst)))
+    assert len(underlying_repo.downloaded_files) == 4
+    assert not cache_dir.exists()
@@ -218,3 +218,39 @@ def test_trace_data(local_artifact_repo):
     mock_trace_data = {"spans": [], "request": {"test": 1}, "response": {"test": 2}}
     local_artifact_repo.upload_trace_data(json.dumps(mock_trace_data))
     assert local_artifact_repo.download_trace_data() == mock_trace_data
+
+
+def test_open_read_stream(local_artifact_repo, local_artifact_root):
+    os.makedirs(os.path.join(local_artifact_root, "dir"))
+    with open(os.path.join(local_artifact_root, "dir", "a.txt"), "wb") as f:
+        f.write(b"0123456789")
+
+    with local_artifact_repo.open_read_stream("dir/a.txt") as stream:
+        assert stream.size == 10
+        assert stream.read() == b"0123456789"
+
+    with local_artifact_repo.open_read_stream("dir/a.txt", offset=2, length=5) as stream:
+        assert stream.size == 10
+        assert stream.read(3) == b"234"
+        assert stream.read() == b"56"
+
+
+def test_open_write_stream(local_artifact_repo, local_artifact_root):
+    with local_artifact_repo.open_write_stream("dir/a.txt") as f:
+        f.write(b"01234")
+        f.write(b"56789")
+    assert os.listdir(os.path.join(local_artifact_root, "dir")) == ["a.txt"]
+    with open(os.path.join(local_artifact_root, "dir", "a.txt"), "rb") as f:
+        assert f.read() == b"0123456789"
+
+    def write_and_fail():
+        with local_artifact_repo.open_write_stream("dir/a.txt") as f:
+            f.write(b"abc")
+            raise ValueError("interrupted")
+
+    with pytest.raises(ValueError, match="interrupted"):
+        write_and_fail()
+    # The existing artifact is left untouched and no temporary file is left behind
+    assert os.listdir(os.path.join(local_artifact_root, "dir")) == ["a.txt"]
+    with open(os.path.join(local_artifact_root, "dir", "a.txt"), "rb") as f:
+        assert f.read() == b"0123456789"
@@ -438,3 +438,48 @@ def test_trace_data(s3_artifact_root):
     mock_trace_data = {"spans": [], "request": {"test": 1}, "response": {"test": 2}}
     repo.upload_trace_data(json.dumps(mock_trace_data))
     assert repo.download_trace_data() == mock_trace_data
+
+
+def test_open_read_stream(s3_artifact_repo, tmp_path):
+    file_path = tmp_path.joinpath("a.txt")
+    file_path.write_bytes(b"0123456789")
+    s3_artifact_repo.log_artifact(file_path, "dir")
+
+    with s3_artifact_repo.open_read_stream("dir/a.txt") as stream:
+        assert stream.size == 10
+        assert stream.read() == b"0123456789"
+
+    with s3_artifact_repo.open_read_stream("dir/a.txt", offset=2, length=5) as stream:
+        assert stream.size == 10
+        assert stream.read() == b"23456"
+
+
+def test_open_write_stream(s3_artifact_repo, s3_artifact_root, monkeypatch):
+    if isinstance(s3_artifact_repo, OptimizedS3ArtifactRepository):
+        pytest.skip("OptimizedS3ArtifactRepository uses the default implementation")
+    # Recent botocore versions upload non-seekable streams with `aws-chunked` content encoding
+    # when computing checksums, which moto doesn't decode
+    monkeypatch.setenv("AWS_REQUEST_CHECKSUM_CALCULATION", "when_required")
+
+    # Large enough to be uploaded as a multipart upload
+    chunk = os.urandom(1024 * 1024)
+    with s3_artifact_repo.open_write_stream("dir/model.bin") as f:
+        for _ in range(10):
+            f.write(chunk)
+    with open(s3_artifact_repo.download_artifacts("dir/model.bin"), "rb") as f:
+        assert f.read() == chunk * 10
+
+    def write_and_fail():
+        with s3_artifact_repo.open_write_stream("dir/a.txt") as f:
+            f.write(b"abc")
+            raise ValueError("interrupted")
+
+    with pytest.raises(ValueError, match="interrupted"):
+        write_and_fail()
+    assert [a.path for a in s3_artifact_repo.list_artifacts("dir")] == ["dir/model.bin"]
+
+    with s3_artifact_repo.open_write_stream("a.txt") as f:
+        f.write(b"abc")
+    bucket, _ = s3_artifact_repo.parse_s3_compliant_uri(s3_artifact_root)
+    response = s3_artifact_repo._get_s3_client().head_object(Bucket=bucket, Key="some/path/a.txt")
+    assert response.get("ContentType") == "text/plain"
@@ -1,4 +1,5 @@
 import json
+import math
 import os
 import posixpath
 import random
@@ -11,6 +12,8 @@ from pathlib import Path
 from typing import List, NamedTuple
 from unittest import mock
 
+import pandas as pd
+import pyarrow as pa
 import pytest
 
 import mlflow
@@ -40,7 +43,10 @@ from mlflow.protos.databricks_pb2 import (
 )
 from mlflow.store.entities.paged_list import PagedList
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
+from mlflow.store.tracking.abstract_store import AbstractStore
 from mlflow.store.tracking.file_store import FileStore
+from mlflow.store.tracking.file_store_metrics import get_metric_file_format
+from mlflow.store.tracking.file_store_run_index import RunIndex
 from mlflow.tracing.constant import TraceMetadataKey, TraceTagKey
 from mlflow.tracking._tracking_service.utils import _use_tracking_uri
 from mlflow.utils import insecure_hash
@@ -1063,6 +1069,177 @@ def test_get_metric_history(store):
                     assert metric.value == metric_value
 
 
+def test_get_sampled_metric_history(store):
+    run_id1 = store.create_run(FileStore.DEFAULT_EXPERIMENT_ID, "user", 0, [], "name").info.run_id
+    run_id2 = store.create_run(FileStore.DEFAULT_EXPERIMENT_ID, "user", 0, [], "name").info.run_id
+    values = [1.0] * 100
+    values[37] = 100.0
+    values[58] = -100.0
+    values[70] = float("nan")
+    metrics = [Metric("loss", value, 0, step) for step, value in enumerate(values)]
+    # multiple values logged at the same step are all returned
+    metrics.append(Metric("loss", 2.0, 1, 37))
+    store.log_batch(run_id1, metrics=metrics, params=[], tags=[])
+    store.log_batch(
+        run_id2,
+        metrics=[Metric("loss", float(step), 0, step) for step in range(50)],
+        params=[],
+        tags=[],
+    )
+
+    # 2 buckets of 50 steps, and the last step
+    sampled = store.get_sampled_metric_history([run_id2, run_id1], "loss", max_points=7)
+    assert [(m.run_id, m.step, m.timestamp) for m in sampled] == [
+        (run_id2, 0, 0),
+        (run_id2, 49, 0),
+        (run_id1, 0, 0),
+        (run_id1, 37, 0),
+        (run_id1, 37, 1),
+        (run_id1, 50, 0),
+        (run_id1, 58, 0),
+        (run_id1, 99, 0),
+    ]
+    assert sampled == AbstractStore.get_sampled_metric_history(
+        store, [run_id2, run_id1], "loss", max_points=7
+    )
+
+    # at most `max_points` steps are returned per run
+    for max_points in range(1, 12):
+        sampled = store.get_sampled_metric_history([run_id1], "loss", max_points=max_points)
+        assert 0 < len({m.step for m in sampled}) <= max_points
+        assert sampled[-1].step == 99
+        assert sampled == AbstractStore.get_sampled_metric_history(
+            store, [run_id1], "loss", max_points=max_points
+        )
+
+    sampled = store.get_sampled_metric_history(
+        [run_id1], "loss", start_step=70, end_step=79, max_points=4
+    )
+    assert [m.step for m in sampled] == [70, 71, 79]
+    assert math.isnan(sampled[0].value)
+
+    # runs with at most `max_points` steps in the range aren't downsampled
+    sampled = store.get_sampled_metric_history(
+        [run_id2], "loss", start_step=10, end_step=14, max_points=5
+    )
+    assert [m.step for m in sampled] == [10, 11, 12, 13, 14]
+    sampled = store.get_sampled_metric_history([run_id2], "loss", start_step=10, end_step=14)
+    assert [m.step for m in sampled] == [10, 11, 12, 13, 14]
+    assert store.get_sampled_metric_history([run_id1], "missing", max_points=5) == []
+
+
+def test_export_metrics(store):
+    run_id1 = store.create_run(FileStore.DEFAULT_EXPERIMENT_ID, "user", 0, [], "name").info.run_id
+    run_id2 = store.create_run(FileStore.DEFAULT_EXPERIMENT_ID, "user", 0, [], "name").info.run_id
+    store.log_batch(
+        run_id1,
+        metrics=[
+            Metric("loss", 3.0, 2, 1),
+            Metric("loss", 1.0, 1, 0),
+            Metric("loss", float("nan"), 0, 1),
+            Metric("acc", 0.5, 0, 5),
+        ],
+        params=[],
+        tags=[],
+    )
+    # Metric files written by MLflow < 1.0 don't contain steps
+    run_dir = store._get_run_dir(FileStore.DEFAULT_EXPERIMENT_ID, run_id2)
+    with open(os.path.join(run_dir, FileStore.METRICS_FOLDER_NAME, "legacy"), "w") as f:
+        f.write("10 0.1\n20 0.2\n")
+
+    run_ids = [run_id2, run_id1]
+    df = pa.Table.from_batches(store.export_metrics(run_ids)).to_pandas()
+    expected = pd.DataFrame(
+        sorted(
+            [
+                (run_id1, "acc", 5, 0, 0.5),
+                (run_id1, "loss", 0, 1, 1.0),
+                (run_id1, "loss", 1, 0, float("nan")),
+                (run_id1, "loss", 1, 2, 3.0),
+                (run_id2, "legacy", 0, 10, 0.1),
+                (run_id2, "legacy", 0, 20, 0.2),
+            ],
+            key=lambda r: r[:4],
+        ),
+        columns=["run_id", "key", "step", "timestamp", "value"],
+    )
+    pd.testing.assert_frame_equal(df, expected)
+    default_batches = AbstractStore.export_metrics(store, run_ids)
+    pd.testing.assert_frame_equal(pa.Table.from_batches(default_batches).to_pandas(), expected)
+
+    table = pa.Table.from_batches(store.export_metrics(run_ids, ["loss", "missing"], (1, 3)))
+    assert table.column("step").to_pylist() == [1, 1]
+    assert table.column("value").to_pylist()[1] == 3.0
+
+    with pytest.raises(MlflowException, match="not found"):
+        list(store.export_metrics(["0" * 32]))
+
+
+def test_binary_metric_format(store, monkeypatch):
+    monkeypatch.setenv("MLFLOW_FILE_STORE_METRIC_FORMAT", "text")
+    run_id = store.create_run(FileStore.DEFAULT_EXPERIMENT_ID, "user", 0, [], "name").info.run_id
+    store.log_metric(run_id, Metric("text", 1.0, 0, 0))
+
+    monkeypatch.setenv("MLFLOW_FILE_STORE_METRIC_FORMAT", "binary")
+    metrics = [Metric("loss", float(step % 7), step, step) for step in range(100)]
+    metrics.append(Metric("loss", float("nan"), 100, 99))
+    store.log_batch(run_id, metrics=metrics[:50], params=[], tags=[])
+    store.log_batch(run_id, metrics=metrics[50:], params=[], tags=[])
+    # Values logged to existing metric files are written in the format of the file
+    store.log_metric(run_id, Metric("text", 2.0, 1, 1))
+
+    def metric_format(key):
+        return get_metric_file_format(store._get_metric_path("0", run_id, key))
+
+    assert metric_format("loss") == "binary"
+    assert metric_format("text") == "text"
+    history = store.get_metric_history(run_id, "loss")
+    assert [(m.key, m.timestamp, m.step) for m in history] == [
+        (m.key, m.timestamp, m.step) for m in metrics
+    ]
+    assert [m.value for m in history[:-1]] == [m.value for m in metrics[:-1]]
+    assert math.isnan(history[-1].value)
+    latest = store.get_run(run_id).data._metric_objs
+    assert sorted((m.key, m.step, m.timestamp) for m in latest) == [
+        ("loss", 99, 100),
+        ("text", 1, 1),
+    ]
+    table = pa.Table.from_batches(store.export_metrics([run_id], ["loss"], (10, 12)))
+    assert table.column("value").to_pylist() == [3.0, 4.0, 5.0]
+    sampled = store.get_sampled_metric_history([run_id], "loss", start_step=10, end_step=12)
+    assert [m.value for m in sampled] == [3.0, 4.0, 5.0]
+
+    # A trailing partial record left by an interrupted write is ignored
+    with open(store._get_metric_path("0", run_id, "loss"), "ab") as f:
+        f.write(b"\x00" * 10)
+    assert len(store.get_metric_history(run_id, "loss")) == 101
+
+    monkeypatch.setenv("MLFLOW_FILE_STORE_METRIC_FORMAT", "parquet")
+    with pytest.raises(MlflowException, match="Invalid value 'parquet'"):
+        store.log_metric(run_id, Metric("other", 1.0, 0, 0))
+
+
+def test_convert_metric_files(store, monkeypatch):
+    monkeypatch.setenv("MLFLOW_FILE_STORE_METRIC_FORMAT", "text")
+    run_id = store.create_run(FileStore.DEFAULT_EXPERIMENT_ID, "user", 0, [], "name").info.run_id
+    store.log_batch(
+        run_id, metrics=[Metric("a/b", 0.5, 1, 2), Metric("c", 1.5, 3, 4)], params=[], tags=[]
+    )
+    store.delete_run(run_id)
+    metrics = store.get_run(run_id).data.metrics
+
+    assert store._convert_metric_files("binary") == 2
+    assert get_metric_file_format(store._get_metric_path("0", run_id, "a/b")) == "binary"
+    assert store._convert_metric_files("binary") == 0
+    assert store.get_run(run_id).data.metrics == metrics
+    assert store._convert_metric_files("text", experiment_ids=["0"]) == 2
+    assert store.get_metric_history(run_id, "c") == [Metric("c", 1.5, 3, 4)]
+    run_dir = store._get_run_dir("0", run_id)
+    assert sorted(os.listdir(run_dir)) == sorted(
+        ["artifacts", "meta.yaml", "metrics", "params", "tags"]
+    )
+
+
 def test_get_metric_history_paginated_request_raises(store):
     with pytest.raises(
         MlflowException,
@@ -1360,6 +1537,60 @@ def test_search_runs_start_time_alias(store):
     assert result == []
 
 
+def test_search_runs_with_run_index(store, monkeypatch):
+    monkeypatch.setenv("MLFLOW_FILE_STORE_RUN_INDEX", "true")
+    exp_id = store.create_experiment("run index")
+    run1 = store.create_run(exp_id, "user", 1, [], "run1").info.run_id
+    run2 = store.create_run(exp_id, "user", 2, [], "run2").info.run_id
+    store.log_batch(
+        run1, metrics=[Metric("m", 1.0, 0, 1)], params=[Param("p", "a")], tags=[RunTag("t", "x")]
+    )
+    assert _search(store, exp_id, "metrics.m = 1") == [run1]
+    run_index = RunIndex(store._get_experiment_path(exp_id))
+    assert run_index.exists()
+    assert {r.info.run_id for r in run_index.get_runs()} == {run1, run2}
+
+    # Writes are applied to the index incrementally
+    store.log_metric(run1, Metric("m", 0.5, 0, 0))
+    store.log_metric(run2, Metric("m", 3.0, 0, 0))
+    store.log_param(run2, Param("p", "b"))
+    store.set_tag(run2, RunTag("t", "y"))
+    store.delete_tag(run1, "t")
+    store.update_run_info(run2, RunStatus.FINISHED, 10, "renamed")
+    runs = {r.info.run_id: r for r in run_index.get_runs()}
+    assert runs[run1].data.metrics == {"m": 1.0}
+    assert "t" not in runs[run1].data.tags
+    assert runs[run2].data.metrics == {"m": 3.0}
+    assert runs[run2].data.params == {"p": "b"}
+    assert runs[run2].data.tags["t"] == "y"
+    assert runs[run2].info.run_name == "renamed"
+    assert runs[run2].info.status == "FINISHED"
+
+    assert _search(store, exp_id, "metrics.m > 2") == [run2]
+    assert _search(store, exp_id, "tags.t = 'y'") == [run2]
+    assert _search(store, exp_id, "attributes.run_name = 'renamed'") == [run2]
+    store.delete_run(run2)
+    assert _search(store, exp_id, run_view_type=ViewType.ACTIVE_ONLY) == [run1]
+    assert _search(store, exp_id, run_view_type=ViewType.DELETED_ONLY) == [run2]
+
+    # Runs created or removed without going through the index are reconciled lazily
+    store._hard_delete_run(run2)
+    with mock.patch.object(RunIndex, "exists", return_value=False):
+        run3 = store.create_run(exp_id, "user", 3, [], "run3").info.run_id
+    assert set(_search(store, exp_id)) == {run1, run3}
+
+    # Results match the ones obtained without the index, including dataset inputs
+    dataset = Dataset(name="ds", digest="digest", source_type="st", source="source")
+    store.log_inputs(run3, [DatasetInput(dataset, [])])
+    indexed = store.search_runs([exp_id], None, ViewType.ALL)
+    assert [len(r.inputs.dataset_inputs) for r in indexed] == [1, 0]
+    assert _search(store, exp_id, "dataset.name = 'ds'") == [run3]
+    monkeypatch.delenv("MLFLOW_FILE_STORE_RUN_INDEX")
+    assert [r.to_dictionary() for r in store.search_runs([exp_id], None, ViewType.ALL)] == [
+        r.to_dictionary() for r in indexed
+    ]
+
+
 def test_search_runs_datasets(store):
     exp_id = store.create_experiment("12345dataset")
 
@@ -1901,7 +2132,7 @@ def test_log_batch_internal_error(store):
         raise Exception("Some internal error")
 
     with mock.patch(
-        FILESTORE_PACKAGE + ".FileStore._log_run_metric"
+        FILESTORE_PACKAGE + ".FileStore._log_run_metrics"
     ) as log_metric_mock, mock.patch(
         FILESTORE_PACKAGE + ".FileStore._log_run_param"
     ) as log_param_mock, mock.patch(FILESTORE_PACKAGE + ".FileStore._set_run_tag") as set_tag_mock:
@@ -12,6 +12,8 @@ from pathlib import Path
 from typing import List, Union
 from unittest import mock
 
+import pandas as pd
+import pyarrow as pa
 import pytest
 import sqlalchemy
 from packaging.version import Version
@@ -49,6 +51,7 @@ from mlflow.store.db.utils import (
     _get_schema_version,
 )
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
+from mlflow.store.tracking.abstract_store import AbstractStore
 from mlflow.store.tracking.dbmodels import models
 from mlflow.store.tracking.dbmodels.models import (
     SqlDataset,
@@ -76,6 +79,7 @@ from mlflow.utils.mlflow_tags import (
 )
 from mlflow.utils.name_utils import _GENERATOR_PREDICATES
 from mlflow.utils.os import is_windows
+from mlflow.utils.search_utils import SearchUtils
 from mlflow.utils.time import get_current_time_millis
 from mlflow.utils.uri import extract_db_type_from_uri
 
@@ -1063,6 +1067,66 @@ def test_log_metric_allows_multiple_values_at_same_ts_and_run_data_uses_max_ts_v
     assert metric_obj.value == 20
 
 
+def test_get_sampled_metric_history(store: SqlAlchemyStore):
+    exp_id = _create_experiments(store, "sampled metric history")
+    run_id1 = _run_factory(store, _get_run_configs(exp_id)).info.run_id
+    run_id2 = _run_factory(store, _get_run_configs(exp_id)).info.run_id
+    values = [1.0] * 100
+    values[37] = 100.0
+    values[58] = -100.0
+    values[70] = float("nan")
+    metrics = [Metric("loss", value, 0, step) for step, value in enumerate(values)]
+    # multiple values logged at the same step are all returned
+    metrics.append(Metric("loss", 2.0, 1, 37))
+    store.log_batch(run_id1, metrics=metrics, params=[], tags=[])
+    store.log_batch(
+        run_id2,
+        metrics=[Metric("loss", float(step), 0, step) for step in range(50)],
+        params=[],
+        tags=[],
+    )
+
+    # 2 buckets of 50 steps, and the last step
+    sampled = store.get_sampled_metric_history([run_id2, run_id1], "loss", max_points=7)
+    assert [(m.run_id, m.step, m.timestamp) for m in sampled] == [
+        (run_id2, 0, 0),
+        (run_id2, 49, 0),
+        (run_id1, 0, 0),
+        (run_id1, 37, 0),
+        (run_id1, 37, 1),
+        (run_id1, 50, 0),
+        (run_id1, 58, 0),
+        (run_id1, 99, 0),
+    ]
+    assert sampled == AbstractStore.get_sampled_metric_history(
+        store, [run_id2, run_id1], "loss", max_points=7
+    )
+
+    # at most `max_points` steps are returned per run
+    for max_points in range(1, 12):
+        sampled = store.get_sampled_metric_history([run_id1], "loss", max_points=max_points)
+        assert 0 < len({m.step for m in sampled}) <= max_points
+        assert sampled[-1].step == 99
+        assert sampled == AbstractStore.get_sampled_metric_history(
+            store, [run_id1], "loss", max_points=max_points
+        )
+
+    sampled = store.get_sampled_metric_history(
+        [run_id1], "loss", start_step=70, end_step=79, max_points=4
+    )
+    assert [m.step for m in sampled] == [70, 71, 79]
+    assert math.isnan(sampled[0].value)
+
+    # runs with at most `max_points` steps in the range aren't downsampled
+    sampled = store.get_sampled_metric_history(
+        [run_id2], "loss", start_step=10, end_step=14, max_points=5
+    )
+    assert [m.step for m in sampled] == [10, 11, 12, 13, 14]
+    sampled = store.get_sampled_metric_history([run_id2], "loss", start_step=10, end_step=14)
+    assert [m.step for m in sampled] == [10, 11, 12, 13, 14]
+    assert store.get_sampled_metric_history([run_id1], "missing", max_points=5) == []
+
+
 def test_get_metric_history_paginated_request_raises(store: SqlAlchemyStore):
     with pytest.raises(
         MlflowException,
@@ -1307,6 +1371,57 @@ def test_get_metric_history(store: SqlAlchemyStore):
     )
 
 
+def test_export_metrics(store: SqlAlchemyStore):
+    config = _get_run_configs(_create_experiments(store, "test_export_metrics"))
+    run_id1 = _run_factory(store, config).info.run_id
+    run_id2 = _run_factory(store, config).info.run_id
+    store.log_batch(
+        run_id1,
+        metrics=[
+            Metric("loss", 3.0, 2, 1),
+            Metric("loss", 1.0, 1, 0),
+            Metric("loss", float("nan"), 0, 1),
+            Metric("acc", 0.5, 0, 5),
+        ],
+        params=[],
+        tags=[],
+    )
+    store.log_batch(
+        run_id2, metrics=[Metric("loss", float(i), 0, i) for i in range(10)], params=[], tags=[]
+    )
+
+    run_ids = [run_id2, run_id1]
+    with mock.patch("mlflow.store.tracking.metrics_export.EXPORT_METRICS_BATCH_SIZE", 4):
+        batches = list(store.export_metrics(run_ids))
+    assert max(b.num_rows for b in batches) <= 4
+    df = pa.Table.from_batches(batches).to_pandas()
+    expected = pd.DataFrame(
+        sorted(
+            [
+                (run_id1, "acc", 5, 0, 0.5),
+                (run_id1, "loss", 0, 1, 1.0),
+                (run_id1, "loss", 1, 0, float("nan")),
+                (run_id1, "loss", 1, 2, 3.0),
+                *((run_id2, "loss", i, 0, float(i)) for i in range(10)),
+            ],
+            key=lambda r: r[:4],
+        ),
+        columns=["run_id", "key", "step", "timestamp", "value"],
+    )
+    pd.testing.assert_frame_equal(df, expected)
+    default_batches = AbstractStore.export_metrics(store, run_ids)
+    pd.testing.assert_frame_equal(pa.Table.from_batches(default_batches).to_pandas(), expected)
+
+    table = pa.Table.from_batches(store.export_metrics(run_ids, ["loss", "missing"], (1, 3)))
+    # Rows are sorted by run ID, and run IDs are random
+    assert list(zip(table.column("run_id").to_pylist(), table.column("step").to_pylist())) == (
+        sorted([(run_id1, 1), (run_id1, 1), (run_id2, 1), (run_id2, 2), (run_id2, 3)])
+    )
+
+    with pytest.raises(MlflowException, match="not found"):
+        list(store.export_metrics(["0" * 32]))
+
+
 def test_rename_experiment(store: SqlAlchemyStore):
     new_name = "new name"
     experiment_id = _create_experiments(store, "test name")
@@ -2070,6 +2185,119 @@ def test_search_runs_pagination(store: SqlAlchemyStore):
     assert result.token is None
 
 
+@pytest.mark.parametrize(
+    "order_by",
+    [
+        None,
+        ["metrics.m DESC"],
+        ["metrics.m ASC", "params.p DESC"],
+        ["params.p ASC", "attributes.end_time DESC"],
+        ["attributes.end_time ASC", "tags.t DESC"],
+    ],
+)
+def test_search_runs_keyset_pagination(store: SqlAlchemyStore, order_by):
+    exp_id = _create_experiments(store, "test_search_runs_keyset_pagination")
+    for i in range(11):
+        run_id = _run_factory(store, _get_run_configs(exp_id, start_time=i % 3)).info.run_id
+        # Leave some of the sort keys empty and log duplicated values to test the handling of
+        # NULLs and ties
+        if i % 4 != 0:
+            store.log_metric(run_id, entities.Metric("m", float("nan") if i == 5 else i % 3, 0, 0))
+        if i % 3 != 0:
+            store.log_param(run_id, entities.Param("p", str(i % 2)))
+        if i % 2 == 0:
+            store.set_tag(run_id, entities.RunTag("t", str(i % 3)))
+            store.update_run_info(run_id, RunStatus.FINISHED, end_time=i % 4, run_name=None)
+
+    expected = [
+        r.info.run_id
+        for r in store.search_runs([exp_id], None, ViewType.ALL, max_results=100, order_by=order_by)
+    ]
+    assert len(expected) == 11
+    run_ids = []
+    token = None
+    while True:
+        result = store.search_runs(
+            [exp_id], None, ViewType.ALL, max_results=3, order_by=order_by, page_token=token
+        )
+        run_ids.extend(r.info.run_id for r in result)
+        token = result.token
+        if token is None:
+            break
+    assert run_ids == expected
+
+
+def test_search_runs_pagination_with_offset_page_token(store: SqlAlchemyStore):
+    exp_id = _create_experiments(store, "test_search_runs_pagination_with_offset_page_token")
+    runs = sorted(
+        _run_factory(store, _get_run_configs(exp_id, start_time=10)).info.run_id for _ in range(10)
+    )
+    page_token = SearchUtils.create_page_token(4)
+    result = store.search_runs([exp_id], None, ViewType.ALL, max_results=4, page_token=page_token)
+    assert [r.info.run_id for r in result] == runs[4:8]
+    result = store.search_runs([exp_id], None, ViewType.ALL, max_results=4, page_token=result.token)
+    assert [r.info.run_id for r in result] == runs[8:]
+    assert result.token is None
+
+    page_token = SearchUtils.create_keyset_page_token([runs[0]])
+    with pytest.raises(MlflowException, match="Invalid page token"):
+        store.search_runs([exp_id], None, ViewType.ALL, max_results=4, page_token=page_token)
+
+
+def test_search_runs_with_projection(store: SqlAlchemyStore):
+    exp_id = _create_experiments(store, "test_search_runs_with_projection")
+    run_ids = []
+    for i in range(3):
+        run_id = _run_factory(store, _get_run_configs(exp_id, start_time=i)).info.run_id
+        store.log_batch(
+            run_id,
+            metrics=[entities.Metric(k, i, 0, 0) for k in ["a", "b", "c"]],
+            params=[entities.Param(k, str(i)) for k in ["p", "q"]],
+            tags=[entities.RunTag("t", str(i))],
+        )
+        dataset = entities.Dataset(
+            name=f"name{i}", digest=f"digest{i}", source_type="st", source="source"
+        )
+        store.log_inputs(run_id, [entities.DatasetInput(dataset, [])])
+        run_ids.append(run_id)
+    run_ids.reverse()
+
+    runs = store.search_runs([exp_id], None, ViewType.ALL)
+    assert [r.info.run_id for r in runs] == run_ids
+    assert all(r.data.metrics.keys() == {"a", "b", "c"} for r in runs)
+    assert all(r.data.params.keys() == {"p", "q"} for r in runs)
+    assert all(len(r.inputs.dataset_inputs) == 1 for r in runs)
+
+    runs = store.search_runs(
+        [exp_id],
+        None,
+        ViewType.ALL,
+        max_results=2,
+        order_by=["metrics.a DESC"],
+        include_metrics=["a", "c", "missing"],
+        include_params=[],
+        include_inputs=False,
+    )
+    assert [r.info.run_id for r in runs] == run_ids[:2]
+    assert [r.data.metrics for r in runs] == [{"a": 2, "c": 2}, {"a": 1, "c": 1}]
+    assert all(r.data.params == {} for r in runs)
+    assert [r.data.tags["t"] for r in runs] == ["2", "1"]
+    assert all(r.inputs.dataset_inputs == [] for r in runs)
+
+    runs = store.search_runs(
+        [exp_id],
+        None,
+        ViewType.ALL,
+        order_by=["metrics.a DESC"],
+        page_token=runs.token,
+        include_params=["q"],
+    )
+    assert [r.info.run_id for r in runs] == run_ids[2:]
+    assert runs[0].data.metrics.keys() == {"a", "b", "c"}
+    assert runs[0].data.params == {"q": "0"}
+    assert runs[0].inputs.dataset_inputs[0].dataset.name == "name0"
+
+
 def test_search_runs_run_name(store: SqlAlchemyStore):
     exp_id = _create_experiments(store, "test_search_runs_pagination")
     run1 = _run_factory(store, dict(_get_run_configs(exp_id), run_name="run_name1"))
@@ -2742,6 +2970,42 @@ def test_log_batch_same_metrics_repeated_multiple_reqs(store: SqlAlchemyStore):
     _verify_logged(store, run.info.run_id, params=[], metrics=[metric0, metric1], tags=[])
 
 
+def test_log_batch_updates_latest_metrics_across_requests(store: SqlAlchemyStore):
+    run = _run_factory(store)
+    run_id = run.info.run_id
+    store.log_batch(
+        run_id,
+        metrics=[
+            Metric(key="a", value=1.0, timestamp=1, step=1),
+            Metric(key="a", value=5.0, timestamp=1, step=3),
+            Metric(key="b", value=2.0, timestamp=5, step=0),
+        ],
+        params=[],
+        tags=[],
+    )
+    assert store.get_run(run_id).data.metrics == {"a": 5.0, "b": 2.0}
+
+    # Older steps, partially duplicated rows, and ties broken by timestamp and value
+    store.log_batch(
+        run_id,
+        metrics=[
+            Metric(key="a", value=1.0, timestamp=1, step=1),
+            Metric(key="a", value=9.0, timestamp=0, step=2),
+            Metric(key="b", value=1.0, timestamp=6, step=0),
+            Metric(key="b", value=3.0, timestamp=6, step=0),
+            Metric(key="c", value=float("nan"), timestamp=0, step=0),
+        ],
+        params=[],
+        tags=[],
+    )
+    metrics = store.get_run(run_id).data.metrics
+    assert metrics["a"] == 5.0
+    assert metrics["b"] == 3.0
+    assert math.isnan(metrics["c"])
+    assert len(store.get_metric_history(run_id, "a")) == 3
+    assert len(store.get_metric_history(run_id, "b")) == 3
+
+
 def test_log_batch_null_metrics(store: SqlAlchemyStore):
     run = _run_factory(store)
 
@@ -3150,6 +3414,30 @@ def test_log_inputs_and_retrieve_runs_behaves_as_expected(store: SqlAlchemyStore
     assert_dataset_inputs_equal(run3.inputs.dataset_inputs, inputs_run3)
 
 
+def test_search_runs_shares_datasets_across_runs(store: SqlAlchemyStore):
+    experiment_id = _create_experiments(store, "test exp")
+    runs = [_run_factory(store, config=_get_run_configs(experiment_id)) for _ in range(3)]
+    dataset = entities.Dataset(
+        name="name", digest="digest", source_type="st", source="source", schema="schema"
+    )
+    for i, run in enumerate(runs[:2]):
+        store.log_inputs(
+            run.info.run_id,
+            [entities.DatasetInput(dataset, [entities.InputTag(key="index", value=str(i))])],
+        )
+
+    results = {
+        run.info.run_id: run.inputs.dataset_inputs
+        for run in store.search_runs([experiment_id], None, ViewType.ALL)
+    }
+    inputs1, inputs2 = (results[run.info.run_id] for run in runs[:2])
+    assert inputs1[0].dataset is inputs2[0].dataset
+    assert dict(inputs1[0].dataset) == dict(dataset)
+    assert [(t.key, t.value) for t in inputs1[0].tags] == [("index", "0")]
+    assert [(t.key, t.value) for t in inputs2[0].tags] == [("index", "1")]
+    assert results[runs[2].info.run_id] == []
+
+
 def test_log_input_multiple_times_does_not_overwrite_tags_or_dataset(store: SqlAlchemyStore):
     experiment_id = _create_experiments(store, "test exp")
     run = _run_factory(store, config=_get_run_configs(experiment_id))
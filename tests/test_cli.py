@@ -17,11 +17,12 @@ from click.testing import CliRunner
 
 import mlflow
 from mlflow import pyfunc
-from mlflow.cli import doctor, gc, server
-from mlflow.entities import ViewType
+from mlflow.cli import doctor, gc, migrate_metrics, server
+from mlflow.entities import Metric, ViewType
 from mlflow.exceptions import MlflowException
 from mlflow.server import handlers
 from mlflow.store.tracking.file_store import FileStore
+from mlflow.store.tracking.file_store_metrics import get_metric_file_format
 from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
 from mlflow.utils.os import is_windows
 from mlflow.utils.rest_utils import augmented_raise_for_status
@@ -77,6 +78,21 @@ def test_server_mlflow_artifacts_options():
         run_server_mock.assert_called_once()
 
 
+@pytest.mark.skipif(is_windows(), reason="gunicorn is not used on Windows")
+def test_server_metric_buffering_requires_single_worker(monkeypatch):
+    monkeypatch.setenv("MLFLOW_SERVER_ENABLE_METRIC_BUFFERING", "true")
+    for args in [[], ["--workers", "4"]]:
+        with mock.patch("mlflow.server._run_server") as run_server_mock:
+            result = CliRunner().invoke(server, args)
+            assert "specify '--workers 1'" in result.output
+            run_server_mock.assert_not_called()
+    with mock.patch("mlflow.server.handlers.initialize_backend_stores"), mock.patch(
+        "mlflow.server._run_server"
+    ) as run_server_mock:
+        CliRunner().invoke(server, ["--workers", "1"])
+        run_server_mock.assert_called_once()
+
+
 @pytest.mark.parametrize("command", [server])
 def test_tracking_uri_validation_failure(command):
     handlers._tracking_store = None
@@ -384,6 +400,24 @@ def test_mlflow_gc_experiments(get_store_details, request):
     )
 
 
+def test_mlflow_migrate_metrics(file_store):
+    store, file_store_uri = file_store
+    run = _create_run_in_store(store, create_artifacts=False)
+    metrics = [Metric("loss", 1.0 / (step + 1), step, step) for step in range(5)]
+    store.log_batch(run.info.run_id, metrics=metrics, params=[], tags=[])
+    metric_path = store._get_metric_path("0", run.info.run_id, "loss")
+
+    for metric_format in ["binary", "text"]:
+        result = CliRunner().invoke(
+            migrate_metrics,
+            ["--backend-store-uri", file_store_uri, "--format", metric_format],
+            catch_exceptions=False,
+        )
+        assert "Converted 1 metric files" in result.output
+        assert get_metric_file_format(metric_path) == metric_format
+        assert store.get_metric_history(run.info.run_id, "loss") == metrics
+
+
 @pytest.mark.parametrize(
     "enable_mlserver",
     [
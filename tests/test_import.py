@@ -55,3 +55,71 @@ fi
         check=True,
         text=True,
     )
+
+
+def _get_imported_modules(code):
+    """
+    Returns the cumulative import times in seconds of the modules imported by ``code``, as reported
+    by ``python -X importtime``.
+    """
+    prc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {}
+    for line in prc.stderr.splitlines():
+        # e.g. "import time:       326 |     198604 |   mlflow.gateway"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, module = line.split("|")
+        import_times[module.strip()] = int(cumulative_us) / 1e6
+    return import_times
+
+
+# Generous budgets which only catch heavy subsystems being imported eagerly again
+_IMPORT_MLFLOW_BUDGET_SECONDS = 1
+_IMPORT_PYFUNC_BUDGET_SECONDS = 10
+
+
+def test_import_mlflow_defers_heavy_subsystems():
+    import_times = _get_imported_modules("import mlflow")
+    deferred_modules = {
+        "mlflow.data",
+        "mlflow.gateway",
+        "mlflow.models",
+        "mlflow.projects",
+        "mlflow.tracing",
+        "mlflow.tracking",
+        "numpy",
+        "opentelemetry",
+        "pandas",
+        "requests",
+        "sqlalchemy",
+    }
+    assert deferred_modules.isdisjoint(import_times)
+    assert import_times["mlflow"] < _IMPORT_MLFLOW_BUDGET_SECONDS
+
+
+def test_load_model_does_not_import_model_evaluation():
+    import_times = _get_imported_modules("from mlflow.pyfunc import load_model")
+    assert {"mlflow.data", "mlflow.models.evaluation", "mlflow.projects"}.isdisjoint(import_times)
+    assert import_times["mlflow.pyfunc"] < _IMPORT_PYFUNC_BUDGET_SECONDS
+
+
+def test_fluent_api_is_imported_on_first_use():
+    prc = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, mlflow; "
+            "assert 'mlflow.tracking.fluent' not in sys.modules; "
+            "assert mlflow.start_run.__module__ == 'mlflow.tracking.fluent'; "
+            "assert all(hasattr(mlflow, name) for name in mlflow.__all__); "
+            "assert set(mlflow.__all__) <= set(dir(mlflow))",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert prc.returncode == 0, prc.stderr
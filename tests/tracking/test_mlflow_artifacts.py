@@ -11,6 +11,7 @@ import requests
 import mlflow
 from mlflow import MlflowClient
 from mlflow.artifacts import download_artifacts
+from mlflow.store.artifact.http_artifact_repo import HttpArtifactRepository
 from mlflow.utils.os import is_windows
 
 from tests.helper_functions import LOCALHOST, get_safe_port
@@ -128,6 +129,39 @@ def test_mlflow_artifacts_rest_apis(artifacts_server, tmp_path):
     assert resp.json() == {"files": [{"path": "b.txt", "is_dir": False, "file_size": 1}]}
 
 
+def test_download_artifact_with_range(artifacts_server, tmp_path):
+    default_artifact_root = artifacts_server.default_artifact_root
+    file_a = tmp_path.joinpath("a.txt")
+    file_a.write_text("0123456789")
+    upload_file(file_a, f"{default_artifact_root}/range/a.txt")
+    url = f"{default_artifact_root}/range/a.txt"
+
+    resp = requests.get(url)
+    assert resp.status_code == 200
+    assert resp.headers["Accept-Ranges"] == "bytes"
+    assert resp.content == b"0123456789"
+
+    for byte_range, content, content_range in [
+        ("bytes=2-5", b"2345", "bytes 2-5/10"),
+        ("bytes=7-", b"789", "bytes 7-9/10"),
+        ("bytes=-3", b"789", "bytes 7-9/10"),
+        ("bytes=0-", b"0123456789", "bytes 0-9/10"),
+    ]:
+        resp = requests.get(url, headers={"Range": byte_range})
+        assert resp.status_code == 206
+        assert resp.headers["Content-Range"] == content_range
+        assert resp.content == content
+
+    resp = requests.get(url, headers={"Range": "bytes=10-"})
+    assert resp.status_code == 416
+    assert resp.headers["Content-Range"] == "bytes */10"
+
+    repo = HttpArtifactRepository(f"{default_artifact_root}/range")
+    with repo.open_read_stream("a.txt", offset=3, length=4) as stream:
+        assert stream.size == 10
+        assert stream.read() == b"3456"
+
+
 def test_log_artifact(artifacts_server, tmp_path):
     url = artifacts_server.url
     artifacts_destination = artifacts_server.artifacts_destination
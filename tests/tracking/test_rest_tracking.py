@@ -39,7 +39,6 @@ from mlflow.entities.trace_status import TraceStatus
 from mlflow.exceptions import MlflowException, RestException
 from mlflow.models import Model
 from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST, ErrorCode
-from mlflow.server.handlers import _get_sampled_steps_from_steps
 from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
 from mlflow.tracing.constant import TraceTagKey
 from mlflow.utils import mlflow_tags
@@ -781,6 +780,35 @@ def test_search_pagination(mlflow_client):
     assert result.token is None
 
 
+def test_search_runs_with_projection(mlflow_client):
+    experiment_id = mlflow_client.create_experiment("search_runs_with_projection")
+    run_id = mlflow_client.create_run(experiment_id).info.run_id
+    mlflow_client.log_batch(
+        run_id,
+        metrics=[Metric(k, 1, 0, 0) for k in ["a", "b"]],
+        params=[Param(k, "v") for k in ["p", "q"]],
+    )
+    dataset = Dataset(name="name", digest="digest", source_type="st", source="source")
+    mlflow_client.log_inputs(run_id, [DatasetInput(dataset, [])])
+
+    (run,) = mlflow_client.search_runs([experiment_id])
+    assert run.data.metrics == {"a": 1, "b": 1}
+    assert run.data.params == {"p": "v", "q": "v"}
+    assert len(run.inputs.dataset_inputs) == 1
+
+    (run,) = mlflow_client.search_runs(
+        [experiment_id], include_metrics=["b"], include_params=[], include_inputs=False
+    )
+    assert run.data.metrics == {"b": 1}
+    assert run.data.params == {}
+    assert run.inputs.dataset_inputs == []
+
+    (run,) = mlflow_client.search_runs([experiment_id], include_metrics=[], include_params=["q"])
+    assert run.data.metrics == {}
+    assert run.data.params == {"q": "v"}
+    assert len(run.inputs.dataset_inputs) == 1
+
+
 def test_search_validation(mlflow_client):
     experiment_id = mlflow_client.create_experiment("search_validation")
     with pytest.raises(
@@ -1129,7 +1157,8 @@ def test_get_metric_history_bulk_interval_respects_max_results(mlflow_client):
         params={"run_ids": [run_id1], "metric_key": "metricA", "max_results": 5},
     )
     assert response_limited.status_code == 200
-    expected_steps = [0, 2, 4, 6, 8, 9]
+    # the first, minimum and maximum steps of a single bucket, and the last step
+    expected_steps = [0, 9]
     expected_metrics = [
         {**metric, "run_id": run_id1}
         for metric in metric_history
@@ -1164,9 +1193,12 @@ def test_get_metric_history_bulk_interval_respects_max_results(mlflow_client):
         url,
         params={"run_ids": [run_id1, run_id2], "metric_key": "metricA", "max_results": 5},
     )
-    expected_steps = [0, 4, 8, 9, 12, 16, 19]
+    # steps are sampled per run, over buckets spanning the steps of all runs
     expected_metrics = []
-    for run_id, metric_history in [(run_id1, metric_history), (run_id2, metric_history2)]:
+    for run_id, metric_history, expected_steps in [
+        (run_id1, metric_history, [0, 9]),
+        (run_id2, metric_history2, [0, 19]),
+    ]:
         expected_metrics.extend(
             [
                 {**metric, "run_id": run_id}
@@ -1188,7 +1220,7 @@ def test_get_metric_history_bulk_interval_respects_max_results(mlflow_client):
         params={"run_ids": [run_id1], "metric_key": "metricA", "max_results": 5},
     )
     assert response_limited.status_code == 200
-    expected_steps = [0, 2, 4, 6, 8, 9]
+    expected_steps = [0, 9]
     expected_metrics = [
         {"key": "metricA", "timestamp": j, "step": i, "value": 10.0, "run_id": run_id1}
         for i in expected_steps
@@ -1197,22 +1229,75 @@ def test_get_metric_history_bulk_interval_respects_max_results(mlflow_client):
     assert response_limited.json().get("metrics") == expected_metrics
 
 
-@pytest.mark.parametrize(
-    ("min_step", "max_step", "max_results", "nums", "expected"),
-    [
-        # should be evenly spaced and include the beginning and
-        # end despite sometimes making it go above max_results
-        (0, 10, 5, list(range(10)), {0, 2, 4, 6, 8, 9}),
-        # if the clipped list is shorter than max_results,
-        # then everything will be returned
-        (4, 8, 5, list(range(10)), {4, 5, 6, 7, 8}),
-        # works if steps are logged in intervals
-        (0, 100, 5, list(range(0, 101, 20)), {0, 20, 40, 60, 80, 100}),
-        (0, 1000, 5, list(range(0, 1001, 10)), {0, 200, 400, 600, 800, 1000}),
-    ],
-)
-def test_get_sampled_steps_from_steps(min_step, max_step, max_results, nums, expected):
-    assert _get_sampled_steps_from_steps(min_step, max_step, max_results, nums) == expected
+def test_get_metric_history_bulk_interval_preserves_spikes(mlflow_client):
+    experiment_id = mlflow_client.create_experiment("get metric history bulk spikes")
+    run_id = mlflow_client.create_run(experiment_id).info.run_id
+    values = [1.0] * 100
+    values[37] = 100.0
+    values[58] = -100.0
+    mlflow_client.log_batch(
+        run_id,
+        metrics=[Metric("loss", value, 0, step) for step, value in enumerate(values)],
+    )
+
+    url = f"{mlflow_client.tracking_uri}/ajax-api/2.0/mlflow/metrics/get-history-bulk-interval"
+    response = requests.get(
+        url, params={"run_ids": [run_id], "metric_key": "loss", "max_results": 5}
+    )
+    assert response.status_code == 200
+    steps = [m["step"] for m in response.json()["metrics"]]
+    assert steps == [0, 37, 58, 99]
+
+    # every run returns at most `max_results` steps
+    for max_results in range(1, 12):
+        response = requests.get(
+            url, params={"run_ids": [run_id], "metric_key": "loss", "max_results": max_results}
+        )
+        steps = [m["step"] for m in response.json()["metrics"]]
+        assert 0 < len(steps) <= max_results
+        assert steps[-1] == 99
+
+
+def test_export_metrics(mlflow_client):
+    experiment_id = mlflow_client.create_experiment("export metrics")
+    run_id1 = mlflow_client.create_run(experiment_id).info.run_id
+    run_id2 = mlflow_client.create_run(experiment_id).info.run_id
+    mlflow_client.log_batch(
+        run_id1, metrics=[Metric("loss", float(step), 0, step) for step in range(100)]
+    )
+    mlflow_client.log_batch(
+        run_id2, metrics=[Metric("acc", 0.5, 1, 0), Metric("loss", float("nan"), 2, 3)]
+    )
+
+    table = mlflow_client.export_metrics([run_id1, run_id2])
+    assert table.num_rows == 102
+    assert table.column("run_id").to_pylist() == sorted([run_id1] * 100 + [run_id2] * 2)
+    df = table.to_pandas()
+    assert df[df["run_id"] == run_id1].head(2).to_dict("list") == {
+        "run_id": [run_id1, run_id1],
+        "key": ["loss", "loss"],
+        "step": [0, 1],
+        "timestamp": [0, 0],
+        "value": [0.0, 1.0],
+    }
+
+    df = mlflow_client.export_metrics(
+        [run_id1, run_id2], keys=["loss"], step_range=(3, 5), output_format="pandas"
+    )
+    assert df["run_id"].tolist() == sorted([run_id1] * 3 + [run_id2])
+    assert df[df["run_id"] == run_id1]["step"].tolist() == [3, 4, 5]
+    assert math.isnan(df[df["run_id"] == run_id2]["value"].iloc[0])
+
+    assert mlflow_client.export_metrics([run_id1], keys=[]).num_rows == 0
+    with pytest.raises(MlflowException, match="not found"):
+        mlflow_client.export_metrics(["0" * 32])
+
+    response = requests.post(
+        f"{mlflow_client.tracking_uri}/api/2.0/mlflow/metrics/export",
+        json={"run_ids": [run_id1], "start_step": 3},
+    )
+    assert response.status_code == 400
+    assert "both must be specified" in response.json()["message"]
 
 
 def test_search_dataset_handler_rejects_invalid_requests(mlflow_client):
@@ -13,6 +13,7 @@ from mlflow.entities.metric import Metric
 from mlflow.entities.param import Param
 from mlflow.entities.run_tag import RunTag
 from mlflow.utils.async_logging.async_logging_queue import AsyncLoggingQueue, QueueStatus
+from mlflow.utils.async_logging.run_batch import RunBatch
 
 METRIC_PER_BATCH = 250
 TAGS_PER_BATCH = 1
@@ -356,3 +357,90 @@ def _assert_sent_received_data(
     for num in range(1, len(params_sent)):
         assert params_sent[num].key == received_params[num].key
         assert params_sent[num].value == received_params[num].value
+
+
+def test_fetch_batch_from_queue_merges_interleaved_runs():
+    async_logging_queue = AsyncLoggingQueue(RunData().consume_queue_data)
+    for i in range(5):
+        for run_id in ["run_a", "run_b"]:
+            metrics = [Metric(f"metric-{i}", val, 0, 0) for val in range(400)]
+            async_logging_queue._queue.put(
+                RunBatch(run_id, metrics=metrics, tags=[RunTag(str(i), "v")])
+            )
+
+    batches = async_logging_queue._fetch_batch_from_queue()
+
+    assert async_logging_queue._queue.empty()
+    for run_id in ["run_a", "run_b"]:
+        run_batches = [b for b in batches if b.run_id == run_id]
+        assert [len(b.metrics) for b in run_batches] == [800, 800, 400]
+        assert [len(b.child_batches) for b in run_batches] == [1, 1, 0]
+        assert [t.key for b in run_batches for t in b.tags] == [str(i) for i in range(5)]
+
+
+def _log_single_metric(async_logging_queue, run_id="test_run_id"):
+    return async_logging_queue.log_batch_async(
+        run_id=run_id, metrics=[Metric("metric", 1, 0, 0)], tags=[], params=[]
+    )
+
+
+def test_max_in_flight_records_blocks_producers(monkeypatch):
+    monkeypatch.setenv("MLFLOW_ASYNC_LOGGING_MAX_IN_FLIGHT_RECORDS", "2")
+    unblock_logging = threading.Event()
+    logged_metrics = []
+
+    def logging_func(run_id, metrics, params, tags):
+        unblock_logging.wait()
+        logged_metrics.extend(metrics)
+
+    async_logging_queue = AsyncLoggingQueue(logging_func)
+    async_logging_queue.activate()
+    run_operations = [_log_single_metric(async_logging_queue) for _ in range(2)]
+    assert async_logging_queue.get_stats()["in_flight_records"] == 2
+
+    producer = threading.Thread(
+        target=lambda: run_operations.append(_log_single_metric(async_logging_queue))
+    )
+    producer.start()
+    producer.join(timeout=1)
+    assert producer.is_alive()
+
+    unblock_logging.set()
+    producer.join()
+    for run_operation in run_operations:
+        run_operation.wait()
+    async_logging_queue.flush()
+
+    assert len(logged_metrics) == 3
+    stats = async_logging_queue.get_stats()
+    assert stats["in_flight_records"] == 0
+    assert stats["queue_depth"] == 0
+    assert stats["logged_batches"] == 3
+    assert stats["dropped_batches"] == 0
+    assert stats["max_latency_seconds"] >= stats["mean_latency_seconds"] > 0
+
+
+def test_max_in_flight_records_drops_batches(monkeypatch):
+    monkeypatch.setenv("MLFLOW_ASYNC_LOGGING_MAX_IN_FLIGHT_RECORDS", "1")
+    monkeypatch.setenv("MLFLOW_ASYNC_LOGGING_OVERFLOW_POLICY", "drop")
+    unblock_logging = threading.Event()
+
+    async_logging_queue = AsyncLoggingQueue(lambda **kwargs: unblock_logging.wait())
+    async_logging_queue.activate()
+    run_operation = _log_single_metric(async_logging_queue)
+    with pytest.raises(MlflowException, match="Dropped 1 records"):
+        _log_single_metric(async_logging_queue).wait()
+
+    unblock_logging.set()
+    run_operation.wait()
+    async_logging_queue.flush()
+    assert async_logging_queue.get_stats()["dropped_batches"] == 1
+
+    monkeypatch.setenv("MLFLOW_ASYNC_LOGGING_OVERFLOW_POLICY", "unknown")
+    async_logging_queue.activate()
+    unblock_logging.clear()
+    _log_single_metric(async_logging_queue)
+    with pytest.raises(MlflowException, match="Invalid value 'unknown'"):
+        _log_single_metric(async_logging_queue)
+    unblock_logging.set()
+    async_logging_queue.flush()
@@ -0,0 +1,219 @@
+import json
+import os
+import pickle
+import threading
+
+import pytest
+
+import mlflow
+from mlflow.exceptions import MlflowException
+from mlflow.utils.checkpoint_utils import (
+    AsyncCheckpointUploader,
+    MlflowModelCheckpointCallbackBase,
+)
+from mlflow.utils.mlflow_tags import LATEST_CHECKPOINT_ARTIFACT_TAG_KEY
+
+
+class _CheckpointCallback(MlflowModelCheckpointCallbackBase):
+    def save_checkpoint(self, filepath):
+        with open(filepath, "w") as f:
+            f.write("model")
+
+
+def _save(callback, epoch):
+    callback.check_and_save_checkpoint_if_needed(
+        current_epoch=epoch, global_step=epoch * 10, metric_dict={"loss": 1.0 / (epoch + 1)}
+    )
+
+
+def _list_artifacts(run_id, path=None):
+    return sorted(f.path for f in mlflow.MlflowClient().list_artifacts(run_id, path))
+
+
+@pytest.mark.parametrize("async_upload", [True, False])
+def test_checkpoints_are_uploaded(async_upload, monkeypatch):
+    monkeypatch.setenv("MLFLOW_CHECKPOINT_ASYNC_UPLOAD", str(async_upload))
+    callback = _CheckpointCallback(
+        checkpoint_file_suffix=".pt",
+        monitor="loss",
+        mode="min",
+        save_best_only=True,
+        save_weights_only=False,
+        save_freq="epoch",
+    )
+    assert (callback.checkpoint_uploader is not None) == async_upload
+    with mlflow.start_run() as run:
+        for epoch in range(3):
+            _save(callback, epoch)
+        callback.flush()
+
+    run_id = run.info.run_id
+    assert _list_artifacts(run_id) == ["checkpoints"]
+    assert _list_artifacts(run_id, "checkpoints") == [
+        "checkpoints/latest_checkpoint.pt",
+        "checkpoints/latest_checkpoint_metrics.json",
+    ]
+    assert mlflow.get_run(run_id).data.tags[LATEST_CHECKPOINT_ARTIFACT_TAG_KEY] == (
+        "checkpoints/latest_checkpoint.pt"
+    )
+    metrics_path = mlflow.artifacts.download_artifacts(
+        run_id=run_id, artifact_path="checkpoints/latest_checkpoint_metrics.json"
+    )
+    with open(metrics_path) as f:
+        assert json.load(f) == {"loss": 1.0 / 3, "epoch": 2, "global_step": 20}
+
+
+def test_pending_checkpoint_is_replaced_by_newer_checkpoint(tmp_path, monkeypatch):
+    uploader = AsyncCheckpointUploader(mlflow.get_tracking_uri(), max_workers=1, max_pending=2)
+    upload_started = threading.Event()
+    release_upload = threading.Event()
+    uploaded = []
+
+    def log_artifacts(self, run_id, local_dir, artifact_path=None):
+        upload_started.set()
+        release_upload.wait()
+        uploaded.append((artifact_path, sorted(os.listdir(local_dir))))
+
+    monkeypatch.setattr(mlflow.MlflowClient, "log_artifacts", log_artifacts)
+    monkeypatch.setattr(mlflow.MlflowClient, "set_tag", lambda *args: None)
+
+    local_dirs = []
+    with mlflow.start_run() as run:
+        for i, artifact_dir in enumerate(["a", "b", "b"]):
+            local_dir = tmp_path / str(i)
+            local_dir.mkdir()
+            (local_dir / f"model{i}").write_text("model")
+            local_dirs.append(local_dir)
+            uploader.submit(run.info.run_id, str(local_dir), artifact_dir, f"{artifact_dir}/model")
+            if i == 0:
+                upload_started.wait()
+
+        # The upload of the first checkpoint is in progress, the second one is replaced by the
+        # third one
+        assert uploader.num_pending == 2
+        assert not local_dirs[1].exists()
+        release_upload.set()
+        uploader.flush()
+
+    assert uploaded == [("a", ["model0"]), ("b", ["model2"])]
+    assert uploader.num_pending == 0
+    assert not any(local_dir.exists() for local_dir in local_dirs)
+
+
+def test_checkpoints_to_same_artifact_dir_are_uploaded_one_at_a_time(tmp_path, monkeypatch):
+    uploader = AsyncCheckpointUploader(mlflow.get_tracking_uri(), max_workers=2, max_pending=2)
+    first_upload_started = threading.Event()
+    release_first_upload = threading.Event()
+    other_dir_uploaded = threading.Event()
+    uploads = []
+
+    def log_artifacts(self, run_id, local_dir, artifact_path=None):
+        (name,) = os.listdir(local_dir)
+        uploads.append(("start", name))
+        if name == "model0":
+            first_upload_started.set()
+            release_first_upload.wait()
+        elif name == "model2":
+            other_dir_uploaded.set()
+        uploads.append(("end", name))
+
+    monkeypatch.setattr(mlflow.MlflowClient, "log_artifacts", log_artifacts)
+    monkeypatch.setattr(mlflow.MlflowClient, "set_tag", lambda *args: None)
+
+    with mlflow.start_run() as run:
+        try:
+            for i, artifact_dir in enumerate(["b", "b", "a"]):
+                local_dir = tmp_path / str(i)
+                local_dir.mkdir()
+                (local_dir / f"model{i}").write_text("model")
+                uploader.submit(
+                    run.info.run_id, str(local_dir), artifact_dir, f"{artifact_dir}/model"
+                )
+                if i == 0:
+                    first_upload_started.wait()
+
+            # Checkpoints to other artifact directories are uploaded concurrently, the second
+            # checkpoint waits for the upload of the first one
+            assert other_dir_uploaded.wait(timeout=10)
+            assert ("start", "model1") not in uploads
+        finally:
+            release_first_upload.set()
+        uploader.flush()
+
+    assert uploads.index(("end", "model0")) < uploads.index(("start", "model1"))
+    assert uploader.num_pending == 0
+
+
+def test_latest_checkpoint_tag_is_not_overwritten_by_older_checkpoints(tmp_path, monkeypatch):
+    uploader = AsyncCheckpointUploader(mlflow.get_tracking_uri(), max_workers=2, max_pending=2)
+    first_tag_started = threading.Event()
+    release_first_tag = threading.Event()
+    second_uploaded = threading.Event()
+    tags = []
+
+    def log_artifacts(self, run_id, local_dir, artifact_path=None):
+        if artifact_path == "b":
+            second_uploaded.set()
+
+    def set_tag(self, run_id, key, value):
+        tags.append(("start", value))
+        if value == "a/model":
+            first_tag_started.set()
+            release_first_tag.wait()
+        tags.append(("end", value))
+
+    monkeypatch.setattr(mlflow.MlflowClient, "log_artifacts", log_artifacts)
+    monkeypatch.setattr(mlflow.MlflowClient, "set_tag", set_tag)
+
+    with mlflow.start_run() as run:
+        try:
+            for i, artifact_dir in enumerate(["a", "b"]):
+                local_dir = tmp_path / str(i)
+                local_dir.mkdir()
+                uploader.submit(
+                    run.info.run_id, str(local_dir), artifact_dir, f"{artifact_dir}/model"
+                )
+                if i == 0:
+                    first_tag_started.wait()
+
+            # The newer checkpoint is uploaded while the tag of the older one is being set
+            assert second_uploaded.wait(timeout=10)
+        finally:
+            release_first_tag.set()
+        uploader.flush()
+
+    assert tags == [
+        ("start", "a/model"),
+        ("end", "a/model"),
+        ("start", "b/model"),
+        ("end", "b/model"),
+    ]
+
+
+def test_upload_failures_are_reported_on_flush(tmp_path, monkeypatch):
+    uploader = AsyncCheckpointUploader(mlflow.get_tracking_uri(), max_workers=2, max_pending=1)
+
+    def log_artifacts(self, run_id, local_dir, artifact_path=None):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(mlflow.MlflowClient, "log_artifacts", log_artifacts)
+    local_dir = tmp_path / "checkpoint"
+    local_dir.mkdir()
+    with mlflow.start_run() as run:
+        uploader.submit(run.info.run_id, str(local_dir), "checkpoints", "checkpoints/model")
+        with pytest.raises(MlflowException, match=r"Failed to upload 1 checkpoint.+disk full"):
+            uploader.flush()
+        # Failures are only reported once
+        uploader.flush()
+    assert LATEST_CHECKPOINT_ARTIFACT_TAG_KEY not in mlflow.get_run(run.info.run_id).data.tags
+
+
+def test_uploader_can_be_pickled():
+    uploader = AsyncCheckpointUploader("file:///tmp/mlruns", max_workers=3, max_pending=4)
+    unpickled = pickle.loads(pickle.dumps(uploader))
+    assert (unpickled.tracking_uri, unpickled.max_workers, unpickled.max_pending) == (
+        "file:///tmp/mlruns",
+        3,
+        4,
+    )
+    assert unpickled.num_pending == 0
@@ -0,0 +1,107 @@
+import os
+import sys
+import time
+from unittest import mock
+
+import pytest
+
+from mlflow.utils.env_cache import (
+    gc_env_cache,
+    get_env_archive_path,
+    list_cached_envs,
+    pack_env,
+    unpack_env,
+)
+from mlflow.utils.environment import _PythonEnv
+from mlflow.utils.virtualenv import _create_virtualenv
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Environments aren't cached")
+
+
+def _create_fake_env(env_dir):
+    bin_dir = env_dir.joinpath("bin")
+    bin_dir.mkdir(parents=True)
+    env_dir.joinpath("lib", "site-packages", "pkg").mkdir(parents=True)
+    env_dir.joinpath("lib", "site-packages", "pkg", "__init__.py").write_text("x = 1")
+    os.symlink(sys.executable, bin_dir.joinpath("python"))
+    os.symlink("python", bin_dir.joinpath("python3"))
+    script = bin_dir.joinpath("tool")
+    script.write_text(f"#!{bin_dir}/python\nimport pkg\n")
+    script.chmod(0o755)
+    bin_dir.joinpath("binary").write_bytes(str(env_dir).encode() + b"\0\1")
+
+
+def test_pack_and_unpack_env(tmp_path):
+    env_dir = tmp_path.joinpath("envs", "env")
+    _create_fake_env(env_dir)
+    archive_path = get_env_archive_path(tmp_path.joinpath("cache"), "mlflow-123")
+    pack_env(env_dir, archive_path)
+    assert archive_path.exists()
+    assert not env_dir.joinpath(".mlflow-env-cache.json").exists()
+    assert [p.name for p in archive_path.parent.iterdir()] == [archive_path.name]
+
+    new_env_dir = tmp_path.joinpath("other", "env")
+    unpack_env(archive_path, new_env_dir)
+    bin_dir = new_env_dir.joinpath("bin")
+    assert bin_dir.joinpath("tool").read_text() == f"#!{bin_dir}/python\nimport pkg\n"
+    assert os.access(bin_dir.joinpath("tool"), os.X_OK)
+    # Compiled executables are left as they are
+    assert bin_dir.joinpath("binary").read_bytes() == str(env_dir).encode() + b"\0\1"
+    assert new_env_dir.joinpath("lib", "site-packages", "pkg", "__init__.py").read_text() == "x = 1"
+    # Links to the interpreter are recreated by virtualenv, relative links are kept
+    assert not bin_dir.joinpath("python").exists()
+    assert os.readlink(bin_dir.joinpath("python3")) == "python"
+    assert not new_env_dir.joinpath(".mlflow-env-cache.json").exists()
+
+
+def test_gc_env_cache(tmp_path):
+    archives = []
+    for i, name in enumerate(["a", "b", "c"]):
+        path = get_env_archive_path(tmp_path, name)
+        path.write_bytes(b"\0" * 100)
+        last_used_time = time.time() - (3 - i) * 3600
+        os.utime(path, (last_used_time, last_used_time))
+        archives.append(path)
+    stale_tmp = tmp_path.joinpath(".a.tar.gz.123.tmp")
+    stale_tmp.write_bytes(b"")
+    os.utime(stale_tmp, (0, 0))
+
+    assert [path for path, _, _ in list_cached_envs(tmp_path)] == archives
+    assert gc_env_cache(tmp_path, older_than_seconds=2.5 * 3600) == archives[:1]
+    assert not stale_tmp.exists()
+    assert gc_env_cache(tmp_path, max_size=150) == archives[1:2]
+    assert [path for path, _, _ in list_cached_envs(tmp_path)] == archives[2:]
+
+
+def test_create_virtualenv_uses_env_cache(tmp_path):
+    model_path = tmp_path.joinpath("model")
+    model_path.mkdir()
+    python_env = _PythonEnv(python="3.8.0", build_dependencies=["pip"], dependencies=["foo"])
+    archive_path = get_env_archive_path(tmp_path.joinpath("cache"), "mlflow-123")
+
+    def create_env(cmd, **kwargs):
+        if "virtualenv" in cmd:
+            _create_fake_env(cmd[-1])
+
+    with mock.patch("mlflow.utils.virtualenv._exec_cmd", side_effect=create_env) as exec_cmd:
+        _create_virtualenv(
+            model_path,
+            sys.executable,
+            tmp_path.joinpath("envs1", "env"),
+            python_env,
+            archive_path=archive_path,
+        )
+    # The environment is created and its requirements are installed
+    assert exec_cmd.call_count == 3
+    assert archive_path.exists()
+
+    env_dir = tmp_path.joinpath("envs2", "env")
+    with mock.patch("mlflow.utils.virtualenv._exec_cmd") as exec_cmd:
+        activate_cmd = _create_virtualenv(
+            model_path, sys.executable, env_dir, python_env, archive_path=archive_path
+        )
+    # Only the links to the interpreter are recreated
+    exec_cmd.assert_called_once()
+    assert exec_cmd.call_args[0][0][:4] == [sys.executable, "-m", "virtualenv", "--no-seed"]
+    assert activate_cmd == f"source {env_dir.joinpath('bin', 'activate')}"
+    assert env_dir.joinpath("bin", "tool").read_text().startswith(f"#!{env_dir}/bin/python")
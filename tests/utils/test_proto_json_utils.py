@@ -12,6 +12,7 @@ from mlflow.entities.model_registry import ModelVersion, RegisteredModel
 from mlflow.exceptions import MlflowException
 from mlflow.protos.model_registry_pb2 import RegisteredModel as ProtoRegisteredModel
 from mlflow.protos.service_pb2 import Experiment as ProtoExperiment
+from mlflow.protos.service_pb2 import GetMetricHistory as ProtoGetMetricHistory
 from mlflow.protos.service_pb2 import Metric as ProtoMetric
 from mlflow.types import ColSpec, DataType, Schema, TensorSpec
 from mlflow.types.schema import Array, Map, Object, Property
@@ -23,6 +24,8 @@ from mlflow.utils.proto_json_utils import (
     cast_df_types_according_to_schema,
     dataframe_from_parsed_json,
     dataframe_from_raw_json,
+    iter_message_json_chunks,
+    message_to_compact_json,
     message_to_json,
     parse_dict,
     parse_tf_serving_input,
@@ -199,6 +202,51 @@ def test_message_to_json():
     assert new_test_message == test_message
 
 
+def test_message_to_compact_json():
+    test_message = ParseTextIntoProto(
+        """
+        field_int64: 12
+        field_uint64: 14
+        field_bool: true
+        field_string: "Im a string"
+        field_repeated_int64: [1, 2, 3]
+        field_enum: ENUM_VALUE2
+        field_inner_message {
+            field_inner_int64: 101
+            field_inner_repeated_int64: [102, 103]
+        }
+        field_map1: [{key: 51 value: "52"}]
+        field_map3: [{key: 561 value: 562}]
+        field_map4: [{key: 71 value: {field_inner_int64: 72 field_inner_string: "str1"}}]
+        [mlflow.ExtensionMessage.field_extended_int64]: 100
+    """,
+        SampleMessage(),
+    )
+    json_out = message_to_compact_json(test_message)
+    assert "\n" not in json_out
+    assert json.loads(json_out) == {
+        **json.loads(message_to_json(test_message)),
+        "[mlflow.ExtensionMessage.field_extended_int64]": 100,
+    }
+    assert "".join(iter_message_json_chunks(test_message, chunk_size=2)) == json_out
+
+
+def test_message_to_compact_json_streams_large_repeated_fields():
+    values = [0.1, float("nan"), float("inf"), float("-inf"), 1e300, 5.0]
+    proto_metrics = [Metric("m", v, 2**40 + i, i).to_proto() for i, v in enumerate(values)]
+    test_message = ProtoGetMetricHistory.Response(metrics=proto_metrics)
+    json_out = message_to_compact_json(test_message)
+    assert json.loads(json_out) == json.loads(message_to_json(test_message))
+    assert json.loads(json_out)["metrics"][1:4] == [
+        {"key": "m", "value": v, "timestamp": 2**40 + i, "step": i}
+        for i, v in enumerate(["NaN", "Infinity", "-Infinity"], start=1)
+    ]
+
+    chunks = list(iter_message_json_chunks(test_message, chunk_size=4))
+    assert len(chunks) == 5
+    assert "".join(chunks) == json_out
+
+
 def test_parse_dict():
     in_json = {"experiment_id": "123", "name": "name", "unknown": "field"}
     message = ProtoExperiment()
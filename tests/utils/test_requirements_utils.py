@@ -1,11 +1,14 @@
 import importlib
 import os
+import pickle
 import sys
+import zipfile
 from unittest import mock
 
 import cloudpickle
 import importlib_metadata
 import pytest
+import yaml
 
 import mlflow
 import mlflow.utils.requirements_utils
@@ -15,6 +18,7 @@ from mlflow.utils.os import is_windows
 from mlflow.utils.requirements_utils import (
     _capture_imported_modules,
     _get_installed_version,
+    _get_model_fingerprint,
     _get_pinned_requirement,
     _infer_requirements,
     _is_comment,
@@ -461,6 +465,106 @@ def test_capture_imported_modules_includes_gateway_extra(module_to_import, shoul
     assert (f"mlflow[gateway]=={mlflow.__version__}" in pip_requirements) == should_capture_extra
 
 
+def _create_model_dir(path, flavor_conf=None, code="x = 1", model=b"model"):
+    path.mkdir()
+    flavor_conf = flavor_conf or {"pickled_model": "model.pkl"}
+    path.joinpath("MLmodel").write_text(yaml.safe_dump({"flavors": {"sklearn": flavor_conf}}))
+    path.joinpath("model.pkl").write_bytes(model)
+    path.joinpath("code").mkdir()
+    path.joinpath("code", "utils.py").write_text(code)
+    return str(path)
+
+
+def test_get_model_fingerprint(tmp_path):
+    model = _create_model_dir(tmp_path / "model")
+    same_model = _create_model_dir(tmp_path / "same_model")
+    other_flavor_conf = _create_model_dir(
+        tmp_path / "other_flavor_conf", {"pickled_model": "m.pkl"}
+    )
+    other_code = _create_model_dir(tmp_path / "other_code", code="x = 2")
+
+    other_weights = _create_model_dir(tmp_path / "other_weights", model=b"weights")
+
+    fingerprint = _get_model_fingerprint(model)
+    assert fingerprint == _get_model_fingerprint(same_model)
+    assert fingerprint == _get_model_fingerprint(other_weights)
+    assert fingerprint != _get_model_fingerprint(other_flavor_conf)
+    assert fingerprint != _get_model_fingerprint(other_code)
+    assert _get_model_fingerprint(str(tmp_path)) is None
+
+
+def test_get_model_fingerprint_ignores_pickled_weights(tmp_path):
+    from sklearn.linear_model import LinearRegression, Ridge
+
+    def create_model_dir(name, model):
+        path = _create_model_dir(tmp_path / name, model=pickle.dumps(model))
+        # Pickles of zip archives, e.g. PyTorch models, are fingerprinted too
+        with zipfile.ZipFile(os.path.join(path, "model.pt"), "w") as archive:
+            archive.writestr("archive/data.pkl", pickle.dumps(model))
+            archive.writestr("archive/data/0", pickle.dumps(model.coef_))
+        return path
+
+    linear = create_model_dir("linear", LinearRegression().fit([[0], [1]], [0, 1]))
+    other_linear = create_model_dir("other_linear", LinearRegression().fit([[0], [1]], [1, 3]))
+    ridge = create_model_dir("ridge", Ridge().fit([[0], [1]], [0, 1]))
+    assert _get_model_fingerprint(linear) == _get_model_fingerprint(other_linear)
+    assert _get_model_fingerprint(linear) != _get_model_fingerprint(ridge)
+
+
+def test_infer_requirements_cache_covers_serialized_models(tmp_path, monkeypatch):
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.linear_model import LinearRegression
+
+    monkeypatch.setattr(mlflow.utils.requirements_utils, "_MODULES_TO_PACKAGES", None)
+    monkeypatch.setenv("MLFLOW_REQUIREMENTS_INFERENCE_CACHE_DIR", str(tmp_path / "cache"))
+    linear = _create_model_dir(tmp_path / "linear", model=pickle.dumps(LinearRegression()))
+    forest = _create_model_dir(tmp_path / "forest", model=pickle.dumps(RandomForestRegressor()))
+    assert _get_model_fingerprint(linear) != _get_model_fingerprint(forest)
+
+    with mock.patch(
+        "mlflow.utils.requirements_utils._capture_imported_modules", return_value=["pytest"]
+    ) as mock_capture_imported_modules:
+        _infer_requirements(linear, "sklearn")
+        _infer_requirements(forest, "sklearn")
+        assert mock_capture_imported_modules.call_count == 2
+
+
+def test_infer_requirements_uses_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(mlflow.utils.requirements_utils, "_MODULES_TO_PACKAGES", None)
+    monkeypatch.setenv("MLFLOW_REQUIREMENTS_INFERENCE_CACHE_DIR", str(tmp_path / "cache"))
+    models = [_create_model_dir(tmp_path / f"model_{i}") for i in range(3)]
+    other_model = _create_model_dir(tmp_path / "other_model", code="import pytest")
+
+    with mock.patch(
+        "mlflow.utils.requirements_utils._capture_imported_modules", return_value=["pytest"]
+    ) as mock_capture_imported_modules:
+        assert _infer_requirements(models[0], "sklearn") == [f"pytest=={pytest.__version__}"]
+        mock_capture_imported_modules.assert_called_once_with(models[0], "sklearn")
+        # Identical models hit the cache
+        assert _infer_requirements(models[1], "sklearn") == [f"pytest=={pytest.__version__}"]
+        assert _infer_requirements(models[2], "sklearn") == [f"pytest=={pytest.__version__}"]
+        mock_capture_imported_modules.assert_called_once()
+        assert _infer_requirements(other_model, "sklearn") == [f"pytest=={pytest.__version__}"]
+        assert mock_capture_imported_modules.call_count == 2
+        mock_capture_imported_modules.assert_called_with(other_model, "sklearn")
+        # The flavor is part of the key
+        _infer_requirements(models[0], "pyfunc")
+        assert mock_capture_imported_modules.call_count == 3
+
+
+def test_infer_requirements_does_not_cache_without_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(mlflow.utils.requirements_utils, "_MODULES_TO_PACKAGES", None)
+    monkeypatch.delenv("MLFLOW_REQUIREMENTS_INFERENCE_CACHE_DIR", raising=False)
+    model = _create_model_dir(tmp_path / "model")
+
+    with mock.patch(
+        "mlflow.utils.requirements_utils._capture_imported_modules", return_value=["pytest"]
+    ) as mock_capture_imported_modules:
+        _infer_requirements(model, "sklearn")
+        _infer_requirements(model, "sklearn")
+        assert mock_capture_imported_modules.call_count == 2
+
+
 def test_warn_dependency_requirement_mismatches():
     import sklearn
 